@@ -0,0 +1,96 @@
+# Checks formatter.check_query() against formatting and comparing, then times both
+#
+# Usage: python bench/check.py [runs]
+#
+# Every statement of bench/corpus is formatted, and the outputs are checked in
+# three versions: as they are, with their first keyword in lower case and with
+# a space appended. check_query() must find the same first difference as a
+# comparison with the output of format_query(), on the original statements
+# too. Both ways are then timed on
+# each version, without the results cache. Checking saves the rendering past
+# the first difference, and when minifying the lexing too. Fails on any
+# difference, or when checking is slower than formatting and comparing by more
+# than the noise of the timings. Checking queries whose recovering parse gives
+# up must raise QueryErrors.
+
+import glob
+import os
+import sys
+import time
+
+bench = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(bench, '..'))
+
+from src import formatter, statements
+
+# Queries the recovering parser gives up on
+BROKEN = ['select ( from t;', 'select a from']
+
+# Allowed ratio of the checking time to the formatting and comparing time
+TOLERANCE = 1.1
+
+def load():
+    queries = []
+    for path in sorted(glob.glob(os.path.join(bench, 'corpus', '*.sql'))):
+        with open(path) as f:
+            queries.extend(query for _, query, code in statements.split_statements(f.read()) if code)
+    return queries
+
+def compared(query, minify):
+    'First difference found by formatting query and comparing the output'
+    result = formatter.format_query(query, minify)
+    for position, (expected, found) in enumerate(zip(result, query)):
+        if expected != found:
+            return position
+    return None if len(result) == len(query) else min(len(result), len(query))
+
+def versions(queries, minify):
+    outputs = [formatter.format_query(query, minify) for query in queries]
+    return {
+        'formatted': outputs,
+        'first line': [output[:6].lower() + output[6:] for output in outputs],
+        'last line': [output + ' ' for output in outputs],
+    }
+
+def main(runs):
+    formatter.disable_cache()
+    queries = load()
+    found = 0
+    checked = 0
+    for minify in (False, True):
+        cases = versions(queries, minify)
+        for query in queries + [query for version in cases.values() for query in version]:
+            expected, result = compared(query, minify), formatter.check_query(query, minify)
+            checked += 1
+            if result != expected:
+                found += 1
+                print('difference (minify=%s) on %r: %r against %r' % (minify, query[:200], result, expected))
+    for query in BROKEN:
+        try:
+            formatter.check_query(query, recover=True)
+        except formatter.QueryErrors:
+            continue
+        except Exception as err:
+            print('%s on %r: %s' % (type(err).__name__, query, err))
+        else:
+            print('no errors on %r' % query)
+        found += 1
+    print('%d checks compared, %d differences' % (checked, found))
+
+    slower = False
+    for minify in (False, True):
+        for name, version in sorted(versions(queries, minify).items()):
+            best = {}
+            for _ in range(runs):
+                for way, function in (('format', compared), ('check', formatter.check_query)):
+                    start = time.perf_counter()
+                    for query in version:
+                        function(query, minify)
+                    best[way] = min(best.get(way, float('inf')), time.perf_counter() - start)
+            print('%-6s %-10s : format and compare %8.3fs, check %8.3fs (x%.2f)' % (
+                'minify' if minify else 'format', name, best['format'], best['check'], best['format'] / best['check']))
+            slower = slower or best['check'] > TOLERANCE * best['format']
+    return 0 if not found and not slower else 1
+
+if __name__ == '__main__':
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5))
@@ -0,0 +1,667 @@
+SELECT
+    t.id,
+    CASE
+        WHEN t.code_0 = 0 AND t.flag IS NOT NULL THEN 'label_0_0'
+        WHEN t.code_0 = 1 AND t.flag IS NOT NULL THEN 'label_0_1'
+        WHEN t.code_0 = 2 AND t.flag IS NOT NULL THEN 'label_0_2'
+        WHEN t.code_0 = 3 AND t.flag IS NOT NULL THEN 'label_0_3'
+        WHEN t.code_0 = 4 AND t.flag IS NOT NULL THEN 'label_0_4'
+        WHEN t.code_0 = 5 AND t.flag IS NOT NULL THEN 'label_0_5'
+        WHEN t.code_0 = 6 AND t.flag IS NOT NULL THEN 'label_0_6'
+        WHEN t.code_0 = 7 AND t.flag IS NOT NULL THEN 'label_0_7'
+        WHEN t.code_0 = 8 AND t.flag IS NOT NULL THEN 'label_0_8'
+        WHEN t.code_0 = 9 AND t.flag IS NOT NULL THEN 'label_0_9'
+        WHEN t.code_0 = 10 AND t.flag IS NOT NULL THEN 'label_0_10'
+        WHEN t.code_0 = 11 AND t.flag IS NOT NULL THEN 'label_0_11'
+        WHEN t.code_0 = 12 AND t.flag IS NOT NULL THEN 'label_0_12'
+        WHEN t.code_0 = 13 AND t.flag IS NOT NULL THEN 'label_0_13'
+        WHEN t.code_0 = 14 AND t.flag IS NOT NULL THEN 'label_0_14'
+        WHEN t.code_0 = 15 AND t.flag IS NOT NULL THEN 'label_0_15'
+        WHEN t.code_0 = 16 AND t.flag IS NOT NULL THEN 'label_0_16'
+        WHEN t.code_0 = 17 AND t.flag IS NOT NULL THEN 'label_0_17'
+        WHEN t.code_0 = 18 AND t.flag IS NOT NULL THEN 'label_0_18'
+        WHEN t.code_0 = 19 AND t.flag IS NOT NULL THEN 'label_0_19'
+        WHEN t.code_0 = 20 AND t.flag IS NOT NULL THEN 'label_0_20'
+        WHEN t.code_0 = 21 AND t.flag IS NOT NULL THEN 'label_0_21'
+        WHEN t.code_0 = 22 AND t.flag IS NOT NULL THEN 'label_0_22'
+        WHEN t.code_0 = 23 AND t.flag IS NOT NULL THEN 'label_0_23'
+        WHEN t.code_0 = 24 AND t.flag IS NOT NULL THEN 'label_0_24'
+        WHEN t.code_0 = 25 AND t.flag IS NOT NULL THEN 'label_0_25'
+        WHEN t.code_0 = 26 AND t.flag IS NOT NULL THEN 'label_0_26'
+        WHEN t.code_0 = 27 AND t.flag IS NOT NULL THEN 'label_0_27'
+        WHEN t.code_0 = 28 AND t.flag IS NOT NULL THEN 'label_0_28'
+        WHEN t.code_0 = 29 AND t.flag IS NOT NULL THEN 'label_0_29'
+        WHEN t.code_0 = 30 AND t.flag IS NOT NULL THEN 'label_0_30'
+        WHEN t.code_0 = 31 AND t.flag IS NOT NULL THEN 'label_0_31'
+        WHEN t.code_0 = 32 AND t.flag IS NOT NULL THEN 'label_0_32'
+        WHEN t.code_0 = 33 AND t.flag IS NOT NULL THEN 'label_0_33'
+        WHEN t.code_0 = 34 AND t.flag IS NOT NULL THEN 'label_0_34'
+        WHEN t.code_0 = 35 AND t.flag IS NOT NULL THEN 'label_0_35'
+        WHEN t.code_0 = 36 AND t.flag IS NOT NULL THEN 'label_0_36'
+        WHEN t.code_0 = 37 AND t.flag IS NOT NULL THEN 'label_0_37'
+        WHEN t.code_0 = 38 AND t.flag IS NOT NULL THEN 'label_0_38'
+        WHEN t.code_0 = 39 AND t.flag IS NOT NULL THEN 'label_0_39'
+        WHEN t.code_0 = 40 AND t.flag IS NOT NULL THEN 'label_0_40'
+        WHEN t.code_0 = 41 AND t.flag IS NOT NULL THEN 'label_0_41'
+        WHEN t.code_0 = 42 AND t.flag IS NOT NULL THEN 'label_0_42'
+        WHEN t.code_0 = 43 AND t.flag IS NOT NULL THEN 'label_0_43'
+        WHEN t.code_0 = 44 AND t.flag IS NOT NULL THEN 'label_0_44'
+        WHEN t.code_0 = 45 AND t.flag IS NOT NULL THEN 'label_0_45'
+        WHEN t.code_0 = 46 AND t.flag IS NOT NULL THEN 'label_0_46'
+        WHEN t.code_0 = 47 AND t.flag IS NOT NULL THEN 'label_0_47'
+        WHEN t.code_0 = 48 AND t.flag IS NOT NULL THEN 'label_0_48'
+        WHEN t.code_0 = 49 AND t.flag IS NOT NULL THEN 'label_0_49'
+        WHEN t.code_0 = 50 AND t.flag IS NOT NULL THEN 'label_0_50'
+        WHEN t.code_0 = 51 AND t.flag IS NOT NULL THEN 'label_0_51'
+        WHEN t.code_0 = 52 AND t.flag IS NOT NULL THEN 'label_0_52'
+        WHEN t.code_0 = 53 AND t.flag IS NOT NULL THEN 'label_0_53'
+        WHEN t.code_0 = 54 AND t.flag IS NOT NULL THEN 'label_0_54'
+        WHEN t.code_0 = 55 AND t.flag IS NOT NULL THEN 'label_0_55'
+        WHEN t.code_0 = 56 AND t.flag IS NOT NULL THEN 'label_0_56'
+        WHEN t.code_0 = 57 AND t.flag IS NOT NULL THEN 'label_0_57'
+        WHEN t.code_0 = 58 AND t.flag IS NOT NULL THEN 'label_0_58'
+        WHEN t.code_0 = 59 AND t.flag IS NOT NULL THEN 'label_0_59'
+        WHEN t.code_0 = 60 AND t.flag IS NOT NULL THEN 'label_0_60'
+        WHEN t.code_0 = 61 AND t.flag IS NOT NULL THEN 'label_0_61'
+        WHEN t.code_0 = 62 AND t.flag IS NOT NULL THEN 'label_0_62'
+        WHEN t.code_0 = 63 AND t.flag IS NOT NULL THEN 'label_0_63'
+        WHEN t.code_0 = 64 AND t.flag IS NOT NULL THEN 'label_0_64'
+        WHEN t.code_0 = 65 AND t.flag IS NOT NULL THEN 'label_0_65'
+        WHEN t.code_0 = 66 AND t.flag IS NOT NULL THEN 'label_0_66'
+        WHEN t.code_0 = 67 AND t.flag IS NOT NULL THEN 'label_0_67'
+        WHEN t.code_0 = 68 AND t.flag IS NOT NULL THEN 'label_0_68'
+        WHEN t.code_0 = 69 AND t.flag IS NOT NULL THEN 'label_0_69'
+        WHEN t.code_0 = 70 AND t.flag IS NOT NULL THEN 'label_0_70'
+        WHEN t.code_0 = 71 AND t.flag IS NOT NULL THEN 'label_0_71'
+        WHEN t.code_0 = 72 AND t.flag IS NOT NULL THEN 'label_0_72'
+        WHEN t.code_0 = 73 AND t.flag IS NOT NULL THEN 'label_0_73'
+        WHEN t.code_0 = 74 AND t.flag IS NOT NULL THEN 'label_0_74'
+        WHEN t.code_0 = 75 AND t.flag IS NOT NULL THEN 'label_0_75'
+        WHEN t.code_0 = 76 AND t.flag IS NOT NULL THEN 'label_0_76'
+        WHEN t.code_0 = 77 AND t.flag IS NOT NULL THEN 'label_0_77'
+        WHEN t.code_0 = 78 AND t.flag IS NOT NULL THEN 'label_0_78'
+        WHEN t.code_0 = 79 AND t.flag IS NOT NULL THEN 'label_0_79'
+        ELSE NULL
+    END AS category_0,
+    CASE
+        WHEN t.code_1 = 0 AND t.flag IS NOT NULL THEN 'label_1_0'
+        WHEN t.code_1 = 1 AND t.flag IS NOT NULL THEN 'label_1_1'
+        WHEN t.code_1 = 2 AND t.flag IS NOT NULL THEN 'label_1_2'
+        WHEN t.code_1 = 3 AND t.flag IS NOT NULL THEN 'label_1_3'
+        WHEN t.code_1 = 4 AND t.flag IS NOT NULL THEN 'label_1_4'
+        WHEN t.code_1 = 5 AND t.flag IS NOT NULL THEN 'label_1_5'
+        WHEN t.code_1 = 6 AND t.flag IS NOT NULL THEN 'label_1_6'
+        WHEN t.code_1 = 7 AND t.flag IS NOT NULL THEN 'label_1_7'
+        WHEN t.code_1 = 8 AND t.flag IS NOT NULL THEN 'label_1_8'
+        WHEN t.code_1 = 9 AND t.flag IS NOT NULL THEN 'label_1_9'
+        WHEN t.code_1 = 10 AND t.flag IS NOT NULL THEN 'label_1_10'
+        WHEN t.code_1 = 11 AND t.flag IS NOT NULL THEN 'label_1_11'
+        WHEN t.code_1 = 12 AND t.flag IS NOT NULL THEN 'label_1_12'
+        WHEN t.code_1 = 13 AND t.flag IS NOT NULL THEN 'label_1_13'
+        WHEN t.code_1 = 14 AND t.flag IS NOT NULL THEN 'label_1_14'
+        WHEN t.code_1 = 15 AND t.flag IS NOT NULL THEN 'label_1_15'
+        WHEN t.code_1 = 16 AND t.flag IS NOT NULL THEN 'label_1_16'
+        WHEN t.code_1 = 17 AND t.flag IS NOT NULL THEN 'label_1_17'
+        WHEN t.code_1 = 18 AND t.flag IS NOT NULL THEN 'label_1_18'
+        WHEN t.code_1 = 19 AND t.flag IS NOT NULL THEN 'label_1_19'
+        WHEN t.code_1 = 20 AND t.flag IS NOT NULL THEN 'label_1_20'
+        WHEN t.code_1 = 21 AND t.flag IS NOT NULL THEN 'label_1_21'
+        WHEN t.code_1 = 22 AND t.flag IS NOT NULL THEN 'label_1_22'
+        WHEN t.code_1 = 23 AND t.flag IS NOT NULL THEN 'label_1_23'
+        WHEN t.code_1 = 24 AND t.flag IS NOT NULL THEN 'label_1_24'
+        WHEN t.code_1 = 25 AND t.flag IS NOT NULL THEN 'label_1_25'
+        WHEN t.code_1 = 26 AND t.flag IS NOT NULL THEN 'label_1_26'
+        WHEN t.code_1 = 27 AND t.flag IS NOT NULL THEN 'label_1_27'
+        WHEN t.code_1 = 28 AND t.flag IS NOT NULL THEN 'label_1_28'
+        WHEN t.code_1 = 29 AND t.flag IS NOT NULL THEN 'label_1_29'
+        WHEN t.code_1 = 30 AND t.flag IS NOT NULL THEN 'label_1_30'
+        WHEN t.code_1 = 31 AND t.flag IS NOT NULL THEN 'label_1_31'
+        WHEN t.code_1 = 32 AND t.flag IS NOT NULL THEN 'label_1_32'
+        WHEN t.code_1 = 33 AND t.flag IS NOT NULL THEN 'label_1_33'
+        WHEN t.code_1 = 34 AND t.flag IS NOT NULL THEN 'label_1_34'
+        WHEN t.code_1 = 35 AND t.flag IS NOT NULL THEN 'label_1_35'
+        WHEN t.code_1 = 36 AND t.flag IS NOT NULL THEN 'label_1_36'
+        WHEN t.code_1 = 37 AND t.flag IS NOT NULL THEN 'label_1_37'
+        WHEN t.code_1 = 38 AND t.flag IS NOT NULL THEN 'label_1_38'
+        WHEN t.code_1 = 39 AND t.flag IS NOT NULL THEN 'label_1_39'
+        WHEN t.code_1 = 40 AND t.flag IS NOT NULL THEN 'label_1_40'
+        WHEN t.code_1 = 41 AND t.flag IS NOT NULL THEN 'label_1_41'
+        WHEN t.code_1 = 42 AND t.flag IS NOT NULL THEN 'label_1_42'
+        WHEN t.code_1 = 43 AND t.flag IS NOT NULL THEN 'label_1_43'
+        WHEN t.code_1 = 44 AND t.flag IS NOT NULL THEN 'label_1_44'
+        WHEN t.code_1 = 45 AND t.flag IS NOT NULL THEN 'label_1_45'
+        WHEN t.code_1 = 46 AND t.flag IS NOT NULL THEN 'label_1_46'
+        WHEN t.code_1 = 47 AND t.flag IS NOT NULL THEN 'label_1_47'
+        WHEN t.code_1 = 48 AND t.flag IS NOT NULL THEN 'label_1_48'
+        WHEN t.code_1 = 49 AND t.flag IS NOT NULL THEN 'label_1_49'
+        WHEN t.code_1 = 50 AND t.flag IS NOT NULL THEN 'label_1_50'
+        WHEN t.code_1 = 51 AND t.flag IS NOT NULL THEN 'label_1_51'
+        WHEN t.code_1 = 52 AND t.flag IS NOT NULL THEN 'label_1_52'
+        WHEN t.code_1 = 53 AND t.flag IS NOT NULL THEN 'label_1_53'
+        WHEN t.code_1 = 54 AND t.flag IS NOT NULL THEN 'label_1_54'
+        WHEN t.code_1 = 55 AND t.flag IS NOT NULL THEN 'label_1_55'
+        WHEN t.code_1 = 56 AND t.flag IS NOT NULL THEN 'label_1_56'
+        WHEN t.code_1 = 57 AND t.flag IS NOT NULL THEN 'label_1_57'
+        WHEN t.code_1 = 58 AND t.flag IS NOT NULL THEN 'label_1_58'
+        WHEN t.code_1 = 59 AND t.flag IS NOT NULL THEN 'label_1_59'
+        WHEN t.code_1 = 60 AND t.flag IS NOT NULL THEN 'label_1_60'
+        WHEN t.code_1 = 61 AND t.flag IS NOT NULL THEN 'label_1_61'
+        WHEN t.code_1 = 62 AND t.flag IS NOT NULL THEN 'label_1_62'
+        WHEN t.code_1 = 63 AND t.flag IS NOT NULL THEN 'label_1_63'
+        WHEN t.code_1 = 64 AND t.flag IS NOT NULL THEN 'label_1_64'
+        WHEN t.code_1 = 65 AND t.flag IS NOT NULL THEN 'label_1_65'
+        WHEN t.code_1 = 66 AND t.flag IS NOT NULL THEN 'label_1_66'
+        WHEN t.code_1 = 67 AND t.flag IS NOT NULL THEN 'label_1_67'
+        WHEN t.code_1 = 68 AND t.flag IS NOT NULL THEN 'label_1_68'
+        WHEN t.code_1 = 69 AND t.flag IS NOT NULL THEN 'label_1_69'
+        WHEN t.code_1 = 70 AND t.flag IS NOT NULL THEN 'label_1_70'
+        WHEN t.code_1 = 71 AND t.flag IS NOT NULL THEN 'label_1_71'
+        WHEN t.code_1 = 72 AND t.flag IS NOT NULL THEN 'label_1_72'
+        WHEN t.code_1 = 73 AND t.flag IS NOT NULL THEN 'label_1_73'
+        WHEN t.code_1 = 74 AND t.flag IS NOT NULL THEN 'label_1_74'
+        WHEN t.code_1 = 75 AND t.flag IS NOT NULL THEN 'label_1_75'
+        WHEN t.code_1 = 76 AND t.flag IS NOT NULL THEN 'label_1_76'
+        WHEN t.code_1 = 77 AND t.flag IS NOT NULL THEN 'label_1_77'
+        WHEN t.code_1 = 78 AND t.flag IS NOT NULL THEN 'label_1_78'
+        WHEN t.code_1 = 79 AND t.flag IS NOT NULL THEN 'label_1_79'
+        ELSE NULL
+    END AS category_1,
+    CASE
+        WHEN t.code_2 = 0 AND t.flag IS NOT NULL THEN 'label_2_0'
+        WHEN t.code_2 = 1 AND t.flag IS NOT NULL THEN 'label_2_1'
+        WHEN t.code_2 = 2 AND t.flag IS NOT NULL THEN 'label_2_2'
+        WHEN t.code_2 = 3 AND t.flag IS NOT NULL THEN 'label_2_3'
+        WHEN t.code_2 = 4 AND t.flag IS NOT NULL THEN 'label_2_4'
+        WHEN t.code_2 = 5 AND t.flag IS NOT NULL THEN 'label_2_5'
+        WHEN t.code_2 = 6 AND t.flag IS NOT NULL THEN 'label_2_6'
+        WHEN t.code_2 = 7 AND t.flag IS NOT NULL THEN 'label_2_7'
+        WHEN t.code_2 = 8 AND t.flag IS NOT NULL THEN 'label_2_8'
+        WHEN t.code_2 = 9 AND t.flag IS NOT NULL THEN 'label_2_9'
+        WHEN t.code_2 = 10 AND t.flag IS NOT NULL THEN 'label_2_10'
+        WHEN t.code_2 = 11 AND t.flag IS NOT NULL THEN 'label_2_11'
+        WHEN t.code_2 = 12 AND t.flag IS NOT NULL THEN 'label_2_12'
+        WHEN t.code_2 = 13 AND t.flag IS NOT NULL THEN 'label_2_13'
+        WHEN t.code_2 = 14 AND t.flag IS NOT NULL THEN 'label_2_14'
+        WHEN t.code_2 = 15 AND t.flag IS NOT NULL THEN 'label_2_15'
+        WHEN t.code_2 = 16 AND t.flag IS NOT NULL THEN 'label_2_16'
+        WHEN t.code_2 = 17 AND t.flag IS NOT NULL THEN 'label_2_17'
+        WHEN t.code_2 = 18 AND t.flag IS NOT NULL THEN 'label_2_18'
+        WHEN t.code_2 = 19 AND t.flag IS NOT NULL THEN 'label_2_19'
+        WHEN t.code_2 = 20 AND t.flag IS NOT NULL THEN 'label_2_20'
+        WHEN t.code_2 = 21 AND t.flag IS NOT NULL THEN 'label_2_21'
+        WHEN t.code_2 = 22 AND t.flag IS NOT NULL THEN 'label_2_22'
+        WHEN t.code_2 = 23 AND t.flag IS NOT NULL THEN 'label_2_23'
+        WHEN t.code_2 = 24 AND t.flag IS NOT NULL THEN 'label_2_24'
+        WHEN t.code_2 = 25 AND t.flag IS NOT NULL THEN 'label_2_25'
+        WHEN t.code_2 = 26 AND t.flag IS NOT NULL THEN 'label_2_26'
+        WHEN t.code_2 = 27 AND t.flag IS NOT NULL THEN 'label_2_27'
+        WHEN t.code_2 = 28 AND t.flag IS NOT NULL THEN 'label_2_28'
+        WHEN t.code_2 = 29 AND t.flag IS NOT NULL THEN 'label_2_29'
+        WHEN t.code_2 = 30 AND t.flag IS NOT NULL THEN 'label_2_30'
+        WHEN t.code_2 = 31 AND t.flag IS NOT NULL THEN 'label_2_31'
+        WHEN t.code_2 = 32 AND t.flag IS NOT NULL THEN 'label_2_32'
+        WHEN t.code_2 = 33 AND t.flag IS NOT NULL THEN 'label_2_33'
+        WHEN t.code_2 = 34 AND t.flag IS NOT NULL THEN 'label_2_34'
+        WHEN t.code_2 = 35 AND t.flag IS NOT NULL THEN 'label_2_35'
+        WHEN t.code_2 = 36 AND t.flag IS NOT NULL THEN 'label_2_36'
+        WHEN t.code_2 = 37 AND t.flag IS NOT NULL THEN 'label_2_37'
+        WHEN t.code_2 = 38 AND t.flag IS NOT NULL THEN 'label_2_38'
+        WHEN t.code_2 = 39 AND t.flag IS NOT NULL THEN 'label_2_39'
+        WHEN t.code_2 = 40 AND t.flag IS NOT NULL THEN 'label_2_40'
+        WHEN t.code_2 = 41 AND t.flag IS NOT NULL THEN 'label_2_41'
+        WHEN t.code_2 = 42 AND t.flag IS NOT NULL THEN 'label_2_42'
+        WHEN t.code_2 = 43 AND t.flag IS NOT NULL THEN 'label_2_43'
+        WHEN t.code_2 = 44 AND t.flag IS NOT NULL THEN 'label_2_44'
+        WHEN t.code_2 = 45 AND t.flag IS NOT NULL THEN 'label_2_45'
+        WHEN t.code_2 = 46 AND t.flag IS NOT NULL THEN 'label_2_46'
+        WHEN t.code_2 = 47 AND t.flag IS NOT NULL THEN 'label_2_47'
+        WHEN t.code_2 = 48 AND t.flag IS NOT NULL THEN 'label_2_48'
+        WHEN t.code_2 = 49 AND t.flag IS NOT NULL THEN 'label_2_49'
+        WHEN t.code_2 = 50 AND t.flag IS NOT NULL THEN 'label_2_50'
+        WHEN t.code_2 = 51 AND t.flag IS NOT NULL THEN 'label_2_51'
+        WHEN t.code_2 = 52 AND t.flag IS NOT NULL THEN 'label_2_52'
+        WHEN t.code_2 = 53 AND t.flag IS NOT NULL THEN 'label_2_53'
+        WHEN t.code_2 = 54 AND t.flag IS NOT NULL THEN 'label_2_54'
+        WHEN t.code_2 = 55 AND t.flag IS NOT NULL THEN 'label_2_55'
+        WHEN t.code_2 = 56 AND t.flag IS NOT NULL THEN 'label_2_56'
+        WHEN t.code_2 = 57 AND t.flag IS NOT NULL THEN 'label_2_57'
+        WHEN t.code_2 = 58 AND t.flag IS NOT NULL THEN 'label_2_58'
+        WHEN t.code_2 = 59 AND t.flag IS NOT NULL THEN 'label_2_59'
+        WHEN t.code_2 = 60 AND t.flag IS NOT NULL THEN 'label_2_60'
+        WHEN t.code_2 = 61 AND t.flag IS NOT NULL THEN 'label_2_61'
+        WHEN t.code_2 = 62 AND t.flag IS NOT NULL THEN 'label_2_62'
+        WHEN t.code_2 = 63 AND t.flag IS NOT NULL THEN 'label_2_63'
+        WHEN t.code_2 = 64 AND t.flag IS NOT NULL THEN 'label_2_64'
+        WHEN t.code_2 = 65 AND t.flag IS NOT NULL THEN 'label_2_65'
+        WHEN t.code_2 = 66 AND t.flag IS NOT NULL THEN 'label_2_66'
+        WHEN t.code_2 = 67 AND t.flag IS NOT NULL THEN 'label_2_67'
+        WHEN t.code_2 = 68 AND t.flag IS NOT NULL THEN 'label_2_68'
+        WHEN t.code_2 = 69 AND t.flag IS NOT NULL THEN 'label_2_69'
+        WHEN t.code_2 = 70 AND t.flag IS NOT NULL THEN 'label_2_70'
+        WHEN t.code_2 = 71 AND t.flag IS NOT NULL THEN 'label_2_71'
+        WHEN t.code_2 = 72 AND t.flag IS NOT NULL THEN 'label_2_72'
+        WHEN t.code_2 = 73 AND t.flag IS NOT NULL THEN 'label_2_73'
+        WHEN t.code_2 = 74 AND t.flag IS NOT NULL THEN 'label_2_74'
+        WHEN t.code_2 = 75 AND t.flag IS NOT NULL THEN 'label_2_75'
+        WHEN t.code_2 = 76 AND t.flag IS NOT NULL THEN 'label_2_76'
+        WHEN t.code_2 = 77 AND t.flag IS NOT NULL THEN 'label_2_77'
+        WHEN t.code_2 = 78 AND t.flag IS NOT NULL THEN 'label_2_78'
+        WHEN t.code_2 = 79 AND t.flag IS NOT NULL THEN 'label_2_79'
+        ELSE NULL
+    END AS category_2,
+    CASE
+        WHEN t.code_3 = 0 AND t.flag IS NOT NULL THEN 'label_3_0'
+        WHEN t.code_3 = 1 AND t.flag IS NOT NULL THEN 'label_3_1'
+        WHEN t.code_3 = 2 AND t.flag IS NOT NULL THEN 'label_3_2'
+        WHEN t.code_3 = 3 AND t.flag IS NOT NULL THEN 'label_3_3'
+        WHEN t.code_3 = 4 AND t.flag IS NOT NULL THEN 'label_3_4'
+        WHEN t.code_3 = 5 AND t.flag IS NOT NULL THEN 'label_3_5'
+        WHEN t.code_3 = 6 AND t.flag IS NOT NULL THEN 'label_3_6'
+        WHEN t.code_3 = 7 AND t.flag IS NOT NULL THEN 'label_3_7'
+        WHEN t.code_3 = 8 AND t.flag IS NOT NULL THEN 'label_3_8'
+        WHEN t.code_3 = 9 AND t.flag IS NOT NULL THEN 'label_3_9'
+        WHEN t.code_3 = 10 AND t.flag IS NOT NULL THEN 'label_3_10'
+        WHEN t.code_3 = 11 AND t.flag IS NOT NULL THEN 'label_3_11'
+        WHEN t.code_3 = 12 AND t.flag IS NOT NULL THEN 'label_3_12'
+        WHEN t.code_3 = 13 AND t.flag IS NOT NULL THEN 'label_3_13'
+        WHEN t.code_3 = 14 AND t.flag IS NOT NULL THEN 'label_3_14'
+        WHEN t.code_3 = 15 AND t.flag IS NOT NULL THEN 'label_3_15'
+        WHEN t.code_3 = 16 AND t.flag IS NOT NULL THEN 'label_3_16'
+        WHEN t.code_3 = 17 AND t.flag IS NOT NULL THEN 'label_3_17'
+        WHEN t.code_3 = 18 AND t.flag IS NOT NULL THEN 'label_3_18'
+        WHEN t.code_3 = 19 AND t.flag IS NOT NULL THEN 'label_3_19'
+        WHEN t.code_3 = 20 AND t.flag IS NOT NULL THEN 'label_3_20'
+        WHEN t.code_3 = 21 AND t.flag IS NOT NULL THEN 'label_3_21'
+        WHEN t.code_3 = 22 AND t.flag IS NOT NULL THEN 'label_3_22'
+        WHEN t.code_3 = 23 AND t.flag IS NOT NULL THEN 'label_3_23'
+        WHEN t.code_3 = 24 AND t.flag IS NOT NULL THEN 'label_3_24'
+        WHEN t.code_3 = 25 AND t.flag IS NOT NULL THEN 'label_3_25'
+        WHEN t.code_3 = 26 AND t.flag IS NOT NULL THEN 'label_3_26'
+        WHEN t.code_3 = 27 AND t.flag IS NOT NULL THEN 'label_3_27'
+        WHEN t.code_3 = 28 AND t.flag IS NOT NULL THEN 'label_3_28'
+        WHEN t.code_3 = 29 AND t.flag IS NOT NULL THEN 'label_3_29'
+        WHEN t.code_3 = 30 AND t.flag IS NOT NULL THEN 'label_3_30'
+        WHEN t.code_3 = 31 AND t.flag IS NOT NULL THEN 'label_3_31'
+        WHEN t.code_3 = 32 AND t.flag IS NOT NULL THEN 'label_3_32'
+        WHEN t.code_3 = 33 AND t.flag IS NOT NULL THEN 'label_3_33'
+        WHEN t.code_3 = 34 AND t.flag IS NOT NULL THEN 'label_3_34'
+        WHEN t.code_3 = 35 AND t.flag IS NOT NULL THEN 'label_3_35'
+        WHEN t.code_3 = 36 AND t.flag IS NOT NULL THEN 'label_3_36'
+        WHEN t.code_3 = 37 AND t.flag IS NOT NULL THEN 'label_3_37'
+        WHEN t.code_3 = 38 AND t.flag IS NOT NULL THEN 'label_3_38'
+        WHEN t.code_3 = 39 AND t.flag IS NOT NULL THEN 'label_3_39'
+        WHEN t.code_3 = 40 AND t.flag IS NOT NULL THEN 'label_3_40'
+        WHEN t.code_3 = 41 AND t.flag IS NOT NULL THEN 'label_3_41'
+        WHEN t.code_3 = 42 AND t.flag IS NOT NULL THEN 'label_3_42'
+        WHEN t.code_3 = 43 AND t.flag IS NOT NULL THEN 'label_3_43'
+        WHEN t.code_3 = 44 AND t.flag IS NOT NULL THEN 'label_3_44'
+        WHEN t.code_3 = 45 AND t.flag IS NOT NULL THEN 'label_3_45'
+        WHEN t.code_3 = 46 AND t.flag IS NOT NULL THEN 'label_3_46'
+        WHEN t.code_3 = 47 AND t.flag IS NOT NULL THEN 'label_3_47'
+        WHEN t.code_3 = 48 AND t.flag IS NOT NULL THEN 'label_3_48'
+        WHEN t.code_3 = 49 AND t.flag IS NOT NULL THEN 'label_3_49'
+        WHEN t.code_3 = 50 AND t.flag IS NOT NULL THEN 'label_3_50'
+        WHEN t.code_3 = 51 AND t.flag IS NOT NULL THEN 'label_3_51'
+        WHEN t.code_3 = 52 AND t.flag IS NOT NULL THEN 'label_3_52'
+        WHEN t.code_3 = 53 AND t.flag IS NOT NULL THEN 'label_3_53'
+        WHEN t.code_3 = 54 AND t.flag IS NOT NULL THEN 'label_3_54'
+        WHEN t.code_3 = 55 AND t.flag IS NOT NULL THEN 'label_3_55'
+        WHEN t.code_3 = 56 AND t.flag IS NOT NULL THEN 'label_3_56'
+        WHEN t.code_3 = 57 AND t.flag IS NOT NULL THEN 'label_3_57'
+        WHEN t.code_3 = 58 AND t.flag IS NOT NULL THEN 'label_3_58'
+        WHEN t.code_3 = 59 AND t.flag IS NOT NULL THEN 'label_3_59'
+        WHEN t.code_3 = 60 AND t.flag IS NOT NULL THEN 'label_3_60'
+        WHEN t.code_3 = 61 AND t.flag IS NOT NULL THEN 'label_3_61'
+        WHEN t.code_3 = 62 AND t.flag IS NOT NULL THEN 'label_3_62'
+        WHEN t.code_3 = 63 AND t.flag IS NOT NULL THEN 'label_3_63'
+        WHEN t.code_3 = 64 AND t.flag IS NOT NULL THEN 'label_3_64'
+        WHEN t.code_3 = 65 AND t.flag IS NOT NULL THEN 'label_3_65'
+        WHEN t.code_3 = 66 AND t.flag IS NOT NULL THEN 'label_3_66'
+        WHEN t.code_3 = 67 AND t.flag IS NOT NULL THEN 'label_3_67'
+        WHEN t.code_3 = 68 AND t.flag IS NOT NULL THEN 'label_3_68'
+        WHEN t.code_3 = 69 AND t.flag IS NOT NULL THEN 'label_3_69'
+        WHEN t.code_3 = 70 AND t.flag IS NOT NULL THEN 'label_3_70'
+        WHEN t.code_3 = 71 AND t.flag IS NOT NULL THEN 'label_3_71'
+        WHEN t.code_3 = 72 AND t.flag IS NOT NULL THEN 'label_3_72'
+        WHEN t.code_3 = 73 AND t.flag IS NOT NULL THEN 'label_3_73'
+        WHEN t.code_3 = 74 AND t.flag IS NOT NULL THEN 'label_3_74'
+        WHEN t.code_3 = 75 AND t.flag IS NOT NULL THEN 'label_3_75'
+        WHEN t.code_3 = 76 AND t.flag IS NOT NULL THEN 'label_3_76'
+        WHEN t.code_3 = 77 AND t.flag IS NOT NULL THEN 'label_3_77'
+        WHEN t.code_3 = 78 AND t.flag IS NOT NULL THEN 'label_3_78'
+        WHEN t.code_3 = 79 AND t.flag IS NOT NULL THEN 'label_3_79'
+        ELSE NULL
+    END AS category_3,
+    CASE
+        WHEN t.code_4 = 0 AND t.flag IS NOT NULL THEN 'label_4_0'
+        WHEN t.code_4 = 1 AND t.flag IS NOT NULL THEN 'label_4_1'
+        WHEN t.code_4 = 2 AND t.flag IS NOT NULL THEN 'label_4_2'
+        WHEN t.code_4 = 3 AND t.flag IS NOT NULL THEN 'label_4_3'
+        WHEN t.code_4 = 4 AND t.flag IS NOT NULL THEN 'label_4_4'
+        WHEN t.code_4 = 5 AND t.flag IS NOT NULL THEN 'label_4_5'
+        WHEN t.code_4 = 6 AND t.flag IS NOT NULL THEN 'label_4_6'
+        WHEN t.code_4 = 7 AND t.flag IS NOT NULL THEN 'label_4_7'
+        WHEN t.code_4 = 8 AND t.flag IS NOT NULL THEN 'label_4_8'
+        WHEN t.code_4 = 9 AND t.flag IS NOT NULL THEN 'label_4_9'
+        WHEN t.code_4 = 10 AND t.flag IS NOT NULL THEN 'label_4_10'
+        WHEN t.code_4 = 11 AND t.flag IS NOT NULL THEN 'label_4_11'
+        WHEN t.code_4 = 12 AND t.flag IS NOT NULL THEN 'label_4_12'
+        WHEN t.code_4 = 13 AND t.flag IS NOT NULL THEN 'label_4_13'
+        WHEN t.code_4 = 14 AND t.flag IS NOT NULL THEN 'label_4_14'
+        WHEN t.code_4 = 15 AND t.flag IS NOT NULL THEN 'label_4_15'
+        WHEN t.code_4 = 16 AND t.flag IS NOT NULL THEN 'label_4_16'
+        WHEN t.code_4 = 17 AND t.flag IS NOT NULL THEN 'label_4_17'
+        WHEN t.code_4 = 18 AND t.flag IS NOT NULL THEN 'label_4_18'
+        WHEN t.code_4 = 19 AND t.flag IS NOT NULL THEN 'label_4_19'
+        WHEN t.code_4 = 20 AND t.flag IS NOT NULL THEN 'label_4_20'
+        WHEN t.code_4 = 21 AND t.flag IS NOT NULL THEN 'label_4_21'
+        WHEN t.code_4 = 22 AND t.flag IS NOT NULL THEN 'label_4_22'
+        WHEN t.code_4 = 23 AND t.flag IS NOT NULL THEN 'label_4_23'
+        WHEN t.code_4 = 24 AND t.flag IS NOT NULL THEN 'label_4_24'
+        WHEN t.code_4 = 25 AND t.flag IS NOT NULL THEN 'label_4_25'
+        WHEN t.code_4 = 26 AND t.flag IS NOT NULL THEN 'label_4_26'
+        WHEN t.code_4 = 27 AND t.flag IS NOT NULL THEN 'label_4_27'
+        WHEN t.code_4 = 28 AND t.flag IS NOT NULL THEN 'label_4_28'
+        WHEN t.code_4 = 29 AND t.flag IS NOT NULL THEN 'label_4_29'
+        WHEN t.code_4 = 30 AND t.flag IS NOT NULL THEN 'label_4_30'
+        WHEN t.code_4 = 31 AND t.flag IS NOT NULL THEN 'label_4_31'
+        WHEN t.code_4 = 32 AND t.flag IS NOT NULL THEN 'label_4_32'
+        WHEN t.code_4 = 33 AND t.flag IS NOT NULL THEN 'label_4_33'
+        WHEN t.code_4 = 34 AND t.flag IS NOT NULL THEN 'label_4_34'
+        WHEN t.code_4 = 35 AND t.flag IS NOT NULL THEN 'label_4_35'
+        WHEN t.code_4 = 36 AND t.flag IS NOT NULL THEN 'label_4_36'
+        WHEN t.code_4 = 37 AND t.flag IS NOT NULL THEN 'label_4_37'
+        WHEN t.code_4 = 38 AND t.flag IS NOT NULL THEN 'label_4_38'
+        WHEN t.code_4 = 39 AND t.flag IS NOT NULL THEN 'label_4_39'
+        WHEN t.code_4 = 40 AND t.flag IS NOT NULL THEN 'label_4_40'
+        WHEN t.code_4 = 41 AND t.flag IS NOT NULL THEN 'label_4_41'
+        WHEN t.code_4 = 42 AND t.flag IS NOT NULL THEN 'label_4_42'
+        WHEN t.code_4 = 43 AND t.flag IS NOT NULL THEN 'label_4_43'
+        WHEN t.code_4 = 44 AND t.flag IS NOT NULL THEN 'label_4_44'
+        WHEN t.code_4 = 45 AND t.flag IS NOT NULL THEN 'label_4_45'
+        WHEN t.code_4 = 46 AND t.flag IS NOT NULL THEN 'label_4_46'
+        WHEN t.code_4 = 47 AND t.flag IS NOT NULL THEN 'label_4_47'
+        WHEN t.code_4 = 48 AND t.flag IS NOT NULL THEN 'label_4_48'
+        WHEN t.code_4 = 49 AND t.flag IS NOT NULL THEN 'label_4_49'
+        WHEN t.code_4 = 50 AND t.flag IS NOT NULL THEN 'label_4_50'
+        WHEN t.code_4 = 51 AND t.flag IS NOT NULL THEN 'label_4_51'
+        WHEN t.code_4 = 52 AND t.flag IS NOT NULL THEN 'label_4_52'
+        WHEN t.code_4 = 53 AND t.flag IS NOT NULL THEN 'label_4_53'
+        WHEN t.code_4 = 54 AND t.flag IS NOT NULL THEN 'label_4_54'
+        WHEN t.code_4 = 55 AND t.flag IS NOT NULL THEN 'label_4_55'
+        WHEN t.code_4 = 56 AND t.flag IS NOT NULL THEN 'label_4_56'
+        WHEN t.code_4 = 57 AND t.flag IS NOT NULL THEN 'label_4_57'
+        WHEN t.code_4 = 58 AND t.flag IS NOT NULL THEN 'label_4_58'
+        WHEN t.code_4 = 59 AND t.flag IS NOT NULL THEN 'label_4_59'
+        WHEN t.code_4 = 60 AND t.flag IS NOT NULL THEN 'label_4_60'
+        WHEN t.code_4 = 61 AND t.flag IS NOT NULL THEN 'label_4_61'
+        WHEN t.code_4 = 62 AND t.flag IS NOT NULL THEN 'label_4_62'
+        WHEN t.code_4 = 63 AND t.flag IS NOT NULL THEN 'label_4_63'
+        WHEN t.code_4 = 64 AND t.flag IS NOT NULL THEN 'label_4_64'
+        WHEN t.code_4 = 65 AND t.flag IS NOT NULL THEN 'label_4_65'
+        WHEN t.code_4 = 66 AND t.flag IS NOT NULL THEN 'label_4_66'
+        WHEN t.code_4 = 67 AND t.flag IS NOT NULL THEN 'label_4_67'
+        WHEN t.code_4 = 68 AND t.flag IS NOT NULL THEN 'label_4_68'
+        WHEN t.code_4 = 69 AND t.flag IS NOT NULL THEN 'label_4_69'
+        WHEN t.code_4 = 70 AND t.flag IS NOT NULL THEN 'label_4_70'
+        WHEN t.code_4 = 71 AND t.flag IS NOT NULL THEN 'label_4_71'
+        WHEN t.code_4 = 72 AND t.flag IS NOT NULL THEN 'label_4_72'
+        WHEN t.code_4 = 73 AND t.flag IS NOT NULL THEN 'label_4_73'
+        WHEN t.code_4 = 74 AND t.flag IS NOT NULL THEN 'label_4_74'
+        WHEN t.code_4 = 75 AND t.flag IS NOT NULL THEN 'label_4_75'
+        WHEN t.code_4 = 76 AND t.flag IS NOT NULL THEN 'label_4_76'
+        WHEN t.code_4 = 77 AND t.flag IS NOT NULL THEN 'label_4_77'
+        WHEN t.code_4 = 78 AND t.flag IS NOT NULL THEN 'label_4_78'
+        WHEN t.code_4 = 79 AND t.flag IS NOT NULL THEN 'label_4_79'
+        ELSE NULL
+    END AS category_4,
+    CASE
+        WHEN t.code_5 = 0 AND t.flag IS NOT NULL THEN 'label_5_0'
+        WHEN t.code_5 = 1 AND t.flag IS NOT NULL THEN 'label_5_1'
+        WHEN t.code_5 = 2 AND t.flag IS NOT NULL THEN 'label_5_2'
+        WHEN t.code_5 = 3 AND t.flag IS NOT NULL THEN 'label_5_3'
+        WHEN t.code_5 = 4 AND t.flag IS NOT NULL THEN 'label_5_4'
+        WHEN t.code_5 = 5 AND t.flag IS NOT NULL THEN 'label_5_5'
+        WHEN t.code_5 = 6 AND t.flag IS NOT NULL THEN 'label_5_6'
+        WHEN t.code_5 = 7 AND t.flag IS NOT NULL THEN 'label_5_7'
+        WHEN t.code_5 = 8 AND t.flag IS NOT NULL THEN 'label_5_8'
+        WHEN t.code_5 = 9 AND t.flag IS NOT NULL THEN 'label_5_9'
+        WHEN t.code_5 = 10 AND t.flag IS NOT NULL THEN 'label_5_10'
+        WHEN t.code_5 = 11 AND t.flag IS NOT NULL THEN 'label_5_11'
+        WHEN t.code_5 = 12 AND t.flag IS NOT NULL THEN 'label_5_12'
+        WHEN t.code_5 = 13 AND t.flag IS NOT NULL THEN 'label_5_13'
+        WHEN t.code_5 = 14 AND t.flag IS NOT NULL THEN 'label_5_14'
+        WHEN t.code_5 = 15 AND t.flag IS NOT NULL THEN 'label_5_15'
+        WHEN t.code_5 = 16 AND t.flag IS NOT NULL THEN 'label_5_16'
+        WHEN t.code_5 = 17 AND t.flag IS NOT NULL THEN 'label_5_17'
+        WHEN t.code_5 = 18 AND t.flag IS NOT NULL THEN 'label_5_18'
+        WHEN t.code_5 = 19 AND t.flag IS NOT NULL THEN 'label_5_19'
+        WHEN t.code_5 = 20 AND t.flag IS NOT NULL THEN 'label_5_20'
+        WHEN t.code_5 = 21 AND t.flag IS NOT NULL THEN 'label_5_21'
+        WHEN t.code_5 = 22 AND t.flag IS NOT NULL THEN 'label_5_22'
+        WHEN t.code_5 = 23 AND t.flag IS NOT NULL THEN 'label_5_23'
+        WHEN t.code_5 = 24 AND t.flag IS NOT NULL THEN 'label_5_24'
+        WHEN t.code_5 = 25 AND t.flag IS NOT NULL THEN 'label_5_25'
+        WHEN t.code_5 = 26 AND t.flag IS NOT NULL THEN 'label_5_26'
+        WHEN t.code_5 = 27 AND t.flag IS NOT NULL THEN 'label_5_27'
+        WHEN t.code_5 = 28 AND t.flag IS NOT NULL THEN 'label_5_28'
+        WHEN t.code_5 = 29 AND t.flag IS NOT NULL THEN 'label_5_29'
+        WHEN t.code_5 = 30 AND t.flag IS NOT NULL THEN 'label_5_30'
+        WHEN t.code_5 = 31 AND t.flag IS NOT NULL THEN 'label_5_31'
+        WHEN t.code_5 = 32 AND t.flag IS NOT NULL THEN 'label_5_32'
+        WHEN t.code_5 = 33 AND t.flag IS NOT NULL THEN 'label_5_33'
+        WHEN t.code_5 = 34 AND t.flag IS NOT NULL THEN 'label_5_34'
+        WHEN t.code_5 = 35 AND t.flag IS NOT NULL THEN 'label_5_35'
+        WHEN t.code_5 = 36 AND t.flag IS NOT NULL THEN 'label_5_36'
+        WHEN t.code_5 = 37 AND t.flag IS NOT NULL THEN 'label_5_37'
+        WHEN t.code_5 = 38 AND t.flag IS NOT NULL THEN 'label_5_38'
+        WHEN t.code_5 = 39 AND t.flag IS NOT NULL THEN 'label_5_39'
+        WHEN t.code_5 = 40 AND t.flag IS NOT NULL THEN 'label_5_40'
+        WHEN t.code_5 = 41 AND t.flag IS NOT NULL THEN 'label_5_41'
+        WHEN t.code_5 = 42 AND t.flag IS NOT NULL THEN 'label_5_42'
+        WHEN t.code_5 = 43 AND t.flag IS NOT NULL THEN 'label_5_43'
+        WHEN t.code_5 = 44 AND t.flag IS NOT NULL THEN 'label_5_44'
+        WHEN t.code_5 = 45 AND t.flag IS NOT NULL THEN 'label_5_45'
+        WHEN t.code_5 = 46 AND t.flag IS NOT NULL THEN 'label_5_46'
+        WHEN t.code_5 = 47 AND t.flag IS NOT NULL THEN 'label_5_47'
+        WHEN t.code_5 = 48 AND t.flag IS NOT NULL THEN 'label_5_48'
+        WHEN t.code_5 = 49 AND t.flag IS NOT NULL THEN 'label_5_49'
+        WHEN t.code_5 = 50 AND t.flag IS NOT NULL THEN 'label_5_50'
+        WHEN t.code_5 = 51 AND t.flag IS NOT NULL THEN 'label_5_51'
+        WHEN t.code_5 = 52 AND t.flag IS NOT NULL THEN 'label_5_52'
+        WHEN t.code_5 = 53 AND t.flag IS NOT NULL THEN 'label_5_53'
+        WHEN t.code_5 = 54 AND t.flag IS NOT NULL THEN 'label_5_54'
+        WHEN t.code_5 = 55 AND t.flag IS NOT NULL THEN 'label_5_55'
+        WHEN t.code_5 = 56 AND t.flag IS NOT NULL THEN 'label_5_56'
+        WHEN t.code_5 = 57 AND t.flag IS NOT NULL THEN 'label_5_57'
+        WHEN t.code_5 = 58 AND t.flag IS NOT NULL THEN 'label_5_58'
+        WHEN t.code_5 = 59 AND t.flag IS NOT NULL THEN 'label_5_59'
+        WHEN t.code_5 = 60 AND t.flag IS NOT NULL THEN 'label_5_60'
+        WHEN t.code_5 = 61 AND t.flag IS NOT NULL THEN 'label_5_61'
+        WHEN t.code_5 = 62 AND t.flag IS NOT NULL THEN 'label_5_62'
+        WHEN t.code_5 = 63 AND t.flag IS NOT NULL THEN 'label_5_63'
+        WHEN t.code_5 = 64 AND t.flag IS NOT NULL THEN 'label_5_64'
+        WHEN t.code_5 = 65 AND t.flag IS NOT NULL THEN 'label_5_65'
+        WHEN t.code_5 = 66 AND t.flag IS NOT NULL THEN 'label_5_66'
+        WHEN t.code_5 = 67 AND t.flag IS NOT NULL THEN 'label_5_67'
+        WHEN t.code_5 = 68 AND t.flag IS NOT NULL THEN 'label_5_68'
+        WHEN t.code_5 = 69 AND t.flag IS NOT NULL THEN 'label_5_69'
+        WHEN t.code_5 = 70 AND t.flag IS NOT NULL THEN 'label_5_70'
+        WHEN t.code_5 = 71 AND t.flag IS NOT NULL THEN 'label_5_71'
+        WHEN t.code_5 = 72 AND t.flag IS NOT NULL THEN 'label_5_72'
+        WHEN t.code_5 = 73 AND t.flag IS NOT NULL THEN 'label_5_73'
+        WHEN t.code_5 = 74 AND t.flag IS NOT NULL THEN 'label_5_74'
+        WHEN t.code_5 = 75 AND t.flag IS NOT NULL THEN 'label_5_75'
+        WHEN t.code_5 = 76 AND t.flag IS NOT NULL THEN 'label_5_76'
+        WHEN t.code_5 = 77 AND t.flag IS NOT NULL THEN 'label_5_77'
+        WHEN t.code_5 = 78 AND t.flag IS NOT NULL THEN 'label_5_78'
+        WHEN t.code_5 = 79 AND t.flag IS NOT NULL THEN 'label_5_79'
+        ELSE NULL
+    END AS category_5,
+    CASE
+        WHEN t.code_6 = 0 AND t.flag IS NOT NULL THEN 'label_6_0'
+        WHEN t.code_6 = 1 AND t.flag IS NOT NULL THEN 'label_6_1'
+        WHEN t.code_6 = 2 AND t.flag IS NOT NULL THEN 'label_6_2'
+        WHEN t.code_6 = 3 AND t.flag IS NOT NULL THEN 'label_6_3'
+        WHEN t.code_6 = 4 AND t.flag IS NOT NULL THEN 'label_6_4'
+        WHEN t.code_6 = 5 AND t.flag IS NOT NULL THEN 'label_6_5'
+        WHEN t.code_6 = 6 AND t.flag IS NOT NULL THEN 'label_6_6'
+        WHEN t.code_6 = 7 AND t.flag IS NOT NULL THEN 'label_6_7'
+        WHEN t.code_6 = 8 AND t.flag IS NOT NULL THEN 'label_6_8'
+        WHEN t.code_6 = 9 AND t.flag IS NOT NULL THEN 'label_6_9'
+        WHEN t.code_6 = 10 AND t.flag IS NOT NULL THEN 'label_6_10'
+        WHEN t.code_6 = 11 AND t.flag IS NOT NULL THEN 'label_6_11'
+        WHEN t.code_6 = 12 AND t.flag IS NOT NULL THEN 'label_6_12'
+        WHEN t.code_6 = 13 AND t.flag IS NOT NULL THEN 'label_6_13'
+        WHEN t.code_6 = 14 AND t.flag IS NOT NULL THEN 'label_6_14'
+        WHEN t.code_6 = 15 AND t.flag IS NOT NULL THEN 'label_6_15'
+        WHEN t.code_6 = 16 AND t.flag IS NOT NULL THEN 'label_6_16'
+        WHEN t.code_6 = 17 AND t.flag IS NOT NULL THEN 'label_6_17'
+        WHEN t.code_6 = 18 AND t.flag IS NOT NULL THEN 'label_6_18'
+        WHEN t.code_6 = 19 AND t.flag IS NOT NULL THEN 'label_6_19'
+        WHEN t.code_6 = 20 AND t.flag IS NOT NULL THEN 'label_6_20'
+        WHEN t.code_6 = 21 AND t.flag IS NOT NULL THEN 'label_6_21'
+        WHEN t.code_6 = 22 AND t.flag IS NOT NULL THEN 'label_6_22'
+        WHEN t.code_6 = 23 AND t.flag IS NOT NULL THEN 'label_6_23'
+        WHEN t.code_6 = 24 AND t.flag IS NOT NULL THEN 'label_6_24'
+        WHEN t.code_6 = 25 AND t.flag IS NOT NULL THEN 'label_6_25'
+        WHEN t.code_6 = 26 AND t.flag IS NOT NULL THEN 'label_6_26'
+        WHEN t.code_6 = 27 AND t.flag IS NOT NULL THEN 'label_6_27'
+        WHEN t.code_6 = 28 AND t.flag IS NOT NULL THEN 'label_6_28'
+        WHEN t.code_6 = 29 AND t.flag IS NOT NULL THEN 'label_6_29'
+        WHEN t.code_6 = 30 AND t.flag IS NOT NULL THEN 'label_6_30'
+        WHEN t.code_6 = 31 AND t.flag IS NOT NULL THEN 'label_6_31'
+        WHEN t.code_6 = 32 AND t.flag IS NOT NULL THEN 'label_6_32'
+        WHEN t.code_6 = 33 AND t.flag IS NOT NULL THEN 'label_6_33'
+        WHEN t.code_6 = 34 AND t.flag IS NOT NULL THEN 'label_6_34'
+        WHEN t.code_6 = 35 AND t.flag IS NOT NULL THEN 'label_6_35'
+        WHEN t.code_6 = 36 AND t.flag IS NOT NULL THEN 'label_6_36'
+        WHEN t.code_6 = 37 AND t.flag IS NOT NULL THEN 'label_6_37'
+        WHEN t.code_6 = 38 AND t.flag IS NOT NULL THEN 'label_6_38'
+        WHEN t.code_6 = 39 AND t.flag IS NOT NULL THEN 'label_6_39'
+        WHEN t.code_6 = 40 AND t.flag IS NOT NULL THEN 'label_6_40'
+        WHEN t.code_6 = 41 AND t.flag IS NOT NULL THEN 'label_6_41'
+        WHEN t.code_6 = 42 AND t.flag IS NOT NULL THEN 'label_6_42'
+        WHEN t.code_6 = 43 AND t.flag IS NOT NULL THEN 'label_6_43'
+        WHEN t.code_6 = 44 AND t.flag IS NOT NULL THEN 'label_6_44'
+        WHEN t.code_6 = 45 AND t.flag IS NOT NULL THEN 'label_6_45'
+        WHEN t.code_6 = 46 AND t.flag IS NOT NULL THEN 'label_6_46'
+        WHEN t.code_6 = 47 AND t.flag IS NOT NULL THEN 'label_6_47'
+        WHEN t.code_6 = 48 AND t.flag IS NOT NULL THEN 'label_6_48'
+        WHEN t.code_6 = 49 AND t.flag IS NOT NULL THEN 'label_6_49'
+        WHEN t.code_6 = 50 AND t.flag IS NOT NULL THEN 'label_6_50'
+        WHEN t.code_6 = 51 AND t.flag IS NOT NULL THEN 'label_6_51'
+        WHEN t.code_6 = 52 AND t.flag IS NOT NULL THEN 'label_6_52'
+        WHEN t.code_6 = 53 AND t.flag IS NOT NULL THEN 'label_6_53'
+        WHEN t.code_6 = 54 AND t.flag IS NOT NULL THEN 'label_6_54'
+        WHEN t.code_6 = 55 AND t.flag IS NOT NULL THEN 'label_6_55'
+        WHEN t.code_6 = 56 AND t.flag IS NOT NULL THEN 'label_6_56'
+        WHEN t.code_6 = 57 AND t.flag IS NOT NULL THEN 'label_6_57'
+        WHEN t.code_6 = 58 AND t.flag IS NOT NULL THEN 'label_6_58'
+        WHEN t.code_6 = 59 AND t.flag IS NOT NULL THEN 'label_6_59'
+        WHEN t.code_6 = 60 AND t.flag IS NOT NULL THEN 'label_6_60'
+        WHEN t.code_6 = 61 AND t.flag IS NOT NULL THEN 'label_6_61'
+        WHEN t.code_6 = 62 AND t.flag IS NOT NULL THEN 'label_6_62'
+        WHEN t.code_6 = 63 AND t.flag IS NOT NULL THEN 'label_6_63'
+        WHEN t.code_6 = 64 AND t.flag IS NOT NULL THEN 'label_6_64'
+        WHEN t.code_6 = 65 AND t.flag IS NOT NULL THEN 'label_6_65'
+        WHEN t.code_6 = 66 AND t.flag IS NOT NULL THEN 'label_6_66'
+        WHEN t.code_6 = 67 AND t.flag IS NOT NULL THEN 'label_6_67'
+        WHEN t.code_6 = 68 AND t.flag IS NOT NULL THEN 'label_6_68'
+        WHEN t.code_6 = 69 AND t.flag IS NOT NULL THEN 'label_6_69'
+        WHEN t.code_6 = 70 AND t.flag IS NOT NULL THEN 'label_6_70'
+        WHEN t.code_6 = 71 AND t.flag IS NOT NULL THEN 'label_6_71'
+        WHEN t.code_6 = 72 AND t.flag IS NOT NULL THEN 'label_6_72'
+        WHEN t.code_6 = 73 AND t.flag IS NOT NULL THEN 'label_6_73'
+        WHEN t.code_6 = 74 AND t.flag IS NOT NULL THEN 'label_6_74'
+        WHEN t.code_6 = 75 AND t.flag IS NOT NULL THEN 'label_6_75'
+        WHEN t.code_6 = 76 AND t.flag IS NOT NULL THEN 'label_6_76'
+        WHEN t.code_6 = 77 AND t.flag IS NOT NULL THEN 'label_6_77'
+        WHEN t.code_6 = 78 AND t.flag IS NOT NULL THEN 'label_6_78'
+        WHEN t.code_6 = 79 AND t.flag IS NOT NULL THEN 'label_6_79'
+        ELSE NULL
+    END AS category_6,
+    CASE
+        WHEN t.code_7 = 0 AND t.flag IS NOT NULL THEN 'label_7_0'
+        WHEN t.code_7 = 1 AND t.flag IS NOT NULL THEN 'label_7_1'
+        WHEN t.code_7 = 2 AND t.flag IS NOT NULL THEN 'label_7_2'
+        WHEN t.code_7 = 3 AND t.flag IS NOT NULL THEN 'label_7_3'
+        WHEN t.code_7 = 4 AND t.flag IS NOT NULL THEN 'label_7_4'
+        WHEN t.code_7 = 5 AND t.flag IS NOT NULL THEN 'label_7_5'
+        WHEN t.code_7 = 6 AND t.flag IS NOT NULL THEN 'label_7_6'
+        WHEN t.code_7 = 7 AND t.flag IS NOT NULL THEN 'label_7_7'
+        WHEN t.code_7 = 8 AND t.flag IS NOT NULL THEN 'label_7_8'
+        WHEN t.code_7 = 9 AND t.flag IS NOT NULL THEN 'label_7_9'
+        WHEN t.code_7 = 10 AND t.flag IS NOT NULL THEN 'label_7_10'
+        WHEN t.code_7 = 11 AND t.flag IS NOT NULL THEN 'label_7_11'
+        WHEN t.code_7 = 12 AND t.flag IS NOT NULL THEN 'label_7_12'
+        WHEN t.code_7 = 13 AND t.flag IS NOT NULL THEN 'label_7_13'
+        WHEN t.code_7 = 14 AND t.flag IS NOT NULL THEN 'label_7_14'
+        WHEN t.code_7 = 15 AND t.flag IS NOT NULL THEN 'label_7_15'
+        WHEN t.code_7 = 16 AND t.flag IS NOT NULL THEN 'label_7_16'
+        WHEN t.code_7 = 17 AND t.flag IS NOT NULL THEN 'label_7_17'
+        WHEN t.code_7 = 18 AND t.flag IS NOT NULL THEN 'label_7_18'
+        WHEN t.code_7 = 19 AND t.flag IS NOT NULL THEN 'label_7_19'
+        WHEN t.code_7 = 20 AND t.flag IS NOT NULL THEN 'label_7_20'
+        WHEN t.code_7 = 21 AND t.flag IS NOT NULL THEN 'label_7_21'
+        WHEN t.code_7 = 22 AND t.flag IS NOT NULL THEN 'label_7_22'
+        WHEN t.code_7 = 23 AND t.flag IS NOT NULL THEN 'label_7_23'
+        WHEN t.code_7 = 24 AND t.flag IS NOT NULL THEN 'label_7_24'
+        WHEN t.code_7 = 25 AND t.flag IS NOT NULL THEN 'label_7_25'
+        WHEN t.code_7 = 26 AND t.flag IS NOT NULL THEN 'label_7_26'
+        WHEN t.code_7 = 27 AND t.flag IS NOT NULL THEN 'label_7_27'
+        WHEN t.code_7 = 28 AND t.flag IS NOT NULL THEN 'label_7_28'
+        WHEN t.code_7 = 29 AND t.flag IS NOT NULL THEN 'label_7_29'
+        WHEN t.code_7 = 30 AND t.flag IS NOT NULL THEN 'label_7_30'
+        WHEN t.code_7 = 31 AND t.flag IS NOT NULL THEN 'label_7_31'
+        WHEN t.code_7 = 32 AND t.flag IS NOT NULL THEN 'label_7_32'
+        WHEN t.code_7 = 33 AND t.flag IS NOT NULL THEN 'label_7_33'
+        WHEN t.code_7 = 34 AND t.flag IS NOT NULL THEN 'label_7_34'
+        WHEN t.code_7 = 35 AND t.flag IS NOT NULL THEN 'label_7_35'
+        WHEN t.code_7 = 36 AND t.flag IS NOT NULL THEN 'label_7_36'
+        WHEN t.code_7 = 37 AND t.flag IS NOT NULL THEN 'label_7_37'
+        WHEN t.code_7 = 38 AND t.flag IS NOT NULL THEN 'label_7_38'
+        WHEN t.code_7 = 39 AND t.flag IS NOT NULL THEN 'label_7_39'
+        WHEN t.code_7 = 40 AND t.flag IS NOT NULL THEN 'label_7_40'
+        WHEN t.code_7 = 41 AND t.flag IS NOT NULL THEN 'label_7_41'
+        WHEN t.code_7 = 42 AND t.flag IS NOT NULL THEN 'label_7_42'
+        WHEN t.code_7 = 43 AND t.flag IS NOT NULL THEN 'label_7_43'
+        WHEN t.code_7 = 44 AND t.flag IS NOT NULL THEN 'label_7_44'
+        WHEN t.code_7 = 45 AND t.flag IS NOT NULL THEN 'label_7_45'
+        WHEN t.code_7 = 46 AND t.flag IS NOT NULL THEN 'label_7_46'
+        WHEN t.code_7 = 47 AND t.flag IS NOT NULL THEN 'label_7_47'
+        WHEN t.code_7 = 48 AND t.flag IS NOT NULL THEN 'label_7_48'
+        WHEN t.code_7 = 49 AND t.flag IS NOT NULL THEN 'label_7_49'
+        WHEN t.code_7 = 50 AND t.flag IS NOT NULL THEN 'label_7_50'
+        WHEN t.code_7 = 51 AND t.flag IS NOT NULL THEN 'label_7_51'
+        WHEN t.code_7 = 52 AND t.flag IS NOT NULL THEN 'label_7_52'
+        WHEN t.code_7 = 53 AND t.flag IS NOT NULL THEN 'label_7_53'
+        WHEN t.code_7 = 54 AND t.flag IS NOT NULL THEN 'label_7_54'
+        WHEN t.code_7 = 55 AND t.flag IS NOT NULL THEN 'label_7_55'
+        WHEN t.code_7 = 56 AND t.flag IS NOT NULL THEN 'label_7_56'
+        WHEN t.code_7 = 57 AND t.flag IS NOT NULL THEN 'label_7_57'
+        WHEN t.code_7 = 58 AND t.flag IS NOT NULL THEN 'label_7_58'
+        WHEN t.code_7 = 59 AND t.flag IS NOT NULL THEN 'label_7_59'
+        WHEN t.code_7 = 60 AND t.flag IS NOT NULL THEN 'label_7_60'
+        WHEN t.code_7 = 61 AND t.flag IS NOT NULL THEN 'label_7_61'
+        WHEN t.code_7 = 62 AND t.flag IS NOT NULL THEN 'label_7_62'
+        WHEN t.code_7 = 63 AND t.flag IS NOT NULL THEN 'label_7_63'
+        WHEN t.code_7 = 64 AND t.flag IS NOT NULL THEN 'label_7_64'
+        WHEN t.code_7 = 65 AND t.flag IS NOT NULL THEN 'label_7_65'
+        WHEN t.code_7 = 66 AND t.flag IS NOT NULL THEN 'label_7_66'
+        WHEN t.code_7 = 67 AND t.flag IS NOT NULL THEN 'label_7_67'
+        WHEN t.code_7 = 68 AND t.flag IS NOT NULL THEN 'label_7_68'
+        WHEN t.code_7 = 69 AND t.flag IS NOT NULL THEN 'label_7_69'
+        WHEN t.code_7 = 70 AND t.flag IS NOT NULL THEN 'label_7_70'
+        WHEN t.code_7 = 71 AND t.flag IS NOT NULL THEN 'label_7_71'
+        WHEN t.code_7 = 72 AND t.flag IS NOT NULL THEN 'label_7_72'
+        WHEN t.code_7 = 73 AND t.flag IS NOT NULL THEN 'label_7_73'
+        WHEN t.code_7 = 74 AND t.flag IS NOT NULL THEN 'label_7_74'
+        WHEN t.code_7 = 75 AND t.flag IS NOT NULL THEN 'label_7_75'
+        WHEN t.code_7 = 76 AND t.flag IS NOT NULL THEN 'label_7_76'
+        WHEN t.code_7 = 77 AND t.flag IS NOT NULL THEN 'label_7_77'
+        WHEN t.code_7 = 78 AND t.flag IS NOT NULL THEN 'label_7_78'
+        WHEN t.code_7 = 79 AND t.flag IS NOT NULL THEN 'label_7_79'
+        ELSE NULL
+    END AS category_7
+FROM warehouse.codes t;
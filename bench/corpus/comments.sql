@@ -0,0 +1,1210 @@
+-- Daily report of the active users
+-- Owner: analytics
+
+SELECT
+    -- column 0: computed from the raw events
+    t.metric_0, -- kept for the dashboard 0
+    -- column 1: computed from the raw events
+    t.metric_1, -- kept for the dashboard 1
+    -- column 2: computed from the raw events
+    t.metric_2, -- kept for the dashboard 2
+    -- column 3: computed from the raw events
+    t.metric_3, -- kept for the dashboard 3
+    -- column 4: computed from the raw events
+    t.metric_4, -- kept for the dashboard 4
+    -- column 5: computed from the raw events
+    t.metric_5, -- kept for the dashboard 5
+    -- column 6: computed from the raw events
+    t.metric_6, -- kept for the dashboard 6
+    -- column 7: computed from the raw events
+    t.metric_7, -- kept for the dashboard 7
+    -- column 8: computed from the raw events
+    t.metric_8, -- kept for the dashboard 8
+    -- column 9: computed from the raw events
+    t.metric_9, -- kept for the dashboard 9
+    -- column 10: computed from the raw events
+    t.metric_10, -- kept for the dashboard 10
+    -- column 11: computed from the raw events
+    t.metric_11, -- kept for the dashboard 11
+    -- column 12: computed from the raw events
+    t.metric_12, -- kept for the dashboard 12
+    -- column 13: computed from the raw events
+    t.metric_13, -- kept for the dashboard 13
+    -- column 14: computed from the raw events
+    t.metric_14, -- kept for the dashboard 14
+    -- column 15: computed from the raw events
+    t.metric_15, -- kept for the dashboard 15
+    -- column 16: computed from the raw events
+    t.metric_16, -- kept for the dashboard 16
+    -- column 17: computed from the raw events
+    t.metric_17, -- kept for the dashboard 17
+    -- column 18: computed from the raw events
+    t.metric_18, -- kept for the dashboard 18
+    -- column 19: computed from the raw events
+    t.metric_19, -- kept for the dashboard 19
+    -- column 20: computed from the raw events
+    t.metric_20, -- kept for the dashboard 20
+    -- column 21: computed from the raw events
+    t.metric_21, -- kept for the dashboard 21
+    -- column 22: computed from the raw events
+    t.metric_22, -- kept for the dashboard 22
+    -- column 23: computed from the raw events
+    t.metric_23, -- kept for the dashboard 23
+    -- column 24: computed from the raw events
+    t.metric_24, -- kept for the dashboard 24
+    -- column 25: computed from the raw events
+    t.metric_25, -- kept for the dashboard 25
+    -- column 26: computed from the raw events
+    t.metric_26, -- kept for the dashboard 26
+    -- column 27: computed from the raw events
+    t.metric_27, -- kept for the dashboard 27
+    -- column 28: computed from the raw events
+    t.metric_28, -- kept for the dashboard 28
+    -- column 29: computed from the raw events
+    t.metric_29, -- kept for the dashboard 29
+    -- column 30: computed from the raw events
+    t.metric_30, -- kept for the dashboard 30
+    -- column 31: computed from the raw events
+    t.metric_31, -- kept for the dashboard 31
+    -- column 32: computed from the raw events
+    t.metric_32, -- kept for the dashboard 32
+    -- column 33: computed from the raw events
+    t.metric_33, -- kept for the dashboard 33
+    -- column 34: computed from the raw events
+    t.metric_34, -- kept for the dashboard 34
+    -- column 35: computed from the raw events
+    t.metric_35, -- kept for the dashboard 35
+    -- column 36: computed from the raw events
+    t.metric_36, -- kept for the dashboard 36
+    -- column 37: computed from the raw events
+    t.metric_37, -- kept for the dashboard 37
+    -- column 38: computed from the raw events
+    t.metric_38, -- kept for the dashboard 38
+    -- column 39: computed from the raw events
+    t.metric_39, -- kept for the dashboard 39
+    -- column 40: computed from the raw events
+    t.metric_40, -- kept for the dashboard 40
+    -- column 41: computed from the raw events
+    t.metric_41, -- kept for the dashboard 41
+    -- column 42: computed from the raw events
+    t.metric_42, -- kept for the dashboard 42
+    -- column 43: computed from the raw events
+    t.metric_43, -- kept for the dashboard 43
+    -- column 44: computed from the raw events
+    t.metric_44, -- kept for the dashboard 44
+    -- column 45: computed from the raw events
+    t.metric_45, -- kept for the dashboard 45
+    -- column 46: computed from the raw events
+    t.metric_46, -- kept for the dashboard 46
+    -- column 47: computed from the raw events
+    t.metric_47, -- kept for the dashboard 47
+    -- column 48: computed from the raw events
+    t.metric_48, -- kept for the dashboard 48
+    -- column 49: computed from the raw events
+    t.metric_49, -- kept for the dashboard 49
+    -- column 50: computed from the raw events
+    t.metric_50, -- kept for the dashboard 50
+    -- column 51: computed from the raw events
+    t.metric_51, -- kept for the dashboard 51
+    -- column 52: computed from the raw events
+    t.metric_52, -- kept for the dashboard 52
+    -- column 53: computed from the raw events
+    t.metric_53, -- kept for the dashboard 53
+    -- column 54: computed from the raw events
+    t.metric_54, -- kept for the dashboard 54
+    -- column 55: computed from the raw events
+    t.metric_55, -- kept for the dashboard 55
+    -- column 56: computed from the raw events
+    t.metric_56, -- kept for the dashboard 56
+    -- column 57: computed from the raw events
+    t.metric_57, -- kept for the dashboard 57
+    -- column 58: computed from the raw events
+    t.metric_58, -- kept for the dashboard 58
+    -- column 59: computed from the raw events
+    t.metric_59, -- kept for the dashboard 59
+    -- column 60: computed from the raw events
+    t.metric_60, -- kept for the dashboard 60
+    -- column 61: computed from the raw events
+    t.metric_61, -- kept for the dashboard 61
+    -- column 62: computed from the raw events
+    t.metric_62, -- kept for the dashboard 62
+    -- column 63: computed from the raw events
+    t.metric_63, -- kept for the dashboard 63
+    -- column 64: computed from the raw events
+    t.metric_64, -- kept for the dashboard 64
+    -- column 65: computed from the raw events
+    t.metric_65, -- kept for the dashboard 65
+    -- column 66: computed from the raw events
+    t.metric_66, -- kept for the dashboard 66
+    -- column 67: computed from the raw events
+    t.metric_67, -- kept for the dashboard 67
+    -- column 68: computed from the raw events
+    t.metric_68, -- kept for the dashboard 68
+    -- column 69: computed from the raw events
+    t.metric_69, -- kept for the dashboard 69
+    -- column 70: computed from the raw events
+    t.metric_70, -- kept for the dashboard 70
+    -- column 71: computed from the raw events
+    t.metric_71, -- kept for the dashboard 71
+    -- column 72: computed from the raw events
+    t.metric_72, -- kept for the dashboard 72
+    -- column 73: computed from the raw events
+    t.metric_73, -- kept for the dashboard 73
+    -- column 74: computed from the raw events
+    t.metric_74, -- kept for the dashboard 74
+    -- column 75: computed from the raw events
+    t.metric_75, -- kept for the dashboard 75
+    -- column 76: computed from the raw events
+    t.metric_76, -- kept for the dashboard 76
+    -- column 77: computed from the raw events
+    t.metric_77, -- kept for the dashboard 77
+    -- column 78: computed from the raw events
+    t.metric_78, -- kept for the dashboard 78
+    -- column 79: computed from the raw events
+    t.metric_79, -- kept for the dashboard 79
+    -- column 80: computed from the raw events
+    t.metric_80, -- kept for the dashboard 80
+    -- column 81: computed from the raw events
+    t.metric_81, -- kept for the dashboard 81
+    -- column 82: computed from the raw events
+    t.metric_82, -- kept for the dashboard 82
+    -- column 83: computed from the raw events
+    t.metric_83, -- kept for the dashboard 83
+    -- column 84: computed from the raw events
+    t.metric_84, -- kept for the dashboard 84
+    -- column 85: computed from the raw events
+    t.metric_85, -- kept for the dashboard 85
+    -- column 86: computed from the raw events
+    t.metric_86, -- kept for the dashboard 86
+    -- column 87: computed from the raw events
+    t.metric_87, -- kept for the dashboard 87
+    -- column 88: computed from the raw events
+    t.metric_88, -- kept for the dashboard 88
+    -- column 89: computed from the raw events
+    t.metric_89, -- kept for the dashboard 89
+    -- column 90: computed from the raw events
+    t.metric_90, -- kept for the dashboard 90
+    -- column 91: computed from the raw events
+    t.metric_91, -- kept for the dashboard 91
+    -- column 92: computed from the raw events
+    t.metric_92, -- kept for the dashboard 92
+    -- column 93: computed from the raw events
+    t.metric_93, -- kept for the dashboard 93
+    -- column 94: computed from the raw events
+    t.metric_94, -- kept for the dashboard 94
+    -- column 95: computed from the raw events
+    t.metric_95, -- kept for the dashboard 95
+    -- column 96: computed from the raw events
+    t.metric_96, -- kept for the dashboard 96
+    -- column 97: computed from the raw events
+    t.metric_97, -- kept for the dashboard 97
+    -- column 98: computed from the raw events
+    t.metric_98, -- kept for the dashboard 98
+    -- column 99: computed from the raw events
+    t.metric_99, -- kept for the dashboard 99
+    -- column 100: computed from the raw events
+    t.metric_100, -- kept for the dashboard 100
+    -- column 101: computed from the raw events
+    t.metric_101, -- kept for the dashboard 101
+    -- column 102: computed from the raw events
+    t.metric_102, -- kept for the dashboard 102
+    -- column 103: computed from the raw events
+    t.metric_103, -- kept for the dashboard 103
+    -- column 104: computed from the raw events
+    t.metric_104, -- kept for the dashboard 104
+    -- column 105: computed from the raw events
+    t.metric_105, -- kept for the dashboard 105
+    -- column 106: computed from the raw events
+    t.metric_106, -- kept for the dashboard 106
+    -- column 107: computed from the raw events
+    t.metric_107, -- kept for the dashboard 107
+    -- column 108: computed from the raw events
+    t.metric_108, -- kept for the dashboard 108
+    -- column 109: computed from the raw events
+    t.metric_109, -- kept for the dashboard 109
+    -- column 110: computed from the raw events
+    t.metric_110, -- kept for the dashboard 110
+    -- column 111: computed from the raw events
+    t.metric_111, -- kept for the dashboard 111
+    -- column 112: computed from the raw events
+    t.metric_112, -- kept for the dashboard 112
+    -- column 113: computed from the raw events
+    t.metric_113, -- kept for the dashboard 113
+    -- column 114: computed from the raw events
+    t.metric_114, -- kept for the dashboard 114
+    -- column 115: computed from the raw events
+    t.metric_115, -- kept for the dashboard 115
+    -- column 116: computed from the raw events
+    t.metric_116, -- kept for the dashboard 116
+    -- column 117: computed from the raw events
+    t.metric_117, -- kept for the dashboard 117
+    -- column 118: computed from the raw events
+    t.metric_118, -- kept for the dashboard 118
+    -- column 119: computed from the raw events
+    t.metric_119, -- kept for the dashboard 119
+    -- column 120: computed from the raw events
+    t.metric_120, -- kept for the dashboard 120
+    -- column 121: computed from the raw events
+    t.metric_121, -- kept for the dashboard 121
+    -- column 122: computed from the raw events
+    t.metric_122, -- kept for the dashboard 122
+    -- column 123: computed from the raw events
+    t.metric_123, -- kept for the dashboard 123
+    -- column 124: computed from the raw events
+    t.metric_124, -- kept for the dashboard 124
+    -- column 125: computed from the raw events
+    t.metric_125, -- kept for the dashboard 125
+    -- column 126: computed from the raw events
+    t.metric_126, -- kept for the dashboard 126
+    -- column 127: computed from the raw events
+    t.metric_127, -- kept for the dashboard 127
+    -- column 128: computed from the raw events
+    t.metric_128, -- kept for the dashboard 128
+    -- column 129: computed from the raw events
+    t.metric_129, -- kept for the dashboard 129
+    -- column 130: computed from the raw events
+    t.metric_130, -- kept for the dashboard 130
+    -- column 131: computed from the raw events
+    t.metric_131, -- kept for the dashboard 131
+    -- column 132: computed from the raw events
+    t.metric_132, -- kept for the dashboard 132
+    -- column 133: computed from the raw events
+    t.metric_133, -- kept for the dashboard 133
+    -- column 134: computed from the raw events
+    t.metric_134, -- kept for the dashboard 134
+    -- column 135: computed from the raw events
+    t.metric_135, -- kept for the dashboard 135
+    -- column 136: computed from the raw events
+    t.metric_136, -- kept for the dashboard 136
+    -- column 137: computed from the raw events
+    t.metric_137, -- kept for the dashboard 137
+    -- column 138: computed from the raw events
+    t.metric_138, -- kept for the dashboard 138
+    -- column 139: computed from the raw events
+    t.metric_139, -- kept for the dashboard 139
+    -- column 140: computed from the raw events
+    t.metric_140, -- kept for the dashboard 140
+    -- column 141: computed from the raw events
+    t.metric_141, -- kept for the dashboard 141
+    -- column 142: computed from the raw events
+    t.metric_142, -- kept for the dashboard 142
+    -- column 143: computed from the raw events
+    t.metric_143, -- kept for the dashboard 143
+    -- column 144: computed from the raw events
+    t.metric_144, -- kept for the dashboard 144
+    -- column 145: computed from the raw events
+    t.metric_145, -- kept for the dashboard 145
+    -- column 146: computed from the raw events
+    t.metric_146, -- kept for the dashboard 146
+    -- column 147: computed from the raw events
+    t.metric_147, -- kept for the dashboard 147
+    -- column 148: computed from the raw events
+    t.metric_148, -- kept for the dashboard 148
+    -- column 149: computed from the raw events
+    t.metric_149, -- kept for the dashboard 149
+    -- column 150: computed from the raw events
+    t.metric_150, -- kept for the dashboard 150
+    -- column 151: computed from the raw events
+    t.metric_151, -- kept for the dashboard 151
+    -- column 152: computed from the raw events
+    t.metric_152, -- kept for the dashboard 152
+    -- column 153: computed from the raw events
+    t.metric_153, -- kept for the dashboard 153
+    -- column 154: computed from the raw events
+    t.metric_154, -- kept for the dashboard 154
+    -- column 155: computed from the raw events
+    t.metric_155, -- kept for the dashboard 155
+    -- column 156: computed from the raw events
+    t.metric_156, -- kept for the dashboard 156
+    -- column 157: computed from the raw events
+    t.metric_157, -- kept for the dashboard 157
+    -- column 158: computed from the raw events
+    t.metric_158, -- kept for the dashboard 158
+    -- column 159: computed from the raw events
+    t.metric_159, -- kept for the dashboard 159
+    -- column 160: computed from the raw events
+    t.metric_160, -- kept for the dashboard 160
+    -- column 161: computed from the raw events
+    t.metric_161, -- kept for the dashboard 161
+    -- column 162: computed from the raw events
+    t.metric_162, -- kept for the dashboard 162
+    -- column 163: computed from the raw events
+    t.metric_163, -- kept for the dashboard 163
+    -- column 164: computed from the raw events
+    t.metric_164, -- kept for the dashboard 164
+    -- column 165: computed from the raw events
+    t.metric_165, -- kept for the dashboard 165
+    -- column 166: computed from the raw events
+    t.metric_166, -- kept for the dashboard 166
+    -- column 167: computed from the raw events
+    t.metric_167, -- kept for the dashboard 167
+    -- column 168: computed from the raw events
+    t.metric_168, -- kept for the dashboard 168
+    -- column 169: computed from the raw events
+    t.metric_169, -- kept for the dashboard 169
+    -- column 170: computed from the raw events
+    t.metric_170, -- kept for the dashboard 170
+    -- column 171: computed from the raw events
+    t.metric_171, -- kept for the dashboard 171
+    -- column 172: computed from the raw events
+    t.metric_172, -- kept for the dashboard 172
+    -- column 173: computed from the raw events
+    t.metric_173, -- kept for the dashboard 173
+    -- column 174: computed from the raw events
+    t.metric_174, -- kept for the dashboard 174
+    -- column 175: computed from the raw events
+    t.metric_175, -- kept for the dashboard 175
+    -- column 176: computed from the raw events
+    t.metric_176, -- kept for the dashboard 176
+    -- column 177: computed from the raw events
+    t.metric_177, -- kept for the dashboard 177
+    -- column 178: computed from the raw events
+    t.metric_178, -- kept for the dashboard 178
+    -- column 179: computed from the raw events
+    t.metric_179, -- kept for the dashboard 179
+    -- column 180: computed from the raw events
+    t.metric_180, -- kept for the dashboard 180
+    -- column 181: computed from the raw events
+    t.metric_181, -- kept for the dashboard 181
+    -- column 182: computed from the raw events
+    t.metric_182, -- kept for the dashboard 182
+    -- column 183: computed from the raw events
+    t.metric_183, -- kept for the dashboard 183
+    -- column 184: computed from the raw events
+    t.metric_184, -- kept for the dashboard 184
+    -- column 185: computed from the raw events
+    t.metric_185, -- kept for the dashboard 185
+    -- column 186: computed from the raw events
+    t.metric_186, -- kept for the dashboard 186
+    -- column 187: computed from the raw events
+    t.metric_187, -- kept for the dashboard 187
+    -- column 188: computed from the raw events
+    t.metric_188, -- kept for the dashboard 188
+    -- column 189: computed from the raw events
+    t.metric_189, -- kept for the dashboard 189
+    -- column 190: computed from the raw events
+    t.metric_190, -- kept for the dashboard 190
+    -- column 191: computed from the raw events
+    t.metric_191, -- kept for the dashboard 191
+    -- column 192: computed from the raw events
+    t.metric_192, -- kept for the dashboard 192
+    -- column 193: computed from the raw events
+    t.metric_193, -- kept for the dashboard 193
+    -- column 194: computed from the raw events
+    t.metric_194, -- kept for the dashboard 194
+    -- column 195: computed from the raw events
+    t.metric_195, -- kept for the dashboard 195
+    -- column 196: computed from the raw events
+    t.metric_196, -- kept for the dashboard 196
+    -- column 197: computed from the raw events
+    t.metric_197, -- kept for the dashboard 197
+    -- column 198: computed from the raw events
+    t.metric_198, -- kept for the dashboard 198
+    -- column 199: computed from the raw events
+    t.metric_199, -- kept for the dashboard 199
+    -- column 200: computed from the raw events
+    t.metric_200, -- kept for the dashboard 200
+    -- column 201: computed from the raw events
+    t.metric_201, -- kept for the dashboard 201
+    -- column 202: computed from the raw events
+    t.metric_202, -- kept for the dashboard 202
+    -- column 203: computed from the raw events
+    t.metric_203, -- kept for the dashboard 203
+    -- column 204: computed from the raw events
+    t.metric_204, -- kept for the dashboard 204
+    -- column 205: computed from the raw events
+    t.metric_205, -- kept for the dashboard 205
+    -- column 206: computed from the raw events
+    t.metric_206, -- kept for the dashboard 206
+    -- column 207: computed from the raw events
+    t.metric_207, -- kept for the dashboard 207
+    -- column 208: computed from the raw events
+    t.metric_208, -- kept for the dashboard 208
+    -- column 209: computed from the raw events
+    t.metric_209, -- kept for the dashboard 209
+    -- column 210: computed from the raw events
+    t.metric_210, -- kept for the dashboard 210
+    -- column 211: computed from the raw events
+    t.metric_211, -- kept for the dashboard 211
+    -- column 212: computed from the raw events
+    t.metric_212, -- kept for the dashboard 212
+    -- column 213: computed from the raw events
+    t.metric_213, -- kept for the dashboard 213
+    -- column 214: computed from the raw events
+    t.metric_214, -- kept for the dashboard 214
+    -- column 215: computed from the raw events
+    t.metric_215, -- kept for the dashboard 215
+    -- column 216: computed from the raw events
+    t.metric_216, -- kept for the dashboard 216
+    -- column 217: computed from the raw events
+    t.metric_217, -- kept for the dashboard 217
+    -- column 218: computed from the raw events
+    t.metric_218, -- kept for the dashboard 218
+    -- column 219: computed from the raw events
+    t.metric_219, -- kept for the dashboard 219
+    -- column 220: computed from the raw events
+    t.metric_220, -- kept for the dashboard 220
+    -- column 221: computed from the raw events
+    t.metric_221, -- kept for the dashboard 221
+    -- column 222: computed from the raw events
+    t.metric_222, -- kept for the dashboard 222
+    -- column 223: computed from the raw events
+    t.metric_223, -- kept for the dashboard 223
+    -- column 224: computed from the raw events
+    t.metric_224, -- kept for the dashboard 224
+    -- column 225: computed from the raw events
+    t.metric_225, -- kept for the dashboard 225
+    -- column 226: computed from the raw events
+    t.metric_226, -- kept for the dashboard 226
+    -- column 227: computed from the raw events
+    t.metric_227, -- kept for the dashboard 227
+    -- column 228: computed from the raw events
+    t.metric_228, -- kept for the dashboard 228
+    -- column 229: computed from the raw events
+    t.metric_229, -- kept for the dashboard 229
+    -- column 230: computed from the raw events
+    t.metric_230, -- kept for the dashboard 230
+    -- column 231: computed from the raw events
+    t.metric_231, -- kept for the dashboard 231
+    -- column 232: computed from the raw events
+    t.metric_232, -- kept for the dashboard 232
+    -- column 233: computed from the raw events
+    t.metric_233, -- kept for the dashboard 233
+    -- column 234: computed from the raw events
+    t.metric_234, -- kept for the dashboard 234
+    -- column 235: computed from the raw events
+    t.metric_235, -- kept for the dashboard 235
+    -- column 236: computed from the raw events
+    t.metric_236, -- kept for the dashboard 236
+    -- column 237: computed from the raw events
+    t.metric_237, -- kept for the dashboard 237
+    -- column 238: computed from the raw events
+    t.metric_238, -- kept for the dashboard 238
+    -- column 239: computed from the raw events
+    t.metric_239, -- kept for the dashboard 239
+    -- column 240: computed from the raw events
+    t.metric_240, -- kept for the dashboard 240
+    -- column 241: computed from the raw events
+    t.metric_241, -- kept for the dashboard 241
+    -- column 242: computed from the raw events
+    t.metric_242, -- kept for the dashboard 242
+    -- column 243: computed from the raw events
+    t.metric_243, -- kept for the dashboard 243
+    -- column 244: computed from the raw events
+    t.metric_244, -- kept for the dashboard 244
+    -- column 245: computed from the raw events
+    t.metric_245, -- kept for the dashboard 245
+    -- column 246: computed from the raw events
+    t.metric_246, -- kept for the dashboard 246
+    -- column 247: computed from the raw events
+    t.metric_247, -- kept for the dashboard 247
+    -- column 248: computed from the raw events
+    t.metric_248, -- kept for the dashboard 248
+    -- column 249: computed from the raw events
+    t.metric_249, -- kept for the dashboard 249
+    -- column 250: computed from the raw events
+    t.metric_250, -- kept for the dashboard 250
+    -- column 251: computed from the raw events
+    t.metric_251, -- kept for the dashboard 251
+    -- column 252: computed from the raw events
+    t.metric_252, -- kept for the dashboard 252
+    -- column 253: computed from the raw events
+    t.metric_253, -- kept for the dashboard 253
+    -- column 254: computed from the raw events
+    t.metric_254, -- kept for the dashboard 254
+    -- column 255: computed from the raw events
+    t.metric_255, -- kept for the dashboard 255
+    -- column 256: computed from the raw events
+    t.metric_256, -- kept for the dashboard 256
+    -- column 257: computed from the raw events
+    t.metric_257, -- kept for the dashboard 257
+    -- column 258: computed from the raw events
+    t.metric_258, -- kept for the dashboard 258
+    -- column 259: computed from the raw events
+    t.metric_259, -- kept for the dashboard 259
+    -- column 260: computed from the raw events
+    t.metric_260, -- kept for the dashboard 260
+    -- column 261: computed from the raw events
+    t.metric_261, -- kept for the dashboard 261
+    -- column 262: computed from the raw events
+    t.metric_262, -- kept for the dashboard 262
+    -- column 263: computed from the raw events
+    t.metric_263, -- kept for the dashboard 263
+    -- column 264: computed from the raw events
+    t.metric_264, -- kept for the dashboard 264
+    -- column 265: computed from the raw events
+    t.metric_265, -- kept for the dashboard 265
+    -- column 266: computed from the raw events
+    t.metric_266, -- kept for the dashboard 266
+    -- column 267: computed from the raw events
+    t.metric_267, -- kept for the dashboard 267
+    -- column 268: computed from the raw events
+    t.metric_268, -- kept for the dashboard 268
+    -- column 269: computed from the raw events
+    t.metric_269, -- kept for the dashboard 269
+    -- column 270: computed from the raw events
+    t.metric_270, -- kept for the dashboard 270
+    -- column 271: computed from the raw events
+    t.metric_271, -- kept for the dashboard 271
+    -- column 272: computed from the raw events
+    t.metric_272, -- kept for the dashboard 272
+    -- column 273: computed from the raw events
+    t.metric_273, -- kept for the dashboard 273
+    -- column 274: computed from the raw events
+    t.metric_274, -- kept for the dashboard 274
+    -- column 275: computed from the raw events
+    t.metric_275, -- kept for the dashboard 275
+    -- column 276: computed from the raw events
+    t.metric_276, -- kept for the dashboard 276
+    -- column 277: computed from the raw events
+    t.metric_277, -- kept for the dashboard 277
+    -- column 278: computed from the raw events
+    t.metric_278, -- kept for the dashboard 278
+    -- column 279: computed from the raw events
+    t.metric_279, -- kept for the dashboard 279
+    -- column 280: computed from the raw events
+    t.metric_280, -- kept for the dashboard 280
+    -- column 281: computed from the raw events
+    t.metric_281, -- kept for the dashboard 281
+    -- column 282: computed from the raw events
+    t.metric_282, -- kept for the dashboard 282
+    -- column 283: computed from the raw events
+    t.metric_283, -- kept for the dashboard 283
+    -- column 284: computed from the raw events
+    t.metric_284, -- kept for the dashboard 284
+    -- column 285: computed from the raw events
+    t.metric_285, -- kept for the dashboard 285
+    -- column 286: computed from the raw events
+    t.metric_286, -- kept for the dashboard 286
+    -- column 287: computed from the raw events
+    t.metric_287, -- kept for the dashboard 287
+    -- column 288: computed from the raw events
+    t.metric_288, -- kept for the dashboard 288
+    -- column 289: computed from the raw events
+    t.metric_289, -- kept for the dashboard 289
+    -- column 290: computed from the raw events
+    t.metric_290, -- kept for the dashboard 290
+    -- column 291: computed from the raw events
+    t.metric_291, -- kept for the dashboard 291
+    -- column 292: computed from the raw events
+    t.metric_292, -- kept for the dashboard 292
+    -- column 293: computed from the raw events
+    t.metric_293, -- kept for the dashboard 293
+    -- column 294: computed from the raw events
+    t.metric_294, -- kept for the dashboard 294
+    -- column 295: computed from the raw events
+    t.metric_295, -- kept for the dashboard 295
+    -- column 296: computed from the raw events
+    t.metric_296, -- kept for the dashboard 296
+    -- column 297: computed from the raw events
+    t.metric_297, -- kept for the dashboard 297
+    -- column 298: computed from the raw events
+    t.metric_298, -- kept for the dashboard 298
+    -- column 299: computed from the raw events
+    t.metric_299, -- kept for the dashboard 299
+    -- column 300: computed from the raw events
+    t.metric_300, -- kept for the dashboard 300
+    -- column 301: computed from the raw events
+    t.metric_301, -- kept for the dashboard 301
+    -- column 302: computed from the raw events
+    t.metric_302, -- kept for the dashboard 302
+    -- column 303: computed from the raw events
+    t.metric_303, -- kept for the dashboard 303
+    -- column 304: computed from the raw events
+    t.metric_304, -- kept for the dashboard 304
+    -- column 305: computed from the raw events
+    t.metric_305, -- kept for the dashboard 305
+    -- column 306: computed from the raw events
+    t.metric_306, -- kept for the dashboard 306
+    -- column 307: computed from the raw events
+    t.metric_307, -- kept for the dashboard 307
+    -- column 308: computed from the raw events
+    t.metric_308, -- kept for the dashboard 308
+    -- column 309: computed from the raw events
+    t.metric_309, -- kept for the dashboard 309
+    -- column 310: computed from the raw events
+    t.metric_310, -- kept for the dashboard 310
+    -- column 311: computed from the raw events
+    t.metric_311, -- kept for the dashboard 311
+    -- column 312: computed from the raw events
+    t.metric_312, -- kept for the dashboard 312
+    -- column 313: computed from the raw events
+    t.metric_313, -- kept for the dashboard 313
+    -- column 314: computed from the raw events
+    t.metric_314, -- kept for the dashboard 314
+    -- column 315: computed from the raw events
+    t.metric_315, -- kept for the dashboard 315
+    -- column 316: computed from the raw events
+    t.metric_316, -- kept for the dashboard 316
+    -- column 317: computed from the raw events
+    t.metric_317, -- kept for the dashboard 317
+    -- column 318: computed from the raw events
+    t.metric_318, -- kept for the dashboard 318
+    -- column 319: computed from the raw events
+    t.metric_319, -- kept for the dashboard 319
+    -- column 320: computed from the raw events
+    t.metric_320, -- kept for the dashboard 320
+    -- column 321: computed from the raw events
+    t.metric_321, -- kept for the dashboard 321
+    -- column 322: computed from the raw events
+    t.metric_322, -- kept for the dashboard 322
+    -- column 323: computed from the raw events
+    t.metric_323, -- kept for the dashboard 323
+    -- column 324: computed from the raw events
+    t.metric_324, -- kept for the dashboard 324
+    -- column 325: computed from the raw events
+    t.metric_325, -- kept for the dashboard 325
+    -- column 326: computed from the raw events
+    t.metric_326, -- kept for the dashboard 326
+    -- column 327: computed from the raw events
+    t.metric_327, -- kept for the dashboard 327
+    -- column 328: computed from the raw events
+    t.metric_328, -- kept for the dashboard 328
+    -- column 329: computed from the raw events
+    t.metric_329, -- kept for the dashboard 329
+    -- column 330: computed from the raw events
+    t.metric_330, -- kept for the dashboard 330
+    -- column 331: computed from the raw events
+    t.metric_331, -- kept for the dashboard 331
+    -- column 332: computed from the raw events
+    t.metric_332, -- kept for the dashboard 332
+    -- column 333: computed from the raw events
+    t.metric_333, -- kept for the dashboard 333
+    -- column 334: computed from the raw events
+    t.metric_334, -- kept for the dashboard 334
+    -- column 335: computed from the raw events
+    t.metric_335, -- kept for the dashboard 335
+    -- column 336: computed from the raw events
+    t.metric_336, -- kept for the dashboard 336
+    -- column 337: computed from the raw events
+    t.metric_337, -- kept for the dashboard 337
+    -- column 338: computed from the raw events
+    t.metric_338, -- kept for the dashboard 338
+    -- column 339: computed from the raw events
+    t.metric_339, -- kept for the dashboard 339
+    -- column 340: computed from the raw events
+    t.metric_340, -- kept for the dashboard 340
+    -- column 341: computed from the raw events
+    t.metric_341, -- kept for the dashboard 341
+    -- column 342: computed from the raw events
+    t.metric_342, -- kept for the dashboard 342
+    -- column 343: computed from the raw events
+    t.metric_343, -- kept for the dashboard 343
+    -- column 344: computed from the raw events
+    t.metric_344, -- kept for the dashboard 344
+    -- column 345: computed from the raw events
+    t.metric_345, -- kept for the dashboard 345
+    -- column 346: computed from the raw events
+    t.metric_346, -- kept for the dashboard 346
+    -- column 347: computed from the raw events
+    t.metric_347, -- kept for the dashboard 347
+    -- column 348: computed from the raw events
+    t.metric_348, -- kept for the dashboard 348
+    -- column 349: computed from the raw events
+    t.metric_349, -- kept for the dashboard 349
+    -- column 350: computed from the raw events
+    t.metric_350, -- kept for the dashboard 350
+    -- column 351: computed from the raw events
+    t.metric_351, -- kept for the dashboard 351
+    -- column 352: computed from the raw events
+    t.metric_352, -- kept for the dashboard 352
+    -- column 353: computed from the raw events
+    t.metric_353, -- kept for the dashboard 353
+    -- column 354: computed from the raw events
+    t.metric_354, -- kept for the dashboard 354
+    -- column 355: computed from the raw events
+    t.metric_355, -- kept for the dashboard 355
+    -- column 356: computed from the raw events
+    t.metric_356, -- kept for the dashboard 356
+    -- column 357: computed from the raw events
+    t.metric_357, -- kept for the dashboard 357
+    -- column 358: computed from the raw events
+    t.metric_358, -- kept for the dashboard 358
+    -- column 359: computed from the raw events
+    t.metric_359, -- kept for the dashboard 359
+    -- column 360: computed from the raw events
+    t.metric_360, -- kept for the dashboard 360
+    -- column 361: computed from the raw events
+    t.metric_361, -- kept for the dashboard 361
+    -- column 362: computed from the raw events
+    t.metric_362, -- kept for the dashboard 362
+    -- column 363: computed from the raw events
+    t.metric_363, -- kept for the dashboard 363
+    -- column 364: computed from the raw events
+    t.metric_364, -- kept for the dashboard 364
+    -- column 365: computed from the raw events
+    t.metric_365, -- kept for the dashboard 365
+    -- column 366: computed from the raw events
+    t.metric_366, -- kept for the dashboard 366
+    -- column 367: computed from the raw events
+    t.metric_367, -- kept for the dashboard 367
+    -- column 368: computed from the raw events
+    t.metric_368, -- kept for the dashboard 368
+    -- column 369: computed from the raw events
+    t.metric_369, -- kept for the dashboard 369
+    -- column 370: computed from the raw events
+    t.metric_370, -- kept for the dashboard 370
+    -- column 371: computed from the raw events
+    t.metric_371, -- kept for the dashboard 371
+    -- column 372: computed from the raw events
+    t.metric_372, -- kept for the dashboard 372
+    -- column 373: computed from the raw events
+    t.metric_373, -- kept for the dashboard 373
+    -- column 374: computed from the raw events
+    t.metric_374, -- kept for the dashboard 374
+    -- column 375: computed from the raw events
+    t.metric_375, -- kept for the dashboard 375
+    -- column 376: computed from the raw events
+    t.metric_376, -- kept for the dashboard 376
+    -- column 377: computed from the raw events
+    t.metric_377, -- kept for the dashboard 377
+    -- column 378: computed from the raw events
+    t.metric_378, -- kept for the dashboard 378
+    -- column 379: computed from the raw events
+    t.metric_379, -- kept for the dashboard 379
+    -- column 380: computed from the raw events
+    t.metric_380, -- kept for the dashboard 380
+    -- column 381: computed from the raw events
+    t.metric_381, -- kept for the dashboard 381
+    -- column 382: computed from the raw events
+    t.metric_382, -- kept for the dashboard 382
+    -- column 383: computed from the raw events
+    t.metric_383, -- kept for the dashboard 383
+    -- column 384: computed from the raw events
+    t.metric_384, -- kept for the dashboard 384
+    -- column 385: computed from the raw events
+    t.metric_385, -- kept for the dashboard 385
+    -- column 386: computed from the raw events
+    t.metric_386, -- kept for the dashboard 386
+    -- column 387: computed from the raw events
+    t.metric_387, -- kept for the dashboard 387
+    -- column 388: computed from the raw events
+    t.metric_388, -- kept for the dashboard 388
+    -- column 389: computed from the raw events
+    t.metric_389, -- kept for the dashboard 389
+    -- column 390: computed from the raw events
+    t.metric_390, -- kept for the dashboard 390
+    -- column 391: computed from the raw events
+    t.metric_391, -- kept for the dashboard 391
+    -- column 392: computed from the raw events
+    t.metric_392, -- kept for the dashboard 392
+    -- column 393: computed from the raw events
+    t.metric_393, -- kept for the dashboard 393
+    -- column 394: computed from the raw events
+    t.metric_394, -- kept for the dashboard 394
+    -- column 395: computed from the raw events
+    t.metric_395, -- kept for the dashboard 395
+    -- column 396: computed from the raw events
+    t.metric_396, -- kept for the dashboard 396
+    -- column 397: computed from the raw events
+    t.metric_397, -- kept for the dashboard 397
+    -- column 398: computed from the raw events
+    t.metric_398, -- kept for the dashboard 398
+    -- column 399: computed from the raw events
+    t.metric_399, -- kept for the dashboard 399
+    -- column 400: computed from the raw events
+    t.metric_400, -- kept for the dashboard 400
+    -- column 401: computed from the raw events
+    t.metric_401, -- kept for the dashboard 401
+    -- column 402: computed from the raw events
+    t.metric_402, -- kept for the dashboard 402
+    -- column 403: computed from the raw events
+    t.metric_403, -- kept for the dashboard 403
+    -- column 404: computed from the raw events
+    t.metric_404, -- kept for the dashboard 404
+    -- column 405: computed from the raw events
+    t.metric_405, -- kept for the dashboard 405
+    -- column 406: computed from the raw events
+    t.metric_406, -- kept for the dashboard 406
+    -- column 407: computed from the raw events
+    t.metric_407, -- kept for the dashboard 407
+    -- column 408: computed from the raw events
+    t.metric_408, -- kept for the dashboard 408
+    -- column 409: computed from the raw events
+    t.metric_409, -- kept for the dashboard 409
+    -- column 410: computed from the raw events
+    t.metric_410, -- kept for the dashboard 410
+    -- column 411: computed from the raw events
+    t.metric_411, -- kept for the dashboard 411
+    -- column 412: computed from the raw events
+    t.metric_412, -- kept for the dashboard 412
+    -- column 413: computed from the raw events
+    t.metric_413, -- kept for the dashboard 413
+    -- column 414: computed from the raw events
+    t.metric_414, -- kept for the dashboard 414
+    -- column 415: computed from the raw events
+    t.metric_415, -- kept for the dashboard 415
+    -- column 416: computed from the raw events
+    t.metric_416, -- kept for the dashboard 416
+    -- column 417: computed from the raw events
+    t.metric_417, -- kept for the dashboard 417
+    -- column 418: computed from the raw events
+    t.metric_418, -- kept for the dashboard 418
+    -- column 419: computed from the raw events
+    t.metric_419, -- kept for the dashboard 419
+    -- column 420: computed from the raw events
+    t.metric_420, -- kept for the dashboard 420
+    -- column 421: computed from the raw events
+    t.metric_421, -- kept for the dashboard 421
+    -- column 422: computed from the raw events
+    t.metric_422, -- kept for the dashboard 422
+    -- column 423: computed from the raw events
+    t.metric_423, -- kept for the dashboard 423
+    -- column 424: computed from the raw events
+    t.metric_424, -- kept for the dashboard 424
+    -- column 425: computed from the raw events
+    t.metric_425, -- kept for the dashboard 425
+    -- column 426: computed from the raw events
+    t.metric_426, -- kept for the dashboard 426
+    -- column 427: computed from the raw events
+    t.metric_427, -- kept for the dashboard 427
+    -- column 428: computed from the raw events
+    t.metric_428, -- kept for the dashboard 428
+    -- column 429: computed from the raw events
+    t.metric_429, -- kept for the dashboard 429
+    -- column 430: computed from the raw events
+    t.metric_430, -- kept for the dashboard 430
+    -- column 431: computed from the raw events
+    t.metric_431, -- kept for the dashboard 431
+    -- column 432: computed from the raw events
+    t.metric_432, -- kept for the dashboard 432
+    -- column 433: computed from the raw events
+    t.metric_433, -- kept for the dashboard 433
+    -- column 434: computed from the raw events
+    t.metric_434, -- kept for the dashboard 434
+    -- column 435: computed from the raw events
+    t.metric_435, -- kept for the dashboard 435
+    -- column 436: computed from the raw events
+    t.metric_436, -- kept for the dashboard 436
+    -- column 437: computed from the raw events
+    t.metric_437, -- kept for the dashboard 437
+    -- column 438: computed from the raw events
+    t.metric_438, -- kept for the dashboard 438
+    -- column 439: computed from the raw events
+    t.metric_439, -- kept for the dashboard 439
+    -- column 440: computed from the raw events
+    t.metric_440, -- kept for the dashboard 440
+    -- column 441: computed from the raw events
+    t.metric_441, -- kept for the dashboard 441
+    -- column 442: computed from the raw events
+    t.metric_442, -- kept for the dashboard 442
+    -- column 443: computed from the raw events
+    t.metric_443, -- kept for the dashboard 443
+    -- column 444: computed from the raw events
+    t.metric_444, -- kept for the dashboard 444
+    -- column 445: computed from the raw events
+    t.metric_445, -- kept for the dashboard 445
+    -- column 446: computed from the raw events
+    t.metric_446, -- kept for the dashboard 446
+    -- column 447: computed from the raw events
+    t.metric_447, -- kept for the dashboard 447
+    -- column 448: computed from the raw events
+    t.metric_448, -- kept for the dashboard 448
+    -- column 449: computed from the raw events
+    t.metric_449, -- kept for the dashboard 449
+    -- column 450: computed from the raw events
+    t.metric_450, -- kept for the dashboard 450
+    -- column 451: computed from the raw events
+    t.metric_451, -- kept for the dashboard 451
+    -- column 452: computed from the raw events
+    t.metric_452, -- kept for the dashboard 452
+    -- column 453: computed from the raw events
+    t.metric_453, -- kept for the dashboard 453
+    -- column 454: computed from the raw events
+    t.metric_454, -- kept for the dashboard 454
+    -- column 455: computed from the raw events
+    t.metric_455, -- kept for the dashboard 455
+    -- column 456: computed from the raw events
+    t.metric_456, -- kept for the dashboard 456
+    -- column 457: computed from the raw events
+    t.metric_457, -- kept for the dashboard 457
+    -- column 458: computed from the raw events
+    t.metric_458, -- kept for the dashboard 458
+    -- column 459: computed from the raw events
+    t.metric_459, -- kept for the dashboard 459
+    -- column 460: computed from the raw events
+    t.metric_460, -- kept for the dashboard 460
+    -- column 461: computed from the raw events
+    t.metric_461, -- kept for the dashboard 461
+    -- column 462: computed from the raw events
+    t.metric_462, -- kept for the dashboard 462
+    -- column 463: computed from the raw events
+    t.metric_463, -- kept for the dashboard 463
+    -- column 464: computed from the raw events
+    t.metric_464, -- kept for the dashboard 464
+    -- column 465: computed from the raw events
+    t.metric_465, -- kept for the dashboard 465
+    -- column 466: computed from the raw events
+    t.metric_466, -- kept for the dashboard 466
+    -- column 467: computed from the raw events
+    t.metric_467, -- kept for the dashboard 467
+    -- column 468: computed from the raw events
+    t.metric_468, -- kept for the dashboard 468
+    -- column 469: computed from the raw events
+    t.metric_469, -- kept for the dashboard 469
+    -- column 470: computed from the raw events
+    t.metric_470, -- kept for the dashboard 470
+    -- column 471: computed from the raw events
+    t.metric_471, -- kept for the dashboard 471
+    -- column 472: computed from the raw events
+    t.metric_472, -- kept for the dashboard 472
+    -- column 473: computed from the raw events
+    t.metric_473, -- kept for the dashboard 473
+    -- column 474: computed from the raw events
+    t.metric_474, -- kept for the dashboard 474
+    -- column 475: computed from the raw events
+    t.metric_475, -- kept for the dashboard 475
+    -- column 476: computed from the raw events
+    t.metric_476, -- kept for the dashboard 476
+    -- column 477: computed from the raw events
+    t.metric_477, -- kept for the dashboard 477
+    -- column 478: computed from the raw events
+    t.metric_478, -- kept for the dashboard 478
+    -- column 479: computed from the raw events
+    t.metric_479, -- kept for the dashboard 479
+    -- column 480: computed from the raw events
+    t.metric_480, -- kept for the dashboard 480
+    -- column 481: computed from the raw events
+    t.metric_481, -- kept for the dashboard 481
+    -- column 482: computed from the raw events
+    t.metric_482, -- kept for the dashboard 482
+    -- column 483: computed from the raw events
+    t.metric_483, -- kept for the dashboard 483
+    -- column 484: computed from the raw events
+    t.metric_484, -- kept for the dashboard 484
+    -- column 485: computed from the raw events
+    t.metric_485, -- kept for the dashboard 485
+    -- column 486: computed from the raw events
+    t.metric_486, -- kept for the dashboard 486
+    -- column 487: computed from the raw events
+    t.metric_487, -- kept for the dashboard 487
+    -- column 488: computed from the raw events
+    t.metric_488, -- kept for the dashboard 488
+    -- column 489: computed from the raw events
+    t.metric_489, -- kept for the dashboard 489
+    -- column 490: computed from the raw events
+    t.metric_490, -- kept for the dashboard 490
+    -- column 491: computed from the raw events
+    t.metric_491, -- kept for the dashboard 491
+    -- column 492: computed from the raw events
+    t.metric_492, -- kept for the dashboard 492
+    -- column 493: computed from the raw events
+    t.metric_493, -- kept for the dashboard 493
+    -- column 494: computed from the raw events
+    t.metric_494, -- kept for the dashboard 494
+    -- column 495: computed from the raw events
+    t.metric_495, -- kept for the dashboard 495
+    -- column 496: computed from the raw events
+    t.metric_496, -- kept for the dashboard 496
+    -- column 497: computed from the raw events
+    t.metric_497, -- kept for the dashboard 497
+    -- column 498: computed from the raw events
+    t.metric_498, -- kept for the dashboard 498
+    -- column 499: computed from the raw events
+    t.metric_499, -- kept for the dashboard 499
+    -- column 500: computed from the raw events
+    t.metric_500, -- kept for the dashboard 500
+    -- column 501: computed from the raw events
+    t.metric_501, -- kept for the dashboard 501
+    -- column 502: computed from the raw events
+    t.metric_502, -- kept for the dashboard 502
+    -- column 503: computed from the raw events
+    t.metric_503, -- kept for the dashboard 503
+    -- column 504: computed from the raw events
+    t.metric_504, -- kept for the dashboard 504
+    -- column 505: computed from the raw events
+    t.metric_505, -- kept for the dashboard 505
+    -- column 506: computed from the raw events
+    t.metric_506, -- kept for the dashboard 506
+    -- column 507: computed from the raw events
+    t.metric_507, -- kept for the dashboard 507
+    -- column 508: computed from the raw events
+    t.metric_508, -- kept for the dashboard 508
+    -- column 509: computed from the raw events
+    t.metric_509, -- kept for the dashboard 509
+    -- column 510: computed from the raw events
+    t.metric_510, -- kept for the dashboard 510
+    -- column 511: computed from the raw events
+    t.metric_511, -- kept for the dashboard 511
+    -- column 512: computed from the raw events
+    t.metric_512, -- kept for the dashboard 512
+    -- column 513: computed from the raw events
+    t.metric_513, -- kept for the dashboard 513
+    -- column 514: computed from the raw events
+    t.metric_514, -- kept for the dashboard 514
+    -- column 515: computed from the raw events
+    t.metric_515, -- kept for the dashboard 515
+    -- column 516: computed from the raw events
+    t.metric_516, -- kept for the dashboard 516
+    -- column 517: computed from the raw events
+    t.metric_517, -- kept for the dashboard 517
+    -- column 518: computed from the raw events
+    t.metric_518, -- kept for the dashboard 518
+    -- column 519: computed from the raw events
+    t.metric_519, -- kept for the dashboard 519
+    -- column 520: computed from the raw events
+    t.metric_520, -- kept for the dashboard 520
+    -- column 521: computed from the raw events
+    t.metric_521, -- kept for the dashboard 521
+    -- column 522: computed from the raw events
+    t.metric_522, -- kept for the dashboard 522
+    -- column 523: computed from the raw events
+    t.metric_523, -- kept for the dashboard 523
+    -- column 524: computed from the raw events
+    t.metric_524, -- kept for the dashboard 524
+    -- column 525: computed from the raw events
+    t.metric_525, -- kept for the dashboard 525
+    -- column 526: computed from the raw events
+    t.metric_526, -- kept for the dashboard 526
+    -- column 527: computed from the raw events
+    t.metric_527, -- kept for the dashboard 527
+    -- column 528: computed from the raw events
+    t.metric_528, -- kept for the dashboard 528
+    -- column 529: computed from the raw events
+    t.metric_529, -- kept for the dashboard 529
+    -- column 530: computed from the raw events
+    t.metric_530, -- kept for the dashboard 530
+    -- column 531: computed from the raw events
+    t.metric_531, -- kept for the dashboard 531
+    -- column 532: computed from the raw events
+    t.metric_532, -- kept for the dashboard 532
+    -- column 533: computed from the raw events
+    t.metric_533, -- kept for the dashboard 533
+    -- column 534: computed from the raw events
+    t.metric_534, -- kept for the dashboard 534
+    -- column 535: computed from the raw events
+    t.metric_535, -- kept for the dashboard 535
+    -- column 536: computed from the raw events
+    t.metric_536, -- kept for the dashboard 536
+    -- column 537: computed from the raw events
+    t.metric_537, -- kept for the dashboard 537
+    -- column 538: computed from the raw events
+    t.metric_538, -- kept for the dashboard 538
+    -- column 539: computed from the raw events
+    t.metric_539, -- kept for the dashboard 539
+    -- column 540: computed from the raw events
+    t.metric_540, -- kept for the dashboard 540
+    -- column 541: computed from the raw events
+    t.metric_541, -- kept for the dashboard 541
+    -- column 542: computed from the raw events
+    t.metric_542, -- kept for the dashboard 542
+    -- column 543: computed from the raw events
+    t.metric_543, -- kept for the dashboard 543
+    -- column 544: computed from the raw events
+    t.metric_544, -- kept for the dashboard 544
+    -- column 545: computed from the raw events
+    t.metric_545, -- kept for the dashboard 545
+    -- column 546: computed from the raw events
+    t.metric_546, -- kept for the dashboard 546
+    -- column 547: computed from the raw events
+    t.metric_547, -- kept for the dashboard 547
+    -- column 548: computed from the raw events
+    t.metric_548, -- kept for the dashboard 548
+    -- column 549: computed from the raw events
+    t.metric_549, -- kept for the dashboard 549
+    -- column 550: computed from the raw events
+    t.metric_550, -- kept for the dashboard 550
+    -- column 551: computed from the raw events
+    t.metric_551, -- kept for the dashboard 551
+    -- column 552: computed from the raw events
+    t.metric_552, -- kept for the dashboard 552
+    -- column 553: computed from the raw events
+    t.metric_553, -- kept for the dashboard 553
+    -- column 554: computed from the raw events
+    t.metric_554, -- kept for the dashboard 554
+    -- column 555: computed from the raw events
+    t.metric_555, -- kept for the dashboard 555
+    -- column 556: computed from the raw events
+    t.metric_556, -- kept for the dashboard 556
+    -- column 557: computed from the raw events
+    t.metric_557, -- kept for the dashboard 557
+    -- column 558: computed from the raw events
+    t.metric_558, -- kept for the dashboard 558
+    -- column 559: computed from the raw events
+    t.metric_559, -- kept for the dashboard 559
+    -- column 560: computed from the raw events
+    t.metric_560, -- kept for the dashboard 560
+    -- column 561: computed from the raw events
+    t.metric_561, -- kept for the dashboard 561
+    -- column 562: computed from the raw events
+    t.metric_562, -- kept for the dashboard 562
+    -- column 563: computed from the raw events
+    t.metric_563, -- kept for the dashboard 563
+    -- column 564: computed from the raw events
+    t.metric_564, -- kept for the dashboard 564
+    -- column 565: computed from the raw events
+    t.metric_565, -- kept for the dashboard 565
+    -- column 566: computed from the raw events
+    t.metric_566, -- kept for the dashboard 566
+    -- column 567: computed from the raw events
+    t.metric_567, -- kept for the dashboard 567
+    -- column 568: computed from the raw events
+    t.metric_568, -- kept for the dashboard 568
+    -- column 569: computed from the raw events
+    t.metric_569, -- kept for the dashboard 569
+    -- column 570: computed from the raw events
+    t.metric_570, -- kept for the dashboard 570
+    -- column 571: computed from the raw events
+    t.metric_571, -- kept for the dashboard 571
+    -- column 572: computed from the raw events
+    t.metric_572, -- kept for the dashboard 572
+    -- column 573: computed from the raw events
+    t.metric_573, -- kept for the dashboard 573
+    -- column 574: computed from the raw events
+    t.metric_574, -- kept for the dashboard 574
+    -- column 575: computed from the raw events
+    t.metric_575, -- kept for the dashboard 575
+    -- column 576: computed from the raw events
+    t.metric_576, -- kept for the dashboard 576
+    -- column 577: computed from the raw events
+    t.metric_577, -- kept for the dashboard 577
+    -- column 578: computed from the raw events
+    t.metric_578, -- kept for the dashboard 578
+    -- column 579: computed from the raw events
+    t.metric_579, -- kept for the dashboard 579
+    -- column 580: computed from the raw events
+    t.metric_580, -- kept for the dashboard 580
+    -- column 581: computed from the raw events
+    t.metric_581, -- kept for the dashboard 581
+    -- column 582: computed from the raw events
+    t.metric_582, -- kept for the dashboard 582
+    -- column 583: computed from the raw events
+    t.metric_583, -- kept for the dashboard 583
+    -- column 584: computed from the raw events
+    t.metric_584, -- kept for the dashboard 584
+    -- column 585: computed from the raw events
+    t.metric_585, -- kept for the dashboard 585
+    -- column 586: computed from the raw events
+    t.metric_586, -- kept for the dashboard 586
+    -- column 587: computed from the raw events
+    t.metric_587, -- kept for the dashboard 587
+    -- column 588: computed from the raw events
+    t.metric_588, -- kept for the dashboard 588
+    -- column 589: computed from the raw events
+    t.metric_589, -- kept for the dashboard 589
+    -- column 590: computed from the raw events
+    t.metric_590, -- kept for the dashboard 590
+    -- column 591: computed from the raw events
+    t.metric_591, -- kept for the dashboard 591
+    -- column 592: computed from the raw events
+    t.metric_592, -- kept for the dashboard 592
+    -- column 593: computed from the raw events
+    t.metric_593, -- kept for the dashboard 593
+    -- column 594: computed from the raw events
+    t.metric_594, -- kept for the dashboard 594
+    -- column 595: computed from the raw events
+    t.metric_595, -- kept for the dashboard 595
+    -- column 596: computed from the raw events
+    t.metric_596, -- kept for the dashboard 596
+    -- column 597: computed from the raw events
+    t.metric_597, -- kept for the dashboard 597
+    -- column 598: computed from the raw events
+    t.metric_598, -- kept for the dashboard 598
+    -- column 599: computed from the raw events
+    t.metric_599, -- kept for the dashboard 599
+    t.id
+-- source table
+FROM warehouse.metrics t -- partitioned by dt
+  -- only the last day
+WHERE t.dt = '${hiveconf:dt}' -- set by the scheduler
+;
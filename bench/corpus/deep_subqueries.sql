@@ -0,0 +1,241 @@
+SELECT s120.id, sum(s120.amount) AS amount, max(s120.dt) AS dt FROM (
+SELECT s119.id, sum(s119.amount) AS amount, max(s119.dt) AS dt FROM (
+SELECT s118.id, sum(s118.amount) AS amount, max(s118.dt) AS dt FROM (
+SELECT s117.id, sum(s117.amount) AS amount, max(s117.dt) AS dt FROM (
+SELECT s116.id, sum(s116.amount) AS amount, max(s116.dt) AS dt FROM (
+SELECT s115.id, sum(s115.amount) AS amount, max(s115.dt) AS dt FROM (
+SELECT s114.id, sum(s114.amount) AS amount, max(s114.dt) AS dt FROM (
+SELECT s113.id, sum(s113.amount) AS amount, max(s113.dt) AS dt FROM (
+SELECT s112.id, sum(s112.amount) AS amount, max(s112.dt) AS dt FROM (
+SELECT s111.id, sum(s111.amount) AS amount, max(s111.dt) AS dt FROM (
+SELECT s110.id, sum(s110.amount) AS amount, max(s110.dt) AS dt FROM (
+SELECT s109.id, sum(s109.amount) AS amount, max(s109.dt) AS dt FROM (
+SELECT s108.id, sum(s108.amount) AS amount, max(s108.dt) AS dt FROM (
+SELECT s107.id, sum(s107.amount) AS amount, max(s107.dt) AS dt FROM (
+SELECT s106.id, sum(s106.amount) AS amount, max(s106.dt) AS dt FROM (
+SELECT s105.id, sum(s105.amount) AS amount, max(s105.dt) AS dt FROM (
+SELECT s104.id, sum(s104.amount) AS amount, max(s104.dt) AS dt FROM (
+SELECT s103.id, sum(s103.amount) AS amount, max(s103.dt) AS dt FROM (
+SELECT s102.id, sum(s102.amount) AS amount, max(s102.dt) AS dt FROM (
+SELECT s101.id, sum(s101.amount) AS amount, max(s101.dt) AS dt FROM (
+SELECT s100.id, sum(s100.amount) AS amount, max(s100.dt) AS dt FROM (
+SELECT s99.id, sum(s99.amount) AS amount, max(s99.dt) AS dt FROM (
+SELECT s98.id, sum(s98.amount) AS amount, max(s98.dt) AS dt FROM (
+SELECT s97.id, sum(s97.amount) AS amount, max(s97.dt) AS dt FROM (
+SELECT s96.id, sum(s96.amount) AS amount, max(s96.dt) AS dt FROM (
+SELECT s95.id, sum(s95.amount) AS amount, max(s95.dt) AS dt FROM (
+SELECT s94.id, sum(s94.amount) AS amount, max(s94.dt) AS dt FROM (
+SELECT s93.id, sum(s93.amount) AS amount, max(s93.dt) AS dt FROM (
+SELECT s92.id, sum(s92.amount) AS amount, max(s92.dt) AS dt FROM (
+SELECT s91.id, sum(s91.amount) AS amount, max(s91.dt) AS dt FROM (
+SELECT s90.id, sum(s90.amount) AS amount, max(s90.dt) AS dt FROM (
+SELECT s89.id, sum(s89.amount) AS amount, max(s89.dt) AS dt FROM (
+SELECT s88.id, sum(s88.amount) AS amount, max(s88.dt) AS dt FROM (
+SELECT s87.id, sum(s87.amount) AS amount, max(s87.dt) AS dt FROM (
+SELECT s86.id, sum(s86.amount) AS amount, max(s86.dt) AS dt FROM (
+SELECT s85.id, sum(s85.amount) AS amount, max(s85.dt) AS dt FROM (
+SELECT s84.id, sum(s84.amount) AS amount, max(s84.dt) AS dt FROM (
+SELECT s83.id, sum(s83.amount) AS amount, max(s83.dt) AS dt FROM (
+SELECT s82.id, sum(s82.amount) AS amount, max(s82.dt) AS dt FROM (
+SELECT s81.id, sum(s81.amount) AS amount, max(s81.dt) AS dt FROM (
+SELECT s80.id, sum(s80.amount) AS amount, max(s80.dt) AS dt FROM (
+SELECT s79.id, sum(s79.amount) AS amount, max(s79.dt) AS dt FROM (
+SELECT s78.id, sum(s78.amount) AS amount, max(s78.dt) AS dt FROM (
+SELECT s77.id, sum(s77.amount) AS amount, max(s77.dt) AS dt FROM (
+SELECT s76.id, sum(s76.amount) AS amount, max(s76.dt) AS dt FROM (
+SELECT s75.id, sum(s75.amount) AS amount, max(s75.dt) AS dt FROM (
+SELECT s74.id, sum(s74.amount) AS amount, max(s74.dt) AS dt FROM (
+SELECT s73.id, sum(s73.amount) AS amount, max(s73.dt) AS dt FROM (
+SELECT s72.id, sum(s72.amount) AS amount, max(s72.dt) AS dt FROM (
+SELECT s71.id, sum(s71.amount) AS amount, max(s71.dt) AS dt FROM (
+SELECT s70.id, sum(s70.amount) AS amount, max(s70.dt) AS dt FROM (
+SELECT s69.id, sum(s69.amount) AS amount, max(s69.dt) AS dt FROM (
+SELECT s68.id, sum(s68.amount) AS amount, max(s68.dt) AS dt FROM (
+SELECT s67.id, sum(s67.amount) AS amount, max(s67.dt) AS dt FROM (
+SELECT s66.id, sum(s66.amount) AS amount, max(s66.dt) AS dt FROM (
+SELECT s65.id, sum(s65.amount) AS amount, max(s65.dt) AS dt FROM (
+SELECT s64.id, sum(s64.amount) AS amount, max(s64.dt) AS dt FROM (
+SELECT s63.id, sum(s63.amount) AS amount, max(s63.dt) AS dt FROM (
+SELECT s62.id, sum(s62.amount) AS amount, max(s62.dt) AS dt FROM (
+SELECT s61.id, sum(s61.amount) AS amount, max(s61.dt) AS dt FROM (
+SELECT s60.id, sum(s60.amount) AS amount, max(s60.dt) AS dt FROM (
+SELECT s59.id, sum(s59.amount) AS amount, max(s59.dt) AS dt FROM (
+SELECT s58.id, sum(s58.amount) AS amount, max(s58.dt) AS dt FROM (
+SELECT s57.id, sum(s57.amount) AS amount, max(s57.dt) AS dt FROM (
+SELECT s56.id, sum(s56.amount) AS amount, max(s56.dt) AS dt FROM (
+SELECT s55.id, sum(s55.amount) AS amount, max(s55.dt) AS dt FROM (
+SELECT s54.id, sum(s54.amount) AS amount, max(s54.dt) AS dt FROM (
+SELECT s53.id, sum(s53.amount) AS amount, max(s53.dt) AS dt FROM (
+SELECT s52.id, sum(s52.amount) AS amount, max(s52.dt) AS dt FROM (
+SELECT s51.id, sum(s51.amount) AS amount, max(s51.dt) AS dt FROM (
+SELECT s50.id, sum(s50.amount) AS amount, max(s50.dt) AS dt FROM (
+SELECT s49.id, sum(s49.amount) AS amount, max(s49.dt) AS dt FROM (
+SELECT s48.id, sum(s48.amount) AS amount, max(s48.dt) AS dt FROM (
+SELECT s47.id, sum(s47.amount) AS amount, max(s47.dt) AS dt FROM (
+SELECT s46.id, sum(s46.amount) AS amount, max(s46.dt) AS dt FROM (
+SELECT s45.id, sum(s45.amount) AS amount, max(s45.dt) AS dt FROM (
+SELECT s44.id, sum(s44.amount) AS amount, max(s44.dt) AS dt FROM (
+SELECT s43.id, sum(s43.amount) AS amount, max(s43.dt) AS dt FROM (
+SELECT s42.id, sum(s42.amount) AS amount, max(s42.dt) AS dt FROM (
+SELECT s41.id, sum(s41.amount) AS amount, max(s41.dt) AS dt FROM (
+SELECT s40.id, sum(s40.amount) AS amount, max(s40.dt) AS dt FROM (
+SELECT s39.id, sum(s39.amount) AS amount, max(s39.dt) AS dt FROM (
+SELECT s38.id, sum(s38.amount) AS amount, max(s38.dt) AS dt FROM (
+SELECT s37.id, sum(s37.amount) AS amount, max(s37.dt) AS dt FROM (
+SELECT s36.id, sum(s36.amount) AS amount, max(s36.dt) AS dt FROM (
+SELECT s35.id, sum(s35.amount) AS amount, max(s35.dt) AS dt FROM (
+SELECT s34.id, sum(s34.amount) AS amount, max(s34.dt) AS dt FROM (
+SELECT s33.id, sum(s33.amount) AS amount, max(s33.dt) AS dt FROM (
+SELECT s32.id, sum(s32.amount) AS amount, max(s32.dt) AS dt FROM (
+SELECT s31.id, sum(s31.amount) AS amount, max(s31.dt) AS dt FROM (
+SELECT s30.id, sum(s30.amount) AS amount, max(s30.dt) AS dt FROM (
+SELECT s29.id, sum(s29.amount) AS amount, max(s29.dt) AS dt FROM (
+SELECT s28.id, sum(s28.amount) AS amount, max(s28.dt) AS dt FROM (
+SELECT s27.id, sum(s27.amount) AS amount, max(s27.dt) AS dt FROM (
+SELECT s26.id, sum(s26.amount) AS amount, max(s26.dt) AS dt FROM (
+SELECT s25.id, sum(s25.amount) AS amount, max(s25.dt) AS dt FROM (
+SELECT s24.id, sum(s24.amount) AS amount, max(s24.dt) AS dt FROM (
+SELECT s23.id, sum(s23.amount) AS amount, max(s23.dt) AS dt FROM (
+SELECT s22.id, sum(s22.amount) AS amount, max(s22.dt) AS dt FROM (
+SELECT s21.id, sum(s21.amount) AS amount, max(s21.dt) AS dt FROM (
+SELECT s20.id, sum(s20.amount) AS amount, max(s20.dt) AS dt FROM (
+SELECT s19.id, sum(s19.amount) AS amount, max(s19.dt) AS dt FROM (
+SELECT s18.id, sum(s18.amount) AS amount, max(s18.dt) AS dt FROM (
+SELECT s17.id, sum(s17.amount) AS amount, max(s17.dt) AS dt FROM (
+SELECT s16.id, sum(s16.amount) AS amount, max(s16.dt) AS dt FROM (
+SELECT s15.id, sum(s15.amount) AS amount, max(s15.dt) AS dt FROM (
+SELECT s14.id, sum(s14.amount) AS amount, max(s14.dt) AS dt FROM (
+SELECT s13.id, sum(s13.amount) AS amount, max(s13.dt) AS dt FROM (
+SELECT s12.id, sum(s12.amount) AS amount, max(s12.dt) AS dt FROM (
+SELECT s11.id, sum(s11.amount) AS amount, max(s11.dt) AS dt FROM (
+SELECT s10.id, sum(s10.amount) AS amount, max(s10.dt) AS dt FROM (
+SELECT s9.id, sum(s9.amount) AS amount, max(s9.dt) AS dt FROM (
+SELECT s8.id, sum(s8.amount) AS amount, max(s8.dt) AS dt FROM (
+SELECT s7.id, sum(s7.amount) AS amount, max(s7.dt) AS dt FROM (
+SELECT s6.id, sum(s6.amount) AS amount, max(s6.dt) AS dt FROM (
+SELECT s5.id, sum(s5.amount) AS amount, max(s5.dt) AS dt FROM (
+SELECT s4.id, sum(s4.amount) AS amount, max(s4.dt) AS dt FROM (
+SELECT s3.id, sum(s3.amount) AS amount, max(s3.dt) AS dt FROM (
+SELECT s2.id, sum(s2.amount) AS amount, max(s2.dt) AS dt FROM (
+SELECT s1.id, sum(s1.amount) AS amount, max(s1.dt) AS dt FROM (
+SELECT id, amount, dt FROM warehouse.events WHERE amount > 0
+) s1 WHERE s1.id IN (SELECT id FROM warehouse.allowed_1) GROUP BY s1.id
+) s2 WHERE s2.id IN (SELECT id FROM warehouse.allowed_2) GROUP BY s2.id
+) s3 WHERE s3.id IN (SELECT id FROM warehouse.allowed_3) GROUP BY s3.id
+) s4 WHERE s4.id IN (SELECT id FROM warehouse.allowed_4) GROUP BY s4.id
+) s5 WHERE s5.id IN (SELECT id FROM warehouse.allowed_5) GROUP BY s5.id
+) s6 WHERE s6.id IN (SELECT id FROM warehouse.allowed_6) GROUP BY s6.id
+) s7 WHERE s7.id IN (SELECT id FROM warehouse.allowed_7) GROUP BY s7.id
+) s8 WHERE s8.id IN (SELECT id FROM warehouse.allowed_8) GROUP BY s8.id
+) s9 WHERE s9.id IN (SELECT id FROM warehouse.allowed_9) GROUP BY s9.id
+) s10 WHERE s10.id IN (SELECT id FROM warehouse.allowed_10) GROUP BY s10.id
+) s11 WHERE s11.id IN (SELECT id FROM warehouse.allowed_11) GROUP BY s11.id
+) s12 WHERE s12.id IN (SELECT id FROM warehouse.allowed_12) GROUP BY s12.id
+) s13 WHERE s13.id IN (SELECT id FROM warehouse.allowed_13) GROUP BY s13.id
+) s14 WHERE s14.id IN (SELECT id FROM warehouse.allowed_14) GROUP BY s14.id
+) s15 WHERE s15.id IN (SELECT id FROM warehouse.allowed_15) GROUP BY s15.id
+) s16 WHERE s16.id IN (SELECT id FROM warehouse.allowed_16) GROUP BY s16.id
+) s17 WHERE s17.id IN (SELECT id FROM warehouse.allowed_17) GROUP BY s17.id
+) s18 WHERE s18.id IN (SELECT id FROM warehouse.allowed_18) GROUP BY s18.id
+) s19 WHERE s19.id IN (SELECT id FROM warehouse.allowed_19) GROUP BY s19.id
+) s20 WHERE s20.id IN (SELECT id FROM warehouse.allowed_20) GROUP BY s20.id
+) s21 WHERE s21.id IN (SELECT id FROM warehouse.allowed_21) GROUP BY s21.id
+) s22 WHERE s22.id IN (SELECT id FROM warehouse.allowed_22) GROUP BY s22.id
+) s23 WHERE s23.id IN (SELECT id FROM warehouse.allowed_23) GROUP BY s23.id
+) s24 WHERE s24.id IN (SELECT id FROM warehouse.allowed_24) GROUP BY s24.id
+) s25 WHERE s25.id IN (SELECT id FROM warehouse.allowed_25) GROUP BY s25.id
+) s26 WHERE s26.id IN (SELECT id FROM warehouse.allowed_26) GROUP BY s26.id
+) s27 WHERE s27.id IN (SELECT id FROM warehouse.allowed_27) GROUP BY s27.id
+) s28 WHERE s28.id IN (SELECT id FROM warehouse.allowed_28) GROUP BY s28.id
+) s29 WHERE s29.id IN (SELECT id FROM warehouse.allowed_29) GROUP BY s29.id
+) s30 WHERE s30.id IN (SELECT id FROM warehouse.allowed_30) GROUP BY s30.id
+) s31 WHERE s31.id IN (SELECT id FROM warehouse.allowed_31) GROUP BY s31.id
+) s32 WHERE s32.id IN (SELECT id FROM warehouse.allowed_32) GROUP BY s32.id
+) s33 WHERE s33.id IN (SELECT id FROM warehouse.allowed_33) GROUP BY s33.id
+) s34 WHERE s34.id IN (SELECT id FROM warehouse.allowed_34) GROUP BY s34.id
+) s35 WHERE s35.id IN (SELECT id FROM warehouse.allowed_35) GROUP BY s35.id
+) s36 WHERE s36.id IN (SELECT id FROM warehouse.allowed_36) GROUP BY s36.id
+) s37 WHERE s37.id IN (SELECT id FROM warehouse.allowed_37) GROUP BY s37.id
+) s38 WHERE s38.id IN (SELECT id FROM warehouse.allowed_38) GROUP BY s38.id
+) s39 WHERE s39.id IN (SELECT id FROM warehouse.allowed_39) GROUP BY s39.id
+) s40 WHERE s40.id IN (SELECT id FROM warehouse.allowed_40) GROUP BY s40.id
+) s41 WHERE s41.id IN (SELECT id FROM warehouse.allowed_41) GROUP BY s41.id
+) s42 WHERE s42.id IN (SELECT id FROM warehouse.allowed_42) GROUP BY s42.id
+) s43 WHERE s43.id IN (SELECT id FROM warehouse.allowed_43) GROUP BY s43.id
+) s44 WHERE s44.id IN (SELECT id FROM warehouse.allowed_44) GROUP BY s44.id
+) s45 WHERE s45.id IN (SELECT id FROM warehouse.allowed_45) GROUP BY s45.id
+) s46 WHERE s46.id IN (SELECT id FROM warehouse.allowed_46) GROUP BY s46.id
+) s47 WHERE s47.id IN (SELECT id FROM warehouse.allowed_47) GROUP BY s47.id
+) s48 WHERE s48.id IN (SELECT id FROM warehouse.allowed_48) GROUP BY s48.id
+) s49 WHERE s49.id IN (SELECT id FROM warehouse.allowed_49) GROUP BY s49.id
+) s50 WHERE s50.id IN (SELECT id FROM warehouse.allowed_50) GROUP BY s50.id
+) s51 WHERE s51.id IN (SELECT id FROM warehouse.allowed_51) GROUP BY s51.id
+) s52 WHERE s52.id IN (SELECT id FROM warehouse.allowed_52) GROUP BY s52.id
+) s53 WHERE s53.id IN (SELECT id FROM warehouse.allowed_53) GROUP BY s53.id
+) s54 WHERE s54.id IN (SELECT id FROM warehouse.allowed_54) GROUP BY s54.id
+) s55 WHERE s55.id IN (SELECT id FROM warehouse.allowed_55) GROUP BY s55.id
+) s56 WHERE s56.id IN (SELECT id FROM warehouse.allowed_56) GROUP BY s56.id
+) s57 WHERE s57.id IN (SELECT id FROM warehouse.allowed_57) GROUP BY s57.id
+) s58 WHERE s58.id IN (SELECT id FROM warehouse.allowed_58) GROUP BY s58.id
+) s59 WHERE s59.id IN (SELECT id FROM warehouse.allowed_59) GROUP BY s59.id
+) s60 WHERE s60.id IN (SELECT id FROM warehouse.allowed_60) GROUP BY s60.id
+) s61 WHERE s61.id IN (SELECT id FROM warehouse.allowed_61) GROUP BY s61.id
+) s62 WHERE s62.id IN (SELECT id FROM warehouse.allowed_62) GROUP BY s62.id
+) s63 WHERE s63.id IN (SELECT id FROM warehouse.allowed_63) GROUP BY s63.id
+) s64 WHERE s64.id IN (SELECT id FROM warehouse.allowed_64) GROUP BY s64.id
+) s65 WHERE s65.id IN (SELECT id FROM warehouse.allowed_65) GROUP BY s65.id
+) s66 WHERE s66.id IN (SELECT id FROM warehouse.allowed_66) GROUP BY s66.id
+) s67 WHERE s67.id IN (SELECT id FROM warehouse.allowed_67) GROUP BY s67.id
+) s68 WHERE s68.id IN (SELECT id FROM warehouse.allowed_68) GROUP BY s68.id
+) s69 WHERE s69.id IN (SELECT id FROM warehouse.allowed_69) GROUP BY s69.id
+) s70 WHERE s70.id IN (SELECT id FROM warehouse.allowed_70) GROUP BY s70.id
+) s71 WHERE s71.id IN (SELECT id FROM warehouse.allowed_71) GROUP BY s71.id
+) s72 WHERE s72.id IN (SELECT id FROM warehouse.allowed_72) GROUP BY s72.id
+) s73 WHERE s73.id IN (SELECT id FROM warehouse.allowed_73) GROUP BY s73.id
+) s74 WHERE s74.id IN (SELECT id FROM warehouse.allowed_74) GROUP BY s74.id
+) s75 WHERE s75.id IN (SELECT id FROM warehouse.allowed_75) GROUP BY s75.id
+) s76 WHERE s76.id IN (SELECT id FROM warehouse.allowed_76) GROUP BY s76.id
+) s77 WHERE s77.id IN (SELECT id FROM warehouse.allowed_77) GROUP BY s77.id
+) s78 WHERE s78.id IN (SELECT id FROM warehouse.allowed_78) GROUP BY s78.id
+) s79 WHERE s79.id IN (SELECT id FROM warehouse.allowed_79) GROUP BY s79.id
+) s80 WHERE s80.id IN (SELECT id FROM warehouse.allowed_80) GROUP BY s80.id
+) s81 WHERE s81.id IN (SELECT id FROM warehouse.allowed_81) GROUP BY s81.id
+) s82 WHERE s82.id IN (SELECT id FROM warehouse.allowed_82) GROUP BY s82.id
+) s83 WHERE s83.id IN (SELECT id FROM warehouse.allowed_83) GROUP BY s83.id
+) s84 WHERE s84.id IN (SELECT id FROM warehouse.allowed_84) GROUP BY s84.id
+) s85 WHERE s85.id IN (SELECT id FROM warehouse.allowed_85) GROUP BY s85.id
+) s86 WHERE s86.id IN (SELECT id FROM warehouse.allowed_86) GROUP BY s86.id
+) s87 WHERE s87.id IN (SELECT id FROM warehouse.allowed_87) GROUP BY s87.id
+) s88 WHERE s88.id IN (SELECT id FROM warehouse.allowed_88) GROUP BY s88.id
+) s89 WHERE s89.id IN (SELECT id FROM warehouse.allowed_89) GROUP BY s89.id
+) s90 WHERE s90.id IN (SELECT id FROM warehouse.allowed_90) GROUP BY s90.id
+) s91 WHERE s91.id IN (SELECT id FROM warehouse.allowed_91) GROUP BY s91.id
+) s92 WHERE s92.id IN (SELECT id FROM warehouse.allowed_92) GROUP BY s92.id
+) s93 WHERE s93.id IN (SELECT id FROM warehouse.allowed_93) GROUP BY s93.id
+) s94 WHERE s94.id IN (SELECT id FROM warehouse.allowed_94) GROUP BY s94.id
+) s95 WHERE s95.id IN (SELECT id FROM warehouse.allowed_95) GROUP BY s95.id
+) s96 WHERE s96.id IN (SELECT id FROM warehouse.allowed_96) GROUP BY s96.id
+) s97 WHERE s97.id IN (SELECT id FROM warehouse.allowed_97) GROUP BY s97.id
+) s98 WHERE s98.id IN (SELECT id FROM warehouse.allowed_98) GROUP BY s98.id
+) s99 WHERE s99.id IN (SELECT id FROM warehouse.allowed_99) GROUP BY s99.id
+) s100 WHERE s100.id IN (SELECT id FROM warehouse.allowed_100) GROUP BY s100.id
+) s101 WHERE s101.id IN (SELECT id FROM warehouse.allowed_101) GROUP BY s101.id
+) s102 WHERE s102.id IN (SELECT id FROM warehouse.allowed_102) GROUP BY s102.id
+) s103 WHERE s103.id IN (SELECT id FROM warehouse.allowed_103) GROUP BY s103.id
+) s104 WHERE s104.id IN (SELECT id FROM warehouse.allowed_104) GROUP BY s104.id
+) s105 WHERE s105.id IN (SELECT id FROM warehouse.allowed_105) GROUP BY s105.id
+) s106 WHERE s106.id IN (SELECT id FROM warehouse.allowed_106) GROUP BY s106.id
+) s107 WHERE s107.id IN (SELECT id FROM warehouse.allowed_107) GROUP BY s107.id
+) s108 WHERE s108.id IN (SELECT id FROM warehouse.allowed_108) GROUP BY s108.id
+) s109 WHERE s109.id IN (SELECT id FROM warehouse.allowed_109) GROUP BY s109.id
+) s110 WHERE s110.id IN (SELECT id FROM warehouse.allowed_110) GROUP BY s110.id
+) s111 WHERE s111.id IN (SELECT id FROM warehouse.allowed_111) GROUP BY s111.id
+) s112 WHERE s112.id IN (SELECT id FROM warehouse.allowed_112) GROUP BY s112.id
+) s113 WHERE s113.id IN (SELECT id FROM warehouse.allowed_113) GROUP BY s113.id
+) s114 WHERE s114.id IN (SELECT id FROM warehouse.allowed_114) GROUP BY s114.id
+) s115 WHERE s115.id IN (SELECT id FROM warehouse.allowed_115) GROUP BY s115.id
+) s116 WHERE s116.id IN (SELECT id FROM warehouse.allowed_116) GROUP BY s116.id
+) s117 WHERE s117.id IN (SELECT id FROM warehouse.allowed_117) GROUP BY s117.id
+) s118 WHERE s118.id IN (SELECT id FROM warehouse.allowed_118) GROUP BY s118.id
+) s119 WHERE s119.id IN (SELECT id FROM warehouse.allowed_119) GROUP BY s119.id
+) s120 WHERE s120.id IN (SELECT id FROM warehouse.allowed_120) GROUP BY s120.id;
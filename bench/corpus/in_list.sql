@@ -0,0 +1,5 @@
+SELECT user_id, count(*) AS n
+FROM warehouse.events
+WHERE user_id IN (278108255, 312198691, 735790164, 976611283, 734527364, 861145937, 911967756, 955627823, 199419816, 700090116, 247560421, 715311300, 158011753, 933329637, 241766857, 688222515, 788151844, 201191488, 139815176, 76049769, 570494872, 908160748, 229681458, 799607132, 316385285, 32184316, 463405851, 135610017, 899426831, 734612083, 653266825, 15496659, 296177567, 895910282, 157529011, 91215160, 935534856, 852668974, 869451287, 953860565, 865486202, 281803911, 887303028, 484328319, 799669391, 468973008, 149794660, 852304639, 941687421, 275638094, 381969854, 912615065, 251285487, 522681937, 964478716, 810679211, 590238762, 605739204, 461255486, 720189064, 391059585, 954158543, 461518150, 685739467, 336898701, 703571564, 126014394, 371492369, 880085657, 638527600, 857123684, 680521186, 282275786, 741872549, 481441639, 595096017, 656259029, 803600713, 144798124, 472854073, 726731619, 782703075, 476097077, 575499786, 189659041, 314936633, 217568694, 192642121, 561237659, 382518887, 271991432, 398479137, 493340369, 281065110, 650149364, 300794463, 424941234, 954843638, 140424987, 619766477, 527053836, 590586438, 252809285, 607046945, 253057674, 952002251, 208809443, 753279701, 393461864, 140769029, 78679271, 462117906, 699254790, 675475892, 497844048, 418425124, 2341851, 771893662, 455605130, 931475453, 46394824, 241489687, 152198137, 534752675, 865538215, 749612007, 899951752, 477940933, 686180633, 272407554, 171537465, 787215522, 443982476, 790548166, 932267238, 269807421, 951541868, 816000358, 862399503, 376444655, 218032181, 757410256, 916604234, 676992306, 402391452, 558724926, 769347924, 705297769, 147110683, 967913023, 755807550, 648003194, 255184593, 776008585, 532946044, 227327988, 925104762, 662756944, 45701938, 623709304, 753546629, 634822997, 41497726, 385850349, 626018564, 781355028, 611912371, 366504474, 195583181, 317102881, 207097468, 176612743, 845465879, 734472986, 596241119, 120538443, 967031130, 242190429, 179667402, 74242725, 460791098, 690981646, 638996955, 597164724, 866519192, 583380676, 746419733, 41690699, 472006811, 886219759, 368356853, 692662224, 99494985, 565417072, 3193893, 135811687, 333489882, 130477019, 438134036, 323736501, 973600588, 288776767, 606709085, 641301868, 750554057, 83136909, 504541103, 560513081, 393738706, 914432603, 896041188, 38423995, 6137488, 343258551, 359438053, 166498168, 533176290, 601038055, 572053999, 554787937, 885132582, 509192340, 239501288, 718872307, 222507341, 318424672, 857714144, 34080319, 403907037, 538349127, 766891938, 977536297, 168661230, 792822361, 157160404, 277363498, 456727828, 734490570, 884968352, 911734299, 231038642, 277613280, 456180701, 631372964, 253153212, 381784708, 829907315, 262270217, 635752348, 308543923, 459441683, 218879475, 687950942, 376689389, 456791663, 40917081, 340305287, 426956848, 494642392, 93154631, 73635021, 814053477, 48971550, 644040010, 989238932, 4397781, 701518785, 830916592, 328972547, 204471397, 482652060, 516184645, 595527874, 418419732, 357412407, 65818352, 310779107, 566997028, 467036061, 147090239, 159308203, 927245731, 56476624, 120188744, 395736165, 884230610, 167780919, 234370945, 330664203, 325723107, 647719277, 416980345, 312383234, 35835816, 373227729, 137732924, 107009668, 387648682, 527101377, 474454154, 628393331, 941073176, 626298218, 466288153, 46788829, 376928461, 574508158, 317269594, 138894871, 862934176, 52799585, 346511534, 178927884, 958741515, 952624581, 585621861, 794201859, 134900447, 968877504, 5303066, 960500600, 266418618, 979629559, 932066809, 731848378, 160792231, 96297474, 514240554, 399058836, 75556247, 370411689, 283540235, 860910261, 882098634, 229518070, 50412953, 771348904, 255336481, 715742869, 888941727, 256324285, 558233924, 844165009, 988321157, 819785304, 473019021, 209432101, 615549357, 422072353, 666366727, 58222800, 901573357, 587454256, 963765531, 55776811, 123877240, 658548335, 147276132, 573217710, 816037034, 872331908, 398087658, 572944207, 425792262, 321599589, 159992691, 585698718, 319816113, 279998364, 93291651, 400158183, 55926062, 32648047, 179349241, 780540199, 16731876, 115056095, 562764874, 768946214, 291283497, 930227783, 97638001, 358250158, 868725231, 673652025, 455641320, 172377756, 668009447, 894600940, 723984961, 768820614, 752507199, 311847893, 986062023, 818198545, 43794466, 117482498, 101651958, 331206409, 435679902, 416278414, 505977408, 418859860, 287506309, 161973834, 842701419, 160520357, 483382892, 323114495, 3942749, 565147360, 31422795, 571452228, 278124741, 296624920, 356431249, 243056887, 265538079, 912776376, 916469628, 402635690, 446832116, 168127046, 897637624, 818020533, 859994654, 519742114, 439357189, 280733353, 166506359, 495073945, 620843900, 968567031, 576264592, 497316581, 208204767, 822773038, 403265948, 766758778, 511213414, 892707252, 204782376, 31199343, 615185535, 972505674, 36713549, 517472552, 881792402, 537717610, 191894350, 134514849, 110464185, 5913546, 632294417, 142725556, 329933548, 86615385, 950452788, 970259184, 533578493, 613298601, 559836017, 778117121, 896061550, 59486450, 230103528, 757421347, 800310020, 978313333, 696900389, 742281965, 460034386, 29009162, 570838278, 23652973, 834179309, 925859740, 731379503, 153988509, 320142618, 901659155, 665110093, 165081057, 698300741, 57534017, 785952584, 537605088, 459519594, 994128282, 806212655, 276392312, 242361265, 522355378, 23100319, 652883285, 100865902, 261636174, 339651335, 569465817, 541164366, 10297627, 613445116, 482525679, 957783458, 815797049, 973918953, 364992528, 701098223, 236699222, 652972040, 54574714, 563304992, 752264058, 458689053, 252782105, 981470159, 547634407, 795153448, 13662857, 107794588, 396193623, 981574377, 159303086, 501202916, 877234995, 378455033, 892596465, 143147870, 731599603, 370206275, 773993481, 243311433, 716385368, 304413245, 634269679, 99710628, 276164072, 765418768, 143375161, 134601584, 779753587, 191578138, 640514397, 112196014, 60621597, 587084529, 689018822, 152153320, 655043149, 789567988, 549279004, 27969482, 832181281, 496016835, 940957148, 382580140, 409208729, 620690016, 874798161, 613165143, 536081260, 864224587, 614072340, 551102915, 444389225, 72368334, 922470501, 477228891, 566144032, 301161724, 363199222, 407551272, 721891905, 133774171, 979953460, 220841381, 734051126, 351502267, 402978825, 622722419, 83456987, 822212779, 513651043, 444849192, 322274545, 874081247, 996527204, 842194769, 28178978, 765666292, 480732149, 418262800, 440782429, 516961587, 605788778, 960402379, 805001977, 65435184, 85816796, 268887657, 231381638, 3464717, 156548863, 571640511, 348549949, 322011657, 902088285, 570067589, 223062487, 463269373, 602930799, 316323883, 12117716, 218872704, 675322201, 940907833, 95679655, 804908290, 121197701, 704453958, 138077591, 71849268, 595460772, 415160378, 674238149, 228046969, 336500317, 170837361, 16833068, 171795126, 749721301, 198879709, 52916476, 59663945, 248491054, 469720953, 607144076, 948651695, 191326999, 708073471, 826584103, 761085781, 439607742, 752212929, 86636385, 855932356, 522814328, 915953506, 551112623, 166462633, 119545076, 58017583, 374386605, 666710947, 55634443, 557079291, 880737823, 559397687, 836046595, 839511097, 805231384, 187083412, 98278421, 758164583, 832572559, 457928313, 327330137, 452716625, 319369577, 262742397, 281566223, 302331667, 865450890, 621645171, 768067860, 594831200, 448493854, 973614724, 303789166, 300839011, 798020218, 768399620, 227394548, 104118695, 901227037, 700073328, 90705097, 172530226, 50503683, 920845321, 128192181, 808062817, 273154113, 160590285, 867807827, 235832594, 670609747, 327916818, 107567083, 110817519, 529393397, 474074368, 642924723, 112033786, 49292815, 756327623, 961276961, 617947027, 585261057, 451079064, 146911026, 762236618, 512832044, 250552436, 513408820, 356145686, 903196733, 390352490, 134106419, 2183513, 765038775, 952281354, 526090519, 94752444, 747705486, 108586032, 826116549, 856693402, 918744719, 878764067, 288656020, 480517185, 16437212, 452468053, 988189927, 149485718, 758257734, 1305645, 678693716, 558871712, 150624393, 261785668, 373489778, 162166370, 460176630, 972439243, 468466801, 20693385, 383203394, 389018126, 352675857, 806987211, 374711563, 801797296, 207121413, 114826916, 158872889, 796840543, 171738001, 604982643, 181828885, 676417038, 458832364, 60882756, 857528199, 643489872, 464123965, 826648903, 132271937, 528088330, 440504772, 592335641, 223716730, 877708788, 165549431, 665124276, 404241645, 858649904, 21891292, 427463232, 847891649, 422814131, 365270111, 979009244, 460673838, 429709712, 308740181, 86313971, 596301600, 260224542, 430520447, 180903917, 895512591, 637924503, 806468206, 599543913, 52851265, 840754126, 495380263, 472940593, 110552884, 575960295, 915247522, 805656111, 550186688, 775789204, 485696594, 798486283, 153485877, 956597755, 836702516, 599154118, 46594132, 596111205, 776010821, 202319989, 28866394, 258986999, 466541546, 48017125, 535587611, 293059952, 965594066, 455896971, 45765974, 831933100, 375415032, 204740373, 794727446, 975195183, 492803211, 429797406, 910943711, 661275032, 171619893, 472238202, 827951729, 221223804, 463047371, 809668642, 609397601, 422273846, 61151142, 419580480, 432556776, 238104374, 862014378, 711140092, 789369261, 205404129, 605585077, 943952118, 454122240, 219706734, 41881438, 39795387, 750752753, 17840790, 479271407, 563389607, 777452731, 735732373, 657090228, 422100076, 431734399, 983495937, 939078122, 541741725, 141877068, 929352319, 486768784, 92388916, 528627923, 525715679, 630107510, 675191434, 480758974, 87379233, 574128142, 550056078, 740324342, 545918652, 14297441, 64331803, 763347563, 856454264, 525253455, 686342434, 190241346, 257272612, 776909308, 122058721, 29393042, 451038409, 753571386, 601435760, 934739075, 218533985, 499773273, 515644427, 38423995, 445093805, 890069274, 44749710, 217050171, 297487853, 784834362, 860819890, 536252809, 564729676, 159411981, 158533450, 166645146, 852214646, 884941929, 773369392, 18522374, 190700280, 607073764, 71613710, 316562817, 181338176, 746605729, 511076309, 208409278, 715237994, 530436937, 2093344, 648271075, 770040113, 266924741, 72915146, 502124205, 838210543, 125021884, 69353457, 773745771, 639047233, 70597434, 416275996, 565848234, 748642508, 192772578, 206167909, 604707790, 982188571, 60756685, 786002042, 29476838, 409987854, 670966872, 220532154, 772540165, 953766363, 484163886, 727228018, 863638559, 352651400, 153220560, 481170170, 675218173, 644483767, 683220595, 823905062, 188298642, 947764038, 150176388, 901084918, 258175847, 622156979, 561927176, 845225950, 754069737, 763421274, 850133108, 614030762, 749129443, 83222978, 541001429, 775085098, 461349193, 550184164, 872234986, 182089622, 429061335, 663836680, 444188116, 263760249, 835460864, 331593901, 307829117, 484557757, 828373588, 806663140, 6976996, 114714996, 820604620, 475055084, 491169010, 252465302, 765654521, 720483300, 865497263, 875944491, 199049077, 283602967, 21851105, 772832861, 827273310, 498206285, 233690257, 601397977, 295946661, 650283503, 577637916, 978611994, 866280285, 757268741, 646200011, 964335535, 572753, 711001722, 839071020, 988431326, 622956745, 137182786, 453710982, 354450964, 258890614, 473318440, 19299092, 743112902, 429214104, 291110014, 107769643, 148601869, 38161771, 943550874, 352457764, 474689967, 30403779, 75816888, 907775963, 956459392, 81160601, 117513458, 391759013, 91165703, 664757745, 821394137, 713263469, 827501460, 965276505, 188936121, 801350572, 611423795, 521818003, 944221020, 613790340, 501930377, 617745364, 767302723, 757676, 500966018, 549293135, 769270955, 19396723, 664182967, 364876045, 593809644, 791413676, 370303967, 85316065, 953079161, 436468549, 820336889, 439364366, 921062402, 961529834, 938251214, 88302013, 639229536, 224830158, 366106844, 166931148, 127367694, 616166552, 165885332, 79795616, 416773625, 626179507, 313837022, 737741950, 532513776, 306226761, 799327089, 871938727, 717765937, 448153363, 876013377, 211987233, 533511811, 207621430, 111057452, 620704689, 575788839, 412555085, 324216384, 50277550, 83449186, 328353472, 484464961, 211992575, 507190287, 8637793, 733529161, 50824563, 457903381, 558684631, 76370746, 508317145, 657295144, 328312599, 225618551, 688575995, 131150226, 646488546, 662545612, 740474569, 725439687, 346885800, 11474541, 323468970, 505788684, 22256291, 696774236, 178243936, 565920610, 352966824, 40838136, 856172706, 313364613, 797315930, 841461520, 798054694, 866798320, 461445595, 949581, 979213567, 454386044, 143409768, 733918266, 453192838, 53909214, 397123195, 164917737, 178779148, 806305968, 391564091, 826532297, 957950666, 722727967, 411879445, 266874830, 321347928, 930695447, 776393239, 553071447, 515396193, 221500824, 24686827, 103574360, 337565056, 181341179, 59929092, 264491563, 235941864, 302123185, 382610969, 852062634, 959176242, 637637625, 891980803, 428726127, 903742362, 557572425, 677452119, 307819291, 12413402, 15401045, 792477049, 983673426, 204520100, 811515562, 277465532, 988971870, 70810776, 590742886, 785174300, 785713929, 259496413, 148517871, 112147922, 447451009, 939369370, 422829952, 475059488, 875298588, 316308675, 337745923, 601434315, 274421740, 69218471, 743788299, 455023970, 304372347, 697376147, 244214074, 928140840, 466470314, 131585116, 517551780, 959649958, 263700197, 113144801, 71594856, 221672657, 125740417, 358313806, 234398361, 181369307, 727717814, 97776434, 703748391, 371781793, 428178358, 266142462, 203699715, 635989210, 552660185, 342607941, 133050958, 84815461, 731540963, 351733842, 442294604, 501550090, 738523884, 452772232, 416052007, 428030416, 81018031, 393625454, 609358704, 444007950, 545299890, 191549547, 280885814, 318048664, 839388617, 741496066, 402887372, 514959158, 586408676, 73003905, 570606064, 155967005, 976707222, 902971985, 70881323, 379155202, 704471146, 891247642, 767408241, 662614450, 13943878, 671610734, 357032736, 381892411, 448439027, 622438588, 948384841, 445487184, 800831831, 554637045, 415681053, 168805819, 115368383, 702155208, 229369080, 969915199, 773561491, 995495624, 427451616, 872722065, 678297327, 923926578, 540972502, 111439636, 651586407, 771439956, 221531412, 133519041, 717421822, 910461793, 679189023, 425193837, 440146358, 525253526, 722357675, 558355866, 930533308, 220960948, 432851923, 608145004, 77562723, 925864530, 290360696, 481934755, 746817763, 471249285, 7728455, 393646512, 886472412, 204623611, 884643596, 305568567, 534529275, 899631273, 295137244, 194878950, 402266687, 732150796, 308488799, 775989296, 362020535, 932469583, 927414563, 827449420, 281756937, 883070615, 196001551, 47066443, 338566850, 92880418, 814975968, 157809513, 249150253, 810568566, 699339110, 929217767, 997547891, 963082338, 277902010, 974715392, 314721672, 925909767, 630207512, 392480809, 31962119, 513105812, 95622992, 190193917, 615890819, 407897395, 498979597, 454478277, 377269194, 445922961, 105539460, 21094160, 278949055, 190303389, 256339012, 851395276, 75023016, 909456289, 875932767, 9727847, 17462095, 114852119, 445012524, 255635496, 184597539, 218435385, 487283734, 815533640, 796400449, 200979849, 754981400, 355547826, 114784474, 581581023, 849738559, 463552600, 563947070, 85948771, 128767350, 454105011, 625792317, 656471886, 964072333, 428192624, 892591215, 842776604, 58145683, 479205925, 315560177, 68089190, 961367807, 675131201, 612282525, 334250300, 274046399, 219602164, 970984064, 120801421, 515134619, 647462925, 78431807, 502902591, 39522559, 922200395, 316345425, 785623653, 687733838, 474994126, 181897996, 392251965, 533710523, 829164353, 903451630, 899120488, 212445739, 646733819, 278883192, 937199333, 502962785, 566686281, 984086414, 445616912, 785608089, 340137550, 919553810, 289027112, 402670053, 164389418, 346073285, 991186447, 678564111, 593283844, 35285692, 89627611, 526303461, 224119205, 884107730, 455383069, 878678854, 865521405, 577415588, 919158890, 882418405, 815498310, 892367145, 314324230, 370533435, 458586017, 659896604, 218539909, 416197810, 609599544, 697438721, 954399721, 54003774, 817784270, 515254983, 436993583, 543763480, 954493808, 976506997, 608794067, 10704249, 807869102, 759933994, 356416243, 298948767, 936623873, 998986660, 983086458, 327682457, 81856950, 663642235, 456040964, 86572207, 591790332, 57022249, 327544171, 790187037, 258459252, 717465928, 842743727, 731117006, 224911668, 79477940, 594314942, 472151614, 21415613, 137543783, 495843777, 523590827, 225009182, 4025152, 12826174, 115547364, 967118521, 196180153, 981879960, 40334702, 543229118, 134811600, 316770425, 918432711, 320125630, 40336327, 787703262, 867210147, 623220843, 732945507, 479373511, 742100614, 477306601, 106533316, 318233483, 417667921, 250044662, 943089540, 38765565, 979479472, 13239007, 521606464, 294703454, 839956172, 680323987, 949791925, 512314686, 559989063, 197736178, 153401162, 197586460, 111896356, 32844092, 720658305, 995885728, 366537779, 585669712, 565291293, 29196388, 45321647, 289983872, 175827671, 298268345, 343855552, 681006646, 683195031, 668356457, 411934657, 382182374, 243733879, 224680729, 303957663, 603333830, 241776759, 350789734, 348135105, 82504888, 410230171, 189038276, 932244972, 42051127, 142429996, 964268289, 572130067, 217647492, 987260599, 717529691, 664393505, 502366413, 504221937, 723379102, 273935529, 48408047, 90576804, 61450841, 667150646, 727884705, 746453178, 77500017, 729330371, 286654617, 976945045, 508457954, 105720572, 506962573, 692936274, 968399262, 755452623, 661160429, 371070485, 269059159, 507874767, 999795899, 633938181, 27539243, 836423462, 632449975, 136535849, 352271220, 960765607, 557050504, 311722792, 187056093, 311090638, 413015516, 272488390, 374581556, 449490692, 497684494, 572478304, 435415281, 181626817, 234398687, 67973775, 181119681, 830955150, 502047138, 258247754, 555612914, 910925690, 457562764, 160859033, 903006209, 680887161, 657156850, 157135572, 48926716, 349398493, 152046437, 691359724, 363945115, 859133264, 109971906, 746193124, 602854123, 957440598, 630388890, 762973316, 548338509, 482869359, 363565071, 550507425, 606741480, 391006174, 1263502, 223853494, 9836640, 624196864, 556510621, 798986993, 449973417, 540555546, 318977184, 419429883, 165405719, 269776827, 552990075, 907550356, 39059954, 55938895, 628331644, 444150987, 763228578, 243159274, 348618395, 904894392, 169387320, 118781471, 60927549, 122773252, 662595798, 777775756, 984824039, 511213783, 741344692, 188190401, 722585668, 135111025, 922702035, 939322391, 442568960, 169395478, 460312923, 620448617, 279621580, 762271432, 892438176, 228649557, 741127763, 800753692, 562563828, 550412558, 836525648, 704331811, 979806400, 6161648, 49260334, 441127787, 235883273, 737117686, 502117426, 766982470, 778191945, 259615624, 810134235, 475441280, 299728216, 712454430, 566549700, 315770190, 219455774, 718833850, 526912840, 64823889, 878196257, 442865952, 685807441, 768762291, 927261206, 292582981, 548815964, 121211873, 713893118, 382360506, 712728718, 345286924, 695466255, 483842747, 484682444, 252863326, 340262484, 898660673, 137180767, 355648236, 952449202, 747181634, 832447273, 244949980, 699274216, 282885688, 808600998, 209122963, 337626311, 411283492, 189734263, 367679578, 571546276, 366399728, 502017046, 942045636, 696583047, 39933874, 937637748, 497355264, 421277070, 861345201, 401224037, 996648557, 756737675, 917466108, 947931560, 420250713, 607895801, 128930018, 637881902, 957498750, 967664565, 988344146, 525444627, 48220878, 128238835, 102014208, 562429055, 592237340, 750589657, 536811377, 938949095, 104257353, 250789976, 919734249, 47524755, 97436787, 677038356, 490595706, 92981499, 492066131, 458301790, 582418337, 297633382, 130332721, 31506615, 918492239, 597483210, 232000248, 366839585, 536266559, 673728151, 43744487, 586872477, 331024672, 748818319, 359046272, 131073129, 869975548, 652202095, 290498509, 192537117, 632609078, 135643796, 897011626, 982645406, 584971237, 599857398, 874698162, 955361466, 430945379, 230587771, 138164161, 189697358, 954624101, 620452975, 784203868, 742582828, 959438653, 191422129, 271891836, 539148994, 626536849, 603366659, 554752313, 536330925, 214658303, 337411906, 280372051, 479657634, 663550622, 118379220, 384892870, 105615421, 388947799, 63338442, 259808644, 895147398, 355185292, 267840036, 30702284, 724256356, 620988200, 123457514, 365868726, 949080574, 226049066, 30594967, 565735301, 864967696, 892873317, 570667570, 695549144, 974846664, 965298170, 955508583, 855316951, 13236141, 305806178, 54483471, 125733302, 267572907, 186098023, 47339228, 878908010, 928820645, 477591155, 154680921, 359322423, 725945544, 71029515, 573050545, 753838191, 97227784, 773653495, 695889384, 863444631, 417275235, 363644774, 616866908, 232772001, 910338133, 595121015, 365427726, 445437169, 173725271, 585299702, 51909237, 319877529, 377724720, 920619064, 750222511, 236705559, 533696610, 1182196, 622239938, 52083153, 140234552, 950316286, 480441617, 116221531, 698876361, 100199949, 80747524, 271664479, 225406358, 398197227, 726973259, 519981988, 507723133, 324656551, 160306527, 364955047, 694301262, 940286411, 540569442, 859907446, 135322713, 820933687, 713271928, 983161727, 687896928, 371358156, 575043478, 934522016, 104487779, 484093877, 723102849, 117086474, 996350352, 487144092, 686273918, 122318698, 387736389, 574640012, 56359541, 979463716, 500821852, 621233640, 520128825, 292851392, 802626137, 619065988, 709592088, 17259038, 262975217, 271442553, 55055197, 517001464, 781863664, 517601034, 497103082, 758107685, 318849814, 248716285, 842321250, 301415622, 548965660, 786714767, 46795846, 304376137, 492050213, 161395709, 340661448, 668135970, 902316284, 375844640, 632537994, 976365553, 243351230, 949360075, 849547901, 925561231, 851472001, 19090771, 386366943, 550763150, 212490869, 135243572, 728256944, 224481847, 753639252, 542902897, 123375682, 132492841, 300019245, 647826150, 989609125, 585655772, 843564130, 224117854, 798225324, 89687010, 583926167, 524450635, 905601800, 294758456, 634302859, 321180280, 155271985, 445192436, 408529517, 641467836, 765971785, 404892853, 325516779, 892247233, 888713337, 149311638, 121509907, 356013628, 81325194, 280356006, 13901646, 168966257, 597123229, 514879679, 647405220, 575008188, 132638191, 506982938, 221954631, 942224365, 548979031, 232270219, 418550989, 157477678, 392946897, 266481123, 773463986, 894548082, 184253623, 871200903, 121287003, 513169128, 1051331, 412184325, 386416273, 529178877, 296067846, 265760014, 571146385, 251924269, 50535464, 280022039, 546738458, 872113571, 185005370, 47921074, 732848539, 235358926, 167044562, 416733106, 606311199, 723574265, 353268083, 892165128, 517530076, 486618790, 561939125, 805236482, 773647828, 567180329, 243378088, 483748475, 271548656, 596456598, 877524948, 833997620, 151021626, 154400199, 868931583, 869475649, 895950692, 319829948, 303506804, 608974367, 574961897, 957861784, 83904206, 985956767, 72615546, 187289889, 541779383, 153170206, 658545973, 286355907, 316010117, 650267298, 283543466, 701425101, 332918172, 819134376, 557987873, 882727065, 789602994, 510100446, 551740742, 403656402, 167390105, 856874736, 51015311, 666553731, 830645553, 949280548, 389468464, 97125173, 499906191, 599109361, 369827588, 441757320, 138126436, 309474265, 627735412, 807954296, 338624468, 403514923, 338471958, 547842730, 543797320, 408743406, 782253895, 731343880, 102070085, 494002138, 309010519, 699074791, 835120909, 674114274, 649764157, 981125763, 470884964, 733533618, 610272814, 911145902, 471568284, 258639837, 913961069, 901881838, 6472857, 642859164, 874088226, 668745107, 15604777, 189802059, 653965424, 70300010, 294345101, 750083814, 174639156, 797670056, 163722901, 147260020, 182957729, 730533289, 829022558, 88366332, 55632818, 223429524, 52299501, 424987596, 612739959, 484809661, 707348465, 359503846, 386345623, 410868579, 930250643, 945259296, 30457178, 206882724, 425302122, 422182394, 887248434, 657112512, 180926805, 702595142, 932483562, 952319297, 413881350, 375882620, 933560493, 688486867, 122386414, 741255801, 685264347, 171845217, 90098664, 394990389, 732570814, 475597138, 460979738, 644214622, 425272441, 567962845, 632935925, 148729367, 241511890, 218463051, 461660151, 352404967, 932271536, 93397422, 120905125, 827981458, 910541590, 961908813, 319473913, 787878710, 41020364, 236092530, 537944079, 631171629, 659424330, 34532853, 77232623, 226758885, 658497907, 273245332, 25048321, 642040999, 197595618, 625324905, 404739510, 581381072, 714479421, 172593822, 983760490, 539333414, 910000009, 802640714, 413628747, 937388012, 516402656, 396352625, 354772432, 482087607, 935023387, 996616647, 48576617, 744588145, 648284086, 472362550, 109769579, 857622918, 863865420, 627659248, 725468263, 131649997, 76935967, 726542304, 46789377, 927972151, 932245593, 329424016, 624202489, 806733688, 623161210, 847257964, 410660198, 915916110, 106768726, 55770176, 777426599, 698232455, 359461138, 425759760, 458812515, 632816992, 860256361, 115771153, 946365556, 307327842, 490261000, 358042844, 552767854, 832458593, 537854278, 483200918, 444384425, 958773892, 632312395, 400638234, 561652211, 58119593, 833077465, 306157957, 257565278, 964753680, 871714540, 621381826, 347777737, 368556901, 882324629, 730807998, 544216221, 192433658, 528014010, 446188676, 918928625, 21862527, 630343092, 359122572, 651401932, 234551662, 238507171, 921483419, 167337168, 370870319, 513019223, 24726743, 501704523, 164776551, 286948379, 747466517, 346965635, 433293237, 983515021, 542486688, 146858376, 880877695, 564007721, 747053634, 864555771, 227869139, 285570969, 801530429, 101346598, 734428482, 990587870, 631971315, 473554206, 538267209, 670913303, 982668700, 567438344, 643982524, 885103623, 65099969, 901316798, 417399011, 708334546, 148663355, 286393081, 643982374, 829945529, 521617086, 613578324, 787407307, 518297279, 512046888, 293098859, 888481639, 872379961, 86948231, 304677001, 56352804, 76412216, 434369022, 927248626, 556641382, 848587131, 690126543, 240189422, 706404581, 476096219, 556285646, 693424304, 400445424, 485929143, 787436904, 599341344, 106886125, 223138453, 242735889, 619478560, 104484515, 492154811, 269614339, 852380327, 754155824, 253977477, 398475928, 820516988, 163974713, 549750579, 412971, 719634811, 393840455, 314703840, 696860953, 594400621, 866418830, 828014154, 129336949, 372585896, 456350758, 749667964, 462587336, 435137061, 767108962, 226315636, 203851283, 544354527, 733916501, 199732452, 120626157, 237416057, 600510253, 86730768, 777557914, 692695157, 383083901, 804023842, 15669631, 594305820, 227281510, 289052270, 648958391, 388474133, 31913100, 958660890, 170221357, 492211667, 729349707, 603690449, 170026595, 138318313, 519876888, 333639329, 873802204, 707805181, 643675198, 171723182, 890683491, 147050288, 669587736, 589130674, 144349926, 243663354, 852482294, 296608995, 432428058, 237407454, 32517192, 635056790, 376944045, 448905734, 917311483, 392521316, 299826672, 21640859, 838135206, 442350661, 521220343, 207954428, 223882185, 398414779, 711515288, 908539883, 97838555, 630321250, 156663361, 170075232, 707122488, 716253405, 489337326, 384854584, 393857359, 143101819, 160200868, 779587816, 259065868, 296022763, 351621488, 294776518, 300951699, 743857465, 676342387, 747451625, 261386162, 685221471, 58429860, 413593, 911068417, 583632323, 568452195, 798223564, 135642070, 356576562, 67966615, 996917117, 978856663, 958040149, 547445198, 183230034, 590099110, 163777625, 966826322, 686649742, 25428308, 322511999, 114419648, 111695464, 222314769, 156536958, 751118596, 4551390, 121758830, 181224440, 603964680, 309513915, 851883680, 309714565, 431121583, 785289825, 715046375, 298440259, 45508951, 966616998, 517947879, 995663644, 401869037, 32187052, 724796137, 688128075, 421388771, 506332645, 709894521, 389271581, 965266996, 635969199, 845011748, 872553488, 769342386, 758268713, 280934062, 880927849, 461673873, 200359674, 22017331, 64523030, 864040507, 603641095, 386279727, 467929265, 359827068, 338128772, 312638418, 429855045, 721796540, 143035380, 446543469, 972204076, 86418298, 3189840, 321049665, 55815045, 481416708, 751517683, 999365301, 185329106, 123419621, 774545175, 366558793, 3488036, 340444043, 313285732, 342566486, 424873821, 514145276, 673116611, 881024467, 799080934, 513399522, 727439242, 592266265, 208477711, 241984417, 916694599, 16618260, 57622143, 472048604, 626418391, 54156193, 5511829, 825989386, 448402147, 506800360, 977847144, 471930673, 105642692, 542603200, 260317057, 835133423, 702291764, 136803884, 748784799, 76233387, 191332382, 827127316, 162906935, 366144857, 191073079, 784910103, 576825860, 808672513, 385715788, 359954598, 242999417, 423791684, 904578146, 441202408, 162622466, 107617854, 487554583, 608537327, 313333204, 778866666, 441003935, 178997205, 476941112, 147876075, 588378901, 975116970, 686964312, 38233493, 819133315, 900585070, 712918311, 755991936, 379093792, 903815087, 859725013, 553105973, 474987791, 886569467, 587905715, 360069142, 180367408, 551071538, 734713406, 550072952, 84879640, 382042001, 255481935, 309287648, 942943942, 303417099, 880744449, 321324057, 321034631, 118393431, 623561523, 980118197, 919779691, 959178119, 420031845, 575012286, 628700309, 254546857, 206294832, 736717052, 446020763, 614761782, 861879729, 483117572, 85488303, 922383391, 902403616, 290889227, 611110797, 570622554, 439819115, 412533424, 963495740, 136881224, 536927127, 392610327, 528565772, 882384187, 218119795, 119961307, 224644614, 629783727, 976257296, 527191219, 693911447, 163801059, 82815351, 940916058, 205704377, 877517813, 855713189, 837181473, 524369802, 723240004, 154769539, 110890690, 702857841, 752425996, 899669079, 669345889, 290892669, 350038065, 815306628, 220885455, 517754143, 796365986, 415074658, 591489246, 644937610, 750227623, 310014698, 3799714, 832088567, 980428244, 889981396, 822586080, 227824576, 465622196, 800311253, 331734208, 106574937, 274162325, 824301290, 1835118, 739064111, 902864214, 429364152, 218495192, 624961642, 715085249, 772314919, 734263004, 887913120, 318793602, 166776168, 668276740, 839010037, 324538920, 65832298, 448185781, 708621267, 369673537, 975631461, 475834369, 929638675, 900021713, 57368509, 408240484, 459986069, 844320513, 329581296, 120016438, 380990898, 881280478, 315900510, 940618586, 846135032, 835091802, 117560157, 537790568, 169118230, 203384799, 869705731, 799512387, 9534932, 164951918, 790493840, 454293166, 240501067, 63741695, 725244339, 907420793, 220634775, 941895802, 250213571, 42545637, 135268229, 842516695, 236541355, 265365703, 894245401, 848282840, 164295002, 707635242, 430294011, 317054699, 961543529, 595746135, 483262361, 589501093, 594428694, 854539940, 378768910, 895479120, 839667536, 839592614, 859076352, 573045495, 707163360, 192668236, 55560496, 51507544, 483493117, 689015321, 236389441, 310271394, 352657922, 451264865, 176526045, 947527111, 584900678, 448594410, 478526962, 278248253, 74334977, 204479540, 685355613, 769674202, 937823337, 108511004, 198887236, 509936266, 393828843, 569162281, 660923510, 795472432, 895850712, 73058654, 74736878, 190589952, 384290001, 129335026, 460214583, 548103626, 832977843, 380790983, 112032071, 955224244, 744980248, 267359235, 312410589, 70528632, 650537222, 256328172, 389313278, 838157007, 183633587, 521918859, 916177760, 139848601, 901192142, 71838119, 385044197, 107494261, 399127384, 30123482, 226649253, 727853793, 375564779, 67792461, 445083521, 882574823, 130074615, 226308981, 986234860, 494570672, 477943353, 383760637, 275984351, 349611422, 279740231, 172965778, 819851367, 508874177, 461122862, 444383207, 383542552, 851910461, 741139313, 348210655, 843348882, 231134645, 744796088, 181448410, 760826522, 811775143, 171454991, 163812019, 500254303, 90425348, 638277257, 583408529, 444578171, 356213114, 795973734, 800068027, 710130036, 389550393, 343886511, 906501326, 40873887, 261598142, 724781048, 407892149, 211329468, 829180096, 808049789, 933308964, 860141047, 867250873, 665146845, 730141821, 965757827, 526533767, 636216351, 457458845, 4267512, 995653347, 359102474, 470113493, 442823081, 147251351, 736751682, 103395767, 585134220, 292696197, 973943366, 557603046, 355555156, 911983632, 887618241, 380663708, 801391359, 617860799, 146925233, 341479408, 981732516, 894897643, 751093169, 302234904, 998414538, 197125592, 563574655, 53910454, 944820818, 553638726, 575240474, 965125566, 946446614, 860339167, 590183270, 211689349, 672736597, 949342692, 411137964, 174726978, 546637692, 133054615, 368800110, 680511154, 473037645, 183404082, 305451347, 682217276, 327282291, 785415938, 793763241, 165793750, 428411379, 779392705, 554339971, 66541851, 160356620, 685408950)
+  AND country NOT IN ('cagjgbfe', 'ecfcgbbe', 'bfffcgjj', 'ficdgdbb', 'ifjedeeh', 'hieaidej', 'chddchia', 'ajjhijaf', 'ggicijjg', 'hhheijjg', 'iabhjdhc', 'jhjccedb', 'iadbdhgg', 'bcijjicg', 'fgjhgfbh', 'ddaieahi', 'faahghhe', 'chhcicag', 'jeefccia', 'ffjhcjef', 'cjaceaaf', 'hcdhafdd', 'ibigihda', 'jgjbbjbd', 'idcjhjfe', 'figjbhfi', 'fdbcccce', 'feigicdg', 'ehcidbja', 'beffgiii', 'dhachgdc', 'abjaeheh', 'ddbgeefi', 'hidfdhfa', 'adajaggh', 'iicfgjai', 'eibhiaib', 'heggdced', 'chicfdgj', 'fdiabbjg', 'agdcihbe', 'hcdaidhf', 'daifhjfj', 'ghcgfgdh', 'ihjjfdia', 'cgfhhjbe', 'fgdbaifi', 'fafhdjeh', 'aeficfhb', 'cieiggab', 'dehiifjj', 'aaaajaab', 'gidbcjdg', 'ghgedbhj', 'fagbaifd', 'dchdiacb', 'bjciccid', 'aedaddje', 'bjafhcdc', 'adbjjfaj', 'chjeecfj', 'eicabcgf', 'cjgbgdcb', 'abcgbjjb', 'igajcbae', 'ehfgefcb', 'bdcdehgh', 'cbebhaej', 'ibddbccg', 'ejjdeiae', 'cichghgi', 'jbgbddjb', 'afbccdgh', 'dgaajfig', 'hhjhejab', 'ihjdeihh', 'eaejdgca', 'hghbefei', 'fjdaaigc', 'fgjeibce', 'fcidfhcd', 'ibihfbge', 'bhheceai', 'fhacicda', 'gjcijieh', 'beedchej', 'bejcfjha', 'fccaddee', 'dddeedji', 'ahafgjdf', 'bafehahc', 'fabjdjii', 'hehbgbga', 'cjdfbjei', 'gjhibhfi', 'ibfcgeid', 'ajbeigaa', 'geihdfdc', 'biiedjfa', 'fajbjadf', 'gajjgbhe', 'aiefghhf', 'jddgcbeg', 'idbajjgg', 'aggaahfh', 'aaghcefd', 'hcfgbgda', 'jfghbdfh', 'iccibbfi', 'higjahfh', 'eggafggc', 'cdigfdic', 'iiacaffc', 'cdhbgijc', 'bhheafef', 'caigihaj', 'bebejaji', 'fhfgicfi', 'cjdcabfh', 'cfjdaegf', 'bjafgcdc', 'gchjacfa', 'bbgijaah', 'hchgcgia', 'cadahdfi', 'hffgbiah', 'djachejg', 'dgghbgab', 'gjbfebcc', 'hhdbahgf', 'jfagcddh', 'ieijgjgi', 'agfafabc', 'fjfagffd', 'ejeiaaga', 'fahafahf', 'bdhdicbe', 'ccjjdgba', 'eghhcgjc', 'fgbjeihj', 'acfdfeac', 'ciiegdih', 'gjdhfdfi', 'aigihbda', 'hdfedbhd', 'chdfgbac', 'fgiacfhg', 'fdjhhdhg', 'faechcef', 'iaagbdij', 'aahhgbgh', 'jeajhdbc', 'cdbcedga', 'iibdbeih', 'chgafeic', 'afgijcje', 'ieabebfi', 'fiecbehd', 'cfgabjfe', 'hfdaeiff', 'ahhehfdb', 'dciebhjh', 'ihijccdh', 'baccfhha', 'bebjcfcg', 'hgdfeiad', 'achcbcai', 'gaiehhic', 'ccbejaha', 'aahcfeee', 'jgafbijd', 'chedceaa', 'ahcigjih', 'egaiaedh', 'gigiiicf', 'cehahjde', 'jddjdejj', 'ahjjddfa', 'jeigdhdj', 'eejihffa', 'gafjhbii', 'ffdccjih', 'hiffjhid', 'jiidbfie', 'daaejaec', 'fchcdjdb', 'bbjiiffj', 'efcgbbgf', 'efedacee', 'bchbgcae', 'idiaebfc', 'jadjifaf', 'bjbfacaj', 'gbcdeafd', 'fghadejd', 'eccjcddi', 'bbhdgdef', 'jdhchjfi', 'dcghffij', 'fhbaiiia', 'iccfeejg', 'jhifbiia', 'cdbeaadj', 'idhecdgi', 'jcdihbgi', 'ccjaagaj', 'eijcfdhh', 'iffdgehd', 'ifiddcbd', 'bgchgiea', 'cdaccgcb', 'djfgigii', 'djhgdfij', 'gijbdbid', 'bjibaidd', 'ecahagjg', 'djbheggd', 'ihggcedc', 'dicfdagc', 'jfefaijj', 'ddiecbcd', 'fgdfhjjc', 'ecbddeej', 'hiigcdgi', 'cfgcedbj', 'gbbdcahi', 'ieheffah', 'biagjjdh', 'fchfbebi', 'dadhdggb', 'fjeihjid', 'hghbadca', 'gjbiagbf', 'fhjiaddf', 'eiacahec', 'jdedjibi', 'cejgacie', 'defgbbjc', 'ahgiidib', 'ehhihgeb', 'eahiabgd', 'hcaibaja', 'jifgdbea', 'cfdhjahg', 'iehcifac', 'hhccjefg', 'hhhccfih', 'fcciaehi', 'iifbaabe', 'ddeabaga', 'hfiadjfj', 'jceiiedb', 'jaddadbb', 'ffegdbid', 'hbchfdji', 'dbbhgjij', 'gcbddggj', 'ciicbace', 'gbdgagfi', 'gdbbccbd', 'dbcbebja', 'hdhdhaec', 'efhidfeb', 'chedfaab', 'hfbgadea', 'cbjadcce', 'ajihjcdj', 'beaheedh', 'egheadfd', 'bdhbbfjh', 'bdaieaeg', 'igefgiig', 'iaidbjii', 'aedgijbj', 'hbhefeda', 'jcdefgfg', 'edafgeah', 'ajdjfija', 'gigbjedb', 'idgiaceg', 'jajbfebd', 'gcabccij', 'fhbhgacj', 'ihefifjh', 'dgjcfcgg', 'jhjagcge', 'gahjceae', 'bfgcdibd', 'ciabjjib', 'abgfbhhg', 'jhhafdee', 'cbbdbiab', 'bdehaafg', 'fjegdafh', 'heeeciij', 'cabjgejh', 'ehhggedg', 'aafeafgb', 'gagabeba', 'jdajhhhb', 'bghjbbfh', 'hjaadfca', 'ccfdiaif', 'dedffhbh', 'fjjhaaea', 'jiebjgfd', 'fbeidihf', 'dhfdjaje', 'bgbhbabe', 'ciceehfe', 'ggbibfci', 'acibhiie', 'bgcfafha', 'cdidffij', 'ggcadhga', 'bgiidcih', 'faiafgjg', 'gigffbda', 'babcaiij', 'idhedcfj', 'ffiaddic', 'jadfeaci', 'cabeafje', 'deegjiba', 'dbjbbbce', 'dfihfjdg', 'gceagagj', 'ffhgdahi', 'hffbgffg', 'eajebfij', 'fhhhhadi', 'hifjdjgj', 'agfbigdj', 'ahdjbhhb', 'cfcacjid', 'ajjbcggd', 'fdbfdeaj', 'jeaehjhh', 'abhacgeb', 'diifcdaj', 'iiidfdig', 'jecejjae', 'abefcjcj', 'ehifagbc', 'dfegfceb', 'jcfejhdd', 'jgejddhh', 'abehbife', 'afbgaejd', 'gcibedic', 'ggffdgdi', 'jdcdjehc', 'cffaicie', 'cadhbcef', 'fhbjgcgj', 'eihgebec', 'acjdghcg', 'igcjigae', 'affdchbf', 'hehcfafj', 'ijbfbehb', 'ebgejfhe', 'jfiibiid', 'ggebfgcj', 'bcefaddh', 'jjggidhj', 'gdccdjah', 'edcibfib', 'ggidfeah', 'eigfeaec', 'iebbgbih', 'cdhdeejf', 'ejcjhcad', 'geajaaae', 'bdcdddee', 'ihgcdehh', 'ifcacaib', 'ffcgfjfa', 'hejefdai', 'fgjcbdej', 'dhaggffe', 'dhhijbae', 'fjghhdhg', 'bbffbcbi', 'aedhcdbb', 'iiichdja', 'jafiahjd', 'jhccejfe', 'eahdjede', 'cefjffig', 'gfafedeh', 'bgagjjhb', 'jdccecjd', 'gjcigbif', 'jagaghha', 'iehcdaaa', 'ehihfddb', 'gbicbjfe', 'gaaeggje', 'cajcbdeg', 'bcaeebad', 'gafbgdgd', 'gcejfhca', 'hjiafbjd', 'ebidaded', 'eieebfch', 'dcbjeaab', 'fjajabhb', 'fahafajf', 'bdgjfjjf', 'edhcjagf', 'chifddca', 'fbjgccbe', 'hijhebag', 'jdgcdhai', 'ieiiabja', 'ahehggie', 'iabafcia', 'adjdaaaj', 'hfgcdgbf', 'adeebhab', 'ejbdbidc', 'eeaghgcj', 'dgadajeb', 'gageabii', 'jihdhhdd', 'gcjabadc', 'ajddggde', 'fhcijhhc', 'cefjdddi', 'agijifga', 'adifaacg', 'gbjhdbai', 'bccdfceb', 'hcbbjeef', 'dggefbge', 'abgjdebb', 'cdhcdjdc', 'ebgjgdbh', 'hgifegaa', 'ejddbghe', 'abeadiib', 'ggjgefje', 'dhfdcffd', 'jigdajeh', 'bdfjific', 'djadjhbi', 'fhegaicc', 'gjibceid', 'gbddjfcd', 'ajhhibhe', 'afggbcib', 'ajiachjj', 'jchahdja', 'jbfaejgd', 'cecgachg', 'gdchbcfb', 'gjjdbghi', 'eaijgacf', 'ihedejcc', 'abcgjbgf', 'fbjhhdea', 'jbdaegha', 'cebjbdee', 'jhhfcddd', 'egebecbe', 'idddfafj', 'hegcagaj', 'bacegjae', 'adadejgj', 'cijjabhe', 'fefjgiia', 'hfcdadei', 'eiigbdjc', 'djjbjbbf', 'ccejgjgd', 'dfbcjgdb', 'idbdiefj', 'gjaijjjj', 'aggcefde', 'bgjegidc', 'egaafhhb', 'aidffieg', 'gfccghfa', 'chdjjcjb', 'ifgaefca', 'hjgihide', 'fcjajbch', 'aahicchg', 'chbcbdee', 'ffbcghga', 'daahehei', 'bfgfdhdd', 'hajcdaic', 'hfbaiabb', 'biaihdjd', 'eibaedhb', 'ijeeagbh', 'gaecegge', 'bagfbfhf', 'ibgffjab', 'figicaaf', 'aijccbhe', 'ghfifeji', 'jjhcdica', 'faheeieg', 'eggiijja', 'dfhecacg', 'abfhdabg', 'diabhdga', 'chghaede', 'bjidcead', 'jfgeedgj', 'heebibaj', 'hedgadfd', 'fhejfggb', 'cehdcghi', 'fbidiaed', 'aiddedhj', 'bcjcjige', 'ijihbedc', 'cghgeafc', 'eeeegahc', 'eddiicei', 'chijacbd', 'ahdaacai', 'fgbeihij', 'gidadefi', 'jgfcdbfe', 'ejjjcjca', 'cbhafadd', 'agafbaih', 'gjfcedea', 'fffdbfah', 'iaheicgi', 'jgggjhbg', 'ffbeiggf', 'edeeaibe', 'hgegahig', 'hiddhahh', 'eiegbhag', 'eeedjcjd', 'dbadijac', 'bahaieje', 'ibhifigf', 'cdiideii', 'aebbdjeb', 'hhfahbej', 'gcjcfibe', 'cgbjicbg', 'hghjedih', 'gffgjeid', 'ffidfgaj', 'bcecagee', 'hjcbhcgj', 'ebbbcdfg', 'bacfejea', 'dhedcbhe', 'fhgdffbi', 'jjggjdfe', 'jdjgbffc', 'bijhjibj', 'jigbhajc', 'jgjacgei', 'cfchbehd', 'ibjcfifj', 'jgdcajdc', 'dhajfhca', 'jgafefih', 'cjfciiah', 'gahddfag', 'faffjddg', 'djfijjce', 'fgiefhha', 'bacdihbh', 'chcfgjbg', 'fhbahdja', 'eibijbbj', 'jfcfgbgc', 'ihgaajag', 'cdgcaigj', 'cdhbcggh', 'jeajidhg', 'dhhedcba', 'ifeiagjh', 'jjabcadf', 'jchbeffh', 'bbfejaaf', 'fjbbcajj', 'dgdgbcjf', 'idhffdai', 'fceffiie', 'dhciibeh', 'bbeacejd', 'dcbbahdb', 'fhcagigj', 'bacbiejf', 'jjbeggia', 'bebbeiej', 'ahgaabjf', 'ejfjcidd', 'gjdiiddf', 'egabggeg', 'fijadchi', 'bighjfce', 'gdihiahf', 'ahaiegba', 'gfiabhab', 'efabbhhc', 'ihajbjia', 'idebceje', 'eibfccjb', 'ggeeejjd', 'jeidieab', 'ceabgfhf', 'gijfgggh', 'eibgfdjb', 'gijdgacg', 'ffgiibdb', 'gahdhbab', 'edhfejbg', 'aaeeaedj', 'dhihdcdg', 'hhbegeea', 'dfbajbch', 'egggccag', 'bfghdcbh', 'ggjgfgfc', 'jdgjahed', 'aejiecgg', 'chdifiaf', 'igaedibh', 'cjfffidg', 'fgbgfjge', 'hfjcajeg', 'fihbibjd', 'aejbgghg', 'gcjdgcdh', 'bgfejdai', 'cgciigjd', 'ecgbjggi', 'gjahdfae', 'hijbbidb', 'jijfdegg', 'dabeagic', 'bgbgafje', 'agbfjfch', 'facdhejd', 'iicdhabe', 'icchibgg', 'jjgbehdh', 'afgcdegh', 'chdjfefb', 'jccceahe', 'iaifajia', 'ehajcefa', 'jaecgaic', 'hhfhbfdb', 'efhdeiaa', 'cfdfhaeh', 'biieaige', 'hcceijda', 'gaeeeiaj', 'iejfaiae', 'fhedjdef', 'cccccgcd', 'cgefbidi', 'cjcaaceh', 'cjdbafej', 'cdhbbefa', 'cfdjaefb', 'fieaiedf', 'cagijjdh', 'ggdfabfa', 'hfcjdjbf', 'bbdcfjhh', 'hggcjhfh', 'iebbgeef', 'jeegahbi', 'ibhgggbc', 'dddjabdb', 'bacecbdi', 'ddbdbfeb', 'heiigcgg', 'diaggcdd', 'icfibfcc', 'fiejcccg', 'idcgcgbf', 'jefedafd', 'effhceff', 'gjiafgfa', 'gcebdbda', 'ffjbcdcc', 'cfgjbgac', 'gbigjajb', 'icaeadff', 'hidbjcjc', 'jdijcfdf', 'hfjhibbe', 'iebjfjjg', 'hifgifbg', 'ficjhjhg', 'dbdiahhf', 'idjghfeh', 'eddbjcfg', 'gadjjeag', 'hdccgbea', 'ffeefdag', 'daheaadb', 'dcaeefcd', 'ajdfdcch', 'bgibfjca', 'ehcgceje', 'icfgjgje', 'iigceaic', 'jdcediae', 'gafjfgfd', 'ceadbgha', 'jfbghhgf', 'efiffiif', 'gbgegiia', 'eiaifbie', 'hfibhhaa', 'agcgbffi', 'jfhjfegg', 'gfbigbae', 'ijdfcajj', 'egfgbiig', 'ejaccedc', 'ebhcbihi', 'edaijaha', 'aibhicgf', 'aiebjiai', 'gajfebaf', 'ijbfadda', 'jbafhcci', 'aibdcbii', 'aiadbdjd', 'dadcdahb', 'fieciahg', 'icgiejad', 'hidadbgd', 'chihaegc', 'eibfbihg', 'hiechadj', 'efegbccg', 'dcijjefc', 'ccahhehi', 'acddegdf', 'chbcigga', 'gbfghabg', 'gbeafgha', 'bhiaaefh', 'bfdfgcad', 'ciigbcjb', 'adigcbed', 'chbghedg', 'ibighacc', 'jjjdhcfe', 'ebgbgcii', 'hffdabjj', 'deahicai', 'fbdaiifi', 'ecjcacdh', 'ceefhjdb', 'agagcihd', 'beajafdc', 'ehfcheej', 'cfaidiib', 'gggejgaj', 'bajcgagg', 'fgjcgecj', 'bchaijdi', 'bgbbhheh', 'agebhfhg', 'jbbfehce', 'jechbihi', 'chaeebfi', 'aebbcgfg', 'aaeicgec', 'gbbhcadc', 'iaeefdja', 'dfehafdi', 'gcjhbefg', 'abeiaeii', 'haigbddg', 'ihifhbge', 'jgecjjci', 'cahicjge', 'jieadhdd', 'iechjhfi', 'aeigdihb', 'cdbehicf', 'eheeejgc', 'aedcdjaj', 'abhjfifg', 'ghggjcba', 'acfhgfid', 'hdaeciif', 'cheacabd', 'dcdejdii', 'fgddgdgh', 'iacchaai', 'febbcbch', 'beeifhbb', 'ecfbecej', 'efihfcaj', 'fbcjhdej', 'cieahghh', 'iibfhabb', 'jjfedaea', 'cbfaabed', 'gicjaaei', 'faicffdd', 'hfidfchb', 'geiecceg', 'ddfcgdfg', 'hfjeghbe', 'jbbfidea', 'fddieafb', 'bhaifefd', 'hiecacib', 'ifbcdfhg', 'aibafigi', 'fcifdcbf', 'icjgbfbc', 'fdebfbeh', 'ahaigddi', 'gijijbbf', 'hgebifib', 'adjibbae', 'fcafbhhc', 'ccfabjgh', 'aigigfaj', 'ddhihhei', 'dadfdfaf', 'fafeheia', 'eebgidhf', 'eaiejbia', 'fehcgadj', 'jghgdhaa', 'ecffbcjh', 'bcibghbi', 'dbjffdbj', 'cjhadjgi', 'debhechi', 'abidgeje', 'gifjcjhb', 'jdgfjcaj', 'fjfdfahf', 'bgeeeagf', 'ifejdfhi', 'diceacic', 'jgcedjhb', 'jgddcfga', 'ehjiiicc', 'cidgibbj', 'aeafgjef', 'ghhibjbb', 'hdbiiagh', 'jheiggfg', 'eichieji', 'dbiheeja', 'jbhfhdjj', 'ajbhjjii', 'eddhbfha', 'fbaafjfc', 'ccbcgiab', 'dccdjbae', 'chgadcie', 'hdijiada', 'ajhfhfhd', 'cehgijge', 'jhjdhhhh', 'hdgfjhaf', 'ibafbhhf', 'dgjfjifg', 'ffdfgiag', 'dccgjjgj', 'bdecghjj', 'jiaahahd', 'jfchdeji', 'jdaggdeg', 'djdcedbh', 'headahcb', 'hejggfeb', 'jjfddbaj', 'gbecijbi', 'gajdhcia', 'ffdiadea', 'jfihiacc', 'gagigeie', 'egjdadhh', 'cibeefgg', 'ajfiecfj', 'daajbgbf', 'jfagfchd', 'icdfjcjj', 'cbfacbab', 'fgejfdgi', 'jfdgcedi', 'eeiacbdh', 'hgchjchc', 'cfhighij', 'jifgdjad', 'jjaiadbj', 'ddcgdhfg', 'jiggedhc', 'ddjjdibf', 'hieiiabj', 'ebgcebie', 'bffbibdd', 'fjhfchfg', 'haggcdbe', 'bcaaegba', 'dhfbcjaa', 'jjffcich', 'dhjhfaid', 'jjbjbgac', 'fgddeiii', 'gbicbjjd', 'daehcgdc', 'highhadi', 'adahadif', 'dibcdjah', 'dadjgiia', 'fabcjhef', 'aceajice', 'geajcefh', 'gajgcdih', 'adheaegf', 'bbgjjgfb', 'cdjicbdg', 'fjdcigbb', 'habajiji', 'eidhjibi', 'aadjeggf', 'ccgchgge', 'degjafde', 'cdfjiife', 'ahhdjeej', 'cjbgggie', 'eafchfaj', 'ccfbjchh', 'hfcjafdd', 'bgabacai', 'dgfjggef', 'fedicefh', 'cdeaebcc', 'bfbhhcci', 'hcdbhggh', 'gihgbhjg', 'chggdabj', 'daggbgag', 'eehaeadb', 'dcfdajff', 'dhfgjibh', 'dfehhgce', 'dbghbhha', 'ibgdegbd', 'jbcgjffh', 'ichebgag', 'ehhhghfa', 'hejjeecb', 'fbjgedbe', 'ddfbccga', 'gfbbebde', 'ahcgcjbg', 'hidjciji', 'eheaefjf', 'gefhijgb', 'idhijjjc', 'dighafac', 'idbgjhdb', 'bdjiifhj', 'abjhjfab', 'jjgahaai', 'ceachbjd', 'hiibefab', 'eegajdac', 'ajbhcidf', 'fdfbbcbh', 'ecjbidei', 'dfabdadc', 'djbbfcgd', 'ecbghiab', 'egificgj', 'aibdaggc', 'adbdcbia', 'gfejeiie', 'fjhcgfhd', 'jdidhhcg', 'icafiijb', 'ibjaeihb', 'aijeigbe', 'cjjaedaa', 'fdaigdaf', 'ccidfhea', 'bjiedibc', 'fhejahgj', 'cdbfgfgh', 'bafffhee', 'bbeebbjc', 'hdieefdf', 'aidbhfid', 'bahfbfid', 'jdfceihd', 'jgbiifbi', 'bhbcfcji', 'egidbjih', 'ghfaebbg', 'hghibicf', 'bddgidgg', 'heddhhdb', 'ihdgiigd', 'fdcicggh', 'ejifiibe', 'acecaiih', 'hgfbgfig', 'jagfdgha', 'gbcgihab', 'dfghghdi', 'idjjihbb', 'gjbiafje', 'jgjhjbdf', 'hdgifjab', 'dfaaiagi', 'cggideci', 'bjghhhef', 'ifcjifee', 'fggiibcc', 'ifeijchi', 'acjcfejd', 'bigcigef', 'becbdhgj', 'dhbdebfc', 'ijgdcgeb', 'eigfabah', 'gghahdjd', 'jcejeagg', 'jceggjha', 'aefhjcbh', 'gaiibefc', 'bffciaia', 'bbadjdde', 'jjgfehde', 'gighhidf', 'hiebedce', 'ceihdcjg', 'fihfibij', 'abgcfged', 'hbhidbfg', 'gjidggdh', 'dajejhca', 'dfcbaaif', 'eaffhche', 'ajciafgi', 'bejeijce', 'gaijaiga', 'cgbjhiih', 'jcgegdhh', 'bjiabfdc', 'aedajgij', 'gjcghgfi', 'jfccdaha', 'ddijhffc', 'hibdeecf', 'hfjageed', 'heeddjii', 'jjacefhc', 'iddfbcbb', 'iijabhei', 'jchgcahg', 'cgfebgbh', 'ideeagei', 'addfdedf', 'caciigbi', 'gagfabid', 'diabhdjc', 'agdjbdbj', 'dicgdgeb', 'gigdcchf', 'ijefheeb', 'babjcbcc', 'jgbichij', 'deidejai', 'egaedjdd', 'dcajejij', 'hhhjjhff', 'dccjfaef', 'ddijechi', 'gbghcddf', 'eeaidcdh', 'jcfafhid', 'fhbcgcfj', 'egiefaig', 'gbddbffg', 'eagighea', 'bifieefh', 'fafbfbfe', 'ahiifjja', 'fgbbfajh', 'iafeigch', 'ceeedbaa', 'gibdfdfh', 'acdhdcgj', 'ijhffcdd', 'gibcbhed', 'hjbjbcbc', 'bchhecgg', 'ibicbagc', 'jgbjifjc', 'ehfdjggg', 'ibeaahfe', 'abfddbac', 'ejcegegb', 'ieegjjej', 'abahhjfc', 'ihfghijj', 'dbjaegid', 'egbiccfd', 'aeeihacg', 'dhgjdcdj', 'figgdeid', 'adbbfbfj', 'gbjiiaji', 'agdhebha', 'jhciahaf', 'jghdgfch', 'gcebeijc', 'bjajgiaj', 'ebgjdjdh', 'dddecfij', 'bbfhfjdi', 'hdhabhdh', 'dfaffgcg', 'dcbdcdii', 'iahihfeh', 'jhjhfagh', 'jeedcffh', 'cacjhadi', 'fcibacgj', 'hffcdbhh', 'eghbcbdi', 'hhidgecb', 'hcihcahg', 'cbhdjgdj', 'idjdegda', 'abcgihgh', 'bdjhaigi', 'haejaiia', 'hdbcdedh', 'bbihjiaf', 'hecdgcaj', 'aihhfccb', 'jaiabbea', 'aabicjje', 'jijhigbj', 'ggdhhifi', 'idhhcgch', 'afdcccfh', 'cdfichbe', 'gaibehfb', 'deebjjfd', 'jaebbdda', 'cbghgiee', 'ahhhihhc', 'hjjdbcjd', 'hbejjdjg', 'bebeggfa', 'jghhhihd', 'fhjhgadi', 'edghhcaa', 'gagdijfh', 'afaeibah', 'aeccjhdc', 'degiigaa', 'abidacha', 'bedfgfbf', 'gcagegga', 'jcjaiahc', 'bbiiddbj', 'beicaadf', 'gafedjbf', 'ihjihbbe', 'bicdeiej', 'dffdfedb', 'cibgfebi', 'ihchjhib', 'caifiaai', 'gfbadjea', 'bachgfaj', 'ehffghah', 'dgaijgjg', 'jdabgajf', 'aiaffjaf', 'bhbhgfhe', 'jfjeabbf', 'jigcihhh', 'ihdchhcf', 'fadgajai', 'cdbbaigj', 'ifdgicjd', 'fajahcfa', 'jdfebjjh', 'hjcfefhh', 'ijhjhbbf', 'djhgcdcf', 'bffhicbe', 'jgjgefed', 'gfdhiege', 'ceajjiaa', 'ahiidbeb', 'afhgcbba', 'dgajebjg', 'ejjhdfdi', 'fedebdci', 'jfadfjif', 'agebjcdf', 'cehgaaij', 'icdbjcgd', 'iihhdahg', 'jfhdiegb', 'dgdhdhba', 'eegeihih', 'bjcgbjhd', 'dbaddjbh', 'igcdeaci', 'ggefehec', 'jchcfdai', 'hjdbgihb', 'chdhgfbe', 'ceafabbb', 'edejcgda', 'bjbgbabi', 'jicchhgj', 'hbjgadcg', 'fiddfefj', 'cfiifdfd', 'jbjidfhc', 'icgjcibj', 'bdjgccha', 'ciehiajb', 'hffhacjd', 'gjbeeafc', 'diddhjhf', 'hjfjjfhj', 'ifecjeff', 'hagbbehc', 'eiheichd', 'cagdecff', 'bghhhafb', 'gjcfhgdc', 'iceddfda', 'aheheceb', 'jdihbhch', 'aefgjcji', 'beccidih', 'bciagcfb', 'fjfbfcda', 'ghddbdai', 'bfiaghfa', 'dfgaeedd', 'gcddcjeh', 'hhfeddja', 'gdgfaeih', 'hggjdecf', 'bbibajgg', 'ahajhfge', 'degaihfi', 'chdjfeje', 'iiahigid', 'aaihiajb', 'gjdbfgih', 'fjiajfda', 'faafbfea', 'dfcaaggb', 'dgjcajgi', 'djejfeba', 'bdegiiib', 'adchcbjb', 'aebjbbjc', 'hccecfci', 'iaighbjf', 'aejhdegh', 'cjigaeif', 'iacejcdg', 'chiajfcf', 'cdjfeeef', 'cgcghhhi', 'biegbccg', 'febccaac', 'habbiafj', 'jjgfcfci', 'bcigihdb', 'fihibijh', 'cjfihaef', 'eejejgbf', 'bibehegf', 'ghdbaghc', 'fbfbgabf', 'ajhbdaaj', 'bjcbedae', 'bdhgcejc', 'gadedjje', 'jahciifi', 'jhdacibf', 'chfcjhcd', 'ebfiagdh', 'ificfici', 'efgahgah', 'gbaafdba', 'ihejdjgd', 'fjeafgai', 'dgbjdegh', 'cfdcjeba', 'eehchjbi', 'egeihaai', 'icadgfbg', 'bbjfhige', 'fdfcfeah', 'eijhegjh', 'beeijajf', 'jdbecajc', 'cacjfgci', 'ggedfadi', 'jjafhfbi', 'gicdjbgh', 'fjhjjbjj', 'iicieaec', 'bdgdjbah', 'jghaajef', 'aaiiaefi', 'bhdhhcgc', 'cbddgegb', 'ddibjecd', 'baadhegb', 'gedcgffh', 'fcgcfgjb', 'cjggibde', 'effacgae', 'jbachbja', 'fjcdfcie', 'fhebbjeh', 'fgcjcjfi', 'gaccdhcf', 'cjfaejhc', 'hgeegaga', 'hjejeghi', 'eefgebig', 'achebicg', 'adeffjej', 'bcehabha', 'aibcbjfc', 'ebdideef', 'jiecbjgd', 'eaieicjc', 'chdcchdj', 'ddjeaagj', 'fefjbfie', 'ciggjdhe', 'faechbei', 'deiagcic', 'cbhfbbfg', 'agdadgdc', 'cbahcjic', 'bjhcfjha', 'fgadhbdf', 'gbbejhea', 'iebdfbec', 'eijiaeij', 'jjcfgaic', 'ejadfcbg', 'dadccfeb', 'dhjdffib', 'behjgdgj', 'dgdjeghb', 'bdebcfaf', 'hfcgjafc', 'hbggeieg', 'jdiijfje', 'afahebcf', 'fdbchgbd', 'hidccijd', 'edjfcjej', 'gfjfajag', 'dbedgjhi', 'aajagced', 'hccicjec', 'abehejgh', 'ecjedfbh', 'decdgbfe', 'jhgdcfai', 'iacgajgg', 'ggbceegj', 'ajfcjhfd', 'aiccagba', 'ceigjhbi', 'jjifajfe', 'ajfcfjed', 'eidfghga', 'eedfidee', 'fachdbhg', 'baaebgbj', 'aicibbaj', 'gcgdfdag', 'gdcagijj', 'adejcfch', 'gfhcjibh', 'aghfachd', 'efijabif', 'cihfeggb', 'habcajjb', 'fgafgbdf', 'jfgdfjii', 'jfdihahc', 'deafjcai', 'ahfcaefi', 'fgighcgh', 'eegiigcb', 'jbcdgeei', 'bbaahfhc', 'chgcjiii', 'iagfdiea', 'ciiaiaci', 'dicddege', 'igcjbbhf', 'hehcifje', 'hdhefbae', 'edhdhbid', 'aceggddj', 'eeaaaacd', 'jjgidbjg', 'fheiacfj', 'jjdafdac', 'bciccida', 'hdegciba', 'ehehbcda', 'fddjjccc', 'aafdaghe', 'aidegdaf', 'gcifhhfj', 'geggecjf', 'ccbejhhg', 'fafiibaj', 'jaciajec', 'dicachge', 'afacfahj', 'fgeefdgj', 'aghhjeje', 'affccigi', 'iajjicbh', 'fddfffag', 'jgggahab', 'ghhehhbg', 'cedcfbef', 'fcdcjdha', 'jjbdgafh', 'ghfjafab', 'ciaffidd', 'fajgebbb', 'ciciedja', 'cjjggdbe', 'cfagjaef', 'accifjhe', 'fcfcegga', 'iccgjbef', 'fceceidh', 'deicibig', 'ihciejde', 'bgjgbddg', 'cjaccfjf', 'efeaigec', 'jbfdiicj', 'gehbggja', 'jbcfjjjd', 'dcfdiiei', 'djhbfffb', 'ijgdggid', 'chcgeeag', 'chdggcbj', 'faagcfaf', 'ebihjaih', 'iedfifhh', 'aaiiaidd', 'gfeafgbe', 'cgabjifi', 'hjhddcic', 'fcdaibeh', 'aciabhec', 'iafhabei', 'bbijjbeh', 'gejcehaa', 'jadihbje', 'dejgceij', 'fjhehhgf', 'bbbceihf', 'bghagihb', 'dddiefhc', 'eebahgfg')
+GROUP BY user_id;
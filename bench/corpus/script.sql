@@ -0,0 +1,1349 @@
+-- step 0
+SELECT a, b, count(*) AS n FROM db.table_0 WHERE c = 0 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_1 x inner join db.y_1 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 1;
+
+SELECT id FROM db.t_2 UNION ALL SELECT id FROM db.u_2;
+
+SELECT CASE WHEN v > 3 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_3; -- done
+
+-- step 4
+SELECT a, b, count(*) AS n FROM db.table_4 WHERE c = 4 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_5 x inner join db.y_5 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 5;
+
+SELECT id FROM db.t_6 UNION ALL SELECT id FROM db.u_6;
+
+SELECT CASE WHEN v > 7 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_7; -- done
+
+-- step 8
+SELECT a, b, count(*) AS n FROM db.table_8 WHERE c = 8 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_9 x inner join db.y_9 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 9;
+
+SELECT id FROM db.t_10 UNION ALL SELECT id FROM db.u_10;
+
+SELECT CASE WHEN v > 11 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_11; -- done
+
+-- step 12
+SELECT a, b, count(*) AS n FROM db.table_12 WHERE c = 12 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_13 x inner join db.y_13 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 13;
+
+SELECT id FROM db.t_14 UNION ALL SELECT id FROM db.u_14;
+
+SELECT CASE WHEN v > 15 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_15; -- done
+
+-- step 16
+SELECT a, b, count(*) AS n FROM db.table_16 WHERE c = 16 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_17 x inner join db.y_17 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 17;
+
+SELECT id FROM db.t_18 UNION ALL SELECT id FROM db.u_18;
+
+SELECT CASE WHEN v > 19 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_19; -- done
+
+-- step 20
+SELECT a, b, count(*) AS n FROM db.table_20 WHERE c = 20 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_21 x inner join db.y_21 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 21;
+
+SELECT id FROM db.t_22 UNION ALL SELECT id FROM db.u_22;
+
+SELECT CASE WHEN v > 23 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_23; -- done
+
+-- step 24
+SELECT a, b, count(*) AS n FROM db.table_24 WHERE c = 24 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_25 x inner join db.y_25 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 25;
+
+SELECT id FROM db.t_26 UNION ALL SELECT id FROM db.u_26;
+
+SELECT CASE WHEN v > 27 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_27; -- done
+
+-- step 28
+SELECT a, b, count(*) AS n FROM db.table_28 WHERE c = 28 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_29 x inner join db.y_29 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 29;
+
+SELECT id FROM db.t_30 UNION ALL SELECT id FROM db.u_30;
+
+SELECT CASE WHEN v > 31 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_31; -- done
+
+-- step 32
+SELECT a, b, count(*) AS n FROM db.table_32 WHERE c = 32 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_33 x inner join db.y_33 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 33;
+
+SELECT id FROM db.t_34 UNION ALL SELECT id FROM db.u_34;
+
+SELECT CASE WHEN v > 35 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_35; -- done
+
+-- step 36
+SELECT a, b, count(*) AS n FROM db.table_36 WHERE c = 36 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_37 x inner join db.y_37 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 37;
+
+SELECT id FROM db.t_38 UNION ALL SELECT id FROM db.u_38;
+
+SELECT CASE WHEN v > 39 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_39; -- done
+
+-- step 40
+SELECT a, b, count(*) AS n FROM db.table_40 WHERE c = 40 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_41 x inner join db.y_41 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 41;
+
+SELECT id FROM db.t_42 UNION ALL SELECT id FROM db.u_42;
+
+SELECT CASE WHEN v > 43 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_43; -- done
+
+-- step 44
+SELECT a, b, count(*) AS n FROM db.table_44 WHERE c = 44 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_45 x inner join db.y_45 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 45;
+
+SELECT id FROM db.t_46 UNION ALL SELECT id FROM db.u_46;
+
+SELECT CASE WHEN v > 47 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_47; -- done
+
+-- step 48
+SELECT a, b, count(*) AS n FROM db.table_48 WHERE c = 48 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_49 x inner join db.y_49 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 49;
+
+SELECT id FROM db.t_50 UNION ALL SELECT id FROM db.u_50;
+
+SELECT CASE WHEN v > 51 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_51; -- done
+
+-- step 52
+SELECT a, b, count(*) AS n FROM db.table_52 WHERE c = 52 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_53 x inner join db.y_53 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 53;
+
+SELECT id FROM db.t_54 UNION ALL SELECT id FROM db.u_54;
+
+SELECT CASE WHEN v > 55 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_55; -- done
+
+-- step 56
+SELECT a, b, count(*) AS n FROM db.table_56 WHERE c = 56 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_57 x inner join db.y_57 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 57;
+
+SELECT id FROM db.t_58 UNION ALL SELECT id FROM db.u_58;
+
+SELECT CASE WHEN v > 59 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_59; -- done
+
+-- step 60
+SELECT a, b, count(*) AS n FROM db.table_60 WHERE c = 60 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_61 x inner join db.y_61 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 61;
+
+SELECT id FROM db.t_62 UNION ALL SELECT id FROM db.u_62;
+
+SELECT CASE WHEN v > 63 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_63; -- done
+
+-- step 64
+SELECT a, b, count(*) AS n FROM db.table_64 WHERE c = 64 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_65 x inner join db.y_65 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 65;
+
+SELECT id FROM db.t_66 UNION ALL SELECT id FROM db.u_66;
+
+SELECT CASE WHEN v > 67 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_67; -- done
+
+-- step 68
+SELECT a, b, count(*) AS n FROM db.table_68 WHERE c = 68 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_69 x inner join db.y_69 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 69;
+
+SELECT id FROM db.t_70 UNION ALL SELECT id FROM db.u_70;
+
+SELECT CASE WHEN v > 71 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_71; -- done
+
+-- step 72
+SELECT a, b, count(*) AS n FROM db.table_72 WHERE c = 72 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_73 x inner join db.y_73 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 73;
+
+SELECT id FROM db.t_74 UNION ALL SELECT id FROM db.u_74;
+
+SELECT CASE WHEN v > 75 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_75; -- done
+
+-- step 76
+SELECT a, b, count(*) AS n FROM db.table_76 WHERE c = 76 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_77 x inner join db.y_77 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 77;
+
+SELECT id FROM db.t_78 UNION ALL SELECT id FROM db.u_78;
+
+SELECT CASE WHEN v > 79 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_79; -- done
+
+-- step 80
+SELECT a, b, count(*) AS n FROM db.table_80 WHERE c = 80 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_81 x inner join db.y_81 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 81;
+
+SELECT id FROM db.t_82 UNION ALL SELECT id FROM db.u_82;
+
+SELECT CASE WHEN v > 83 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_83; -- done
+
+-- step 84
+SELECT a, b, count(*) AS n FROM db.table_84 WHERE c = 84 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_85 x inner join db.y_85 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 85;
+
+SELECT id FROM db.t_86 UNION ALL SELECT id FROM db.u_86;
+
+SELECT CASE WHEN v > 87 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_87; -- done
+
+-- step 88
+SELECT a, b, count(*) AS n FROM db.table_88 WHERE c = 88 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_89 x inner join db.y_89 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 89;
+
+SELECT id FROM db.t_90 UNION ALL SELECT id FROM db.u_90;
+
+SELECT CASE WHEN v > 91 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_91; -- done
+
+-- step 92
+SELECT a, b, count(*) AS n FROM db.table_92 WHERE c = 92 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_93 x inner join db.y_93 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 93;
+
+SELECT id FROM db.t_94 UNION ALL SELECT id FROM db.u_94;
+
+SELECT CASE WHEN v > 95 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_95; -- done
+
+-- step 96
+SELECT a, b, count(*) AS n FROM db.table_96 WHERE c = 96 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_97 x inner join db.y_97 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 97;
+
+SELECT id FROM db.t_98 UNION ALL SELECT id FROM db.u_98;
+
+SELECT CASE WHEN v > 99 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_99; -- done
+
+-- step 100
+SELECT a, b, count(*) AS n FROM db.table_100 WHERE c = 100 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_101 x inner join db.y_101 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 101;
+
+SELECT id FROM db.t_102 UNION ALL SELECT id FROM db.u_102;
+
+SELECT CASE WHEN v > 103 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_103; -- done
+
+-- step 104
+SELECT a, b, count(*) AS n FROM db.table_104 WHERE c = 104 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_105 x inner join db.y_105 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 105;
+
+SELECT id FROM db.t_106 UNION ALL SELECT id FROM db.u_106;
+
+SELECT CASE WHEN v > 107 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_107; -- done
+
+-- step 108
+SELECT a, b, count(*) AS n FROM db.table_108 WHERE c = 108 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_109 x inner join db.y_109 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 109;
+
+SELECT id FROM db.t_110 UNION ALL SELECT id FROM db.u_110;
+
+SELECT CASE WHEN v > 111 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_111; -- done
+
+-- step 112
+SELECT a, b, count(*) AS n FROM db.table_112 WHERE c = 112 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_113 x inner join db.y_113 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 113;
+
+SELECT id FROM db.t_114 UNION ALL SELECT id FROM db.u_114;
+
+SELECT CASE WHEN v > 115 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_115; -- done
+
+-- step 116
+SELECT a, b, count(*) AS n FROM db.table_116 WHERE c = 116 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_117 x inner join db.y_117 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 117;
+
+SELECT id FROM db.t_118 UNION ALL SELECT id FROM db.u_118;
+
+SELECT CASE WHEN v > 119 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_119; -- done
+
+-- step 120
+SELECT a, b, count(*) AS n FROM db.table_120 WHERE c = 120 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_121 x inner join db.y_121 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 121;
+
+SELECT id FROM db.t_122 UNION ALL SELECT id FROM db.u_122;
+
+SELECT CASE WHEN v > 123 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_123; -- done
+
+-- step 124
+SELECT a, b, count(*) AS n FROM db.table_124 WHERE c = 124 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_125 x inner join db.y_125 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 125;
+
+SELECT id FROM db.t_126 UNION ALL SELECT id FROM db.u_126;
+
+SELECT CASE WHEN v > 127 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_127; -- done
+
+-- step 128
+SELECT a, b, count(*) AS n FROM db.table_128 WHERE c = 128 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_129 x inner join db.y_129 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 129;
+
+SELECT id FROM db.t_130 UNION ALL SELECT id FROM db.u_130;
+
+SELECT CASE WHEN v > 131 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_131; -- done
+
+-- step 132
+SELECT a, b, count(*) AS n FROM db.table_132 WHERE c = 132 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_133 x inner join db.y_133 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 133;
+
+SELECT id FROM db.t_134 UNION ALL SELECT id FROM db.u_134;
+
+SELECT CASE WHEN v > 135 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_135; -- done
+
+-- step 136
+SELECT a, b, count(*) AS n FROM db.table_136 WHERE c = 136 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_137 x inner join db.y_137 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 137;
+
+SELECT id FROM db.t_138 UNION ALL SELECT id FROM db.u_138;
+
+SELECT CASE WHEN v > 139 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_139; -- done
+
+-- step 140
+SELECT a, b, count(*) AS n FROM db.table_140 WHERE c = 140 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_141 x inner join db.y_141 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 141;
+
+SELECT id FROM db.t_142 UNION ALL SELECT id FROM db.u_142;
+
+SELECT CASE WHEN v > 143 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_143; -- done
+
+-- step 144
+SELECT a, b, count(*) AS n FROM db.table_144 WHERE c = 144 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_145 x inner join db.y_145 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 145;
+
+SELECT id FROM db.t_146 UNION ALL SELECT id FROM db.u_146;
+
+SELECT CASE WHEN v > 147 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_147; -- done
+
+-- step 148
+SELECT a, b, count(*) AS n FROM db.table_148 WHERE c = 148 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_149 x inner join db.y_149 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 149;
+
+SELECT id FROM db.t_150 UNION ALL SELECT id FROM db.u_150;
+
+SELECT CASE WHEN v > 151 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_151; -- done
+
+-- step 152
+SELECT a, b, count(*) AS n FROM db.table_152 WHERE c = 152 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_153 x inner join db.y_153 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 153;
+
+SELECT id FROM db.t_154 UNION ALL SELECT id FROM db.u_154;
+
+SELECT CASE WHEN v > 155 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_155; -- done
+
+-- step 156
+SELECT a, b, count(*) AS n FROM db.table_156 WHERE c = 156 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_157 x inner join db.y_157 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 157;
+
+SELECT id FROM db.t_158 UNION ALL SELECT id FROM db.u_158;
+
+SELECT CASE WHEN v > 159 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_159; -- done
+
+-- step 160
+SELECT a, b, count(*) AS n FROM db.table_160 WHERE c = 160 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_161 x inner join db.y_161 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 161;
+
+SELECT id FROM db.t_162 UNION ALL SELECT id FROM db.u_162;
+
+SELECT CASE WHEN v > 163 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_163; -- done
+
+-- step 164
+SELECT a, b, count(*) AS n FROM db.table_164 WHERE c = 164 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_165 x inner join db.y_165 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 165;
+
+SELECT id FROM db.t_166 UNION ALL SELECT id FROM db.u_166;
+
+SELECT CASE WHEN v > 167 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_167; -- done
+
+-- step 168
+SELECT a, b, count(*) AS n FROM db.table_168 WHERE c = 168 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_169 x inner join db.y_169 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 169;
+
+SELECT id FROM db.t_170 UNION ALL SELECT id FROM db.u_170;
+
+SELECT CASE WHEN v > 171 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_171; -- done
+
+-- step 172
+SELECT a, b, count(*) AS n FROM db.table_172 WHERE c = 172 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_173 x inner join db.y_173 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 173;
+
+SELECT id FROM db.t_174 UNION ALL SELECT id FROM db.u_174;
+
+SELECT CASE WHEN v > 175 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_175; -- done
+
+-- step 176
+SELECT a, b, count(*) AS n FROM db.table_176 WHERE c = 176 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_177 x inner join db.y_177 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 177;
+
+SELECT id FROM db.t_178 UNION ALL SELECT id FROM db.u_178;
+
+SELECT CASE WHEN v > 179 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_179; -- done
+
+-- step 180
+SELECT a, b, count(*) AS n FROM db.table_180 WHERE c = 180 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_181 x inner join db.y_181 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 181;
+
+SELECT id FROM db.t_182 UNION ALL SELECT id FROM db.u_182;
+
+SELECT CASE WHEN v > 183 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_183; -- done
+
+-- step 184
+SELECT a, b, count(*) AS n FROM db.table_184 WHERE c = 184 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_185 x inner join db.y_185 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 185;
+
+SELECT id FROM db.t_186 UNION ALL SELECT id FROM db.u_186;
+
+SELECT CASE WHEN v > 187 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_187; -- done
+
+-- step 188
+SELECT a, b, count(*) AS n FROM db.table_188 WHERE c = 188 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_189 x inner join db.y_189 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 189;
+
+SELECT id FROM db.t_190 UNION ALL SELECT id FROM db.u_190;
+
+SELECT CASE WHEN v > 191 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_191; -- done
+
+-- step 192
+SELECT a, b, count(*) AS n FROM db.table_192 WHERE c = 192 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_193 x inner join db.y_193 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 193;
+
+SELECT id FROM db.t_194 UNION ALL SELECT id FROM db.u_194;
+
+SELECT CASE WHEN v > 195 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_195; -- done
+
+-- step 196
+SELECT a, b, count(*) AS n FROM db.table_196 WHERE c = 196 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_197 x inner join db.y_197 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 197;
+
+SELECT id FROM db.t_198 UNION ALL SELECT id FROM db.u_198;
+
+SELECT CASE WHEN v > 199 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_199; -- done
+
+-- step 200
+SELECT a, b, count(*) AS n FROM db.table_200 WHERE c = 200 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_201 x inner join db.y_201 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 201;
+
+SELECT id FROM db.t_202 UNION ALL SELECT id FROM db.u_202;
+
+SELECT CASE WHEN v > 203 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_203; -- done
+
+-- step 204
+SELECT a, b, count(*) AS n FROM db.table_204 WHERE c = 204 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_205 x inner join db.y_205 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 205;
+
+SELECT id FROM db.t_206 UNION ALL SELECT id FROM db.u_206;
+
+SELECT CASE WHEN v > 207 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_207; -- done
+
+-- step 208
+SELECT a, b, count(*) AS n FROM db.table_208 WHERE c = 208 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_209 x inner join db.y_209 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 209;
+
+SELECT id FROM db.t_210 UNION ALL SELECT id FROM db.u_210;
+
+SELECT CASE WHEN v > 211 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_211; -- done
+
+-- step 212
+SELECT a, b, count(*) AS n FROM db.table_212 WHERE c = 212 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_213 x inner join db.y_213 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 213;
+
+SELECT id FROM db.t_214 UNION ALL SELECT id FROM db.u_214;
+
+SELECT CASE WHEN v > 215 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_215; -- done
+
+-- step 216
+SELECT a, b, count(*) AS n FROM db.table_216 WHERE c = 216 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_217 x inner join db.y_217 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 217;
+
+SELECT id FROM db.t_218 UNION ALL SELECT id FROM db.u_218;
+
+SELECT CASE WHEN v > 219 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_219; -- done
+
+-- step 220
+SELECT a, b, count(*) AS n FROM db.table_220 WHERE c = 220 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_221 x inner join db.y_221 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 221;
+
+SELECT id FROM db.t_222 UNION ALL SELECT id FROM db.u_222;
+
+SELECT CASE WHEN v > 223 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_223; -- done
+
+-- step 224
+SELECT a, b, count(*) AS n FROM db.table_224 WHERE c = 224 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_225 x inner join db.y_225 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 225;
+
+SELECT id FROM db.t_226 UNION ALL SELECT id FROM db.u_226;
+
+SELECT CASE WHEN v > 227 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_227; -- done
+
+-- step 228
+SELECT a, b, count(*) AS n FROM db.table_228 WHERE c = 228 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_229 x inner join db.y_229 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 229;
+
+SELECT id FROM db.t_230 UNION ALL SELECT id FROM db.u_230;
+
+SELECT CASE WHEN v > 231 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_231; -- done
+
+-- step 232
+SELECT a, b, count(*) AS n FROM db.table_232 WHERE c = 232 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_233 x inner join db.y_233 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 233;
+
+SELECT id FROM db.t_234 UNION ALL SELECT id FROM db.u_234;
+
+SELECT CASE WHEN v > 235 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_235; -- done
+
+-- step 236
+SELECT a, b, count(*) AS n FROM db.table_236 WHERE c = 236 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_237 x inner join db.y_237 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 237;
+
+SELECT id FROM db.t_238 UNION ALL SELECT id FROM db.u_238;
+
+SELECT CASE WHEN v > 239 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_239; -- done
+
+-- step 240
+SELECT a, b, count(*) AS n FROM db.table_240 WHERE c = 240 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_241 x inner join db.y_241 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 241;
+
+SELECT id FROM db.t_242 UNION ALL SELECT id FROM db.u_242;
+
+SELECT CASE WHEN v > 243 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_243; -- done
+
+-- step 244
+SELECT a, b, count(*) AS n FROM db.table_244 WHERE c = 244 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_245 x inner join db.y_245 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 245;
+
+SELECT id FROM db.t_246 UNION ALL SELECT id FROM db.u_246;
+
+SELECT CASE WHEN v > 247 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_247; -- done
+
+-- step 248
+SELECT a, b, count(*) AS n FROM db.table_248 WHERE c = 248 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_249 x inner join db.y_249 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 249;
+
+SELECT id FROM db.t_250 UNION ALL SELECT id FROM db.u_250;
+
+SELECT CASE WHEN v > 251 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_251; -- done
+
+-- step 252
+SELECT a, b, count(*) AS n FROM db.table_252 WHERE c = 252 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_253 x inner join db.y_253 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 253;
+
+SELECT id FROM db.t_254 UNION ALL SELECT id FROM db.u_254;
+
+SELECT CASE WHEN v > 255 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_255; -- done
+
+-- step 256
+SELECT a, b, count(*) AS n FROM db.table_256 WHERE c = 256 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_257 x inner join db.y_257 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 257;
+
+SELECT id FROM db.t_258 UNION ALL SELECT id FROM db.u_258;
+
+SELECT CASE WHEN v > 259 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_259; -- done
+
+-- step 260
+SELECT a, b, count(*) AS n FROM db.table_260 WHERE c = 260 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_261 x inner join db.y_261 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 261;
+
+SELECT id FROM db.t_262 UNION ALL SELECT id FROM db.u_262;
+
+SELECT CASE WHEN v > 263 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_263; -- done
+
+-- step 264
+SELECT a, b, count(*) AS n FROM db.table_264 WHERE c = 264 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_265 x inner join db.y_265 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 265;
+
+SELECT id FROM db.t_266 UNION ALL SELECT id FROM db.u_266;
+
+SELECT CASE WHEN v > 267 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_267; -- done
+
+-- step 268
+SELECT a, b, count(*) AS n FROM db.table_268 WHERE c = 268 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_269 x inner join db.y_269 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 269;
+
+SELECT id FROM db.t_270 UNION ALL SELECT id FROM db.u_270;
+
+SELECT CASE WHEN v > 271 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_271; -- done
+
+-- step 272
+SELECT a, b, count(*) AS n FROM db.table_272 WHERE c = 272 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_273 x inner join db.y_273 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 273;
+
+SELECT id FROM db.t_274 UNION ALL SELECT id FROM db.u_274;
+
+SELECT CASE WHEN v > 275 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_275; -- done
+
+-- step 276
+SELECT a, b, count(*) AS n FROM db.table_276 WHERE c = 276 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_277 x inner join db.y_277 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 277;
+
+SELECT id FROM db.t_278 UNION ALL SELECT id FROM db.u_278;
+
+SELECT CASE WHEN v > 279 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_279; -- done
+
+-- step 280
+SELECT a, b, count(*) AS n FROM db.table_280 WHERE c = 280 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_281 x inner join db.y_281 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 281;
+
+SELECT id FROM db.t_282 UNION ALL SELECT id FROM db.u_282;
+
+SELECT CASE WHEN v > 283 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_283; -- done
+
+-- step 284
+SELECT a, b, count(*) AS n FROM db.table_284 WHERE c = 284 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_285 x inner join db.y_285 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 285;
+
+SELECT id FROM db.t_286 UNION ALL SELECT id FROM db.u_286;
+
+SELECT CASE WHEN v > 287 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_287; -- done
+
+-- step 288
+SELECT a, b, count(*) AS n FROM db.table_288 WHERE c = 288 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_289 x inner join db.y_289 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 289;
+
+SELECT id FROM db.t_290 UNION ALL SELECT id FROM db.u_290;
+
+SELECT CASE WHEN v > 291 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_291; -- done
+
+-- step 292
+SELECT a, b, count(*) AS n FROM db.table_292 WHERE c = 292 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_293 x inner join db.y_293 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 293;
+
+SELECT id FROM db.t_294 UNION ALL SELECT id FROM db.u_294;
+
+SELECT CASE WHEN v > 295 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_295; -- done
+
+-- step 296
+SELECT a, b, count(*) AS n FROM db.table_296 WHERE c = 296 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_297 x inner join db.y_297 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 297;
+
+SELECT id FROM db.t_298 UNION ALL SELECT id FROM db.u_298;
+
+SELECT CASE WHEN v > 299 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_299; -- done
+
+-- step 300
+SELECT a, b, count(*) AS n FROM db.table_300 WHERE c = 300 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_301 x inner join db.y_301 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 301;
+
+SELECT id FROM db.t_302 UNION ALL SELECT id FROM db.u_302;
+
+SELECT CASE WHEN v > 303 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_303; -- done
+
+-- step 304
+SELECT a, b, count(*) AS n FROM db.table_304 WHERE c = 304 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_305 x inner join db.y_305 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 305;
+
+SELECT id FROM db.t_306 UNION ALL SELECT id FROM db.u_306;
+
+SELECT CASE WHEN v > 307 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_307; -- done
+
+-- step 308
+SELECT a, b, count(*) AS n FROM db.table_308 WHERE c = 308 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_309 x inner join db.y_309 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 309;
+
+SELECT id FROM db.t_310 UNION ALL SELECT id FROM db.u_310;
+
+SELECT CASE WHEN v > 311 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_311; -- done
+
+-- step 312
+SELECT a, b, count(*) AS n FROM db.table_312 WHERE c = 312 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_313 x inner join db.y_313 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 313;
+
+SELECT id FROM db.t_314 UNION ALL SELECT id FROM db.u_314;
+
+SELECT CASE WHEN v > 315 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_315; -- done
+
+-- step 316
+SELECT a, b, count(*) AS n FROM db.table_316 WHERE c = 316 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_317 x inner join db.y_317 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 317;
+
+SELECT id FROM db.t_318 UNION ALL SELECT id FROM db.u_318;
+
+SELECT CASE WHEN v > 319 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_319; -- done
+
+-- step 320
+SELECT a, b, count(*) AS n FROM db.table_320 WHERE c = 320 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_321 x inner join db.y_321 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 321;
+
+SELECT id FROM db.t_322 UNION ALL SELECT id FROM db.u_322;
+
+SELECT CASE WHEN v > 323 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_323; -- done
+
+-- step 324
+SELECT a, b, count(*) AS n FROM db.table_324 WHERE c = 324 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_325 x inner join db.y_325 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 325;
+
+SELECT id FROM db.t_326 UNION ALL SELECT id FROM db.u_326;
+
+SELECT CASE WHEN v > 327 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_327; -- done
+
+-- step 328
+SELECT a, b, count(*) AS n FROM db.table_328 WHERE c = 328 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_329 x inner join db.y_329 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 329;
+
+SELECT id FROM db.t_330 UNION ALL SELECT id FROM db.u_330;
+
+SELECT CASE WHEN v > 331 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_331; -- done
+
+-- step 332
+SELECT a, b, count(*) AS n FROM db.table_332 WHERE c = 332 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_333 x inner join db.y_333 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 333;
+
+SELECT id FROM db.t_334 UNION ALL SELECT id FROM db.u_334;
+
+SELECT CASE WHEN v > 335 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_335; -- done
+
+-- step 336
+SELECT a, b, count(*) AS n FROM db.table_336 WHERE c = 336 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_337 x inner join db.y_337 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 337;
+
+SELECT id FROM db.t_338 UNION ALL SELECT id FROM db.u_338;
+
+SELECT CASE WHEN v > 339 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_339; -- done
+
+-- step 340
+SELECT a, b, count(*) AS n FROM db.table_340 WHERE c = 340 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_341 x inner join db.y_341 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 341;
+
+SELECT id FROM db.t_342 UNION ALL SELECT id FROM db.u_342;
+
+SELECT CASE WHEN v > 343 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_343; -- done
+
+-- step 344
+SELECT a, b, count(*) AS n FROM db.table_344 WHERE c = 344 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_345 x inner join db.y_345 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 345;
+
+SELECT id FROM db.t_346 UNION ALL SELECT id FROM db.u_346;
+
+SELECT CASE WHEN v > 347 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_347; -- done
+
+-- step 348
+SELECT a, b, count(*) AS n FROM db.table_348 WHERE c = 348 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_349 x inner join db.y_349 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 349;
+
+SELECT id FROM db.t_350 UNION ALL SELECT id FROM db.u_350;
+
+SELECT CASE WHEN v > 351 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_351; -- done
+
+-- step 352
+SELECT a, b, count(*) AS n FROM db.table_352 WHERE c = 352 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_353 x inner join db.y_353 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 353;
+
+SELECT id FROM db.t_354 UNION ALL SELECT id FROM db.u_354;
+
+SELECT CASE WHEN v > 355 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_355; -- done
+
+-- step 356
+SELECT a, b, count(*) AS n FROM db.table_356 WHERE c = 356 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_357 x inner join db.y_357 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 357;
+
+SELECT id FROM db.t_358 UNION ALL SELECT id FROM db.u_358;
+
+SELECT CASE WHEN v > 359 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_359; -- done
+
+-- step 360
+SELECT a, b, count(*) AS n FROM db.table_360 WHERE c = 360 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_361 x inner join db.y_361 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 361;
+
+SELECT id FROM db.t_362 UNION ALL SELECT id FROM db.u_362;
+
+SELECT CASE WHEN v > 363 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_363; -- done
+
+-- step 364
+SELECT a, b, count(*) AS n FROM db.table_364 WHERE c = 364 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_365 x inner join db.y_365 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 365;
+
+SELECT id FROM db.t_366 UNION ALL SELECT id FROM db.u_366;
+
+SELECT CASE WHEN v > 367 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_367; -- done
+
+-- step 368
+SELECT a, b, count(*) AS n FROM db.table_368 WHERE c = 368 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_369 x inner join db.y_369 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 369;
+
+SELECT id FROM db.t_370 UNION ALL SELECT id FROM db.u_370;
+
+SELECT CASE WHEN v > 371 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_371; -- done
+
+-- step 372
+SELECT a, b, count(*) AS n FROM db.table_372 WHERE c = 372 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_373 x inner join db.y_373 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 373;
+
+SELECT id FROM db.t_374 UNION ALL SELECT id FROM db.u_374;
+
+SELECT CASE WHEN v > 375 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_375; -- done
+
+-- step 376
+SELECT a, b, count(*) AS n FROM db.table_376 WHERE c = 376 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_377 x inner join db.y_377 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 377;
+
+SELECT id FROM db.t_378 UNION ALL SELECT id FROM db.u_378;
+
+SELECT CASE WHEN v > 379 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_379; -- done
+
+-- step 380
+SELECT a, b, count(*) AS n FROM db.table_380 WHERE c = 380 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_381 x inner join db.y_381 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 381;
+
+SELECT id FROM db.t_382 UNION ALL SELECT id FROM db.u_382;
+
+SELECT CASE WHEN v > 383 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_383; -- done
+
+-- step 384
+SELECT a, b, count(*) AS n FROM db.table_384 WHERE c = 384 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_385 x inner join db.y_385 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 385;
+
+SELECT id FROM db.t_386 UNION ALL SELECT id FROM db.u_386;
+
+SELECT CASE WHEN v > 387 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_387; -- done
+
+-- step 388
+SELECT a, b, count(*) AS n FROM db.table_388 WHERE c = 388 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_389 x inner join db.y_389 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 389;
+
+SELECT id FROM db.t_390 UNION ALL SELECT id FROM db.u_390;
+
+SELECT CASE WHEN v > 391 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_391; -- done
+
+-- step 392
+SELECT a, b, count(*) AS n FROM db.table_392 WHERE c = 392 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_393 x inner join db.y_393 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 393;
+
+SELECT id FROM db.t_394 UNION ALL SELECT id FROM db.u_394;
+
+SELECT CASE WHEN v > 395 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_395; -- done
+
+-- step 396
+SELECT a, b, count(*) AS n FROM db.table_396 WHERE c = 396 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_397 x inner join db.y_397 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 397;
+
+SELECT id FROM db.t_398 UNION ALL SELECT id FROM db.u_398;
+
+SELECT CASE WHEN v > 399 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_399; -- done
+
+-- step 400
+SELECT a, b, count(*) AS n FROM db.table_400 WHERE c = 400 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_401 x inner join db.y_401 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 401;
+
+SELECT id FROM db.t_402 UNION ALL SELECT id FROM db.u_402;
+
+SELECT CASE WHEN v > 403 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_403; -- done
+
+-- step 404
+SELECT a, b, count(*) AS n FROM db.table_404 WHERE c = 404 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_405 x inner join db.y_405 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 405;
+
+SELECT id FROM db.t_406 UNION ALL SELECT id FROM db.u_406;
+
+SELECT CASE WHEN v > 407 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_407; -- done
+
+-- step 408
+SELECT a, b, count(*) AS n FROM db.table_408 WHERE c = 408 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_409 x inner join db.y_409 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 409;
+
+SELECT id FROM db.t_410 UNION ALL SELECT id FROM db.u_410;
+
+SELECT CASE WHEN v > 411 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_411; -- done
+
+-- step 412
+SELECT a, b, count(*) AS n FROM db.table_412 WHERE c = 412 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_413 x inner join db.y_413 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 413;
+
+SELECT id FROM db.t_414 UNION ALL SELECT id FROM db.u_414;
+
+SELECT CASE WHEN v > 415 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_415; -- done
+
+-- step 416
+SELECT a, b, count(*) AS n FROM db.table_416 WHERE c = 416 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_417 x inner join db.y_417 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 417;
+
+SELECT id FROM db.t_418 UNION ALL SELECT id FROM db.u_418;
+
+SELECT CASE WHEN v > 419 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_419; -- done
+
+-- step 420
+SELECT a, b, count(*) AS n FROM db.table_420 WHERE c = 420 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_421 x inner join db.y_421 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 421;
+
+SELECT id FROM db.t_422 UNION ALL SELECT id FROM db.u_422;
+
+SELECT CASE WHEN v > 423 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_423; -- done
+
+-- step 424
+SELECT a, b, count(*) AS n FROM db.table_424 WHERE c = 424 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_425 x inner join db.y_425 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 425;
+
+SELECT id FROM db.t_426 UNION ALL SELECT id FROM db.u_426;
+
+SELECT CASE WHEN v > 427 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_427; -- done
+
+-- step 428
+SELECT a, b, count(*) AS n FROM db.table_428 WHERE c = 428 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_429 x inner join db.y_429 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 429;
+
+SELECT id FROM db.t_430 UNION ALL SELECT id FROM db.u_430;
+
+SELECT CASE WHEN v > 431 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_431; -- done
+
+-- step 432
+SELECT a, b, count(*) AS n FROM db.table_432 WHERE c = 432 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_433 x inner join db.y_433 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 433;
+
+SELECT id FROM db.t_434 UNION ALL SELECT id FROM db.u_434;
+
+SELECT CASE WHEN v > 435 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_435; -- done
+
+-- step 436
+SELECT a, b, count(*) AS n FROM db.table_436 WHERE c = 436 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_437 x inner join db.y_437 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 437;
+
+SELECT id FROM db.t_438 UNION ALL SELECT id FROM db.u_438;
+
+SELECT CASE WHEN v > 439 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_439; -- done
+
+-- step 440
+SELECT a, b, count(*) AS n FROM db.table_440 WHERE c = 440 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_441 x inner join db.y_441 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 441;
+
+SELECT id FROM db.t_442 UNION ALL SELECT id FROM db.u_442;
+
+SELECT CASE WHEN v > 443 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_443; -- done
+
+-- step 444
+SELECT a, b, count(*) AS n FROM db.table_444 WHERE c = 444 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_445 x inner join db.y_445 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 445;
+
+SELECT id FROM db.t_446 UNION ALL SELECT id FROM db.u_446;
+
+SELECT CASE WHEN v > 447 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_447; -- done
+
+-- step 448
+SELECT a, b, count(*) AS n FROM db.table_448 WHERE c = 448 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_449 x inner join db.y_449 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 449;
+
+SELECT id FROM db.t_450 UNION ALL SELECT id FROM db.u_450;
+
+SELECT CASE WHEN v > 451 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_451; -- done
+
+-- step 452
+SELECT a, b, count(*) AS n FROM db.table_452 WHERE c = 452 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_453 x inner join db.y_453 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 453;
+
+SELECT id FROM db.t_454 UNION ALL SELECT id FROM db.u_454;
+
+SELECT CASE WHEN v > 455 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_455; -- done
+
+-- step 456
+SELECT a, b, count(*) AS n FROM db.table_456 WHERE c = 456 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_457 x inner join db.y_457 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 457;
+
+SELECT id FROM db.t_458 UNION ALL SELECT id FROM db.u_458;
+
+SELECT CASE WHEN v > 459 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_459; -- done
+
+-- step 460
+SELECT a, b, count(*) AS n FROM db.table_460 WHERE c = 460 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_461 x inner join db.y_461 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 461;
+
+SELECT id FROM db.t_462 UNION ALL SELECT id FROM db.u_462;
+
+SELECT CASE WHEN v > 463 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_463; -- done
+
+-- step 464
+SELECT a, b, count(*) AS n FROM db.table_464 WHERE c = 464 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_465 x inner join db.y_465 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 465;
+
+SELECT id FROM db.t_466 UNION ALL SELECT id FROM db.u_466;
+
+SELECT CASE WHEN v > 467 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_467; -- done
+
+-- step 468
+SELECT a, b, count(*) AS n FROM db.table_468 WHERE c = 468 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_469 x inner join db.y_469 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 469;
+
+SELECT id FROM db.t_470 UNION ALL SELECT id FROM db.u_470;
+
+SELECT CASE WHEN v > 471 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_471; -- done
+
+-- step 472
+SELECT a, b, count(*) AS n FROM db.table_472 WHERE c = 472 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_473 x inner join db.y_473 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 473;
+
+SELECT id FROM db.t_474 UNION ALL SELECT id FROM db.u_474;
+
+SELECT CASE WHEN v > 475 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_475; -- done
+
+-- step 476
+SELECT a, b, count(*) AS n FROM db.table_476 WHERE c = 476 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_477 x inner join db.y_477 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 477;
+
+SELECT id FROM db.t_478 UNION ALL SELECT id FROM db.u_478;
+
+SELECT CASE WHEN v > 479 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_479; -- done
+
+-- step 480
+SELECT a, b, count(*) AS n FROM db.table_480 WHERE c = 480 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_481 x inner join db.y_481 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 481;
+
+SELECT id FROM db.t_482 UNION ALL SELECT id FROM db.u_482;
+
+SELECT CASE WHEN v > 483 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_483; -- done
+
+-- step 484
+SELECT a, b, count(*) AS n FROM db.table_484 WHERE c = 484 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_485 x inner join db.y_485 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 485;
+
+SELECT id FROM db.t_486 UNION ALL SELECT id FROM db.u_486;
+
+SELECT CASE WHEN v > 487 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_487; -- done
+
+-- step 488
+SELECT a, b, count(*) AS n FROM db.table_488 WHERE c = 488 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_489 x inner join db.y_489 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 489;
+
+SELECT id FROM db.t_490 UNION ALL SELECT id FROM db.u_490;
+
+SELECT CASE WHEN v > 491 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_491; -- done
+
+-- step 492
+SELECT a, b, count(*) AS n FROM db.table_492 WHERE c = 492 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_493 x inner join db.y_493 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 493;
+
+SELECT id FROM db.t_494 UNION ALL SELECT id FROM db.u_494;
+
+SELECT CASE WHEN v > 495 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_495; -- done
+
+-- step 496
+SELECT a, b, count(*) AS n FROM db.table_496 WHERE c = 496 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_497 x inner join db.y_497 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 497;
+
+SELECT id FROM db.t_498 UNION ALL SELECT id FROM db.u_498;
+
+SELECT CASE WHEN v > 499 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_499; -- done
+
+-- step 500
+SELECT a, b, count(*) AS n FROM db.table_500 WHERE c = 500 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_501 x inner join db.y_501 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 501;
+
+SELECT id FROM db.t_502 UNION ALL SELECT id FROM db.u_502;
+
+SELECT CASE WHEN v > 503 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_503; -- done
+
+-- step 504
+SELECT a, b, count(*) AS n FROM db.table_504 WHERE c = 504 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_505 x inner join db.y_505 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 505;
+
+SELECT id FROM db.t_506 UNION ALL SELECT id FROM db.u_506;
+
+SELECT CASE WHEN v > 507 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_507; -- done
+
+-- step 508
+SELECT a, b, count(*) AS n FROM db.table_508 WHERE c = 508 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_509 x inner join db.y_509 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 509;
+
+SELECT id FROM db.t_510 UNION ALL SELECT id FROM db.u_510;
+
+SELECT CASE WHEN v > 511 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_511; -- done
+
+-- step 512
+SELECT a, b, count(*) AS n FROM db.table_512 WHERE c = 512 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_513 x inner join db.y_513 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 513;
+
+SELECT id FROM db.t_514 UNION ALL SELECT id FROM db.u_514;
+
+SELECT CASE WHEN v > 515 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_515; -- done
+
+-- step 516
+SELECT a, b, count(*) AS n FROM db.table_516 WHERE c = 516 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_517 x inner join db.y_517 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 517;
+
+SELECT id FROM db.t_518 UNION ALL SELECT id FROM db.u_518;
+
+SELECT CASE WHEN v > 519 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_519; -- done
+
+-- step 520
+SELECT a, b, count(*) AS n FROM db.table_520 WHERE c = 520 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_521 x inner join db.y_521 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 521;
+
+SELECT id FROM db.t_522 UNION ALL SELECT id FROM db.u_522;
+
+SELECT CASE WHEN v > 523 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_523; -- done
+
+-- step 524
+SELECT a, b, count(*) AS n FROM db.table_524 WHERE c = 524 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_525 x inner join db.y_525 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 525;
+
+SELECT id FROM db.t_526 UNION ALL SELECT id FROM db.u_526;
+
+SELECT CASE WHEN v > 527 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_527; -- done
+
+-- step 528
+SELECT a, b, count(*) AS n FROM db.table_528 WHERE c = 528 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_529 x inner join db.y_529 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 529;
+
+SELECT id FROM db.t_530 UNION ALL SELECT id FROM db.u_530;
+
+SELECT CASE WHEN v > 531 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_531; -- done
+
+-- step 532
+SELECT a, b, count(*) AS n FROM db.table_532 WHERE c = 532 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_533 x inner join db.y_533 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 533;
+
+SELECT id FROM db.t_534 UNION ALL SELECT id FROM db.u_534;
+
+SELECT CASE WHEN v > 535 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_535; -- done
+
+-- step 536
+SELECT a, b, count(*) AS n FROM db.table_536 WHERE c = 536 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_537 x inner join db.y_537 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 537;
+
+SELECT id FROM db.t_538 UNION ALL SELECT id FROM db.u_538;
+
+SELECT CASE WHEN v > 539 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_539; -- done
+
+-- step 540
+SELECT a, b, count(*) AS n FROM db.table_540 WHERE c = 540 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_541 x inner join db.y_541 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 541;
+
+SELECT id FROM db.t_542 UNION ALL SELECT id FROM db.u_542;
+
+SELECT CASE WHEN v > 543 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_543; -- done
+
+-- step 544
+SELECT a, b, count(*) AS n FROM db.table_544 WHERE c = 544 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_545 x inner join db.y_545 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 545;
+
+SELECT id FROM db.t_546 UNION ALL SELECT id FROM db.u_546;
+
+SELECT CASE WHEN v > 547 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_547; -- done
+
+-- step 548
+SELECT a, b, count(*) AS n FROM db.table_548 WHERE c = 548 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_549 x inner join db.y_549 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 549;
+
+SELECT id FROM db.t_550 UNION ALL SELECT id FROM db.u_550;
+
+SELECT CASE WHEN v > 551 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_551; -- done
+
+-- step 552
+SELECT a, b, count(*) AS n FROM db.table_552 WHERE c = 552 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_553 x inner join db.y_553 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 553;
+
+SELECT id FROM db.t_554 UNION ALL SELECT id FROM db.u_554;
+
+SELECT CASE WHEN v > 555 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_555; -- done
+
+-- step 556
+SELECT a, b, count(*) AS n FROM db.table_556 WHERE c = 556 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_557 x inner join db.y_557 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 557;
+
+SELECT id FROM db.t_558 UNION ALL SELECT id FROM db.u_558;
+
+SELECT CASE WHEN v > 559 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_559; -- done
+
+-- step 560
+SELECT a, b, count(*) AS n FROM db.table_560 WHERE c = 560 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_561 x inner join db.y_561 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 561;
+
+SELECT id FROM db.t_562 UNION ALL SELECT id FROM db.u_562;
+
+SELECT CASE WHEN v > 563 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_563; -- done
+
+-- step 564
+SELECT a, b, count(*) AS n FROM db.table_564 WHERE c = 564 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_565 x inner join db.y_565 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 565;
+
+SELECT id FROM db.t_566 UNION ALL SELECT id FROM db.u_566;
+
+SELECT CASE WHEN v > 567 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_567; -- done
+
+-- step 568
+SELECT a, b, count(*) AS n FROM db.table_568 WHERE c = 568 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_569 x inner join db.y_569 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 569;
+
+SELECT id FROM db.t_570 UNION ALL SELECT id FROM db.u_570;
+
+SELECT CASE WHEN v > 571 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_571; -- done
+
+-- step 572
+SELECT a, b, count(*) AS n FROM db.table_572 WHERE c = 572 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_573 x inner join db.y_573 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 573;
+
+SELECT id FROM db.t_574 UNION ALL SELECT id FROM db.u_574;
+
+SELECT CASE WHEN v > 575 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_575; -- done
+
+-- step 576
+SELECT a, b, count(*) AS n FROM db.table_576 WHERE c = 576 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_577 x inner join db.y_577 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 577;
+
+SELECT id FROM db.t_578 UNION ALL SELECT id FROM db.u_578;
+
+SELECT CASE WHEN v > 579 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_579; -- done
+
+-- step 580
+SELECT a, b, count(*) AS n FROM db.table_580 WHERE c = 580 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_581 x inner join db.y_581 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 581;
+
+SELECT id FROM db.t_582 UNION ALL SELECT id FROM db.u_582;
+
+SELECT CASE WHEN v > 583 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_583; -- done
+
+-- step 584
+SELECT a, b, count(*) AS n FROM db.table_584 WHERE c = 584 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_585 x inner join db.y_585 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 585;
+
+SELECT id FROM db.t_586 UNION ALL SELECT id FROM db.u_586;
+
+SELECT CASE WHEN v > 587 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_587; -- done
+
+-- step 588
+SELECT a, b, count(*) AS n FROM db.table_588 WHERE c = 588 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_589 x inner join db.y_589 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 589;
+
+SELECT id FROM db.t_590 UNION ALL SELECT id FROM db.u_590;
+
+SELECT CASE WHEN v > 591 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_591; -- done
+
+-- step 592
+SELECT a, b, count(*) AS n FROM db.table_592 WHERE c = 592 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_593 x inner join db.y_593 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 593;
+
+SELECT id FROM db.t_594 UNION ALL SELECT id FROM db.u_594;
+
+SELECT CASE WHEN v > 595 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_595; -- done
+
+-- step 596
+SELECT a, b, count(*) AS n FROM db.table_596 WHERE c = 596 GROUP BY a, b ORDER BY n DESC LIMIT 100;
+
+select x.id, y.name from db.x_597 x inner join db.y_597 y on x.id = y.id where y.name like '%a%' and x.v between 1 and 597;
+
+SELECT id FROM db.t_598 UNION ALL SELECT id FROM db.u_598;
+
+SELECT CASE WHEN v > 599 THEN 'high' ELSE 'low' END AS level, cast(w AS int) FROM db.z_599; -- done
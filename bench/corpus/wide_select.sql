@@ -0,0 +1,1506 @@
+SELECT
+    t.col_0,
+    sum(t.amount_1) AS total_1,
+    coalesce(u.name_2, 'unknown') AS name_2,
+    cast(t.value_3 AS double) * 100 / t.count_3 AS ratio_3,
+    concat(t.first_4, ' ', t.last_4) AS full_4,
+    t.col_5,
+    sum(t.amount_6) AS total_6,
+    coalesce(u.name_7, 'unknown') AS name_7,
+    cast(t.value_8 AS double) * 100 / t.count_8 AS ratio_8,
+    concat(t.first_9, ' ', t.last_9) AS full_9,
+    t.col_10,
+    sum(t.amount_11) AS total_11,
+    coalesce(u.name_12, 'unknown') AS name_12,
+    cast(t.value_13 AS double) * 100 / t.count_13 AS ratio_13,
+    concat(t.first_14, ' ', t.last_14) AS full_14,
+    t.col_15,
+    sum(t.amount_16) AS total_16,
+    coalesce(u.name_17, 'unknown') AS name_17,
+    cast(t.value_18 AS double) * 100 / t.count_18 AS ratio_18,
+    concat(t.first_19, ' ', t.last_19) AS full_19,
+    t.col_20,
+    sum(t.amount_21) AS total_21,
+    coalesce(u.name_22, 'unknown') AS name_22,
+    cast(t.value_23 AS double) * 100 / t.count_23 AS ratio_23,
+    concat(t.first_24, ' ', t.last_24) AS full_24,
+    t.col_25,
+    sum(t.amount_26) AS total_26,
+    coalesce(u.name_27, 'unknown') AS name_27,
+    cast(t.value_28 AS double) * 100 / t.count_28 AS ratio_28,
+    concat(t.first_29, ' ', t.last_29) AS full_29,
+    t.col_30,
+    sum(t.amount_31) AS total_31,
+    coalesce(u.name_32, 'unknown') AS name_32,
+    cast(t.value_33 AS double) * 100 / t.count_33 AS ratio_33,
+    concat(t.first_34, ' ', t.last_34) AS full_34,
+    t.col_35,
+    sum(t.amount_36) AS total_36,
+    coalesce(u.name_37, 'unknown') AS name_37,
+    cast(t.value_38 AS double) * 100 / t.count_38 AS ratio_38,
+    concat(t.first_39, ' ', t.last_39) AS full_39,
+    t.col_40,
+    sum(t.amount_41) AS total_41,
+    coalesce(u.name_42, 'unknown') AS name_42,
+    cast(t.value_43 AS double) * 100 / t.count_43 AS ratio_43,
+    concat(t.first_44, ' ', t.last_44) AS full_44,
+    t.col_45,
+    sum(t.amount_46) AS total_46,
+    coalesce(u.name_47, 'unknown') AS name_47,
+    cast(t.value_48 AS double) * 100 / t.count_48 AS ratio_48,
+    concat(t.first_49, ' ', t.last_49) AS full_49,
+    t.col_50,
+    sum(t.amount_51) AS total_51,
+    coalesce(u.name_52, 'unknown') AS name_52,
+    cast(t.value_53 AS double) * 100 / t.count_53 AS ratio_53,
+    concat(t.first_54, ' ', t.last_54) AS full_54,
+    t.col_55,
+    sum(t.amount_56) AS total_56,
+    coalesce(u.name_57, 'unknown') AS name_57,
+    cast(t.value_58 AS double) * 100 / t.count_58 AS ratio_58,
+    concat(t.first_59, ' ', t.last_59) AS full_59,
+    t.col_60,
+    sum(t.amount_61) AS total_61,
+    coalesce(u.name_62, 'unknown') AS name_62,
+    cast(t.value_63 AS double) * 100 / t.count_63 AS ratio_63,
+    concat(t.first_64, ' ', t.last_64) AS full_64,
+    t.col_65,
+    sum(t.amount_66) AS total_66,
+    coalesce(u.name_67, 'unknown') AS name_67,
+    cast(t.value_68 AS double) * 100 / t.count_68 AS ratio_68,
+    concat(t.first_69, ' ', t.last_69) AS full_69,
+    t.col_70,
+    sum(t.amount_71) AS total_71,
+    coalesce(u.name_72, 'unknown') AS name_72,
+    cast(t.value_73 AS double) * 100 / t.count_73 AS ratio_73,
+    concat(t.first_74, ' ', t.last_74) AS full_74,
+    t.col_75,
+    sum(t.amount_76) AS total_76,
+    coalesce(u.name_77, 'unknown') AS name_77,
+    cast(t.value_78 AS double) * 100 / t.count_78 AS ratio_78,
+    concat(t.first_79, ' ', t.last_79) AS full_79,
+    t.col_80,
+    sum(t.amount_81) AS total_81,
+    coalesce(u.name_82, 'unknown') AS name_82,
+    cast(t.value_83 AS double) * 100 / t.count_83 AS ratio_83,
+    concat(t.first_84, ' ', t.last_84) AS full_84,
+    t.col_85,
+    sum(t.amount_86) AS total_86,
+    coalesce(u.name_87, 'unknown') AS name_87,
+    cast(t.value_88 AS double) * 100 / t.count_88 AS ratio_88,
+    concat(t.first_89, ' ', t.last_89) AS full_89,
+    t.col_90,
+    sum(t.amount_91) AS total_91,
+    coalesce(u.name_92, 'unknown') AS name_92,
+    cast(t.value_93 AS double) * 100 / t.count_93 AS ratio_93,
+    concat(t.first_94, ' ', t.last_94) AS full_94,
+    t.col_95,
+    sum(t.amount_96) AS total_96,
+    coalesce(u.name_97, 'unknown') AS name_97,
+    cast(t.value_98 AS double) * 100 / t.count_98 AS ratio_98,
+    concat(t.first_99, ' ', t.last_99) AS full_99,
+    t.col_100,
+    sum(t.amount_101) AS total_101,
+    coalesce(u.name_102, 'unknown') AS name_102,
+    cast(t.value_103 AS double) * 100 / t.count_103 AS ratio_103,
+    concat(t.first_104, ' ', t.last_104) AS full_104,
+    t.col_105,
+    sum(t.amount_106) AS total_106,
+    coalesce(u.name_107, 'unknown') AS name_107,
+    cast(t.value_108 AS double) * 100 / t.count_108 AS ratio_108,
+    concat(t.first_109, ' ', t.last_109) AS full_109,
+    t.col_110,
+    sum(t.amount_111) AS total_111,
+    coalesce(u.name_112, 'unknown') AS name_112,
+    cast(t.value_113 AS double) * 100 / t.count_113 AS ratio_113,
+    concat(t.first_114, ' ', t.last_114) AS full_114,
+    t.col_115,
+    sum(t.amount_116) AS total_116,
+    coalesce(u.name_117, 'unknown') AS name_117,
+    cast(t.value_118 AS double) * 100 / t.count_118 AS ratio_118,
+    concat(t.first_119, ' ', t.last_119) AS full_119,
+    t.col_120,
+    sum(t.amount_121) AS total_121,
+    coalesce(u.name_122, 'unknown') AS name_122,
+    cast(t.value_123 AS double) * 100 / t.count_123 AS ratio_123,
+    concat(t.first_124, ' ', t.last_124) AS full_124,
+    t.col_125,
+    sum(t.amount_126) AS total_126,
+    coalesce(u.name_127, 'unknown') AS name_127,
+    cast(t.value_128 AS double) * 100 / t.count_128 AS ratio_128,
+    concat(t.first_129, ' ', t.last_129) AS full_129,
+    t.col_130,
+    sum(t.amount_131) AS total_131,
+    coalesce(u.name_132, 'unknown') AS name_132,
+    cast(t.value_133 AS double) * 100 / t.count_133 AS ratio_133,
+    concat(t.first_134, ' ', t.last_134) AS full_134,
+    t.col_135,
+    sum(t.amount_136) AS total_136,
+    coalesce(u.name_137, 'unknown') AS name_137,
+    cast(t.value_138 AS double) * 100 / t.count_138 AS ratio_138,
+    concat(t.first_139, ' ', t.last_139) AS full_139,
+    t.col_140,
+    sum(t.amount_141) AS total_141,
+    coalesce(u.name_142, 'unknown') AS name_142,
+    cast(t.value_143 AS double) * 100 / t.count_143 AS ratio_143,
+    concat(t.first_144, ' ', t.last_144) AS full_144,
+    t.col_145,
+    sum(t.amount_146) AS total_146,
+    coalesce(u.name_147, 'unknown') AS name_147,
+    cast(t.value_148 AS double) * 100 / t.count_148 AS ratio_148,
+    concat(t.first_149, ' ', t.last_149) AS full_149,
+    t.col_150,
+    sum(t.amount_151) AS total_151,
+    coalesce(u.name_152, 'unknown') AS name_152,
+    cast(t.value_153 AS double) * 100 / t.count_153 AS ratio_153,
+    concat(t.first_154, ' ', t.last_154) AS full_154,
+    t.col_155,
+    sum(t.amount_156) AS total_156,
+    coalesce(u.name_157, 'unknown') AS name_157,
+    cast(t.value_158 AS double) * 100 / t.count_158 AS ratio_158,
+    concat(t.first_159, ' ', t.last_159) AS full_159,
+    t.col_160,
+    sum(t.amount_161) AS total_161,
+    coalesce(u.name_162, 'unknown') AS name_162,
+    cast(t.value_163 AS double) * 100 / t.count_163 AS ratio_163,
+    concat(t.first_164, ' ', t.last_164) AS full_164,
+    t.col_165,
+    sum(t.amount_166) AS total_166,
+    coalesce(u.name_167, 'unknown') AS name_167,
+    cast(t.value_168 AS double) * 100 / t.count_168 AS ratio_168,
+    concat(t.first_169, ' ', t.last_169) AS full_169,
+    t.col_170,
+    sum(t.amount_171) AS total_171,
+    coalesce(u.name_172, 'unknown') AS name_172,
+    cast(t.value_173 AS double) * 100 / t.count_173 AS ratio_173,
+    concat(t.first_174, ' ', t.last_174) AS full_174,
+    t.col_175,
+    sum(t.amount_176) AS total_176,
+    coalesce(u.name_177, 'unknown') AS name_177,
+    cast(t.value_178 AS double) * 100 / t.count_178 AS ratio_178,
+    concat(t.first_179, ' ', t.last_179) AS full_179,
+    t.col_180,
+    sum(t.amount_181) AS total_181,
+    coalesce(u.name_182, 'unknown') AS name_182,
+    cast(t.value_183 AS double) * 100 / t.count_183 AS ratio_183,
+    concat(t.first_184, ' ', t.last_184) AS full_184,
+    t.col_185,
+    sum(t.amount_186) AS total_186,
+    coalesce(u.name_187, 'unknown') AS name_187,
+    cast(t.value_188 AS double) * 100 / t.count_188 AS ratio_188,
+    concat(t.first_189, ' ', t.last_189) AS full_189,
+    t.col_190,
+    sum(t.amount_191) AS total_191,
+    coalesce(u.name_192, 'unknown') AS name_192,
+    cast(t.value_193 AS double) * 100 / t.count_193 AS ratio_193,
+    concat(t.first_194, ' ', t.last_194) AS full_194,
+    t.col_195,
+    sum(t.amount_196) AS total_196,
+    coalesce(u.name_197, 'unknown') AS name_197,
+    cast(t.value_198 AS double) * 100 / t.count_198 AS ratio_198,
+    concat(t.first_199, ' ', t.last_199) AS full_199,
+    t.col_200,
+    sum(t.amount_201) AS total_201,
+    coalesce(u.name_202, 'unknown') AS name_202,
+    cast(t.value_203 AS double) * 100 / t.count_203 AS ratio_203,
+    concat(t.first_204, ' ', t.last_204) AS full_204,
+    t.col_205,
+    sum(t.amount_206) AS total_206,
+    coalesce(u.name_207, 'unknown') AS name_207,
+    cast(t.value_208 AS double) * 100 / t.count_208 AS ratio_208,
+    concat(t.first_209, ' ', t.last_209) AS full_209,
+    t.col_210,
+    sum(t.amount_211) AS total_211,
+    coalesce(u.name_212, 'unknown') AS name_212,
+    cast(t.value_213 AS double) * 100 / t.count_213 AS ratio_213,
+    concat(t.first_214, ' ', t.last_214) AS full_214,
+    t.col_215,
+    sum(t.amount_216) AS total_216,
+    coalesce(u.name_217, 'unknown') AS name_217,
+    cast(t.value_218 AS double) * 100 / t.count_218 AS ratio_218,
+    concat(t.first_219, ' ', t.last_219) AS full_219,
+    t.col_220,
+    sum(t.amount_221) AS total_221,
+    coalesce(u.name_222, 'unknown') AS name_222,
+    cast(t.value_223 AS double) * 100 / t.count_223 AS ratio_223,
+    concat(t.first_224, ' ', t.last_224) AS full_224,
+    t.col_225,
+    sum(t.amount_226) AS total_226,
+    coalesce(u.name_227, 'unknown') AS name_227,
+    cast(t.value_228 AS double) * 100 / t.count_228 AS ratio_228,
+    concat(t.first_229, ' ', t.last_229) AS full_229,
+    t.col_230,
+    sum(t.amount_231) AS total_231,
+    coalesce(u.name_232, 'unknown') AS name_232,
+    cast(t.value_233 AS double) * 100 / t.count_233 AS ratio_233,
+    concat(t.first_234, ' ', t.last_234) AS full_234,
+    t.col_235,
+    sum(t.amount_236) AS total_236,
+    coalesce(u.name_237, 'unknown') AS name_237,
+    cast(t.value_238 AS double) * 100 / t.count_238 AS ratio_238,
+    concat(t.first_239, ' ', t.last_239) AS full_239,
+    t.col_240,
+    sum(t.amount_241) AS total_241,
+    coalesce(u.name_242, 'unknown') AS name_242,
+    cast(t.value_243 AS double) * 100 / t.count_243 AS ratio_243,
+    concat(t.first_244, ' ', t.last_244) AS full_244,
+    t.col_245,
+    sum(t.amount_246) AS total_246,
+    coalesce(u.name_247, 'unknown') AS name_247,
+    cast(t.value_248 AS double) * 100 / t.count_248 AS ratio_248,
+    concat(t.first_249, ' ', t.last_249) AS full_249,
+    t.col_250,
+    sum(t.amount_251) AS total_251,
+    coalesce(u.name_252, 'unknown') AS name_252,
+    cast(t.value_253 AS double) * 100 / t.count_253 AS ratio_253,
+    concat(t.first_254, ' ', t.last_254) AS full_254,
+    t.col_255,
+    sum(t.amount_256) AS total_256,
+    coalesce(u.name_257, 'unknown') AS name_257,
+    cast(t.value_258 AS double) * 100 / t.count_258 AS ratio_258,
+    concat(t.first_259, ' ', t.last_259) AS full_259,
+    t.col_260,
+    sum(t.amount_261) AS total_261,
+    coalesce(u.name_262, 'unknown') AS name_262,
+    cast(t.value_263 AS double) * 100 / t.count_263 AS ratio_263,
+    concat(t.first_264, ' ', t.last_264) AS full_264,
+    t.col_265,
+    sum(t.amount_266) AS total_266,
+    coalesce(u.name_267, 'unknown') AS name_267,
+    cast(t.value_268 AS double) * 100 / t.count_268 AS ratio_268,
+    concat(t.first_269, ' ', t.last_269) AS full_269,
+    t.col_270,
+    sum(t.amount_271) AS total_271,
+    coalesce(u.name_272, 'unknown') AS name_272,
+    cast(t.value_273 AS double) * 100 / t.count_273 AS ratio_273,
+    concat(t.first_274, ' ', t.last_274) AS full_274,
+    t.col_275,
+    sum(t.amount_276) AS total_276,
+    coalesce(u.name_277, 'unknown') AS name_277,
+    cast(t.value_278 AS double) * 100 / t.count_278 AS ratio_278,
+    concat(t.first_279, ' ', t.last_279) AS full_279,
+    t.col_280,
+    sum(t.amount_281) AS total_281,
+    coalesce(u.name_282, 'unknown') AS name_282,
+    cast(t.value_283 AS double) * 100 / t.count_283 AS ratio_283,
+    concat(t.first_284, ' ', t.last_284) AS full_284,
+    t.col_285,
+    sum(t.amount_286) AS total_286,
+    coalesce(u.name_287, 'unknown') AS name_287,
+    cast(t.value_288 AS double) * 100 / t.count_288 AS ratio_288,
+    concat(t.first_289, ' ', t.last_289) AS full_289,
+    t.col_290,
+    sum(t.amount_291) AS total_291,
+    coalesce(u.name_292, 'unknown') AS name_292,
+    cast(t.value_293 AS double) * 100 / t.count_293 AS ratio_293,
+    concat(t.first_294, ' ', t.last_294) AS full_294,
+    t.col_295,
+    sum(t.amount_296) AS total_296,
+    coalesce(u.name_297, 'unknown') AS name_297,
+    cast(t.value_298 AS double) * 100 / t.count_298 AS ratio_298,
+    concat(t.first_299, ' ', t.last_299) AS full_299,
+    t.col_300,
+    sum(t.amount_301) AS total_301,
+    coalesce(u.name_302, 'unknown') AS name_302,
+    cast(t.value_303 AS double) * 100 / t.count_303 AS ratio_303,
+    concat(t.first_304, ' ', t.last_304) AS full_304,
+    t.col_305,
+    sum(t.amount_306) AS total_306,
+    coalesce(u.name_307, 'unknown') AS name_307,
+    cast(t.value_308 AS double) * 100 / t.count_308 AS ratio_308,
+    concat(t.first_309, ' ', t.last_309) AS full_309,
+    t.col_310,
+    sum(t.amount_311) AS total_311,
+    coalesce(u.name_312, 'unknown') AS name_312,
+    cast(t.value_313 AS double) * 100 / t.count_313 AS ratio_313,
+    concat(t.first_314, ' ', t.last_314) AS full_314,
+    t.col_315,
+    sum(t.amount_316) AS total_316,
+    coalesce(u.name_317, 'unknown') AS name_317,
+    cast(t.value_318 AS double) * 100 / t.count_318 AS ratio_318,
+    concat(t.first_319, ' ', t.last_319) AS full_319,
+    t.col_320,
+    sum(t.amount_321) AS total_321,
+    coalesce(u.name_322, 'unknown') AS name_322,
+    cast(t.value_323 AS double) * 100 / t.count_323 AS ratio_323,
+    concat(t.first_324, ' ', t.last_324) AS full_324,
+    t.col_325,
+    sum(t.amount_326) AS total_326,
+    coalesce(u.name_327, 'unknown') AS name_327,
+    cast(t.value_328 AS double) * 100 / t.count_328 AS ratio_328,
+    concat(t.first_329, ' ', t.last_329) AS full_329,
+    t.col_330,
+    sum(t.amount_331) AS total_331,
+    coalesce(u.name_332, 'unknown') AS name_332,
+    cast(t.value_333 AS double) * 100 / t.count_333 AS ratio_333,
+    concat(t.first_334, ' ', t.last_334) AS full_334,
+    t.col_335,
+    sum(t.amount_336) AS total_336,
+    coalesce(u.name_337, 'unknown') AS name_337,
+    cast(t.value_338 AS double) * 100 / t.count_338 AS ratio_338,
+    concat(t.first_339, ' ', t.last_339) AS full_339,
+    t.col_340,
+    sum(t.amount_341) AS total_341,
+    coalesce(u.name_342, 'unknown') AS name_342,
+    cast(t.value_343 AS double) * 100 / t.count_343 AS ratio_343,
+    concat(t.first_344, ' ', t.last_344) AS full_344,
+    t.col_345,
+    sum(t.amount_346) AS total_346,
+    coalesce(u.name_347, 'unknown') AS name_347,
+    cast(t.value_348 AS double) * 100 / t.count_348 AS ratio_348,
+    concat(t.first_349, ' ', t.last_349) AS full_349,
+    t.col_350,
+    sum(t.amount_351) AS total_351,
+    coalesce(u.name_352, 'unknown') AS name_352,
+    cast(t.value_353 AS double) * 100 / t.count_353 AS ratio_353,
+    concat(t.first_354, ' ', t.last_354) AS full_354,
+    t.col_355,
+    sum(t.amount_356) AS total_356,
+    coalesce(u.name_357, 'unknown') AS name_357,
+    cast(t.value_358 AS double) * 100 / t.count_358 AS ratio_358,
+    concat(t.first_359, ' ', t.last_359) AS full_359,
+    t.col_360,
+    sum(t.amount_361) AS total_361,
+    coalesce(u.name_362, 'unknown') AS name_362,
+    cast(t.value_363 AS double) * 100 / t.count_363 AS ratio_363,
+    concat(t.first_364, ' ', t.last_364) AS full_364,
+    t.col_365,
+    sum(t.amount_366) AS total_366,
+    coalesce(u.name_367, 'unknown') AS name_367,
+    cast(t.value_368 AS double) * 100 / t.count_368 AS ratio_368,
+    concat(t.first_369, ' ', t.last_369) AS full_369,
+    t.col_370,
+    sum(t.amount_371) AS total_371,
+    coalesce(u.name_372, 'unknown') AS name_372,
+    cast(t.value_373 AS double) * 100 / t.count_373 AS ratio_373,
+    concat(t.first_374, ' ', t.last_374) AS full_374,
+    t.col_375,
+    sum(t.amount_376) AS total_376,
+    coalesce(u.name_377, 'unknown') AS name_377,
+    cast(t.value_378 AS double) * 100 / t.count_378 AS ratio_378,
+    concat(t.first_379, ' ', t.last_379) AS full_379,
+    t.col_380,
+    sum(t.amount_381) AS total_381,
+    coalesce(u.name_382, 'unknown') AS name_382,
+    cast(t.value_383 AS double) * 100 / t.count_383 AS ratio_383,
+    concat(t.first_384, ' ', t.last_384) AS full_384,
+    t.col_385,
+    sum(t.amount_386) AS total_386,
+    coalesce(u.name_387, 'unknown') AS name_387,
+    cast(t.value_388 AS double) * 100 / t.count_388 AS ratio_388,
+    concat(t.first_389, ' ', t.last_389) AS full_389,
+    t.col_390,
+    sum(t.amount_391) AS total_391,
+    coalesce(u.name_392, 'unknown') AS name_392,
+    cast(t.value_393 AS double) * 100 / t.count_393 AS ratio_393,
+    concat(t.first_394, ' ', t.last_394) AS full_394,
+    t.col_395,
+    sum(t.amount_396) AS total_396,
+    coalesce(u.name_397, 'unknown') AS name_397,
+    cast(t.value_398 AS double) * 100 / t.count_398 AS ratio_398,
+    concat(t.first_399, ' ', t.last_399) AS full_399,
+    t.col_400,
+    sum(t.amount_401) AS total_401,
+    coalesce(u.name_402, 'unknown') AS name_402,
+    cast(t.value_403 AS double) * 100 / t.count_403 AS ratio_403,
+    concat(t.first_404, ' ', t.last_404) AS full_404,
+    t.col_405,
+    sum(t.amount_406) AS total_406,
+    coalesce(u.name_407, 'unknown') AS name_407,
+    cast(t.value_408 AS double) * 100 / t.count_408 AS ratio_408,
+    concat(t.first_409, ' ', t.last_409) AS full_409,
+    t.col_410,
+    sum(t.amount_411) AS total_411,
+    coalesce(u.name_412, 'unknown') AS name_412,
+    cast(t.value_413 AS double) * 100 / t.count_413 AS ratio_413,
+    concat(t.first_414, ' ', t.last_414) AS full_414,
+    t.col_415,
+    sum(t.amount_416) AS total_416,
+    coalesce(u.name_417, 'unknown') AS name_417,
+    cast(t.value_418 AS double) * 100 / t.count_418 AS ratio_418,
+    concat(t.first_419, ' ', t.last_419) AS full_419,
+    t.col_420,
+    sum(t.amount_421) AS total_421,
+    coalesce(u.name_422, 'unknown') AS name_422,
+    cast(t.value_423 AS double) * 100 / t.count_423 AS ratio_423,
+    concat(t.first_424, ' ', t.last_424) AS full_424,
+    t.col_425,
+    sum(t.amount_426) AS total_426,
+    coalesce(u.name_427, 'unknown') AS name_427,
+    cast(t.value_428 AS double) * 100 / t.count_428 AS ratio_428,
+    concat(t.first_429, ' ', t.last_429) AS full_429,
+    t.col_430,
+    sum(t.amount_431) AS total_431,
+    coalesce(u.name_432, 'unknown') AS name_432,
+    cast(t.value_433 AS double) * 100 / t.count_433 AS ratio_433,
+    concat(t.first_434, ' ', t.last_434) AS full_434,
+    t.col_435,
+    sum(t.amount_436) AS total_436,
+    coalesce(u.name_437, 'unknown') AS name_437,
+    cast(t.value_438 AS double) * 100 / t.count_438 AS ratio_438,
+    concat(t.first_439, ' ', t.last_439) AS full_439,
+    t.col_440,
+    sum(t.amount_441) AS total_441,
+    coalesce(u.name_442, 'unknown') AS name_442,
+    cast(t.value_443 AS double) * 100 / t.count_443 AS ratio_443,
+    concat(t.first_444, ' ', t.last_444) AS full_444,
+    t.col_445,
+    sum(t.amount_446) AS total_446,
+    coalesce(u.name_447, 'unknown') AS name_447,
+    cast(t.value_448 AS double) * 100 / t.count_448 AS ratio_448,
+    concat(t.first_449, ' ', t.last_449) AS full_449,
+    t.col_450,
+    sum(t.amount_451) AS total_451,
+    coalesce(u.name_452, 'unknown') AS name_452,
+    cast(t.value_453 AS double) * 100 / t.count_453 AS ratio_453,
+    concat(t.first_454, ' ', t.last_454) AS full_454,
+    t.col_455,
+    sum(t.amount_456) AS total_456,
+    coalesce(u.name_457, 'unknown') AS name_457,
+    cast(t.value_458 AS double) * 100 / t.count_458 AS ratio_458,
+    concat(t.first_459, ' ', t.last_459) AS full_459,
+    t.col_460,
+    sum(t.amount_461) AS total_461,
+    coalesce(u.name_462, 'unknown') AS name_462,
+    cast(t.value_463 AS double) * 100 / t.count_463 AS ratio_463,
+    concat(t.first_464, ' ', t.last_464) AS full_464,
+    t.col_465,
+    sum(t.amount_466) AS total_466,
+    coalesce(u.name_467, 'unknown') AS name_467,
+    cast(t.value_468 AS double) * 100 / t.count_468 AS ratio_468,
+    concat(t.first_469, ' ', t.last_469) AS full_469,
+    t.col_470,
+    sum(t.amount_471) AS total_471,
+    coalesce(u.name_472, 'unknown') AS name_472,
+    cast(t.value_473 AS double) * 100 / t.count_473 AS ratio_473,
+    concat(t.first_474, ' ', t.last_474) AS full_474,
+    t.col_475,
+    sum(t.amount_476) AS total_476,
+    coalesce(u.name_477, 'unknown') AS name_477,
+    cast(t.value_478 AS double) * 100 / t.count_478 AS ratio_478,
+    concat(t.first_479, ' ', t.last_479) AS full_479,
+    t.col_480,
+    sum(t.amount_481) AS total_481,
+    coalesce(u.name_482, 'unknown') AS name_482,
+    cast(t.value_483 AS double) * 100 / t.count_483 AS ratio_483,
+    concat(t.first_484, ' ', t.last_484) AS full_484,
+    t.col_485,
+    sum(t.amount_486) AS total_486,
+    coalesce(u.name_487, 'unknown') AS name_487,
+    cast(t.value_488 AS double) * 100 / t.count_488 AS ratio_488,
+    concat(t.first_489, ' ', t.last_489) AS full_489,
+    t.col_490,
+    sum(t.amount_491) AS total_491,
+    coalesce(u.name_492, 'unknown') AS name_492,
+    cast(t.value_493 AS double) * 100 / t.count_493 AS ratio_493,
+    concat(t.first_494, ' ', t.last_494) AS full_494,
+    t.col_495,
+    sum(t.amount_496) AS total_496,
+    coalesce(u.name_497, 'unknown') AS name_497,
+    cast(t.value_498 AS double) * 100 / t.count_498 AS ratio_498,
+    concat(t.first_499, ' ', t.last_499) AS full_499,
+    t.col_500,
+    sum(t.amount_501) AS total_501,
+    coalesce(u.name_502, 'unknown') AS name_502,
+    cast(t.value_503 AS double) * 100 / t.count_503 AS ratio_503,
+    concat(t.first_504, ' ', t.last_504) AS full_504,
+    t.col_505,
+    sum(t.amount_506) AS total_506,
+    coalesce(u.name_507, 'unknown') AS name_507,
+    cast(t.value_508 AS double) * 100 / t.count_508 AS ratio_508,
+    concat(t.first_509, ' ', t.last_509) AS full_509,
+    t.col_510,
+    sum(t.amount_511) AS total_511,
+    coalesce(u.name_512, 'unknown') AS name_512,
+    cast(t.value_513 AS double) * 100 / t.count_513 AS ratio_513,
+    concat(t.first_514, ' ', t.last_514) AS full_514,
+    t.col_515,
+    sum(t.amount_516) AS total_516,
+    coalesce(u.name_517, 'unknown') AS name_517,
+    cast(t.value_518 AS double) * 100 / t.count_518 AS ratio_518,
+    concat(t.first_519, ' ', t.last_519) AS full_519,
+    t.col_520,
+    sum(t.amount_521) AS total_521,
+    coalesce(u.name_522, 'unknown') AS name_522,
+    cast(t.value_523 AS double) * 100 / t.count_523 AS ratio_523,
+    concat(t.first_524, ' ', t.last_524) AS full_524,
+    t.col_525,
+    sum(t.amount_526) AS total_526,
+    coalesce(u.name_527, 'unknown') AS name_527,
+    cast(t.value_528 AS double) * 100 / t.count_528 AS ratio_528,
+    concat(t.first_529, ' ', t.last_529) AS full_529,
+    t.col_530,
+    sum(t.amount_531) AS total_531,
+    coalesce(u.name_532, 'unknown') AS name_532,
+    cast(t.value_533 AS double) * 100 / t.count_533 AS ratio_533,
+    concat(t.first_534, ' ', t.last_534) AS full_534,
+    t.col_535,
+    sum(t.amount_536) AS total_536,
+    coalesce(u.name_537, 'unknown') AS name_537,
+    cast(t.value_538 AS double) * 100 / t.count_538 AS ratio_538,
+    concat(t.first_539, ' ', t.last_539) AS full_539,
+    t.col_540,
+    sum(t.amount_541) AS total_541,
+    coalesce(u.name_542, 'unknown') AS name_542,
+    cast(t.value_543 AS double) * 100 / t.count_543 AS ratio_543,
+    concat(t.first_544, ' ', t.last_544) AS full_544,
+    t.col_545,
+    sum(t.amount_546) AS total_546,
+    coalesce(u.name_547, 'unknown') AS name_547,
+    cast(t.value_548 AS double) * 100 / t.count_548 AS ratio_548,
+    concat(t.first_549, ' ', t.last_549) AS full_549,
+    t.col_550,
+    sum(t.amount_551) AS total_551,
+    coalesce(u.name_552, 'unknown') AS name_552,
+    cast(t.value_553 AS double) * 100 / t.count_553 AS ratio_553,
+    concat(t.first_554, ' ', t.last_554) AS full_554,
+    t.col_555,
+    sum(t.amount_556) AS total_556,
+    coalesce(u.name_557, 'unknown') AS name_557,
+    cast(t.value_558 AS double) * 100 / t.count_558 AS ratio_558,
+    concat(t.first_559, ' ', t.last_559) AS full_559,
+    t.col_560,
+    sum(t.amount_561) AS total_561,
+    coalesce(u.name_562, 'unknown') AS name_562,
+    cast(t.value_563 AS double) * 100 / t.count_563 AS ratio_563,
+    concat(t.first_564, ' ', t.last_564) AS full_564,
+    t.col_565,
+    sum(t.amount_566) AS total_566,
+    coalesce(u.name_567, 'unknown') AS name_567,
+    cast(t.value_568 AS double) * 100 / t.count_568 AS ratio_568,
+    concat(t.first_569, ' ', t.last_569) AS full_569,
+    t.col_570,
+    sum(t.amount_571) AS total_571,
+    coalesce(u.name_572, 'unknown') AS name_572,
+    cast(t.value_573 AS double) * 100 / t.count_573 AS ratio_573,
+    concat(t.first_574, ' ', t.last_574) AS full_574,
+    t.col_575,
+    sum(t.amount_576) AS total_576,
+    coalesce(u.name_577, 'unknown') AS name_577,
+    cast(t.value_578 AS double) * 100 / t.count_578 AS ratio_578,
+    concat(t.first_579, ' ', t.last_579) AS full_579,
+    t.col_580,
+    sum(t.amount_581) AS total_581,
+    coalesce(u.name_582, 'unknown') AS name_582,
+    cast(t.value_583 AS double) * 100 / t.count_583 AS ratio_583,
+    concat(t.first_584, ' ', t.last_584) AS full_584,
+    t.col_585,
+    sum(t.amount_586) AS total_586,
+    coalesce(u.name_587, 'unknown') AS name_587,
+    cast(t.value_588 AS double) * 100 / t.count_588 AS ratio_588,
+    concat(t.first_589, ' ', t.last_589) AS full_589,
+    t.col_590,
+    sum(t.amount_591) AS total_591,
+    coalesce(u.name_592, 'unknown') AS name_592,
+    cast(t.value_593 AS double) * 100 / t.count_593 AS ratio_593,
+    concat(t.first_594, ' ', t.last_594) AS full_594,
+    t.col_595,
+    sum(t.amount_596) AS total_596,
+    coalesce(u.name_597, 'unknown') AS name_597,
+    cast(t.value_598 AS double) * 100 / t.count_598 AS ratio_598,
+    concat(t.first_599, ' ', t.last_599) AS full_599,
+    t.col_600,
+    sum(t.amount_601) AS total_601,
+    coalesce(u.name_602, 'unknown') AS name_602,
+    cast(t.value_603 AS double) * 100 / t.count_603 AS ratio_603,
+    concat(t.first_604, ' ', t.last_604) AS full_604,
+    t.col_605,
+    sum(t.amount_606) AS total_606,
+    coalesce(u.name_607, 'unknown') AS name_607,
+    cast(t.value_608 AS double) * 100 / t.count_608 AS ratio_608,
+    concat(t.first_609, ' ', t.last_609) AS full_609,
+    t.col_610,
+    sum(t.amount_611) AS total_611,
+    coalesce(u.name_612, 'unknown') AS name_612,
+    cast(t.value_613 AS double) * 100 / t.count_613 AS ratio_613,
+    concat(t.first_614, ' ', t.last_614) AS full_614,
+    t.col_615,
+    sum(t.amount_616) AS total_616,
+    coalesce(u.name_617, 'unknown') AS name_617,
+    cast(t.value_618 AS double) * 100 / t.count_618 AS ratio_618,
+    concat(t.first_619, ' ', t.last_619) AS full_619,
+    t.col_620,
+    sum(t.amount_621) AS total_621,
+    coalesce(u.name_622, 'unknown') AS name_622,
+    cast(t.value_623 AS double) * 100 / t.count_623 AS ratio_623,
+    concat(t.first_624, ' ', t.last_624) AS full_624,
+    t.col_625,
+    sum(t.amount_626) AS total_626,
+    coalesce(u.name_627, 'unknown') AS name_627,
+    cast(t.value_628 AS double) * 100 / t.count_628 AS ratio_628,
+    concat(t.first_629, ' ', t.last_629) AS full_629,
+    t.col_630,
+    sum(t.amount_631) AS total_631,
+    coalesce(u.name_632, 'unknown') AS name_632,
+    cast(t.value_633 AS double) * 100 / t.count_633 AS ratio_633,
+    concat(t.first_634, ' ', t.last_634) AS full_634,
+    t.col_635,
+    sum(t.amount_636) AS total_636,
+    coalesce(u.name_637, 'unknown') AS name_637,
+    cast(t.value_638 AS double) * 100 / t.count_638 AS ratio_638,
+    concat(t.first_639, ' ', t.last_639) AS full_639,
+    t.col_640,
+    sum(t.amount_641) AS total_641,
+    coalesce(u.name_642, 'unknown') AS name_642,
+    cast(t.value_643 AS double) * 100 / t.count_643 AS ratio_643,
+    concat(t.first_644, ' ', t.last_644) AS full_644,
+    t.col_645,
+    sum(t.amount_646) AS total_646,
+    coalesce(u.name_647, 'unknown') AS name_647,
+    cast(t.value_648 AS double) * 100 / t.count_648 AS ratio_648,
+    concat(t.first_649, ' ', t.last_649) AS full_649,
+    t.col_650,
+    sum(t.amount_651) AS total_651,
+    coalesce(u.name_652, 'unknown') AS name_652,
+    cast(t.value_653 AS double) * 100 / t.count_653 AS ratio_653,
+    concat(t.first_654, ' ', t.last_654) AS full_654,
+    t.col_655,
+    sum(t.amount_656) AS total_656,
+    coalesce(u.name_657, 'unknown') AS name_657,
+    cast(t.value_658 AS double) * 100 / t.count_658 AS ratio_658,
+    concat(t.first_659, ' ', t.last_659) AS full_659,
+    t.col_660,
+    sum(t.amount_661) AS total_661,
+    coalesce(u.name_662, 'unknown') AS name_662,
+    cast(t.value_663 AS double) * 100 / t.count_663 AS ratio_663,
+    concat(t.first_664, ' ', t.last_664) AS full_664,
+    t.col_665,
+    sum(t.amount_666) AS total_666,
+    coalesce(u.name_667, 'unknown') AS name_667,
+    cast(t.value_668 AS double) * 100 / t.count_668 AS ratio_668,
+    concat(t.first_669, ' ', t.last_669) AS full_669,
+    t.col_670,
+    sum(t.amount_671) AS total_671,
+    coalesce(u.name_672, 'unknown') AS name_672,
+    cast(t.value_673 AS double) * 100 / t.count_673 AS ratio_673,
+    concat(t.first_674, ' ', t.last_674) AS full_674,
+    t.col_675,
+    sum(t.amount_676) AS total_676,
+    coalesce(u.name_677, 'unknown') AS name_677,
+    cast(t.value_678 AS double) * 100 / t.count_678 AS ratio_678,
+    concat(t.first_679, ' ', t.last_679) AS full_679,
+    t.col_680,
+    sum(t.amount_681) AS total_681,
+    coalesce(u.name_682, 'unknown') AS name_682,
+    cast(t.value_683 AS double) * 100 / t.count_683 AS ratio_683,
+    concat(t.first_684, ' ', t.last_684) AS full_684,
+    t.col_685,
+    sum(t.amount_686) AS total_686,
+    coalesce(u.name_687, 'unknown') AS name_687,
+    cast(t.value_688 AS double) * 100 / t.count_688 AS ratio_688,
+    concat(t.first_689, ' ', t.last_689) AS full_689,
+    t.col_690,
+    sum(t.amount_691) AS total_691,
+    coalesce(u.name_692, 'unknown') AS name_692,
+    cast(t.value_693 AS double) * 100 / t.count_693 AS ratio_693,
+    concat(t.first_694, ' ', t.last_694) AS full_694,
+    t.col_695,
+    sum(t.amount_696) AS total_696,
+    coalesce(u.name_697, 'unknown') AS name_697,
+    cast(t.value_698 AS double) * 100 / t.count_698 AS ratio_698,
+    concat(t.first_699, ' ', t.last_699) AS full_699,
+    t.col_700,
+    sum(t.amount_701) AS total_701,
+    coalesce(u.name_702, 'unknown') AS name_702,
+    cast(t.value_703 AS double) * 100 / t.count_703 AS ratio_703,
+    concat(t.first_704, ' ', t.last_704) AS full_704,
+    t.col_705,
+    sum(t.amount_706) AS total_706,
+    coalesce(u.name_707, 'unknown') AS name_707,
+    cast(t.value_708 AS double) * 100 / t.count_708 AS ratio_708,
+    concat(t.first_709, ' ', t.last_709) AS full_709,
+    t.col_710,
+    sum(t.amount_711) AS total_711,
+    coalesce(u.name_712, 'unknown') AS name_712,
+    cast(t.value_713 AS double) * 100 / t.count_713 AS ratio_713,
+    concat(t.first_714, ' ', t.last_714) AS full_714,
+    t.col_715,
+    sum(t.amount_716) AS total_716,
+    coalesce(u.name_717, 'unknown') AS name_717,
+    cast(t.value_718 AS double) * 100 / t.count_718 AS ratio_718,
+    concat(t.first_719, ' ', t.last_719) AS full_719,
+    t.col_720,
+    sum(t.amount_721) AS total_721,
+    coalesce(u.name_722, 'unknown') AS name_722,
+    cast(t.value_723 AS double) * 100 / t.count_723 AS ratio_723,
+    concat(t.first_724, ' ', t.last_724) AS full_724,
+    t.col_725,
+    sum(t.amount_726) AS total_726,
+    coalesce(u.name_727, 'unknown') AS name_727,
+    cast(t.value_728 AS double) * 100 / t.count_728 AS ratio_728,
+    concat(t.first_729, ' ', t.last_729) AS full_729,
+    t.col_730,
+    sum(t.amount_731) AS total_731,
+    coalesce(u.name_732, 'unknown') AS name_732,
+    cast(t.value_733 AS double) * 100 / t.count_733 AS ratio_733,
+    concat(t.first_734, ' ', t.last_734) AS full_734,
+    t.col_735,
+    sum(t.amount_736) AS total_736,
+    coalesce(u.name_737, 'unknown') AS name_737,
+    cast(t.value_738 AS double) * 100 / t.count_738 AS ratio_738,
+    concat(t.first_739, ' ', t.last_739) AS full_739,
+    t.col_740,
+    sum(t.amount_741) AS total_741,
+    coalesce(u.name_742, 'unknown') AS name_742,
+    cast(t.value_743 AS double) * 100 / t.count_743 AS ratio_743,
+    concat(t.first_744, ' ', t.last_744) AS full_744,
+    t.col_745,
+    sum(t.amount_746) AS total_746,
+    coalesce(u.name_747, 'unknown') AS name_747,
+    cast(t.value_748 AS double) * 100 / t.count_748 AS ratio_748,
+    concat(t.first_749, ' ', t.last_749) AS full_749,
+    t.col_750,
+    sum(t.amount_751) AS total_751,
+    coalesce(u.name_752, 'unknown') AS name_752,
+    cast(t.value_753 AS double) * 100 / t.count_753 AS ratio_753,
+    concat(t.first_754, ' ', t.last_754) AS full_754,
+    t.col_755,
+    sum(t.amount_756) AS total_756,
+    coalesce(u.name_757, 'unknown') AS name_757,
+    cast(t.value_758 AS double) * 100 / t.count_758 AS ratio_758,
+    concat(t.first_759, ' ', t.last_759) AS full_759,
+    t.col_760,
+    sum(t.amount_761) AS total_761,
+    coalesce(u.name_762, 'unknown') AS name_762,
+    cast(t.value_763 AS double) * 100 / t.count_763 AS ratio_763,
+    concat(t.first_764, ' ', t.last_764) AS full_764,
+    t.col_765,
+    sum(t.amount_766) AS total_766,
+    coalesce(u.name_767, 'unknown') AS name_767,
+    cast(t.value_768 AS double) * 100 / t.count_768 AS ratio_768,
+    concat(t.first_769, ' ', t.last_769) AS full_769,
+    t.col_770,
+    sum(t.amount_771) AS total_771,
+    coalesce(u.name_772, 'unknown') AS name_772,
+    cast(t.value_773 AS double) * 100 / t.count_773 AS ratio_773,
+    concat(t.first_774, ' ', t.last_774) AS full_774,
+    t.col_775,
+    sum(t.amount_776) AS total_776,
+    coalesce(u.name_777, 'unknown') AS name_777,
+    cast(t.value_778 AS double) * 100 / t.count_778 AS ratio_778,
+    concat(t.first_779, ' ', t.last_779) AS full_779,
+    t.col_780,
+    sum(t.amount_781) AS total_781,
+    coalesce(u.name_782, 'unknown') AS name_782,
+    cast(t.value_783 AS double) * 100 / t.count_783 AS ratio_783,
+    concat(t.first_784, ' ', t.last_784) AS full_784,
+    t.col_785,
+    sum(t.amount_786) AS total_786,
+    coalesce(u.name_787, 'unknown') AS name_787,
+    cast(t.value_788 AS double) * 100 / t.count_788 AS ratio_788,
+    concat(t.first_789, ' ', t.last_789) AS full_789,
+    t.col_790,
+    sum(t.amount_791) AS total_791,
+    coalesce(u.name_792, 'unknown') AS name_792,
+    cast(t.value_793 AS double) * 100 / t.count_793 AS ratio_793,
+    concat(t.first_794, ' ', t.last_794) AS full_794,
+    t.col_795,
+    sum(t.amount_796) AS total_796,
+    coalesce(u.name_797, 'unknown') AS name_797,
+    cast(t.value_798 AS double) * 100 / t.count_798 AS ratio_798,
+    concat(t.first_799, ' ', t.last_799) AS full_799,
+    t.col_800,
+    sum(t.amount_801) AS total_801,
+    coalesce(u.name_802, 'unknown') AS name_802,
+    cast(t.value_803 AS double) * 100 / t.count_803 AS ratio_803,
+    concat(t.first_804, ' ', t.last_804) AS full_804,
+    t.col_805,
+    sum(t.amount_806) AS total_806,
+    coalesce(u.name_807, 'unknown') AS name_807,
+    cast(t.value_808 AS double) * 100 / t.count_808 AS ratio_808,
+    concat(t.first_809, ' ', t.last_809) AS full_809,
+    t.col_810,
+    sum(t.amount_811) AS total_811,
+    coalesce(u.name_812, 'unknown') AS name_812,
+    cast(t.value_813 AS double) * 100 / t.count_813 AS ratio_813,
+    concat(t.first_814, ' ', t.last_814) AS full_814,
+    t.col_815,
+    sum(t.amount_816) AS total_816,
+    coalesce(u.name_817, 'unknown') AS name_817,
+    cast(t.value_818 AS double) * 100 / t.count_818 AS ratio_818,
+    concat(t.first_819, ' ', t.last_819) AS full_819,
+    t.col_820,
+    sum(t.amount_821) AS total_821,
+    coalesce(u.name_822, 'unknown') AS name_822,
+    cast(t.value_823 AS double) * 100 / t.count_823 AS ratio_823,
+    concat(t.first_824, ' ', t.last_824) AS full_824,
+    t.col_825,
+    sum(t.amount_826) AS total_826,
+    coalesce(u.name_827, 'unknown') AS name_827,
+    cast(t.value_828 AS double) * 100 / t.count_828 AS ratio_828,
+    concat(t.first_829, ' ', t.last_829) AS full_829,
+    t.col_830,
+    sum(t.amount_831) AS total_831,
+    coalesce(u.name_832, 'unknown') AS name_832,
+    cast(t.value_833 AS double) * 100 / t.count_833 AS ratio_833,
+    concat(t.first_834, ' ', t.last_834) AS full_834,
+    t.col_835,
+    sum(t.amount_836) AS total_836,
+    coalesce(u.name_837, 'unknown') AS name_837,
+    cast(t.value_838 AS double) * 100 / t.count_838 AS ratio_838,
+    concat(t.first_839, ' ', t.last_839) AS full_839,
+    t.col_840,
+    sum(t.amount_841) AS total_841,
+    coalesce(u.name_842, 'unknown') AS name_842,
+    cast(t.value_843 AS double) * 100 / t.count_843 AS ratio_843,
+    concat(t.first_844, ' ', t.last_844) AS full_844,
+    t.col_845,
+    sum(t.amount_846) AS total_846,
+    coalesce(u.name_847, 'unknown') AS name_847,
+    cast(t.value_848 AS double) * 100 / t.count_848 AS ratio_848,
+    concat(t.first_849, ' ', t.last_849) AS full_849,
+    t.col_850,
+    sum(t.amount_851) AS total_851,
+    coalesce(u.name_852, 'unknown') AS name_852,
+    cast(t.value_853 AS double) * 100 / t.count_853 AS ratio_853,
+    concat(t.first_854, ' ', t.last_854) AS full_854,
+    t.col_855,
+    sum(t.amount_856) AS total_856,
+    coalesce(u.name_857, 'unknown') AS name_857,
+    cast(t.value_858 AS double) * 100 / t.count_858 AS ratio_858,
+    concat(t.first_859, ' ', t.last_859) AS full_859,
+    t.col_860,
+    sum(t.amount_861) AS total_861,
+    coalesce(u.name_862, 'unknown') AS name_862,
+    cast(t.value_863 AS double) * 100 / t.count_863 AS ratio_863,
+    concat(t.first_864, ' ', t.last_864) AS full_864,
+    t.col_865,
+    sum(t.amount_866) AS total_866,
+    coalesce(u.name_867, 'unknown') AS name_867,
+    cast(t.value_868 AS double) * 100 / t.count_868 AS ratio_868,
+    concat(t.first_869, ' ', t.last_869) AS full_869,
+    t.col_870,
+    sum(t.amount_871) AS total_871,
+    coalesce(u.name_872, 'unknown') AS name_872,
+    cast(t.value_873 AS double) * 100 / t.count_873 AS ratio_873,
+    concat(t.first_874, ' ', t.last_874) AS full_874,
+    t.col_875,
+    sum(t.amount_876) AS total_876,
+    coalesce(u.name_877, 'unknown') AS name_877,
+    cast(t.value_878 AS double) * 100 / t.count_878 AS ratio_878,
+    concat(t.first_879, ' ', t.last_879) AS full_879,
+    t.col_880,
+    sum(t.amount_881) AS total_881,
+    coalesce(u.name_882, 'unknown') AS name_882,
+    cast(t.value_883 AS double) * 100 / t.count_883 AS ratio_883,
+    concat(t.first_884, ' ', t.last_884) AS full_884,
+    t.col_885,
+    sum(t.amount_886) AS total_886,
+    coalesce(u.name_887, 'unknown') AS name_887,
+    cast(t.value_888 AS double) * 100 / t.count_888 AS ratio_888,
+    concat(t.first_889, ' ', t.last_889) AS full_889,
+    t.col_890,
+    sum(t.amount_891) AS total_891,
+    coalesce(u.name_892, 'unknown') AS name_892,
+    cast(t.value_893 AS double) * 100 / t.count_893 AS ratio_893,
+    concat(t.first_894, ' ', t.last_894) AS full_894,
+    t.col_895,
+    sum(t.amount_896) AS total_896,
+    coalesce(u.name_897, 'unknown') AS name_897,
+    cast(t.value_898 AS double) * 100 / t.count_898 AS ratio_898,
+    concat(t.first_899, ' ', t.last_899) AS full_899,
+    t.col_900,
+    sum(t.amount_901) AS total_901,
+    coalesce(u.name_902, 'unknown') AS name_902,
+    cast(t.value_903 AS double) * 100 / t.count_903 AS ratio_903,
+    concat(t.first_904, ' ', t.last_904) AS full_904,
+    t.col_905,
+    sum(t.amount_906) AS total_906,
+    coalesce(u.name_907, 'unknown') AS name_907,
+    cast(t.value_908 AS double) * 100 / t.count_908 AS ratio_908,
+    concat(t.first_909, ' ', t.last_909) AS full_909,
+    t.col_910,
+    sum(t.amount_911) AS total_911,
+    coalesce(u.name_912, 'unknown') AS name_912,
+    cast(t.value_913 AS double) * 100 / t.count_913 AS ratio_913,
+    concat(t.first_914, ' ', t.last_914) AS full_914,
+    t.col_915,
+    sum(t.amount_916) AS total_916,
+    coalesce(u.name_917, 'unknown') AS name_917,
+    cast(t.value_918 AS double) * 100 / t.count_918 AS ratio_918,
+    concat(t.first_919, ' ', t.last_919) AS full_919,
+    t.col_920,
+    sum(t.amount_921) AS total_921,
+    coalesce(u.name_922, 'unknown') AS name_922,
+    cast(t.value_923 AS double) * 100 / t.count_923 AS ratio_923,
+    concat(t.first_924, ' ', t.last_924) AS full_924,
+    t.col_925,
+    sum(t.amount_926) AS total_926,
+    coalesce(u.name_927, 'unknown') AS name_927,
+    cast(t.value_928 AS double) * 100 / t.count_928 AS ratio_928,
+    concat(t.first_929, ' ', t.last_929) AS full_929,
+    t.col_930,
+    sum(t.amount_931) AS total_931,
+    coalesce(u.name_932, 'unknown') AS name_932,
+    cast(t.value_933 AS double) * 100 / t.count_933 AS ratio_933,
+    concat(t.first_934, ' ', t.last_934) AS full_934,
+    t.col_935,
+    sum(t.amount_936) AS total_936,
+    coalesce(u.name_937, 'unknown') AS name_937,
+    cast(t.value_938 AS double) * 100 / t.count_938 AS ratio_938,
+    concat(t.first_939, ' ', t.last_939) AS full_939,
+    t.col_940,
+    sum(t.amount_941) AS total_941,
+    coalesce(u.name_942, 'unknown') AS name_942,
+    cast(t.value_943 AS double) * 100 / t.count_943 AS ratio_943,
+    concat(t.first_944, ' ', t.last_944) AS full_944,
+    t.col_945,
+    sum(t.amount_946) AS total_946,
+    coalesce(u.name_947, 'unknown') AS name_947,
+    cast(t.value_948 AS double) * 100 / t.count_948 AS ratio_948,
+    concat(t.first_949, ' ', t.last_949) AS full_949,
+    t.col_950,
+    sum(t.amount_951) AS total_951,
+    coalesce(u.name_952, 'unknown') AS name_952,
+    cast(t.value_953 AS double) * 100 / t.count_953 AS ratio_953,
+    concat(t.first_954, ' ', t.last_954) AS full_954,
+    t.col_955,
+    sum(t.amount_956) AS total_956,
+    coalesce(u.name_957, 'unknown') AS name_957,
+    cast(t.value_958 AS double) * 100 / t.count_958 AS ratio_958,
+    concat(t.first_959, ' ', t.last_959) AS full_959,
+    t.col_960,
+    sum(t.amount_961) AS total_961,
+    coalesce(u.name_962, 'unknown') AS name_962,
+    cast(t.value_963 AS double) * 100 / t.count_963 AS ratio_963,
+    concat(t.first_964, ' ', t.last_964) AS full_964,
+    t.col_965,
+    sum(t.amount_966) AS total_966,
+    coalesce(u.name_967, 'unknown') AS name_967,
+    cast(t.value_968 AS double) * 100 / t.count_968 AS ratio_968,
+    concat(t.first_969, ' ', t.last_969) AS full_969,
+    t.col_970,
+    sum(t.amount_971) AS total_971,
+    coalesce(u.name_972, 'unknown') AS name_972,
+    cast(t.value_973 AS double) * 100 / t.count_973 AS ratio_973,
+    concat(t.first_974, ' ', t.last_974) AS full_974,
+    t.col_975,
+    sum(t.amount_976) AS total_976,
+    coalesce(u.name_977, 'unknown') AS name_977,
+    cast(t.value_978 AS double) * 100 / t.count_978 AS ratio_978,
+    concat(t.first_979, ' ', t.last_979) AS full_979,
+    t.col_980,
+    sum(t.amount_981) AS total_981,
+    coalesce(u.name_982, 'unknown') AS name_982,
+    cast(t.value_983 AS double) * 100 / t.count_983 AS ratio_983,
+    concat(t.first_984, ' ', t.last_984) AS full_984,
+    t.col_985,
+    sum(t.amount_986) AS total_986,
+    coalesce(u.name_987, 'unknown') AS name_987,
+    cast(t.value_988 AS double) * 100 / t.count_988 AS ratio_988,
+    concat(t.first_989, ' ', t.last_989) AS full_989,
+    t.col_990,
+    sum(t.amount_991) AS total_991,
+    coalesce(u.name_992, 'unknown') AS name_992,
+    cast(t.value_993 AS double) * 100 / t.count_993 AS ratio_993,
+    concat(t.first_994, ' ', t.last_994) AS full_994,
+    t.col_995,
+    sum(t.amount_996) AS total_996,
+    coalesce(u.name_997, 'unknown') AS name_997,
+    cast(t.value_998 AS double) * 100 / t.count_998 AS ratio_998,
+    concat(t.first_999, ' ', t.last_999) AS full_999,
+    t.col_1000,
+    sum(t.amount_1001) AS total_1001,
+    coalesce(u.name_1002, 'unknown') AS name_1002,
+    cast(t.value_1003 AS double) * 100 / t.count_1003 AS ratio_1003,
+    concat(t.first_1004, ' ', t.last_1004) AS full_1004,
+    t.col_1005,
+    sum(t.amount_1006) AS total_1006,
+    coalesce(u.name_1007, 'unknown') AS name_1007,
+    cast(t.value_1008 AS double) * 100 / t.count_1008 AS ratio_1008,
+    concat(t.first_1009, ' ', t.last_1009) AS full_1009,
+    t.col_1010,
+    sum(t.amount_1011) AS total_1011,
+    coalesce(u.name_1012, 'unknown') AS name_1012,
+    cast(t.value_1013 AS double) * 100 / t.count_1013 AS ratio_1013,
+    concat(t.first_1014, ' ', t.last_1014) AS full_1014,
+    t.col_1015,
+    sum(t.amount_1016) AS total_1016,
+    coalesce(u.name_1017, 'unknown') AS name_1017,
+    cast(t.value_1018 AS double) * 100 / t.count_1018 AS ratio_1018,
+    concat(t.first_1019, ' ', t.last_1019) AS full_1019,
+    t.col_1020,
+    sum(t.amount_1021) AS total_1021,
+    coalesce(u.name_1022, 'unknown') AS name_1022,
+    cast(t.value_1023 AS double) * 100 / t.count_1023 AS ratio_1023,
+    concat(t.first_1024, ' ', t.last_1024) AS full_1024,
+    t.col_1025,
+    sum(t.amount_1026) AS total_1026,
+    coalesce(u.name_1027, 'unknown') AS name_1027,
+    cast(t.value_1028 AS double) * 100 / t.count_1028 AS ratio_1028,
+    concat(t.first_1029, ' ', t.last_1029) AS full_1029,
+    t.col_1030,
+    sum(t.amount_1031) AS total_1031,
+    coalesce(u.name_1032, 'unknown') AS name_1032,
+    cast(t.value_1033 AS double) * 100 / t.count_1033 AS ratio_1033,
+    concat(t.first_1034, ' ', t.last_1034) AS full_1034,
+    t.col_1035,
+    sum(t.amount_1036) AS total_1036,
+    coalesce(u.name_1037, 'unknown') AS name_1037,
+    cast(t.value_1038 AS double) * 100 / t.count_1038 AS ratio_1038,
+    concat(t.first_1039, ' ', t.last_1039) AS full_1039,
+    t.col_1040,
+    sum(t.amount_1041) AS total_1041,
+    coalesce(u.name_1042, 'unknown') AS name_1042,
+    cast(t.value_1043 AS double) * 100 / t.count_1043 AS ratio_1043,
+    concat(t.first_1044, ' ', t.last_1044) AS full_1044,
+    t.col_1045,
+    sum(t.amount_1046) AS total_1046,
+    coalesce(u.name_1047, 'unknown') AS name_1047,
+    cast(t.value_1048 AS double) * 100 / t.count_1048 AS ratio_1048,
+    concat(t.first_1049, ' ', t.last_1049) AS full_1049,
+    t.col_1050,
+    sum(t.amount_1051) AS total_1051,
+    coalesce(u.name_1052, 'unknown') AS name_1052,
+    cast(t.value_1053 AS double) * 100 / t.count_1053 AS ratio_1053,
+    concat(t.first_1054, ' ', t.last_1054) AS full_1054,
+    t.col_1055,
+    sum(t.amount_1056) AS total_1056,
+    coalesce(u.name_1057, 'unknown') AS name_1057,
+    cast(t.value_1058 AS double) * 100 / t.count_1058 AS ratio_1058,
+    concat(t.first_1059, ' ', t.last_1059) AS full_1059,
+    t.col_1060,
+    sum(t.amount_1061) AS total_1061,
+    coalesce(u.name_1062, 'unknown') AS name_1062,
+    cast(t.value_1063 AS double) * 100 / t.count_1063 AS ratio_1063,
+    concat(t.first_1064, ' ', t.last_1064) AS full_1064,
+    t.col_1065,
+    sum(t.amount_1066) AS total_1066,
+    coalesce(u.name_1067, 'unknown') AS name_1067,
+    cast(t.value_1068 AS double) * 100 / t.count_1068 AS ratio_1068,
+    concat(t.first_1069, ' ', t.last_1069) AS full_1069,
+    t.col_1070,
+    sum(t.amount_1071) AS total_1071,
+    coalesce(u.name_1072, 'unknown') AS name_1072,
+    cast(t.value_1073 AS double) * 100 / t.count_1073 AS ratio_1073,
+    concat(t.first_1074, ' ', t.last_1074) AS full_1074,
+    t.col_1075,
+    sum(t.amount_1076) AS total_1076,
+    coalesce(u.name_1077, 'unknown') AS name_1077,
+    cast(t.value_1078 AS double) * 100 / t.count_1078 AS ratio_1078,
+    concat(t.first_1079, ' ', t.last_1079) AS full_1079,
+    t.col_1080,
+    sum(t.amount_1081) AS total_1081,
+    coalesce(u.name_1082, 'unknown') AS name_1082,
+    cast(t.value_1083 AS double) * 100 / t.count_1083 AS ratio_1083,
+    concat(t.first_1084, ' ', t.last_1084) AS full_1084,
+    t.col_1085,
+    sum(t.amount_1086) AS total_1086,
+    coalesce(u.name_1087, 'unknown') AS name_1087,
+    cast(t.value_1088 AS double) * 100 / t.count_1088 AS ratio_1088,
+    concat(t.first_1089, ' ', t.last_1089) AS full_1089,
+    t.col_1090,
+    sum(t.amount_1091) AS total_1091,
+    coalesce(u.name_1092, 'unknown') AS name_1092,
+    cast(t.value_1093 AS double) * 100 / t.count_1093 AS ratio_1093,
+    concat(t.first_1094, ' ', t.last_1094) AS full_1094,
+    t.col_1095,
+    sum(t.amount_1096) AS total_1096,
+    coalesce(u.name_1097, 'unknown') AS name_1097,
+    cast(t.value_1098 AS double) * 100 / t.count_1098 AS ratio_1098,
+    concat(t.first_1099, ' ', t.last_1099) AS full_1099,
+    t.col_1100,
+    sum(t.amount_1101) AS total_1101,
+    coalesce(u.name_1102, 'unknown') AS name_1102,
+    cast(t.value_1103 AS double) * 100 / t.count_1103 AS ratio_1103,
+    concat(t.first_1104, ' ', t.last_1104) AS full_1104,
+    t.col_1105,
+    sum(t.amount_1106) AS total_1106,
+    coalesce(u.name_1107, 'unknown') AS name_1107,
+    cast(t.value_1108 AS double) * 100 / t.count_1108 AS ratio_1108,
+    concat(t.first_1109, ' ', t.last_1109) AS full_1109,
+    t.col_1110,
+    sum(t.amount_1111) AS total_1111,
+    coalesce(u.name_1112, 'unknown') AS name_1112,
+    cast(t.value_1113 AS double) * 100 / t.count_1113 AS ratio_1113,
+    concat(t.first_1114, ' ', t.last_1114) AS full_1114,
+    t.col_1115,
+    sum(t.amount_1116) AS total_1116,
+    coalesce(u.name_1117, 'unknown') AS name_1117,
+    cast(t.value_1118 AS double) * 100 / t.count_1118 AS ratio_1118,
+    concat(t.first_1119, ' ', t.last_1119) AS full_1119,
+    t.col_1120,
+    sum(t.amount_1121) AS total_1121,
+    coalesce(u.name_1122, 'unknown') AS name_1122,
+    cast(t.value_1123 AS double) * 100 / t.count_1123 AS ratio_1123,
+    concat(t.first_1124, ' ', t.last_1124) AS full_1124,
+    t.col_1125,
+    sum(t.amount_1126) AS total_1126,
+    coalesce(u.name_1127, 'unknown') AS name_1127,
+    cast(t.value_1128 AS double) * 100 / t.count_1128 AS ratio_1128,
+    concat(t.first_1129, ' ', t.last_1129) AS full_1129,
+    t.col_1130,
+    sum(t.amount_1131) AS total_1131,
+    coalesce(u.name_1132, 'unknown') AS name_1132,
+    cast(t.value_1133 AS double) * 100 / t.count_1133 AS ratio_1133,
+    concat(t.first_1134, ' ', t.last_1134) AS full_1134,
+    t.col_1135,
+    sum(t.amount_1136) AS total_1136,
+    coalesce(u.name_1137, 'unknown') AS name_1137,
+    cast(t.value_1138 AS double) * 100 / t.count_1138 AS ratio_1138,
+    concat(t.first_1139, ' ', t.last_1139) AS full_1139,
+    t.col_1140,
+    sum(t.amount_1141) AS total_1141,
+    coalesce(u.name_1142, 'unknown') AS name_1142,
+    cast(t.value_1143 AS double) * 100 / t.count_1143 AS ratio_1143,
+    concat(t.first_1144, ' ', t.last_1144) AS full_1144,
+    t.col_1145,
+    sum(t.amount_1146) AS total_1146,
+    coalesce(u.name_1147, 'unknown') AS name_1147,
+    cast(t.value_1148 AS double) * 100 / t.count_1148 AS ratio_1148,
+    concat(t.first_1149, ' ', t.last_1149) AS full_1149,
+    t.col_1150,
+    sum(t.amount_1151) AS total_1151,
+    coalesce(u.name_1152, 'unknown') AS name_1152,
+    cast(t.value_1153 AS double) * 100 / t.count_1153 AS ratio_1153,
+    concat(t.first_1154, ' ', t.last_1154) AS full_1154,
+    t.col_1155,
+    sum(t.amount_1156) AS total_1156,
+    coalesce(u.name_1157, 'unknown') AS name_1157,
+    cast(t.value_1158 AS double) * 100 / t.count_1158 AS ratio_1158,
+    concat(t.first_1159, ' ', t.last_1159) AS full_1159,
+    t.col_1160,
+    sum(t.amount_1161) AS total_1161,
+    coalesce(u.name_1162, 'unknown') AS name_1162,
+    cast(t.value_1163 AS double) * 100 / t.count_1163 AS ratio_1163,
+    concat(t.first_1164, ' ', t.last_1164) AS full_1164,
+    t.col_1165,
+    sum(t.amount_1166) AS total_1166,
+    coalesce(u.name_1167, 'unknown') AS name_1167,
+    cast(t.value_1168 AS double) * 100 / t.count_1168 AS ratio_1168,
+    concat(t.first_1169, ' ', t.last_1169) AS full_1169,
+    t.col_1170,
+    sum(t.amount_1171) AS total_1171,
+    coalesce(u.name_1172, 'unknown') AS name_1172,
+    cast(t.value_1173 AS double) * 100 / t.count_1173 AS ratio_1173,
+    concat(t.first_1174, ' ', t.last_1174) AS full_1174,
+    t.col_1175,
+    sum(t.amount_1176) AS total_1176,
+    coalesce(u.name_1177, 'unknown') AS name_1177,
+    cast(t.value_1178 AS double) * 100 / t.count_1178 AS ratio_1178,
+    concat(t.first_1179, ' ', t.last_1179) AS full_1179,
+    t.col_1180,
+    sum(t.amount_1181) AS total_1181,
+    coalesce(u.name_1182, 'unknown') AS name_1182,
+    cast(t.value_1183 AS double) * 100 / t.count_1183 AS ratio_1183,
+    concat(t.first_1184, ' ', t.last_1184) AS full_1184,
+    t.col_1185,
+    sum(t.amount_1186) AS total_1186,
+    coalesce(u.name_1187, 'unknown') AS name_1187,
+    cast(t.value_1188 AS double) * 100 / t.count_1188 AS ratio_1188,
+    concat(t.first_1189, ' ', t.last_1189) AS full_1189,
+    t.col_1190,
+    sum(t.amount_1191) AS total_1191,
+    coalesce(u.name_1192, 'unknown') AS name_1192,
+    cast(t.value_1193 AS double) * 100 / t.count_1193 AS ratio_1193,
+    concat(t.first_1194, ' ', t.last_1194) AS full_1194,
+    t.col_1195,
+    sum(t.amount_1196) AS total_1196,
+    coalesce(u.name_1197, 'unknown') AS name_1197,
+    cast(t.value_1198 AS double) * 100 / t.count_1198 AS ratio_1198,
+    concat(t.first_1199, ' ', t.last_1199) AS full_1199,
+    t.col_1200,
+    sum(t.amount_1201) AS total_1201,
+    coalesce(u.name_1202, 'unknown') AS name_1202,
+    cast(t.value_1203 AS double) * 100 / t.count_1203 AS ratio_1203,
+    concat(t.first_1204, ' ', t.last_1204) AS full_1204,
+    t.col_1205,
+    sum(t.amount_1206) AS total_1206,
+    coalesce(u.name_1207, 'unknown') AS name_1207,
+    cast(t.value_1208 AS double) * 100 / t.count_1208 AS ratio_1208,
+    concat(t.first_1209, ' ', t.last_1209) AS full_1209,
+    t.col_1210,
+    sum(t.amount_1211) AS total_1211,
+    coalesce(u.name_1212, 'unknown') AS name_1212,
+    cast(t.value_1213 AS double) * 100 / t.count_1213 AS ratio_1213,
+    concat(t.first_1214, ' ', t.last_1214) AS full_1214,
+    t.col_1215,
+    sum(t.amount_1216) AS total_1216,
+    coalesce(u.name_1217, 'unknown') AS name_1217,
+    cast(t.value_1218 AS double) * 100 / t.count_1218 AS ratio_1218,
+    concat(t.first_1219, ' ', t.last_1219) AS full_1219,
+    t.col_1220,
+    sum(t.amount_1221) AS total_1221,
+    coalesce(u.name_1222, 'unknown') AS name_1222,
+    cast(t.value_1223 AS double) * 100 / t.count_1223 AS ratio_1223,
+    concat(t.first_1224, ' ', t.last_1224) AS full_1224,
+    t.col_1225,
+    sum(t.amount_1226) AS total_1226,
+    coalesce(u.name_1227, 'unknown') AS name_1227,
+    cast(t.value_1228 AS double) * 100 / t.count_1228 AS ratio_1228,
+    concat(t.first_1229, ' ', t.last_1229) AS full_1229,
+    t.col_1230,
+    sum(t.amount_1231) AS total_1231,
+    coalesce(u.name_1232, 'unknown') AS name_1232,
+    cast(t.value_1233 AS double) * 100 / t.count_1233 AS ratio_1233,
+    concat(t.first_1234, ' ', t.last_1234) AS full_1234,
+    t.col_1235,
+    sum(t.amount_1236) AS total_1236,
+    coalesce(u.name_1237, 'unknown') AS name_1237,
+    cast(t.value_1238 AS double) * 100 / t.count_1238 AS ratio_1238,
+    concat(t.first_1239, ' ', t.last_1239) AS full_1239,
+    t.col_1240,
+    sum(t.amount_1241) AS total_1241,
+    coalesce(u.name_1242, 'unknown') AS name_1242,
+    cast(t.value_1243 AS double) * 100 / t.count_1243 AS ratio_1243,
+    concat(t.first_1244, ' ', t.last_1244) AS full_1244,
+    t.col_1245,
+    sum(t.amount_1246) AS total_1246,
+    coalesce(u.name_1247, 'unknown') AS name_1247,
+    cast(t.value_1248 AS double) * 100 / t.count_1248 AS ratio_1248,
+    concat(t.first_1249, ' ', t.last_1249) AS full_1249,
+    t.col_1250,
+    sum(t.amount_1251) AS total_1251,
+    coalesce(u.name_1252, 'unknown') AS name_1252,
+    cast(t.value_1253 AS double) * 100 / t.count_1253 AS ratio_1253,
+    concat(t.first_1254, ' ', t.last_1254) AS full_1254,
+    t.col_1255,
+    sum(t.amount_1256) AS total_1256,
+    coalesce(u.name_1257, 'unknown') AS name_1257,
+    cast(t.value_1258 AS double) * 100 / t.count_1258 AS ratio_1258,
+    concat(t.first_1259, ' ', t.last_1259) AS full_1259,
+    t.col_1260,
+    sum(t.amount_1261) AS total_1261,
+    coalesce(u.name_1262, 'unknown') AS name_1262,
+    cast(t.value_1263 AS double) * 100 / t.count_1263 AS ratio_1263,
+    concat(t.first_1264, ' ', t.last_1264) AS full_1264,
+    t.col_1265,
+    sum(t.amount_1266) AS total_1266,
+    coalesce(u.name_1267, 'unknown') AS name_1267,
+    cast(t.value_1268 AS double) * 100 / t.count_1268 AS ratio_1268,
+    concat(t.first_1269, ' ', t.last_1269) AS full_1269,
+    t.col_1270,
+    sum(t.amount_1271) AS total_1271,
+    coalesce(u.name_1272, 'unknown') AS name_1272,
+    cast(t.value_1273 AS double) * 100 / t.count_1273 AS ratio_1273,
+    concat(t.first_1274, ' ', t.last_1274) AS full_1274,
+    t.col_1275,
+    sum(t.amount_1276) AS total_1276,
+    coalesce(u.name_1277, 'unknown') AS name_1277,
+    cast(t.value_1278 AS double) * 100 / t.count_1278 AS ratio_1278,
+    concat(t.first_1279, ' ', t.last_1279) AS full_1279,
+    t.col_1280,
+    sum(t.amount_1281) AS total_1281,
+    coalesce(u.name_1282, 'unknown') AS name_1282,
+    cast(t.value_1283 AS double) * 100 / t.count_1283 AS ratio_1283,
+    concat(t.first_1284, ' ', t.last_1284) AS full_1284,
+    t.col_1285,
+    sum(t.amount_1286) AS total_1286,
+    coalesce(u.name_1287, 'unknown') AS name_1287,
+    cast(t.value_1288 AS double) * 100 / t.count_1288 AS ratio_1288,
+    concat(t.first_1289, ' ', t.last_1289) AS full_1289,
+    t.col_1290,
+    sum(t.amount_1291) AS total_1291,
+    coalesce(u.name_1292, 'unknown') AS name_1292,
+    cast(t.value_1293 AS double) * 100 / t.count_1293 AS ratio_1293,
+    concat(t.first_1294, ' ', t.last_1294) AS full_1294,
+    t.col_1295,
+    sum(t.amount_1296) AS total_1296,
+    coalesce(u.name_1297, 'unknown') AS name_1297,
+    cast(t.value_1298 AS double) * 100 / t.count_1298 AS ratio_1298,
+    concat(t.first_1299, ' ', t.last_1299) AS full_1299,
+    t.col_1300,
+    sum(t.amount_1301) AS total_1301,
+    coalesce(u.name_1302, 'unknown') AS name_1302,
+    cast(t.value_1303 AS double) * 100 / t.count_1303 AS ratio_1303,
+    concat(t.first_1304, ' ', t.last_1304) AS full_1304,
+    t.col_1305,
+    sum(t.amount_1306) AS total_1306,
+    coalesce(u.name_1307, 'unknown') AS name_1307,
+    cast(t.value_1308 AS double) * 100 / t.count_1308 AS ratio_1308,
+    concat(t.first_1309, ' ', t.last_1309) AS full_1309,
+    t.col_1310,
+    sum(t.amount_1311) AS total_1311,
+    coalesce(u.name_1312, 'unknown') AS name_1312,
+    cast(t.value_1313 AS double) * 100 / t.count_1313 AS ratio_1313,
+    concat(t.first_1314, ' ', t.last_1314) AS full_1314,
+    t.col_1315,
+    sum(t.amount_1316) AS total_1316,
+    coalesce(u.name_1317, 'unknown') AS name_1317,
+    cast(t.value_1318 AS double) * 100 / t.count_1318 AS ratio_1318,
+    concat(t.first_1319, ' ', t.last_1319) AS full_1319,
+    t.col_1320,
+    sum(t.amount_1321) AS total_1321,
+    coalesce(u.name_1322, 'unknown') AS name_1322,
+    cast(t.value_1323 AS double) * 100 / t.count_1323 AS ratio_1323,
+    concat(t.first_1324, ' ', t.last_1324) AS full_1324,
+    t.col_1325,
+    sum(t.amount_1326) AS total_1326,
+    coalesce(u.name_1327, 'unknown') AS name_1327,
+    cast(t.value_1328 AS double) * 100 / t.count_1328 AS ratio_1328,
+    concat(t.first_1329, ' ', t.last_1329) AS full_1329,
+    t.col_1330,
+    sum(t.amount_1331) AS total_1331,
+    coalesce(u.name_1332, 'unknown') AS name_1332,
+    cast(t.value_1333 AS double) * 100 / t.count_1333 AS ratio_1333,
+    concat(t.first_1334, ' ', t.last_1334) AS full_1334,
+    t.col_1335,
+    sum(t.amount_1336) AS total_1336,
+    coalesce(u.name_1337, 'unknown') AS name_1337,
+    cast(t.value_1338 AS double) * 100 / t.count_1338 AS ratio_1338,
+    concat(t.first_1339, ' ', t.last_1339) AS full_1339,
+    t.col_1340,
+    sum(t.amount_1341) AS total_1341,
+    coalesce(u.name_1342, 'unknown') AS name_1342,
+    cast(t.value_1343 AS double) * 100 / t.count_1343 AS ratio_1343,
+    concat(t.first_1344, ' ', t.last_1344) AS full_1344,
+    t.col_1345,
+    sum(t.amount_1346) AS total_1346,
+    coalesce(u.name_1347, 'unknown') AS name_1347,
+    cast(t.value_1348 AS double) * 100 / t.count_1348 AS ratio_1348,
+    concat(t.first_1349, ' ', t.last_1349) AS full_1349,
+    t.col_1350,
+    sum(t.amount_1351) AS total_1351,
+    coalesce(u.name_1352, 'unknown') AS name_1352,
+    cast(t.value_1353 AS double) * 100 / t.count_1353 AS ratio_1353,
+    concat(t.first_1354, ' ', t.last_1354) AS full_1354,
+    t.col_1355,
+    sum(t.amount_1356) AS total_1356,
+    coalesce(u.name_1357, 'unknown') AS name_1357,
+    cast(t.value_1358 AS double) * 100 / t.count_1358 AS ratio_1358,
+    concat(t.first_1359, ' ', t.last_1359) AS full_1359,
+    t.col_1360,
+    sum(t.amount_1361) AS total_1361,
+    coalesce(u.name_1362, 'unknown') AS name_1362,
+    cast(t.value_1363 AS double) * 100 / t.count_1363 AS ratio_1363,
+    concat(t.first_1364, ' ', t.last_1364) AS full_1364,
+    t.col_1365,
+    sum(t.amount_1366) AS total_1366,
+    coalesce(u.name_1367, 'unknown') AS name_1367,
+    cast(t.value_1368 AS double) * 100 / t.count_1368 AS ratio_1368,
+    concat(t.first_1369, ' ', t.last_1369) AS full_1369,
+    t.col_1370,
+    sum(t.amount_1371) AS total_1371,
+    coalesce(u.name_1372, 'unknown') AS name_1372,
+    cast(t.value_1373 AS double) * 100 / t.count_1373 AS ratio_1373,
+    concat(t.first_1374, ' ', t.last_1374) AS full_1374,
+    t.col_1375,
+    sum(t.amount_1376) AS total_1376,
+    coalesce(u.name_1377, 'unknown') AS name_1377,
+    cast(t.value_1378 AS double) * 100 / t.count_1378 AS ratio_1378,
+    concat(t.first_1379, ' ', t.last_1379) AS full_1379,
+    t.col_1380,
+    sum(t.amount_1381) AS total_1381,
+    coalesce(u.name_1382, 'unknown') AS name_1382,
+    cast(t.value_1383 AS double) * 100 / t.count_1383 AS ratio_1383,
+    concat(t.first_1384, ' ', t.last_1384) AS full_1384,
+    t.col_1385,
+    sum(t.amount_1386) AS total_1386,
+    coalesce(u.name_1387, 'unknown') AS name_1387,
+    cast(t.value_1388 AS double) * 100 / t.count_1388 AS ratio_1388,
+    concat(t.first_1389, ' ', t.last_1389) AS full_1389,
+    t.col_1390,
+    sum(t.amount_1391) AS total_1391,
+    coalesce(u.name_1392, 'unknown') AS name_1392,
+    cast(t.value_1393 AS double) * 100 / t.count_1393 AS ratio_1393,
+    concat(t.first_1394, ' ', t.last_1394) AS full_1394,
+    t.col_1395,
+    sum(t.amount_1396) AS total_1396,
+    coalesce(u.name_1397, 'unknown') AS name_1397,
+    cast(t.value_1398 AS double) * 100 / t.count_1398 AS ratio_1398,
+    concat(t.first_1399, ' ', t.last_1399) AS full_1399,
+    t.col_1400,
+    sum(t.amount_1401) AS total_1401,
+    coalesce(u.name_1402, 'unknown') AS name_1402,
+    cast(t.value_1403 AS double) * 100 / t.count_1403 AS ratio_1403,
+    concat(t.first_1404, ' ', t.last_1404) AS full_1404,
+    t.col_1405,
+    sum(t.amount_1406) AS total_1406,
+    coalesce(u.name_1407, 'unknown') AS name_1407,
+    cast(t.value_1408 AS double) * 100 / t.count_1408 AS ratio_1408,
+    concat(t.first_1409, ' ', t.last_1409) AS full_1409,
+    t.col_1410,
+    sum(t.amount_1411) AS total_1411,
+    coalesce(u.name_1412, 'unknown') AS name_1412,
+    cast(t.value_1413 AS double) * 100 / t.count_1413 AS ratio_1413,
+    concat(t.first_1414, ' ', t.last_1414) AS full_1414,
+    t.col_1415,
+    sum(t.amount_1416) AS total_1416,
+    coalesce(u.name_1417, 'unknown') AS name_1417,
+    cast(t.value_1418 AS double) * 100 / t.count_1418 AS ratio_1418,
+    concat(t.first_1419, ' ', t.last_1419) AS full_1419,
+    t.col_1420,
+    sum(t.amount_1421) AS total_1421,
+    coalesce(u.name_1422, 'unknown') AS name_1422,
+    cast(t.value_1423 AS double) * 100 / t.count_1423 AS ratio_1423,
+    concat(t.first_1424, ' ', t.last_1424) AS full_1424,
+    t.col_1425,
+    sum(t.amount_1426) AS total_1426,
+    coalesce(u.name_1427, 'unknown') AS name_1427,
+    cast(t.value_1428 AS double) * 100 / t.count_1428 AS ratio_1428,
+    concat(t.first_1429, ' ', t.last_1429) AS full_1429,
+    t.col_1430,
+    sum(t.amount_1431) AS total_1431,
+    coalesce(u.name_1432, 'unknown') AS name_1432,
+    cast(t.value_1433 AS double) * 100 / t.count_1433 AS ratio_1433,
+    concat(t.first_1434, ' ', t.last_1434) AS full_1434,
+    t.col_1435,
+    sum(t.amount_1436) AS total_1436,
+    coalesce(u.name_1437, 'unknown') AS name_1437,
+    cast(t.value_1438 AS double) * 100 / t.count_1438 AS ratio_1438,
+    concat(t.first_1439, ' ', t.last_1439) AS full_1439,
+    t.col_1440,
+    sum(t.amount_1441) AS total_1441,
+    coalesce(u.name_1442, 'unknown') AS name_1442,
+    cast(t.value_1443 AS double) * 100 / t.count_1443 AS ratio_1443,
+    concat(t.first_1444, ' ', t.last_1444) AS full_1444,
+    t.col_1445,
+    sum(t.amount_1446) AS total_1446,
+    coalesce(u.name_1447, 'unknown') AS name_1447,
+    cast(t.value_1448 AS double) * 100 / t.count_1448 AS ratio_1448,
+    concat(t.first_1449, ' ', t.last_1449) AS full_1449,
+    t.col_1450,
+    sum(t.amount_1451) AS total_1451,
+    coalesce(u.name_1452, 'unknown') AS name_1452,
+    cast(t.value_1453 AS double) * 100 / t.count_1453 AS ratio_1453,
+    concat(t.first_1454, ' ', t.last_1454) AS full_1454,
+    t.col_1455,
+    sum(t.amount_1456) AS total_1456,
+    coalesce(u.name_1457, 'unknown') AS name_1457,
+    cast(t.value_1458 AS double) * 100 / t.count_1458 AS ratio_1458,
+    concat(t.first_1459, ' ', t.last_1459) AS full_1459,
+    t.col_1460,
+    sum(t.amount_1461) AS total_1461,
+    coalesce(u.name_1462, 'unknown') AS name_1462,
+    cast(t.value_1463 AS double) * 100 / t.count_1463 AS ratio_1463,
+    concat(t.first_1464, ' ', t.last_1464) AS full_1464,
+    t.col_1465,
+    sum(t.amount_1466) AS total_1466,
+    coalesce(u.name_1467, 'unknown') AS name_1467,
+    cast(t.value_1468 AS double) * 100 / t.count_1468 AS ratio_1468,
+    concat(t.first_1469, ' ', t.last_1469) AS full_1469,
+    t.col_1470,
+    sum(t.amount_1471) AS total_1471,
+    coalesce(u.name_1472, 'unknown') AS name_1472,
+    cast(t.value_1473 AS double) * 100 / t.count_1473 AS ratio_1473,
+    concat(t.first_1474, ' ', t.last_1474) AS full_1474,
+    t.col_1475,
+    sum(t.amount_1476) AS total_1476,
+    coalesce(u.name_1477, 'unknown') AS name_1477,
+    cast(t.value_1478 AS double) * 100 / t.count_1478 AS ratio_1478,
+    concat(t.first_1479, ' ', t.last_1479) AS full_1479,
+    t.col_1480,
+    sum(t.amount_1481) AS total_1481,
+    coalesce(u.name_1482, 'unknown') AS name_1482,
+    cast(t.value_1483 AS double) * 100 / t.count_1483 AS ratio_1483,
+    concat(t.first_1484, ' ', t.last_1484) AS full_1484,
+    t.col_1485,
+    sum(t.amount_1486) AS total_1486,
+    coalesce(u.name_1487, 'unknown') AS name_1487,
+    cast(t.value_1488 AS double) * 100 / t.count_1488 AS ratio_1488,
+    concat(t.first_1489, ' ', t.last_1489) AS full_1489,
+    t.col_1490,
+    sum(t.amount_1491) AS total_1491,
+    coalesce(u.name_1492, 'unknown') AS name_1492,
+    cast(t.value_1493 AS double) * 100 / t.count_1493 AS ratio_1493,
+    concat(t.first_1494, ' ', t.last_1494) AS full_1494,
+    t.col_1495,
+    sum(t.amount_1496) AS total_1496,
+    coalesce(u.name_1497, 'unknown') AS name_1497,
+    cast(t.value_1498 AS double) * 100 / t.count_1498 AS ratio_1498,
+    concat(t.first_1499, ' ', t.last_1499) AS full_1499
+FROM warehouse.facts t
+LEFT OUTER JOIN warehouse.users u ON t.user_id = u.id AND t.dt = u.dt
+WHERE t.dt = '${hiveconf:dt}'
+GROUP BY t.col_0
+;
@@ -0,0 +1,804 @@
+SELECT
+    t.user_id,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_0,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_1,
+    lag(t.amount, 3) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_2,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_3,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_4,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_5,
+    lag(t.amount, 7) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_6,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_7,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_8,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_9,
+    lag(t.amount, 4) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_10,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_11,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_12,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_13,
+    lag(t.amount, 1) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_14,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_15,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_16,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_17,
+    lag(t.amount, 5) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_18,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_19,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_20,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_21,
+    lag(t.amount, 2) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_22,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_23,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_24,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_25,
+    lag(t.amount, 6) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_26,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_27,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_28,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_29,
+    lag(t.amount, 3) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_30,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_31,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_32,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_33,
+    lag(t.amount, 7) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_34,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_35,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_36,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_37,
+    lag(t.amount, 4) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_38,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_39,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_40,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_41,
+    lag(t.amount, 1) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_42,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_43,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_44,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_45,
+    lag(t.amount, 5) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_46,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_47,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_48,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_49,
+    lag(t.amount, 2) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_50,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_51,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_52,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_53,
+    lag(t.amount, 6) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_54,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_55,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_56,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_57,
+    lag(t.amount, 3) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_58,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_59,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_60,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_61,
+    lag(t.amount, 7) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_62,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_63,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_64,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_65,
+    lag(t.amount, 4) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_66,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_67,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_68,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_69,
+    lag(t.amount, 1) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_70,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_71,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_72,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_73,
+    lag(t.amount, 5) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_74,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_75,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_76,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_77,
+    lag(t.amount, 2) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_78,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_79,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_80,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_81,
+    lag(t.amount, 6) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_82,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_83,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_84,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_85,
+    lag(t.amount, 3) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_86,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_87,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_88,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_89,
+    lag(t.amount, 7) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_90,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_91,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_92,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_93,
+    lag(t.amount, 4) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_94,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_95,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_96,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_97,
+    lag(t.amount, 1) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_98,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_99,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_100,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_101,
+    lag(t.amount, 5) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_102,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_103,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_104,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_105,
+    lag(t.amount, 2) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_106,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_107,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_108,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_109,
+    lag(t.amount, 6) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_110,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_111,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_112,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_113,
+    lag(t.amount, 3) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_114,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_115,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_116,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_117,
+    lag(t.amount, 7) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_118,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_119,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_120,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_121,
+    lag(t.amount, 4) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_122,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_123,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_124,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_125,
+    lag(t.amount, 1) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_126,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_127,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_128,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_129,
+    lag(t.amount, 5) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_130,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_131,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_132,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_133,
+    lag(t.amount, 2) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_134,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_135,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_136,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_137,
+    lag(t.amount, 6) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_138,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_139,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_140,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_141,
+    lag(t.amount, 3) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_142,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_143,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_144,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_145,
+    lag(t.amount, 7) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_146,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_147,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_148,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_149,
+    lag(t.amount, 4) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_150,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_151,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_152,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_153,
+    lag(t.amount, 1) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_154,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_155,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_156,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_157,
+    lag(t.amount, 5) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_158,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_159,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_160,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_161,
+    lag(t.amount, 2) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_162,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_163,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_164,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_165,
+    lag(t.amount, 6) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_166,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_167,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_168,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_169,
+    lag(t.amount, 3) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_170,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_171,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_172,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_173,
+    lag(t.amount, 7) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_174,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_175,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_176,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_177,
+    lag(t.amount, 4) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_178,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_179,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_180,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_181,
+    lag(t.amount, 1) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_182,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_183,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_184,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_185,
+    lag(t.amount, 5) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_186,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_187,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_188,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_189,
+    lag(t.amount, 2) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_190,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_191,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_192,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_193,
+    lag(t.amount, 6) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_194,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_195,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_196,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_197,
+    lag(t.amount, 3) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_198,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_199,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_200,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_201,
+    lag(t.amount, 7) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_202,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_203,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_204,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_205,
+    lag(t.amount, 4) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_206,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_207,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_208,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_209,
+    lag(t.amount, 1) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_210,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_211,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_212,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_213,
+    lag(t.amount, 5) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_214,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_215,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_216,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_217,
+    lag(t.amount, 2) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_218,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_219,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_220,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_221,
+    lag(t.amount, 6) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_222,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_223,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_224,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_225,
+    lag(t.amount, 3) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_226,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_227,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_228,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_229,
+    lag(t.amount, 7) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_230,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_231,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_232,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_233,
+    lag(t.amount, 4) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_234,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_235,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_236,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_237,
+    lag(t.amount, 1) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_238,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_239,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_240,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_241,
+    lag(t.amount, 5) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_242,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_243,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_244,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_245,
+    lag(t.amount, 2) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_246,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_247,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_248,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_249,
+    lag(t.amount, 6) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_250,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_251,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_252,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_253,
+    lag(t.amount, 3) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_254,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_255,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_256,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_257,
+    lag(t.amount, 7) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_258,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_259,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_260,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_261,
+    lag(t.amount, 4) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_262,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_263,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_264,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_265,
+    lag(t.amount, 1) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_266,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_267,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_268,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_269,
+    lag(t.amount, 5) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_270,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_271,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_272,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_273,
+    lag(t.amount, 2) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_274,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_275,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_276,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_277,
+    lag(t.amount, 6) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_278,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_279,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_280,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_281,
+    lag(t.amount, 3) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_282,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_283,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_284,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_285,
+    lag(t.amount, 7) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_286,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_287,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_288,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_289,
+    lag(t.amount, 4) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_290,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_291,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_292,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_293,
+    lag(t.amount, 1) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_294,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_295,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_296,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_297,
+    lag(t.amount, 5) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_298,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_299,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_300,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_301,
+    lag(t.amount, 2) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_302,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_303,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_304,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_305,
+    lag(t.amount, 6) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_306,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_307,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_308,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_309,
+    lag(t.amount, 3) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_310,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_311,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_312,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_313,
+    lag(t.amount, 7) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_314,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_315,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_316,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_317,
+    lag(t.amount, 4) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_318,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_319,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_320,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_321,
+    lag(t.amount, 1) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_322,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_323,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_324,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_325,
+    lag(t.amount, 5) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_326,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_327,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_328,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_329,
+    lag(t.amount, 2) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_330,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_331,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_332,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_333,
+    lag(t.amount, 6) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_334,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_335,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_336,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_337,
+    lag(t.amount, 3) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_338,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_339,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_340,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_341,
+    lag(t.amount, 7) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_342,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_343,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_344,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_345,
+    lag(t.amount, 4) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_346,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_347,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_348,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_349,
+    lag(t.amount, 1) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_350,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_351,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_352,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_353,
+    lag(t.amount, 5) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_354,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_355,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_356,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_357,
+    lag(t.amount, 2) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_358,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_359,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_360,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_361,
+    lag(t.amount, 6) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_362,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_363,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_364,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_365,
+    lag(t.amount, 3) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_366,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_367,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_368,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_369,
+    lag(t.amount, 7) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_370,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_371,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_372,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_373,
+    lag(t.amount, 4) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_374,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_375,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_376,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_377,
+    lag(t.amount, 1) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_378,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_379,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_380,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_381,
+    lag(t.amount, 5) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_382,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_383,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_384,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_385,
+    lag(t.amount, 2) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_386,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_387,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_388,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_389,
+    lag(t.amount, 6) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_390,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_391,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_392,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_393,
+    lag(t.amount, 3) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_394,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_395,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_396,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_397,
+    lag(t.amount, 7) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_398,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_399,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_400,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_401,
+    lag(t.amount, 4) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_402,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_403,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_404,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_405,
+    lag(t.amount, 1) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_406,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_407,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_408,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_409,
+    lag(t.amount, 5) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_410,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_411,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_412,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_413,
+    lag(t.amount, 2) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_414,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_415,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_416,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_417,
+    lag(t.amount, 6) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_418,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_419,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_420,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_421,
+    lag(t.amount, 3) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_422,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_423,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_424,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_425,
+    lag(t.amount, 7) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_426,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_427,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_428,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_429,
+    lag(t.amount, 4) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_430,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_431,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_432,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_433,
+    lag(t.amount, 1) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_434,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_435,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_436,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_437,
+    lag(t.amount, 5) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_438,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_439,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_440,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_441,
+    lag(t.amount, 2) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_442,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_443,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_444,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_445,
+    lag(t.amount, 6) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_446,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_447,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_448,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_449,
+    lag(t.amount, 3) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_450,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_451,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_452,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_453,
+    lag(t.amount, 7) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_454,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_455,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_456,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_457,
+    lag(t.amount, 4) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_458,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_459,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_460,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_461,
+    lag(t.amount, 1) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_462,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_463,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_464,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_465,
+    lag(t.amount, 5) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_466,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_467,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_468,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_469,
+    lag(t.amount, 2) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_470,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_471,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_472,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_473,
+    lag(t.amount, 6) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_474,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_475,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_476,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_477,
+    lag(t.amount, 3) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_478,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_479,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_480,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_481,
+    lag(t.amount, 7) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_482,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_483,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_484,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_485,
+    lag(t.amount, 4) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_486,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_487,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_488,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_489,
+    lag(t.amount, 1) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_490,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_491,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_492,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_493,
+    lag(t.amount, 5) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_494,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_495,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_496,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_497,
+    lag(t.amount, 2) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_498,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_499,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_500,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_501,
+    lag(t.amount, 6) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_502,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_503,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_504,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_505,
+    lag(t.amount, 3) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_506,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_507,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_508,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_509,
+    lag(t.amount, 7) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_510,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_511,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_512,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_513,
+    lag(t.amount, 4) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_514,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_515,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_516,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_517,
+    lag(t.amount, 1) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_518,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_519,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_520,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_521,
+    lag(t.amount, 5) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_522,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_523,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_524,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_525,
+    lag(t.amount, 2) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_526,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_527,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_528,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_529,
+    lag(t.amount, 6) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_530,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_531,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_532,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_533,
+    lag(t.amount, 3) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_534,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_535,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_536,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_537,
+    lag(t.amount, 7) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_538,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_539,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_540,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_541,
+    lag(t.amount, 4) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_542,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_543,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_544,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_545,
+    lag(t.amount, 1) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_546,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_547,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_548,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_549,
+    lag(t.amount, 5) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_550,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_551,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_552,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_553,
+    lag(t.amount, 2) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_554,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_555,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_556,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_557,
+    lag(t.amount, 6) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_558,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_559,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_560,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_561,
+    lag(t.amount, 3) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_562,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_563,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_564,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_565,
+    lag(t.amount, 7) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_566,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_567,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_568,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_569,
+    lag(t.amount, 4) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_570,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_571,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_572,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_573,
+    lag(t.amount, 1) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_574,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_575,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_576,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_577,
+    lag(t.amount, 5) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_578,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_579,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_580,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_581,
+    lag(t.amount, 2) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_582,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_583,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_584,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_585,
+    lag(t.amount, 6) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_586,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_587,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_588,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_589,
+    lag(t.amount, 3) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_590,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_591,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_592,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_593,
+    lag(t.amount, 7) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_594,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_595,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_596,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_597,
+    lag(t.amount, 4) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_598,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_599,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_600,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_601,
+    lag(t.amount, 1) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_602,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_603,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_604,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_605,
+    lag(t.amount, 5) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_606,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_607,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_608,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_609,
+    lag(t.amount, 2) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_610,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_611,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_612,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_613,
+    lag(t.amount, 6) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_614,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_615,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_616,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_617,
+    lag(t.amount, 3) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_618,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_619,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_620,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_621,
+    lag(t.amount, 7) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_622,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_623,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_624,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_625,
+    lag(t.amount, 4) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_626,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_627,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_628,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_629,
+    lag(t.amount, 1) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_630,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_631,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_632,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_633,
+    lag(t.amount, 5) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_634,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_635,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_636,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_637,
+    lag(t.amount, 2) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_638,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_639,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_640,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_641,
+    lag(t.amount, 6) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_642,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_643,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_644,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_645,
+    lag(t.amount, 3) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_646,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_647,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_648,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_649,
+    lag(t.amount, 7) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_650,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_651,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_652,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_653,
+    lag(t.amount, 4) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_654,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_655,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_656,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_657,
+    lag(t.amount, 1) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_658,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_659,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_660,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_661,
+    lag(t.amount, 5) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_662,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_663,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_664,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_665,
+    lag(t.amount, 2) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_666,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_667,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_668,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_669,
+    lag(t.amount, 6) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_670,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_671,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_672,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_673,
+    lag(t.amount, 3) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_674,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_675,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_676,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_677,
+    lag(t.amount, 7) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_678,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_679,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_680,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_681,
+    lag(t.amount, 4) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_682,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_683,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_684,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_685,
+    lag(t.amount, 1) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_686,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_687,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_688,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_689,
+    lag(t.amount, 5) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_690,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_691,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_692,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_693,
+    lag(t.amount, 2) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_694,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_695,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_696,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_697,
+    lag(t.amount, 6) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_698,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_699,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_700,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_701,
+    lag(t.amount, 3) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_702,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_703,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_704,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_705,
+    lag(t.amount, 7) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_706,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_707,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_708,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_709,
+    lag(t.amount, 4) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_710,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_711,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_712,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_713,
+    lag(t.amount, 1) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_714,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_715,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_716,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_717,
+    lag(t.amount, 5) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_718,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_719,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_720,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_721,
+    lag(t.amount, 2) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_722,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_723,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_724,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_725,
+    lag(t.amount, 6) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_726,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_727,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_728,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_729,
+    lag(t.amount, 3) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_730,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_731,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_732,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_733,
+    lag(t.amount, 7) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_734,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_735,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_736,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_737,
+    lag(t.amount, 4) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_738,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_739,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_740,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_741,
+    lag(t.amount, 1) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_742,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_743,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_744,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_745,
+    lag(t.amount, 5) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_746,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_747,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_748,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_749,
+    lag(t.amount, 2) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_750,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_751,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_752,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_753,
+    lag(t.amount, 6) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_754,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_755,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_756,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_757,
+    lag(t.amount, 3) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_758,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_759,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_760,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_761,
+    lag(t.amount, 7) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_762,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_763,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_764,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_765,
+    lag(t.amount, 4) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_766,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_767,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_768,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_769,
+    lag(t.amount, 1) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_770,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_771,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_772,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_773,
+    lag(t.amount, 5) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_774,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_775,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_776,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_777,
+    lag(t.amount, 2) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_778,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_779,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_780,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_781,
+    lag(t.amount, 6) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_782,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_783,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_784,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_785,
+    lag(t.amount, 3) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_786,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_787,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_788,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_789,
+    lag(t.amount, 7) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_790,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_791,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_792,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_793,
+    lag(t.amount, 4) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_794,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_795,
+    row_number() OVER (PARTITION BY t.user_id ORDER BY t.ts DESC) AS rn_796,
+    sum(t.amount) OVER (PARTITION BY t.user_id, t.dt ORDER BY t.ts ASC) AS running_797,
+    lag(t.amount, 1) OVER (PARTITION BY t.session_id ORDER BY t.ts) AS lag_798,
+    avg(t.amount) OVER (PARTITION BY t.country) AS avg_799
+FROM warehouse.transactions t
+WHERE t.dt BETWEEN '2020-01-01' AND '2020-12-31';
@@ -0,0 +1,106 @@
+# Times the client of the formatting daemon against formatting in process
+#
+# Usage: python bench/daemon.py [runs]
+#
+# A daemon is started on a temporary socket. Every run then starts a fresh
+# client process formatting one file of bench/corpus to stdout, once through
+# the daemon and once in process, as the client does when no daemon listens.
+# The median times are printed. Several threads then send the statements of
+# the corpus to the daemon at the same time, each pipelining its requests, and
+# their responses are compared with the statements streamed in process. A
+# script the recovering parser gives up on must be checked with its errors.
+# Fails when the responses differ, or when the client of the daemon is not
+# faster than formatting in process.
+
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+bench = os.path.dirname(os.path.abspath(__file__))
+root = os.path.join(bench, '..')
+sys.path.insert(0, root)
+
+from src import client, statements
+
+FILE = os.path.join(bench, 'corpus', 'window_over.sql')
+THREADS = 8
+# Formatted up to a statement the recovering parser gives up on
+BROKEN = 'SELECT\n\ta\nFROM t;\nselect ( from t;'
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+def timed(arguments):
+    start = time.perf_counter()
+    with open(FILE) as f:
+        output = subprocess.check_output([sys.executable, '-m', 'src.client'] + arguments, stdin=f, cwd=root)
+    return time.perf_counter() - start, output
+
+def stream(query):
+    output = io.StringIO()
+    statements.format_stream(query, output)
+    return output.getvalue()
+
+def concurrent(path, queries):
+    'Outputs of the daemon for queries, sent by several threads at the same time'
+    outputs = [None] * THREADS
+    def send(number):
+        requests = [{'jsonrpc': '2.0', 'id': id, 'method': 'format', 'params': {'text': query}}
+                    for id, query in enumerate(queries)]
+        responses = client.call(requests, path)
+        outputs[number] = [responses[id]['result']['output'] for id in range(len(queries))]
+    threads = [threading.Thread(target=send, args=(number,)) for number in range(THREADS)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, outputs
+
+def main(runs):
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'daemon.sock')
+        daemon = subprocess.Popen([sys.executable, '-m', 'src.daemon', '--socket', path], cwd=root)
+        try:
+            while client.connect(path) is None:
+                if daemon.poll() is not None:
+                    print('the daemon did not start')
+                    return 1
+                time.sleep(0.05)
+
+            times = {'daemon': [], 'in process': []}
+            outputs = {}
+            for _ in range(runs):
+                for name, socket in (('daemon', path), ('in process', os.path.join(folder, 'none.sock'))):
+                    elapsed, outputs[name] = timed(['--socket', socket])
+                    times[name].append(elapsed)
+            for name in ('in process', 'daemon'):
+                print('client, %-10s : %8.3fs' % (name, median(times[name])))
+            same = outputs['daemon'] == outputs['in process']
+
+            with open(os.path.join(bench, 'corpus', 'script.sql')) as f:
+                queries = [query for _, query, code in statements.split_statements(f.read()) if code]
+            expected = [stream(query) for query in queries]
+            elapsed, found = concurrent(path, queries)
+            print('%d threads x %d requests : %8.3fs' % (THREADS, len(queries), elapsed))
+            same = same and all(output == expected for output in found)
+
+            request = {'jsonrpc': '2.0', 'id': 0, 'method': 'check', 'params': {'text': BROKEN}}
+            response = client.call([request], path)[0]
+            if not response.get('result', {}).get('errors'):
+                print('checking %r gave %r' % (BROKEN, response))
+                return 1
+        finally:
+            daemon.terminate()
+            daemon.wait()
+    if not same:
+        print('the outputs of the daemon differ from the ones formatted in process')
+    return 0 if same and median(times['daemon']) < median(times['in process']) else 1
+
+if __name__ == '__main__':
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 7))
@@ -0,0 +1,101 @@
+# Checks the direct-coded parser against the table-driven one, then times both
+#
+# Usage: python bench/direct.py [runs]
+#
+# The parser of src/parsedirect.py, written again by formatter.enable_direct()
+# when the grammar changed, must give the same results as the parser reading
+# the compact tables. Every statement of bench/corpus is formatted and minified
+# with comments by both, whole and cut after each of its first tokens so that
+# the syntax errors are compared too. Statements are also formatted by
+# recovering formatters, which only parse again with the tables the statements
+# holding errors. Both then parse the statements, replaying tokens lexed
+# beforehand so that the time left is the one of the parser and of the grammar
+# actions. Fails on any difference, or when the direct-coded parser is slower.
+
+import functools
+import glob
+import os
+import sys
+import time
+
+bench = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(bench, '..'))
+
+from src import formatter, statements
+
+# Cuts of each statement, after its first tokens
+CUTS = 24
+
+class Replay(object):
+    def __init__(self, tokens):
+        self.tokens = tokens
+
+    def input(self, data):
+        self.token = functools.partial(next, iter(self.tokens), None)
+
+def load():
+    queries = []
+    for path in sorted(glob.glob(os.path.join(bench, 'corpus', '*.sql'))):
+        with open(path) as f:
+            queries.extend(query for _, query, code in statements.split_statements(f.read()) if code)
+    return queries
+
+def outcome(format, query):
+    try:
+        return format(query)
+    except (SyntaxError, ValueError) as e:
+        return '%s%r' % (type(e).__name__, e.args)
+    except formatter.QueryErrors as e:
+        return 'QueryErrors%r' % (e.errors,)
+
+def differences(queries, direct):
+    found = 0
+    checked = 0
+    lexer = formatter.lexer.clone()
+    for minify, recover in ((False, False), (True, False), (False, True)):
+        tables = formatter.Formatter(minify, drop_comments=False, recover=recover)
+        direct_coded = formatter.Formatter(minify, drop_comments=False, direct=direct, recover=recover)
+        for query in queries:
+            lexer.input(query)
+            ends = [token.lexpos + len(token.value) for token in iter(lexer.token, None)]
+            for end in [len(query)] + ends[:CUTS]:
+                cut = query[:end]
+                expected, result = outcome(tables.format, cut), outcome(direct_coded.format, cut)
+                checked += 1
+                if result != expected:
+                    found += 1
+                    print('difference (minify=%s, recover=%s) on %r:\n  tables : %r\n  direct : %r' % (minify, recover, cut[:200], expected, result))
+    return checked, found
+
+def main(runs):
+    direct = formatter.enable_direct()
+    formatter.disable_direct()
+    queries = load()
+    checked, found = differences(queries, direct)
+    print('%d parses compared, %d differences' % (checked, found))
+
+    lexer = formatter.lexer.clone()
+    tokens = []
+    for query in queries:
+        lexer.input(query)
+        tokens.append(list(iter(lexer.token, None)))
+    parser = formatter.Formatter().parser
+    parsers = {
+        'tables': lambda query, replayed: parser.parse(query, lexer=Replay(replayed)),
+        'direct': lambda query, replayed: direct.parse(query, lexer=Replay(replayed), parser=parser),
+    }
+    best = {}
+    for _ in range(runs):
+        for name, parse in sorted(parsers.items(), reverse=True):
+            start = time.perf_counter()
+            for query, replayed in zip(queries, tokens):
+                parse(query, replayed)
+            best[name] = min(best.get(name, float('inf')), time.perf_counter() - start)
+    count = sum(len(replayed) for replayed in tokens)
+    for name in ('tables', 'direct'):
+        print('%-6s : %8.3fs %10.0f tokens/s' % (name, best[name], count / best[name]))
+    print('direct : x%.2f' % (best['tables'] / best['direct']))
+    return 0 if not found and best['direct'] <= best['tables'] else 1
+
+if __name__ == '__main__':
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 10))
@@ -0,0 +1,109 @@
+# Checks the fingerprints against the formatter's lexer, then times them
+#
+# Usage: python bench/fingerprint.py [runs]
+#
+# Every statement of bench/corpus, and a few comments and operators it lacks,
+# must be normalized to the text made of its tokens found by the formatter's
+# lexer, normalized one by one and joined by a space. Each statement of
+# bench/corpus/script.sql must also have the fingerprint of a copy of it with
+# other numbers and strings and with its keywords in lowercase. The statements
+# of the script are then lexed by the formatter's lexer, and fingerprinted the
+# given number of times with other numbers and strings on each run, so that no
+# query is met twice, starting with no chunk known. Fails on any difference, or
+# when all the runs together, the first one included, fingerprint fewer than
+# 100000 queries per second.
+
+import glob
+import os
+import re
+import sys
+import time
+
+bench = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(bench, '..'))
+
+from src import fingerprint, formatter, statements
+
+SCRIPT = os.path.join(bench, 'corpus', 'script.sql')
+RATE = 100000
+
+PUNCTUATION = set(fingerprint.punctuation())
+
+# Comments and operators of symbols which the corpus lacks
+EDGES = [
+    'select a+--b from t',
+    'select a<--b from t',
+    'select a---b\nfrom t',
+    'select a+---b from t',
+    "select '--', \"--\", `--` from t -- comment",
+    "select a from t where b = 'x--y' --c\n and c=1;",
+]
+
+def corpus_statements(path):
+    with open(path) as f:
+        return [text for _, text, code in statements.split_statements(f.read()) if code]
+
+def lexed(lexer, query):
+    'Tokens of query found by lexer, comments aside'
+    lexer.input(query)
+    return [token for token in iter(lexer.token, None) if token.type not in ('COMMENT', 'COMMENT_ALONE')]
+
+def reference(lexer, query):
+    'Normalized text of query from its tokens found by lexer, with the operators cut into characters'
+    words = []
+    for token in lexed(lexer, query):
+        if token.type in ('STRING_SIMPLE', 'STRING_DOUBLE'):
+            words.append('?')
+        elif token.value[0] in PUNCTUATION:
+            words.extend(token.value)
+        else:
+            words.append(fingerprint.word(token.value))
+    return fingerprint.collapsed(' '.join(words))
+
+def renewed(query, run):
+    'query with numbers and strings of its own for the given run'
+    query = re.sub(r'\b[0-9]+\b', lambda match: str(int(match.group()) + run), query)
+    return re.sub(r"'[^'\n]*'", "'run %d'" % run, query)
+
+def variant(query):
+    'query with other numbers and strings, and its keywords in lowercase'
+    query = renewed(query, 7)
+    return re.sub(r'[A-Za-z_]+', lambda match: match.group().lower() if match.group().lower() in formatter.reserved else match.group(), query)
+
+def timed(function, queries):
+    start = time.perf_counter()
+    for query in queries:
+        function(query)
+    return time.perf_counter() - start
+
+def main(runs):
+    formatter.build()
+    lexer = formatter.lexer.clone()
+    lexer.errors = []
+    differences = 0
+    corpus = [query for path in sorted(glob.glob(os.path.join(bench, 'corpus', '*.sql')))
+              for query in corpus_statements(path)]
+    for query in corpus + EDGES:
+        if fingerprint.normalize(query) != reference(lexer, query):
+            print('differs from the lexer: %r' % query)
+            differences += 1
+    queries = corpus_statements(SCRIPT)
+    for query in queries:
+        if fingerprint.fingerprint(query) != fingerprint.fingerprint(variant(query)):
+            differences += 1
+    shapes = len(set(map(fingerprint.fingerprint, queries)))
+    print('%d statements, %d shapes, %d differences' % (len(queries), shapes, differences))
+
+    lexing = timed(lambda query: lexed(lexer, query), queries)
+    batches = [[renewed(query, run) for query in queries] for run in range(1, runs + 1)]
+    fingerprint.chunk_words.cache_clear()
+    times = [timed(fingerprint.fingerprint, batch) for batch in batches]
+    rate = runs * len(queries) / sum(times)
+    print('lexer              : %10d queries/s' % (len(queries) / lexing))
+    print('fingerprint, first : %10d queries/s' % (len(queries) / times[0]))
+    print('fingerprint        : %10d queries/s' % rate)
+    print('chunks cached      : %10d' % fingerprint.chunk_words.cache_info().currsize)
+    return 0 if differences == 0 and rate > RATE else 1
+
+if __name__ == '__main__':
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100))
@@ -0,0 +1,81 @@
+# Times the reformatting of a whole script after one of its statements changed
+#
+# Usage: python bench/incremental.py [runs]
+#
+# The script of bench/corpus is formatted with a Reformatter as the plugin does
+# for a whole view, and the outputs replace their statements. One statement in
+# the middle is then edited, and the script formatted again, both from scratch
+# and by the reformatter which reuses the statements left unchanged. The blank
+# lines around a single statement must be kept, unlike when it is formatted on
+# its own. Fails when the results differ or when reformatting is not faster.
+
+import os
+import sys
+import time
+
+bench = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(bench, '..'))
+
+from src import formatter, incremental
+
+SCRIPT = os.path.join(bench, 'corpus', 'script.sql')
+
+# A view holding a single statement, and the view once formatted
+SINGLE = '\n\nselect a from t;\n\n'
+SINGLE_OUTPUT = '\n\nSELECT\n\ta\nFROM t;\n\n'
+
+def apply(text, results):
+    'Text with the statements replaced by their outputs'
+    parts = []
+    position = 0
+    for statement in results:
+        if statement.error is None:
+            parts.append(text[position:statement.start])
+            parts.append(statement.output)
+            position = statement.end
+    parts.append(text[position:])
+    return ''.join(parts)
+
+def main(runs):
+    formatter.build()
+    with open(SCRIPT) as f:
+        text = f.read()
+
+    reformatter = incremental.Reformatter()
+    start = time.perf_counter()
+    results = reformatter.format(text)
+    first = time.perf_counter() - start
+    text = apply(text, results)
+    start = time.perf_counter()
+    reformatter.settle()
+    settle = time.perf_counter() - start
+    print('first format : %8.3fs, %d statements, settled in %.3fs' % (first, len(results), settle))
+
+    # Adds a column to the select clause of the statement in the middle
+    middle = results[len(results) // 2]
+    position = text.index('\n', text.index('SELECT', middle.start)) + 1
+    edited = text[:position] + '\tedited_column,\n' + text[position:]
+
+    best = {}
+    for _ in range(runs):
+        start = time.perf_counter()
+        expected = incremental.Reformatter().format(edited)
+        best['scratch'] = min(best.get('scratch', float('inf')), time.perf_counter() - start)
+        reformatter.format(text)
+        start = time.perf_counter()
+        found = reformatter.format(edited)
+        best['reformat'] = min(best.get('reformat', float('inf')), time.perf_counter() - start)
+    print('from scratch : %8.3fs' % best['scratch'])
+    print('reformat     : %8.3fs, %d statements reused, %d formatted (x%.1f)' % (
+        best['reformat'], reformatter.reused, reformatter.formatted, best['scratch'] / best['reformat']))
+    same = found == expected
+    if not same:
+        print('the reformatted statements differ from the ones formatted from scratch')
+    single = apply(SINGLE, incremental.Reformatter().format(SINGLE))
+    if single != SINGLE_OUTPUT:
+        print('the lines around a single statement are not kept: %r' % single)
+        same = False
+    return 0 if same and best['reformat'] < best['scratch'] else 1
+
+if __name__ == '__main__':
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5))
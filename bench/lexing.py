@@ -0,0 +1,64 @@
+# Measures how fast the lexer goes through whitespace heavy queries
+#
+# Usage: python bench/lexing.py [lines]
+#
+# Lexes an indented query of the given number of lines with the formatter's
+# lexer and with a copy of it where whitespaces are discarded one character at a
+# time by a Python callback, as they used to be.
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src import formatter
+from src.ply import lex
+
+class CharByCharRules(object):
+    tokens = formatter.tokens
+
+    def __init__(self):
+        for name, value in vars(formatter).items():
+            if name.startswith('t_') and isinstance(value, str) and name != 't_ignore_WHITESPACE':
+                setattr(self, name, value)
+
+    def t_LABEL(self, t):
+        r'[a-zA-Z0-9$\{\}\_\:\@\#]+'
+        return formatter.t_LABEL(t)
+
+    def t_COMMENT_ALONE(self, t):
+        r'((^|(?<=\n))(?:\s*)--[^\n]*)|\s'
+        if '--' in t.value:
+            return t
+
+    def t_COMMENT(self, t):
+        r'--[^\n]*'
+        return t
+
+    def t_error(self, t):
+        formatter.t_error(t)
+
+def make_query(lines):
+    body = ',\n'.join('        col_%d    +    1      AS    alias_%d' % (i, i) for i in range(lines))
+    return 'SELECT\n%s\n    -- comment alone\nFROM    t' % body
+
+def timed(lexer, query):
+    start = time.perf_counter()
+    lexer.input(query)
+    count = 0
+    for _ in iter(lexer.token, None):
+        count += 1
+    return time.perf_counter() - start, count
+
+def main(lines):
+    query = make_query(lines)
+    before, count_before = timed(lex.lex(object=CharByCharRules()), query)
+    after, count_after = timed(lex.lex(module=formatter), query)
+    print('%d characters, %d tokens' % (len(query), count_after))
+    print('char by char     : %8.3fs' % before)
+    print('whitespace runs : %8.3fs (x%.1f)' % (after, before / after))
+    return 0 if count_before == count_after else 1
+
+if __name__ == '__main__':
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000))
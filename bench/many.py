@@ -0,0 +1,59 @@
+# Compares format_many() with formatting a batch query by query
+#
+# Usage: python bench/many.py [copies]
+#
+# The batch is made of copies of the statements of bench/corpus/script.sql, one
+# in ten of them broken by a syntax error. It is formatted by format_many(),
+# and by calling format_query() on every query and catching its errors, as
+# call_formatter() did for the selected regions. Fails when the outputs or the
+# errors differ, or when format_many() is not faster.
+
+import os
+import sys
+import time
+
+bench = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(bench, '..'))
+
+from src import formatter, statements
+
+SCRIPT = os.path.join(bench, 'corpus', 'script.sql')
+
+def one_by_one(queries):
+    results = []
+    for query in queries:
+        try:
+            results.append(formatter.Result(formatter.format_query(query), None))
+        except (formatter.QueryErrors, ValueError, SyntaxError) as err:
+            results.append(formatter.Result(None, err))
+    return results
+
+def timed(function, queries):
+    start = time.perf_counter()
+    result = function(queries)
+    return time.perf_counter() - start, result
+
+def same(found, expected):
+    'Whether the outputs and the errors of two lists of Result are the same'
+    return [(output, type(error), str(error)) for output, error in found] == \
+        [(output, type(error), str(error)) for output, error in expected]
+
+def main(copies):
+    formatter.build()
+    with open(SCRIPT) as f:
+        unique = [text for _, text, code in statements.split_statements(f.read()) if code]
+    unique = [text.replace('FROM', 'FROM FROM', 1) if i % 10 == 0 else text for i, text in enumerate(unique)]
+    queries = unique * copies
+    before, expected = timed(one_by_one, queries)
+    after, found = timed(formatter.format_many, queries)
+    failed = sum(1 for result in found if result.error is not None)
+    print('%d queries, %d unique, %d failed' % (len(queries), len(unique), failed))
+    print('one by one  : %8.3fs' % before)
+    print('format_many : %8.3fs (x%.1f)' % (after, before / after))
+    if not same(found, expected):
+        print('the results differ')
+        return 1
+    return 0 if after < before else 1
+
+if __name__ == '__main__':
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 4))
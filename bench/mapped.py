@@ -0,0 +1,86 @@
+# Compares splitting a script mapped in memory with splitting it read as text
+#
+# Usage: python bench/mapped.py [copies]
+#
+# A script made of copies of bench/corpus/script.sql, with a few characters
+# beyond ASCII and whitespaces the lexer for bytes does not match, is written
+# to a temporary file. Its statements are split by split_statements() from the
+# file read whole, from the file read as text chunk by chunk, and from the file
+# mapped in memory and lexed as bytes. The time and the peak memory allocated
+# by each way are printed; the pages of the mapping are left to the system and
+# not allocated. Fails when the statements differ, or when splitting the mapped
+# file allocates as much as reading it whole.
+
+import hashlib
+import mmap
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+bench = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(bench, '..'))
+
+from src import formatter, statements
+
+SCRIPT = os.path.join(bench, 'corpus', 'script.sql')
+
+def digest(split):
+    'Digest of the statements split, which are dropped as they come'
+    result = hashlib.md5()
+    for start, text, code in split:
+        result.update(('%d %d %s' % (start, code, text)).encode('utf-8'))
+    return result.hexdigest()
+
+def whole(path):
+    with open(path, encoding='utf-8') as f:
+        return digest(statements.split_statements(f.read()))
+
+def chunks(path):
+    with open(path, encoding='utf-8') as f:
+        return digest(statements.split_statements(f))
+
+def mapped(path):
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        return digest(statements.split_statements(data))
+
+def traced(function, path):
+    'Digest of the statements and time of one run, then peak memory of a traced one'
+    start = time.perf_counter()
+    found = function(path)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    try:
+        function(path)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return found, elapsed, peak
+
+def main(copies):
+    formatter.build()
+    # The lexer for bytes is made on first use
+    list(statements.split_statements(b'SELECT 1;'))
+    with open(SCRIPT) as f:
+        script = f.read().replace("'N'", "'é'").replace('--', '-- ü')
+    # Whitespaces the lexer for bytes doesn't match, before a comment alone
+    script += '\x1c-- separated\n\u3000-- apart\n'
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'script.sql')
+        with open(path, 'w', encoding='utf-8') as f:
+            for _ in range(copies):
+                f.write(script)
+        print('%d copies, %.1fMB' % (copies, os.path.getsize(path) / float(1 << 20)))
+        results = {}
+        peaks = {}
+        for name, function in (('whole', whole), ('chunks', chunks), ('mapped', mapped)):
+            results[name], elapsed, peaks[name] = traced(function, path)
+            print('%-6s : %8.3fs %8.1fMB' % (name, elapsed, peaks[name] / float(1 << 20)))
+    same = len(set(results.values())) == 1
+    if not same:
+        print('the statements differ')
+    return 0 if same and peaks['mapped'] < peaks['whole'] else 1
+
+if __name__ == '__main__':
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 16))
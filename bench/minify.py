@@ -0,0 +1,38 @@
+# Compares minifying from the tokens with minifying through the parser
+#
+# Usage: python bench/minify.py [columns]
+#
+# Minifies a query selecting the given number of columns with a formatter using
+# the parser and with a formatter using the token minifier, and checks that
+# both give the same output.
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src import formatter
+
+def make_query(columns):
+    body = ',\n'.join('    -col_%d * (x + 1) AS alias_%d -- note %d' % (i, i, i) for i in range(columns))
+    return 'SELECT DISTINCT\n%s\nFROM t\nWHERE a NOT IN (1, 2) AND b[0] = -1\nORDER BY alias_0 DESC;' % body
+
+def timed(minifier, query):
+    start = time.perf_counter()
+    result = minifier.format(query)
+    return time.perf_counter() - start, result
+
+def main(columns):
+    query = make_query(columns)
+    parsed = formatter.Formatter(minify=True)
+    parsed.minify_tokens = None
+    before, expected = timed(parsed, query)
+    after, result = timed(formatter.Formatter(minify=True), query)
+    print('%d characters' % len(query))
+    print('parser : %8.3fs' % before)
+    print('tokens : %8.3fs (x%.1f)' % (after, before / after))
+    return 0 if result == expected else 1
+
+if __name__ == '__main__':
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000))
@@ -0,0 +1,60 @@
+# Checks that formatting grows linearly with the length of comma lists
+#
+# Usage: python bench/scaling.py [size]
+#
+# Formats IN lists and wide SELECT clauses of size, 2*size, 4*size and 8*size
+# elements and fails when doubling the list more than triples the time. Each
+# time is the best of REPEAT runs with the collector off, as in bench/suite.py,
+# so that a single slow run doesn't look like a quadratic one.
+
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src import formatter
+
+MAX_RATIO = 3.0
+REPEAT = 5
+
+cases = {
+    'in_list': lambda n: 'SELECT id FROM t WHERE id IN (%s)' % ', '.join(str(i) for i in range(n)),
+    'wide_select': lambda n: 'SELECT %s FROM t' % ', '.join('col_%d' % i for i in range(n)),
+}
+
+def timed(query, minify):
+    'Best time of formatting query over REPEAT runs'
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        best = None
+        for _ in range(REPEAT):
+            # The cycles left by the run before are freed outside the timing
+            gc.collect()
+            start = time.perf_counter()
+            formatter.format_query(query, minify)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best
+    finally:
+        if collecting:
+            gc.enable()
+
+def main(size):
+    failed = False
+    for name in sorted(cases):
+        for minify in (False, True):
+            times = []
+            for n in (size, 2 * size, 4 * size, 8 * size):
+                times.append(timed(cases[name](n), minify))
+                print('%-12s minify=%-5s n=%-8d %8.3fs %6.2fus/item' % (name, minify, n, times[-1], 1e6 * times[-1] / n))
+            ratio = max(b / a for a, b in zip(times, times[1:]))
+            if ratio > MAX_RATIO:
+                print('%s: doubling the list multiplied the time by %.2f' % (name, ratio))
+                failed = True
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000))
@@ -0,0 +1,50 @@
+# Records the cold start latency of the formatter
+#
+# Usage: python bench/startup.py [runs]
+#
+# Each run starts a fresh interpreter, imports src.formatter, then formats a
+# first query, and reports both durations. The median over the runs is printed.
+# Fails when the import builds the parser or takes longer than IMPORT_BUDGET.
+# Note that without compiled bytecode (PYTHONDONTWRITEBYTECODE), the parse
+# tables are compiled again by every run, which inflates the first format.
+
+import os
+import subprocess
+import sys
+
+IMPORT_BUDGET = 0.1
+
+root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+child = '''
+import time
+start = time.perf_counter()
+from src import formatter
+imported = time.perf_counter()
+assert formatter.parser is None, 'the parser was built at import'
+formatter.format_query('SELECT a, b FROM t WHERE c = 1')
+formatted = time.perf_counter()
+print(imported - start, formatted - imported)
+'''
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+def main(runs):
+    imports = []
+    firsts = []
+    for _ in range(runs):
+        output = subprocess.check_output([sys.executable, '-c', child], cwd=root)
+        imported, formatted = output.split()
+        imports.append(float(imported))
+        firsts.append(float(formatted))
+    print('import       : %8.1fms' % (1e3 * median(imports)))
+    print('first format : %8.1fms' % (1e3 * median(firsts)))
+    if median(imports) > IMPORT_BUDGET:
+        print('import exceeds its budget of %.1fms' % (1e3 * IMPORT_BUDGET))
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 10))
@@ -0,0 +1,114 @@
+# Measures the peak memory of format_stream() as the formatted script grows
+#
+# Usage: python bench/stream.py [copies]
+#
+# A script made of copies of bench/corpus/script.sql is written to a temporary
+# file, then formatted by format_stream() from that file to another one, and
+# by reading the whole script and formatting it to a string. The peak memory
+# allocated by each way is measured for the script and for a script four times
+# as long. Statements sharing a line must come out on lines of their own, and
+# a script ending in a comment must keep its last newline. A script of
+# statements all on one line is then streamed in small chunks, for the same
+# number of statements and four times as many. Fails when the outputs differ,
+# or when the peak memory of streaming grows with the length of the script.
+
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+bench = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(bench, '..'))
+
+from src import formatter, statements
+
+SCRIPT = os.path.join(bench, 'corpus', 'script.sql')
+
+# Statements sharing a line, and their output
+SHARED = 'select a from t; select b from u;select c from v;'
+SHARED_OUTPUT = 'SELECT\n\ta\nFROM t;\nSELECT\n\tb\nFROM u;\nSELECT\n\tc\nFROM v;'
+
+# Script ending in a comment, and its output
+TRAILING = 'select a from t;\n--comment\n'
+TRAILING_OUTPUT = 'SELECT\n\ta\nFROM t;\n-- comment\n'
+
+# Statement repeated on a single line, and the size of the chunks it is read by
+ONE_LINE = 'select a, b from t where c = 1; '
+ONE_LINE_CHUNK = 1024
+
+# Allowed ratio of the peak memory of format_stream() for the longer script
+GROWTH = 1.25
+
+def whole(path):
+    with open(path) as f:
+        text = f.read()
+    output = io.StringIO()
+    statements.format_stream(text, output)
+    return output.getvalue()
+
+def streamed(path):
+    with open(path) as f, open(path + '.out', 'w') as output:
+        statements.format_stream(f, output)
+
+def one_line(path):
+    with open(path) as f, open(path + '.out', 'w') as output:
+        statements.format_stream(f, output, chunk_size=ONE_LINE_CHUNK)
+
+def traced(function, path):
+    'Result, time and peak memory of one run'
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        result = function(path)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, elapsed, peak
+
+def main(copies):
+    formatter.build()
+    with open(SCRIPT) as f:
+        script = f.read()
+    output = io.StringIO()
+    statements.format_stream(SHARED, output)
+    same = output.getvalue() == SHARED_OUTPUT and statements.check_stream(SHARED_OUTPUT) is None
+    if not same:
+        print('the statements sharing a line are not separated: %r' % output.getvalue())
+    output = io.StringIO()
+    statements.format_stream(TRAILING, output)
+    if output.getvalue() != TRAILING_OUTPUT or statements.check_stream(TRAILING_OUTPUT) is not None:
+        print('the script ending in a comment lost its last newline: %r' % output.getvalue())
+        same = False
+    peaks = []
+    lines = []
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'script.sql')
+        statement_count = len([code for _, _, code in statements.split_statements(script) if code])
+        for count in (copies, 4 * copies):
+            with open(path, 'w') as f:
+                f.write(ONE_LINE * count * statement_count)
+            _, elapsed, peak = traced(one_line, path)
+            print('%4d copies, %-6s : %8.3fs %8.1fMB' % (count, 'line', elapsed, peak / float(1 << 20)))
+            lines.append(peak)
+        for count in (copies, 4 * copies):
+            with open(path, 'w') as f:
+                for _ in range(count):
+                    f.write(script)
+            results = {}
+            for name, function in (('whole', whole), ('stream', streamed)):
+                results[name], elapsed, peak = traced(function, path)
+                print('%4d copies, %-6s : %8.3fs %8.1fMB' % (count, name, elapsed, peak / float(1 << 20)))
+            with open(path + '.out') as f:
+                same = same and f.read() == results['whole']
+            peaks.append(peak)
+    if not same:
+        print('the streamed output differs from the one formatted to a string')
+    print('stream peak growth : x%.2f for a script x4 as long' % (peaks[1] / float(peaks[0])))
+    print('line peak growth   : x%.2f for a line x4 as long' % (lines[1] / float(lines[0])))
+    return 0 if same and peaks[1] <= GROWTH * peaks[0] and lines[1] <= GROWTH * lines[0] else 1
+
+if __name__ == '__main__':
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 4))
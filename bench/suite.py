@@ -0,0 +1,216 @@
+# Times formatting and minifying on the queries of bench/corpus
+#
+# Usage: python bench/suite.py [--repeat N] [--output FILE] [--baseline FILE]
+#                              [--update-baseline] [--require-baseline]
+#                              [--threshold RATIO]
+#
+# Every .sql file of the corpus is cut into statements, which go through each
+# phase on its own so that the phases can be told apart:
+#
+#   lex    : the lexer only
+#   parse  : the parser, fed with the tokens lexed beforehand, without rendering
+#   render : rendering of the documents built by the parser
+#   minify : the token minifier, fed with the tokens lexed beforehand
+#   total  : format_statements, statement by statement as the command line does it
+#
+# The best time over the runs, the tokens per second and the peak memory
+# allocated by each phase are printed, and written as JSON with --output. Each
+# time is also recorded relative to the time of a calibration loop, so that
+# the baseline committed in bench/baseline.json holds on other machines. The
+# relative times are compared with the baseline, and the peak memory too when
+# the baseline was recorded with the same version of Python. The suite fails
+# when a phase takes more than RATIO times its baseline, or with
+# --require-baseline when there is no baseline. The baseline is recorded again
+# with --update-baseline.
+
+import argparse
+import functools
+import gc
+import glob
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+bench = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(bench, '..'))
+
+from src import formatter, statements
+from src.document import render
+from src.minifier import minify_tokens
+
+CORPUS = os.path.join(bench, 'corpus')
+BASELINE = os.path.join(bench, 'baseline.json')
+# The calibration loop follows the phases only roughly from one machine to
+# another, the relative times vary by about a third
+THRESHOLD = 1.5
+
+# Iterations of the calibration loop
+CALIBRATION = 200000
+
+# Phases shorter than this are too noisy to be compared with the baseline
+MIN_SECONDS = 0.02
+
+class Replay(object):
+    'Lexer giving back tokens lexed beforehand'
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+
+    def input(self, data):
+        self.token = functools.partial(next, iter(self.tokens), None)
+
+def lex_all(lexer, queries):
+    tokens = []
+    for query in queries:
+        lexer.input(query)
+        tokens.append(list(iter(lexer.token, None)))
+    return tokens
+
+def parse_all(parser, queries, tokens):
+    # The parser renders the query in its last action, which is skipped here
+    formatter.render = lambda doc: doc
+    try:
+        return [parser.parse(query, lexer=Replay(replayed)) for query, replayed in zip(queries, tokens)]
+    finally:
+        formatter.render = render
+
+def render_all(documents):
+    return [render(document) for document in documents]
+
+def minify_all(queries, tokens):
+    return [minify_tokens(Replay(replayed), query) for query, replayed in zip(queries, tokens)]
+
+def format_all(text, minify):
+    return list(statements.format_statements(text, minify))
+
+def calibration_loop():
+    'Work of the same kind as the phases: lookups, small objects and strings'
+    table = {}
+    for i in range(CALIBRATION):
+        table.setdefault(i & 1023, []).append(str(i))
+    return table
+
+def timed(function):
+    # As timeit does, the collector doesn't run during the timing
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        function()
+        return time.perf_counter() - start
+    finally:
+        if collecting:
+            gc.enable()
+
+def measure(function, repeat):
+    '''
+    Best time over repeat runs, the best time of the calibration loop over as
+    many runs between them, then peak memory over one traced run
+    '''
+    # The loop is timed between the runs, so that both see the same load
+    runs = [(timed(function), timed(calibration_loop)) for _ in range(repeat)]
+    best = min(elapsed for elapsed, _ in runs)
+    unit = min(calibration for _, calibration in runs)
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, unit, peak
+
+def run_case(path, repeat):
+    with open(path) as f:
+        text = f.read()
+    queries = [query for _, query, code in statements.split_statements(text) if code]
+    lexer = formatter.lexer.clone()
+    tokens = lex_all(lexer, queries)
+    count = sum(len(replayed) for replayed in tokens)
+    parser = formatter.Formatter().parser
+    documents = parse_all(parser, queries, tokens)
+
+    phases = {
+        'format': [
+            ('lex', lambda: lex_all(lexer, queries)),
+            ('parse', lambda: parse_all(parser, queries, tokens)),
+            ('render', lambda: render_all(documents)),
+            ('total', lambda: format_all(text, False)),
+        ],
+        'minify': [
+            ('lex', lambda: lex_all(lexer, queries)),
+            ('minify', lambda: minify_all(queries, tokens)),
+            ('total', lambda: format_all(text, True)),
+        ],
+    }
+    result = {'characters': len(text), 'statements': len(queries), 'tokens': count}
+    for mode in ('format', 'minify'):
+        result[mode] = {}
+        for phase, function in phases[mode]:
+            seconds, unit, peak = measure(function, repeat)
+            result[mode][phase] = {'seconds': seconds, 'relative': seconds / unit, 'tokens_per_second': count / seconds, 'peak_bytes': peak}
+    return result
+
+def python_release(results):
+    return results.get('python', '').rsplit('.', 1)[0]
+
+def regressions(results, baseline, threshold):
+    'Phases slower or bigger than threshold times the baseline'
+    found = []
+    # The memory allocated depends on the version of Python
+    memory = python_release(results) == python_release(baseline)
+    for name, case in sorted(results['cases'].items()):
+        for mode in ('format', 'minify'):
+            for phase, current in sorted(case[mode].items()):
+                try:
+                    previous = baseline['cases'][name][mode][phase]
+                except KeyError:
+                    continue
+                if previous['seconds'] >= MIN_SECONDS and current['relative'] > threshold * previous['relative']:
+                    found.append('%s %s %s: %.2f against %.2f calibration loops' % (name, mode, phase, current['relative'], previous['relative']))
+                if memory and current['peak_bytes'] > threshold * previous['peak_bytes']:
+                    found.append('%s %s %s: %d bytes against %d' % (name, mode, phase, current['peak_bytes'], previous['peak_bytes']))
+    return found
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python bench/suite.py', description='Times formatting and minifying on the corpus.')
+    parser.add_argument('--repeat', type=int, default=5, help='runs of each phase, the best one is kept (default: 5)')
+    parser.add_argument('--output', help='write the results as JSON in this file')
+    parser.add_argument('--baseline', default=BASELINE, help='results to compare with (default: bench/baseline.json)')
+    parser.add_argument('--update-baseline', action='store_true', help='write the results as the new baseline')
+    parser.add_argument('--require-baseline', action='store_true', help='fail when there is no baseline to compare with')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD, help='allowed ratio to the baseline (default: %.2f)' % THRESHOLD)
+    args = parser.parse_args(argv)
+
+    if formatter.parser is None:
+        formatter.build()
+    results = {'python': platform.python_version(), 'repeat': args.repeat, 'cases': {}}
+    for path in sorted(glob.glob(os.path.join(CORPUS, '*.sql'))):
+        name = os.path.splitext(os.path.basename(path))[0]
+        case = results['cases'][name] = run_case(path, max(args.repeat, 1))
+        print('%s: %d characters, %d statements, %d tokens' % (name, case['characters'], case['statements'], case['tokens']))
+        for mode in ('format', 'minify'):
+            for phase, measured in case[mode].items():
+                print('    %-6s %-6s %8.3fs %10.0f tokens/s %8.1fMB' % (
+                    mode, phase, measured['seconds'], measured['tokens_per_second'], measured['peak_bytes'] / float(1 << 20)))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    if args.update_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        return 0
+    if not os.path.exists(args.baseline):
+        print('no baseline to compare with, record one with --update-baseline')
+        return 1 if args.require_baseline else 0
+    with open(args.baseline) as f:
+        found = regressions(results, json.load(f), args.threshold)
+    for regression in found:
+        print('regression: %s' % regression)
+    return 1 if found else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
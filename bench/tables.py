@@ -0,0 +1,86 @@
+# Compares the compact parse tables with the dictionaries they are built from
+#
+# Usage: python bench/tables.py [runs]
+#
+# Reports the memory taken by each form of the tables, then parses the queries
+# of bench/corpus with both, replaying tokens lexed beforehand and with actions
+# doing nothing, so that the time left is the one of the parse loop itself.
+# Fails when the compact tables are larger or slower.
+
+import copy
+import functools
+import glob
+import os
+import sys
+import time
+import tracemalloc
+
+bench = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(bench, '..'))
+
+from src import formatter, statements
+from src.ply import yacc
+
+class Replay(object):
+    def __init__(self, tokens):
+        self.tokens = tokens
+
+    def input(self, data):
+        self.token = functools.partial(next, iter(self.tokens), None)
+
+def nothing(p):
+    pass
+
+def load():
+    lexer = formatter.lexer.clone()
+    queries = []
+    for path in sorted(glob.glob(os.path.join(bench, 'corpus', '*.sql'))):
+        with open(path) as f:
+            for _, query, code in statements.split_statements(f.read()):
+                if code:
+                    lexer.input(query)
+                    queries.append((query, list(iter(lexer.token, None))))
+    return queries
+
+def traced(function):
+    tracemalloc.start()
+    try:
+        result = function()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, size
+
+def main(runs):
+    formatter.build()
+    compact = formatter.parser.compact
+    (action, goto), dict_size = traced(compact.expand)
+    _, compact_size = traced(lambda: yacc.CompactTable(action, goto, formatter.parser.productions, formatter.parser.defaulted_states))
+    print('dictionaries : %6.1fKB' % (dict_size / 1024.0))
+    print('compact      : %6.1fKB (x%.2f)' % (compact_size / 1024.0, compact_size / float(dict_size)))
+
+    parsers = {}
+    for name in ('dictionaries', 'compact'):
+        parser = parsers[name] = copy.copy(formatter.parser)
+        parser.productions = [copy.copy(production) for production in parser.productions]
+        for production in parser.productions:
+            if production.callable:
+                production.callable = nothing
+    parsers['dictionaries'].compact = None
+    parsers['dictionaries'].action, parsers['dictionaries'].goto = action, goto
+
+    queries = load()
+    best = {}
+    for _ in range(runs):
+        for name, parser in sorted(parsers.items(), reverse=True):
+            start = time.perf_counter()
+            for query, tokens in queries:
+                parser.parse(query, lexer=Replay(tokens))
+            best[name] = min(best.get(name, float('inf')), time.perf_counter() - start)
+    count = sum(len(tokens) for _, tokens in queries)
+    for name in ('dictionaries', 'compact'):
+        print('%-12s : %8.3fs %10.0f tokens/s' % (name, best[name], count / best[name]))
+    return 0 if compact_size < dict_size and best['compact'] <= best['dictionaries'] else 1
+
+if __name__ == '__main__':
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 10))
@@ -0,0 +1,88 @@
+# Measures the memory taken by the tokens and symbols of the parser
+#
+# Usage: python bench/tokens.py
+#
+# Lexes the queries of bench/corpus into lists to count the blocks and bytes
+# each token keeps alive, then parses them under tracemalloc for the peak
+# memory. Both are done with the slotted LexToken and YaccSymbol, and with
+# subclasses of them having a dictionary, as the classes used to.
+
+import glob
+import os
+import sys
+import time
+import tracemalloc
+
+bench = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(bench, '..'))
+
+from src import formatter, statements
+from src.ply import lex, yacc
+
+SlottedToken = lex.LexToken
+SlottedSymbol = yacc.YaccSymbol
+
+class DictToken(SlottedToken):
+    pass
+
+class DictSymbol(SlottedSymbol):
+    pass
+
+def load():
+    queries = []
+    for path in sorted(glob.glob(os.path.join(bench, 'corpus', '*.sql'))):
+        with open(path) as f:
+            queries.extend(query for _, query, code in statements.split_statements(f.read()) if code)
+    return queries
+
+def lex_all(lexer, queries):
+    tokens = []
+    for query in queries:
+        lexer.input(query)
+        tokens.extend(iter(lexer.token, None))
+    return tokens
+
+def measure(token_class, symbol_class, queries):
+    lex.LexToken = token_class
+    yacc.YaccSymbol = symbol_class
+    try:
+        lexer = formatter.lexer.clone()
+        parser = formatter.Formatter().parser
+        blocks = sys.getallocatedblocks()
+        tracemalloc.start()
+        tokens = lex_all(lexer, queries)
+        kept, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        blocks = sys.getallocatedblocks() - blocks
+        count = len(tokens)
+        del tokens
+
+        tracemalloc.start()
+        for query in queries:
+            parser.parse(query, lexer=lexer)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        for query in queries:
+            parser.parse(query, lexer=lexer)
+        elapsed = time.perf_counter() - start
+    finally:
+        lex.LexToken = SlottedToken
+        yacc.YaccSymbol = SlottedSymbol
+    return count, blocks / float(count), kept / float(count), peak, elapsed
+
+def main():
+    formatter.build()
+    queries = load()
+    results = {}
+    for name, token_class, symbol_class in (('dict', DictToken, DictSymbol), ('slots', SlottedToken, SlottedSymbol)):
+        count, blocks, kept, peak, elapsed = results[name] = measure(token_class, symbol_class, queries)
+        print('%-5s : %d tokens, %4.1f blocks/token, %5.1f bytes/token, parse peak %6.1fMB, parse %6.3fs' % (
+            name, count, blocks, kept, peak / float(1 << 20), elapsed))
+    before, after = results['dict'], results['slots']
+    print('slots : x%.2f blocks, x%.2f bytes per token, x%.2f parse peak' % (after[1] / before[1], after[2] / before[2], after[3] / float(before[3])))
+    return 0 if after[2] < before[2] and after[3] <= before[3] else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,44 +2,134 @@ import sublime
 import sublime_plugin
 
 from .src import formatter
+from .src import diff
+from .src import incremental
 
-def call_formatter(self, edit, minify):
-	self.view.erase_regions('sql_errors')
+formatter.enable_cache(max_entries=256, max_bytes=16 << 20)
+
+STATUS_KEY = 'sql_formatter'
+
+def plugin_loaded():
+	# Writing or importing the direct-coded parser takes a while, it is done on
+	# the async thread, where the queries are formatted
+	sublime.set_timeout_async(formatter.enable_direct, 0)
+
+# Reformatter of each view, reusing the statements unchanged since its last format
+reformatters = {}
+
+def outline_errors(region, err_positions):
+	# Each error is outlined up to the next one, the last one up to the end
+	left = min(region.a, region.b)
+	right = max(region.a, region.b)
+	regions = []
+	for i, err_pos in enumerate(err_positions):
+		end = right
+		if i + 1 < len(err_positions) and err_positions[i + 1] > 0:
+			end = left + err_positions[i + 1]
+		if err_pos > 0:
+			regions.append(sublime.Region(end, left + err_pos))
+		else:
+			regions.append(sublime.Region(right, right - 1))
+	return regions
+
+def relative_positions(error, start, end):
+	# Offsets in their statement of the errors of a statement, -1 at its end
+	errors = error.errors if isinstance(error, formatter.QueryErrors) else [error]
+	positions = [int(str(err)) for err in errors]
+	return [position - start if position < end else -1 for position in positions]
+
+def call_formatter(self, minify):
+	view = self.view
+	view.erase_regions('sql_errors')
 
 	regions = []
-	error_regions = []
 
-	selection = self.view.sel()
+	selection = view.sel()
 	if len(selection) > 1 or not selection[0].empty():
 		regions = [region for region in selection if not(region.empty())]
+	reformatter = None
 	if not regions:
-		regions = [sublime.Region(0, self.view.size())]
+		regions = [sublime.Region(0, view.size())]
+		# A whole view is minified on one line as a selection is, but formatted
+		# statement by statement, keeping the lines around them
+		if not minify:
+			reformatter = reformatters.setdefault(view.id(), incremental.Reformatter())
 
-	for region in reversed(regions):
-		try:
-			formatted_text = formatter.format_query(self.view.substr(region), minify)
-			self.view.replace(edit, region, formatted_text)
-		except (ValueError, SyntaxError) as err:
-			left = min(region.a, region.b)
-			right = max(region.a, region.b)
-			err_pos = int(str(err))
-			if err_pos > 0:
-				error_regions.append(sublime.Region(right, left + err_pos))
+	# The text is read now, formatted on the async thread, and applied back on
+	# the main thread only if the buffer did not change in the meantime.
+	queries = [(region.a, region.b, view.substr(region)) for region in regions]
+	change_count = view.change_count()
+	view.set_status(STATUS_KEY, 'SQL Formatter: minifying...' if minify else 'SQL Formatter: formatting...')
+
+	def formatted_results():
+		results = []
+		if reformatter is not None:
+			# The whole buffer is formatted statement by statement
+			text = queries[0][2]
+			for statement in reformatter.format(text, minify, recover=True):
+				query = text[statement.start:statement.end]
+				if statement.error is None:
+					results.append([statement.start, statement.end, diff.changes(query, statement.output), None])
+				else:
+					results.append([statement.start, statement.end, None, relative_positions(statement.error, statement.start, statement.end)])
+			return results
+		outcomes = formatter.format_many([query for _, _, query in queries], minify, recover=True)
+		for (a, b, query), outcome in zip(queries, outcomes):
+			if outcome.error is None:
+				results.append([a, b, diff.changes(query, outcome.output), None])
 			else:
-				error_regions.append(sublime.Region(right, right - 1))
+				results.append([a, b, None, relative_positions(outcome.error, 0, len(query))])
+		return results
+
+	def format_queries():
+		try:
+			results = formatted_results()
+		except Exception:
+			# The status is erased all the same, and the error shown on the console
+			sublime.set_timeout(lambda: view.erase_status(STATUS_KEY), 0)
+			raise
+		sublime.set_timeout(lambda: apply_results(results), 0)
+
+	def apply_results(results):
+		view.erase_status(STATUS_KEY)
+		if view.change_count() != change_count:
+			sublime.status_message('SQL Formatter: the buffer changed while formatting, the result was dropped')
+			return
+		view.run_command('apply_formatted_query', {'results': results})
+		if reformatter is not None:
+			sublime.set_timeout_async(reformatter.settle, 0)
 
-	
-	if error_regions:
-		self.view.add_regions('sql_errors', error_regions, scope='invalid', flags=sublime.DRAW_OUTLINED)
-		self.view.show(error_regions[0])
+	sublime.set_timeout_async(format_queries, 0)
 
-	if "Plain text" in self.view.settings().get('syntax'):
-		self.view.set_syntax_file("Packages/SQL/SQL.tmLanguage")
+class ApplyFormattedQueryCommand(sublime_plugin.TextCommand):
+	def run(self, edit, results):
+		error_regions = []
+
+		# Only the parts of the regions which differ from the formatted text
+		# are replaced, from the end so that the offsets stay valid.
+		for a, b, changes, err_positions in reversed(results):
+			region = sublime.Region(a, b)
+			if changes is None:
+				error_regions.extend(outline_errors(region, err_positions))
+				continue
+			for start, end, text in reversed(changes):
+				self.view.replace(edit, sublime.Region(region.begin() + start, region.begin() + end), text)
+
+		if error_regions:
+			self.view.add_regions('sql_errors', error_regions, scope='invalid', flags=sublime.DRAW_OUTLINED)
+			self.view.show(error_regions[0])
+
+		if "Plain text" in self.view.settings().get('syntax'):
+			self.view.set_syntax_file("Packages/SQL/SQL.tmLanguage")
 
 class FormatQueryCommand(sublime_plugin.TextCommand):
 	def run(self, edit):
-		call_formatter(self, edit, False)
+		call_formatter(self, False)
 
 class MinifyQueryCommand(sublime_plugin.TextCommand):
 	def run(self, edit):
-		call_formatter(self, edit, True)
+		call_formatter(self, True)
+
+class ReformatterListener(sublime_plugin.EventListener):
+	def on_close(self, view):
+		reformatters.pop(view.id(), None)
@@ -0,0 +1,65 @@
+# Cache of formatted queries
+#
+# Results are keyed by a digest of the query and by the options of the
+# formatter, so that the queries themselves are not kept in memory. The least
+# recently used results are evicted once the number of entries or their total
+# size exceeds the budget.
+
+import collections
+import hashlib
+import sys
+import threading
+
+# Memory taken by an entry besides its result: key, digest and links of the
+# ordered dictionary.
+ENTRY_OVERHEAD = 200
+
+def digest(query):
+    return hashlib.blake2b(query.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+class Cache(object):
+    'Bounded LRU cache of formatted queries, safe to share between threads'
+
+    def __init__(self, max_entries=1024, max_bytes=32 << 20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = collections.OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, query, options):
+        'Formatted query, or None when it is not cached'
+        key = (digest(query), options)
+        with self.lock:
+            result = self.entries.get(key)
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.entries.move_to_end(key)
+            return result
+
+    def put(self, query, options, result):
+        key = (digest(query), options)
+        size = sys.getsizeof(result) + ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+        with self.lock:
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.size -= sys.getsizeof(previous) + ENTRY_OVERHEAD
+            self.entries[key] = result
+            self.size += size
+            while len(self.entries) > self.max_entries or self.size > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= sys.getsizeof(evicted) + ENTRY_OVERHEAD
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+    def stats(self):
+        return {'entries': len(self.entries), 'bytes': self.size, 'hits': self.hits, 'misses': self.misses}
@@ -0,0 +1,235 @@
+# Command line interface, to format .sql files outside of Sublime Text
+#
+# Usage: python -m src.cli [--minify] [--output-dir DIR] [--jobs N] [--profile]
+#                          [--check [--verified FILE]] PATH...
+#
+# Directories are searched recursively for .sql files, which are mapped in
+# memory, formatted statement by statement and written as they are formatted,
+# next to their destination until they are complete. Files are formatted in place unless an
+# output directory is given, in which case the tree of each directory argument
+# is reproduced there. With --check, files are only checked
+# to be formatted already. The digests of the contents found formatted can be
+# kept in a file, so that the files left unchanged are skipped on the next
+# checks.
+
+import argparse
+import filecmp
+import hashlib
+import mmap
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+
+from . import document, formatter, minifier, statements
+
+def error_position(text, offset):
+    'Line and column, starting at 1, of an error offset'
+    if offset < 0:
+        offset = len(text)
+    line = text.count('\n', 0, offset) + 1
+    return line, offset - text.rfind('\n', 0, offset)
+
+def collect(paths, output_dir):
+    'Pairs of (source, destination) for every .sql file found, largest first'
+    tasks = []
+    for path in paths:
+        if os.path.isdir(path):
+            for folder, _, names in os.walk(path):
+                for name in names:
+                    if name.endswith('.sql'):
+                        source = os.path.join(folder, name)
+                        tasks.append((source, os.path.join(output_dir, os.path.relpath(source, path)) if output_dir else source))
+        else:
+            tasks.append((path, os.path.join(output_dir, os.path.basename(path)) if output_dir else path))
+    tasks.sort(key=lambda task: os.path.getsize(task[0]) if os.path.isfile(task[0]) else 0, reverse=True)
+    return tasks
+
+def error_messages(source, query, errors):
+    'Message line of every error of a query'
+    messages = []
+    for error in errors:
+        kind = 'invalid character' if isinstance(error, ValueError) else 'syntax error'
+        messages.append('%s:%d:%d: %s' % ((source,) + error_position(query, int(str(error))) + (kind,)))
+    return '\n'.join(messages)
+
+def open_source(source):
+    '''
+    Source file mapped in memory, or opened as text when it is empty or holds
+    carriage returns, which only text files translate
+    '''
+    with open(source, 'rb') as f:
+        if os.fstat(f.fileno()).st_size:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            if data.find(b'\r') < 0:
+                return data
+            data.close()
+    return open(source, encoding='utf-8')
+
+def format_file(task):
+    'Formats one file, returns the error messages or None'
+    source, destination, minify = task
+    folder = os.path.dirname(destination)
+    try:
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        output = tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=folder or '.',
+                                             prefix='.%s.' % os.path.basename(destination), delete=False)
+    except OSError as err:
+        return '%s: %s' % (destination, err)
+    try:
+        with output:
+            try:
+                with open_source(source) as f:
+                    failed = statements.format_stream(f, output, minify, recover=True)
+            except (OSError, UnicodeDecodeError) as err:
+                return '%s: %s' % (source, err)
+        if failed:
+            with open(source, encoding='utf-8') as f:
+                return error_messages(source, f.read(), [error for statement in failed for error in statement.error.errors])
+        if destination == source and filecmp.cmp(output.name, source, shallow=False):
+            return None
+        if os.path.exists(destination):
+            shutil.copymode(destination, output.name)
+        os.replace(output.name, destination)
+    except OSError as err:
+        return '%s: %s' % (destination, err)
+    finally:
+        if os.path.exists(output.name):
+            os.remove(output.name)
+    return None
+
+def content_digest(data, minify):
+    'Digest of the content of a file, for the given mode'
+    return hashlib.blake2b(data, digest_size=16, person=b'minify' if minify else b'format').hexdigest()
+
+def check_file(task):
+    '''
+    Checks that one file is formatted, returns the digest of its content when
+    it is, and the error message otherwise
+    '''
+    source, minify = task
+    try:
+        with open(source, 'rb') as f:
+            data = f.read()
+        position = statements.check_stream(data, minify, recover=True)
+    except (OSError, UnicodeDecodeError) as err:
+        return None, '%s: %s' % (source, err)
+    except formatter.QueryErrors as err:
+        return None, error_messages(source, data.decode('utf-8'), err.errors)
+    if position is not None:
+        position = error_position(data.decode('utf-8'), position)
+        return None, '%s:%d:%d: not %s' % ((source,) + position + ('minified' if minify else 'formatted',))
+    return content_digest(data, minify), None
+
+def rules_version():
+    'Digest of the modules producing the outputs, which the verified contents depend on'
+    version = hashlib.blake2b(digest_size=16)
+    for module in (document, formatter, minifier, statements):
+        with open(module.__file__, 'rb') as f:
+            version.update(f.read())
+    return version.hexdigest()
+
+def load_verified(path, version):
+    'Digests of the contents already found formatted, kept in path by save_verified()'
+    try:
+        with open(path) as f:
+            lines = f.read().split()
+    except OSError:
+        return set()
+    return set(lines[1:]) if lines[:1] == [version] else set()
+
+def save_verified(path, version, verified):
+    try:
+        with open(path, 'w') as f:
+            f.write('\n'.join([version] + sorted(verified)) + '\n')
+    except OSError as err:
+        print('%s: %s' % (path, err), file=sys.stderr)
+
+def unverified(tasks, verified):
+    'Tasks of the files whose content is not among the verified digests'
+    pending = []
+    for source, minify in tasks:
+        try:
+            with open(source, 'rb') as f:
+                if content_digest(f.read(), minify) in verified:
+                    continue
+        except OSError:
+            pass
+        pending.append((source, minify))
+    return pending
+
+def start_worker():
+    # Processes started rather than forked load the direct-coded parser again
+    if formatter.direct is None:
+        formatter.enable_direct()
+
+def run(function, tasks, jobs):
+    'Calls function on every task with a pool of jobs processes, yields the results'
+    # The direct-coded parser takes longer to load than it saves on a single
+    # file, and the results of the grammar rules are profiled without it
+    direct = len(tasks) > 1 and formatter.profile is None
+    if direct:
+        formatter.enable_direct()
+    if jobs == 1 or len(tasks) < 2:
+        for result in map(function, tasks):
+            yield result
+        return
+    with multiprocessing.Pool(min(jobs, len(tasks)), start_worker if direct else None) as pool:
+        for result in pool.imap_unordered(function, tasks):
+            yield result
+
+def check(args):
+    'Checks the files of the arguments, returns the exit status'
+    tasks = [(source, args.minify) for source, _ in collect(args.paths, None)]
+    version = rules_version()
+    verified = load_verified(args.verified, version) if args.verified else set()
+    pending = unverified(tasks, verified)
+    errors = 0
+    for digest, error in run(check_file, pending, max(args.jobs, 1)):
+        if error:
+            print(error, file=sys.stderr)
+            errors += 1
+        else:
+            verified.add(digest)
+    if args.verified:
+        save_verified(args.verified, version, verified)
+    if errors:
+        print('%d of %d files are not %s' % (errors, len(tasks), 'minified' if args.minify else 'formatted'), file=sys.stderr)
+        return 1
+    return 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m src.cli', description='Formats or minifies Hive SQL files.')
+    parser.add_argument('paths', nargs='+', metavar='PATH', help='.sql file, or directory searched for .sql files')
+    parser.add_argument('--minify', action='store_true', help='minify instead of formatting')
+    parser.add_argument('-o', '--output-dir', help='write the results in this directory instead of in place')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1, help='number of processes (default: number of cores)')
+    parser.add_argument('--profile', action='store_true', help='report the time spent in each grammar rule, in a single process')
+    parser.add_argument('--check', action='store_true', help='only check that the files are formatted, without writing them')
+    parser.add_argument('--verified', metavar='FILE', help='with --check, skip the contents found formatted by the previous checks, kept in this file')
+    args = parser.parse_args(argv)
+    if args.check and (args.output_dir or args.profile):
+        parser.error('--check writes no files and profiles nothing')
+    if args.verified and not args.check:
+        parser.error('--verified is only used with --check')
+    if args.check:
+        return check(args)
+
+    tasks = [(source, destination, args.minify) for source, destination in collect(args.paths, args.output_dir)]
+    profile = formatter.enable_profile() if args.profile else None
+    errors = 0
+    for error in run(format_file, tasks, 1 if profile else max(args.jobs, 1)):
+        if error:
+            print(error, file=sys.stderr)
+            errors += 1
+    if profile:
+        print(profile.report(), file=sys.stderr)
+    if errors:
+        print('%d of %d files could not be formatted' % (errors, len(tasks)), file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,123 @@
+# Client of the formatting daemon of src/daemon.py
+#
+# Usage: python -m src.client [--socket PATH] [--minify] [--check] [PATH...]
+#
+# Files are formatted in place, or only checked with --check. Without paths,
+# the script read from stdin is written formatted to stdout. The requests for
+# all the files are sent to the daemon at once, and its responses read as they
+# come. When no daemon listens on the socket, the same requests are answered
+# in process, at the cost of building the lexer and the parser: the formatter
+# is only imported then.
+
+import argparse
+import getpass
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+
+def default_socket():
+    'Socket of the daemon: $SQL_FORMATTER_SOCKET, or one of the user in the temporary directory'
+    return os.environ.get('SQL_FORMATTER_SOCKET') or os.path.join(tempfile.gettempdir(), 'sql-formatter-%s.sock' % getpass.getuser())
+
+def connect(path):
+    'Socket connected to the daemon listening at path, or None'
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(path)
+    except OSError:
+        client.close()
+        return None
+    return client
+
+def exchange(client, requests):
+    'Responses of the daemon to requests, sent by a thread while the responses are read'
+    def send():
+        try:
+            for request in requests:
+                client.sendall((json.dumps(request) + '\n').encode('utf-8'))
+        except OSError:
+            pass
+    sender = threading.Thread(target=send)
+    sender.daemon = True
+    sender.start()
+    responses = []
+    with client.makefile('rb') as reader:
+        for _ in requests:
+            line = reader.readline()
+            if not line:
+                raise ConnectionError('the daemon closed the connection')
+            responses.append(json.loads(line.decode('utf-8')))
+    sender.join()
+    return responses
+
+def call(requests, path):
+    'Responses to requests, from the daemon listening at path or in process, by id'
+    client = connect(path)
+    if client is None:
+        from . import daemon
+        responses = [daemon.call(request) for request in requests]
+    else:
+        with client:
+            responses = exchange(client, requests)
+    return dict((response['id'], response) for response in responses)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m src.client', description='Formats Hive SQL with the formatting daemon.')
+    parser.add_argument('paths', nargs='*', metavar='PATH', help='.sql file to format in place (default: stdin to stdout)')
+    parser.add_argument('--socket', default=default_socket(), metavar='PATH', help='socket of the daemon (default: %(default)s)')
+    parser.add_argument('--minify', action='store_true', help='minify instead of formatting')
+    parser.add_argument('--check', action='store_true', help='only check that the scripts are formatted')
+    args = parser.parse_args(argv)
+
+    failures = 0
+    scripts = []
+    if not args.paths:
+        scripts.append(('<stdin>', sys.stdin.read()))
+    for path in args.paths:
+        try:
+            with open(path, encoding='utf-8') as f:
+                scripts.append((path, f.read()))
+        except (OSError, UnicodeDecodeError) as err:
+            print('%s: %s' % (path, err), file=sys.stderr)
+            failures += 1
+
+    method = 'check' if args.check else 'minify' if args.minify else 'format'
+    requests = [{'jsonrpc': '2.0', 'id': id, 'method': method, 'params': {'text': text, 'minify': args.minify}}
+                for id, (_, text) in enumerate(scripts)]
+    responses = call(requests, args.socket)
+    for id, (path, text) in enumerate(scripts):
+        response = responses[id]
+        if 'error' in response:
+            print('%s: %s' % (path, response['error']['message']), file=sys.stderr)
+            failures += 1
+            continue
+        result = response['result']
+        if result['errors'] or (args.check and result['difference'] is not None):
+            from .cli import error_position
+            for error in result['errors']:
+                print('%s:%d:%d: %s' % ((path,) + error_position(text, error['offset']) + (error['kind'],)), file=sys.stderr)
+            if not result['errors']:
+                kind = 'not minified' if args.minify else 'not formatted'
+                print('%s:%d:%d: %s' % ((path,) + error_position(text, result['difference']) + (kind,)), file=sys.stderr)
+            failures += 1
+        # The statements holding errors are written as they are to stdout
+        if args.check or (args.paths and (result['errors'] or result['output'] == text)):
+            continue
+        if not args.paths:
+            sys.stdout.write(result['output'])
+            continue
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(result['output'])
+        except OSError as err:
+            print('%s: %s' % (path, err), file=sys.stderr)
+            failures += 1
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,184 @@
+# Formatting daemon, keeping the lexer, the parser and the results cache warm
+#
+# Usage: python -m src.daemon [--socket [PATH]]
+#
+# Requests and responses are JSON-RPC 2.0 messages, one per line, read from
+# stdin and written to stdout, or exchanged with every client of the Unix
+# socket, each served by its own thread. A client may send its requests
+# without waiting for the responses, which come back in the same order with
+# their ids. Requests without an id are notifications, answered by nothing.
+#
+# Methods, whose params are an object:
+#
+#   format : {"text": script, "minify": false}  ->  {"output": ..., "errors": [...]}
+#   minify : {"text": script}                   ->  {"output": ..., "errors": [...]}
+#   check  : {"text": script, "minify": false}  ->  {"difference": ..., "errors": [...]}
+#   stats  : {}                                 ->  counters of the results cache
+#
+# Scripts are formatted statement by statement like the command line does,
+# and the statements holding errors are left as they are in the output. The
+# difference is the offset where the script first differs from its output,
+# or null when it is formatted. Errors are {"offset": ..., "kind": "syntax
+# error" or "invalid character"}, and offsets count the characters of text.
+
+import argparse
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+
+from . import formatter, statements
+from .client import default_socket
+
+# JSON-RPC error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+class InvalidParams(Exception):
+    pass
+
+def text_param(params):
+    text = params.get('text')
+    if not isinstance(text, str):
+        raise InvalidParams('params.text must be a string')
+    return text
+
+def error_list(errors):
+    return [{'offset': int(str(error)), 'kind': 'invalid character' if isinstance(error, ValueError) else 'syntax error'}
+            for error in errors]
+
+def format_text(params, minify=None):
+    text = text_param(params)
+    output = io.StringIO()
+    failed = statements.format_stream(text, output, bool(params.get('minify')) if minify is None else minify, recover=True)
+    return {'output': output.getvalue(), 'errors': error_list(error for statement in failed for error in statement.error.errors)}
+
+def check_text(params):
+    try:
+        difference = statements.check_stream(text_param(params), bool(params.get('minify')), recover=True)
+    except formatter.QueryErrors as err:
+        return {'difference': None, 'errors': error_list(err.errors)}
+    return {'difference': difference, 'errors': []}
+
+def stats(params):
+    return formatter.cache.stats() if formatter.cache is not None else {}
+
+METHODS = {
+    'format': format_text,
+    'minify': lambda params: format_text(params, True),
+    'check': check_text,
+    'stats': stats,
+}
+
+def error(id, code, message):
+    return {'jsonrpc': '2.0', 'id': id, 'error': {'code': code, 'message': message}}
+
+def call(request):
+    'Response to a request, or None for a notification'
+    if not isinstance(request, dict) or request.get('jsonrpc') != '2.0' or not isinstance(request.get('method'), str):
+        return error(request.get('id') if isinstance(request, dict) else None, INVALID_REQUEST, 'Invalid Request')
+    id = request.get('id')
+    method = METHODS.get(request['method'])
+    params = request.get('params', {})
+    if method is None:
+        response = error(id, METHOD_NOT_FOUND, 'Method not found: %s' % request['method'])
+    elif not isinstance(params, dict):
+        response = error(id, INVALID_PARAMS, 'params must be an object')
+    else:
+        try:
+            response = {'jsonrpc': '2.0', 'id': id, 'result': method(params)}
+        except InvalidParams as err:
+            response = error(id, INVALID_PARAMS, str(err))
+        except Exception as err:
+            # The daemon outlives the requests it can't answer
+            response = error(id, INTERNAL_ERROR, '%s: %s' % (type(err).__name__, err))
+    return response if 'id' in request else None
+
+def respond(line):
+    'Response line to a request line, or None'
+    try:
+        request = json.loads(line)
+    except ValueError:
+        return json.dumps(error(None, PARSE_ERROR, 'Parse error')) + '\n'
+    if isinstance(request, list):
+        responses = [response for response in map(call, request) if response is not None]
+        if not request:
+            responses = error(None, INVALID_REQUEST, 'Invalid Request')
+    else:
+        responses = call(request)
+    return json.dumps(responses) + '\n' if responses else None
+
+def serve(reader, writer):
+    'Answers the request lines read from reader, a binary file, on writer'
+    for line in reader:
+        if not line.strip():
+            continue
+        response = respond(line.decode('utf-8', 'replace'))
+        if response is not None:
+            writer.write(response.encode('utf-8'))
+            writer.flush()
+
+class Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            serve(self.rfile, self.wfile)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+def listening(path):
+    'Whether a daemon already listens on the socket at path'
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(path)
+        return True
+    except OSError:
+        return False
+    finally:
+        client.close()
+
+def warm_up():
+    # The recovering formatters parse with the direct-coded parser first, and
+    # parse again with the tables only the statements holding errors.
+    # parsedirect.py is only written again when the grammar changed.
+    formatter.build()
+    formatter.enable_cache()
+    formatter.enable_direct()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m src.daemon', description='Formats Hive SQL for clients speaking JSON-RPC.')
+    parser.add_argument('--socket', nargs='?', const=default_socket(), metavar='PATH',
+                        help='listen on this Unix socket (default path: %s) instead of stdin and stdout' % default_socket())
+    args = parser.parse_args(argv)
+
+    warm_up()
+    if args.socket is None:
+        serve(sys.stdin.buffer, sys.stdout.buffer)
+        return 0
+    if os.path.exists(args.socket):
+        if listening(args.socket):
+            print('a daemon already listens on %s' % args.socket, file=sys.stderr)
+            return 1
+        os.remove(args.socket)
+    server = Server(args.socket, Handler)
+    # Stopped by SIGTERM as by SIGINT, removing the socket
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.remove(args.socket)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,51 @@
+# Minimal edits between a query and its formatted version
+#
+# Replacing a whole region makes the editor redraw and highlight all of it
+# again, and keep an undo record as large as the region. The two texts are
+# compared line by line instead, and each block of changed lines is narrowed
+# to the characters which actually differ.
+
+import difflib
+
+def common_prefix(a, b):
+    size = min(len(a), len(b))
+    i = 0
+    while i < size and a[i] == b[i]:
+        i += 1
+    return i
+
+def common_suffix(a, b, limit):
+    i = 0
+    while i < limit and a[-1 - i] == b[-1 - i]:
+        i += 1
+    return i
+
+def offsets(lines):
+    'Offset of the start of every line, and of the end of the text'
+    result = [0]
+    for line in lines:
+        result.append(result[-1] + len(line))
+    return result
+
+def changes(old, new):
+    '''
+    List of (start, end, text) edits turning old into new, in increasing order.
+    start and end are offsets in old, so the edits must be applied from the
+    last one to the first one.
+    '''
+    if old == new:
+        return []
+    old_lines = old.splitlines(True)
+    new_lines = new.splitlines(True)
+    old_offsets = offsets(old_lines)
+    new_offsets = offsets(new_lines)
+    result = []
+    for tag, i1, i2, j1, j2 in difflib.SequenceMatcher(None, old_lines, new_lines).get_opcodes():
+        if tag == 'equal':
+            continue
+        start, end = old_offsets[i1], old_offsets[i2]
+        before, after = old[start:end], new[new_offsets[j1]:new_offsets[j2]]
+        prefix = common_prefix(before, after)
+        suffix = common_suffix(before, after, min(len(before), len(after)) - prefix)
+        result.append((start + prefix, end - suffix, after[prefix:len(after) - suffix]))
+    return result
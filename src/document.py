@@ -0,0 +1,271 @@
+# Document tree built by the grammar actions of formatter.py
+#
+# Instead of re-indenting an already rendered string at each level of nesting,
+# the actions combine small nodes (text, newline, concatenation, indentation,
+# flattening) and the whole tree is rendered once at the end.
+#
+# A few actions need to look at the rendered text of a child (its first or last
+# character, whether it spans several lines...). Each node therefore carries a
+# summary of its own rendering, computed from the summaries of its children
+# when it is built. The summary describes the text before the whitespaces are
+# normalized by render.
+
+import re
+import sys
+
+_TEXT = 0
+_NEWLINE = 1
+_CONCAT = 2
+_INDENT = 3
+_FLATTEN = 4
+_INLINE = 5
+_COMPACT = 6
+_SPACES = 7
+_PADDED_TEXT = 8
+
+numeric_regex = re.compile(r'^[\s\d\.\+\-\*\/\^\%\&\|\(\)\=\<\>\!\~\,\$]*$')
+
+class Doc(object):
+    '''
+    Node of the document tree. The summary attributes describe the text the
+    node renders to when it is not nested in any other node:
+
+    first, last       : first and last characters ('' when empty)
+    first_nt, last_nt : first and last characters which are not tabulations
+    size              : length of the text
+    newlines, tabs    : number of newlines and tabulations in the text
+    numeric           : text only holds numbers, operators and whitespaces
+    '''
+    __slots__ = ('kind', 'value', 'first', 'first_nt', 'last', 'last_nt', 'size', 'newlines', 'tabs', 'numeric')
+
+    def __str__(self):
+        return render(self)
+
+    def __repr__(self):
+        return 'Doc(%r)' % render(self)
+
+def text(value):
+    'Text node, split on newlines when needed'
+    if '\n' in value:
+        lines = value.split('\n')
+        parts = [NEWLINE] * (2 * len(lines) - 1)
+        parts[::2] = [text(line) for line in lines]
+        return concat(*parts)
+
+    doc = Doc()
+    if not value or value.isspace():
+        doc.kind = _SPACES
+    elif value[0].isspace() or value[-1].isspace():
+        doc.kind = _PADDED_TEXT
+    else:
+        doc.kind = _TEXT
+    doc.value = value
+    doc.size = len(value)
+    doc.newlines = 0
+    doc.tabs = value.count('\t')
+    doc.numeric = numeric_regex.match(value) is not None
+    if doc.tabs:
+        stripped = value.strip('\t')
+        doc.first, doc.last = value[:1], value[-1:]
+        doc.first_nt, doc.last_nt = stripped[:1], stripped[-1:]
+    else:
+        doc.first = doc.first_nt = value[:1]
+        doc.last = doc.last_nt = value[-1:]
+    return doc
+
+def _newline():
+    doc = Doc()
+    doc.kind = _NEWLINE
+    doc.value = None
+    doc.first = doc.first_nt = doc.last = doc.last_nt = '\n'
+    doc.size = 1
+    doc.newlines = 1
+    doc.tabs = 0
+    doc.numeric = True
+    return doc
+
+NEWLINE = _newline()
+EMPTY = text('')
+
+def concat(*parts):
+    'Concatenation of nodes, which can be extended afterwards'
+    doc = Doc()
+    doc.kind = _CONCAT
+    doc.value = []
+    doc.first = doc.first_nt = doc.last = doc.last_nt = ''
+    doc.size = doc.newlines = doc.tabs = 0
+    doc.numeric = True
+    return extend(doc, *parts)
+
+def extend(doc, *parts):
+    'Appends nodes to a concatenation in place, so that lists are built in linear time'
+    doc.value.extend(parts)
+    for part in parts:
+        doc.size += part.size
+        doc.newlines += part.newlines
+        doc.tabs += part.tabs
+        doc.numeric = doc.numeric and part.numeric
+        if not doc.first:
+            doc.first = part.first
+        if not doc.first_nt:
+            doc.first_nt = part.first_nt
+        if part.last:
+            doc.last = part.last
+        if part.last_nt:
+            doc.last_nt = part.last_nt
+    return doc
+
+def indent(child):
+    'Indents every line of child but the first one with a tabulation'
+    doc = Doc()
+    doc.kind = _INDENT
+    doc.value = child
+    doc.first, doc.first_nt, doc.last_nt = child.first, child.first_nt, child.last_nt
+    doc.last = '\t' if child.last == '\n' else child.last
+    doc.size = child.size + child.newlines
+    doc.newlines = child.newlines
+    doc.tabs = child.tabs + child.newlines
+    doc.numeric = child.numeric
+    return doc
+
+def _unwrap(char):
+    return ' ' if char == '\n' else char
+
+def flatten(child):
+    'Replaces the newlines of child by spaces'
+    doc = Doc()
+    doc.kind = _FLATTEN
+    doc.value = child
+    doc.first, doc.first_nt = _unwrap(child.first), _unwrap(child.first_nt)
+    doc.last, doc.last_nt = _unwrap(child.last), _unwrap(child.last_nt)
+    doc.size = child.size
+    doc.newlines = 0
+    doc.tabs = child.tabs
+    doc.numeric = child.numeric
+    return doc
+
+def inline(child):
+    'Replaces the newlines of child by spaces and removes its tabulations'
+    doc = Doc()
+    doc.kind = _INLINE
+    doc.value = child
+    doc.first = doc.first_nt = _unwrap(child.first_nt)
+    doc.last = doc.last_nt = _unwrap(child.last_nt)
+    doc.size = child.size - child.tabs
+    doc.newlines = doc.tabs = 0
+    doc.numeric = child.numeric
+    return doc
+
+def compact(child):
+    'Like inline, and also removes the spaces just inside parentheses'
+    doc = inline(child)
+    doc.kind = _COMPACT
+    return doc
+
+#  _ __   ___  _ __    __| |  ___  _ __
+# | '__| / _ \| '_ \  / _` | / _ \| '__|
+# | |   |  __/| | | || (_| ||  __/| |
+# |_|    \___||_| |_| \__,_| \___||_|
+
+# While walking down the tree, the nodes crossed so far are summed up by the
+# number of indentations applied to the newlines and by the flattening mode
+# (0: newlines are kept, 1: newlines become spaces, 2: tabulations are removed
+# too, 3: spaces just inside parentheses are removed too).
+#
+# Whitespaces are normalized on the fly: a run of whitespaces is only written
+# once the text following it is known. Empty lines are removed, spaces at the
+# start of lines are removed, comments starting a line are not indented, and
+# the whitespaces at both ends of the output are dropped.
+
+def spacing(run, previous, following, flat):
+    'Normalized run of whitespaces between two texts'
+    if '\n' in run:
+        last = run.rindex('\n')
+        if following.startswith('--'):
+            tail = ''
+        elif run.startswith(' ', last + 1):
+            tail = run[last + 1:].lstrip(' ')
+        elif run.index('\n') == last:
+            return run
+        else:
+            tail = run[last + 1:]
+        return run[:run.index('\n')] + '\n' + tail
+    if flat == 3:
+        if previous.endswith('(') and run.startswith(' '):
+            run = run[1:]
+        if following.startswith(')') and run.endswith(' '):
+            run = run[:-1]
+    return run
+
+# Texts joined into each chunk yielded by render_chunks()
+CHUNK_TEXTS = 256
+
+def render_chunks(doc, texts=CHUNK_TEXTS):
+    '''
+    Renders the document like render(), yielding the output as it goes in
+    chunks of about texts texts, so that it never needs to be held whole
+    '''
+    output = []
+    append = output.append
+    # The last text of the previous chunk is kept for the spacing of the next one
+    emitted = 0
+    spaces = ''
+    stack = [(doc, 0, 0)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        doc, depth, flat = pop()
+        kind = doc.kind
+        if kind == _TEXT or kind == _PADDED_TEXT:
+            value = doc.value
+            if flat >= 2 and doc.tabs:
+                value = value.replace('\t', '')
+            if kind == _PADDED_TEXT:
+                stripped = value.lstrip()
+                if not stripped:
+                    spaces += value
+                    continue
+                spaces += value[:len(value) - len(stripped)]
+                value = stripped.rstrip()
+            if spaces:
+                if output:
+                    if flat == 3 or '\n' in spaces:
+                        spaces = spacing(spaces, output[-1], value, flat)
+                    append(spaces)
+                spaces = ''
+            append(value)
+            if kind == _PADDED_TEXT:
+                spaces = stripped[len(value):]
+            if len(output) > texts:
+                yield ''.join(output[emitted:])
+                output[:] = (value,)
+                emitted = 1
+        elif kind == _SPACES:
+            if flat >= 2 and doc.tabs:
+                spaces += doc.value.replace('\t', '')
+            else:
+                spaces += doc.value
+        elif kind == _CONCAT:
+            for part in reversed(doc.value):
+                push((part, depth, flat))
+        elif kind == _NEWLINE:
+            if flat == 0:
+                spaces += '\n' + '\t' * depth
+            elif flat == 1:
+                spaces += ' ' + '\t' * depth
+            else:
+                spaces += ' '
+        elif kind == _INDENT:
+            push((doc.value, depth + 1, flat))
+        elif kind == _FLATTEN:
+            push((doc.value, 0, flat if flat >= 2 else 1))
+        elif kind == _INLINE:
+            push((doc.value, 0, flat if flat >= 2 else 2))
+        else:
+            push((doc.value, 0, 3))
+    if len(output) > emitted:
+        yield ''.join(output[emitted:])
+
+def render(doc):
+    'Renders the document to a string with normalized whitespaces in a single pass'
+    return ''.join(render_chunks(doc, sys.maxsize))
@@ -0,0 +1,122 @@
+# Fingerprints of queries, equal for the queries of the same shape
+#
+# A query is normalized from its tokens alone, without parsing it: the keywords
+# are uppercased, the strings and numbers are replaced by ? and the lists of
+# literals of IN by a single one, the comments and the semicolons ending the
+# query are dropped, and the tokens are joined by a space. Its fingerprint is a
+# 64-bit digest of that text, the same from one run or machine to another.
+#
+# The tokens are cut by the rules of formatter.py with string methods rather
+# than with the lexer, whose loop calling back into Python for each token is
+# too slow for logs: the strings, the labels between backquotes and the
+# comments are found by the regexes of their rules, then the query is split on
+# whitespace. Each chunk between whitespace is cut once into tokens by spacing
+# out the characters of the operators and brackets, and its words are kept in
+# a cache of the least recently used chunks for the next queries. The
+# operators are thus cut into characters, which is the same for every query.
+# Labels between backquotes are names, not literals, and are kept whole. A
+# comment starts where the lexer would start one, which excludes -- within a
+# run of symbols such as +--.
+
+import functools
+import hashlib
+import re
+
+from . import formatter
+from .formatter import reserved
+
+PLACEHOLDER = '?'
+
+def punctuation():
+    'Characters of the operators and brackets, tokens of their own in the rules of formatter.py'
+    rules = [value for name, value in vars(formatter).items()
+             if name.startswith('t_') and isinstance(value, str) and not name.startswith(('t_STRING', 't_ignore'))]
+    return [char for char in map(chr, range(33, 127)) if any(re.fullmatch(rule, char) for rule in rules)]
+
+SPACED = [(char, ' %s ' % char) for char in punctuation()]
+
+# Comments, except for -- within a run of symbols, which the lexer cuts as
+# one operator from its first symbol. The first - is matched before looking
+# behind it, so that the regex still skips quickly to the characters starting
+# a literal.
+COMMENT = '-(?<!%s-)%s' % (formatter.t_SYMBOL[:-1], formatter.t_COMMENT.__doc__[1:])
+
+# Strings, labels between backquotes and comments, in the order the lexer tries them
+LITERAL = re.compile('|'.join((COMMENT, formatter.t_STRING_SIMPLE,
+                               formatter.t_STRING_DOUBLE, formatter.t_STRING_GRAVE)))
+
+# Labels which are numbers, with the suffixes of Hive for their types
+NUMBER = re.compile(r'[0-9]+(?:[eE][0-9]*)?(?:[lLsSyY]|[bB][dD])?$')
+
+DECIMAL = re.compile(r'\? \. \?')
+IN_LIST = re.compile(r' IN \( (?:- )?\?(?: , (?:- )?\?)* \)')
+
+# Chunks whose normalized words are cached
+CHUNKS = 1 << 16
+
+def literal(match):
+    return ' ' if match.group()[0] == '-' else ' ? '
+
+def without_literals(query):
+    'query without labels between backquotes, with its strings replaced by ? and without its comments'
+    if '"' in query or '--' in query:
+        return LITERAL.sub(literal, query)
+    if "'" not in query:
+        return query
+    # Only simple quotes: the strings are every other part between them, unless
+    # one is left open or spans lines, which the rule doesn't match
+    parts = query.split("'")
+    if len(parts) % 2 == 0 or '\n' in ''.join(parts[1::2]):
+        return LITERAL.sub(literal, query)
+    return ' ? '.join(parts[::2])
+
+def word(token):
+    'Normalized word of a token'
+    if token.lower() in reserved:
+        return token.upper()
+    return PLACEHOLDER if NUMBER.match(token) else token
+
+@functools.lru_cache(maxsize=CHUNKS)
+def chunk_words(chunk):
+    'Normalized words of the tokens of a chunk of a query between whitespace'
+    text = chunk
+    for char, spaced in SPACED:
+        if char in text:
+            text = text.replace(char, spaced)
+    return ' '.join(map(word, text.split()))
+
+def labelled_words(query):
+    'Normalized words of a query, keeping its labels between backquotes whole'
+    words = []
+    position = 0
+    for match in LITERAL.finditer(query):
+        words.extend(map(chunk_words, query[position:match.start()].split()))
+        first = match.group()[0]
+        if first == '`':
+            words.append(match.group())
+        elif first != '-':
+            words.append(PLACEHOLDER)
+        position = match.end()
+    words.extend(map(chunk_words, query[position:].split()))
+    return ' '.join(words)
+
+def normalize(query):
+    'Text of the shape of query, from which its fingerprint is computed'
+    if '`' in query:
+        return collapsed(labelled_words(query))
+    # Queries are mostly made of the same chunks, normalized once
+    return collapsed(' '.join(map(chunk_words, without_literals(query).split())))
+
+def collapsed(text):
+    'Normalized words of a query without its last semicolons, with its decimals and lists of IN collapsed'
+    result = text.rstrip(' ;')
+    if '? . ?' in result:
+        result = DECIMAL.sub(PLACEHOLDER, result)
+    if ' IN ( ' in result:
+        result = IN_LIST.sub(' IN ( ? )', result)
+    return result
+
+def fingerprint(query):
+    'Fingerprint of query, a 64-bit integer'
+    digest = hashlib.blake2b(normalize(query).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big')
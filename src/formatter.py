@@ -1,9 +1,16 @@
 # Based on Hive SQL Syntax 👍
 # https://cwiki.apache.org/confluence/display/Hive/LanguageManual
 
-from .ply import yacc
 from .ply import lex
+from .document import text, concat, extend, indent, flatten, inline, compact, render, render_chunks, NEWLINE, EMPTY
+from .cache import Cache
+from .profiler import Profile
+import collections
+import copy
+import functools
 import re
+import sys
+import threading
 
 #  _           _                      
 # | |_   ___  | | __  ___  _ __   ___ 
@@ -95,24 +102,31 @@ t_STRING_SIMPLE = r'\'.*?\''
 t_STRING_DOUBLE = r'\".*?\"'
 t_STRING_GRAVE = r'\`.*?\`'
 
+# Whitespace runs are skipped without calling back into Python. A run stops
+# after its first newline so that a comment alone on the next line is still
+# matched from the start of that line by t_COMMENT_ALONE.
+t_ignore_WHITESPACE = r'[^\S\n]*\n|[^\S\n]+'
+
 def t_LABEL(t):
      r'[a-zA-Z0-9$\{\}\_\:\@\#]+'
      t.type = reserved.get(t.value.lower(),'LABEL')        # Check for reserved words
      return t
 
 def t_COMMENT_ALONE(t):
-    r'((^|(?<=\n))(?:\s*)--[^\n]*)|\s'
-    if '--' in t.value:
-        return t
-    else:
-        pass
+    r'(^|(?<=\n))\s*--[^\n]*'
+    return t
 
 def t_COMMENT(t):
     r'--[^\n]*'
     return t
 
 def t_error(t):
-    raise ValueError(t.lexpos)
+    # Lexers of recovering formatters collect the errors and skip the character
+    errors = getattr(t.lexer, 'errors', None)
+    if errors is None:
+        raise ValueError(t.lexpos)
+    errors.append(ValueError(t.lexpos))
+    t.lexer.skip(1)
 
 #  _ __   ___   __ _   ___ __  __
 # | '__| / _ \ / _` | / _ \\ \/ /
@@ -120,18 +134,13 @@ def t_error(t):
 # |_|    \___| \__, | \___|/_/\_\
 #              |___/             
 
-numeric_regex = re.compile(r'^[\s\d\.\+\-\*\/\^\%\&\|\(\)\=\<\>\!\~\,\$]*$')
-is_numeric_expression = lambda x: numeric_regex.match(x)
+is_numeric_expression = lambda x: x.numeric
 
-empty_line_regex = re.compile(r'\n\s*\n')
-spaces_start_regex = re.compile(r'^[ ]+', re.MULTILINE)
-comments_regex = re.compile(r'--\s*')
-comments_alone_regex = re.compile(r'^\s*--', re.MULTILINE)
-remove_useless_whitespaces = lambda x: comments_alone_regex.sub('--', comments_regex.sub('-- ', spaces_start_regex.sub('', empty_line_regex.sub('\n', x)))).strip()
+SPACE = text(' ')
+TAB = text('\t')
 
-space_after_left_par_regex = re.compile(r'\( ')
-space_before_right_par_regex = re.compile(r' \)')
-sanitize_one_line_subquery = lambda x: space_after_left_par_regex.sub('(', space_before_right_par_regex.sub(')' ,x))
+comments_regex = re.compile(r'--\s*')
+normalize_comment = lambda x: comments_regex.sub('-- ', x)
 
 #   __ _  _ __   __ _  _ __ ___   _ __ ___    __ _  _ __ 
 #  / _` || '__| / _` || '_ ` _ \ | '_ ` _ \  / _` || '__|
@@ -148,7 +157,9 @@ sanitize_one_line_subquery = lambda x: space_after_left_par_regex.sub('(', space
 
 def p_formatted_query(p):
     'formatted_query : query'
-    p[0] = remove_useless_whitespaces(p[1])
+    options = p.parser.options
+    # The document is rendered by the caller when checking a query
+    p[0] = p[1] if options["document"] else render(p[1])
 
                                  
 #   __ _  _   _   ___  _ __  _   _ 
@@ -163,11 +174,11 @@ def p_query(p):
 
 def p_query_with_semicolon(p):
     'query : query semicolon'
-    p[0] = "%s%s" % (p[1], p[2])
+    p[0] = concat(p[1], p[2])
 
 def p_query_with_comment(p):
     'query : comment query'
-    p[0] = "%s%s" % (p[1], p[2])
+    p[0] = concat(p[1], p[2])
 
 #              _                                            
 #  ___  _   _ | |__    __ _  _   _   ___  _ __  _ __  _   _ 
@@ -182,7 +193,8 @@ def p_subquerry(p):
 
 def p_subquerry_by_block(p):
     'subquerry : subquerry by_block'
-    p[0] = "%s%s%s" % (p[1], options["newline_sep"], p[2])
+    options = p.parser.options
+    p[0] = concat(p[1], options["newline_sep"], p[2])
 
 #             _              _   
 #  ___   ___ | |  ___   ___ | |_ 
@@ -196,21 +208,23 @@ def p_select_full_select(p):
 
 def p_select_full_combined(p):
     'select_full : select_full combine_keyword select_full'
-    p[0] = "%s%s%s%s%s" % (p[1], options["newline_sep"], p[2], options["newline_sep"], p[3])
+    options = p.parser.options
+    p[0] = concat(p[1], options["newline_sep"], p[2], options["newline_sep"], p[3])
 
 def p_select_full_parentheses(p):
     'select_full : left_par select_full right_par'
-    p[2] = p[2].replace('\n','\n\t')
-    p[0] = "%s%s%s%s%s%s" % (p[1], options["newline"], options["tab"], p[2], options["newline"], p[3])
+    options = p.parser.options
+    p[0] = concat(p[1], options["newline"], options["tab"], indent(p[2]), options["newline"], p[3])
 
 def p_select_full_more(p):
     'select_full : select_block additional_block_list'
-    p[0] = "%s%s%s" % (p[1], options["newline_sep"], p[2])
+    options = p.parser.options
+    p[0] = concat(p[1], options["newline_sep"], p[2])
 
 def p_select_block(p):
     'select_block : select_keyword select_clause'
-    p[2] = p[2].replace('\n','\n\t')
-    p[0] = "%s%s%s%s" % (p[1], options["newline_sep"], options["tab"], p[2])
+    options = p.parser.options
+    p[0] = concat(p[1], options["newline_sep"], options["tab"], indent(p[2]))
 
 def p_select_keyword_alone(p):
     'select_keyword : select'
@@ -221,15 +235,16 @@ def p_select_keyword_enriched(p):
     select_keyword : select distinct
                    | select all
     '''
-    p[0] = "%s %s" % (p[1], p[2])
+    p[0] = concat(p[1], SPACE, p[2])
 
 def p_select_clause_next(p):
-    'select_clause : expr comma select_clause'
-    p[0] = "%s%s%s%s" % (p[1], p[2], options["newline"], p[3])
+    'select_clause : select_clause comma expr'
+    options = p.parser.options
+    p[0] = extend(p[1], p[2], options["newline"], p[3])
 
 def p_select_clause_end(p):
     'select_clause : expr'
-    p[0] = p[1]
+    p[0] = concat(p[1])
 
 #                                     _      _               _    
 #   __ _  _   _   ___  _ __  _   _   | |__  | |  ___    ___ | | __
@@ -240,7 +255,8 @@ def p_select_clause_end(p):
 
 def p_additional_block_list_next(p):
     'additional_block_list : additional_block additional_block_list'
-    p[0] = "%s%s%s" % (p[1], options["newline_sep"], p[2])
+    options = p.parser.options
+    p[0] = concat(p[1], options["newline_sep"], p[2])
 
 def p_additional_block_list_end(p):
     'additional_block_list : additional_block'
@@ -262,7 +278,7 @@ def p_keyword_block(p):
                   | having clause
                   | option clause
     '''
-    p[0] = "%s %s" % (p[1], p[2])
+    p[0] = concat(p[1], SPACE, p[2])
 
 def p_by_block(p):
     '''
@@ -273,12 +289,12 @@ def p_by_block(p):
              | sort by clause
              | partition by clause
     '''
-    p[0] = "%s %s %s"  % (p[1], p[2], p[3])
+    p[0] = concat(p[1], SPACE, p[2], SPACE, p[3])
 
 def p_clause(p):
     'clause : expr_list'
-    if p[1][0] != '(' and '\n' in p[1]:
-        p[1] = p[1].replace('\n','\n\t')
+    if p[1].first != '(' and p[1].newlines:
+        p[1] = indent(p[1])
     p[0] = p[1]
 
 #                          _      _              
@@ -292,7 +308,7 @@ def p_combine_keyword_composed(p):
     combine_keyword : union all
                     | union distinct
     '''
-    p[0] = "%s %s" % (p[1], p[2])
+    p[0] = concat(p[1], SPACE, p[2])
 
 def p_combine_keyword_alone(p):
     '''
@@ -310,16 +326,16 @@ def p_combine_keyword_alone(p):
 
 def p_join_block_on(p):
     'join_block : join_expression clause on expr_list'
-    p[4] = p[4].replace('\n','\n\t')
-    p[0] = "%s %s%s%s%s %s" % (p[1], p[2], options["newline_sep"], options["tab"], p[3], p[4])
+    options = p.parser.options
+    p[0] = concat(p[1], SPACE, p[2], options["newline_sep"], options["tab"], p[3], SPACE, indent(p[4]))
 
 def p_join_block_alone(p):
     'join_block : join_expression clause'
-    p[0] = "%s %s" % (p[1], p[2])
+    p[0] = concat(p[1], SPACE, p[2])
 
 def p_join_expression(p):
     'join_expression : join_prefix_list join'
-    p[0] = "%s %s" % (p[1], p[2])
+    p[0] = concat(p[1], SPACE, p[2])
 
 def p_join_expression_alone(p):
     'join_expression : join'
@@ -341,7 +357,7 @@ def p_join_prefix(p):
 
 def p_join_prefix_list_next(p):
     'join_prefix_list : join_prefix join_prefix_list'
-    p[0] = "%s %s" % (p[1], p[2])
+    p[0] = concat(p[1], SPACE, p[2])
 
 def p_join_prefix_list_end(p):
     'join_prefix_list : join_prefix'
@@ -356,12 +372,13 @@ def p_join_prefix_list_end(p):
 
 def p_case_when(p):
     'case_when : case case_when_clause_list end'
-    p[2] = p[2].replace('\n','\n\t')
-    p[0] = "%s%s%s%s%s%s" % (p[1], options["newline_sep"], options["tab"], p[2], options["newline_sep"], p[3])
+    options = p.parser.options
+    p[0] = concat(p[1], options["newline_sep"], options["tab"], indent(p[2]), options["newline_sep"], p[3])
 
 def p_case_when_clause_list_next(p):
     'case_when_clause_list : case_when_clause case_when_clause_list'
-    p[0] = "%s%s%s" % (p[1], options["newline_sep"], p[2])
+    options = p.parser.options
+    p[0] = concat(p[1], options["newline_sep"], p[2])
 
 def p_case_when_clause_list_end(p):
     'case_when_clause_list : case_when_clause'
@@ -369,13 +386,11 @@ def p_case_when_clause_list_end(p):
 
 def p_case_when_clause_if(p):
     'case_when_clause : when expr then expr'
-    p[2] = p[2].replace('\n','\n\t')
-    p[4] = p[4].replace('\n','\n\t')
-    p[0] = "%s %s %s %s" % (p[1], p[2], p[3], p[4])
+    p[0] = concat(p[1], SPACE, indent(p[2]), SPACE, p[3], SPACE, indent(p[4]))
 
 def p_case_when_clause_else(p):
     'case_when_clause : else expr'
-    p[0] = "%s %s" % (p[1], p[2])
+    p[0] = concat(p[1], SPACE, p[2])
 
 #   _____   _____ _ __ 
 #  / _ \ \ / / _ \ '__|
@@ -384,12 +399,13 @@ def p_case_when_clause_else(p):
 
 def p_over_block(p):
     'over_block : over left_par over_clause_list right_par'
-    p[3] = p[3].replace('\n','\n\t')
-    p[0] = "%s %s%s%s%s%s%s" % (p[1], p[2], options["newline"], options["tab"], p[3], options["newline"], p[4])
+    options = p.parser.options
+    p[0] = concat(p[1], SPACE, p[2], options["newline"], options["tab"], indent(p[3]), options["newline"], p[4])
 
 def p_over_clause_list_next(p):
     'over_clause_list : over_clause_list over_clause'
-    p[0] = "%s%s%s" % (p[1], options["newline_sep"], p[2])
+    options = p.parser.options
+    p[0] = concat(p[1], options["newline_sep"], p[2])
 
 def p_over_clause_list_alone(p):
     'over_clause_list : over_clause'
@@ -414,14 +430,14 @@ def p_expr(p):
 
 def p_expr_definition_list_next(p):
     'expr_definition_list : expr_definition expr_definition_list'
-    if p[2][0] in ['(', '['] or p[1] in ['+', '-'] or (p[1][-1] == ')'  and p[2][0] == '#'):
-        p[0] = "%s%s" % (p[1], p[2])
+    if p[2].first in ['(', '['] or (p[1].size == 1 and p[1].first in ['+', '-']) or (p[1].last == ')'  and p[2].first == '#'):
+        p[0] = concat(p[1], p[2])
     else:
-        p[0] = "%s %s" % (p[1], p[2])
+        p[0] = concat(p[1], SPACE, p[2])
 
 def p_expr_definition_list_point(p):
     'expr_definition_list : expr_definition point expr_definition_list'
-    p[0] = "%s%s%s" % (p[1], p[2], p[3])
+    p[0] = concat(p[1], p[2], p[3])
 
 def p_expr_definition_list_end(p):
     'expr_definition_list : expr_definition'
@@ -429,10 +445,10 @@ def p_expr_definition_list_end(p):
 
 def p_expr_definition_list_prefix(p):
     'expr_definition_list : not expr_definition_list'
-    if len(p[1]) == 1:
-        p[0] = "%s%s" % (p[1], p[2])
+    if p[1].size == 1:
+        p[0] = concat(p[1], p[2])
     else:
-        p[0] = "%s %s" % (p[1], p[2])
+        p[0] = concat(p[1], SPACE, p[2])
 
 def p_expr_definition_list_infix(p):
     '''
@@ -443,16 +459,15 @@ def p_expr_definition_list_infix(p):
                          | expr_definition in expr_definition_list
                          | expr_definition with expr_definition_list
     '''
-    p[0] = "%s %s %s" % (p[1], p[2], p[3])
+    p[0] = concat(p[1], SPACE, p[2], SPACE, p[3])
 
 def p_expr_definition_list_double_infix(p):
     'expr_definition_list : expr_definition not in expr_definition_list'
-    p[0] = "%s %s %s %s" % (p[1], p[2], p[3], p[4])
+    p[0] = concat(p[1], SPACE, p[2], SPACE, p[3], SPACE, p[4])
 
 def p_expr_definition_list_between(p):
     'expr_definition_list : between expr_definition_list'
-    p[2] = p[2].replace('\n',' ')
-    p[0] = "%s %s" % (p[1], p[2])
+    p[0] = concat(p[1], SPACE, flatten(p[2]))
 
 #                                           _               
 #   ___ __  __ _ __   _ __   ___  ___  ___ (_)  ___   _ __  
@@ -466,7 +481,8 @@ def p_expr_definition_list_boolean(p):
     expr_definition_list : expr_definition and expr_definition_list
                          | expr_definition or expr_definition_list
     '''
-    p[0] = "%s%s%s %s" % (p[1], options["newline_sep"], p[2], p[3])
+    options = p.parser.options
+    p[0] = concat(p[1], options["newline_sep"], p[2], SPACE, p[3])
 
 def p_expr_definition_value(p):
     '''
@@ -503,43 +519,41 @@ def p_expr_definition_block(p):
 
 def p_expr_definition_brackets(p):
     'expr_definition : left_bra expr_list right_bra'
-    p[2] = sanitize_one_line_subquery(p[2].replace('\n',' ').replace('\t',''))
-    p[0] = "%s%s%s" % (p[1], p[2], p[3])
+    p[0] = concat(p[1], compact(p[2]), p[3])
 
 def p_expr_definition_brackets_empty(p):
     'expr_definition : left_bra right_bra'
-    p[0] = "%s%s" % (p[1], p[2])
+    p[0] = concat(p[1], p[2])
 
 def p_expr_definition_parentheses_unique(p):
     'expr_definition : left_par expr_definition_list right_par'
-    if "\t" in p[2]:
-        p[2] = p[2].replace('\n','\n\t')
-        p[0] = "%s%s%s%s%s%s" % (p[1], options["newline"], options["tab"], p[2], options["newline"], p[3])
+    options = p.parser.options
+    if p[2].tabs:
+        p[0] = concat(p[1], options["newline"], options["tab"], indent(p[2]), options["newline"], p[3])
     else:
-        p[2] = p[2].replace('\n',' ').replace('\t','')
-        p[0] = "%s%s%s" % (p[1], p[2], p[3])
+        p[0] = concat(p[1], inline(p[2]), p[3])
 
 def p_expr_definition_parentheses(p):
     'expr_definition : left_par expr_list right_par'
+    options = p.parser.options
     if is_numeric_expression(p[2]):
-        p[2] = p[2].replace('\n',' ')
-        p[0] = "%s%s%s" % (p[1], p[2], p[3])
+        p[0] = concat(p[1], flatten(p[2]), p[3])
     else:
-        p[2] = p[2].replace('\n','\n\t')
-        p[0] = "%s%s%s%s%s%s" % (p[1], options["newline"], options["tab"], p[2], options["newline"], p[3])
+        p[0] = concat(p[1], options["newline"], options["tab"], indent(p[2]), options["newline"], p[3])
 
 def p_expr_definition_parentheses_empty(p):
     'expr_definition : left_par right_par'
-    p[0] = "%s%s" % (p[1], p[2])
+    p[0] = concat(p[1], p[2])
         
 
 def p_expr_list_next(p):
-    'expr_list : expr_definition_list comma expr_list'
-    p[0] = "%s%s%s%s" % (p[1], p[2], options["newline"], p[3])
+    'expr_list : expr_list comma expr_definition_list'
+    options = p.parser.options
+    p[0] = extend(p[1], p[2], options["newline"], p[3])
 
 def p_expr_list_end(p):
     'expr_list : expr_definition_list'
-    p[0] = p[1]
+    p[0] = concat(p[1])
 
 #  _           _                                _                     
 # | |_   ___  | | __  ___  _ __   ___     __ _ | |  ___   _ __    ___ 
@@ -599,7 +613,7 @@ def p_token_to_upper(p):
     option : OPTION
     over : OVER
     '''
-    p[0] = p[1].upper()
+    p[0] = text(p[1].upper())
 
 def p_token_unchanged(p):
     '''
@@ -617,7 +631,7 @@ def p_token_unchanged(p):
     string_double : STRING_DOUBLE
     string_grave : STRING_GRAVE
     '''
-    p[0] = p[1]
+    p[0] = text(p[1])
 
 def p_token_commented(p):
     '''
@@ -684,7 +698,7 @@ def p_token_commented(p):
     string_double : string_double comment
     string_grave : string_grave comment
     '''
-    p[0] = "%s%s" % (p[1], p[2])
+    p[0] = concat(p[1], p[2])
 
 #                                                  _        
 #   ___   ___   _ __ ___   _ __ ___    ___  _ __  | |_  ___ 
@@ -695,17 +709,19 @@ def p_token_commented(p):
 
 def p_comment(p):
     'comment : COMMENT'
+    options = p.parser.options
     if options["drop_comments"]:
-        p[0] = ""
+        p[0] = EMPTY
     else:
-        p[0] = " %s\n" % p[1]
+        p[0] = concat(SPACE, text(normalize_comment(p[1])), NEWLINE)
 
 def p_comment_alone(p):
     'comment : COMMENT_ALONE'
+    options = p.parser.options
     if options["drop_comments"]:
-        p[0] = ""
+        p[0] = EMPTY
     else:
-        p[0] = "\n%s\n" % p[1]
+        p[0] = concat(NEWLINE, text(normalize_comment(p[1])), NEWLINE)
    
 #   ___  _ __  _ __   ___   _ __ 
 #  / _ \| '__|| '__| / _ \ | '__|
@@ -715,22 +731,322 @@ def p_comment_alone(p):
 def p_error(p):
     raise SyntaxError(p.lexpos if p else -1)
 
-options = {}
-lex.lex()
-yacc.yacc()
+# Recovering formatters resume parsing after the select clause or the clause
+# holding an error, or at the next keyword block when the whole query before is
+# wrong. These rules are never used otherwise.
 
-def set_options(minify):
-    if minify:
-        options["tab"] = ""
-        options["newline"] = ""
-        options["newline_sep"] = " "
-        options["drop_comments"] = True
-    else:
-        options["tab"] = "\t"
-        options["newline"] = "\n"
-        options["newline_sep"] = "\n"
-        options["drop_comments"] = False
-
-def format_query(query, minify=False):
-    set_options(minify)
-    return yacc.parse(query)
\ No newline at end of file
+def p_select_clause_error(p):
+    'select_clause : error'
+    p[0] = concat()
+
+def p_clause_error(p):
+    'clause : error'
+    p[0] = concat()
+
+def p_select_full_error(p):
+    '''
+    select_full : error keyword_block
+                | error join_block
+    '''
+    p[0] = p[2]
+
+def p_select_full_error_more(p):
+    '''
+    select_full : error keyword_block additional_block_list
+                | error join_block additional_block_list
+    '''
+    options = p.parser.options
+    p[0] = concat(p[2], options["newline_sep"], p[3])
+
+def p_query_error(p):
+    'query : error'
+    p[0] = concat()
+
+# The lexer and the parser are only built when the first formatter is created,
+# so that importing this module stays cheap. yacc is imported at the same time.
+
+lexer = None
+parser = None
+build_lock = threading.Lock()
+
+def build():
+    'Builds the lexer and loads the parser tables from parsetab.py'
+    global lexer, parser
+    with build_lock:
+        if parser is None:
+            from .ply import yacc
+            lexer = lex.lex()
+            parser = yacc.yacc(compact=True)
+
+class Formatter(object):
+    '''
+    Formats or minifies queries with its own options, lexer and parser, so that
+    several formatters can be used at the same time from different threads.
+    A formatter handles one query at a time. When given a Profile, the grammar
+    actions record their statistics there and the results are not cached. When
+    given the module of enable_direct(), queries are parsed with it unless they
+    are profiled. A recovering formatter goes on after the errors of a query,
+    and raises QueryErrors with all of them instead of the first one: with the
+    direct-coded parser, only the queries holding errors are parsed twice.
+    '''
+
+    def __init__(self, minify=False, drop_comments=None, profile=None, direct=None, recover=False):
+        self.minify = minify
+        if minify:
+            self.options = {"tab": EMPTY, "newline": EMPTY, "newline_sep": SPACE}
+        else:
+            self.options = {"tab": TAB, "newline": NEWLINE, "newline_sep": NEWLINE}
+        self.options["drop_comments"] = minify if drop_comments is None else drop_comments
+        self.options["document"] = False
+        self.key = (minify, self.options["drop_comments"])
+        if parser is None:
+            build()
+        self.lexer = lexer.clone()
+        self.parser = copy.copy(parser)
+        self.parser.options = self.options
+        self.lock = threading.Lock()
+        self.profile = profile
+        self.direct = direct
+        self.recover = recover
+        self.parse = self.parser.parse
+        if profile is not None:
+            self.parser.productions = profile.wrap(self.parser.productions)
+        elif direct is not None:
+            self.direct_parse = functools.partial(direct.parse, parser=self.parser)
+            self.parse = self.parse_recovering if recover else self.direct_parse
+        self.errors = None
+        if recover:
+            self.errors = self.lexer.errors = []
+            self.parser.errorfunc = self.syntax_error
+        # Without comments, minifying only needs the tokens and skips the parser
+        self.minify_tokens = self.minify_chunks = None
+        if minify and self.options["drop_comments"] and profile is None:
+            from .minifier import minify_tokens, minify_chunks
+            self.minify_tokens = minify_tokens
+            self.minify_chunks = minify_chunks
+
+    def format(self, query):
+        results = cache if self.profile is None else None
+        if results is not None:
+            result = results.get(query, self.key)
+            if result is not None:
+                return result
+        with self.lock:
+            if self.errors is not None:
+                del self.errors[:]
+            if self.minify_tokens is not None:
+                result = self.minify_tokens(self.lexer, query)
+            else:
+                result = self.parse(query, lexer=self.lexer)
+            if self.errors:
+                raise QueryErrors(list(self.errors))
+        if results is not None:
+            results.put(query, self.key, result)
+        return result
+
+    def check(self, query):
+        '''
+        Offset of the first difference between query and its formatted version,
+        or None when query is already formatted. The output is rendered, or
+        minified from the tokens, chunk by chunk and compared with query as it
+        goes, up to the first difference.
+        '''
+        results = cache if self.profile is None else None
+        if results is not None:
+            result = results.get(query, self.key)
+            if result is not None:
+                return first_difference((result,), query)
+        with self.lock:
+            if self.errors is not None:
+                del self.errors[:]
+            if self.minify_chunks is not None:
+                chunks = self.minify_chunks(self.lexer, query)
+            else:
+                chunks = render_chunks(self.parsed_document(query))
+            position = first_difference(chunks, query)
+            if self.errors:
+                raise QueryErrors(list(self.errors))
+        # A formatted query is its own result
+        if position is None and results is not None:
+            results.put(query, self.key, query)
+        return position
+
+    def write(self, query, sink):
+        '''
+        Writes the formatted query to sink, an object with a write method, as it
+        is rendered chunk by chunk. Nothing is written when the query can't be
+        formatted. When the results are cached, the chunks are joined to be.
+        '''
+        results = cache if self.profile is None else None
+        if results is not None:
+            result = results.get(query, self.key)
+            if result is not None:
+                sink.write(result)
+                return
+        with self.lock:
+            if self.errors is not None:
+                del self.errors[:]
+            if self.minify_tokens is not None:
+                chunks = (self.minify_tokens(self.lexer, query),)
+            else:
+                chunks = render_chunks(self.parsed_document(query))
+            if self.errors:
+                raise QueryErrors(list(self.errors))
+        if results is not None:
+            result = ''.join(chunks)
+            results.put(query, self.key, result)
+            chunks = (result,)
+        for chunk in chunks:
+            sink.write(chunk)
+
+    def document(self, query):
+        # Document of the query, left unrendered by the start rule
+        self.options["document"] = True
+        try:
+            return self.parse(query, lexer=self.lexer)
+        finally:
+            self.options["document"] = False
+
+    def parse_recovering(self, query, lexer):
+        # The direct-coded parser stops at the first error: the queries holding
+        # errors are parsed again by the table-driven one, which recovers
+        try:
+            result = self.direct_parse(query, lexer=lexer)
+            if not self.errors:
+                return result
+        except SyntaxError:
+            pass
+        del self.errors[:]
+        return self.parser.parse(query, lexer=lexer)
+
+    def parsed_document(self, query):
+        # Document of the query, checked for errors before it is rendered: a
+        # recovering parse which gives up returns no document
+        document = self.document(query)
+        if self.errors or document is None:
+            raise QueryErrors(list(self.errors or ()))
+        return document
+
+    def syntax_error(self, token):
+        # Error function of the parser of a recovering formatter
+        self.errors.append(SyntaxError(token.lexpos if token else -1))
+
+def first_difference(chunks, query):
+    'Offset in query of the first difference with the text made of chunks, or None'
+    position = 0
+    for chunk in chunks:
+        if not query.startswith(chunk, position):
+            for offset, (expected, found) in enumerate(zip(chunk, query[position:position + len(chunk)])):
+                if expected != found:
+                    return position + offset
+            return len(query)
+        position += len(chunk)
+    return position if position < len(query) else None
+
+class QueryErrors(Exception):
+    '''
+    Errors of a query found by a recovering formatter, in errors: ValueError for
+    the invalid characters and SyntaxError for the unexpected tokens, whose
+    argument is the offset of the error in the query, or -1 at its end
+    '''
+
+    def __init__(self, errors):
+        Exception.__init__(self, errors)
+        self.errors = errors
+
+# Results cache shared by all the formatters, disabled by default
+
+cache = None
+
+def enable_cache(max_entries=1024, max_bytes=32 << 20):
+    'Caches the results of the formatters, returns the cache to read its counters'
+    global cache
+    cache = Cache(max_entries, max_bytes)
+    return cache
+
+def disable_cache():
+    global cache
+    cache = None
+
+# Statistics of the grammar actions recorded by the formatters, disabled by default
+
+profile = None
+
+def enable_profile():
+    'Profiles the grammar actions of the formatters, returns the Profile to report'
+    global profile
+    profile = Profile()
+    return profile
+
+def disable_profile():
+    global profile
+    profile = None
+
+# Parser generated by ply/ygen.py for the grammar above, disabled by default
+
+direct = None
+
+def enable_direct():
+    '''
+    Parses with the direct-coded parser of parsedirect.py, which is written
+    again when the grammar changed
+    '''
+    global direct
+    build()
+    from .ply import ygen
+    direct = ygen.write_direct(parser, sys.modules[__name__])
+    return direct
+
+def disable_direct():
+    global direct
+    direct = None
+
+local = threading.local()
+
+def get_formatter(minify=False, recover=False):
+    'Formatter of the calling thread for the given mode'
+    formatters = local.__dict__.setdefault('formatters', {})
+    result = formatters.get((minify, recover))
+    if result is None or result.profile is not profile or result.direct is not direct:
+        result = formatters[minify, recover] = Formatter(minify, profile=profile, direct=direct, recover=recover)
+    return result
+
+def format_query(query, minify=False, recover=False):
+    return get_formatter(minify, recover).format(query)
+
+def check_query(query, minify=False, recover=False):
+    '''
+    Offset of the first difference between query and its formatted version, or
+    None when query is already formatted
+    '''
+    return get_formatter(minify, recover).check(query)
+
+def write_query(query, sink, minify=False, recover=False):
+    'Writes the formatted query to sink as it is rendered'
+    get_formatter(minify, recover).write(query, sink)
+
+# Result of a query formatted by format_many(): its output, or the error which
+# kept it from being formatted
+
+Result = collections.namedtuple('Result', 'output error')
+
+def format_many(queries, minify=False, recover=False):
+    '''
+    Formats every query of queries with the formatter of the calling thread and
+    returns a Result for each of them, in the same order. A query which can't be
+    formatted gets its error and the others are formatted all the same.
+    Identical queries are formatted once and share their Result.
+    '''
+    formatter = get_formatter(minify, recover)
+    results = {}
+    output = []
+    for query in queries:
+        result = results.get(query)
+        if result is None:
+            try:
+                result = Result(formatter.format(query), None)
+            except (QueryErrors, ValueError, SyntaxError) as err:
+                result = Result(None, err)
+            results[query] = result
+        output.append(result)
+    return output
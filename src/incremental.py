@@ -0,0 +1,78 @@
+# Incremental formatting of the whole text of an editor view
+#
+# The text is cut into statements with statements.split_statements(), and the
+# output of every statement formatted is kept with a digest of its text until
+# the next version of the text is formatted. The statements whose text didn't
+# change in between are then taken from there, without being lexed, parsed and
+# rendered again.
+#
+# The lines before the first token of a statement, such as the blank lines
+# between two statements or before the first one, are left as they are, and a
+# statement sharing its line with the one before gets a newline before its
+# output. Formatting is not idempotent for every statement, so the output of a
+# statement is only known to stay as it is once settle() formatted it again.
+
+from . import statements
+from .cache import digest
+
+class Reformatter(object):
+    '''
+    Formats the successive versions of a text, reusing the outputs of the
+    statements left unchanged since the previous one. A reformatter is used by
+    one thread at a time.
+    '''
+
+    def __init__(self):
+        # Outputs of the last version formatted in each mode, by digest
+        self.outputs = {False: {}, True: {}}
+        # Outputs of the last version to format again, with their mode and code flag
+        self.unsettled = []
+        self.reused = 0
+        self.formatted = 0
+
+    def format(self, text, minify=False, recover=False):
+        '''
+        Statement of every statement of text, starting on the line of its first
+        token. Errors are offsets in text, as with statements.format_statements().
+        '''
+        previous = self.outputs[minify]
+        outputs = {}
+        results = []
+        self.unsettled = []
+        self.reused = 0
+        self.formatted = 0
+        for start, statement, code in statements.split_statements(text):
+            start, statement, leading = statements.without_leading_lines(start, statement)
+            if not statement.strip():
+                continue
+            # The outputs are kept without the newline, which depends on the statement before
+            newline = statements.separator(start, leading, code)
+            key = digest(statement)
+            if key in previous:
+                outputs[key] = previous[key]
+                results.append(statements.Statement(start, start + len(statement), newline + outputs[key], None))
+                self.reused += 1
+                continue
+            result = statements.format_statement(start, statement, code, minify, recover)
+            self.formatted += 1
+            if result.error is None:
+                outputs[key] = result.output
+                if result.output != statement:
+                    self.unsettled.append((result.output, code, minify))
+                if newline:
+                    result = result._replace(output=newline + result.output)
+            results.append(result)
+        self.outputs[minify] = outputs
+        return results
+
+    def settle(self):
+        '''
+        Formats again the outputs of the statements formatted by the last call
+        to format(), so that those which stay as they are get reused once they
+        replaced their statement in the text
+        '''
+        unsettled, self.unsettled = self.unsettled, []
+        for output, code, minify in unsettled:
+            result = statements.format_statement(0, output, code, minify)
+            if result.output == output:
+                self.outputs[minify][digest(output)] = output
@@ -0,0 +1,119 @@
+# Minifier working on the tokens of a query, without parsing it
+#
+# When minifying, the grammar actions only drop the comments, uppercase the
+# keywords and join the tokens with a space or with nothing. Which one only
+# depends on the tokens around, so the same output is produced here in a single
+# pass over the tokens. The rules below mirror the actions of formatter.py:
+#
+# - nothing before , ; ) ] . and nothing after , ( [ .
+# - nothing after the prefix ! and ~
+# - spaces around a symbol following an operand (infix), while a symbol
+#   starting an operand is an operand itself
+# - nothing after a lone + or - operand, before the operand it starts or before
+#   a symbol ending the expression, but spaces around NOT IN
+# - nothing between an operand and ( or [, or between ) and a label
+#   starting with #
+# - a space everywhere else
+#
+# The tabulations of the tokens between brackets are removed, as the formatter
+# renders them inline. Since nothing is parsed, queries the grammar rejects are
+# minified too.
+
+import sys
+
+from .document import CHUNK_TEXTS
+from .formatter import reserved
+
+KEYWORDS = frozenset(reserved.values())
+
+NOTHING_BEFORE = frozenset(('COMMA', 'SEMICOLON', 'RIGHT_PAR', 'RIGHT_BRA', 'POINT'))
+NOTHING_AFTER = frozenset(('COMMA', 'LEFT_PAR', 'LEFT_BRA', 'POINT'))
+
+# Tokens ending an operand, after which a symbol is an infix operator
+OPERAND_ENDS = frozenset((
+    'LABEL', 'STRING_SIMPLE', 'STRING_DOUBLE', 'STRING_GRAVE', 'RIGHT_PAR', 'RIGHT_BRA', 'END',
+    'NULL', 'TRUE', 'FALSE', 'COALESCE', 'CAST', 'CONCAT', 'ASC', 'DESC', 'DISTINCT', 'ALL'
+))
+
+# Tokens starting an operand, which a lone + or - is glued to. The next token
+# tells whether a symbol or a NOT following a lone + or - is infix, hence the
+# lookahead.
+OPERAND_STARTS = frozenset((
+    'LABEL', 'STRING_SIMPLE', 'STRING_DOUBLE', 'STRING_GRAVE', 'LEFT_PAR', 'LEFT_BRA',
+    'NULL', 'TRUE', 'FALSE', 'COALESCE', 'CAST', 'CONCAT', 'ASC', 'DESC', 'DISTINCT', 'ALL',
+    'CASE', 'SELECT', 'NOT', 'BETWEEN', 'OVER', 'SYMBOL'
+))
+
+def significant_tokens(lexer, query):
+    'Type and value of the tokens of query, comments aside'
+    lexer.input(query)
+    for token in iter(lexer.token, None):
+        if token.type != 'COMMENT' and token.type != 'COMMENT_ALONE':
+            yield token.type, token.value
+
+def minify_tokens(lexer, query):
+    'Minifies query with lexer, which raises ValueError on invalid characters'
+    return ''.join(minify_chunks(lexer, query, sys.maxsize))
+
+def minify_chunks(lexer, query, texts=CHUNK_TEXTS):
+    '''
+    Minifies query like minify_tokens(), yielding the output as it goes in
+    chunks of about texts texts. The query is lexed as the chunks are read.
+    '''
+    output = []
+    append = output.append
+    tokens = significant_tokens(lexer, query)
+    previous = None
+    previous_value = None
+    operand = False
+    unary = False
+    brackets = 0
+    following = next(tokens, None)
+    while following is not None:
+        kind, value = following
+        following = next(tokens, None)
+        if kind in KEYWORDS:
+            value = value.upper()
+        elif brackets and '\t' in value:
+            value = value.replace('\t', '')
+
+        # A symbol following an operand is an infix operator, unless nothing
+        # operand-like follows it: it then ends the expression, glued to a lone
+        # + or - before it.
+        sign = unary and (previous_value == '+' or previous_value == '-')
+        infix = kind == 'SYMBOL' and operand and (
+            not sign or (following is not None and following[0] in OPERAND_STARTS))
+        if previous is None or kind in NOTHING_BEFORE or previous in NOTHING_AFTER:
+            pass
+        elif previous == 'NOT' and len(previous_value) == 1 and kind != 'IN':
+            pass
+        elif infix:
+            append(' ')
+        elif sign and kind in OPERAND_STARTS and not (kind == 'NOT' and following is not None and following[0] == 'IN'):
+            pass
+        elif operand and (kind == 'LEFT_PAR' or kind == 'LEFT_BRA'):
+            pass
+        elif previous == 'RIGHT_PAR' and kind == 'LABEL' and value[0] == '#':
+            pass
+        else:
+            append(' ')
+        append(value)
+
+        if kind == 'LEFT_BRA':
+            brackets += 1
+        elif kind == 'RIGHT_BRA' and brackets:
+            brackets -= 1
+        # DISTINCT and ALL are keywords right after SELECT and UNION
+        if kind == 'SYMBOL':
+            unary = not infix
+            operand = unary
+        else:
+            unary = False
+            operand = kind in OPERAND_ENDS and not ((kind == 'DISTINCT' or kind == 'ALL') and (previous == 'SELECT' or previous == 'UNION'))
+        previous = kind
+        previous_value = value
+        if len(output) > texts:
+            yield ''.join(output)
+            del output[:]
+    if output:
+        yield ''.join(output)
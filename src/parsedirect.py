@@ -0,0 +1,3637 @@
+# parsedirect.py
+# This file is automatically generated by ply/ygen.py from formatter. Do not edit.
+# pylint: disable=W,C,R
+
+signature = '6c5c3821c8bcce86cd7169bc44adb4b7'
+
+from .formatter import EMPTY, NEWLINE, SPACE, compact, concat, extend, flatten, indent, inline, is_numeric_expression, normalize_comment, p_error, render, text
+
+TERMINALS = {
+    '$end': 0, 'ALL': 1, 'AND': 2, 'AS': 3, 'ASC': 4, 'BETWEEN': 5, 'BY': 6, 'CASE': 7, 'CAST': 8,
+    'CLUSTER': 9, 'COALESCE': 10, 'COMMA': 11, 'COMMENT': 12, 'COMMENT_ALONE': 13, 'COMPARISON': 14,
+    'CONCAT': 15, 'CROSS': 16, 'DESC': 17, 'DISTINCT': 18, 'DISTRIBUTE': 19, 'ELSE': 20, 'END': 21,
+    'EXCEPT': 22, 'FALSE': 23, 'FROM': 24, 'FULL': 25, 'GROUP': 26, 'HAVING': 27, 'IN': 28, 'INNER':
+    29, 'IS': 30, 'JOIN': 31, 'LABEL': 32, 'LEFT': 33, 'LEFT_BRA': 34, 'LEFT_PAR': 35, 'LIMIT': 36,
+    'NATURAL': 37, 'NOT': 38, 'NULL': 39, 'ON': 40, 'OPTION': 41, 'OR': 42, 'ORDER': 43, 'OUTER':
+    44, 'OVER': 45, 'PARTITION': 46, 'POINT': 47, 'RIGHT': 48, 'RIGHT_BRA': 49, 'RIGHT_PAR': 50,
+    'SELECT': 51, 'SEMI': 52, 'SEMICOLON': 53, 'SORT': 54, 'STRING_DOUBLE': 55, 'STRING_GRAVE': 56,
+    'STRING_SIMPLE': 57, 'SYMBOL': 58, 'THEN': 59, 'TRUE': 60, 'UNION': 61, 'WHEN': 62, 'WHERE': 63,
+    'WITH': 64, 'error': 65}
+
+END = 0
+UNKNOWN = 66
+
+def row(entries):
+    result = [None] * (UNKNOWN + 1)
+    for terminal, value in entries.items():
+        result[terminal] = value
+    return tuple(result)
+
+ROWS = [
+    row({
+        1: 39, 4: 46, 5: 33, 7: 54, 8: 44, 10: 43, 12: 7, 13: 8, 15: 45, 17: 47, 18: 38, 23: 42, 32:
+        34, 34: 52, 35: 53, 38: 32, 39: 40, 45: 56, 51: 58, 55: 36, 56: 37, 57: 35, 58: 48, 60: 41,
+        65: 5}),
+    row({
+        0: 0}),
+    row({
+        0: -1, 53: 60}),
+    row({
+        0: -2, 9: 70, 19: 71, 26: 68, 43: 69, 46: 73, 53: -2, 54: 72}),
+    row({
+        0: -233, 16: 106, 24: 83, 25: 104, 27: 86, 29: 100, 31: 91, 33: 102, 36: 85, 37: 107, 41:
+        87, 44: 101, 48: 103, 52: 105, 53: -233, 63: 84}),
+    row({
+        0: -5, 9: -5, 19: -5, 26: -5, 43: -5, 46: -5, 53: -5, 54: -5}),
+    row({
+        0: -225, 1: -225, 2: -225, 3: -225, 4: -225, 5: -225, 6: -225, 7: -225, 8: -225, 9: -225,
+        10: -225, 11: -225, 12: -225, 13: -225, 14: -225, 15: -225, 16: -225, 17: -225, 18: -225,
+        19: -225, 20: -225, 21: -225, 22: -225, 23: -225, 24: -225, 25: -225, 26: -225, 27: -225,
+        28: -225, 29: -225, 30: -225, 31: -225, 32: -225, 33: -225, 34: -225, 35: -225, 36: -225,
+        37: -225, 38: -225, 39: -225, 40: -225, 41: -225, 42: -225, 43: -225, 44: -225, 45: -225,
+        46: -225, 47: -225, 48: -225, 49: -225, 50: -225, 51: -225, 52: -225, 53: -225, 54: -225,
+        55: -225, 56: -225, 57: -225, 58: -225, 59: -225, 60: -225, 61: -225, 62: -225, 63: -225,
+        64: -225, 65: -225}),
+    row({
+        0: -226, 1: -226, 2: -226, 3: -226, 4: -226, 5: -226, 6: -226, 7: -226, 8: -226, 9: -226,
+        10: -226, 11: -226, 12: -226, 13: -226, 14: -226, 15: -226, 16: -226, 17: -226, 18: -226,
+        19: -226, 20: -226, 21: -226, 22: -226, 23: -226, 24: -226, 25: -226, 26: -226, 27: -226,
+        28: -226, 29: -226, 30: -226, 31: -226, 32: -226, 33: -226, 34: -226, 35: -226, 36: -226,
+        37: -226, 38: -226, 39: -226, 40: -226, 41: -226, 42: -226, 43: -226, 44: -226, 45: -226,
+        46: -226, 47: -226, 48: -226, 49: -226, 50: -226, 51: -226, 52: -226, 53: -226, 54: -226,
+        55: -226, 56: -226, 57: -226, 58: -226, 59: -226, 60: -226, 61: -226, 62: -226, 63: -226,
+        64: -226, 65: -226}),
+    row({
+        0: -64, 1: 39, 2: 125, 3: 121, 4: 46, 5: 33, 7: 54, 8: 44, 9: -64, 10: 43, 11: -64, 14: 120,
+        15: 45, 16: -64, 17: 47, 18: 38, 19: -64, 20: -64, 21: -64, 22: -64, 23: 42, 24: -64, 25:
+        -64, 26: -64, 27: -64, 28: 123, 29: -64, 30: 122, 31: -64, 32: 34, 33: -64, 34: 52, 35: 53,
+        36: -64, 37: -64, 38: 32, 39: 40, 40: -64, 41: -64, 42: 126, 43: -64, 44: -64, 45: 56, 46:
+        -64, 47: 119, 48: -64, 49: -64, 50: -64, 51: 58, 52: -64, 53: -64, 54: -64, 55: 36, 56: 37,
+        57: 35, 58: 48, 59: -64, 60: 41, 61: -64, 62: -64, 63: -64, 64: 124, 65: 127}),
+    row({
+        1: 39, 4: 46, 5: 33, 7: 54, 8: 44, 10: 43, 12: 7, 13: 8, 15: 45, 17: 47, 18: 38, 23: 42, 32:
+        34, 34: 52, 35: 53, 38: 32, 39: 40, 45: 56, 51: 58, 55: 36, 56: 37, 57: 35, 58: 48, 60: 41,
+        65: 127}),
+    row({
+        0: -90, 1: -90, 2: -90, 3: -90, 4: -90, 5: -90, 7: -90, 8: -90, 9: -90, 10: -90, 11: -90,
+        12: 7, 13: 8, 14: -90, 15: -90, 16: -90, 17: -90, 18: -90, 19: -90, 20: -90, 21: -90, 22:
+        -90, 23: -90, 24: -90, 25: -90, 26: -90, 27: -90, 28: -90, 29: -90, 30: -90, 31: -90, 32:
+        -90, 33: -90, 34: -90, 35: -90, 36: -90, 37: -90, 38: -90, 39: -90, 40: -90, 41: -90, 42:
+        -90, 43: -90, 44: -90, 45: -90, 46: -90, 47: -90, 48: -90, 49: -90, 50: -90, 51: -90, 52:
+        -90, 53: -90, 54: -90, 55: -90, 56: -90, 57: -90, 58: -90, 59: -90, 60: -90, 61: -90, 62:
+        -90, 63: -90, 64: -90, 65: -90}),
+    row({
+        0: -76, 1: -76, 2: -76, 3: -76, 4: -76, 5: -76, 7: -76, 8: -76, 9: -76, 10: -76, 11: -76,
+        12: 7, 13: 8, 14: -76, 15: -76, 16: -76, 17: -76, 18: -76, 19: -76, 20: -76, 21: -76, 22:
+        -76, 23: -76, 24: -76, 25: -76, 26: -76, 27: -76, 28: -76, 29: -76, 30: -76, 31: -76, 32:
+        -76, 33: -76, 34: -76, 35: -76, 36: -76, 37: -76, 38: -76, 39: -76, 40: -76, 41: -76, 42:
+        -76, 43: -76, 44: -76, 45: -76, 46: -76, 47: -76, 48: -76, 49: -76, 50: -76, 51: -76, 52:
+        -76, 53: -76, 54: -76, 55: -76, 56: -76, 57: -76, 58: -76, 59: -76, 60: -76, 61: -76, 62:
+        -76, 63: -76, 64: -76, 65: -76}),
+    row({
+        0: -77, 1: -77, 2: -77, 3: -77, 4: -77, 5: -77, 7: -77, 8: -77, 9: -77, 10: -77, 11: -77,
+        12: 7, 13: 8, 14: -77, 15: -77, 16: -77, 17: -77, 18: -77, 19: -77, 20: -77, 21: -77, 22:
+        -77, 23: -77, 24: -77, 25: -77, 26: -77, 27: -77, 28: -77, 29: -77, 30: -77, 31: -77, 32:
+        -77, 33: -77, 34: -77, 35: -77, 36: -77, 37: -77, 38: -77, 39: -77, 40: -77, 41: -77, 42:
+        -77, 43: -77, 44: -77, 45: -77, 46: -77, 47: -77, 48: -77, 49: -77, 50: -77, 51: -77, 52:
+        -77, 53: -77, 54: -77, 55: -77, 56: -77, 57: -77, 58: -77, 59: -77, 60: -77, 61: -77, 62:
+        -77, 63: -77, 64: -77, 65: -77}),
+    row({
+        0: -78, 1: -78, 2: -78, 3: -78, 4: -78, 5: -78, 7: -78, 8: -78, 9: -78, 10: -78, 11: -78,
+        12: 7, 13: 8, 14: -78, 15: -78, 16: -78, 17: -78, 18: -78, 19: -78, 20: -78, 21: -78, 22:
+        -78, 23: -78, 24: -78, 25: -78, 26: -78, 27: -78, 28: -78, 29: -78, 30: -78, 31: -78, 32:
+        -78, 33: -78, 34: -78, 35: -78, 36: -78, 37: -78, 38: -78, 39: -78, 40: -78, 41: -78, 42:
+        -78, 43: -78, 44: -78, 45: -78, 46: -78, 47: -78, 48: -78, 49: -78, 50: -78, 51: -78, 52:
+        -78, 53: -78, 54: -78, 55: -78, 56: -78, 57: -78, 58: -78, 59: -78, 60: -78, 61: -78, 62:
+        -78, 63: -78, 64: -78, 65: -78}),
+    row({
+        0: -79, 1: -79, 2: -79, 3: -79, 4: -79, 5: -79, 7: -79, 8: -79, 9: -79, 10: -79, 11: -79,
+        12: 7, 13: 8, 14: -79, 15: -79, 16: -79, 17: -79, 18: -79, 19: -79, 20: -79, 21: -79, 22:
+        -79, 23: -79, 24: -79, 25: -79, 26: -79, 27: -79, 28: -79, 29: -79, 30: -79, 31: -79, 32:
+        -79, 33: -79, 34: -79, 35: -79, 36: -79, 37: -79, 38: -79, 39: -79, 40: -79, 41: -79, 42:
+        -79, 43: -79, 44: -79, 45: -79, 46: -79, 47: -79, 48: -79, 49: -79, 50: -79, 51: -79, 52:
+        -79, 53: -79, 54: -79, 55: -79, 56: -79, 57: -79, 58: -79, 59: -79, 60: -79, 61: -79, 62:
+        -79, 63: -79, 64: -79, 65: -79}),
+    row({
+        0: -80, 1: -80, 2: -80, 3: -80, 4: -80, 5: -80, 7: -80, 8: -80, 9: -80, 10: -80, 11: -80,
+        12: 7, 13: 8, 14: -80, 15: -80, 16: -80, 17: -80, 18: -80, 19: -80, 20: -80, 21: -80, 22:
+        -80, 23: -80, 24: -80, 25: -80, 26: -80, 27: -80, 28: -80, 29: -80, 30: -80, 31: -80, 32:
+        -80, 33: -80, 34: -80, 35: -80, 36: -80, 37: -80, 38: -80, 39: -80, 40: -80, 41: -80, 42:
+        -80, 43: -80, 44: -80, 45: -80, 46: -80, 47: -80, 48: -80, 49: -80, 50: -80, 51: -80, 52:
+        -80, 53: -80, 54: -80, 55: -80, 56: -80, 57: -80, 58: -80, 59: -80, 60: -80, 61: -80, 62:
+        -80, 63: -80, 64: -80, 65: -80}),
+    row({
+        0: -81, 1: -81, 2: -81, 3: -81, 4: -81, 5: -81, 7: -81, 8: -81, 9: -81, 10: -81, 11: -81,
+        12: 7, 13: 8, 14: -81, 15: -81, 16: -81, 17: -81, 18: -81, 19: -81, 20: -81, 21: -81, 22:
+        -81, 23: -81, 24: -81, 25: -81, 26: -81, 27: -81, 28: -81, 29: -81, 30: -81, 31: -81, 32:
+        -81, 33: -81, 34: -81, 35: -81, 36: -81, 37: -81, 38: -81, 39: -81, 40: -81, 41: -81, 42:
+        -81, 43: -81, 44: -81, 45: -81, 46: -81, 47: -81, 48: -81, 49: -81, 50: -81, 51: -81, 52:
+        -81, 53: -81, 54: -81, 55: -81, 56: -81, 57: -81, 58: -81, 59: -81, 60: -81, 61: -81, 62:
+        -81, 63: -81, 64: -81, 65: -81}),
+    row({
+        0: -82, 1: -82, 2: -82, 3: -82, 4: -82, 5: -82, 7: -82, 8: -82, 9: -82, 10: -82, 11: -82,
+        12: 7, 13: 8, 14: -82, 15: -82, 16: -82, 17: -82, 18: -82, 19: -82, 20: -82, 21: -82, 22:
+        -82, 23: -82, 24: -82, 25: -82, 26: -82, 27: -82, 28: -82, 29: -82, 30: -82, 31: -82, 32:
+        -82, 33: -82, 34: -82, 35: -82, 36: -82, 37: -82, 38: -82, 39: -82, 40: -82, 41: -82, 42:
+        -82, 43: -82, 44: -82, 45: -82, 46: -82, 47: -82, 48: -82, 49: -82, 50: -82, 51: -82, 52:
+        -82, 53: -82, 54: -82, 55: -82, 56: -82, 57: -82, 58: -82, 59: -82, 60: -82, 61: -82, 62:
+        -82, 63: -82, 64: -82, 65: -82}),
+    row({
+        0: -83, 1: -83, 2: -83, 3: -83, 4: -83, 5: -83, 7: -83, 8: -83, 9: -83, 10: -83, 11: -83,
+        12: 7, 13: 8, 14: -83, 15: -83, 16: -83, 17: -83, 18: -83, 19: -83, 20: -83, 21: -83, 22:
+        -83, 23: -83, 24: -83, 25: -83, 26: -83, 27: -83, 28: -83, 29: -83, 30: -83, 31: -83, 32:
+        -83, 33: -83, 34: -83, 35: -83, 36: -83, 37: -83, 38: -83, 39: -83, 40: -83, 41: -83, 42:
+        -83, 43: -83, 44: -83, 45: -83, 46: -83, 47: -83, 48: -83, 49: -83, 50: -83, 51: -83, 52:
+        -83, 53: -83, 54: -83, 55: -83, 56: -83, 57: -83, 58: -83, 59: -83, 60: -83, 61: -83, 62:
+        -83, 63: -83, 64: -83, 65: -83}),
+    row({
+        0: -84, 1: -84, 2: -84, 3: -84, 4: -84, 5: -84, 7: -84, 8: -84, 9: -84, 10: -84, 11: -84,
+        12: 7, 13: 8, 14: -84, 15: -84, 16: -84, 17: -84, 18: -84, 19: -84, 20: -84, 21: -84, 22:
+        -84, 23: -84, 24: -84, 25: -84, 26: -84, 27: -84, 28: -84, 29: -84, 30: -84, 31: -84, 32:
+        -84, 33: -84, 34: -84, 35: -84, 36: -84, 37: -84, 38: -84, 39: -84, 40: -84, 41: -84, 42:
+        -84, 43: -84, 44: -84, 45: -84, 46: -84, 47: -84, 48: -84, 49: -84, 50: -84, 51: -84, 52:
+        -84, 53: -84, 54: -84, 55: -84, 56: -84, 57: -84, 58: -84, 59: -84, 60: -84, 61: -84, 62:
+        -84, 63: -84, 64: -84, 65: -84}),
+    row({
+        0: -85, 1: -85, 2: -85, 3: -85, 4: -85, 5: -85, 7: -85, 8: -85, 9: -85, 10: -85, 11: -85,
+        12: 7, 13: 8, 14: -85, 15: -85, 16: -85, 17: -85, 18: -85, 19: -85, 20: -85, 21: -85, 22:
+        -85, 23: -85, 24: -85, 25: -85, 26: -85, 27: -85, 28: -85, 29: -85, 30: -85, 31: -85, 32:
+        -85, 33: -85, 34: -85, 35: -85, 36: -85, 37: -85, 38: -85, 39: -85, 40: -85, 41: -85, 42:
+        -85, 43: -85, 44: -85, 45: -85, 46: -85, 47: -85, 48: -85, 49: -85, 50: -85, 51: -85, 52:
+        -85, 53: -85, 54: -85, 55: -85, 56: -85, 57: -85, 58: -85, 59: -85, 60: -85, 61: -85, 62:
+        -85, 63: -85, 64: -85, 65: -85}),
+    row({
+        0: -86, 1: -86, 2: -86, 3: -86, 4: -86, 5: -86, 7: -86, 8: -86, 9: -86, 10: -86, 11: -86,
+        12: 7, 13: 8, 14: -86, 15: -86, 16: -86, 17: -86, 18: -86, 19: -86, 20: -86, 21: -86, 22:
+        -86, 23: -86, 24: -86, 25: -86, 26: -86, 27: -86, 28: -86, 29: -86, 30: -86, 31: -86, 32:
+        -86, 33: -86, 34: -86, 35: -86, 36: -86, 37: -86, 38: -86, 39: -86, 40: -86, 41: -86, 42:
+        -86, 43: -86, 44: -86, 45: -86, 46: -86, 47: -86, 48: -86, 49: -86, 50: -86, 51: -86, 52:
+        -86, 53: -86, 54: -86, 55: -86, 56: -86, 57: -86, 58: -86, 59: -86, 60: -86, 61: -86, 62:
+        -86, 63: -86, 64: -86, 65: -86}),
+    row({
+        0: -87, 1: -87, 2: -87, 3: -87, 4: -87, 5: -87, 7: -87, 8: -87, 9: -87, 10: -87, 11: -87,
+        12: 7, 13: 8, 14: -87, 15: -87, 16: -87, 17: -87, 18: -87, 19: -87, 20: -87, 21: -87, 22:
+        -87, 23: -87, 24: -87, 25: -87, 26: -87, 27: -87, 28: -87, 29: -87, 30: -87, 31: -87, 32:
+        -87, 33: -87, 34: -87, 35: -87, 36: -87, 37: -87, 38: -87, 39: -87, 40: -87, 41: -87, 42:
+        -87, 43: -87, 44: -87, 45: -87, 46: -87, 47: -87, 48: -87, 49: -87, 50: -87, 51: -87, 52:
+        -87, 53: -87, 54: -87, 55: -87, 56: -87, 57: -87, 58: -87, 59: -87, 60: -87, 61: -87, 62:
+        -87, 63: -87, 64: -87, 65: -87}),
+    row({
+        0: -88, 1: -88, 2: -88, 3: -88, 4: -88, 5: -88, 7: -88, 8: -88, 9: -88, 10: -88, 11: -88,
+        12: 7, 13: 8, 14: -88, 15: -88, 16: -88, 17: -88, 18: -88, 19: -88, 20: -88, 21: -88, 22:
+        -88, 23: -88, 24: -88, 25: -88, 26: -88, 27: -88, 28: -88, 29: -88, 30: -88, 31: -88, 32:
+        -88, 33: -88, 34: -88, 35: -88, 36: -88, 37: -88, 38: -88, 39: -88, 40: -88, 41: -88, 42:
+        -88, 43: -88, 44: -88, 45: -88, 46: -88, 47: -88, 48: -88, 49: -88, 50: -88, 51: -88, 52:
+        -88, 53: -88, 54: -88, 55: -88, 56: -88, 57: -88, 58: -88, 59: -88, 60: -88, 61: -88, 62:
+        -88, 63: -88, 64: -88, 65: -88}),
+    row({
+        0: -89, 1: -89, 2: -89, 3: -89, 4: -89, 5: -89, 7: -89, 8: -89, 9: -89, 10: -89, 11: -89,
+        12: 7, 13: 8, 14: -89, 15: -89, 16: -89, 17: -89, 18: -89, 19: -89, 20: -89, 21: -89, 22:
+        -89, 23: -89, 24: -89, 25: -89, 26: -89, 27: -89, 28: -89, 29: -89, 30: -89, 31: -89, 32:
+        -89, 33: -89, 34: -89, 35: -89, 36: -89, 37: -89, 38: -89, 39: -89, 40: -89, 41: -89, 42:
+        -89, 43: -89, 44: -89, 45: -89, 46: -89, 47: -89, 48: -89, 49: -89, 50: -89, 51: -89, 52:
+        -89, 53: -89, 54: -89, 55: -89, 56: -89, 57: -89, 58: -89, 59: -89, 60: -89, 61: -89, 62:
+        -89, 63: -89, 64: -89, 65: -89}),
+    row({
+        0: -91, 1: -91, 2: -91, 3: -91, 4: -91, 5: -91, 7: -91, 8: -91, 9: -91, 10: -91, 11: -91,
+        14: -91, 15: -91, 16: -91, 17: -91, 18: -91, 19: -91, 20: -91, 21: -91, 22: -91, 23: -91,
+        24: -91, 25: -91, 26: -91, 27: -91, 28: -91, 29: -91, 30: -91, 31: -91, 32: -91, 33: -91,
+        34: -91, 35: -91, 36: -91, 37: -91, 38: -91, 39: -91, 40: -91, 41: -91, 42: -91, 43: -91,
+        44: -91, 45: -91, 46: -91, 47: -91, 48: -91, 49: -91, 50: -91, 51: -91, 52: -91, 53: -91,
+        54: -91, 55: -91, 56: -91, 57: -91, 58: -91, 59: -91, 60: -91, 61: -91, 62: -91, 63: -91,
+        64: -91, 65: -91}),
+    row({
+        0: -92, 1: -92, 2: -92, 3: -92, 4: -92, 5: -92, 7: -92, 8: -92, 9: -92, 10: -92, 11: -92,
+        14: -92, 15: -92, 16: -92, 17: -92, 18: -92, 19: -92, 20: -92, 21: -92, 22: 151, 23: -92,
+        24: -92, 25: -92, 26: -92, 27: -92, 28: -92, 29: -92, 30: -92, 31: -92, 32: -92, 33: -92,
+        34: -92, 35: -92, 36: -92, 37: -92, 38: -92, 39: -92, 40: -92, 41: -92, 42: -92, 43: -92,
+        44: -92, 45: -92, 46: -92, 47: -92, 48: -92, 49: -92, 50: -92, 51: -92, 52: -92, 53: -92,
+        54: -92, 55: -92, 56: -92, 57: -92, 58: -92, 59: -92, 60: -92, 61: 150, 62: -92, 63: -92,
+        64: -92, 65: -92}),
+    row({
+        0: -93, 1: -93, 2: -93, 3: -93, 4: -93, 5: -93, 7: -93, 8: -93, 9: -93, 10: -93, 11: -93,
+        14: -93, 15: -93, 16: -93, 17: -93, 18: -93, 19: -93, 20: -93, 21: -93, 22: -93, 23: -93,
+        24: -93, 25: -93, 26: -93, 27: -93, 28: -93, 29: -93, 30: -93, 31: -93, 32: -93, 33: -93,
+        34: -93, 35: -93, 36: -93, 37: -93, 38: -93, 39: -93, 40: -93, 41: -93, 42: -93, 43: -93,
+        44: -93, 45: -93, 46: -93, 47: -93, 48: -93, 49: -93, 50: -93, 51: -93, 52: -93, 53: -93,
+        54: -93, 55: -93, 56: -93, 57: -93, 58: -93, 59: -93, 60: -93, 61: -93, 62: -93, 63: -93,
+        64: -93, 65: -93}),
+    row({
+        1: 39, 4: 46, 5: 33, 7: 54, 8: 44, 10: 43, 12: 7, 13: 8, 15: 45, 17: 47, 18: 38, 23: 42, 32:
+        34, 34: 52, 35: 53, 38: 32, 39: 40, 45: 56, 49: 156, 51: 58, 55: 36, 56: 37, 57: 35, 58: 48,
+        60: 41, 65: 127}),
+    row({
+        1: 39, 4: 46, 5: 33, 7: 54, 8: 44, 10: 43, 12: 7, 13: 8, 15: 45, 17: 47, 18: 38, 23: 42, 32:
+        34, 34: 52, 35: 53, 38: 32, 39: 40, 45: 56, 50: 163, 51: 58, 55: 36, 56: 37, 57: 35, 58: 48,
+        60: 41, 65: 127}),
+    row({
+        1: -123, 4: -123, 5: -123, 7: -123, 8: -123, 10: -123, 12: -123, 13: -123, 15: -123, 17:
+        -123, 18: -123, 23: -123, 28: -123, 32: -123, 34: -123, 35: -123, 38: -123, 39: -123, 45:
+        -123, 51: -123, 55: -123, 56: -123, 57: -123, 58: -123, 60: -123, 65: -123}),
+    row({
+        1: -134, 4: -134, 5: -134, 7: -134, 8: -134, 10: -134, 12: -134, 13: -134, 15: -134, 17:
+        -134, 18: -134, 23: -134, 32: -134, 34: -134, 35: -134, 38: -134, 39: -134, 45: -134, 51:
+        -134, 55: -134, 56: -134, 57: -134, 58: -134, 60: -134, 65: -134}),
+    row({
+        0: -155, 1: -155, 2: -155, 3: -155, 4: -155, 5: -155, 7: -155, 8: -155, 9: -155, 10: -155,
+        11: -155, 12: -155, 13: -155, 14: -155, 15: -155, 16: -155, 17: -155, 18: -155, 19: -155,
+        20: -155, 21: -155, 22: -155, 23: -155, 24: -155, 25: -155, 26: -155, 27: -155, 28: -155,
+        29: -155, 30: -155, 31: -155, 32: -155, 33: -155, 34: -155, 35: -155, 36: -155, 37: -155,
+        38: -155, 39: -155, 40: -155, 41: -155, 42: -155, 43: -155, 44: -155, 45: -155, 46: -155,
+        47: -155, 48: -155, 49: -155, 50: -155, 51: -155, 52: -155, 53: -155, 54: -155, 55: -155,
+        56: -155, 57: -155, 58: -155, 59: -155, 60: -155, 61: -155, 62: -155, 63: -155, 64: -155,
+        65: -155}),
+    row({
+        0: -160, 1: -160, 2: -160, 3: -160, 4: -160, 5: -160, 7: -160, 8: -160, 9: -160, 10: -160,
+        11: -160, 12: -160, 13: -160, 14: -160, 15: -160, 16: -160, 17: -160, 18: -160, 19: -160,
+        20: -160, 21: -160, 22: -160, 23: -160, 24: -160, 25: -160, 26: -160, 27: -160, 28: -160,
+        29: -160, 30: -160, 31: -160, 32: -160, 33: -160, 34: -160, 35: -160, 36: -160, 37: -160,
+        38: -160, 39: -160, 40: -160, 41: -160, 42: -160, 43: -160, 44: -160, 45: -160, 46: -160,
+        47: -160, 48: -160, 49: -160, 50: -160, 51: -160, 52: -160, 53: -160, 54: -160, 55: -160,
+        56: -160, 57: -160, 58: -160, 59: -160, 60: -160, 61: -160, 62: -160, 63: -160, 64: -160,
+        65: -160}),
+    row({
+        0: -161, 1: -161, 2: -161, 3: -161, 4: -161, 5: -161, 7: -161, 8: -161, 9: -161, 10: -161,
+        11: -161, 12: -161, 13: -161, 14: -161, 15: -161, 16: -161, 17: -161, 18: -161, 19: -161,
+        20: -161, 21: -161, 22: -161, 23: -161, 24: -161, 25: -161, 26: -161, 27: -161, 28: -161,
+        29: -161, 30: -161, 31: -161, 32: -161, 33: -161, 34: -161, 35: -161, 36: -161, 37: -161,
+        38: -161, 39: -161, 40: -161, 41: -161, 42: -161, 43: -161, 44: -161, 45: -161, 46: -161,
+        47: -161, 48: -161, 49: -161, 50: -161, 51: -161, 52: -161, 53: -161, 54: -161, 55: -161,
+        56: -161, 57: -161, 58: -161, 59: -161, 60: -161, 61: -161, 62: -161, 63: -161, 64: -161,
+        65: -161}),
+    row({
+        0: -162, 1: -162, 2: -162, 3: -162, 4: -162, 5: -162, 7: -162, 8: -162, 9: -162, 10: -162,
+        11: -162, 12: -162, 13: -162, 14: -162, 15: -162, 16: -162, 17: -162, 18: -162, 19: -162,
+        20: -162, 21: -162, 22: -162, 23: -162, 24: -162, 25: -162, 26: -162, 27: -162, 28: -162,
+        29: -162, 30: -162, 31: -162, 32: -162, 33: -162, 34: -162, 35: -162, 36: -162, 37: -162,
+        38: -162, 39: -162, 40: -162, 41: -162, 42: -162, 43: -162, 44: -162, 45: -162, 46: -162,
+        47: -162, 48: -162, 49: -162, 50: -162, 51: -162, 52: -162, 53: -162, 54: -162, 55: -162,
+        56: -162, 57: -162, 58: -162, 59: -162, 60: -162, 61: -162, 62: -162, 63: -162, 64: -162,
+        65: -162}),
+    row({
+        0: -103, 1: -103, 2: -103, 3: -103, 4: -103, 5: -103, 7: -103, 8: -103, 9: -103, 10: -103,
+        11: -103, 12: -103, 13: -103, 14: -103, 15: -103, 16: -103, 17: -103, 18: -103, 19: -103,
+        20: -103, 21: -103, 22: -103, 23: -103, 24: -103, 25: -103, 26: -103, 27: -103, 28: -103,
+        29: -103, 30: -103, 31: -103, 32: -103, 33: -103, 34: -103, 35: -103, 36: -103, 37: -103,
+        38: -103, 39: -103, 40: -103, 41: -103, 42: -103, 43: -103, 44: -103, 45: -103, 46: -103,
+        47: -103, 48: -103, 49: -103, 50: -103, 51: -103, 52: -103, 53: -103, 54: -103, 55: -103,
+        56: -103, 57: -103, 58: -103, 59: -103, 60: -103, 61: -103, 62: -103, 63: -103, 64: -103,
+        65: -103}),
+    row({
+        0: -102, 1: -102, 2: -102, 3: -102, 4: -102, 5: -102, 7: -102, 8: -102, 9: -102, 10: -102,
+        11: -102, 12: -102, 13: -102, 14: -102, 15: -102, 16: -102, 17: -102, 18: -102, 19: -102,
+        20: -102, 21: -102, 22: -102, 23: -102, 24: -102, 25: -102, 26: -102, 27: -102, 28: -102,
+        29: -102, 30: -102, 31: -102, 32: -102, 33: -102, 34: -102, 35: -102, 36: -102, 37: -102,
+        38: -102, 39: -102, 40: -102, 41: -102, 42: -102, 43: -102, 44: -102, 45: -102, 46: -102,
+        47: -102, 48: -102, 49: -102, 50: -102, 51: -102, 52: -102, 53: -102, 54: -102, 55: -102,
+        56: -102, 57: -102, 58: -102, 59: -102, 60: -102, 61: -102, 62: -102, 63: -102, 64: -102,
+        65: -102}),
+    row({
+        0: -128, 1: -128, 2: -128, 3: -128, 4: -128, 5: -128, 7: -128, 8: -128, 9: -128, 10: -128,
+        11: -128, 12: -128, 13: -128, 14: -128, 15: -128, 16: -128, 17: -128, 18: -128, 19: -128,
+        20: -128, 21: -128, 22: -128, 23: -128, 24: -128, 25: -128, 26: -128, 27: -128, 28: -128,
+        29: -128, 30: -128, 31: -128, 32: -128, 33: -128, 34: -128, 35: -128, 36: -128, 37: -128,
+        38: -128, 39: -128, 40: -128, 41: -128, 42: -128, 43: -128, 44: -128, 45: -128, 46: -128,
+        47: -128, 48: -128, 49: -128, 50: -128, 51: -128, 52: -128, 53: -128, 54: -128, 55: -128,
+        56: -128, 57: -128, 58: -128, 59: -128, 60: -128, 61: -128, 62: -128, 63: -128, 64: -128,
+        65: -128}),
+    row({
+        0: -126, 1: -126, 2: -126, 3: -126, 4: -126, 5: -126, 7: -126, 8: -126, 9: -126, 10: -126,
+        11: -126, 12: -126, 13: -126, 14: -126, 15: -126, 16: -126, 17: -126, 18: -126, 19: -126,
+        20: -126, 21: -126, 22: -126, 23: -126, 24: -126, 25: -126, 26: -126, 27: -126, 28: -126,
+        29: -126, 30: -126, 31: -126, 32: -126, 33: -126, 34: -126, 35: -126, 36: -126, 37: -126,
+        38: -126, 39: -126, 40: -126, 41: -126, 42: -126, 43: -126, 44: -126, 45: -126, 46: -126,
+        47: -126, 48: -126, 49: -126, 50: -126, 51: -126, 52: -126, 53: -126, 54: -126, 55: -126,
+        56: -126, 57: -126, 58: -126, 59: -126, 60: -126, 61: -126, 62: -126, 63: -126, 64: -126,
+        65: -126}),
+    row({
+        0: -127, 1: -127, 2: -127, 3: -127, 4: -127, 5: -127, 7: -127, 8: -127, 9: -127, 10: -127,
+        11: -127, 12: -127, 13: -127, 14: -127, 15: -127, 16: -127, 17: -127, 18: -127, 19: -127,
+        20: -127, 21: -127, 22: -127, 23: -127, 24: -127, 25: -127, 26: -127, 27: -127, 28: -127,
+        29: -127, 30: -127, 31: -127, 32: -127, 33: -127, 34: -127, 35: -127, 36: -127, 37: -127,
+        38: -127, 39: -127, 40: -127, 41: -127, 42: -127, 43: -127, 44: -127, 45: -127, 46: -127,
+        47: -127, 48: -127, 49: -127, 50: -127, 51: -127, 52: -127, 53: -127, 54: -127, 55: -127,
+        56: -127, 57: -127, 58: -127, 59: -127, 60: -127, 61: -127, 62: -127, 63: -127, 64: -127,
+        65: -127}),
+    row({
+        0: -129, 1: -129, 2: -129, 3: -129, 4: -129, 5: -129, 7: -129, 8: -129, 9: -129, 10: -129,
+        11: -129, 12: -129, 13: -129, 14: -129, 15: -129, 16: -129, 17: -129, 18: -129, 19: -129,
+        20: -129, 21: -129, 22: -129, 23: -129, 24: -129, 25: -129, 26: -129, 27: -129, 28: -129,
+        29: -129, 30: -129, 31: -129, 32: -129, 33: -129, 34: -129, 35: -129, 36: -129, 37: -129,
+        38: -129, 39: -129, 40: -129, 41: -129, 42: -129, 43: -129, 44: -129, 45: -129, 46: -129,
+        47: -129, 48: -129, 49: -129, 50: -129, 51: -129, 52: -129, 53: -129, 54: -129, 55: -129,
+        56: -129, 57: -129, 58: -129, 59: -129, 60: -129, 61: -129, 62: -129, 63: -129, 64: -129,
+        65: -129}),
+    row({
+        0: -130, 1: -130, 2: -130, 3: -130, 4: -130, 5: -130, 7: -130, 8: -130, 9: -130, 10: -130,
+        11: -130, 12: -130, 13: -130, 14: -130, 15: -130, 16: -130, 17: -130, 18: -130, 19: -130,
+        20: -130, 21: -130, 22: -130, 23: -130, 24: -130, 25: -130, 26: -130, 27: -130, 28: -130,
+        29: -130, 30: -130, 31: -130, 32: -130, 33: -130, 34: -130, 35: -130, 36: -130, 37: -130,
+        38: -130, 39: -130, 40: -130, 41: -130, 42: -130, 43: -130, 44: -130, 45: -130, 46: -130,
+        47: -130, 48: -130, 49: -130, 50: -130, 51: -130, 52: -130, 53: -130, 54: -130, 55: -130,
+        56: -130, 57: -130, 58: -130, 59: -130, 60: -130, 61: -130, 62: -130, 63: -130, 64: -130,
+        65: -130}),
+    row({
+        0: -131, 1: -131, 2: -131, 3: -131, 4: -131, 5: -131, 7: -131, 8: -131, 9: -131, 10: -131,
+        11: -131, 12: -131, 13: -131, 14: -131, 15: -131, 16: -131, 17: -131, 18: -131, 19: -131,
+        20: -131, 21: -131, 22: -131, 23: -131, 24: -131, 25: -131, 26: -131, 27: -131, 28: -131,
+        29: -131, 30: -131, 31: -131, 32: -131, 33: -131, 34: -131, 35: -131, 36: -131, 37: -131,
+        38: -131, 39: -131, 40: -131, 41: -131, 42: -131, 43: -131, 44: -131, 45: -131, 46: -131,
+        47: -131, 48: -131, 49: -131, 50: -131, 51: -131, 52: -131, 53: -131, 54: -131, 55: -131,
+        56: -131, 57: -131, 58: -131, 59: -131, 60: -131, 61: -131, 62: -131, 63: -131, 64: -131,
+        65: -131}),
+    row({
+        0: -135, 1: -135, 2: -135, 3: -135, 4: -135, 5: -135, 7: -135, 8: -135, 9: -135, 10: -135,
+        11: -135, 12: -135, 13: -135, 14: -135, 15: -135, 16: -135, 17: -135, 18: -135, 19: -135,
+        20: -135, 21: -135, 22: -135, 23: -135, 24: -135, 25: -135, 26: -135, 27: -135, 28: -135,
+        29: -135, 30: -135, 31: -135, 32: -135, 33: -135, 34: -135, 35: -135, 36: -135, 37: -135,
+        38: -135, 39: -135, 40: -135, 41: -135, 42: -135, 43: -135, 44: -135, 45: -135, 46: -135,
+        47: -135, 48: -135, 49: -135, 50: -135, 51: -135, 52: -135, 53: -135, 54: -135, 55: -135,
+        56: -135, 57: -135, 58: -135, 59: -135, 60: -135, 61: -135, 62: -135, 63: -135, 64: -135,
+        65: -135}),
+    row({
+        0: -136, 1: -136, 2: -136, 3: -136, 4: -136, 5: -136, 7: -136, 8: -136, 9: -136, 10: -136,
+        11: -136, 12: -136, 13: -136, 14: -136, 15: -136, 16: -136, 17: -136, 18: -136, 19: -136,
+        20: -136, 21: -136, 22: -136, 23: -136, 24: -136, 25: -136, 26: -136, 27: -136, 28: -136,
+        29: -136, 30: -136, 31: -136, 32: -136, 33: -136, 34: -136, 35: -136, 36: -136, 37: -136,
+        38: -136, 39: -136, 40: -136, 41: -136, 42: -136, 43: -136, 44: -136, 45: -136, 46: -136,
+        47: -136, 48: -136, 49: -136, 50: -136, 51: -136, 52: -136, 53: -136, 54: -136, 55: -136,
+        56: -136, 57: -136, 58: -136, 59: -136, 60: -136, 61: -136, 62: -136, 63: -136, 64: -136,
+        65: -136}),
+    row({
+        0: -152, 1: -152, 2: -152, 3: -152, 4: -152, 5: -152, 7: -152, 8: -152, 9: -152, 10: -152,
+        11: -152, 12: -152, 13: -152, 14: -152, 15: -152, 16: -152, 17: -152, 18: -152, 19: -152,
+        20: -152, 21: -152, 22: -152, 23: -152, 24: -152, 25: -152, 26: -152, 27: -152, 28: -152,
+        29: -152, 30: -152, 31: -152, 32: -152, 33: -152, 34: -152, 35: -152, 36: -152, 37: -152,
+        38: -152, 39: -152, 40: -152, 41: -152, 42: -152, 43: -152, 44: -152, 45: -152, 46: -152,
+        47: -152, 48: -152, 49: -152, 50: -152, 51: -152, 52: -152, 53: -152, 54: -152, 55: -152,
+        56: -152, 57: -152, 58: -152, 59: -152, 60: -152, 61: -152, 62: -152, 63: -152, 64: -152,
+        65: -152}),
+    row({
+        12: 7, 13: 8, 20: 170, 62: 169}),
+    row({
+        0: -7, 1: -7, 2: -7, 3: -7, 4: -7, 5: -7, 7: -7, 8: -7, 9: 70, 10: -7, 11: -7, 14: -7, 15:
+        -7, 16: 106, 17: -7, 18: -7, 19: 71, 20: -7, 21: -7, 22: -7, 23: -7, 24: 83, 25: 104, 26:
+        68, 27: 86, 28: -7, 29: 100, 30: -7, 31: 91, 32: -7, 33: 102, 34: -7, 35: -7, 36: 85, 37:
+        107, 38: -7, 39: -7, 40: -7, 41: 87, 42: -7, 43: 69, 44: 101, 45: -7, 46: 73, 47: -7, 48:
+        103, 49: -7, 50: -7, 51: -7, 52: 105, 53: -7, 54: 72, 55: -7, 56: -7, 57: -7, 58: -7, 59:
+        -7, 60: -7, 61: -7, 62: -7, 63: 84, 64: -7, 65: -7}),
+    row({
+        12: 7, 13: 8, 35: 53}),
+    row({
+        1: -158, 4: -158, 5: -158, 7: -158, 8: -158, 10: -158, 12: -158, 13: -158, 15: -158, 17:
+        -158, 18: -158, 23: -158, 32: -158, 34: -158, 35: -158, 38: -158, 39: -158, 45: -158, 49:
+        -158, 51: -158, 55: -158, 56: -158, 57: -158, 58: -158, 60: -158, 65: -158}),
+    row({
+        1: -156, 4: -156, 5: -156, 7: -156, 8: -156, 9: -156, 10: -156, 12: -156, 13: -156, 15:
+        -156, 17: -156, 18: -156, 19: -156, 23: -156, 26: -156, 32: -156, 34: -156, 35: -156, 38:
+        -156, 39: -156, 43: -156, 45: -156, 46: -156, 50: -156, 51: -156, 54: -156, 55: -156, 56:
+        -156, 57: -156, 58: -156, 60: -156, 65: -156}),
+    row({
+        12: -116, 13: -116, 20: -116, 62: -116}),
+    row({
+        1: 39, 4: 46, 5: 33, 7: 54, 8: 44, 10: 43, 15: 45, 17: 47, 18: 38, 23: 42, 32: 34, 34: 52,
+        35: 53, 38: 32, 39: 40, 45: 56, 51: 58, 55: 36, 56: 37, 57: 35, 58: 48, 60: 41, 65: 180}),
+    row({
+        12: -149, 13: -149, 35: -149}),
+    row({
+        1: 39, 4: -12, 5: -12, 7: -12, 8: -12, 10: -12, 12: 7, 13: 8, 15: -12, 17: -12, 18: 38, 23:
+        -12, 32: -12, 34: -12, 35: -12, 38: -12, 39: -12, 45: -12, 51: -12, 55: -12, 56: -12, 57:
+        -12, 58: -12, 60: -12, 65: -12}),
+    row({
+        1: -101, 4: -101, 5: -101, 7: -101, 8: -101, 10: -101, 12: -101, 13: -101, 15: -101, 17:
+        -101, 18: -101, 23: -101, 32: -101, 34: -101, 35: -101, 38: -101, 39: -101, 45: -101, 51:
+        -101, 55: -101, 56: -101, 57: -101, 58: -101, 60: -101, 65: -101}),
+    row({
+        0: -3, 12: 7, 13: 8, 53: -3}),
+    row({
+        0: -153, 12: -153, 13: -153, 53: -153}),
+    row({
+        0: -6, 9: -6, 19: -6, 26: -6, 43: -6, 46: -6, 53: -6, 54: -6}),
+    row({
+        6: 188, 12: 7, 13: 8}),
+    row({
+        6: -107, 12: -107, 13: -107}),
+    row({
+        6: -108, 12: -108, 13: -108}),
+    row({
+        6: -109, 12: -109, 13: -109}),
+    row({
+        6: -110, 12: -110, 13: -110}),
+    row({
+        6: -111, 12: -111, 13: -111}),
+    row({
+        6: -112, 12: -112, 13: -112}),
+    row({
+        0: -4, 53: 60}),
+    row({
+        0: -229, 1: -229, 2: -229, 3: -229, 4: -229, 5: -229, 7: -229, 8: -229, 9: 70, 10: -229, 11:
+        -229, 14: -229, 15: -229, 16: 106, 17: -229, 18: -229, 19: 71, 20: -229, 21: -229, 22: -229,
+        23: -229, 24: 83, 25: 104, 26: 68, 27: 86, 28: -229, 29: 100, 30: -229, 31: 91, 32: -229,
+        33: 102, 34: -229, 35: -229, 36: 85, 37: 107, 38: -229, 39: -229, 40: -229, 41: 87, 42:
+        -229, 43: 69, 44: 101, 45: -229, 46: 73, 47: -229, 48: 103, 49: -229, 50: -229, 51: -229,
+        52: 105, 53: -229, 54: 72, 55: -229, 56: -229, 57: -229, 58: -229, 59: -229, 60: -229, 61:
+        -229, 62: -229, 63: 84, 64: -229, 65: -229}),
+    row({
+        0: -230, 1: -230, 2: -230, 3: -230, 4: -230, 5: -230, 7: -230, 8: -230, 9: 70, 10: -230, 11:
+        -230, 14: -230, 15: -230, 16: 106, 17: -230, 18: -230, 19: 71, 20: -230, 21: -230, 22: -230,
+        23: -230, 24: 83, 25: 104, 26: 68, 27: 86, 28: -230, 29: 100, 30: -230, 31: 91, 32: -230,
+        33: 102, 34: -230, 35: -230, 36: 85, 37: 107, 38: -230, 39: -230, 40: -230, 41: 87, 42:
+        -230, 43: 69, 44: 101, 45: -230, 46: 73, 47: -230, 48: 103, 49: -230, 50: -230, 51: -230,
+        52: 105, 53: -230, 54: 72, 55: -230, 56: -230, 57: -230, 58: -230, 59: -230, 60: -230, 61:
+        -230, 62: -230, 63: 84, 64: -230, 65: -230}),
+    row({
+        1: 39, 4: 46, 5: 33, 7: 54, 8: 44, 10: 43, 12: 7, 13: 8, 15: 45, 17: 47, 18: 38, 23: 42, 32:
+        34, 34: 52, 35: 53, 38: 32, 39: 40, 45: 56, 51: 58, 55: 36, 56: 37, 57: 35, 58: 48, 60: 41,
+        65: 204}),
+    row({
+        1: 39, 4: 46, 5: 33, 7: 54, 8: 44, 10: 43, 15: 45, 17: 47, 18: 38, 23: 42, 32: 34, 34: 52,
+        35: 53, 38: 32, 39: 40, 45: 56, 51: 58, 55: 36, 56: 37, 57: 35, 58: 48, 60: 41, 65: 204}),
+    row({
+        1: -104, 4: -104, 5: -104, 7: -104, 8: -104, 10: -104, 12: -104, 13: -104, 15: -104, 17:
+        -104, 18: -104, 23: -104, 32: -104, 34: -104, 35: -104, 38: -104, 39: -104, 45: -104, 51:
+        -104, 55: -104, 56: -104, 57: -104, 58: -104, 60: -104, 65: -104}),
+    row({
+        1: -105, 4: -105, 5: -105, 7: -105, 8: -105, 10: -105, 12: -105, 13: -105, 15: -105, 17:
+        -105, 18: -105, 23: -105, 32: -105, 34: -105, 35: -105, 38: -105, 39: -105, 45: -105, 51:
+        -105, 55: -105, 56: -105, 57: -105, 58: -105, 60: -105, 65: -105}),
+    row({
+        1: -114, 4: -114, 5: -114, 7: -114, 8: -114, 10: -114, 12: -114, 13: -114, 15: -114, 17:
+        -114, 18: -114, 23: -114, 32: -114, 34: -114, 35: -114, 38: -114, 39: -114, 45: -114, 51:
+        -114, 55: -114, 56: -114, 57: -114, 58: -114, 60: -114, 65: -114}),
+    row({
+        1: -113, 4: -113, 5: -113, 7: -113, 8: -113, 10: -113, 12: -113, 13: -113, 15: -113, 17:
+        -113, 18: -113, 23: -113, 32: -113, 34: -113, 35: -113, 38: -113, 39: -113, 45: -113, 51:
+        -113, 55: -113, 56: -113, 57: -113, 58: -113, 60: -113, 65: -113}),
+    row({
+        1: -148, 4: -148, 5: -148, 7: -148, 8: -148, 10: -148, 12: -148, 13: -148, 15: -148, 17:
+        -148, 18: -148, 23: -148, 32: -148, 34: -148, 35: -148, 38: -148, 39: -148, 45: -148, 51:
+        -148, 55: -148, 56: -148, 57: -148, 58: -148, 60: -148, 65: -148}),
+    row({
+        31: 91}),
+    row({
+        1: -41, 4: -41, 5: -41, 7: -41, 8: -41, 10: -41, 12: 7, 13: 8, 15: -41, 17: -41, 18: -41,
+        23: -41, 32: -41, 34: -41, 35: -41, 38: -41, 39: -41, 45: -41, 51: -41, 55: -41, 56: -41,
+        57: -41, 58: -41, 60: -41, 65: -41}),
+    row({
+        16: 106, 25: 104, 29: 100, 31: -51, 33: 102, 37: 107, 44: 101, 48: 103, 52: 105}),
+    row({
+        1: -137, 4: -137, 5: -137, 7: -137, 8: -137, 10: -137, 12: -137, 13: -137, 15: -137, 17:
+        -137, 18: -137, 23: -137, 32: -137, 34: -137, 35: -137, 38: -137, 39: -137, 45: -137, 51:
+        -137, 55: -137, 56: -137, 57: -137, 58: -137, 60: -137, 65: -137}),
+    row({
+        12: 7, 13: 8, 16: -42, 25: -42, 29: -42, 31: -42, 33: -42, 37: -42, 44: -42, 48: -42, 52:
+        -42}),
+    row({
+        12: 7, 13: 8, 16: -43, 25: -43, 29: -43, 31: -43, 33: -43, 37: -43, 44: -43, 48: -43, 52:
+        -43}),
+    row({
+        12: 7, 13: 8, 16: -44, 25: -44, 29: -44, 31: -44, 33: -44, 37: -44, 44: -44, 48: -44, 52:
+        -44}),
+    row({
+        12: 7, 13: 8, 16: -45, 25: -45, 29: -45, 31: -45, 33: -45, 37: -45, 44: -45, 48: -45, 52:
+        -45}),
+    row({
+        12: 7, 13: 8, 16: -46, 25: -46, 29: -46, 31: -46, 33: -46, 37: -46, 44: -46, 48: -46, 52:
+        -46}),
+    row({
+        12: 7, 13: 8, 16: -47, 25: -47, 29: -47, 31: -47, 33: -47, 37: -47, 44: -47, 48: -47, 52:
+        -47}),
+    row({
+        12: 7, 13: 8, 16: -48, 25: -48, 29: -48, 31: -48, 33: -48, 37: -48, 44: -48, 48: -48, 52:
+        -48}),
+    row({
+        12: 7, 13: 8, 16: -49, 25: -49, 29: -49, 31: -49, 33: -49, 37: -49, 44: -49, 48: -49, 52:
+        -49}),
+    row({
+        12: -139, 13: -139, 16: -139, 25: -139, 29: -139, 31: -139, 33: -139, 37: -139, 44: -139,
+        48: -139, 52: -139}),
+    row({
+        12: -140, 13: -140, 16: -140, 25: -140, 29: -140, 31: -140, 33: -140, 37: -140, 44: -140,
+        48: -140, 52: -140}),
+    row({
+        12: -141, 13: -141, 16: -141, 25: -141, 29: -141, 31: -141, 33: -141, 37: -141, 44: -141,
+        48: -141, 52: -141}),
+    row({
+        12: -142, 13: -142, 16: -142, 25: -142, 29: -142, 31: -142, 33: -142, 37: -142, 44: -142,
+        48: -142, 52: -142}),
+    row({
+        12: -143, 13: -143, 16: -143, 25: -143, 29: -143, 31: -143, 33: -143, 37: -143, 44: -143,
+        48: -143, 52: -143}),
+    row({
+        12: -144, 13: -144, 16: -144, 25: -144, 29: -144, 31: -144, 33: -144, 37: -144, 44: -144,
+        48: -144, 52: -144}),
+    row({
+        12: -145, 13: -145, 16: -145, 25: -145, 29: -145, 31: -145, 33: -145, 37: -145, 44: -145,
+        48: -145, 52: -145}),
+    row({
+        12: -146, 13: -146, 16: -146, 25: -146, 29: -146, 31: -146, 33: -146, 37: -146, 44: -146,
+        48: -146, 52: -146}),
+    row({
+        0: -62, 1: -62, 2: -62, 3: -62, 4: -62, 5: -62, 7: -62, 8: -62, 9: -62, 10: -62, 11: -62,
+        14: -62, 15: -62, 16: -62, 17: -62, 18: -62, 19: -62, 20: -62, 21: -62, 22: -62, 23: -62,
+        24: -62, 25: -62, 26: -62, 27: -62, 28: -62, 29: -62, 30: -62, 31: -62, 32: -62, 33: -62,
+        34: -62, 35: -62, 36: -62, 37: -62, 38: -62, 39: -62, 40: -62, 41: -62, 42: -62, 43: -62,
+        44: -62, 45: -62, 46: -62, 47: -62, 48: -62, 49: -62, 50: -62, 51: -62, 52: -62, 53: -62,
+        54: -62, 55: -62, 56: -62, 57: -62, 58: -62, 59: -62, 60: -62, 61: -62, 62: -62, 63: -62,
+        64: -62, 65: -62}),
+    row({
+        0: -90, 1: 39, 2: -90, 3: -90, 4: 46, 5: 33, 7: 54, 8: 44, 9: -90, 10: 43, 11: -90, 12: 7,
+        13: 8, 14: -90, 15: 45, 16: -90, 17: 47, 18: 38, 19: -90, 20: -90, 21: -90, 22: -90, 23: 42,
+        24: -90, 25: -90, 26: -90, 27: -90, 28: -90, 29: -90, 30: -90, 31: -90, 32: 34, 33: -90, 34:
+        52, 35: 53, 36: -90, 37: -90, 38: 32, 39: 40, 40: -90, 41: -90, 42: -90, 43: -90, 44: -90,
+        45: 56, 46: -90, 47: -90, 48: -90, 49: -90, 50: -90, 51: 58, 52: -90, 53: -90, 54: -90, 55:
+        36, 56: 37, 57: 35, 58: 48, 59: -90, 60: 41, 61: -90, 62: -90, 63: -90, 64: -90, 65: 127}),
+    row({
+        1: 39, 4: 46, 5: 33, 7: 54, 8: 44, 10: 43, 12: 7, 13: 8, 15: 45, 17: 47, 18: 38, 23: 42, 28:
+        123, 32: 34, 34: 52, 35: 53, 38: 32, 39: 40, 45: 56, 51: 58, 55: 36, 56: 37, 57: 35, 58: 48,
+        60: 41, 65: 127}),
+    row({
+        1: -154, 4: -154, 5: -154, 7: -154, 8: -154, 10: -154, 12: -154, 13: -154, 15: -154, 17:
+        -154, 18: -154, 23: -154, 32: -154, 34: -154, 35: -154, 38: -154, 39: -154, 45: -154, 51:
+        -154, 55: -154, 56: -154, 57: -154, 58: -154, 60: -154, 65: -154}),
+    row({
+        1: -151, 4: -151, 5: -151, 7: -151, 8: -151, 10: -151, 12: -151, 13: -151, 15: -151, 17:
+        -151, 18: -151, 23: -151, 32: -151, 34: -151, 35: -151, 38: -151, 39: -151, 45: -151, 51:
+        -151, 55: -151, 56: -151, 57: -151, 58: -151, 60: -151, 65: -151}),
+    row({
+        1: -115, 4: -115, 5: -115, 7: -115, 8: -115, 10: -115, 12: -115, 13: -115, 15: -115, 17:
+        -115, 18: -115, 23: -115, 32: -115, 34: -115, 35: -115, 38: -115, 39: -115, 45: -115, 51:
+        -115, 55: -115, 56: -115, 57: -115, 58: -115, 60: -115, 65: -115}),
+    row({
+        1: -124, 4: -124, 5: -124, 7: -124, 8: -124, 10: -124, 12: -124, 13: -124, 15: -124, 17:
+        -124, 18: -124, 23: -124, 32: -124, 34: -124, 35: -124, 38: -124, 39: -124, 45: -124, 51:
+        -124, 55: -124, 56: -124, 57: -124, 58: -124, 60: -124, 65: -124}),
+    row({
+        1: -125, 4: -125, 5: -125, 7: -125, 8: -125, 10: -125, 12: -125, 13: -125, 15: -125, 17:
+        -125, 18: -125, 23: -125, 32: -125, 34: -125, 35: -125, 38: -125, 39: -125, 45: -125, 51:
+        -125, 55: -125, 56: -125, 57: -125, 58: -125, 60: -125, 65: -125}),
+    row({
+        1: -147, 4: -147, 5: -147, 7: -147, 8: -147, 10: -147, 12: -147, 13: -147, 15: -147, 17:
+        -147, 18: -147, 23: -147, 32: -147, 34: -147, 35: -147, 38: -147, 39: -147, 45: -147, 51:
+        -147, 55: -147, 56: -147, 57: -147, 58: -147, 60: -147, 65: -147}),
+    row({
+        1: -122, 4: -122, 5: -122, 7: -122, 8: -122, 10: -122, 12: -122, 13: -122, 15: -122, 17:
+        -122, 18: -122, 23: -122, 32: -122, 34: -122, 35: -122, 38: -122, 39: -122, 45: -122, 51:
+        -122, 55: -122, 56: -122, 57: -122, 58: -122, 60: -122, 65: -122}),
+    row({
+        1: -121, 4: -121, 5: -121, 7: -121, 8: -121, 10: -121, 12: -121, 13: -121, 15: -121, 17:
+        -121, 18: -121, 23: -121, 32: -121, 34: -121, 35: -121, 38: -121, 39: -121, 45: -121, 51:
+        -121, 55: -121, 56: -121, 57: -121, 58: -121, 60: -121, 65: -121}),
+    row({
+        16: 106, 24: 83, 25: 104, 27: 86, 29: 100, 31: 91, 33: 102, 36: 85, 37: 107, 41: 87, 44:
+        101, 48: 103, 52: 105, 63: 84}),
+    row({
+        0: -65, 1: -65, 2: -65, 3: -65, 4: -65, 5: -65, 7: -65, 8: -65, 9: -65, 10: -65, 11: -65,
+        14: -65, 15: -65, 16: -65, 17: -65, 18: -65, 19: -65, 20: -65, 21: -65, 22: -65, 23: -65,
+        24: -65, 25: -65, 26: -65, 27: -65, 28: -65, 29: -65, 30: -65, 31: -65, 32: -65, 33: -65,
+        34: -65, 35: -65, 36: -65, 37: -65, 38: -65, 39: -65, 40: -65, 41: -65, 42: -65, 43: -65,
+        44: -65, 45: -65, 46: -65, 47: -65, 48: -65, 49: -65, 50: -65, 51: -65, 52: -65, 53: -65,
+        54: -65, 55: -65, 56: -65, 57: -65, 58: -65, 59: -65, 60: -65, 61: -65, 62: -65, 63: -65,
+        64: -65, 65: -65}),
+    row({
+        1: -185, 4: -185, 5: -185, 7: -185, 8: -185, 10: -185, 12: -185, 13: -185, 15: -185, 17:
+        -185, 18: -185, 23: -185, 28: -185, 32: -185, 34: -185, 35: -185, 38: -185, 39: -185, 45:
+        -185, 51: -185, 55: -185, 56: -185, 57: -185, 58: -185, 60: -185, 65: -185}),
+    row({
+        0: -214, 1: -214, 2: -214, 3: -214, 4: -214, 5: -214, 7: -214, 8: -214, 9: -214, 10: -214,
+        11: -214, 12: -214, 13: -214, 14: -214, 15: -214, 16: -214, 17: -214, 18: -214, 19: -214,
+        20: -214, 21: -214, 22: -214, 23: -214, 24: -214, 25: -214, 26: -214, 27: -214, 28: -214,
+        29: -214, 30: -214, 31: -214, 32: -214, 33: -214, 34: -214, 35: -214, 36: -214, 37: -214,
+        38: -214, 39: -214, 40: -214, 41: -214, 42: -214, 43: -214, 44: -214, 45: -214, 46: -214,
+        47: -214, 48: -214, 49: -214, 50: -214, 51: -214, 52: -214, 53: -214, 54: -214, 55: -214,
+        56: -214, 57: -214, 58: -214, 59: -214, 60: -214, 61: -214, 62: -214, 63: -214, 64: -214,
+        65: -214}),
+    row({
+        0: -73, 1: -73, 2: -73, 3: -73, 4: -73, 5: -73, 7: -73, 8: -73, 9: -73, 10: -73, 11: -73,
+        14: -73, 15: -73, 16: -73, 17: -73, 18: -73, 19: -73, 20: -73, 21: -73, 22: -73, 23: -73,
+        24: -73, 25: -73, 26: -73, 27: -73, 28: -73, 29: -73, 30: -73, 31: -73, 32: -73, 33: -73,
+        34: -73, 35: -73, 36: -73, 37: -73, 38: -73, 39: -73, 40: -73, 41: -73, 42: -73, 43: -73,
+        44: -73, 45: -73, 46: -73, 47: -73, 48: -73, 49: -73, 50: -73, 51: -73, 52: -73, 53: -73,
+        54: -73, 55: -73, 56: -73, 57: -73, 58: -73, 59: -73, 60: -73, 61: -73, 62: -73, 63: -73,
+        64: -73, 65: -73}),
+    row({
+        1: -196, 4: -196, 5: -196, 7: -196, 8: -196, 10: -196, 12: -196, 13: -196, 15: -196, 17:
+        -196, 18: -196, 23: -196, 32: -196, 34: -196, 35: -196, 38: -196, 39: -196, 45: -196, 51:
+        -196, 55: -196, 56: -196, 57: -196, 58: -196, 60: -196, 65: -196}),
+    row({
+        0: -217, 1: -217, 2: -217, 3: -217, 4: -217, 5: -217, 7: -217, 8: -217, 9: -217, 10: -217,
+        11: -217, 12: -217, 13: -217, 14: -217, 15: -217, 16: -217, 17: -217, 18: -217, 19: -217,
+        20: -217, 21: -217, 22: -217, 23: -217, 24: -217, 25: -217, 26: -217, 27: -217, 28: -217,
+        29: -217, 30: -217, 31: -217, 32: -217, 33: -217, 34: -217, 35: -217, 36: -217, 37: -217,
+        38: -217, 39: -217, 40: -217, 41: -217, 42: -217, 43: -217, 44: -217, 45: -217, 46: -217,
+        47: -217, 48: -217, 49: -217, 50: -217, 51: -217, 52: -217, 53: -217, 54: -217, 55: -217,
+        56: -217, 57: -217, 58: -217, 59: -217, 60: -217, 61: -217, 62: -217, 63: -217, 64: -217,
+        65: -217}),
+    row({
+        0: -222, 1: -222, 2: -222, 3: -222, 4: -222, 5: -222, 7: -222, 8: -222, 9: -222, 10: -222,
+        11: -222, 12: -222, 13: -222, 14: -222, 15: -222, 16: -222, 17: -222, 18: -222, 19: -222,
+        20: -222, 21: -222, 22: -222, 23: -222, 24: -222, 25: -222, 26: -222, 27: -222, 28: -222,
+        29: -222, 30: -222, 31: -222, 32: -222, 33: -222, 34: -222, 35: -222, 36: -222, 37: -222,
+        38: -222, 39: -222, 40: -222, 41: -222, 42: -222, 43: -222, 44: -222, 45: -222, 46: -222,
+        47: -222, 48: -222, 49: -222, 50: -222, 51: -222, 52: -222, 53: -222, 54: -222, 55: -222,
+        56: -222, 57: -222, 58: -222, 59: -222, 60: -222, 61: -222, 62: -222, 63: -222, 64: -222,
+        65: -222}),
+    row({
+        0: -223, 1: -223, 2: -223, 3: -223, 4: -223, 5: -223, 7: -223, 8: -223, 9: -223, 10: -223,
+        11: -223, 12: -223, 13: -223, 14: -223, 15: -223, 16: -223, 17: -223, 18: -223, 19: -223,
+        20: -223, 21: -223, 22: -223, 23: -223, 24: -223, 25: -223, 26: -223, 27: -223, 28: -223,
+        29: -223, 30: -223, 31: -223, 32: -223, 33: -223, 34: -223, 35: -223, 36: -223, 37: -223,
+        38: -223, 39: -223, 40: -223, 41: -223, 42: -223, 43: -223, 44: -223, 45: -223, 46: -223,
+        47: -223, 48: -223, 49: -223, 50: -223, 51: -223, 52: -223, 53: -223, 54: -223, 55: -223,
+        56: -223, 57: -223, 58: -223, 59: -223, 60: -223, 61: -223, 62: -223, 63: -223, 64: -223,
+        65: -223}),
+    row({
+        0: -224, 1: -224, 2: -224, 3: -224, 4: -224, 5: -224, 7: -224, 8: -224, 9: -224, 10: -224,
+        11: -224, 12: -224, 13: -224, 14: -224, 15: -224, 16: -224, 17: -224, 18: -224, 19: -224,
+        20: -224, 21: -224, 22: -224, 23: -224, 24: -224, 25: -224, 26: -224, 27: -224, 28: -224,
+        29: -224, 30: -224, 31: -224, 32: -224, 33: -224, 34: -224, 35: -224, 36: -224, 37: -224,
+        38: -224, 39: -224, 40: -224, 41: -224, 42: -224, 43: -224, 44: -224, 45: -224, 46: -224,
+        47: -224, 48: -224, 49: -224, 50: -224, 51: -224, 52: -224, 53: -224, 54: -224, 55: -224,
+        56: -224, 57: -224, 58: -224, 59: -224, 60: -224, 61: -224, 62: -224, 63: -224, 64: -224,
+        65: -224}),
+    row({
+        0: -165, 1: -165, 2: -165, 3: -165, 4: -165, 5: -165, 7: -165, 8: -165, 9: -165, 10: -165,
+        11: -165, 12: -165, 13: -165, 14: -165, 15: -165, 16: -165, 17: -165, 18: -165, 19: -165,
+        20: -165, 21: -165, 22: -165, 23: -165, 24: -165, 25: -165, 26: -165, 27: -165, 28: -165,
+        29: -165, 30: -165, 31: -165, 32: -165, 33: -165, 34: -165, 35: -165, 36: -165, 37: -165,
+        38: -165, 39: -165, 40: -165, 41: -165, 42: -165, 43: -165, 44: -165, 45: -165, 46: -165,
+        47: -165, 48: -165, 49: -165, 50: -165, 51: -165, 52: -165, 53: -165, 54: -165, 55: -165,
+        56: -165, 57: -165, 58: -165, 59: -165, 60: -165, 61: -165, 62: -165, 63: -165, 64: -165,
+        65: -165}),
+    row({
+        0: -164, 1: -164, 2: -164, 3: -164, 4: -164, 5: -164, 7: -164, 8: -164, 9: -164, 10: -164,
+        11: -164, 12: -164, 13: -164, 14: -164, 15: -164, 16: -164, 17: -164, 18: -164, 19: -164,
+        20: -164, 21: -164, 22: -164, 23: -164, 24: -164, 25: -164, 26: -164, 27: -164, 28: -164,
+        29: -164, 30: -164, 31: -164, 32: -164, 33: -164, 34: -164, 35: -164, 36: -164, 37: -164,
+        38: -164, 39: -164, 40: -164, 41: -164, 42: -164, 43: -164, 44: -164, 45: -164, 46: -164,
+        47: -164, 48: -164, 49: -164, 50: -164, 51: -164, 52: -164, 53: -164, 54: -164, 55: -164,
+        56: -164, 57: -164, 58: -164, 59: -164, 60: -164, 61: -164, 62: -164, 63: -164, 64: -164,
+        65: -164}),
+    row({
+        0: -190, 1: -190, 2: -190, 3: -190, 4: -190, 5: -190, 7: -190, 8: -190, 9: -190, 10: -190,
+        11: -190, 12: -190, 13: -190, 14: -190, 15: -190, 16: -190, 17: -190, 18: -190, 19: -190,
+        20: -190, 21: -190, 22: -190, 23: -190, 24: -190, 25: -190, 26: -190, 27: -190, 28: -190,
+        29: -190, 30: -190, 31: -190, 32: -190, 33: -190, 34: -190, 35: -190, 36: -190, 37: -190,
+        38: -190, 39: -190, 40: -190, 41: -190, 42: -190, 43: -190, 44: -190, 45: -190, 46: -190,
+        47: -190, 48: -190, 49: -190, 50: -190, 51: -190, 52: -190, 53: -190, 54: -190, 55: -190,
+        56: -190, 57: -190, 58: -190, 59: -190, 60: -190, 61: -190, 62: -190, 63: -190, 64: -190,
+        65: -190}),
+    row({
+        0: -188, 1: -188, 2: -188, 3: -188, 4: -188, 5: -188, 7: -188, 8: -188, 9: -188, 10: -188,
+        11: -188, 12: -188, 13: -188, 14: -188, 15: -188, 16: -188, 17: -188, 18: -188, 19: -188,
+        20: -188, 21: -188, 22: -188, 23: -188, 24: -188, 25: -188, 26: -188, 27: -188, 28: -188,
+        29: -188, 30: -188, 31: -188, 32: -188, 33: -188, 34: -188, 35: -188, 36: -188, 37: -188,
+        38: -188, 39: -188, 40: -188, 41: -188, 42: -188, 43: -188, 44: -188, 45: -188, 46: -188,
+        47: -188, 48: -188, 49: -188, 50: -188, 51: -188, 52: -188, 53: -188, 54: -188, 55: -188,
+        56: -188, 57: -188, 58: -188, 59: -188, 60: -188, 61: -188, 62: -188, 63: -188, 64: -188,
+        65: -188}),
+    row({
+        0: -189, 1: -189, 2: -189, 3: -189, 4: -189, 5: -189, 7: -189, 8: -189, 9: -189, 10: -189,
+        11: -189, 12: -189, 13: -189, 14: -189, 15: -189, 16: -189, 17: -189, 18: -189, 19: -189,
+        20: -189, 21: -189, 22: -189, 23: -189, 24: -189, 25: -189, 26: -189, 27: -189, 28: -189,
+        29: -189, 30: -189, 31: -189, 32: -189, 33: -189, 34: -189, 35: -189, 36: -189, 37: -189,
+        38: -189, 39: -189, 40: -189, 41: -189, 42: -189, 43: -189, 44: -189, 45: -189, 46: -189,
+        47: -189, 48: -189, 49: -189, 50: -189, 51: -189, 52: -189, 53: -189, 54: -189, 55: -189,
+        56: -189, 57: -189, 58: -189, 59: -189, 60: -189, 61: -189, 62: -189, 63: -189, 64: -189,
+        65: -189}),
+    row({
+        0: -191, 1: -191, 2: -191, 3: -191, 4: -191, 5: -191, 7: -191, 8: -191, 9: -191, 10: -191,
+        11: -191, 12: -191, 13: -191, 14: -191, 15: -191, 16: -191, 17: -191, 18: -191, 19: -191,
+        20: -191, 21: -191, 22: -191, 23: -191, 24: -191, 25: -191, 26: -191, 27: -191, 28: -191,
+        29: -191, 30: -191, 31: -191, 32: -191, 33: -191, 34: -191, 35: -191, 36: -191, 37: -191,
+        38: -191, 39: -191, 40: -191, 41: -191, 42: -191, 43: -191, 44: -191, 45: -191, 46: -191,
+        47: -191, 48: -191, 49: -191, 50: -191, 51: -191, 52: -191, 53: -191, 54: -191, 55: -191,
+        56: -191, 57: -191, 58: -191, 59: -191, 60: -191, 61: -191, 62: -191, 63: -191, 64: -191,
+        65: -191}),
+    row({
+        0: -192, 1: -192, 2: -192, 3: -192, 4: -192, 5: -192, 7: -192, 8: -192, 9: -192, 10: -192,
+        11: -192, 12: -192, 13: -192, 14: -192, 15: -192, 16: -192, 17: -192, 18: -192, 19: -192,
+        20: -192, 21: -192, 22: -192, 23: -192, 24: -192, 25: -192, 26: -192, 27: -192, 28: -192,
+        29: -192, 30: -192, 31: -192, 32: -192, 33: -192, 34: -192, 35: -192, 36: -192, 37: -192,
+        38: -192, 39: -192, 40: -192, 41: -192, 42: -192, 43: -192, 44: -192, 45: -192, 46: -192,
+        47: -192, 48: -192, 49: -192, 50: -192, 51: -192, 52: -192, 53: -192, 54: -192, 55: -192,
+        56: -192, 57: -192, 58: -192, 59: -192, 60: -192, 61: -192, 62: -192, 63: -192, 64: -192,
+        65: -192}),
+    row({
+        0: -193, 1: -193, 2: -193, 3: -193, 4: -193, 5: -193, 7: -193, 8: -193, 9: -193, 10: -193,
+        11: -193, 12: -193, 13: -193, 14: -193, 15: -193, 16: -193, 17: -193, 18: -193, 19: -193,
+        20: -193, 21: -193, 22: -193, 23: -193, 24: -193, 25: -193, 26: -193, 27: -193, 28: -193,
+        29: -193, 30: -193, 31: -193, 32: -193, 33: -193, 34: -193, 35: -193, 36: -193, 37: -193,
+        38: -193, 39: -193, 40: -193, 41: -193, 42: -193, 43: -193, 44: -193, 45: -193, 46: -193,
+        47: -193, 48: -193, 49: -193, 50: -193, 51: -193, 52: -193, 53: -193, 54: -193, 55: -193,
+        56: -193, 57: -193, 58: -193, 59: -193, 60: -193, 61: -193, 62: -193, 63: -193, 64: -193,
+        65: -193}),
+    row({
+        0: -197, 1: -197, 2: -197, 3: -197, 4: -197, 5: -197, 7: -197, 8: -197, 9: -197, 10: -197,
+        11: -197, 12: -197, 13: -197, 14: -197, 15: -197, 16: -197, 17: -197, 18: -197, 19: -197,
+        20: -197, 21: -197, 22: -197, 23: -197, 24: -197, 25: -197, 26: -197, 27: -197, 28: -197,
+        29: -197, 30: -197, 31: -197, 32: -197, 33: -197, 34: -197, 35: -197, 36: -197, 37: -197,
+        38: -197, 39: -197, 40: -197, 41: -197, 42: -197, 43: -197, 44: -197, 45: -197, 46: -197,
+        47: -197, 48: -197, 49: -197, 50: -197, 51: -197, 52: -197, 53: -197, 54: -197, 55: -197,
+        56: -197, 57: -197, 58: -197, 59: -197, 60: -197, 61: -197, 62: -197, 63: -197, 64: -197,
+        65: -197}),
+    row({
+        0: -198, 1: -198, 2: -198, 3: -198, 4: -198, 5: -198, 7: -198, 8: -198, 9: -198, 10: -198,
+        11: -198, 12: -198, 13: -198, 14: -198, 15: -198, 16: -198, 17: -198, 18: -198, 19: -198,
+        20: -198, 21: -198, 22: -198, 23: -198, 24: -198, 25: -198, 26: -198, 27: -198, 28: -198,
+        29: -198, 30: -198, 31: -198, 32: -198, 33: -198, 34: -198, 35: -198, 36: -198, 37: -198,
+        38: -198, 39: -198, 40: -198, 41: -198, 42: -198, 43: -198, 44: -198, 45: -198, 46: -198,
+        47: -198, 48: -198, 49: -198, 50: -198, 51: -198, 52: -198, 53: -198, 54: -198, 55: -198,
+        56: -198, 57: -198, 58: -198, 59: -198, 60: -198, 61: -198, 62: -198, 63: -198, 64: -198,
+        65: -198}),
+    row({
+        35: 53, 51: 58, 65: 127}),
+    row({
+        1: 39, 12: 7, 13: 8, 18: 38, 35: -36, 51: -36, 65: -36}),
+    row({
+        12: 7, 13: 8, 35: -37, 51: -37, 65: -37}),
+    row({
+        1: -132, 12: -132, 13: -132, 18: -132, 35: -132, 51: -132, 65: -132}),
+    row({
+        12: -133, 13: -133, 35: -133, 51: -133, 65: -133}),
+    row({
+        11: 251, 49: 156}),
+    row({
+        0: -95, 1: -95, 2: -95, 3: -95, 4: -95, 5: -95, 7: -95, 8: -95, 9: -95, 10: -95, 11: -95,
+        12: 7, 13: 8, 14: -95, 15: -95, 16: -95, 17: -95, 18: -95, 19: -95, 20: -95, 21: -95, 22:
+        -95, 23: -95, 24: -95, 25: -95, 26: -95, 27: -95, 28: -95, 29: -95, 30: -95, 31: -95, 32:
+        -95, 33: -95, 34: -95, 35: -95, 36: -95, 37: -95, 38: -95, 39: -95, 40: -95, 41: -95, 42:
+        -95, 43: -95, 44: -95, 45: -95, 46: -95, 47: -95, 48: -95, 49: -95, 50: -95, 51: -95, 52:
+        -95, 53: -95, 54: -95, 55: -95, 56: -95, 57: -95, 58: -95, 59: -95, 60: -95, 61: -95, 62:
+        -95, 63: -95, 64: -95, 65: -95}),
+    row({
+        1: -220, 4: -220, 5: -220, 7: -220, 8: -220, 10: -220, 12: -220, 13: -220, 15: -220, 17:
+        -220, 18: -220, 23: -220, 32: -220, 34: -220, 35: -220, 38: -220, 39: -220, 45: -220, 49:
+        -220, 51: -220, 55: -220, 56: -220, 57: -220, 58: -220, 60: -220, 65: -220}),
+    row({
+        0: -100, 1: -100, 2: -100, 3: -100, 4: -100, 5: -100, 7: -100, 8: -100, 9: -100, 10: -100,
+        11: -100, 14: -100, 15: -100, 16: -100, 17: -100, 18: -100, 19: -100, 20: -100, 21: -100,
+        22: -100, 23: -100, 24: -100, 25: -100, 26: -100, 27: -100, 28: -100, 29: -100, 30: -100,
+        31: -100, 32: -100, 33: -100, 34: -100, 35: -100, 36: -100, 37: -100, 38: -100, 39: -100,
+        40: -100, 41: -100, 42: -100, 43: -100, 44: -100, 45: -100, 46: -100, 47: -100, 48: -100,
+        49: -100, 50: -100, 51: -100, 52: -100, 53: -100, 54: -100, 55: -100, 56: -100, 57: -100,
+        58: -100, 59: -100, 60: -100, 61: -100, 62: -100, 63: -100, 64: -100, 65: -100}),
+    row({
+        0: -159, 1: -159, 2: -159, 3: -159, 4: -159, 5: -159, 7: -159, 8: -159, 9: -159, 10: -159,
+        11: -159, 12: -159, 13: -159, 14: -159, 15: -159, 16: -159, 17: -159, 18: -159, 19: -159,
+        20: -159, 21: -159, 22: -159, 23: -159, 24: -159, 25: -159, 26: -159, 27: -159, 28: -159,
+        29: -159, 30: -159, 31: -159, 32: -159, 33: -159, 34: -159, 35: -159, 36: -159, 37: -159,
+        38: -159, 39: -159, 40: -159, 41: -159, 42: -159, 43: -159, 44: -159, 45: -159, 46: -159,
+        47: -159, 48: -159, 49: -159, 50: -159, 51: -159, 52: -159, 53: -159, 54: -159, 55: -159,
+        56: -159, 57: -159, 58: -159, 59: -159, 60: -159, 61: -159, 62: -159, 63: -159, 64: -159,
+        65: -159}),
+    row({
+        11: -100, 50: 163}),
+    row({
+        0: -98, 1: -98, 2: -98, 3: -98, 4: -98, 5: -98, 7: -98, 8: -98, 9: -98, 10: -98, 11: -98,
+        12: 7, 13: 8, 14: -98, 15: -98, 16: -98, 17: -98, 18: -98, 19: -98, 20: -98, 21: -98, 22:
+        -98, 23: -98, 24: -98, 25: -98, 26: -98, 27: -98, 28: -98, 29: -98, 30: -98, 31: -98, 32:
+        -98, 33: -98, 34: -98, 35: -98, 36: -98, 37: -98, 38: -98, 39: -98, 40: -98, 41: -98, 42:
+        -98, 43: -98, 44: -98, 45: -98, 46: -98, 47: -98, 48: -98, 49: -98, 50: -98, 51: -98, 52:
+        -98, 53: -98, 54: -98, 55: -98, 56: -98, 57: -98, 58: -98, 59: -98, 60: -98, 61: -98, 62:
+        -98, 63: -98, 64: -98, 65: -98}),
+    row({
+        11: 251, 50: 163}),
+    row({
+        1: -92, 2: -92, 3: -92, 4: -92, 5: -92, 7: -92, 8: -92, 10: -92, 11: -92, 14: -92, 15: -92,
+        17: -92, 18: -92, 22: 151, 23: -92, 28: -92, 30: -92, 32: -92, 34: -92, 35: -92, 38: -92,
+        39: -92, 42: -92, 45: -92, 47: -92, 50: 163, 51: -92, 55: -92, 56: -92, 57: -92, 58: -92,
+        60: -92, 61: 150, 64: -92, 65: -92}),
+    row({
+        1: -218, 4: -218, 5: -218, 7: -218, 8: -218, 9: -218, 10: -218, 12: -218, 13: -218, 15:
+        -218, 17: -218, 18: -218, 19: -218, 23: -218, 26: -218, 32: -218, 34: -218, 35: -218, 38:
+        -218, 39: -218, 43: -218, 45: -218, 46: -218, 50: -218, 51: -218, 54: -218, 55: -218, 56:
+        -218, 57: -218, 58: -218, 60: -218, 65: -218}),
+    row({
+        0: -157, 1: -157, 2: -157, 3: -157, 4: -157, 5: -157, 7: -157, 8: -157, 9: -157, 10: -157,
+        11: -157, 12: -157, 13: -157, 14: -157, 15: -157, 16: -157, 17: -157, 18: -157, 19: -157,
+        20: -157, 21: -157, 22: -157, 23: -157, 24: -157, 25: -157, 26: -157, 27: -157, 28: -157,
+        29: -157, 30: -157, 31: -157, 32: -157, 33: -157, 34: -157, 35: -157, 36: -157, 37: -157,
+        38: -157, 39: -157, 40: -157, 41: -157, 42: -157, 43: -157, 44: -157, 45: -157, 46: -157,
+        47: -157, 48: -157, 49: -157, 50: -157, 51: -157, 52: -157, 53: -157, 54: -157, 55: -157,
+        56: -157, 57: -157, 58: -157, 59: -157, 60: -157, 61: -157, 62: -157, 63: -157, 64: -157,
+        65: -157}),
+    row({
+        21: 259}),
+    row({
+        12: -178, 13: -178, 20: -178, 62: -178}),
+    row({
+        20: 170, 21: -54, 62: 169}),
+    row({
+        1: -117, 4: -117, 5: -117, 7: -117, 8: -117, 10: -117, 12: -117, 13: -117, 15: -117, 17:
+        -117, 18: -117, 23: -117, 32: -117, 34: -117, 35: -117, 38: -117, 39: -117, 45: -117, 51:
+        -117, 55: -117, 56: -117, 57: -117, 58: -117, 60: -117, 65: -117}),
+    row({
+        1: -119, 4: -119, 5: -119, 7: -119, 8: -119, 10: -119, 12: -119, 13: -119, 15: -119, 17:
+        -119, 18: -119, 23: -119, 32: -119, 34: -119, 35: -119, 38: -119, 39: -119, 45: -119, 51:
+        -119, 55: -119, 56: -119, 57: -119, 58: -119, 60: -119, 65: -119}),
+    row({
+        0: -10, 1: -10, 2: -10, 3: -10, 4: -10, 5: -10, 7: -10, 8: -10, 9: -10, 10: -10, 11: -10,
+        14: -10, 15: -10, 16: -10, 17: -10, 18: -10, 19: -10, 20: -10, 21: -10, 22: -10, 23: -10,
+        24: -10, 25: -10, 26: -10, 27: -10, 28: -10, 29: -10, 30: -10, 31: -10, 32: -10, 33: -10,
+        34: -10, 35: -10, 36: -10, 37: -10, 38: -10, 39: -10, 40: -10, 41: -10, 42: -10, 43: -10,
+        44: -10, 45: -10, 46: -10, 47: -10, 48: -10, 49: -10, 50: -10, 51: -10, 52: -10, 53: -10,
+        54: -10, 55: -10, 56: -10, 57: -10, 58: -10, 59: -10, 60: -10, 61: -10, 62: -10, 63: -10,
+        64: -10, 65: -10}),
+    row({
+        0: -18, 1: -18, 2: -18, 3: -18, 4: -18, 5: -18, 7: -18, 8: -18, 9: 70, 10: -18, 11: -18, 14:
+        -18, 15: -18, 16: 106, 17: -18, 18: -18, 19: 71, 20: -18, 21: -18, 22: -18, 23: -18, 24: 83,
+        25: 104, 26: 68, 27: 86, 28: -18, 29: 100, 30: -18, 31: 91, 32: -18, 33: 102, 34: -18, 35:
+        -18, 36: 85, 37: 107, 38: -18, 39: -18, 40: -18, 41: 87, 42: -18, 43: 69, 44: 101, 45: -18,
+        46: 73, 47: -18, 48: 103, 49: -18, 50: -18, 51: -18, 52: 105, 53: -18, 54: 72, 55: -18, 56:
+        -18, 57: -18, 58: -18, 59: -18, 60: -18, 61: -18, 62: -18, 63: 84, 64: -18, 65: -18}),
+    row({
+        0: -19, 1: -19, 2: -19, 3: -19, 4: -19, 5: -19, 7: -19, 8: -19, 9: -19, 10: -19, 11: -19,
+        14: -19, 15: -19, 16: -19, 17: -19, 18: -19, 19: -19, 20: -19, 21: -19, 22: -19, 23: -19,
+        24: -19, 25: -19, 26: -19, 27: -19, 28: -19, 29: -19, 30: -19, 31: -19, 32: -19, 33: -19,
+        34: -19, 35: -19, 36: -19, 37: -19, 38: -19, 39: -19, 40: -19, 41: -19, 42: -19, 43: -19,
+        44: -19, 45: -19, 46: -19, 47: -19, 48: -19, 49: -19, 50: -19, 51: -19, 52: -19, 53: -19,
+        54: -19, 55: -19, 56: -19, 57: -19, 58: -19, 59: -19, 60: -19, 61: -19, 62: -19, 63: -19,
+        64: -19, 65: -19}),
+    row({
+        0: -20, 1: -20, 2: -20, 3: -20, 4: -20, 5: -20, 7: -20, 8: -20, 9: -20, 10: -20, 11: -20,
+        14: -20, 15: -20, 16: -20, 17: -20, 18: -20, 19: -20, 20: -20, 21: -20, 22: -20, 23: -20,
+        24: -20, 25: -20, 26: -20, 27: -20, 28: -20, 29: -20, 30: -20, 31: -20, 32: -20, 33: -20,
+        34: -20, 35: -20, 36: -20, 37: -20, 38: -20, 39: -20, 40: -20, 41: -20, 42: -20, 43: -20,
+        44: -20, 45: -20, 46: -20, 47: -20, 48: -20, 49: -20, 50: -20, 51: -20, 52: -20, 53: -20,
+        54: -20, 55: -20, 56: -20, 57: -20, 58: -20, 59: -20, 60: -20, 61: -20, 62: -20, 63: -20,
+        64: -20, 65: -20}),
+    row({
+        0: -21, 1: -21, 2: -21, 3: -21, 4: -21, 5: -21, 7: -21, 8: -21, 9: -21, 10: -21, 11: -21,
+        14: -21, 15: -21, 16: -21, 17: -21, 18: -21, 19: -21, 20: -21, 21: -21, 22: -21, 23: -21,
+        24: -21, 25: -21, 26: -21, 27: -21, 28: -21, 29: -21, 30: -21, 31: -21, 32: -21, 33: -21,
+        34: -21, 35: -21, 36: -21, 37: -21, 38: -21, 39: -21, 40: -21, 41: -21, 42: -21, 43: -21,
+        44: -21, 45: -21, 46: -21, 47: -21, 48: -21, 49: -21, 50: -21, 51: -21, 52: -21, 53: -21,
+        54: -21, 55: -21, 56: -21, 57: -21, 58: -21, 59: -21, 60: -21, 61: -21, 62: -21, 63: -21,
+        64: -21, 65: -21}),
+    row({
+        9: 70, 12: 7, 13: 8, 19: 71, 26: 68, 43: 69, 46: 73, 54: 72}),
+    row({
+        12: -211, 13: -211, 35: -211}),
+    row({
+        0: -11, 1: -11, 2: -11, 3: -11, 4: -11, 5: -11, 7: -11, 8: -11, 9: -11, 10: -11, 11: 251,
+        14: -11, 15: -11, 16: -11, 17: -11, 18: -11, 19: -11, 20: -11, 21: -11, 22: -11, 23: -11,
+        24: -11, 25: -11, 26: -11, 27: -11, 28: -11, 29: -11, 30: -11, 31: -11, 32: -11, 33: -11,
+        34: -11, 35: -11, 36: -11, 37: -11, 38: -11, 39: -11, 40: -11, 41: -11, 42: -11, 43: -11,
+        44: -11, 45: -11, 46: -11, 47: -11, 48: -11, 49: -11, 50: -11, 51: -11, 52: -11, 53: -11,
+        54: -11, 55: -11, 56: -11, 57: -11, 58: -11, 59: -11, 60: -11, 61: -11, 62: -11, 63: -11,
+        64: -11, 65: -11}),
+    row({
+        0: -16, 1: -16, 2: -16, 3: -16, 4: -16, 5: -16, 7: -16, 8: -16, 9: -16, 10: -16, 11: -16,
+        14: -16, 15: -16, 16: -16, 17: -16, 18: -16, 19: -16, 20: -16, 21: -16, 22: -16, 23: -16,
+        24: -16, 25: -16, 26: -16, 27: -16, 28: -16, 29: -16, 30: -16, 31: -16, 32: -16, 33: -16,
+        34: -16, 35: -16, 36: -16, 37: -16, 38: -16, 39: -16, 40: -16, 41: -16, 42: -16, 43: -16,
+        44: -16, 45: -16, 46: -16, 47: -16, 48: -16, 49: -16, 50: -16, 51: -16, 52: -16, 53: -16,
+        54: -16, 55: -16, 56: -16, 57: -16, 58: -16, 59: -16, 60: -16, 61: -16, 62: -16, 63: -16,
+        64: -16, 65: -16}),
+    row({
+        0: -227, 1: -227, 2: -227, 3: -227, 4: -227, 5: -227, 7: -227, 8: -227, 9: -227, 10: -227,
+        11: -227, 14: -227, 15: -227, 16: 106, 17: -227, 18: -227, 19: -227, 20: -227, 21: -227, 22:
+        -227, 23: -227, 24: 83, 25: 104, 26: -227, 27: 86, 28: -227, 29: 100, 30: -227, 31: 91, 32:
+        -227, 33: 102, 34: -227, 35: -227, 36: 85, 37: 107, 38: -227, 39: -227, 40: -227, 41: 87,
+        42: -227, 43: -227, 44: 101, 45: -227, 46: -227, 47: -227, 48: 103, 49: -227, 50: -227, 51:
+        -227, 52: 105, 53: -227, 54: -227, 55: -227, 56: -227, 57: -227, 58: -227, 59: -227, 60:
+        -227, 61: -227, 62: -227, 63: 84, 64: -227, 65: -227}),
+    row({
+        0: -61, 1: -61, 2: -61, 3: -61, 4: -61, 5: -61, 7: -61, 8: -61, 9: -61, 10: -61, 11: -61,
+        14: -61, 15: -61, 16: -61, 17: -61, 18: -61, 19: -61, 20: -61, 21: -61, 22: -61, 23: -61,
+        24: -61, 25: -61, 26: -61, 27: -61, 28: -61, 29: -61, 30: -61, 31: -61, 32: -61, 33: -61,
+        34: -61, 35: -61, 36: -61, 37: -61, 38: -61, 39: -61, 40: -61, 41: -61, 42: -61, 43: -61,
+        44: -61, 45: -61, 46: -61, 47: -61, 48: -61, 49: -61, 50: -61, 51: -61, 52: -61, 53: -61,
+        54: -61, 55: -61, 56: -61, 57: -61, 58: -61, 59: -61, 60: -61, 61: -61, 62: -61, 63: -61,
+        64: -61, 65: -61}),
+    row({
+        1: -13, 4: -13, 5: -13, 7: -13, 8: -13, 10: -13, 12: 7, 13: 8, 15: -13, 17: -13, 18: -13,
+        23: -13, 32: -13, 34: -13, 35: -13, 38: -13, 39: -13, 45: -13, 51: -13, 55: -13, 56: -13,
+        57: -13, 58: -13, 60: -13, 65: -13}),
+    row({
+        1: -14, 4: -14, 5: -14, 7: -14, 8: -14, 10: -14, 12: 7, 13: 8, 15: -14, 17: -14, 18: -14,
+        23: -14, 32: -14, 34: -14, 35: -14, 38: -14, 39: -14, 45: -14, 51: -14, 55: -14, 56: -14,
+        57: -14, 58: -14, 60: -14, 65: -14}),
+    row({
+        1: -163, 4: -163, 5: -163, 7: -163, 8: -163, 10: -163, 12: -163, 13: -163, 15: -163, 17:
+        -163, 18: -163, 23: -163, 32: -163, 34: -163, 35: -163, 38: -163, 39: -163, 45: -163, 51:
+        -163, 55: -163, 56: -163, 57: -163, 58: -163, 60: -163, 65: -163}),
+    row({
+        0: -215, 12: -215, 13: -215, 53: -215}),
+    row({
+        6: -169, 12: -169, 13: -169}),
+    row({
+        1: -106, 4: -106, 5: -106, 7: -106, 8: -106, 10: -106, 12: -106, 13: -106, 15: -106, 17:
+        -106, 18: -106, 23: -106, 32: -106, 34: -106, 35: -106, 38: -106, 39: -106, 45: -106, 51:
+        -106, 55: -106, 56: -106, 57: -106, 58: -106, 60: -106, 65: -106}),
+    row({
+        6: -170, 12: -170, 13: -170}),
+    row({
+        6: -171, 12: -171, 13: -171}),
+    row({
+        6: -172, 12: -172, 13: -172}),
+    row({
+        6: -173, 12: -173, 13: -173}),
+    row({
+        6: -174, 12: -174, 13: -174}),
+    row({
+        0: -231, 1: -231, 2: -231, 3: -231, 4: -231, 5: -231, 7: -231, 8: -231, 9: -231, 10: -231,
+        11: -231, 14: -231, 15: -231, 16: -231, 17: -231, 18: -231, 19: -231, 20: -231, 21: -231,
+        22: -231, 23: -231, 24: -231, 25: -231, 26: -231, 27: -231, 28: -231, 29: -231, 30: -231,
+        31: -231, 32: -231, 33: -231, 34: -231, 35: -231, 36: -231, 37: -231, 38: -231, 39: -231,
+        40: -231, 41: -231, 42: -231, 43: -231, 44: -231, 45: -231, 46: -231, 47: -231, 48: -231,
+        49: -231, 50: -231, 51: -231, 52: -231, 53: -231, 54: -231, 55: -231, 56: -231, 57: -231,
+        58: -231, 59: -231, 60: -231, 61: -231, 62: -231, 63: -231, 64: -231, 65: -231}),
+    row({
+        0: -232, 1: -232, 2: -232, 3: -232, 4: -232, 5: -232, 7: -232, 8: -232, 9: -232, 10: -232,
+        11: -232, 14: -232, 15: -232, 16: -232, 17: -232, 18: -232, 19: -232, 20: -232, 21: -232,
+        22: -232, 23: -232, 24: -232, 25: -232, 26: -232, 27: -232, 28: -232, 29: -232, 30: -232,
+        31: -232, 32: -232, 33: -232, 34: -232, 35: -232, 36: -232, 37: -232, 38: -232, 39: -232,
+        40: -232, 41: -232, 42: -232, 43: -232, 44: -232, 45: -232, 46: -232, 47: -232, 48: -232,
+        49: -232, 50: -232, 51: -232, 52: -232, 53: -232, 54: -232, 55: -232, 56: -232, 57: -232,
+        58: -232, 59: -232, 60: -232, 61: -232, 62: -232, 63: -232, 64: -232, 65: -232}),
+    row({
+        0: -22, 1: -22, 2: -22, 3: -22, 4: -22, 5: -22, 7: -22, 8: -22, 9: -22, 10: -22, 11: -22,
+        14: -22, 15: -22, 16: -22, 17: -22, 18: -22, 19: -22, 20: -22, 21: -22, 22: -22, 23: -22,
+        24: -22, 25: -22, 26: -22, 27: -22, 28: -22, 29: -22, 30: -22, 31: -22, 32: -22, 33: -22,
+        34: -22, 35: -22, 36: -22, 37: -22, 38: -22, 39: -22, 40: -22, 41: -22, 42: -22, 43: -22,
+        44: -22, 45: -22, 46: -22, 47: -22, 48: -22, 49: -22, 50: -22, 51: -22, 52: -22, 53: -22,
+        54: -22, 55: -22, 56: -22, 57: -22, 58: -22, 59: -22, 60: -22, 61: -22, 62: -22, 63: -22,
+        64: -22, 65: -22}),
+    row({
+        1: -166, 4: -166, 5: -166, 7: -166, 8: -166, 10: -166, 12: -166, 13: -166, 15: -166, 17:
+        -166, 18: -166, 23: -166, 32: -166, 34: -166, 35: -166, 38: -166, 39: -166, 45: -166, 51:
+        -166, 55: -166, 56: -166, 57: -166, 58: -166, 60: -166, 65: -166}),
+    row({
+        0: -33, 1: -33, 2: -33, 3: -33, 4: -33, 5: -33, 7: -33, 8: -33, 9: -33, 10: -33, 11: 251,
+        14: -33, 15: -33, 16: -33, 17: -33, 18: -33, 19: -33, 20: -33, 21: -33, 22: -33, 23: -33,
+        24: -33, 25: -33, 26: -33, 27: -33, 28: -33, 29: -33, 30: -33, 31: -33, 32: -33, 33: -33,
+        34: -33, 35: -33, 36: -33, 37: -33, 38: -33, 39: -33, 40: -33, 41: -33, 42: -33, 43: -33,
+        44: -33, 45: -33, 46: -33, 47: -33, 48: -33, 49: -33, 50: -33, 51: -33, 52: -33, 53: -33,
+        54: -33, 55: -33, 56: -33, 57: -33, 58: -33, 59: -33, 60: -33, 61: -33, 62: -33, 63: -33,
+        64: -33, 65: -33}),
+    row({
+        0: -228, 1: -228, 2: -228, 3: -228, 4: -228, 5: -228, 7: -228, 8: -228, 9: -228, 10: -228,
+        11: -228, 14: -228, 15: -228, 16: 106, 17: -228, 18: -228, 19: -228, 20: -228, 21: -228, 22:
+        -228, 23: -228, 24: 83, 25: 104, 26: -228, 27: 86, 28: -228, 29: 100, 30: -228, 31: 91, 32:
+        -228, 33: 102, 34: -228, 35: -228, 36: 85, 37: 107, 38: -228, 39: -228, 40: -228, 41: 87,
+        42: -228, 43: -228, 44: 101, 45: -228, 46: -228, 47: -228, 48: 103, 49: -228, 50: -228, 51:
+        -228, 52: 105, 53: -228, 54: -228, 55: -228, 56: -228, 57: -228, 58: -228, 59: -228, 60:
+        -228, 61: -228, 62: -228, 63: 84, 64: -228, 65: -228}),
+    row({
+        0: -23, 1: -23, 2: -23, 3: -23, 4: -23, 5: -23, 7: -23, 8: -23, 9: -23, 10: -23, 11: -23,
+        14: -23, 15: -23, 16: -23, 17: -23, 18: -23, 19: -23, 20: -23, 21: -23, 22: -23, 23: -23,
+        24: -23, 25: -23, 26: -23, 27: -23, 28: -23, 29: -23, 30: -23, 31: -23, 32: -23, 33: -23,
+        34: -23, 35: -23, 36: -23, 37: -23, 38: -23, 39: -23, 40: -23, 41: -23, 42: -23, 43: -23,
+        44: -23, 45: -23, 46: -23, 47: -23, 48: -23, 49: -23, 50: -23, 51: -23, 52: -23, 53: -23,
+        54: -23, 55: -23, 56: -23, 57: -23, 58: -23, 59: -23, 60: -23, 61: -23, 62: -23, 63: -23,
+        64: -23, 65: -23}),
+    row({
+        1: -167, 4: -167, 5: -167, 7: -167, 8: -167, 10: -167, 12: -167, 13: -167, 15: -167, 17:
+        -167, 18: -167, 23: -167, 32: -167, 34: -167, 35: -167, 38: -167, 39: -167, 45: -167, 51:
+        -167, 55: -167, 56: -167, 57: -167, 58: -167, 60: -167, 65: -167}),
+    row({
+        0: -24, 1: -24, 2: -24, 3: -24, 4: -24, 5: -24, 7: -24, 8: -24, 9: -24, 10: -24, 11: -24,
+        14: -24, 15: -24, 16: -24, 17: -24, 18: -24, 19: -24, 20: -24, 21: -24, 22: -24, 23: -24,
+        24: -24, 25: -24, 26: -24, 27: -24, 28: -24, 29: -24, 30: -24, 31: -24, 32: -24, 33: -24,
+        34: -24, 35: -24, 36: -24, 37: -24, 38: -24, 39: -24, 40: -24, 41: -24, 42: -24, 43: -24,
+        44: -24, 45: -24, 46: -24, 47: -24, 48: -24, 49: -24, 50: -24, 51: -24, 52: -24, 53: -24,
+        54: -24, 55: -24, 56: -24, 57: -24, 58: -24, 59: -24, 60: -24, 61: -24, 62: -24, 63: -24,
+        64: -24, 65: -24}),
+    row({
+        1: -176, 4: -176, 5: -176, 7: -176, 8: -176, 10: -176, 12: -176, 13: -176, 15: -176, 17:
+        -176, 18: -176, 23: -176, 32: -176, 34: -176, 35: -176, 38: -176, 39: -176, 45: -176, 51:
+        -176, 55: -176, 56: -176, 57: -176, 58: -176, 60: -176, 65: -176}),
+    row({
+        0: -25, 1: -25, 2: -25, 3: -25, 4: -25, 5: -25, 7: -25, 8: -25, 9: -25, 10: -25, 11: -25,
+        14: -25, 15: -25, 16: -25, 17: -25, 18: -25, 19: -25, 20: -25, 21: -25, 22: -25, 23: -25,
+        24: -25, 25: -25, 26: -25, 27: -25, 28: -25, 29: -25, 30: -25, 31: -25, 32: -25, 33: -25,
+        34: -25, 35: -25, 36: -25, 37: -25, 38: -25, 39: -25, 40: -25, 41: -25, 42: -25, 43: -25,
+        44: -25, 45: -25, 46: -25, 47: -25, 48: -25, 49: -25, 50: -25, 51: -25, 52: -25, 53: -25,
+        54: -25, 55: -25, 56: -25, 57: -25, 58: -25, 59: -25, 60: -25, 61: -25, 62: -25, 63: -25,
+        64: -25, 65: -25}),
+    row({
+        1: -175, 4: -175, 5: -175, 7: -175, 8: -175, 10: -175, 12: -175, 13: -175, 15: -175, 17:
+        -175, 18: -175, 23: -175, 32: -175, 34: -175, 35: -175, 38: -175, 39: -175, 45: -175, 51:
+        -175, 55: -175, 56: -175, 57: -175, 58: -175, 60: -175, 65: -175}),
+    row({
+        0: -26, 1: -26, 2: -26, 3: -26, 4: -26, 5: -26, 7: -26, 8: -26, 9: -26, 10: -26, 11: -26,
+        14: -26, 15: -26, 16: -26, 17: -26, 18: -26, 19: -26, 20: -26, 21: -26, 22: -26, 23: -26,
+        24: -26, 25: -26, 26: -26, 27: -26, 28: -26, 29: -26, 30: -26, 31: -26, 32: -26, 33: -26,
+        34: -26, 35: -26, 36: -26, 37: -26, 38: -26, 39: -26, 40: -26, 41: -26, 42: -26, 43: -26,
+        44: -26, 45: -26, 46: -26, 47: -26, 48: -26, 49: -26, 50: -26, 51: -26, 52: -26, 53: -26,
+        54: -26, 55: -26, 56: -26, 57: -26, 58: -26, 59: -26, 60: -26, 61: -26, 62: -26, 63: -26,
+        64: -26, 65: -26}),
+    row({
+        1: -210, 4: -210, 5: -210, 7: -210, 8: -210, 10: -210, 12: -210, 13: -210, 15: -210, 17:
+        -210, 18: -210, 23: -210, 32: -210, 34: -210, 35: -210, 38: -210, 39: -210, 45: -210, 51:
+        -210, 55: -210, 56: -210, 57: -210, 58: -210, 60: -210, 65: -210}),
+    row({
+        0: -39, 1: -39, 2: -39, 3: -39, 4: -39, 5: -39, 7: -39, 8: -39, 9: -39, 10: -39, 11: -39,
+        14: -39, 15: -39, 16: -39, 17: -39, 18: -39, 19: -39, 20: -39, 21: -39, 22: -39, 23: -39,
+        24: -39, 25: -39, 26: -39, 27: -39, 28: -39, 29: -39, 30: -39, 31: -39, 32: -39, 33: -39,
+        34: -39, 35: -39, 36: -39, 37: -39, 38: -39, 39: -39, 40: 278, 41: -39, 42: -39, 43: -39,
+        44: -39, 45: -39, 46: -39, 47: -39, 48: -39, 49: -39, 50: -39, 51: -39, 52: -39, 53: -39,
+        54: -39, 55: -39, 56: -39, 57: -39, 58: -39, 59: -39, 60: -39, 61: -39, 62: -39, 63: -39,
+        64: -39, 65: -39}),
+    row({
+        1: -40, 4: -40, 5: -40, 7: -40, 8: -40, 10: -40, 12: 7, 13: 8, 15: -40, 17: -40, 18: -40,
+        23: -40, 32: -40, 34: -40, 35: -40, 38: -40, 39: -40, 45: -40, 51: -40, 55: -40, 56: -40,
+        57: -40, 58: -40, 60: -40, 65: -40}),
+    row({
+        1: -199, 4: -199, 5: -199, 7: -199, 8: -199, 10: -199, 12: -199, 13: -199, 15: -199, 17:
+        -199, 18: -199, 23: -199, 32: -199, 34: -199, 35: -199, 38: -199, 39: -199, 45: -199, 51:
+        -199, 55: -199, 56: -199, 57: -199, 58: -199, 60: -199, 65: -199}),
+    row({
+        31: -50}),
+    row({
+        12: -201, 13: -201, 16: -201, 25: -201, 29: -201, 31: -201, 33: -201, 37: -201, 44: -201,
+        48: -201, 52: -201}),
+    row({
+        12: -202, 13: -202, 16: -202, 25: -202, 29: -202, 31: -202, 33: -202, 37: -202, 44: -202,
+        48: -202, 52: -202}),
+    row({
+        12: -203, 13: -203, 16: -203, 25: -203, 29: -203, 31: -203, 33: -203, 37: -203, 44: -203,
+        48: -203, 52: -203}),
+    row({
+        12: -204, 13: -204, 16: -204, 25: -204, 29: -204, 31: -204, 33: -204, 37: -204, 44: -204,
+        48: -204, 52: -204}),
+    row({
+        12: -205, 13: -205, 16: -205, 25: -205, 29: -205, 31: -205, 33: -205, 37: -205, 44: -205,
+        48: -205, 52: -205}),
+    row({
+        12: -206, 13: -206, 16: -206, 25: -206, 29: -206, 31: -206, 33: -206, 37: -206, 44: -206,
+        48: -206, 52: -206}),
+    row({
+        12: -207, 13: -207, 16: -207, 25: -207, 29: -207, 31: -207, 33: -207, 37: -207, 44: -207,
+        48: -207, 52: -207}),
+    row({
+        12: -208, 13: -208, 16: -208, 25: -208, 29: -208, 31: -208, 33: -208, 37: -208, 44: -208,
+        48: -208, 52: -208}),
+    row({
+        0: -63, 1: -63, 2: -63, 3: -63, 4: -63, 5: -63, 7: -63, 8: -63, 9: -63, 10: -63, 11: -63,
+        14: -63, 15: -63, 16: -63, 17: -63, 18: -63, 19: -63, 20: -63, 21: -63, 22: -63, 23: -63,
+        24: -63, 25: -63, 26: -63, 27: -63, 28: -63, 29: -63, 30: -63, 31: -63, 32: -63, 33: -63,
+        34: -63, 35: -63, 36: -63, 37: -63, 38: -63, 39: -63, 40: -63, 41: -63, 42: -63, 43: -63,
+        44: -63, 45: -63, 46: -63, 47: -63, 48: -63, 49: -63, 50: -63, 51: -63, 52: -63, 53: -63,
+        54: -63, 55: -63, 56: -63, 57: -63, 58: -63, 59: -63, 60: -63, 61: -63, 62: -63, 63: -63,
+        64: -63, 65: -63}),
+    row({
+        1: -216, 4: -216, 5: -216, 7: -216, 8: -216, 10: -216, 12: -216, 13: -216, 15: -216, 17:
+        -216, 18: -216, 23: -216, 32: -216, 34: -216, 35: -216, 38: -216, 39: -216, 45: -216, 51:
+        -216, 55: -216, 56: -216, 57: -216, 58: -216, 60: -216, 65: -216}),
+    row({
+        0: -66, 1: -66, 2: -66, 3: -66, 4: -66, 5: -66, 7: -66, 8: -66, 9: -66, 10: -66, 11: -66,
+        14: -66, 15: -66, 16: -66, 17: -66, 18: -66, 19: -66, 20: -66, 21: -66, 22: -66, 23: -66,
+        24: -66, 25: -66, 26: -66, 27: -66, 28: -66, 29: -66, 30: -66, 31: -66, 32: -66, 33: -66,
+        34: -66, 35: -66, 36: -66, 37: -66, 38: -66, 39: -66, 40: -66, 41: -66, 42: -66, 43: -66,
+        44: -66, 45: -66, 46: -66, 47: -66, 48: -66, 49: -66, 50: -66, 51: -66, 52: -66, 53: -66,
+        54: -66, 55: -66, 56: -66, 57: -66, 58: -66, 59: -66, 60: -66, 61: -66, 62: -66, 63: -66,
+        64: -66, 65: -66}),
+    row({
+        1: -213, 4: -213, 5: -213, 7: -213, 8: -213, 10: -213, 12: -213, 13: -213, 15: -213, 17:
+        -213, 18: -213, 23: -213, 32: -213, 34: -213, 35: -213, 38: -213, 39: -213, 45: -213, 51:
+        -213, 55: -213, 56: -213, 57: -213, 58: -213, 60: -213, 65: -213}),
+    row({
+        0: -67, 1: -67, 2: -67, 3: -67, 4: -67, 5: -67, 7: -67, 8: -67, 9: -67, 10: -67, 11: -67,
+        14: -67, 15: -67, 16: -67, 17: -67, 18: -67, 19: -67, 20: -67, 21: -67, 22: -67, 23: -67,
+        24: -67, 25: -67, 26: -67, 27: -67, 28: -67, 29: -67, 30: -67, 31: -67, 32: -67, 33: -67,
+        34: -67, 35: -67, 36: -67, 37: -67, 38: -67, 39: -67, 40: -67, 41: -67, 42: -67, 43: -67,
+        44: -67, 45: -67, 46: -67, 47: -67, 48: -67, 49: -67, 50: -67, 51: -67, 52: -67, 53: -67,
+        54: -67, 55: -67, 56: -67, 57: -67, 58: -67, 59: -67, 60: -67, 61: -67, 62: -67, 63: -67,
+        64: -67, 65: -67}),
+    row({
+        0: -68, 1: -68, 2: -68, 3: -68, 4: -68, 5: -68, 7: -68, 8: -68, 9: -68, 10: -68, 11: -68,
+        14: -68, 15: -68, 16: -68, 17: -68, 18: -68, 19: -68, 20: -68, 21: -68, 22: -68, 23: -68,
+        24: -68, 25: -68, 26: -68, 27: -68, 28: -68, 29: -68, 30: -68, 31: -68, 32: -68, 33: -68,
+        34: -68, 35: -68, 36: -68, 37: -68, 38: -68, 39: -68, 40: -68, 41: -68, 42: -68, 43: -68,
+        44: -68, 45: -68, 46: -68, 47: -68, 48: -68, 49: -68, 50: -68, 51: -68, 52: -68, 53: -68,
+        54: -68, 55: -68, 56: -68, 57: -68, 58: -68, 59: -68, 60: -68, 61: -68, 62: -68, 63: -68,
+        64: -68, 65: -68}),
+    row({
+        1: -177, 4: -177, 5: -177, 7: -177, 8: -177, 10: -177, 12: -177, 13: -177, 15: -177, 17:
+        -177, 18: -177, 23: -177, 32: -177, 34: -177, 35: -177, 38: -177, 39: -177, 45: -177, 51:
+        -177, 55: -177, 56: -177, 57: -177, 58: -177, 60: -177, 65: -177}),
+    row({
+        0: -69, 1: -69, 2: -69, 3: -69, 4: -69, 5: -69, 7: -69, 8: -69, 9: -69, 10: -69, 11: -69,
+        14: -69, 15: -69, 16: -69, 17: -69, 18: -69, 19: -69, 20: -69, 21: -69, 22: -69, 23: -69,
+        24: -69, 25: -69, 26: -69, 27: -69, 28: -69, 29: -69, 30: -69, 31: -69, 32: -69, 33: -69,
+        34: -69, 35: -69, 36: -69, 37: -69, 38: -69, 39: -69, 40: -69, 41: -69, 42: -69, 43: -69,
+        44: -69, 45: -69, 46: -69, 47: -69, 48: -69, 49: -69, 50: -69, 51: -69, 52: -69, 53: -69,
+        54: -69, 55: -69, 56: -69, 57: -69, 58: -69, 59: -69, 60: -69, 61: -69, 62: -69, 63: -69,
+        64: -69, 65: -69}),
+    row({
+        1: -186, 4: -186, 5: -186, 7: -186, 8: -186, 10: -186, 12: -186, 13: -186, 15: -186, 17:
+        -186, 18: -186, 23: -186, 32: -186, 34: -186, 35: -186, 38: -186, 39: -186, 45: -186, 51:
+        -186, 55: -186, 56: -186, 57: -186, 58: -186, 60: -186, 65: -186}),
+    row({
+        0: -70, 1: -70, 2: -70, 3: -70, 4: -70, 5: -70, 7: -70, 8: -70, 9: -70, 10: -70, 11: -70,
+        14: -70, 15: -70, 16: -70, 17: -70, 18: -70, 19: -70, 20: -70, 21: -70, 22: -70, 23: -70,
+        24: -70, 25: -70, 26: -70, 27: -70, 28: -70, 29: -70, 30: -70, 31: -70, 32: -70, 33: -70,
+        34: -70, 35: -70, 36: -70, 37: -70, 38: -70, 39: -70, 40: -70, 41: -70, 42: -70, 43: -70,
+        44: -70, 45: -70, 46: -70, 47: -70, 48: -70, 49: -70, 50: -70, 51: -70, 52: -70, 53: -70,
+        54: -70, 55: -70, 56: -70, 57: -70, 58: -70, 59: -70, 60: -70, 61: -70, 62: -70, 63: -70,
+        64: -70, 65: -70}),
+    row({
+        1: -187, 4: -187, 5: -187, 7: -187, 8: -187, 10: -187, 12: -187, 13: -187, 15: -187, 17:
+        -187, 18: -187, 23: -187, 32: -187, 34: -187, 35: -187, 38: -187, 39: -187, 45: -187, 51:
+        -187, 55: -187, 56: -187, 57: -187, 58: -187, 60: -187, 65: -187}),
+    row({
+        0: -71, 1: -71, 2: -71, 3: -71, 4: -71, 5: -71, 7: -71, 8: -71, 9: -71, 10: -71, 11: -71,
+        14: -71, 15: -71, 16: -71, 17: -71, 18: -71, 19: -71, 20: -71, 21: -71, 22: -71, 23: -71,
+        24: -71, 25: -71, 26: -71, 27: -71, 28: -71, 29: -71, 30: -71, 31: -71, 32: -71, 33: -71,
+        34: -71, 35: -71, 36: -71, 37: -71, 38: -71, 39: -71, 40: -71, 41: -71, 42: -71, 43: -71,
+        44: -71, 45: -71, 46: -71, 47: -71, 48: -71, 49: -71, 50: -71, 51: -71, 52: -71, 53: -71,
+        54: -71, 55: -71, 56: -71, 57: -71, 58: -71, 59: -71, 60: -71, 61: -71, 62: -71, 63: -71,
+        64: -71, 65: -71}),
+    row({
+        1: -209, 4: -209, 5: -209, 7: -209, 8: -209, 10: -209, 12: -209, 13: -209, 15: -209, 17:
+        -209, 18: -209, 23: -209, 32: -209, 34: -209, 35: -209, 38: -209, 39: -209, 45: -209, 51:
+        -209, 55: -209, 56: -209, 57: -209, 58: -209, 60: -209, 65: -209}),
+    row({
+        0: -74, 1: -74, 2: -74, 3: -74, 4: -74, 5: -74, 7: -74, 8: -74, 9: -74, 10: -74, 11: -74,
+        14: -74, 15: -74, 16: -74, 17: -74, 18: -74, 19: -74, 20: -74, 21: -74, 22: -74, 23: -74,
+        24: -74, 25: -74, 26: -74, 27: -74, 28: -74, 29: -74, 30: -74, 31: -74, 32: -74, 33: -74,
+        34: -74, 35: -74, 36: -74, 37: -74, 38: -74, 39: -74, 40: -74, 41: -74, 42: -74, 43: -74,
+        44: -74, 45: -74, 46: -74, 47: -74, 48: -74, 49: -74, 50: -74, 51: -74, 52: -74, 53: -74,
+        54: -74, 55: -74, 56: -74, 57: -74, 58: -74, 59: -74, 60: -74, 61: -74, 62: -74, 63: -74,
+        64: -74, 65: -74}),
+    row({
+        1: -184, 4: -184, 5: -184, 7: -184, 8: -184, 10: -184, 12: -184, 13: -184, 15: -184, 17:
+        -184, 18: -184, 23: -184, 32: -184, 34: -184, 35: -184, 38: -184, 39: -184, 45: -184, 51:
+        -184, 55: -184, 56: -184, 57: -184, 58: -184, 60: -184, 65: -184}),
+    row({
+        0: -75, 1: -75, 2: -75, 3: -75, 4: -75, 5: -75, 7: -75, 8: -75, 9: -75, 10: -75, 11: -75,
+        14: -75, 15: -75, 16: -75, 17: -75, 18: -75, 19: -75, 20: -75, 21: -75, 22: -75, 23: -75,
+        24: -75, 25: -75, 26: -75, 27: -75, 28: -75, 29: -75, 30: -75, 31: -75, 32: -75, 33: -75,
+        34: -75, 35: -75, 36: -75, 37: -75, 38: -75, 39: -75, 40: -75, 41: -75, 42: -75, 43: -75,
+        44: -75, 45: -75, 46: -75, 47: -75, 48: -75, 49: -75, 50: -75, 51: -75, 52: -75, 53: -75,
+        54: -75, 55: -75, 56: -75, 57: -75, 58: -75, 59: -75, 60: -75, 61: -75, 62: -75, 63: -75,
+        64: -75, 65: -75}),
+    row({
+        1: -183, 4: -183, 5: -183, 7: -183, 8: -183, 10: -183, 12: -183, 13: -183, 15: -183, 17:
+        -183, 18: -183, 23: -183, 32: -183, 34: -183, 35: -183, 38: -183, 39: -183, 45: -183, 51:
+        -183, 55: -183, 56: -183, 57: -183, 58: -183, 60: -183, 65: -183}),
+    row({
+        0: -8, 1: -8, 2: -8, 3: -8, 4: -8, 5: -8, 7: -8, 8: -8, 9: -8, 10: -8, 11: -8, 14: -8, 15:
+        -8, 16: -8, 17: -8, 18: -8, 19: -8, 20: -8, 21: -8, 22: 151, 23: -8, 24: -8, 25: -8, 26: -8,
+        27: -8, 28: -8, 29: -8, 30: -8, 31: -8, 32: -8, 33: -8, 34: -8, 35: -8, 36: -8, 37: -8, 38:
+        -8, 39: -8, 40: -8, 41: -8, 42: -8, 43: -8, 44: -8, 45: -8, 46: -8, 47: -8, 48: -8, 49: -8,
+        50: -8, 51: -8, 52: -8, 53: -8, 54: -8, 55: -8, 56: -8, 57: -8, 58: -8, 59: -8, 60: -8, 61:
+        150, 62: -8, 63: -8, 64: -8, 65: -8}),
+    row({
+        12: 7, 13: 8, 35: 53, 51: 58, 65: 127}),
+    row({
+        12: 7, 13: 8, 35: -34, 51: -34, 65: -34}),
+    row({
+        12: 7, 13: 8, 35: -35, 51: -35, 65: -35}),
+    row({
+        1: -194, 12: -194, 13: -194, 18: -194, 35: -194, 51: -194, 65: -194}),
+    row({
+        12: -195, 13: -195, 35: -195, 51: -195, 65: -195}),
+    row({
+        0: -94, 1: -94, 2: -94, 3: -94, 4: -94, 5: -94, 7: -94, 8: -94, 9: -94, 10: -94, 11: -94,
+        12: 7, 13: 8, 14: -94, 15: -94, 16: -94, 17: -94, 18: -94, 19: -94, 20: -94, 21: -94, 22:
+        -94, 23: -94, 24: -94, 25: -94, 26: -94, 27: -94, 28: -94, 29: -94, 30: -94, 31: -94, 32:
+        -94, 33: -94, 34: -94, 35: -94, 36: -94, 37: -94, 38: -94, 39: -94, 40: -94, 41: -94, 42:
+        -94, 43: -94, 44: -94, 45: -94, 46: -94, 47: -94, 48: -94, 49: -94, 50: -94, 51: -94, 52:
+        -94, 53: -94, 54: -94, 55: -94, 56: -94, 57: -94, 58: -94, 59: -94, 60: -94, 61: -94, 62:
+        -94, 63: -94, 64: -94, 65: -94}),
+    row({
+        1: -150, 4: -150, 5: -150, 7: -150, 8: -150, 10: -150, 12: -150, 13: -150, 15: -150, 17:
+        -150, 18: -150, 23: -150, 32: -150, 34: -150, 35: -150, 38: -150, 39: -150, 45: -150, 51:
+        -150, 55: -150, 56: -150, 57: -150, 58: -150, 60: -150, 65: -150}),
+    row({
+        0: -221, 1: -221, 2: -221, 3: -221, 4: -221, 5: -221, 7: -221, 8: -221, 9: -221, 10: -221,
+        11: -221, 12: -221, 13: -221, 14: -221, 15: -221, 16: -221, 17: -221, 18: -221, 19: -221,
+        20: -221, 21: -221, 22: -221, 23: -221, 24: -221, 25: -221, 26: -221, 27: -221, 28: -221,
+        29: -221, 30: -221, 31: -221, 32: -221, 33: -221, 34: -221, 35: -221, 36: -221, 37: -221,
+        38: -221, 39: -221, 40: -221, 41: -221, 42: -221, 43: -221, 44: -221, 45: -221, 46: -221,
+        47: -221, 48: -221, 49: -221, 50: -221, 51: -221, 52: -221, 53: -221, 54: -221, 55: -221,
+        56: -221, 57: -221, 58: -221, 59: -221, 60: -221, 61: -221, 62: -221, 63: -221, 64: -221,
+        65: -221}),
+    row({
+        0: -96, 1: -96, 2: -96, 3: -96, 4: -96, 5: -96, 7: -96, 8: -96, 9: -96, 10: -96, 11: -96,
+        12: 7, 13: 8, 14: -96, 15: -96, 16: -96, 17: -96, 18: -96, 19: -96, 20: -96, 21: -96, 22:
+        -96, 23: -96, 24: -96, 25: -96, 26: -96, 27: -96, 28: -96, 29: -96, 30: -96, 31: -96, 32:
+        -96, 33: -96, 34: -96, 35: -96, 36: -96, 37: -96, 38: -96, 39: -96, 40: -96, 41: -96, 42:
+        -96, 43: -96, 44: -96, 45: -96, 46: -96, 47: -96, 48: -96, 49: -96, 50: -96, 51: -96, 52:
+        -96, 53: -96, 54: -96, 55: -96, 56: -96, 57: -96, 58: -96, 59: -96, 60: -96, 61: -96, 62:
+        -96, 63: -96, 64: -96, 65: -96}),
+    row({
+        0: -219, 1: -219, 2: -219, 3: -219, 4: -219, 5: -219, 7: -219, 8: -219, 9: -219, 10: -219,
+        11: -219, 12: -219, 13: -219, 14: -219, 15: -219, 16: -219, 17: -219, 18: -219, 19: -219,
+        20: -219, 21: -219, 22: -219, 23: -219, 24: -219, 25: -219, 26: -219, 27: -219, 28: -219,
+        29: -219, 30: -219, 31: -219, 32: -219, 33: -219, 34: -219, 35: -219, 36: -219, 37: -219,
+        38: -219, 39: -219, 40: -219, 41: -219, 42: -219, 43: -219, 44: -219, 45: -219, 46: -219,
+        47: -219, 48: -219, 49: -219, 50: -219, 51: -219, 52: -219, 53: -219, 54: -219, 55: -219,
+        56: -219, 57: -219, 58: -219, 59: -219, 60: -219, 61: -219, 62: -219, 63: -219, 64: -219,
+        65: -219}),
+    row({
+        0: -97, 1: -97, 2: -97, 3: -97, 4: -97, 5: -97, 7: -97, 8: -97, 9: -97, 10: -97, 11: -97,
+        12: 7, 13: 8, 14: -97, 15: -97, 16: -97, 17: -97, 18: -97, 19: -97, 20: -97, 21: -97, 22:
+        -97, 23: -97, 24: -97, 25: -97, 26: -97, 27: -97, 28: -97, 29: -97, 30: -97, 31: -97, 32:
+        -97, 33: -97, 34: -97, 35: -97, 36: -97, 37: -97, 38: -97, 39: -97, 40: -97, 41: -97, 42:
+        -97, 43: -97, 44: -97, 45: -97, 46: -97, 47: -97, 48: -97, 49: -97, 50: -97, 51: -97, 52:
+        -97, 53: -97, 54: -97, 55: -97, 56: -97, 57: -97, 58: -97, 59: -97, 60: -97, 61: -97, 62:
+        -97, 63: -97, 64: -97, 65: -97}),
+    row({
+        0: -9, 1: -9, 2: -9, 3: -9, 4: -9, 5: -9, 7: -9, 8: -9, 9: -9, 10: -9, 11: -9, 12: 7, 13: 8,
+        14: -9, 15: -9, 16: -9, 17: -9, 18: -9, 19: -9, 20: -9, 21: -9, 22: -9, 23: -9, 24: -9, 25:
+        -9, 26: -9, 27: -9, 28: -9, 29: -9, 30: -9, 31: -9, 32: -9, 33: -9, 34: -9, 35: -9, 36: -9,
+        37: -9, 38: -9, 39: -9, 40: -9, 41: -9, 42: -9, 43: -9, 44: -9, 45: -9, 46: -9, 47: -9, 48:
+        -9, 49: -9, 50: -9, 51: -9, 52: -9, 53: -9, 54: -9, 55: -9, 56: -9, 57: -9, 58: -9, 59: -9,
+        60: -9, 61: -9, 62: -9, 63: -9, 64: -9, 65: -9}),
+    row({
+        0: -52, 1: -52, 2: -52, 3: -52, 4: -52, 5: -52, 7: -52, 8: -52, 9: -52, 10: -52, 11: -52,
+        12: 7, 13: 8, 14: -52, 15: -52, 16: -52, 17: -52, 18: -52, 19: -52, 20: -52, 21: -52, 22:
+        -52, 23: -52, 24: -52, 25: -52, 26: -52, 27: -52, 28: -52, 29: -52, 30: -52, 31: -52, 32:
+        -52, 33: -52, 34: -52, 35: -52, 36: -52, 37: -52, 38: -52, 39: -52, 40: -52, 41: -52, 42:
+        -52, 43: -52, 44: -52, 45: -52, 46: -52, 47: -52, 48: -52, 49: -52, 50: -52, 51: -52, 52:
+        -52, 53: -52, 54: -52, 55: -52, 56: -52, 57: -52, 58: -52, 59: -52, 60: -52, 61: -52, 62:
+        -52, 63: -52, 64: -52, 65: -52}),
+    row({
+        0: -120, 1: -120, 2: -120, 3: -120, 4: -120, 5: -120, 7: -120, 8: -120, 9: -120, 10: -120,
+        11: -120, 12: -120, 13: -120, 14: -120, 15: -120, 16: -120, 17: -120, 18: -120, 19: -120,
+        20: -120, 21: -120, 22: -120, 23: -120, 24: -120, 25: -120, 26: -120, 27: -120, 28: -120,
+        29: -120, 30: -120, 31: -120, 32: -120, 33: -120, 34: -120, 35: -120, 36: -120, 37: -120,
+        38: -120, 39: -120, 40: -120, 41: -120, 42: -120, 43: -120, 44: -120, 45: -120, 46: -120,
+        47: -120, 48: -120, 49: -120, 50: -120, 51: -120, 52: -120, 53: -120, 54: -120, 55: -120,
+        56: -120, 57: -120, 58: -120, 59: -120, 60: -120, 61: -120, 62: -120, 63: -120, 64: -120,
+        65: -120}),
+    row({
+        21: -53}),
+    row({
+        59: 285}),
+    row({
+        1: -179, 4: -179, 5: -179, 7: -179, 8: -179, 10: -179, 12: -179, 13: -179, 15: -179, 17:
+        -179, 18: -179, 23: -179, 32: -179, 34: -179, 35: -179, 38: -179, 39: -179, 45: -179, 51:
+        -179, 55: -179, 56: -179, 57: -179, 58: -179, 60: -179, 65: -179}),
+    row({
+        20: -56, 21: -56, 62: -56}),
+    row({
+        1: -181, 4: -181, 5: -181, 7: -181, 8: -181, 10: -181, 12: -181, 13: -181, 15: -181, 17:
+        -181, 18: -181, 23: -181, 32: -181, 34: -181, 35: -181, 38: -181, 39: -181, 45: -181, 51:
+        -181, 55: -181, 56: -181, 57: -181, 58: -181, 60: -181, 65: -181}),
+    row({
+        0: -17, 1: -17, 2: -17, 3: -17, 4: -17, 5: -17, 7: -17, 8: -17, 9: -17, 10: -17, 11: -17,
+        14: -17, 15: -17, 16: -17, 17: -17, 18: -17, 19: -17, 20: -17, 21: -17, 22: -17, 23: -17,
+        24: -17, 25: -17, 26: -17, 27: -17, 28: -17, 29: -17, 30: -17, 31: -17, 32: -17, 33: -17,
+        34: -17, 35: -17, 36: -17, 37: -17, 38: -17, 39: -17, 40: -17, 41: -17, 42: -17, 43: -17,
+        44: -17, 45: -17, 46: -17, 47: -17, 48: -17, 49: -17, 50: -17, 51: -17, 52: -17, 53: -17,
+        54: -17, 55: -17, 56: -17, 57: -17, 58: -17, 59: -17, 60: -17, 61: -17, 62: -17, 63: -17,
+        64: -17, 65: -17}),
+    row({
+        9: 70, 19: 71, 26: 68, 43: 69, 46: 73, 50: 163, 54: 72}),
+    row({
+        9: -59, 19: -59, 26: -59, 43: -59, 46: -59, 50: -59, 54: -59}),
+    row({
+        9: -60, 19: -60, 26: -60, 43: -60, 46: -60, 50: -60, 54: -60}),
+    row({
+        0: -27, 1: -27, 2: -27, 3: -27, 4: -27, 5: -27, 7: -27, 8: -27, 9: -27, 10: -27, 11: -27,
+        14: -27, 15: -27, 16: -27, 17: -27, 18: -27, 19: -27, 20: -27, 21: -27, 22: -27, 23: -27,
+        24: -27, 25: -27, 26: -27, 27: -27, 28: -27, 29: -27, 30: -27, 31: -27, 32: -27, 33: -27,
+        34: -27, 35: -27, 36: -27, 37: -27, 38: -27, 39: -27, 40: -27, 41: -27, 42: -27, 43: -27,
+        44: -27, 45: -27, 46: -27, 47: -27, 48: -27, 49: -27, 50: -27, 51: -27, 52: -27, 53: -27,
+        54: -27, 55: -27, 56: -27, 57: -27, 58: -27, 59: -27, 60: -27, 61: -27, 62: -27, 63: -27,
+        64: -27, 65: -27}),
+    row({
+        1: -168, 4: -168, 5: -168, 7: -168, 8: -168, 10: -168, 12: -168, 13: -168, 15: -168, 17:
+        -168, 18: -168, 23: -168, 32: -168, 34: -168, 35: -168, 38: -168, 39: -168, 45: -168, 51:
+        -168, 55: -168, 56: -168, 57: -168, 58: -168, 60: -168, 65: -168}),
+    row({
+        0: -28, 1: -28, 2: -28, 3: -28, 4: -28, 5: -28, 7: -28, 8: -28, 9: -28, 10: -28, 11: -28,
+        14: -28, 15: -28, 16: -28, 17: -28, 18: -28, 19: -28, 20: -28, 21: -28, 22: -28, 23: -28,
+        24: -28, 25: -28, 26: -28, 27: -28, 28: -28, 29: -28, 30: -28, 31: -28, 32: -28, 33: -28,
+        34: -28, 35: -28, 36: -28, 37: -28, 38: -28, 39: -28, 40: -28, 41: -28, 42: -28, 43: -28,
+        44: -28, 45: -28, 46: -28, 47: -28, 48: -28, 49: -28, 50: -28, 51: -28, 52: -28, 53: -28,
+        54: -28, 55: -28, 56: -28, 57: -28, 58: -28, 59: -28, 60: -28, 61: -28, 62: -28, 63: -28,
+        64: -28, 65: -28}),
+    row({
+        0: -29, 1: -29, 2: -29, 3: -29, 4: -29, 5: -29, 7: -29, 8: -29, 9: -29, 10: -29, 11: -29,
+        14: -29, 15: -29, 16: -29, 17: -29, 18: -29, 19: -29, 20: -29, 21: -29, 22: -29, 23: -29,
+        24: -29, 25: -29, 26: -29, 27: -29, 28: -29, 29: -29, 30: -29, 31: -29, 32: -29, 33: -29,
+        34: -29, 35: -29, 36: -29, 37: -29, 38: -29, 39: -29, 40: -29, 41: -29, 42: -29, 43: -29,
+        44: -29, 45: -29, 46: -29, 47: -29, 48: -29, 49: -29, 50: -29, 51: -29, 52: -29, 53: -29,
+        54: -29, 55: -29, 56: -29, 57: -29, 58: -29, 59: -29, 60: -29, 61: -29, 62: -29, 63: -29,
+        64: -29, 65: -29}),
+    row({
+        0: -30, 1: -30, 2: -30, 3: -30, 4: -30, 5: -30, 7: -30, 8: -30, 9: -30, 10: -30, 11: -30,
+        14: -30, 15: -30, 16: -30, 17: -30, 18: -30, 19: -30, 20: -30, 21: -30, 22: -30, 23: -30,
+        24: -30, 25: -30, 26: -30, 27: -30, 28: -30, 29: -30, 30: -30, 31: -30, 32: -30, 33: -30,
+        34: -30, 35: -30, 36: -30, 37: -30, 38: -30, 39: -30, 40: -30, 41: -30, 42: -30, 43: -30,
+        44: -30, 45: -30, 46: -30, 47: -30, 48: -30, 49: -30, 50: -30, 51: -30, 52: -30, 53: -30,
+        54: -30, 55: -30, 56: -30, 57: -30, 58: -30, 59: -30, 60: -30, 61: -30, 62: -30, 63: -30,
+        64: -30, 65: -30}),
+    row({
+        0: -31, 1: -31, 2: -31, 3: -31, 4: -31, 5: -31, 7: -31, 8: -31, 9: -31, 10: -31, 11: -31,
+        14: -31, 15: -31, 16: -31, 17: -31, 18: -31, 19: -31, 20: -31, 21: -31, 22: -31, 23: -31,
+        24: -31, 25: -31, 26: -31, 27: -31, 28: -31, 29: -31, 30: -31, 31: -31, 32: -31, 33: -31,
+        34: -31, 35: -31, 36: -31, 37: -31, 38: -31, 39: -31, 40: -31, 41: -31, 42: -31, 43: -31,
+        44: -31, 45: -31, 46: -31, 47: -31, 48: -31, 49: -31, 50: -31, 51: -31, 52: -31, 53: -31,
+        54: -31, 55: -31, 56: -31, 57: -31, 58: -31, 59: -31, 60: -31, 61: -31, 62: -31, 63: -31,
+        64: -31, 65: -31}),
+    row({
+        0: -32, 1: -32, 2: -32, 3: -32, 4: -32, 5: -32, 7: -32, 8: -32, 9: -32, 10: -32, 11: -32,
+        14: -32, 15: -32, 16: -32, 17: -32, 18: -32, 19: -32, 20: -32, 21: -32, 22: -32, 23: -32,
+        24: -32, 25: -32, 26: -32, 27: -32, 28: -32, 29: -32, 30: -32, 31: -32, 32: -32, 33: -32,
+        34: -32, 35: -32, 36: -32, 37: -32, 38: -32, 39: -32, 40: -32, 41: -32, 42: -32, 43: -32,
+        44: -32, 45: -32, 46: -32, 47: -32, 48: -32, 49: -32, 50: -32, 51: -32, 52: -32, 53: -32,
+        54: -32, 55: -32, 56: -32, 57: -32, 58: -32, 59: -32, 60: -32, 61: -32, 62: -32, 63: -32,
+        64: -32, 65: -32}),
+    row({
+        1: -138, 4: -138, 5: -138, 7: -138, 8: -138, 10: -138, 12: -138, 13: -138, 15: -138, 17:
+        -138, 18: -138, 23: -138, 32: -138, 34: -138, 35: -138, 38: -138, 39: -138, 45: -138, 51:
+        -138, 55: -138, 56: -138, 57: -138, 58: -138, 60: -138, 65: -138}),
+    row({
+        0: -72, 1: -72, 2: -72, 3: -72, 4: -72, 5: -72, 7: -72, 8: -72, 9: -72, 10: -72, 11: -72,
+        14: -72, 15: -72, 16: -72, 17: -72, 18: -72, 19: -72, 20: -72, 21: -72, 22: -72, 23: -72,
+        24: -72, 25: -72, 26: -72, 27: -72, 28: -72, 29: -72, 30: -72, 31: -72, 32: -72, 33: -72,
+        34: -72, 35: -72, 36: -72, 37: -72, 38: -72, 39: -72, 40: -72, 41: -72, 42: -72, 43: -72,
+        44: -72, 45: -72, 46: -72, 47: -72, 48: -72, 49: -72, 50: -72, 51: -72, 52: -72, 53: -72,
+        54: -72, 55: -72, 56: -72, 57: -72, 58: -72, 59: -72, 60: -72, 61: -72, 62: -72, 63: -72,
+        64: -72, 65: -72}),
+    row({
+        22: 151, 50: 163, 61: 150}),
+    row({
+        0: -99, 1: -99, 2: -99, 3: -99, 4: -99, 5: -99, 7: -99, 8: -99, 9: -99, 10: -99, 11: -99,
+        14: -99, 15: -99, 16: -99, 17: -99, 18: -99, 19: -99, 20: -99, 21: -99, 22: -99, 23: -99,
+        24: -99, 25: -99, 26: -99, 27: -99, 28: -99, 29: -99, 30: -99, 31: -99, 32: -99, 33: -99,
+        34: -99, 35: -99, 36: -99, 37: -99, 38: -99, 39: -99, 40: -99, 41: -99, 42: -99, 43: -99,
+        44: -99, 45: -99, 46: -99, 47: -99, 48: -99, 49: -99, 50: -99, 51: -99, 52: -99, 53: -99,
+        54: -99, 55: -99, 56: -99, 57: -99, 58: -99, 59: -99, 60: -99, 61: -99, 62: -99, 63: -99,
+        64: -99, 65: -99}),
+    row({
+        1: -212, 4: -212, 5: -212, 7: -212, 8: -212, 10: -212, 12: -212, 13: -212, 15: -212, 17:
+        -212, 18: -212, 23: -212, 32: -212, 34: -212, 35: -212, 38: -212, 39: -212, 45: -212, 51:
+        -212, 55: -212, 56: -212, 57: -212, 58: -212, 60: -212, 65: -212}),
+    row({
+        0: -182, 1: -182, 2: -182, 3: -182, 4: -182, 5: -182, 7: -182, 8: -182, 9: -182, 10: -182,
+        11: -182, 12: -182, 13: -182, 14: -182, 15: -182, 16: -182, 17: -182, 18: -182, 19: -182,
+        20: -182, 21: -182, 22: -182, 23: -182, 24: -182, 25: -182, 26: -182, 27: -182, 28: -182,
+        29: -182, 30: -182, 31: -182, 32: -182, 33: -182, 34: -182, 35: -182, 36: -182, 37: -182,
+        38: -182, 39: -182, 40: -182, 41: -182, 42: -182, 43: -182, 44: -182, 45: -182, 46: -182,
+        47: -182, 48: -182, 49: -182, 50: -182, 51: -182, 52: -182, 53: -182, 54: -182, 55: -182,
+        56: -182, 57: -182, 58: -182, 59: -182, 60: -182, 61: -182, 62: -182, 63: -182, 64: -182,
+        65: -182}),
+    row({
+        1: -118, 4: -118, 5: -118, 7: -118, 8: -118, 10: -118, 12: -118, 13: -118, 15: -118, 17:
+        -118, 18: -118, 23: -118, 32: -118, 34: -118, 35: -118, 38: -118, 39: -118, 45: -118, 51:
+        -118, 55: -118, 56: -118, 57: -118, 58: -118, 60: -118, 65: -118}),
+    row({
+        0: -57, 1: -57, 2: -57, 3: -57, 4: -57, 5: -57, 7: -57, 8: -57, 9: -57, 10: -57, 11: -57,
+        12: 7, 13: 8, 14: -57, 15: -57, 16: -57, 17: -57, 18: -57, 19: -57, 20: -57, 21: -57, 22:
+        -57, 23: -57, 24: -57, 25: -57, 26: -57, 27: -57, 28: -57, 29: -57, 30: -57, 31: -57, 32:
+        -57, 33: -57, 34: -57, 35: -57, 36: -57, 37: -57, 38: -57, 39: -57, 40: -57, 41: -57, 42:
+        -57, 43: -57, 44: -57, 45: -57, 46: -57, 47: -57, 48: -57, 49: -57, 50: -57, 51: -57, 52:
+        -57, 53: -57, 54: -57, 55: -57, 56: -57, 57: -57, 58: -57, 59: -57, 60: -57, 61: -57, 62:
+        -57, 63: -57, 64: -57, 65: -57}),
+    row({
+        9: -58, 19: -58, 26: -58, 43: -58, 46: -58, 50: -58, 54: -58}),
+    row({
+        0: -15, 1: -15, 2: -15, 3: -15, 4: -15, 5: -15, 7: -15, 8: -15, 9: -15, 10: -15, 11: -15,
+        14: -15, 15: -15, 16: -15, 17: -15, 18: -15, 19: -15, 20: -15, 21: -15, 22: -15, 23: -15,
+        24: -15, 25: -15, 26: -15, 27: -15, 28: -15, 29: -15, 30: -15, 31: -15, 32: -15, 33: -15,
+        34: -15, 35: -15, 36: -15, 37: -15, 38: -15, 39: -15, 40: -15, 41: -15, 42: -15, 43: -15,
+        44: -15, 45: -15, 46: -15, 47: -15, 48: -15, 49: -15, 50: -15, 51: -15, 52: -15, 53: -15,
+        54: -15, 55: -15, 56: -15, 57: -15, 58: -15, 59: -15, 60: -15, 61: -15, 62: -15, 63: -15,
+        64: -15, 65: -15}),
+    row({
+        0: -38, 1: -38, 2: -38, 3: -38, 4: -38, 5: -38, 7: -38, 8: -38, 9: -38, 10: -38, 11: 251,
+        14: -38, 15: -38, 16: -38, 17: -38, 18: -38, 19: -38, 20: -38, 21: -38, 22: -38, 23: -38,
+        24: -38, 25: -38, 26: -38, 27: -38, 28: -38, 29: -38, 30: -38, 31: -38, 32: -38, 33: -38,
+        34: -38, 35: -38, 36: -38, 37: -38, 38: -38, 39: -38, 40: -38, 41: -38, 42: -38, 43: -38,
+        44: -38, 45: -38, 46: -38, 47: -38, 48: -38, 49: -38, 50: -38, 51: -38, 52: -38, 53: -38,
+        54: -38, 55: -38, 56: -38, 57: -38, 58: -38, 59: -38, 60: -38, 61: -38, 62: -38, 63: -38,
+        64: -38, 65: -38}),
+    row({
+        1: -200, 4: -200, 5: -200, 7: -200, 8: -200, 10: -200, 12: -200, 13: -200, 15: -200, 17:
+        -200, 18: -200, 23: -200, 32: -200, 34: -200, 35: -200, 38: -200, 39: -200, 45: -200, 51:
+        -200, 55: -200, 56: -200, 57: -200, 58: -200, 60: -200, 65: -200}),
+    row({
+        20: -55, 21: -55, 62: -55}),
+    row({
+        1: -180, 4: -180, 5: -180, 7: -180, 8: -180, 10: -180, 12: -180, 13: -180, 15: -180, 17:
+        -180, 18: -180, 23: -180, 32: -180, 34: -180, 35: -180, 38: -180, 39: -180, 45: -180, 51:
+        -180, 55: -180, 56: -180, 57: -180, 58: -180, 60: -180, 65: -180})
+]
+
+ACTION = tuple(ROWS[i] for i in (
+    0, 1, 2, 3, 0, 4, 5, 6, 7, 8, 9, 10, 9, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24,
+    25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48,
+    49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 60, 60, 60, 60, 60, 61, 62, 63, 64, 65, 66, 67,
+    68, 69, 70, 70, 70, 70, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87,
+    88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 9, 9, 98, 9, 9, 9, 9, 99, 9, 9, 100, 101, 102, 103, 104,
+    105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123,
+    124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 29, 138, 139, 140, 141,
+    142, 143, 144, 145, 146, 9, 9, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159,
+    160, 161, 162, 163, 70, 164, 165, 70, 166, 70, 167, 70, 168, 70, 169, 70, 170, 171, 172, 173,
+    174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192,
+    193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 9, 210,
+    211, 212, 213, 214, 215, 216, 217, 218, 219, 220, 9, 221, 222, 29, 223, 224, 225, 226, 227, 228,
+    229, 230, 231, 232, 233, 234, 235, 236, 237, 9, 238, 239, 240, 241, 242, 243, 244, 9, 245, 246,
+    247, 248, 249, 250, 9, 251, 252, 253, 254, 255, 256, 257, 258))
+
+DEFAULT = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, -50, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, -53, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None)
+
+GOTO_additional_block = {
+    50: 172, 75: 172, 76: 172, 172: 172}
+
+GOTO_additional_block_list = {
+    50: 171, 75: 199, 76: 200, 172: 265}
+
+GOTO_all = {
+    0: 18, 4: 18, 9: 18, 10: 18, 12: 18, 30: 18, 31: 18, 55: 18, 57: 183, 77: 18, 78: 18, 79: 18,
+    80: 18, 81: 18, 82: 18, 109: 18, 110: 18, 111: 18, 112: 18, 113: 18, 114: 18, 115: 18, 116: 18,
+    117: 18, 118: 18, 148: 245, 157: 18, 167: 18, 168: 18, 186: 18, 189: 18, 191: 18, 193: 18, 195:
+    18, 197: 18, 238: 18, 250: 18, 253: 18, 269: 18, 277: 18, 284: 18}
+
+GOTO_and = {
+    9: 117}
+
+GOTO_as = {
+    9: 112}
+
+GOTO_asc = {
+    0: 25, 4: 25, 9: 25, 10: 25, 12: 25, 30: 25, 31: 25, 55: 25, 77: 25, 78: 25, 79: 25, 80: 25, 81:
+    25, 82: 25, 109: 25, 110: 25, 111: 25, 112: 25, 113: 25, 114: 25, 115: 25, 116: 25, 117: 25,
+    118: 25, 157: 25, 167: 25, 168: 25, 186: 25, 189: 25, 191: 25, 193: 25, 195: 25, 197: 25, 238:
+    25, 250: 25, 253: 25, 269: 25, 277: 25, 284: 25}
+
+GOTO_between = {
+    0: 12, 4: 12, 9: 12, 10: 12, 12: 12, 30: 12, 31: 12, 55: 12, 77: 12, 78: 12, 79: 12, 80: 12, 81:
+    12, 82: 12, 109: 12, 110: 12, 111: 12, 112: 12, 113: 12, 114: 12, 115: 12, 116: 12, 117: 12,
+    118: 12, 157: 12, 167: 12, 168: 12, 186: 12, 189: 12, 191: 12, 193: 12, 195: 12, 197: 12, 238:
+    12, 250: 12, 253: 12, 269: 12, 277: 12, 284: 12}
+
+GOTO_by = {
+    62: 186, 63: 189, 64: 191, 65: 193, 66: 195, 67: 197}
+
+GOTO_by_block = {
+    3: 61, 50: 174, 75: 174, 76: 174, 172: 174, 176: 268, 266: 268}
+
+GOTO_case = {
+    0: 49, 4: 49, 9: 49, 10: 49, 12: 49, 30: 49, 31: 49, 55: 49, 77: 49, 78: 49, 79: 49, 80: 49, 81:
+    49, 82: 49, 109: 49, 110: 49, 111: 49, 112: 49, 113: 49, 114: 49, 115: 49, 116: 49, 117: 49,
+    118: 49, 157: 49, 167: 49, 168: 49, 186: 49, 189: 49, 191: 49, 193: 49, 195: 49, 197: 49, 238:
+    49, 250: 49, 253: 49, 269: 49, 277: 49, 284: 49}
+
+GOTO_case_when = {
+    0: 27, 4: 27, 9: 27, 10: 27, 12: 27, 30: 27, 31: 27, 55: 27, 77: 27, 78: 27, 79: 27, 80: 27, 81:
+    27, 82: 27, 109: 27, 110: 27, 111: 27, 112: 27, 113: 27, 114: 27, 115: 27, 116: 27, 117: 27,
+    118: 27, 157: 27, 167: 27, 168: 27, 186: 27, 189: 27, 191: 27, 193: 27, 195: 27, 197: 27, 238:
+    27, 250: 27, 253: 27, 269: 27, 277: 27, 284: 27}
+
+GOTO_case_when_clause = {
+    49: 166, 166: 166}
+
+GOTO_case_when_clause_list = {
+    49: 164, 166: 260}
+
+GOTO_cast = {
+    0: 23, 4: 23, 9: 23, 10: 23, 12: 23, 30: 23, 31: 23, 55: 23, 77: 23, 78: 23, 79: 23, 80: 23, 81:
+    23, 82: 23, 109: 23, 110: 23, 111: 23, 112: 23, 113: 23, 114: 23, 115: 23, 116: 23, 117: 23,
+    118: 23, 157: 23, 167: 23, 168: 23, 186: 23, 189: 23, 191: 23, 193: 23, 195: 23, 197: 23, 238:
+    23, 250: 23, 253: 23, 269: 23, 277: 23, 284: 23}
+
+GOTO_clause = {
+    77: 201, 78: 205, 79: 207, 80: 209, 81: 211, 82: 213, 186: 270, 189: 272, 191: 273, 193: 274,
+    195: 275, 197: 276}
+
+GOTO_cluster = {
+    3: 64, 50: 64, 75: 64, 76: 64, 172: 64, 176: 64, 266: 64}
+
+GOTO_coalesce = {
+    0: 22, 4: 22, 9: 22, 10: 22, 12: 22, 30: 22, 31: 22, 55: 22, 77: 22, 78: 22, 79: 22, 80: 22, 81:
+    22, 82: 22, 109: 22, 110: 22, 111: 22, 112: 22, 113: 22, 114: 22, 115: 22, 116: 22, 117: 22,
+    118: 22, 157: 22, 167: 22, 168: 22, 186: 22, 189: 22, 191: 22, 193: 22, 195: 22, 197: 22, 238:
+    22, 250: 22, 253: 22, 269: 22, 277: 22, 284: 22}
+
+GOTO_combine_keyword = {
+    28: 147, 161: 147, 243: 147, 280: 147}
+
+GOTO_comma = {
+    152: 250, 160: 250, 178: 269, 203: 250, 289: 250}
+
+GOTO_comment = {
+    0: 4, 4: 4, 10: 129, 11: 130, 12: 132, 13: 133, 14: 134, 15: 135, 16: 136, 17: 137, 18: 138, 19:
+    139, 20: 140, 21: 141, 22: 142, 23: 143, 24: 144, 25: 145, 26: 146, 30: 154, 31: 162, 49: 165,
+    51: 177, 57: 184, 59: 185, 62: 187, 63: 190, 64: 192, 65: 194, 66: 196, 67: 198, 77: 202, 78:
+    206, 79: 208, 80: 210, 81: 212, 89: 215, 92: 217, 93: 218, 94: 219, 95: 220, 96: 221, 97: 222,
+    98: 223, 99: 224, 109: 226, 110: 228, 111: 130, 112: 231, 113: 233, 114: 235, 115: 237, 116:
+    129, 117: 240, 118: 242, 148: 247, 149: 248, 153: 252, 157: 162, 159: 255, 167: 262, 168: 264,
+    176: 162, 182: 137, 183: 138, 186: 271, 189: 271, 191: 271, 193: 271, 195: 271, 197: 271, 214:
+    215, 238: 235, 244: 162, 245: 138, 246: 137, 249: 252, 250: 282, 253: 162, 254: 255, 256: 255,
+    257: 255, 258: 283, 269: 282, 277: 290, 284: 292, 286: 255}
+
+GOTO_comparison = {
+    9: 110}
+
+GOTO_concat = {
+    0: 24, 4: 24, 9: 24, 10: 24, 12: 24, 30: 24, 31: 24, 55: 24, 77: 24, 78: 24, 79: 24, 80: 24, 81:
+    24, 82: 24, 109: 24, 110: 24, 111: 24, 112: 24, 113: 24, 114: 24, 115: 24, 116: 24, 117: 24,
+    118: 24, 157: 24, 167: 24, 168: 24, 186: 24, 189: 24, 191: 24, 193: 24, 195: 24, 197: 24, 238:
+    24, 250: 24, 253: 24, 269: 24, 277: 24, 284: 24}
+
+GOTO_cross = {
+    5: 98, 50: 98, 75: 98, 76: 98, 90: 98, 127: 98, 172: 98, 180: 98, 204: 98}
+
+GOTO_desc = {
+    0: 26, 4: 26, 9: 26, 10: 26, 12: 26, 30: 26, 31: 26, 55: 26, 77: 26, 78: 26, 79: 26, 80: 26, 81:
+    26, 82: 26, 109: 26, 110: 26, 111: 26, 112: 26, 113: 26, 114: 26, 115: 26, 116: 26, 117: 26,
+    118: 26, 157: 26, 167: 26, 168: 26, 186: 26, 189: 26, 191: 26, 193: 26, 195: 26, 197: 26, 238:
+    26, 250: 26, 253: 26, 269: 26, 277: 26, 284: 26}
+
+GOTO_distinct = {
+    0: 17, 4: 17, 9: 17, 10: 17, 12: 17, 30: 17, 31: 17, 55: 17, 57: 182, 77: 17, 78: 17, 79: 17,
+    80: 17, 81: 17, 82: 17, 109: 17, 110: 17, 111: 17, 112: 17, 113: 17, 114: 17, 115: 17, 116: 17,
+    117: 17, 118: 17, 148: 246, 157: 17, 167: 17, 168: 17, 186: 17, 189: 17, 191: 17, 193: 17, 195:
+    17, 197: 17, 238: 17, 250: 17, 253: 17, 269: 17, 277: 17, 284: 17}
+
+GOTO_distribute = {
+    3: 65, 50: 65, 75: 65, 76: 65, 172: 65, 176: 65, 266: 65}
+
+GOTO_else = {
+    49: 168, 166: 168}
+
+GOTO_end = {
+    164: 258}
+
+GOTO_except = {
+    28: 149, 161: 149, 243: 149, 280: 149}
+
+GOTO_expr = {
+    55: 179, 167: 261, 168: 263, 269: 288, 284: 291}
+
+GOTO_expr_definition = {
+    0: 9, 4: 9, 9: 9, 10: 9, 12: 9, 30: 9, 31: 9, 55: 9, 77: 9, 78: 9, 79: 9, 80: 9, 81: 9, 82: 9,
+    109: 9, 110: 9, 111: 9, 112: 9, 113: 9, 114: 9, 115: 9, 116: 9, 117: 9, 118: 9, 157: 9, 167: 9,
+    168: 9, 186: 9, 189: 9, 191: 9, 193: 9, 195: 9, 197: 9, 238: 9, 250: 9, 253: 9, 269: 9, 277: 9,
+    284: 9}
+
+GOTO_expr_definition_list = {
+    0: 6, 4: 6, 9: 108, 10: 128, 12: 131, 30: 155, 31: 158, 55: 181, 77: 155, 78: 155, 79: 155, 80:
+    155, 81: 155, 82: 155, 109: 225, 110: 227, 111: 229, 112: 230, 113: 232, 114: 234, 115: 236,
+    116: 128, 117: 239, 118: 241, 157: 158, 167: 181, 168: 181, 186: 155, 189: 155, 191: 155, 193:
+    155, 195: 155, 197: 155, 238: 279, 250: 281, 253: 158, 269: 181, 277: 155, 284: 181}
+
+GOTO_expr_list = {
+    30: 152, 31: 160, 77: 203, 78: 203, 79: 203, 80: 203, 81: 203, 82: 203, 157: 160, 186: 203, 189:
+    203, 191: 203, 193: 203, 195: 203, 197: 203, 253: 160, 277: 289}
+
+GOTO_false = {
+    0: 21, 4: 21, 9: 21, 10: 21, 12: 21, 30: 21, 31: 21, 55: 21, 77: 21, 78: 21, 79: 21, 80: 21, 81:
+    21, 82: 21, 109: 21, 110: 21, 111: 21, 112: 21, 113: 21, 114: 21, 115: 21, 116: 21, 117: 21,
+    118: 21, 157: 21, 167: 21, 168: 21, 186: 21, 189: 21, 191: 21, 193: 21, 195: 21, 197: 21, 238:
+    21, 250: 21, 253: 21, 269: 21, 277: 21, 284: 21}
+
+GOTO_formatted_query = {
+    0: 1}
+
+GOTO_from = {
+    5: 77, 50: 77, 75: 77, 76: 77, 127: 77, 172: 77, 180: 77, 204: 77}
+
+GOTO_full = {
+    5: 96, 50: 96, 75: 96, 76: 96, 90: 96, 127: 96, 172: 96, 180: 96, 204: 96}
+
+GOTO_group = {
+    3: 62, 50: 62, 75: 62, 76: 62, 172: 62, 176: 62, 266: 62}
+
+GOTO_having = {
+    5: 80, 50: 80, 75: 80, 76: 80, 127: 80, 172: 80, 180: 80, 204: 80}
+
+GOTO_in = {
+    9: 114, 116: 238}
+
+GOTO_inner = {
+    5: 92, 50: 92, 75: 92, 76: 92, 90: 92, 127: 92, 172: 92, 180: 92, 204: 92}
+
+GOTO_is = {
+    9: 113}
+
+GOTO_join = {
+    5: 89, 50: 89, 75: 89, 76: 89, 88: 214, 127: 89, 172: 89, 180: 89, 204: 89}
+
+GOTO_join_block = {
+    5: 76, 50: 175, 75: 175, 76: 175, 127: 76, 172: 175, 180: 76, 204: 76}
+
+GOTO_join_expression = {
+    5: 82, 50: 82, 75: 82, 76: 82, 127: 82, 172: 82, 180: 82, 204: 82}
+
+GOTO_join_prefix = {
+    5: 90, 50: 90, 75: 90, 76: 90, 90: 90, 127: 90, 172: 90, 180: 90, 204: 90}
+
+GOTO_join_prefix_list = {
+    5: 88, 50: 88, 75: 88, 76: 88, 90: 216, 127: 88, 172: 88, 180: 88, 204: 88}
+
+GOTO_keyword_block = {
+    5: 75, 50: 173, 75: 173, 76: 173, 127: 75, 172: 173, 180: 75, 204: 75}
+
+GOTO_label = {
+    0: 13, 4: 13, 9: 13, 10: 13, 12: 13, 30: 13, 31: 13, 55: 13, 77: 13, 78: 13, 79: 13, 80: 13, 81:
+    13, 82: 13, 109: 13, 110: 13, 111: 13, 112: 13, 113: 13, 114: 13, 115: 13, 116: 13, 117: 13,
+    118: 13, 157: 13, 167: 13, 168: 13, 186: 13, 189: 13, 191: 13, 193: 13, 195: 13, 197: 13, 238:
+    13, 250: 13, 253: 13, 269: 13, 277: 13, 284: 13}
+
+GOTO_left = {
+    5: 94, 50: 94, 75: 94, 76: 94, 90: 94, 127: 94, 172: 94, 180: 94, 204: 94}
+
+GOTO_left_bra = {
+    0: 30, 4: 30, 9: 30, 10: 30, 12: 30, 30: 30, 31: 30, 55: 30, 77: 30, 78: 30, 79: 30, 80: 30, 81:
+    30, 82: 30, 109: 30, 110: 30, 111: 30, 112: 30, 113: 30, 114: 30, 115: 30, 116: 30, 117: 30,
+    118: 30, 157: 30, 167: 30, 168: 30, 186: 30, 189: 30, 191: 30, 193: 30, 195: 30, 197: 30, 238:
+    30, 250: 30, 253: 30, 269: 30, 277: 30, 284: 30}
+
+GOTO_left_par = {
+    0: 31, 4: 31, 9: 31, 10: 31, 12: 31, 30: 31, 31: 157, 51: 176, 55: 31, 77: 31, 78: 31, 79: 31,
+    80: 31, 81: 31, 82: 31, 109: 31, 110: 31, 111: 31, 112: 31, 113: 31, 114: 31, 115: 31, 116: 31,
+    117: 31, 118: 31, 147: 244, 157: 253, 167: 31, 168: 31, 186: 31, 189: 31, 191: 31, 193: 31, 195:
+    31, 197: 31, 238: 31, 244: 244, 250: 31, 253: 253, 269: 31, 277: 31, 284: 31}
+
+GOTO_limit = {
+    5: 79, 50: 79, 75: 79, 76: 79, 127: 79, 172: 79, 180: 79, 204: 79}
+
+GOTO_natural = {
+    5: 99, 50: 99, 75: 99, 76: 99, 90: 99, 127: 99, 172: 99, 180: 99, 204: 99}
+
+GOTO_not = {
+    0: 10, 4: 10, 9: 116, 10: 10, 12: 10, 30: 10, 31: 10, 55: 10, 77: 10, 78: 10, 79: 10, 80: 10,
+    81: 10, 82: 10, 109: 10, 110: 10, 111: 10, 112: 10, 113: 10, 114: 10, 115: 10, 116: 10, 117: 10,
+    118: 10, 157: 10, 167: 10, 168: 10, 186: 10, 189: 10, 191: 10, 193: 10, 195: 10, 197: 10, 238:
+    10, 250: 10, 253: 10, 269: 10, 277: 10, 284: 10}
+
+GOTO_null = {
+    0: 19, 4: 19, 9: 19, 10: 19, 12: 19, 30: 19, 31: 19, 55: 19, 77: 19, 78: 19, 79: 19, 80: 19, 81:
+    19, 82: 19, 109: 19, 110: 19, 111: 19, 112: 19, 113: 19, 114: 19, 115: 19, 116: 19, 117: 19,
+    118: 19, 157: 19, 167: 19, 168: 19, 186: 19, 189: 19, 191: 19, 193: 19, 195: 19, 197: 19, 238:
+    19, 250: 19, 253: 19, 269: 19, 277: 19, 284: 19}
+
+GOTO_on = {
+    213: 277}
+
+GOTO_option = {
+    5: 81, 50: 81, 75: 81, 76: 81, 127: 81, 172: 81, 180: 81, 204: 81}
+
+GOTO_or = {
+    9: 118}
+
+GOTO_order = {
+    3: 63, 50: 63, 75: 63, 76: 63, 172: 63, 176: 63, 266: 63}
+
+GOTO_outer = {
+    5: 93, 50: 93, 75: 93, 76: 93, 90: 93, 127: 93, 172: 93, 180: 93, 204: 93}
+
+GOTO_over = {
+    0: 51, 4: 51, 9: 51, 10: 51, 12: 51, 30: 51, 31: 51, 55: 51, 77: 51, 78: 51, 79: 51, 80: 51, 81:
+    51, 82: 51, 109: 51, 110: 51, 111: 51, 112: 51, 113: 51, 114: 51, 115: 51, 116: 51, 117: 51,
+    118: 51, 157: 51, 167: 51, 168: 51, 186: 51, 189: 51, 191: 51, 193: 51, 195: 51, 197: 51, 238:
+    51, 250: 51, 253: 51, 269: 51, 277: 51, 284: 51}
+
+GOTO_over_block = {
+    0: 29, 4: 29, 9: 29, 10: 29, 12: 29, 30: 29, 31: 29, 55: 29, 77: 29, 78: 29, 79: 29, 80: 29, 81:
+    29, 82: 29, 109: 29, 110: 29, 111: 29, 112: 29, 113: 29, 114: 29, 115: 29, 116: 29, 117: 29,
+    118: 29, 157: 29, 167: 29, 168: 29, 186: 29, 189: 29, 191: 29, 193: 29, 195: 29, 197: 29, 238:
+    29, 250: 29, 253: 29, 269: 29, 277: 29, 284: 29}
+
+GOTO_over_clause = {
+    176: 267, 266: 287}
+
+GOTO_over_clause_list = {
+    176: 266}
+
+GOTO_partition = {
+    3: 67, 50: 67, 75: 67, 76: 67, 172: 67, 176: 67, 266: 67}
+
+GOTO_point = {
+    9: 109}
+
+GOTO_query = {
+    0: 2, 4: 74}
+
+GOTO_right = {
+    5: 95, 50: 95, 75: 95, 76: 95, 90: 95, 127: 95, 172: 95, 180: 95, 204: 95}
+
+GOTO_right_bra = {
+    30: 153, 152: 249}
+
+GOTO_right_par = {
+    31: 159, 157: 159, 158: 254, 160: 256, 161: 257, 253: 159, 266: 286, 280: 257}
+
+GOTO_select = {
+    0: 57, 4: 57, 9: 57, 10: 57, 12: 57, 30: 57, 31: 57, 55: 57, 77: 57, 78: 57, 79: 57, 80: 57, 81:
+    57, 82: 57, 109: 57, 110: 57, 111: 57, 112: 57, 113: 57, 114: 57, 115: 57, 116: 57, 117: 57,
+    118: 57, 147: 57, 157: 57, 167: 57, 168: 57, 186: 57, 189: 57, 191: 57, 193: 57, 195: 57, 197:
+    57, 238: 57, 244: 57, 250: 57, 253: 57, 269: 57, 277: 57, 284: 57}
+
+GOTO_select_block = {
+    0: 50, 4: 50, 9: 50, 10: 50, 12: 50, 30: 50, 31: 50, 55: 50, 77: 50, 78: 50, 79: 50, 80: 50, 81:
+    50, 82: 50, 109: 50, 110: 50, 111: 50, 112: 50, 113: 50, 114: 50, 115: 50, 116: 50, 117: 50,
+    118: 50, 147: 50, 157: 50, 167: 50, 168: 50, 186: 50, 189: 50, 191: 50, 193: 50, 195: 50, 197:
+    50, 238: 50, 244: 50, 250: 50, 253: 50, 269: 50, 277: 50, 284: 50}
+
+GOTO_select_clause = {
+    55: 178}
+
+GOTO_select_full = {
+    0: 28, 4: 28, 9: 28, 10: 28, 12: 28, 30: 28, 31: 161, 55: 28, 77: 28, 78: 28, 79: 28, 80: 28,
+    81: 28, 82: 28, 109: 28, 110: 28, 111: 28, 112: 28, 113: 28, 114: 28, 115: 28, 116: 28, 117: 28,
+    118: 28, 147: 243, 157: 161, 167: 28, 168: 28, 186: 28, 189: 28, 191: 28, 193: 28, 195: 28, 197:
+    28, 238: 28, 244: 280, 250: 28, 253: 161, 269: 28, 277: 28, 284: 28}
+
+GOTO_select_keyword = {
+    0: 55, 4: 55, 9: 55, 10: 55, 12: 55, 30: 55, 31: 55, 55: 55, 77: 55, 78: 55, 79: 55, 80: 55, 81:
+    55, 82: 55, 109: 55, 110: 55, 111: 55, 112: 55, 113: 55, 114: 55, 115: 55, 116: 55, 117: 55,
+    118: 55, 147: 55, 157: 55, 167: 55, 168: 55, 186: 55, 189: 55, 191: 55, 193: 55, 195: 55, 197:
+    55, 238: 55, 244: 55, 250: 55, 253: 55, 269: 55, 277: 55, 284: 55}
+
+GOTO_semi = {
+    5: 97, 50: 97, 75: 97, 76: 97, 90: 97, 127: 97, 172: 97, 180: 97, 204: 97}
+
+GOTO_semicolon = {
+    2: 59, 74: 59}
+
+GOTO_sort = {
+    3: 66, 50: 66, 75: 66, 76: 66, 172: 66, 176: 66, 266: 66}
+
+GOTO_string_double = {
+    0: 15, 4: 15, 9: 15, 10: 15, 12: 15, 30: 15, 31: 15, 55: 15, 77: 15, 78: 15, 79: 15, 80: 15, 81:
+    15, 82: 15, 109: 15, 110: 15, 111: 15, 112: 15, 113: 15, 114: 15, 115: 15, 116: 15, 117: 15,
+    118: 15, 157: 15, 167: 15, 168: 15, 186: 15, 189: 15, 191: 15, 193: 15, 195: 15, 197: 15, 238:
+    15, 250: 15, 253: 15, 269: 15, 277: 15, 284: 15}
+
+GOTO_string_grave = {
+    0: 16, 4: 16, 9: 16, 10: 16, 12: 16, 30: 16, 31: 16, 55: 16, 77: 16, 78: 16, 79: 16, 80: 16, 81:
+    16, 82: 16, 109: 16, 110: 16, 111: 16, 112: 16, 113: 16, 114: 16, 115: 16, 116: 16, 117: 16,
+    118: 16, 157: 16, 167: 16, 168: 16, 186: 16, 189: 16, 191: 16, 193: 16, 195: 16, 197: 16, 238:
+    16, 250: 16, 253: 16, 269: 16, 277: 16, 284: 16}
+
+GOTO_string_simple = {
+    0: 14, 4: 14, 9: 14, 10: 14, 12: 14, 30: 14, 31: 14, 55: 14, 77: 14, 78: 14, 79: 14, 80: 14, 81:
+    14, 82: 14, 109: 14, 110: 14, 111: 14, 112: 14, 113: 14, 114: 14, 115: 14, 116: 14, 117: 14,
+    118: 14, 157: 14, 167: 14, 168: 14, 186: 14, 189: 14, 191: 14, 193: 14, 195: 14, 197: 14, 238:
+    14, 250: 14, 253: 14, 269: 14, 277: 14, 284: 14}
+
+GOTO_subquerry = {
+    0: 3, 4: 3}
+
+GOTO_symbol = {
+    0: 11, 4: 11, 9: 111, 10: 11, 12: 11, 30: 11, 31: 11, 55: 11, 77: 11, 78: 11, 79: 11, 80: 11,
+    81: 11, 82: 11, 109: 11, 110: 11, 111: 11, 112: 11, 113: 11, 114: 11, 115: 11, 116: 11, 117: 11,
+    118: 11, 157: 11, 167: 11, 168: 11, 186: 11, 189: 11, 191: 11, 193: 11, 195: 11, 197: 11, 238:
+    11, 250: 11, 253: 11, 269: 11, 277: 11, 284: 11}
+
+GOTO_then = {
+    261: 284}
+
+GOTO_true = {
+    0: 20, 4: 20, 9: 20, 10: 20, 12: 20, 30: 20, 31: 20, 55: 20, 77: 20, 78: 20, 79: 20, 80: 20, 81:
+    20, 82: 20, 109: 20, 110: 20, 111: 20, 112: 20, 113: 20, 114: 20, 115: 20, 116: 20, 117: 20,
+    118: 20, 157: 20, 167: 20, 168: 20, 186: 20, 189: 20, 191: 20, 193: 20, 195: 20, 197: 20, 238:
+    20, 250: 20, 253: 20, 269: 20, 277: 20, 284: 20}
+
+GOTO_union = {
+    28: 148, 161: 148, 243: 148, 280: 148}
+
+GOTO_when = {
+    49: 167, 166: 167}
+
+GOTO_where = {
+    5: 78, 50: 78, 75: 78, 76: 78, 127: 78, 172: 78, 180: 78, 204: 78}
+
+GOTO_with = {
+    9: 115}
+
+def reduce_1(values, states, parser):
+    # formatted_query -> query
+    p1 = values[-1]
+    options = parser.options
+    # The document is rendered by the caller when checking a query
+    p0 = p1 if options["document"] else render(p1)
+    values[-1] = p0
+    state = states[-1] = GOTO_formatted_query[states[-2]]
+    return state
+
+def reduce_2(values, states, parser):
+    # query -> subquerry
+    p1 = values[-1]
+    p0 = p1
+    values[-1] = p0
+    state = states[-1] = GOTO_query[states[-2]]
+    return state
+
+def reduce_3(values, states, parser):
+    # query -> query semicolon
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_query[states[-2]]
+    return state
+
+def reduce_4(values, states, parser):
+    # query -> comment query
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_query[states[-2]]
+    return state
+
+def reduce_5(values, states, parser):
+    # subquerry -> expr_definition_list
+    p1 = values[-1]
+    p0 = p1
+    values[-1] = p0
+    state = states[-1] = GOTO_subquerry[states[-2]]
+    return state
+
+def reduce_6(values, states, parser):
+    # subquerry -> subquerry by_block
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    options = parser.options
+    p0 = concat(p1, options["newline_sep"], p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_subquerry[states[-2]]
+    return state
+
+def reduce_7(values, states, parser):
+    # select_full -> select_block
+    p1 = values[-1]
+    p0 = p1
+    values[-1] = p0
+    state = states[-1] = GOTO_select_full[states[-2]]
+    return state
+
+def reduce_8(values, states, parser):
+    # select_full -> select_full combine_keyword select_full
+    p1, p2, p3 = values[-3:]
+    del values[-2:]
+    del states[-2:]
+    options = parser.options
+    p0 = concat(p1, options["newline_sep"], p2, options["newline_sep"], p3)
+    values[-1] = p0
+    state = states[-1] = GOTO_select_full[states[-2]]
+    return state
+
+def reduce_9(values, states, parser):
+    # select_full -> left_par select_full right_par
+    p1, p2, p3 = values[-3:]
+    del values[-2:]
+    del states[-2:]
+    options = parser.options
+    p0 = concat(p1, options["newline"], options["tab"], indent(p2), options["newline"], p3)
+    values[-1] = p0
+    state = states[-1] = GOTO_select_full[states[-2]]
+    return state
+
+def reduce_10(values, states, parser):
+    # select_full -> select_block additional_block_list
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    options = parser.options
+    p0 = concat(p1, options["newline_sep"], p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_select_full[states[-2]]
+    return state
+
+def reduce_11(values, states, parser):
+    # select_block -> select_keyword select_clause
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    options = parser.options
+    p0 = concat(p1, options["newline_sep"], options["tab"], indent(p2))
+    values[-1] = p0
+    state = states[-1] = GOTO_select_block[states[-2]]
+    return state
+
+def reduce_12(values, states, parser):
+    # select_keyword -> select
+    p1 = values[-1]
+    p0 = p1
+    values[-1] = p0
+    state = states[-1] = GOTO_select_keyword[states[-2]]
+    return state
+
+def reduce_13(values, states, parser):
+    # select_keyword -> select distinct
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, SPACE, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_select_keyword[states[-2]]
+    return state
+
+def reduce_15(values, states, parser):
+    # select_clause -> select_clause comma expr
+    p1, p2, p3 = values[-3:]
+    del values[-2:]
+    del states[-2:]
+    options = parser.options
+    p0 = extend(p1, p2, options["newline"], p3)
+    values[-1] = p0
+    state = states[-1] = GOTO_select_clause[states[-2]]
+    return state
+
+def reduce_16(values, states, parser):
+    # select_clause -> expr
+    p1 = values[-1]
+    p0 = concat(p1)
+    values[-1] = p0
+    state = states[-1] = GOTO_select_clause[states[-2]]
+    return state
+
+def reduce_17(values, states, parser):
+    # additional_block_list -> additional_block additional_block_list
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    options = parser.options
+    p0 = concat(p1, options["newline_sep"], p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_additional_block_list[states[-2]]
+    return state
+
+def reduce_18(values, states, parser):
+    # additional_block_list -> additional_block
+    p1 = values[-1]
+    p0 = p1
+    values[-1] = p0
+    state = states[-1] = GOTO_additional_block_list[states[-2]]
+    return state
+
+def reduce_19(values, states, parser):
+    # additional_block -> keyword_block
+    p1 = values[-1]
+    p0 = p1
+    values[-1] = p0
+    state = states[-1] = GOTO_additional_block[states[-2]]
+    return state
+
+def reduce_22(values, states, parser):
+    # keyword_block -> from clause
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, SPACE, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_keyword_block[states[-2]]
+    return state
+
+def reduce_27(values, states, parser):
+    # by_block -> group by clause
+    p1, p2, p3 = values[-3:]
+    del values[-2:]
+    del states[-2:]
+    p0 = concat(p1, SPACE, p2, SPACE, p3)
+    values[-1] = p0
+    state = states[-1] = GOTO_by_block[states[-2]]
+    return state
+
+def reduce_33(values, states, parser):
+    # clause -> expr_list
+    p1 = values[-1]
+    if p1.first != '(' and p1.newlines:
+        p1 = indent(p1)
+    p0 = p1
+    values[-1] = p0
+    state = states[-1] = GOTO_clause[states[-2]]
+    return state
+
+def reduce_34(values, states, parser):
+    # combine_keyword -> union all
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, SPACE, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_combine_keyword[states[-2]]
+    return state
+
+def reduce_36(values, states, parser):
+    # combine_keyword -> union
+    p1 = values[-1]
+    p0 = p1
+    values[-1] = p0
+    state = states[-1] = GOTO_combine_keyword[states[-2]]
+    return state
+
+def reduce_38(values, states, parser):
+    # join_block -> join_expression clause on expr_list
+    p1, p2, p3, p4 = values[-4:]
+    del values[-3:]
+    del states[-3:]
+    options = parser.options
+    p0 = concat(p1, SPACE, p2, options["newline_sep"], options["tab"], p3, SPACE, indent(p4))
+    values[-1] = p0
+    state = states[-1] = GOTO_join_block[states[-2]]
+    return state
+
+def reduce_39(values, states, parser):
+    # join_block -> join_expression clause
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, SPACE, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_join_block[states[-2]]
+    return state
+
+def reduce_40(values, states, parser):
+    # join_expression -> join_prefix_list join
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, SPACE, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_join_expression[states[-2]]
+    return state
+
+def reduce_41(values, states, parser):
+    # join_expression -> join
+    p1 = values[-1]
+    p0 = p1
+    values[-1] = p0
+    state = states[-1] = GOTO_join_expression[states[-2]]
+    return state
+
+def reduce_42(values, states, parser):
+    # join_prefix -> inner
+    p1 = values[-1]
+    p0 = p1
+    values[-1] = p0
+    state = states[-1] = GOTO_join_prefix[states[-2]]
+    return state
+
+def reduce_50(values, states, parser):
+    # join_prefix_list -> join_prefix join_prefix_list
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, SPACE, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_join_prefix_list[states[-2]]
+    return state
+
+def reduce_51(values, states, parser):
+    # join_prefix_list -> join_prefix
+    p1 = values[-1]
+    p0 = p1
+    values[-1] = p0
+    state = states[-1] = GOTO_join_prefix_list[states[-2]]
+    return state
+
+def reduce_52(values, states, parser):
+    # case_when -> case case_when_clause_list end
+    p1, p2, p3 = values[-3:]
+    del values[-2:]
+    del states[-2:]
+    options = parser.options
+    p0 = concat(p1, options["newline_sep"], options["tab"], indent(p2), options["newline_sep"], p3)
+    values[-1] = p0
+    state = states[-1] = GOTO_case_when[states[-2]]
+    return state
+
+def reduce_53(values, states, parser):
+    # case_when_clause_list -> case_when_clause case_when_clause_list
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    options = parser.options
+    p0 = concat(p1, options["newline_sep"], p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_case_when_clause_list[states[-2]]
+    return state
+
+def reduce_54(values, states, parser):
+    # case_when_clause_list -> case_when_clause
+    p1 = values[-1]
+    p0 = p1
+    values[-1] = p0
+    state = states[-1] = GOTO_case_when_clause_list[states[-2]]
+    return state
+
+def reduce_55(values, states, parser):
+    # case_when_clause -> when expr then expr
+    p1, p2, p3, p4 = values[-4:]
+    del values[-3:]
+    del states[-3:]
+    p0 = concat(p1, SPACE, indent(p2), SPACE, p3, SPACE, indent(p4))
+    values[-1] = p0
+    state = states[-1] = GOTO_case_when_clause[states[-2]]
+    return state
+
+def reduce_56(values, states, parser):
+    # case_when_clause -> else expr
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, SPACE, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_case_when_clause[states[-2]]
+    return state
+
+def reduce_57(values, states, parser):
+    # over_block -> over left_par over_clause_list right_par
+    p1, p2, p3, p4 = values[-4:]
+    del values[-3:]
+    del states[-3:]
+    options = parser.options
+    p0 = concat(p1, SPACE, p2, options["newline"], options["tab"], indent(p3), options["newline"], p4)
+    values[-1] = p0
+    state = states[-1] = GOTO_over_block[states[-2]]
+    return state
+
+def reduce_58(values, states, parser):
+    # over_clause_list -> over_clause_list over_clause
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    options = parser.options
+    p0 = concat(p1, options["newline_sep"], p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_over_clause_list[states[-2]]
+    return state
+
+def reduce_59(values, states, parser):
+    # over_clause_list -> over_clause
+    p1 = values[-1]
+    p0 = p1
+    values[-1] = p0
+    state = states[-1] = GOTO_over_clause_list[states[-2]]
+    return state
+
+def reduce_60(values, states, parser):
+    # over_clause -> by_block
+    p1 = values[-1]
+    p0 = p1
+    values[-1] = p0
+    state = states[-1] = GOTO_over_clause[states[-2]]
+    return state
+
+def reduce_61(values, states, parser):
+    # expr -> expr_definition_list
+    p1 = values[-1]
+    p0 = p1
+    values[-1] = p0
+    state = states[-1] = GOTO_expr[states[-2]]
+    return state
+
+def reduce_62(values, states, parser):
+    # expr_definition_list -> expr_definition expr_definition_list
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = None
+    if p2.first in ['(', '['] or (p1.size == 1 and p1.first in ['+', '-']) or (p1.last == ')'  and p2.first == '#'):
+        p0 = concat(p1, p2)
+    else:
+        p0 = concat(p1, SPACE, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_expr_definition_list[states[-2]]
+    return state
+
+def reduce_63(values, states, parser):
+    # expr_definition_list -> expr_definition point expr_definition_list
+    p1, p2, p3 = values[-3:]
+    del values[-2:]
+    del states[-2:]
+    p0 = concat(p1, p2, p3)
+    values[-1] = p0
+    state = states[-1] = GOTO_expr_definition_list[states[-2]]
+    return state
+
+def reduce_64(values, states, parser):
+    # expr_definition_list -> expr_definition
+    p1 = values[-1]
+    p0 = p1
+    values[-1] = p0
+    state = states[-1] = GOTO_expr_definition_list[states[-2]]
+    return state
+
+def reduce_65(values, states, parser):
+    # expr_definition_list -> not expr_definition_list
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = None
+    if p1.size == 1:
+        p0 = concat(p1, p2)
+    else:
+        p0 = concat(p1, SPACE, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_expr_definition_list[states[-2]]
+    return state
+
+def reduce_66(values, states, parser):
+    # expr_definition_list -> expr_definition comparison expr_definition_list
+    p1, p2, p3 = values[-3:]
+    del values[-2:]
+    del states[-2:]
+    p0 = concat(p1, SPACE, p2, SPACE, p3)
+    values[-1] = p0
+    state = states[-1] = GOTO_expr_definition_list[states[-2]]
+    return state
+
+def reduce_72(values, states, parser):
+    # expr_definition_list -> expr_definition not in expr_definition_list
+    p1, p2, p3, p4 = values[-4:]
+    del values[-3:]
+    del states[-3:]
+    p0 = concat(p1, SPACE, p2, SPACE, p3, SPACE, p4)
+    values[-1] = p0
+    state = states[-1] = GOTO_expr_definition_list[states[-2]]
+    return state
+
+def reduce_73(values, states, parser):
+    # expr_definition_list -> between expr_definition_list
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, SPACE, flatten(p2))
+    values[-1] = p0
+    state = states[-1] = GOTO_expr_definition_list[states[-2]]
+    return state
+
+def reduce_74(values, states, parser):
+    # expr_definition_list -> expr_definition and expr_definition_list
+    p1, p2, p3 = values[-3:]
+    del values[-2:]
+    del states[-2:]
+    options = parser.options
+    p0 = concat(p1, options["newline_sep"], p2, SPACE, p3)
+    values[-1] = p0
+    state = states[-1] = GOTO_expr_definition_list[states[-2]]
+    return state
+
+def reduce_76(values, states, parser):
+    # expr_definition -> label
+    p1 = values[-1]
+    p0 = p1
+    values[-1] = p0
+    state = states[-1] = GOTO_expr_definition[states[-2]]
+    return state
+
+def reduce_80(values, states, parser):
+    # expr_definition -> distinct
+    p1 = values[-1]
+    p0 = p1
+    values[-1] = p0
+    state = states[-1] = GOTO_expr_definition[states[-2]]
+    return state
+
+def reduce_91(values, states, parser):
+    # expr_definition -> case_when
+    p1 = values[-1]
+    p0 = p1
+    values[-1] = p0
+    state = states[-1] = GOTO_expr_definition[states[-2]]
+    return state
+
+def reduce_94(values, states, parser):
+    # expr_definition -> left_bra expr_list right_bra
+    p1, p2, p3 = values[-3:]
+    del values[-2:]
+    del states[-2:]
+    p0 = concat(p1, compact(p2), p3)
+    values[-1] = p0
+    state = states[-1] = GOTO_expr_definition[states[-2]]
+    return state
+
+def reduce_95(values, states, parser):
+    # expr_definition -> left_bra right_bra
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_expr_definition[states[-2]]
+    return state
+
+def reduce_96(values, states, parser):
+    # expr_definition -> left_par expr_definition_list right_par
+    p1, p2, p3 = values[-3:]
+    del values[-2:]
+    del states[-2:]
+    p0 = None
+    options = parser.options
+    if p2.tabs:
+        p0 = concat(p1, options["newline"], options["tab"], indent(p2), options["newline"], p3)
+    else:
+        p0 = concat(p1, inline(p2), p3)
+    values[-1] = p0
+    state = states[-1] = GOTO_expr_definition[states[-2]]
+    return state
+
+def reduce_97(values, states, parser):
+    # expr_definition -> left_par expr_list right_par
+    p1, p2, p3 = values[-3:]
+    del values[-2:]
+    del states[-2:]
+    p0 = None
+    options = parser.options
+    if is_numeric_expression(p2):
+        p0 = concat(p1, flatten(p2), p3)
+    else:
+        p0 = concat(p1, options["newline"], options["tab"], indent(p2), options["newline"], p3)
+    values[-1] = p0
+    state = states[-1] = GOTO_expr_definition[states[-2]]
+    return state
+
+def reduce_98(values, states, parser):
+    # expr_definition -> left_par right_par
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_expr_definition[states[-2]]
+    return state
+
+def reduce_99(values, states, parser):
+    # expr_list -> expr_list comma expr_definition_list
+    p1, p2, p3 = values[-3:]
+    del values[-2:]
+    del states[-2:]
+    options = parser.options
+    p0 = extend(p1, p2, options["newline"], p3)
+    values[-1] = p0
+    state = states[-1] = GOTO_expr_list[states[-2]]
+    return state
+
+def reduce_100(values, states, parser):
+    # expr_list -> expr_definition_list
+    p1 = values[-1]
+    p0 = concat(p1)
+    values[-1] = p0
+    state = states[-1] = GOTO_expr_list[states[-2]]
+    return state
+
+def reduce_101(values, states, parser):
+    # select -> SELECT
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_select[states[-2]]
+    return state
+
+def reduce_102(values, states, parser):
+    # all -> ALL
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_all[states[-2]]
+    return state
+
+def reduce_103(values, states, parser):
+    # distinct -> DISTINCT
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_distinct[states[-2]]
+    return state
+
+def reduce_104(values, states, parser):
+    # from -> FROM
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_from[states[-2]]
+    return state
+
+def reduce_105(values, states, parser):
+    # where -> WHERE
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_where[states[-2]]
+    return state
+
+def reduce_106(values, states, parser):
+    # by -> BY
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_by[states[-2]]
+    return state
+
+def reduce_107(values, states, parser):
+    # group -> GROUP
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_group[states[-2]]
+    return state
+
+def reduce_108(values, states, parser):
+    # order -> ORDER
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_order[states[-2]]
+    return state
+
+def reduce_109(values, states, parser):
+    # cluster -> CLUSTER
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_cluster[states[-2]]
+    return state
+
+def reduce_110(values, states, parser):
+    # distribute -> DISTRIBUTE
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_distribute[states[-2]]
+    return state
+
+def reduce_111(values, states, parser):
+    # sort -> SORT
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_sort[states[-2]]
+    return state
+
+def reduce_112(values, states, parser):
+    # partition -> PARTITION
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_partition[states[-2]]
+    return state
+
+def reduce_113(values, states, parser):
+    # having -> HAVING
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_having[states[-2]]
+    return state
+
+def reduce_114(values, states, parser):
+    # limit -> LIMIT
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_limit[states[-2]]
+    return state
+
+def reduce_115(values, states, parser):
+    # as -> AS
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_as[states[-2]]
+    return state
+
+def reduce_116(values, states, parser):
+    # case -> CASE
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_case[states[-2]]
+    return state
+
+def reduce_117(values, states, parser):
+    # when -> WHEN
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_when[states[-2]]
+    return state
+
+def reduce_118(values, states, parser):
+    # then -> THEN
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_then[states[-2]]
+    return state
+
+def reduce_119(values, states, parser):
+    # else -> ELSE
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_else[states[-2]]
+    return state
+
+def reduce_120(values, states, parser):
+    # end -> END
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_end[states[-2]]
+    return state
+
+def reduce_121(values, states, parser):
+    # or -> OR
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_or[states[-2]]
+    return state
+
+def reduce_122(values, states, parser):
+    # and -> AND
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_and[states[-2]]
+    return state
+
+def reduce_123(values, states, parser):
+    # not -> NOT
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_not[states[-2]]
+    return state
+
+def reduce_124(values, states, parser):
+    # is -> IS
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_is[states[-2]]
+    return state
+
+def reduce_125(values, states, parser):
+    # in -> IN
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_in[states[-2]]
+    return state
+
+def reduce_126(values, states, parser):
+    # true -> TRUE
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_true[states[-2]]
+    return state
+
+def reduce_127(values, states, parser):
+    # false -> FALSE
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_false[states[-2]]
+    return state
+
+def reduce_128(values, states, parser):
+    # null -> NULL
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_null[states[-2]]
+    return state
+
+def reduce_129(values, states, parser):
+    # coalesce -> COALESCE
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_coalesce[states[-2]]
+    return state
+
+def reduce_130(values, states, parser):
+    # cast -> CAST
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_cast[states[-2]]
+    return state
+
+def reduce_131(values, states, parser):
+    # concat -> CONCAT
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_concat[states[-2]]
+    return state
+
+def reduce_132(values, states, parser):
+    # union -> UNION
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_union[states[-2]]
+    return state
+
+def reduce_133(values, states, parser):
+    # except -> EXCEPT
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_except[states[-2]]
+    return state
+
+def reduce_134(values, states, parser):
+    # between -> BETWEEN
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_between[states[-2]]
+    return state
+
+def reduce_135(values, states, parser):
+    # asc -> ASC
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_asc[states[-2]]
+    return state
+
+def reduce_136(values, states, parser):
+    # desc -> DESC
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_desc[states[-2]]
+    return state
+
+def reduce_137(values, states, parser):
+    # join -> JOIN
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_join[states[-2]]
+    return state
+
+def reduce_138(values, states, parser):
+    # on -> ON
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_on[states[-2]]
+    return state
+
+def reduce_139(values, states, parser):
+    # inner -> INNER
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_inner[states[-2]]
+    return state
+
+def reduce_140(values, states, parser):
+    # outer -> OUTER
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_outer[states[-2]]
+    return state
+
+def reduce_141(values, states, parser):
+    # left -> LEFT
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_left[states[-2]]
+    return state
+
+def reduce_142(values, states, parser):
+    # right -> RIGHT
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_right[states[-2]]
+    return state
+
+def reduce_143(values, states, parser):
+    # full -> FULL
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_full[states[-2]]
+    return state
+
+def reduce_144(values, states, parser):
+    # semi -> SEMI
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_semi[states[-2]]
+    return state
+
+def reduce_145(values, states, parser):
+    # cross -> CROSS
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_cross[states[-2]]
+    return state
+
+def reduce_146(values, states, parser):
+    # natural -> NATURAL
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_natural[states[-2]]
+    return state
+
+def reduce_147(values, states, parser):
+    # with -> WITH
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_with[states[-2]]
+    return state
+
+def reduce_148(values, states, parser):
+    # option -> OPTION
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_option[states[-2]]
+    return state
+
+def reduce_149(values, states, parser):
+    # over -> OVER
+    p1 = values[-1]
+    p0 = text(p1.upper())
+    values[-1] = p0
+    state = states[-1] = GOTO_over[states[-2]]
+    return state
+
+def reduce_150(values, states, parser):
+    # comma -> COMMA
+    p1 = values[-1]
+    p0 = text(p1)
+    values[-1] = p0
+    state = states[-1] = GOTO_comma[states[-2]]
+    return state
+
+def reduce_151(values, states, parser):
+    # comparison -> COMPARISON
+    p1 = values[-1]
+    p0 = text(p1)
+    values[-1] = p0
+    state = states[-1] = GOTO_comparison[states[-2]]
+    return state
+
+def reduce_152(values, states, parser):
+    # symbol -> SYMBOL
+    p1 = values[-1]
+    p0 = text(p1)
+    values[-1] = p0
+    state = states[-1] = GOTO_symbol[states[-2]]
+    return state
+
+def reduce_153(values, states, parser):
+    # semicolon -> SEMICOLON
+    p1 = values[-1]
+    p0 = text(p1)
+    values[-1] = p0
+    state = states[-1] = GOTO_semicolon[states[-2]]
+    return state
+
+def reduce_154(values, states, parser):
+    # point -> POINT
+    p1 = values[-1]
+    p0 = text(p1)
+    values[-1] = p0
+    state = states[-1] = GOTO_point[states[-2]]
+    return state
+
+def reduce_155(values, states, parser):
+    # label -> LABEL
+    p1 = values[-1]
+    p0 = text(p1)
+    values[-1] = p0
+    state = states[-1] = GOTO_label[states[-2]]
+    return state
+
+def reduce_156(values, states, parser):
+    # left_par -> LEFT_PAR
+    p1 = values[-1]
+    p0 = text(p1)
+    values[-1] = p0
+    state = states[-1] = GOTO_left_par[states[-2]]
+    return state
+
+def reduce_157(values, states, parser):
+    # right_par -> RIGHT_PAR
+    p1 = values[-1]
+    p0 = text(p1)
+    values[-1] = p0
+    state = states[-1] = GOTO_right_par[states[-2]]
+    return state
+
+def reduce_158(values, states, parser):
+    # left_bra -> LEFT_BRA
+    p1 = values[-1]
+    p0 = text(p1)
+    values[-1] = p0
+    state = states[-1] = GOTO_left_bra[states[-2]]
+    return state
+
+def reduce_159(values, states, parser):
+    # right_bra -> RIGHT_BRA
+    p1 = values[-1]
+    p0 = text(p1)
+    values[-1] = p0
+    state = states[-1] = GOTO_right_bra[states[-2]]
+    return state
+
+def reduce_160(values, states, parser):
+    # string_simple -> STRING_SIMPLE
+    p1 = values[-1]
+    p0 = text(p1)
+    values[-1] = p0
+    state = states[-1] = GOTO_string_simple[states[-2]]
+    return state
+
+def reduce_161(values, states, parser):
+    # string_double -> STRING_DOUBLE
+    p1 = values[-1]
+    p0 = text(p1)
+    values[-1] = p0
+    state = states[-1] = GOTO_string_double[states[-2]]
+    return state
+
+def reduce_162(values, states, parser):
+    # string_grave -> STRING_GRAVE
+    p1 = values[-1]
+    p0 = text(p1)
+    values[-1] = p0
+    state = states[-1] = GOTO_string_grave[states[-2]]
+    return state
+
+def reduce_163(values, states, parser):
+    # select -> select comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_select[states[-2]]
+    return state
+
+def reduce_164(values, states, parser):
+    # all -> all comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_all[states[-2]]
+    return state
+
+def reduce_165(values, states, parser):
+    # distinct -> distinct comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_distinct[states[-2]]
+    return state
+
+def reduce_166(values, states, parser):
+    # from -> from comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_from[states[-2]]
+    return state
+
+def reduce_167(values, states, parser):
+    # where -> where comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_where[states[-2]]
+    return state
+
+def reduce_168(values, states, parser):
+    # by -> by comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_by[states[-2]]
+    return state
+
+def reduce_169(values, states, parser):
+    # group -> group comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_group[states[-2]]
+    return state
+
+def reduce_170(values, states, parser):
+    # order -> order comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_order[states[-2]]
+    return state
+
+def reduce_171(values, states, parser):
+    # cluster -> cluster comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_cluster[states[-2]]
+    return state
+
+def reduce_172(values, states, parser):
+    # distribute -> distribute comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_distribute[states[-2]]
+    return state
+
+def reduce_173(values, states, parser):
+    # sort -> sort comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_sort[states[-2]]
+    return state
+
+def reduce_174(values, states, parser):
+    # partition -> partition comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_partition[states[-2]]
+    return state
+
+def reduce_175(values, states, parser):
+    # having -> having comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_having[states[-2]]
+    return state
+
+def reduce_176(values, states, parser):
+    # limit -> limit comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_limit[states[-2]]
+    return state
+
+def reduce_177(values, states, parser):
+    # as -> as comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_as[states[-2]]
+    return state
+
+def reduce_178(values, states, parser):
+    # case -> case comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_case[states[-2]]
+    return state
+
+def reduce_179(values, states, parser):
+    # when -> when comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_when[states[-2]]
+    return state
+
+def reduce_180(values, states, parser):
+    # then -> then comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_then[states[-2]]
+    return state
+
+def reduce_181(values, states, parser):
+    # else -> else comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_else[states[-2]]
+    return state
+
+def reduce_182(values, states, parser):
+    # end -> end comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_end[states[-2]]
+    return state
+
+def reduce_183(values, states, parser):
+    # or -> or comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_or[states[-2]]
+    return state
+
+def reduce_184(values, states, parser):
+    # and -> and comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_and[states[-2]]
+    return state
+
+def reduce_185(values, states, parser):
+    # not -> not comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_not[states[-2]]
+    return state
+
+def reduce_186(values, states, parser):
+    # is -> is comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_is[states[-2]]
+    return state
+
+def reduce_187(values, states, parser):
+    # in -> in comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_in[states[-2]]
+    return state
+
+def reduce_188(values, states, parser):
+    # true -> true comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_true[states[-2]]
+    return state
+
+def reduce_189(values, states, parser):
+    # false -> false comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_false[states[-2]]
+    return state
+
+def reduce_190(values, states, parser):
+    # null -> null comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_null[states[-2]]
+    return state
+
+def reduce_191(values, states, parser):
+    # coalesce -> coalesce comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_coalesce[states[-2]]
+    return state
+
+def reduce_192(values, states, parser):
+    # cast -> cast comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_cast[states[-2]]
+    return state
+
+def reduce_193(values, states, parser):
+    # concat -> concat comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_concat[states[-2]]
+    return state
+
+def reduce_194(values, states, parser):
+    # union -> union comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_union[states[-2]]
+    return state
+
+def reduce_195(values, states, parser):
+    # except -> except comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_except[states[-2]]
+    return state
+
+def reduce_196(values, states, parser):
+    # between -> between comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_between[states[-2]]
+    return state
+
+def reduce_197(values, states, parser):
+    # asc -> asc comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_asc[states[-2]]
+    return state
+
+def reduce_198(values, states, parser):
+    # desc -> desc comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_desc[states[-2]]
+    return state
+
+def reduce_199(values, states, parser):
+    # join -> join comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_join[states[-2]]
+    return state
+
+def reduce_200(values, states, parser):
+    # on -> on comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_on[states[-2]]
+    return state
+
+def reduce_201(values, states, parser):
+    # inner -> inner comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_inner[states[-2]]
+    return state
+
+def reduce_202(values, states, parser):
+    # outer -> outer comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_outer[states[-2]]
+    return state
+
+def reduce_203(values, states, parser):
+    # left -> left comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_left[states[-2]]
+    return state
+
+def reduce_204(values, states, parser):
+    # right -> right comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_right[states[-2]]
+    return state
+
+def reduce_205(values, states, parser):
+    # full -> full comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_full[states[-2]]
+    return state
+
+def reduce_206(values, states, parser):
+    # semi -> semi comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_semi[states[-2]]
+    return state
+
+def reduce_207(values, states, parser):
+    # cross -> cross comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_cross[states[-2]]
+    return state
+
+def reduce_208(values, states, parser):
+    # natural -> natural comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_natural[states[-2]]
+    return state
+
+def reduce_209(values, states, parser):
+    # with -> with comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_with[states[-2]]
+    return state
+
+def reduce_210(values, states, parser):
+    # option -> option comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_option[states[-2]]
+    return state
+
+def reduce_211(values, states, parser):
+    # over -> over comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_over[states[-2]]
+    return state
+
+def reduce_212(values, states, parser):
+    # comma -> comma comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_comma[states[-2]]
+    return state
+
+def reduce_213(values, states, parser):
+    # comparison -> comparison comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_comparison[states[-2]]
+    return state
+
+def reduce_214(values, states, parser):
+    # symbol -> symbol comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_symbol[states[-2]]
+    return state
+
+def reduce_215(values, states, parser):
+    # semicolon -> semicolon comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_semicolon[states[-2]]
+    return state
+
+def reduce_216(values, states, parser):
+    # point -> point comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_point[states[-2]]
+    return state
+
+def reduce_217(values, states, parser):
+    # label -> label comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_label[states[-2]]
+    return state
+
+def reduce_218(values, states, parser):
+    # left_par -> left_par comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_left_par[states[-2]]
+    return state
+
+def reduce_219(values, states, parser):
+    # right_par -> right_par comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_right_par[states[-2]]
+    return state
+
+def reduce_220(values, states, parser):
+    # left_bra -> left_bra comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_left_bra[states[-2]]
+    return state
+
+def reduce_221(values, states, parser):
+    # right_bra -> right_bra comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_right_bra[states[-2]]
+    return state
+
+def reduce_222(values, states, parser):
+    # string_simple -> string_simple comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_string_simple[states[-2]]
+    return state
+
+def reduce_223(values, states, parser):
+    # string_double -> string_double comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_string_double[states[-2]]
+    return state
+
+def reduce_224(values, states, parser):
+    # string_grave -> string_grave comment
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = concat(p1, p2)
+    values[-1] = p0
+    state = states[-1] = GOTO_string_grave[states[-2]]
+    return state
+
+def reduce_225(values, states, parser):
+    # comment -> COMMENT
+    p1 = values[-1]
+    p0 = None
+    options = parser.options
+    if options["drop_comments"]:
+        p0 = EMPTY
+    else:
+        p0 = concat(SPACE, text(normalize_comment(p1)), NEWLINE)
+    values[-1] = p0
+    state = states[-1] = GOTO_comment[states[-2]]
+    return state
+
+def reduce_226(values, states, parser):
+    # comment -> COMMENT_ALONE
+    p1 = values[-1]
+    p0 = None
+    options = parser.options
+    if options["drop_comments"]:
+        p0 = EMPTY
+    else:
+        p0 = concat(NEWLINE, text(normalize_comment(p1)), NEWLINE)
+    values[-1] = p0
+    state = states[-1] = GOTO_comment[states[-2]]
+    return state
+
+def reduce_227(values, states, parser):
+    # select_clause -> error
+    p1 = values[-1]
+    p0 = concat()
+    values[-1] = p0
+    state = states[-1] = GOTO_select_clause[states[-2]]
+    return state
+
+def reduce_228(values, states, parser):
+    # clause -> error
+    p1 = values[-1]
+    p0 = concat()
+    values[-1] = p0
+    state = states[-1] = GOTO_clause[states[-2]]
+    return state
+
+def reduce_229(values, states, parser):
+    # select_full -> error keyword_block
+    p1, p2 = values[-2:]
+    del values[-1:]
+    del states[-1:]
+    p0 = p2
+    values[-1] = p0
+    state = states[-1] = GOTO_select_full[states[-2]]
+    return state
+
+def reduce_231(values, states, parser):
+    # select_full -> error keyword_block additional_block_list
+    p1, p2, p3 = values[-3:]
+    del values[-2:]
+    del states[-2:]
+    options = parser.options
+    p0 = concat(p2, options["newline_sep"], p3)
+    values[-1] = p0
+    state = states[-1] = GOTO_select_full[states[-2]]
+    return state
+
+def reduce_233(values, states, parser):
+    # query -> error
+    p1 = values[-1]
+    p0 = concat()
+    values[-1] = p0
+    state = states[-1] = GOTO_query[states[-2]]
+    return state
+
+REDUCE = (
+    None, reduce_1, reduce_2, reduce_3, reduce_4, reduce_5, reduce_6, reduce_7, reduce_8, reduce_9,
+    reduce_10, reduce_11, reduce_12, reduce_13, reduce_13, reduce_15, reduce_16, reduce_17,
+    reduce_18, reduce_19, reduce_19, reduce_19, reduce_22, reduce_22, reduce_22, reduce_22,
+    reduce_22, reduce_27, reduce_27, reduce_27, reduce_27, reduce_27, reduce_27, reduce_33,
+    reduce_34, reduce_34, reduce_36, reduce_36, reduce_38, reduce_39, reduce_40, reduce_41,
+    reduce_42, reduce_42, reduce_42, reduce_42, reduce_42, reduce_42, reduce_42, reduce_42,
+    reduce_50, reduce_51, reduce_52, reduce_53, reduce_54, reduce_55, reduce_56, reduce_57,
+    reduce_58, reduce_59, reduce_60, reduce_61, reduce_62, reduce_63, reduce_64, reduce_65,
+    reduce_66, reduce_66, reduce_66, reduce_66, reduce_66, reduce_66, reduce_72, reduce_73,
+    reduce_74, reduce_74, reduce_76, reduce_76, reduce_76, reduce_76, reduce_80, reduce_80,
+    reduce_80, reduce_80, reduce_80, reduce_80, reduce_80, reduce_80, reduce_80, reduce_80,
+    reduce_80, reduce_91, reduce_91, reduce_91, reduce_94, reduce_95, reduce_96, reduce_97,
+    reduce_98, reduce_99, reduce_100, reduce_101, reduce_102, reduce_103, reduce_104, reduce_105,
+    reduce_106, reduce_107, reduce_108, reduce_109, reduce_110, reduce_111, reduce_112, reduce_113,
+    reduce_114, reduce_115, reduce_116, reduce_117, reduce_118, reduce_119, reduce_120, reduce_121,
+    reduce_122, reduce_123, reduce_124, reduce_125, reduce_126, reduce_127, reduce_128, reduce_129,
+    reduce_130, reduce_131, reduce_132, reduce_133, reduce_134, reduce_135, reduce_136, reduce_137,
+    reduce_138, reduce_139, reduce_140, reduce_141, reduce_142, reduce_143, reduce_144, reduce_145,
+    reduce_146, reduce_147, reduce_148, reduce_149, reduce_150, reduce_151, reduce_152, reduce_153,
+    reduce_154, reduce_155, reduce_156, reduce_157, reduce_158, reduce_159, reduce_160, reduce_161,
+    reduce_162, reduce_163, reduce_164, reduce_165, reduce_166, reduce_167, reduce_168, reduce_169,
+    reduce_170, reduce_171, reduce_172, reduce_173, reduce_174, reduce_175, reduce_176, reduce_177,
+    reduce_178, reduce_179, reduce_180, reduce_181, reduce_182, reduce_183, reduce_184, reduce_185,
+    reduce_186, reduce_187, reduce_188, reduce_189, reduce_190, reduce_191, reduce_192, reduce_193,
+    reduce_194, reduce_195, reduce_196, reduce_197, reduce_198, reduce_199, reduce_200, reduce_201,
+    reduce_202, reduce_203, reduce_204, reduce_205, reduce_206, reduce_207, reduce_208, reduce_209,
+    reduce_210, reduce_211, reduce_212, reduce_213, reduce_214, reduce_215, reduce_216, reduce_217,
+    reduce_218, reduce_219, reduce_220, reduce_221, reduce_222, reduce_223, reduce_224, reduce_225,
+    reduce_226, reduce_227, reduce_228, reduce_229, reduce_229, reduce_231, reduce_231, reduce_233)
+
+def parse(input=None, lexer=None, parser=None):
+    if input is not None:
+        lexer.input(input)
+    get_token = lexer.token
+    states = [0]
+    values = [None]
+    state = 0
+    token = None
+    ltid = None
+    while True:
+        t = DEFAULT[state]
+        if t is None:
+            if ltid is None:
+                token = get_token()
+                ltid = END if token is None else TERMINALS.get(token.type, UNKNOWN)
+            t = ACTION[state][ltid]
+            if t is None:
+                p_error(token)
+                raise SyntaxError('Syntax error')
+        if t > 0:
+            states.append(t)
+            values.append(token.value)
+            state = t
+            ltid = None
+        elif t < 0:
+            state = REDUCE[-t](values, states, parser)
+        else:
+            return values[-1]
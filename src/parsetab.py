@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'ALL AND AS ASC BETWEEN BY CASE CAST CLUSTER COALESCE COMMA COMMENT COMMENT_ALONE COMPARISON CONCAT CROSS DESC DISTINCT DISTRIBUTE ELSE END EXCEPT FALSE FROM FULL GROUP HAVING IN INNER IS JOIN LABEL LEFT LEFT_BRA LEFT_PAR LIMIT NATURAL NOT NULL ON OPTION OR ORDER OUTER OVER PARTITION POINT RIGHT RIGHT_BRA RIGHT_PAR SELECT SEMI SEMICOLON SORT STRING_DOUBLE STRING_GRAVE STRING_SIMPLE SYMBOL THEN TRUE UNION WHEN WHERE WITHformatted_query : queryquery : subquerryquery : query semicolonquery : comment querysubquerry : expr_definition_listsubquerry : subquerry by_blockselect_full : select_blockselect_full : select_full combine_keyword select_fullselect_full : left_par select_full right_parselect_full : select_block additional_block_listselect_block : select_keyword select_clauseselect_keyword : select\n    select_keyword : select distinct\n                   | select all\n    select_clause : expr comma select_clauseselect_clause : expradditional_block_list : additional_block additional_block_listadditional_block_list : additional_block\n    additional_block : keyword_block\n                     | by_block\n                     | join_block\n    \n    keyword_block : from clause\n                  | where clause\n                  | limit clause\n                  | having clause\n                  | option clause\n    \n    by_block : group by clause\n             | order by clause\n             | cluster by clause\n             | distribute by clause\n             | sort by clause\n             | partition by clause\n    clause : expr_list\n    combine_keyword : union all\n                    | union distinct\n    \n    combine_keyword : union\n                    | except\n    join_block : join_expression clause on expr_listjoin_block : join_expression clausejoin_expression : join_prefix_list joinjoin_expression : join\n    join_prefix : inner\n                | outer\n                | left\n                | right\n                | full\n                | semi\n                | cross\n                | natural\n    join_prefix_list : join_prefix join_prefix_listjoin_prefix_list : join_prefixcase_when : case case_when_clause_list endcase_when_clause_list : case_when_clause case_when_clause_listcase_when_clause_list : case_when_clausecase_when_clause : when expr then exprcase_when_clause : else exprover_block : over left_par over_clause_list right_parover_clause_list : over_clause_list over_clauseover_clause_list : over_clauseover_clause : by_blockexpr : expr_definition_listexpr_definition_list : expr_definition expr_definition_listexpr_definition_list : expr_definition point expr_definition_listexpr_definition_list : expr_definitionexpr_definition_list : not expr_definition_list\n    expr_definition_list : expr_definition comparison expr_definition_list\n                         | expr_definition symbol expr_definition_list\n                         | expr_definition as expr_definition_list\n                         | expr_definition is expr_definition_list\n                         | expr_definition in expr_definition_list\n                         | expr_definition with expr_definition_list\n    expr_definition_list : expr_definition not in expr_definition_listexpr_definition_list : between expr_definition_list\n    expr_definition_list : expr_definition and expr_definition_list\n                         | expr_definition or expr_definition_list\n    \n    expr_definition : label\n                    | string_simple\n                    | string_double\n                    | string_grave\n    \n    expr_definition : distinct\n                    | all\n                    | null\n                    | true\n                    | false\n                    | coalesce\n                    | cast\n                    | concat\n                    | asc\n                    | desc\n                    | symbol\n    \n    expr_definition : case_when\n                    | select_full\n                    | over_block\n    expr_definition : left_bra expr_list right_braexpr_definition : left_bra right_braexpr_definition : left_par expr_definition_list right_parexpr_definition : left_par expr_list right_parexpr_definition : left_par right_parexpr_list : expr_definition_list comma expr_listexpr_list : expr_definition_list\n    select : SELECT\n    all : ALL\n    distinct : DISTINCT\n    from : FROM\n    where : WHERE\n    by : BY\n    group : GROUP\n    order : ORDER\n    cluster : CLUSTER\n    distribute : DISTRIBUTE\n    sort : SORT\n    partition : PARTITION\n    having : HAVING\n    limit : LIMIT\n    as : AS\n    case : CASE\n    when : WHEN\n    then : THEN\n    else : ELSE\n    end : END\n    or : OR\n    and : AND\n    not : NOT\n    is : IS\n    in : IN\n    true : TRUE\n    false : FALSE\n    null : NULL\n    coalesce : COALESCE\n    cast : CAST\n    concat : CONCAT\n    union : UNION\n    except : EXCEPT\n    between : BETWEEN\n    asc : ASC\n    desc : DESC\n    join : JOIN\n    on : ON\n    inner : INNER\n    outer : OUTER\n    left : LEFT\n    right : RIGHT\n    full : FULL\n    semi : SEMI\n    cross : CROSS\n    natural : NATURAL\n    with : WITH\n    option : OPTION\n    over : OVER\n    \n    comma : COMMA\n    comparison : COMPARISON\n    symbol : SYMBOL\n    semicolon : SEMICOLON\n    point : POINT\n    label : LABEL\n    left_par : LEFT_PAR\n    right_par : RIGHT_PAR\n    left_bra : LEFT_BRA\n    right_bra : RIGHT_BRA\n    string_simple : STRING_SIMPLE\n    string_double : STRING_DOUBLE\n    string_grave : STRING_GRAVE\n    \n    select : select comment\n    all : all comment\n    distinct : distinct comment\n    from : from comment\n    where : where comment\n    by : by comment\n    group : group comment\n    order : order comment\n    cluster : cluster comment\n    distribute : distribute comment\n    sort : sort comment\n    partition : partition comment\n    having : having comment\n    limit : limit comment\n    as : as comment\n    case : case comment\n    when : when comment\n    then : then comment\n    else : else comment\n    end : end comment\n    or : or comment\n    and : and comment\n    not : not comment\n    is : is comment\n    in : in comment\n    true : true comment\n    false : false comment\n    null : null comment\n    coalesce : coalesce comment\n    cast : cast comment\n    concat : concat comment\n    union : union comment\n    except : except comment\n    between : between comment\n    asc : asc comment\n    desc : desc comment\n    join : join comment\n    on : on comment\n    inner : inner comment\n    outer : outer comment\n    left : left comment\n    right : right comment\n    full : full comment\n    semi : semi comment\n    cross : cross comment\n    natural : natural comment\n    with : with comment\n    option : option comment\n    over : over comment\n    comma : comma comment\n    comparison : comparison comment\n    symbol : symbol comment\n    semicolon : semicolon comment\n    point : point comment\n    label : label comment\n    left_par : left_par comment\n    right_par : right_par comment\n    left_bra : left_bra comment\n    right_bra : right_bra comment\n    string_simple : string_simple comment\n    string_double : string_double comment\n    string_grave : string_grave comment\n    comment : COMMENTcomment : COMMENT_ALONE'
+_lr_signature = 'ALL AND AS ASC BETWEEN BY CASE CAST CLUSTER COALESCE COMMA COMMENT COMMENT_ALONE COMPARISON CONCAT CROSS DESC DISTINCT DISTRIBUTE ELSE END EXCEPT FALSE FROM FULL GROUP HAVING IN INNER IS JOIN LABEL LEFT LEFT_BRA LEFT_PAR LIMIT NATURAL NOT NULL ON OPTION OR ORDER OUTER OVER PARTITION POINT RIGHT RIGHT_BRA RIGHT_PAR SELECT SEMI SEMICOLON SORT STRING_DOUBLE STRING_GRAVE STRING_SIMPLE SYMBOL THEN TRUE UNION WHEN WHERE WITHformatted_query : queryquery : subquerryquery : query semicolonquery : comment querysubquerry : expr_definition_listsubquerry : subquerry by_blockselect_full : select_blockselect_full : select_full combine_keyword select_fullselect_full : left_par select_full right_parselect_full : select_block additional_block_listselect_block : select_keyword select_clauseselect_keyword : select\n    select_keyword : select distinct\n                   | select all\n    select_clause : select_clause comma exprselect_clause : expradditional_block_list : additional_block additional_block_listadditional_block_list : additional_block\n    additional_block : keyword_block\n                     | by_block\n                     | join_block\n    \n    keyword_block : from clause\n                  | where clause\n                  | limit clause\n                  | having clause\n                  | option clause\n    \n    by_block : group by clause\n             | order by clause\n             | cluster by clause\n             | distribute by clause\n             | sort by clause\n             | partition by clause\n    clause : expr_list\n    combine_keyword : union all\n                    | union distinct\n    \n    combine_keyword : union\n                    | except\n    join_block : join_expression clause on expr_listjoin_block : join_expression clausejoin_expression : join_prefix_list joinjoin_expression : join\n    join_prefix : inner\n                | outer\n                | left\n                | right\n                | full\n                | semi\n                | cross\n                | natural\n    join_prefix_list : join_prefix join_prefix_listjoin_prefix_list : join_prefixcase_when : case case_when_clause_list endcase_when_clause_list : case_when_clause case_when_clause_listcase_when_clause_list : case_when_clausecase_when_clause : when expr then exprcase_when_clause : else exprover_block : over left_par over_clause_list right_parover_clause_list : over_clause_list over_clauseover_clause_list : over_clauseover_clause : by_blockexpr : expr_definition_listexpr_definition_list : expr_definition expr_definition_listexpr_definition_list : expr_definition point expr_definition_listexpr_definition_list : expr_definitionexpr_definition_list : not expr_definition_list\n    expr_definition_list : expr_definition comparison expr_definition_list\n                         | expr_definition symbol expr_definition_list\n                         | expr_definition as expr_definition_list\n                         | expr_definition is expr_definition_list\n                         | expr_definition in expr_definition_list\n                         | expr_definition with expr_definition_list\n    expr_definition_list : expr_definition not in expr_definition_listexpr_definition_list : between expr_definition_list\n    expr_definition_list : expr_definition and expr_definition_list\n                         | expr_definition or expr_definition_list\n    \n    expr_definition : label\n                    | string_simple\n                    | string_double\n                    | string_grave\n    \n    expr_definition : distinct\n                    | all\n                    | null\n                    | true\n                    | false\n                    | coalesce\n                    | cast\n                    | concat\n                    | asc\n                    | desc\n                    | symbol\n    \n    expr_definition : case_when\n                    | select_full\n                    | over_block\n    expr_definition : left_bra expr_list right_braexpr_definition : left_bra right_braexpr_definition : left_par expr_definition_list right_parexpr_definition : left_par expr_list right_parexpr_definition : left_par right_parexpr_list : expr_list comma expr_definition_listexpr_list : expr_definition_list\n    select : SELECT\n    all : ALL\n    distinct : DISTINCT\n    from : FROM\n    where : WHERE\n    by : BY\n    group : GROUP\n    order : ORDER\n    cluster : CLUSTER\n    distribute : DISTRIBUTE\n    sort : SORT\n    partition : PARTITION\n    having : HAVING\n    limit : LIMIT\n    as : AS\n    case : CASE\n    when : WHEN\n    then : THEN\n    else : ELSE\n    end : END\n    or : OR\n    and : AND\n    not : NOT\n    is : IS\n    in : IN\n    true : TRUE\n    false : FALSE\n    null : NULL\n    coalesce : COALESCE\n    cast : CAST\n    concat : CONCAT\n    union : UNION\n    except : EXCEPT\n    between : BETWEEN\n    asc : ASC\n    desc : DESC\n    join : JOIN\n    on : ON\n    inner : INNER\n    outer : OUTER\n    left : LEFT\n    right : RIGHT\n    full : FULL\n    semi : SEMI\n    cross : CROSS\n    natural : NATURAL\n    with : WITH\n    option : OPTION\n    over : OVER\n    \n    comma : COMMA\n    comparison : COMPARISON\n    symbol : SYMBOL\n    semicolon : SEMICOLON\n    point : POINT\n    label : LABEL\n    left_par : LEFT_PAR\n    right_par : RIGHT_PAR\n    left_bra : LEFT_BRA\n    right_bra : RIGHT_BRA\n    string_simple : STRING_SIMPLE\n    string_double : STRING_DOUBLE\n    string_grave : STRING_GRAVE\n    \n    select : select comment\n    all : all comment\n    distinct : distinct comment\n    from : from comment\n    where : where comment\n    by : by comment\n    group : group comment\n    order : order comment\n    cluster : cluster comment\n    distribute : distribute comment\n    sort : sort comment\n    partition : partition comment\n    having : having comment\n    limit : limit comment\n    as : as comment\n    case : case comment\n    when : when comment\n    then : then comment\n    else : else comment\n    end : end comment\n    or : or comment\n    and : and comment\n    not : not comment\n    is : is comment\n    in : in comment\n    true : true comment\n    false : false comment\n    null : null comment\n    coalesce : coalesce comment\n    cast : cast comment\n    concat : concat comment\n    union : union comment\n    except : except comment\n    between : between comment\n    asc : asc comment\n    desc : desc comment\n    join : join comment\n    on : on comment\n    inner : inner comment\n    outer : outer comment\n    left : left comment\n    right : right comment\n    full : full comment\n    semi : semi comment\n    cross : cross comment\n    natural : natural comment\n    with : with comment\n    option : option comment\n    over : over comment\n    comma : comma comment\n    comparison : comparison comment\n    symbol : symbol comment\n    semicolon : semicolon comment\n    point : point comment\n    label : label comment\n    left_par : left_par comment\n    right_par : right_par comment\n    left_bra : left_bra comment\n    right_bra : right_bra comment\n    string_simple : string_simple comment\n    string_double : string_double comment\n    string_grave : string_grave comment\n    comment : COMMENTcomment : COMMENT_ALONEselect_clause : errorclause : error\n    select_full : error keyword_block\n                | error join_block\n    \n    select_full : error keyword_block additional_block_list\n                | error join_block additional_block_list\n    query : error'
     
-_lr_action_items = {'COMMENT':([0,4,6,7,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,55,56,57,58,59,61,62,63,64,65,66,67,68,69,70,71,72,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,94,95,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,113,114,115,116,118,119,121,122,124,127,128,130,132,133,134,135,141,142,143,144,145,147,148,149,150,151,153,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,195,197,200,202,204,206,207,209,211,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,231,233,236,239,241,243,245,247,248,250,251,252,253,254,255,256,257,261,263,272,273,274,275,276,277,278,282,284,],[6,6,-225,-226,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,6,6,-158,-156,-116,-149,6,-101,6,-153,6,6,6,6,6,6,-107,-108,-109,-110,-111,-112,6,6,6,6,6,6,6,6,6,6,-154,-151,-115,-124,-125,-147,-122,-121,-185,-214,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,6,6,-132,-133,6,-220,-159,6,6,-218,-157,-178,6,6,-117,-119,6,6,6,6,6,-104,-105,-114,-113,-148,6,-137,6,6,6,6,6,6,6,6,-139,-140,-141,-142,-143,-144,-145,-146,6,-211,6,6,-163,-215,6,-169,-106,6,-170,6,-171,6,-172,6,-173,6,-174,-216,-213,-177,-186,-187,-209,6,-184,-183,6,6,6,-194,-195,6,-221,6,-150,6,6,-219,6,6,6,-120,-179,-181,-166,-167,-176,-175,-210,6,-199,-201,-202,-203,-204,-205,-206,-207,-208,6,-168,-212,-182,6,-118,6,-138,6,-180,-200,]),'COMMENT_ALONE':([0,4,6,7,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,55,56,57,58,59,61,62,63,64,65,66,67,68,69,70,71,72,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,94,95,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,113,114,115,116,118,119,121,122,124,127,128,130,132,133,134,135,141,142,143,144,145,147,148,149,150,151,153,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,195,197,200,202,204,206,207,209,211,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,231,233,236,239,241,243,245,247,248,250,251,252,253,254,255,256,257,261,263,272,273,274,275,276,277,278,282,284,],[7,7,-225,-226,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,7,7,-158,-156,-116,-149,7,-101,7,-153,7,7,7,7,7,7,-107,-108,-109,-110,-111,-112,7,7,7,7,7,7,7,7,7,7,-154,-151,-115,-124,-125,-147,-122,-121,-185,-214,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,7,7,-132,-133,7,-220,-159,7,7,-218,-157,-178,7,7,-117,-119,7,7,7,7,7,-104,-105,-114,-113,-148,7,-137,7,7,7,7,7,7,7,7,-139,-140,-141,-142,-143,-144,-145,-146,7,-211,7,7,-163,-215,7,-169,-106,7,-170,7,-171,7,-172,7,-173,7,-174,-216,-213,-177,-186,-187,-209,7,-184,-183,7,7,7,-194,-195,7,-221,7,-150,7,7,-219,7,7,7,-120,-179,-181,-166,-167,-176,-175,-210,7,-199,-201,-202,-203,-204,-205,-206,-207,-208,7,-168,-212,-182,7,-118,7,-138,7,-180,-200,]),'NOT':([0,4,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,52,54,56,57,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,120,121,122,124,126,127,128,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,153,155,174,175,176,177,178,179,181,183,184,186,188,190,192,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,218,219,220,221,222,223,224,225,226,227,228,231,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,261,262,263,264,265,266,267,268,269,271,272,273,274,275,276,277,278,280,282,283,284,],[31,31,-225,-226,31,31,-90,31,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,31,31,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,31,-12,-101,-62,31,31,31,31,31,31,31,31,31,31,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,31,-98,-92,-218,-157,31,31,-117,-119,-10,-18,-19,-20,-21,31,31,31,31,31,31,-104,-105,-114,-113,-148,-41,-137,-11,-16,-61,-13,-14,-163,31,-106,31,31,31,31,31,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,31,-74,-184,-75,-183,-8,-94,-221,31,-150,31,-96,-219,-97,-9,-52,-120,-179,-181,-17,-22,-166,-33,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,31,-27,-168,-28,-29,-30,-31,-32,-72,-99,-212,-182,31,-118,31,-138,-57,-15,-180,-38,-200,]),'BETWEEN':([0,4,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,52,54,56,57,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,120,121,122,124,126,127,128,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,153,155,174,175,176,177,178,179,181,183,184,186,188,190,192,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,218,219,220,221,222,223,224,225,226,227,228,231,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,261,262,263,264,265,266,267,268,269,271,272,273,274,275,276,277,278,280,282,283,284,],[32,32,-225,-226,32,32,-90,32,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,32,32,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,32,-12,-101,-62,32,32,32,32,32,32,32,32,32,32,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,32,-98,-92,-218,-157,32,32,-117,-119,-10,-18,-19,-20,-21,32,32,32,32,32,32,-104,-105,-114,-113,-148,-41,-137,-11,-16,-61,-13,-14,-163,32,-106,32,32,32,32,32,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,32,-74,-184,-75,-183,-8,-94,-221,32,-150,32,-96,-219,-97,-9,-52,-120,-179,-181,-17,-22,-166,-33,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,32,-27,-168,-28,-29,-30,-31,-32,-72,-99,-212,-182,32,-118,32,-138,-57,-15,-180,-38,-200,]),'LABEL':([0,4,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,52,54,56,57,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,120,121,122,124,126,127,128,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,153,155,174,175,176,177,178,179,181,183,184,186,188,190,192,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,218,219,220,221,222,223,224,225,226,227,228,231,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,261,262,263,264,265,266,267,268,269,271,272,273,274,275,276,277,278,280,282,283,284,],[33,33,-225,-226,33,33,-90,33,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,33,33,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,33,-12,-101,-62,33,33,33,33,33,33,33,33,33,33,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,33,-98,-92,-218,-157,33,33,-117,-119,-10,-18,-19,-20,-21,33,33,33,33,33,33,-104,-105,-114,-113,-148,-41,-137,-11,-16,-61,-13,-14,-163,33,-106,33,33,33,33,33,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,33,-74,-184,-75,-183,-8,-94,-221,33,-150,33,-96,-219,-97,-9,-52,-120,-179,-181,-17,-22,-166,-33,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,33,-27,-168,-28,-29,-30,-31,-32,-72,-99,-212,-182,33,-118,33,-138,-57,-15,-180,-38,-200,]),'STRING_SIMPLE':([0,4,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,52,54,56,57,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,120,121,122,124,126,127,128,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,153,155,174,175,176,177,178,179,181,183,184,186,188,190,192,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,218,219,220,221,222,223,224,225,226,227,228,231,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,261,262,263,264,265,266,267,268,269,271,272,273,274,275,276,277,278,280,282,283,284,],[34,34,-225,-226,34,34,-90,34,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,34,34,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,34,-12,-101,-62,34,34,34,34,34,34,34,34,34,34,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,34,-98,-92,-218,-157,34,34,-117,-119,-10,-18,-19,-20,-21,34,34,34,34,34,34,-104,-105,-114,-113,-148,-41,-137,-11,-16,-61,-13,-14,-163,34,-106,34,34,34,34,34,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,34,-74,-184,-75,-183,-8,-94,-221,34,-150,34,-96,-219,-97,-9,-52,-120,-179,-181,-17,-22,-166,-33,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,34,-27,-168,-28,-29,-30,-31,-32,-72,-99,-212,-182,34,-118,34,-138,-57,-15,-180,-38,-200,]),'STRING_DOUBLE':([0,4,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,52,54,56,57,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,120,121,122,124,126,127,128,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,153,155,174,175,176,177,178,179,181,183,184,186,188,190,192,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,218,219,220,221,222,223,224,225,226,227,228,231,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,261,262,263,264,265,266,267,268,269,271,272,273,274,275,276,277,278,280,282,283,284,],[35,35,-225,-226,35,35,-90,35,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,35,35,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,35,-12,-101,-62,35,35,35,35,35,35,35,35,35,35,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,35,-98,-92,-218,-157,35,35,-117,-119,-10,-18,-19,-20,-21,35,35,35,35,35,35,-104,-105,-114,-113,-148,-41,-137,-11,-16,-61,-13,-14,-163,35,-106,35,35,35,35,35,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,35,-74,-184,-75,-183,-8,-94,-221,35,-150,35,-96,-219,-97,-9,-52,-120,-179,-181,-17,-22,-166,-33,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,35,-27,-168,-28,-29,-30,-31,-32,-72,-99,-212,-182,35,-118,35,-138,-57,-15,-180,-38,-200,]),'STRING_GRAVE':([0,4,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,52,54,56,57,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,120,121,122,124,126,127,128,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,153,155,174,175,176,177,178,179,181,183,184,186,188,190,192,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,218,219,220,221,222,223,224,225,226,227,228,231,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,261,262,263,264,265,266,267,268,269,271,272,273,274,275,276,277,278,280,282,283,284,],[36,36,-225,-226,36,36,-90,36,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,36,36,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,36,-12,-101,-62,36,36,36,36,36,36,36,36,36,36,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,36,-98,-92,-218,-157,36,36,-117,-119,-10,-18,-19,-20,-21,36,36,36,36,36,36,-104,-105,-114,-113,-148,-41,-137,-11,-16,-61,-13,-14,-163,36,-106,36,36,36,36,36,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,36,-74,-184,-75,-183,-8,-94,-221,36,-150,36,-96,-219,-97,-9,-52,-120,-179,-181,-17,-22,-166,-33,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,36,-27,-168,-28,-29,-30,-31,-32,-72,-99,-212,-182,36,-118,36,-138,-57,-15,-180,-38,-200,]),'DISTINCT':([0,4,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,52,54,56,57,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,113,115,118,119,120,121,122,124,126,127,128,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,153,155,174,175,176,177,178,179,181,183,184,186,188,190,192,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,216,218,219,220,221,222,223,224,225,226,227,228,231,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,261,262,263,264,265,266,267,268,269,271,272,273,274,275,276,277,278,280,282,283,284,],[37,37,-225,-226,37,37,-90,37,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,37,37,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,37,37,-101,-62,37,37,37,37,37,37,37,37,37,37,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,37,-132,-95,-220,-100,-159,37,-98,-92,-218,-157,37,37,-117,-119,-10,-18,-19,-20,-21,37,37,37,37,37,37,-104,-105,-114,-113,-148,-41,-137,-11,-16,-61,-13,-14,-163,37,-106,37,37,37,37,37,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,37,-74,-184,-75,-183,-8,-194,-94,-221,37,-150,37,-96,-219,-97,-9,-52,-120,-179,-181,-17,-22,-166,-33,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,37,-27,-168,-28,-29,-30,-31,-32,-72,-99,-212,-182,37,-118,37,-138,-57,-15,-180,-38,-200,]),'ALL':([0,4,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,52,54,56,57,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,113,115,118,119,120,121,122,124,126,127,128,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,153,155,174,175,176,177,178,179,181,183,184,186,188,190,192,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,216,218,219,220,221,222,223,224,225,226,227,228,231,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,261,262,263,264,265,266,267,268,269,271,272,273,274,275,276,277,278,280,282,283,284,],[38,38,-225,-226,38,38,-90,38,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,38,38,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,38,38,-101,-62,38,38,38,38,38,38,38,38,38,38,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,38,-132,-95,-220,-100,-159,38,-98,-92,-218,-157,38,38,-117,-119,-10,-18,-19,-20,-21,38,38,38,38,38,38,-104,-105,-114,-113,-148,-41,-137,-11,-16,-61,-13,-14,-163,38,-106,38,38,38,38,38,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,38,-74,-184,-75,-183,-8,-194,-94,-221,38,-150,38,-96,-219,-97,-9,-52,-120,-179,-181,-17,-22,-166,-33,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,38,-27,-168,-28,-29,-30,-31,-32,-72,-99,-212,-182,38,-118,38,-138,-57,-15,-180,-38,-200,]),'NULL':([0,4,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,52,54,56,57,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,120,121,122,124,126,127,128,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,153,155,174,175,176,177,178,179,181,183,184,186,188,190,192,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,218,219,220,221,222,223,224,225,226,227,228,231,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,261,262,263,264,265,266,267,268,269,271,272,273,274,275,276,277,278,280,282,283,284,],[39,39,-225,-226,39,39,-90,39,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,39,39,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,39,-12,-101,-62,39,39,39,39,39,39,39,39,39,39,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,39,-98,-92,-218,-157,39,39,-117,-119,-10,-18,-19,-20,-21,39,39,39,39,39,39,-104,-105,-114,-113,-148,-41,-137,-11,-16,-61,-13,-14,-163,39,-106,39,39,39,39,39,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,39,-74,-184,-75,-183,-8,-94,-221,39,-150,39,-96,-219,-97,-9,-52,-120,-179,-181,-17,-22,-166,-33,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,39,-27,-168,-28,-29,-30,-31,-32,-72,-99,-212,-182,39,-118,39,-138,-57,-15,-180,-38,-200,]),'TRUE':([0,4,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,52,54,56,57,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,120,121,122,124,126,127,128,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,153,155,174,175,176,177,178,179,181,183,184,186,188,190,192,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,218,219,220,221,222,223,224,225,226,227,228,231,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,261,262,263,264,265,266,267,268,269,271,272,273,274,275,276,277,278,280,282,283,284,],[40,40,-225,-226,40,40,-90,40,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,40,40,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,40,-12,-101,-62,40,40,40,40,40,40,40,40,40,40,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,40,-98,-92,-218,-157,40,40,-117,-119,-10,-18,-19,-20,-21,40,40,40,40,40,40,-104,-105,-114,-113,-148,-41,-137,-11,-16,-61,-13,-14,-163,40,-106,40,40,40,40,40,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,40,-74,-184,-75,-183,-8,-94,-221,40,-150,40,-96,-219,-97,-9,-52,-120,-179,-181,-17,-22,-166,-33,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,40,-27,-168,-28,-29,-30,-31,-32,-72,-99,-212,-182,40,-118,40,-138,-57,-15,-180,-38,-200,]),'FALSE':([0,4,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,52,54,56,57,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,120,121,122,124,126,127,128,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,153,155,174,175,176,177,178,179,181,183,184,186,188,190,192,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,218,219,220,221,222,223,224,225,226,227,228,231,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,261,262,263,264,265,266,267,268,269,271,272,273,274,275,276,277,278,280,282,283,284,],[41,41,-225,-226,41,41,-90,41,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,41,41,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,41,-12,-101,-62,41,41,41,41,41,41,41,41,41,41,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,41,-98,-92,-218,-157,41,41,-117,-119,-10,-18,-19,-20,-21,41,41,41,41,41,41,-104,-105,-114,-113,-148,-41,-137,-11,-16,-61,-13,-14,-163,41,-106,41,41,41,41,41,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,41,-74,-184,-75,-183,-8,-94,-221,41,-150,41,-96,-219,-97,-9,-52,-120,-179,-181,-17,-22,-166,-33,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,41,-27,-168,-28,-29,-30,-31,-32,-72,-99,-212,-182,41,-118,41,-138,-57,-15,-180,-38,-200,]),'COALESCE':([0,4,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,52,54,56,57,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,120,121,122,124,126,127,128,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,153,155,174,175,176,177,178,179,181,183,184,186,188,190,192,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,218,219,220,221,222,223,224,225,226,227,228,231,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,261,262,263,264,265,266,267,268,269,271,272,273,274,275,276,277,278,280,282,283,284,],[42,42,-225,-226,42,42,-90,42,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,42,42,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,42,-12,-101,-62,42,42,42,42,42,42,42,42,42,42,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,42,-98,-92,-218,-157,42,42,-117,-119,-10,-18,-19,-20,-21,42,42,42,42,42,42,-104,-105,-114,-113,-148,-41,-137,-11,-16,-61,-13,-14,-163,42,-106,42,42,42,42,42,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,42,-74,-184,-75,-183,-8,-94,-221,42,-150,42,-96,-219,-97,-9,-52,-120,-179,-181,-17,-22,-166,-33,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,42,-27,-168,-28,-29,-30,-31,-32,-72,-99,-212,-182,42,-118,42,-138,-57,-15,-180,-38,-200,]),'CAST':([0,4,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,52,54,56,57,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,120,121,122,124,126,127,128,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,153,155,174,175,176,177,178,179,181,183,184,186,188,190,192,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,218,219,220,221,222,223,224,225,226,227,228,231,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,261,262,263,264,265,266,267,268,269,271,272,273,274,275,276,277,278,280,282,283,284,],[43,43,-225,-226,43,43,-90,43,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,43,43,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,43,-12,-101,-62,43,43,43,43,43,43,43,43,43,43,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,43,-98,-92,-218,-157,43,43,-117,-119,-10,-18,-19,-20,-21,43,43,43,43,43,43,-104,-105,-114,-113,-148,-41,-137,-11,-16,-61,-13,-14,-163,43,-106,43,43,43,43,43,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,43,-74,-184,-75,-183,-8,-94,-221,43,-150,43,-96,-219,-97,-9,-52,-120,-179,-181,-17,-22,-166,-33,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,43,-27,-168,-28,-29,-30,-31,-32,-72,-99,-212,-182,43,-118,43,-138,-57,-15,-180,-38,-200,]),'CONCAT':([0,4,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,52,54,56,57,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,120,121,122,124,126,127,128,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,153,155,174,175,176,177,178,179,181,183,184,186,188,190,192,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,218,219,220,221,222,223,224,225,226,227,228,231,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,261,262,263,264,265,266,267,268,269,271,272,273,274,275,276,277,278,280,282,283,284,],[44,44,-225,-226,44,44,-90,44,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,44,44,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,44,-12,-101,-62,44,44,44,44,44,44,44,44,44,44,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,44,-98,-92,-218,-157,44,44,-117,-119,-10,-18,-19,-20,-21,44,44,44,44,44,44,-104,-105,-114,-113,-148,-41,-137,-11,-16,-61,-13,-14,-163,44,-106,44,44,44,44,44,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,44,-74,-184,-75,-183,-8,-94,-221,44,-150,44,-96,-219,-97,-9,-52,-120,-179,-181,-17,-22,-166,-33,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,44,-27,-168,-28,-29,-30,-31,-32,-72,-99,-212,-182,44,-118,44,-138,-57,-15,-180,-38,-200,]),'ASC':([0,4,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,52,54,56,57,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,120,121,122,124,126,127,128,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,153,155,174,175,176,177,178,179,181,183,184,186,188,190,192,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,218,219,220,221,222,223,224,225,226,227,228,231,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,261,262,263,264,265,266,267,268,269,271,272,273,274,275,276,277,278,280,282,283,284,],[45,45,-225,-226,45,45,-90,45,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,45,45,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,45,-12,-101,-62,45,45,45,45,45,45,45,45,45,45,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,45,-98,-92,-218,-157,45,45,-117,-119,-10,-18,-19,-20,-21,45,45,45,45,45,45,-104,-105,-114,-113,-148,-41,-137,-11,-16,-61,-13,-14,-163,45,-106,45,45,45,45,45,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,45,-74,-184,-75,-183,-8,-94,-221,45,-150,45,-96,-219,-97,-9,-52,-120,-179,-181,-17,-22,-166,-33,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,45,-27,-168,-28,-29,-30,-31,-32,-72,-99,-212,-182,45,-118,45,-138,-57,-15,-180,-38,-200,]),'DESC':([0,4,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,52,54,56,57,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,120,121,122,124,126,127,128,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,153,155,174,175,176,177,178,179,181,183,184,186,188,190,192,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,218,219,220,221,222,223,224,225,226,227,228,231,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,261,262,263,264,265,266,267,268,269,271,272,273,274,275,276,277,278,280,282,283,284,],[46,46,-225,-226,46,46,-90,46,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,46,46,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,46,-12,-101,-62,46,46,46,46,46,46,46,46,46,46,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,46,-98,-92,-218,-157,46,46,-117,-119,-10,-18,-19,-20,-21,46,46,46,46,46,46,-104,-105,-114,-113,-148,-41,-137,-11,-16,-61,-13,-14,-163,46,-106,46,46,46,46,46,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,46,-74,-184,-75,-183,-8,-94,-221,46,-150,46,-96,-219,-97,-9,-52,-120,-179,-181,-17,-22,-166,-33,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,46,-27,-168,-28,-29,-30,-31,-32,-72,-99,-212,-182,46,-118,46,-138,-57,-15,-180,-38,-200,]),'SYMBOL':([0,4,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,52,54,56,57,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,120,121,122,124,126,127,128,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,153,155,174,175,176,177,178,179,181,183,184,186,188,190,192,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,218,219,220,221,222,223,224,225,226,227,228,231,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,261,262,263,264,265,266,267,268,269,271,272,273,274,275,276,277,278,280,282,283,284,],[47,47,-225,-226,47,47,-90,47,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,47,47,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,47,-12,-101,-62,47,47,47,47,47,47,47,47,47,47,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,47,-98,-92,-218,-157,47,47,-117,-119,-10,-18,-19,-20,-21,47,47,47,47,47,47,-104,-105,-114,-113,-148,-41,-137,-11,-16,-61,-13,-14,-163,47,-106,47,47,47,47,47,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,47,-74,-184,-75,-183,-8,-94,-221,47,-150,47,-96,-219,-97,-9,-52,-120,-179,-181,-17,-22,-166,-33,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,47,-27,-168,-28,-29,-30,-31,-32,-72,-99,-212,-182,47,-118,47,-138,-57,-15,-180,-38,-200,]),'LEFT_BRA':([0,4,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,52,54,56,57,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,120,121,122,124,126,127,128,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,153,155,174,175,176,177,178,179,181,183,184,186,188,190,192,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,218,219,220,221,222,223,224,225,226,227,228,231,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,261,262,263,264,265,266,267,268,269,271,272,273,274,275,276,277,278,280,282,283,284,],[51,51,-225,-226,51,51,-90,51,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,51,51,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,51,-12,-101,-62,51,51,51,51,51,51,51,51,51,51,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,51,-98,-92,-218,-157,51,51,-117,-119,-10,-18,-19,-20,-21,51,51,51,51,51,51,-104,-105,-114,-113,-148,-41,-137,-11,-16,-61,-13,-14,-163,51,-106,51,51,51,51,51,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,51,-74,-184,-75,-183,-8,-94,-221,51,-150,51,-96,-219,-97,-9,-52,-120,-179,-181,-17,-22,-166,-33,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,51,-27,-168,-28,-29,-30,-31,-32,-72,-99,-212,-182,51,-118,51,-138,-57,-15,-180,-38,-200,]),'LEFT_PAR':([0,4,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,51,52,54,55,56,57,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,118,119,120,121,122,124,126,127,128,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,153,155,173,174,175,176,177,178,179,181,183,184,186,188,190,192,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,231,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,261,262,263,264,265,266,267,268,269,271,272,273,274,275,276,277,278,280,282,283,284,],[52,52,-225,-226,52,52,-90,52,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,52,52,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,52,-158,-156,52,-149,-12,-101,-62,52,52,52,52,52,52,52,52,52,52,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,52,-36,-37,-132,-133,-95,-220,-100,-159,52,-98,-92,-218,-157,52,52,-117,-119,-10,-18,-19,-20,-21,52,52,52,52,52,52,-104,-105,-114,-113,-148,-41,-137,-211,-11,-16,-61,-13,-14,-163,52,-106,52,52,52,52,52,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,52,-74,-184,-75,-183,-8,52,-34,-35,-194,-195,-94,-221,52,-150,52,-96,-219,-97,-9,-52,-120,-179,-181,-17,-22,-166,-33,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,52,-27,-168,-28,-29,-30,-31,-32,-72,-99,-212,-182,52,-118,52,-138,-57,-15,-180,-38,-200,]),'CASE':([0,4,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,52,54,56,57,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,120,121,122,124,126,127,128,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,153,155,174,175,176,177,178,179,181,183,184,186,188,190,192,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,218,219,220,221,222,223,224,225,226,227,228,231,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,261,262,263,264,265,266,267,268,269,271,272,273,274,275,276,277,278,280,282,283,284,],[53,53,-225,-226,53,53,-90,53,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,53,53,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,53,-12,-101,-62,53,53,53,53,53,53,53,53,53,53,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,53,-98,-92,-218,-157,53,53,-117,-119,-10,-18,-19,-20,-21,53,53,53,53,53,53,-104,-105,-114,-113,-148,-41,-137,-11,-16,-61,-13,-14,-163,53,-106,53,53,53,53,53,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,53,-74,-184,-75,-183,-8,-94,-221,53,-150,53,-96,-219,-97,-9,-52,-120,-179,-181,-17,-22,-166,-33,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,53,-27,-168,-28,-29,-30,-31,-32,-72,-99,-212,-182,53,-118,53,-138,-57,-15,-180,-38,-200,]),'OVER':([0,4,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,52,54,56,57,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,119,120,121,122,124,126,127,128,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,153,155,174,175,176,177,178,179,181,183,184,186,188,190,192,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,218,219,220,221,222,223,224,225,226,227,228,231,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,261,262,263,264,265,266,267,268,269,271,272,273,274,275,276,277,278,280,282,283,284,],[55,55,-225,-226,55,55,-90,55,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,55,55,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,55,-12,-101,-62,55,55,55,55,55,55,55,55,55,55,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,55,-98,-92,-218,-157,55,55,-117,-119,-10,-18,-19,-20,-21,55,55,55,55,55,55,-104,-105,-114,-113,-148,-41,-137,-11,-16,-61,-13,-14,-163,55,-106,55,55,55,55,55,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,55,-74,-184,-75,-183,-8,-94,-221,55,-150,55,-96,-219,-97,-9,-52,-120,-179,-181,-17,-22,-166,-33,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,55,-27,-168,-28,-29,-30,-31,-32,-72,-99,-212,-182,55,-118,55,-138,-57,-15,-180,-38,-200,]),'SELECT':([0,4,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,52,54,56,57,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,118,119,120,121,122,124,126,127,128,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,153,155,174,175,176,177,178,179,181,183,184,186,188,190,192,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,231,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,261,262,263,264,265,266,267,268,269,271,272,273,274,275,276,277,278,280,282,283,284,],[57,57,-225,-226,57,57,-90,57,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,57,57,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,57,-12,-101,-62,57,57,57,57,57,57,57,57,57,57,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,57,-36,-37,-132,-133,-95,-220,-100,-159,57,-98,-92,-218,-157,57,57,-117,-119,-10,-18,-19,-20,-21,57,57,57,57,57,57,-104,-105,-114,-113,-148,-41,-137,-11,-16,-61,-13,-14,-163,57,-106,57,57,57,57,57,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,57,-74,-184,-75,-183,-8,57,-34,-35,-194,-195,-94,-221,57,-150,57,-96,-219,-97,-9,-52,-120,-179,-181,-17,-22,-166,-33,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,57,-27,-168,-28,-29,-30,-31,-32,-72,-99,-212,-182,57,-118,57,-138,-57,-15,-180,-38,-200,]),'$end':([1,2,3,5,6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,58,59,60,73,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,128,136,137,138,139,140,174,175,176,180,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,262,264,265,266,267,268,269,271,273,278,280,283,],[0,-1,-2,-5,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-3,-153,-6,-4,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,-18,-19,-20,-21,-11,-16,-61,-215,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'SEMICOLON':([2,3,5,6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,58,59,60,73,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,128,136,137,138,139,140,174,175,176,180,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,262,264,265,266,267,268,269,271,273,278,280,283,],[59,-2,-5,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-3,-153,-6,59,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,-18,-19,-20,-21,-11,-16,-61,-215,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'GROUP':([3,5,6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,52,60,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,127,128,136,137,138,139,140,172,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,258,259,260,262,264,265,266,267,268,269,271,273,278,279,280,283,],[67,-5,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,67,-156,-6,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-218,-157,-10,67,-19,-20,-21,67,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,67,-59,-60,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-58,-15,-38,]),'ORDER':([3,5,6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,52,60,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,127,128,136,137,138,139,140,172,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,258,259,260,262,264,265,266,267,268,269,271,273,278,279,280,283,],[68,-5,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,68,-156,-6,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-218,-157,-10,68,-19,-20,-21,68,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,68,-59,-60,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-58,-15,-38,]),'CLUSTER':([3,5,6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,52,60,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,127,128,136,137,138,139,140,172,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,258,259,260,262,264,265,266,267,268,269,271,273,278,279,280,283,],[69,-5,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,69,-156,-6,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-218,-157,-10,69,-19,-20,-21,69,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,69,-59,-60,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-58,-15,-38,]),'DISTRIBUTE':([3,5,6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,52,60,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,127,128,136,137,138,139,140,172,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,258,259,260,262,264,265,266,267,268,269,271,273,278,279,280,283,],[70,-5,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,70,-156,-6,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-218,-157,-10,70,-19,-20,-21,70,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,70,-59,-60,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-58,-15,-38,]),'SORT':([3,5,6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,52,60,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,127,128,136,137,138,139,140,172,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,258,259,260,262,264,265,266,267,268,269,271,273,278,279,280,283,],[71,-5,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,71,-156,-6,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-218,-157,-10,71,-19,-20,-21,71,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,71,-59,-60,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-58,-15,-38,]),'PARTITION':([3,5,6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,52,60,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,127,128,136,137,138,139,140,172,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,258,259,260,262,264,265,266,267,268,269,271,273,278,279,280,283,],[72,-5,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,72,-156,-6,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-218,-157,-10,72,-19,-20,-21,72,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,72,-59,-60,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-58,-15,-38,]),'POINT':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,126,128,136,137,138,139,140,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,262,264,265,266,267,268,269,271,273,278,280,283,],[-225,-226,85,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-92,-157,-10,-18,-19,-20,-21,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'COMPARISON':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,126,128,136,137,138,139,140,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,262,264,265,266,267,268,269,271,273,278,280,283,],[-225,-226,86,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-92,-157,-10,-18,-19,-20,-21,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'AS':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,126,128,136,137,138,139,140,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,262,264,265,266,267,268,269,271,273,278,280,283,],[-225,-226,87,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-92,-157,-10,-18,-19,-20,-21,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'IS':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,126,128,136,137,138,139,140,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,262,264,265,266,267,268,269,271,273,278,280,283,],[-225,-226,88,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-92,-157,-10,-18,-19,-20,-21,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'IN':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,31,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,74,77,82,93,94,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,126,128,136,137,138,139,140,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,262,264,265,266,267,268,269,271,273,278,280,283,],[-225,-226,89,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-123,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-62,-90,89,-65,-185,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-92,-157,-10,-18,-19,-20,-21,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'WITH':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,126,128,136,137,138,139,140,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,262,264,265,266,267,268,269,271,273,278,280,283,],[-225,-226,90,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-92,-157,-10,-18,-19,-20,-21,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'AND':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,126,128,136,137,138,139,140,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,262,264,265,266,267,268,269,271,273,278,280,283,],[-225,-226,91,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-92,-157,-10,-18,-19,-20,-21,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'OR':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,126,128,136,137,138,139,140,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,262,264,265,266,267,268,269,271,273,278,280,283,],[-225,-226,92,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-92,-157,-10,-18,-19,-20,-21,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'COMMA':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,123,124,126,128,136,137,138,139,140,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,262,264,265,266,267,268,269,271,273,278,280,283,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,221,-159,221,-98,-92,-157,-10,-18,-19,-20,-21,-11,221,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'RIGHT_BRA':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,117,118,119,120,121,124,128,136,137,138,139,140,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,262,264,265,266,267,268,269,271,273,278,280,283,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,121,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,121,-95,-220,-100,-159,-98,-157,-10,-18,-19,-20,-21,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'RIGHT_PAR':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,52,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,122,123,124,125,126,127,128,136,137,138,139,140,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,222,223,224,225,226,227,228,234,235,237,238,240,242,244,246,258,259,260,262,264,265,266,267,268,269,270,271,273,278,279,280,283,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,128,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-156,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,128,128,-98,128,128,-218,-157,-10,-18,-19,-20,-21,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,128,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,128,-59,-60,-27,-28,-29,-30,-31,-32,-72,128,-99,-182,-57,-58,-15,-38,]),'FROM':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,128,136,137,138,139,140,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,262,264,265,266,267,268,269,271,273,278,280,283,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,147,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,147,-19,-20,-21,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'WHERE':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,128,136,137,138,139,140,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,262,264,265,266,267,268,269,271,273,278,280,283,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,148,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,148,-19,-20,-21,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'LIMIT':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,128,136,137,138,139,140,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,262,264,265,266,267,268,269,271,273,278,280,283,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,149,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,149,-19,-20,-21,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'HAVING':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,128,136,137,138,139,140,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,262,264,265,266,267,268,269,271,273,278,280,283,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,150,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,150,-19,-20,-21,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'OPTION':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,128,136,137,138,139,140,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,262,264,265,266,267,268,269,271,273,278,280,283,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,151,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,151,-19,-20,-21,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'JOIN':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,128,136,137,138,139,140,152,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,249,250,251,252,253,254,255,256,257,262,264,265,266,267,268,269,271,273,278,280,283,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,155,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,155,-19,-20,-21,155,-51,-42,-43,-44,-45,-46,-47,-48,-49,-139,-140,-141,-142,-143,-144,-145,-146,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,-50,-201,-202,-203,-204,-205,-206,-207,-208,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'INNER':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,128,136,137,138,139,140,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,250,251,252,253,254,255,256,257,262,264,265,266,267,268,269,271,273,278,280,283,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,164,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,164,-19,-20,-21,164,-42,-43,-44,-45,-46,-47,-48,-49,-139,-140,-141,-142,-143,-144,-145,-146,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,-201,-202,-203,-204,-205,-206,-207,-208,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'OUTER':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,128,136,137,138,139,140,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,250,251,252,253,254,255,256,257,262,264,265,266,267,268,269,271,273,278,280,283,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,165,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,165,-19,-20,-21,165,-42,-43,-44,-45,-46,-47,-48,-49,-139,-140,-141,-142,-143,-144,-145,-146,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,-201,-202,-203,-204,-205,-206,-207,-208,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'LEFT':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,128,136,137,138,139,140,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,250,251,252,253,254,255,256,257,262,264,265,266,267,268,269,271,273,278,280,283,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,166,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,166,-19,-20,-21,166,-42,-43,-44,-45,-46,-47,-48,-49,-139,-140,-141,-142,-143,-144,-145,-146,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,-201,-202,-203,-204,-205,-206,-207,-208,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'RIGHT':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,128,136,137,138,139,140,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,250,251,252,253,254,255,256,257,262,264,265,266,267,268,269,271,273,278,280,283,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,167,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,167,-19,-20,-21,167,-42,-43,-44,-45,-46,-47,-48,-49,-139,-140,-141,-142,-143,-144,-145,-146,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,-201,-202,-203,-204,-205,-206,-207,-208,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'FULL':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,128,136,137,138,139,140,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,250,251,252,253,254,255,256,257,262,264,265,266,267,268,269,271,273,278,280,283,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,168,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,168,-19,-20,-21,168,-42,-43,-44,-45,-46,-47,-48,-49,-139,-140,-141,-142,-143,-144,-145,-146,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,-201,-202,-203,-204,-205,-206,-207,-208,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'SEMI':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,128,136,137,138,139,140,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,250,251,252,253,254,255,256,257,262,264,265,266,267,268,269,271,273,278,280,283,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,169,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,169,-19,-20,-21,169,-42,-43,-44,-45,-46,-47,-48,-49,-139,-140,-141,-142,-143,-144,-145,-146,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,-201,-202,-203,-204,-205,-206,-207,-208,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'CROSS':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,128,136,137,138,139,140,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,250,251,252,253,254,255,256,257,262,264,265,266,267,268,269,271,273,278,280,283,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,170,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,170,-19,-20,-21,170,-42,-43,-44,-45,-46,-47,-48,-49,-139,-140,-141,-142,-143,-144,-145,-146,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,-201,-202,-203,-204,-205,-206,-207,-208,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'NATURAL':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,128,136,137,138,139,140,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,250,251,252,253,254,255,256,257,262,264,265,266,267,268,269,271,273,278,280,283,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,171,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,171,-19,-20,-21,171,-42,-43,-44,-45,-46,-47,-48,-49,-139,-140,-141,-142,-143,-144,-145,-146,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,-201,-202,-203,-204,-205,-206,-207,-208,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'UNION':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,126,128,136,137,138,139,140,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,262,264,265,266,267,268,269,270,271,273,278,280,283,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,115,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,115,-157,-10,-18,-19,-20,-21,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,115,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,-27,-28,-29,-30,-31,-32,-72,115,-99,-182,-57,-15,-38,]),'EXCEPT':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,126,128,136,137,138,139,140,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,262,264,265,266,267,268,269,270,271,273,278,280,283,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,116,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,116,-157,-10,-18,-19,-20,-21,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,116,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,-39,-27,-28,-29,-30,-31,-32,-72,116,-99,-182,-57,-15,-38,]),'THEN':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,128,136,137,138,139,140,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,230,234,235,237,238,240,242,244,246,262,264,265,266,267,268,269,271,273,278,280,283,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,-18,-19,-20,-21,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,275,-17,-22,-33,-23,-24,-25,-26,-39,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'WHEN':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,53,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,128,130,131,136,137,138,139,140,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,232,234,235,237,238,240,242,244,246,262,264,265,266,267,268,269,271,273,278,280,281,283,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,134,-7,-116,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-178,134,-10,-18,-19,-20,-21,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-56,-17,-22,-33,-23,-24,-25,-26,-39,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-55,-38,]),'ELSE':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,53,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,128,130,131,136,137,138,139,140,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,232,234,235,237,238,240,242,244,246,262,264,265,266,267,268,269,271,273,278,280,281,283,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,135,-7,-116,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-178,135,-10,-18,-19,-20,-21,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-56,-17,-22,-33,-23,-24,-25,-26,-39,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-55,-38,]),'END':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,128,129,131,136,137,138,139,140,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,229,232,234,235,237,238,240,242,244,246,262,264,265,266,267,268,269,271,273,278,280,281,283,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,228,-54,-10,-18,-19,-20,-21,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-53,-56,-17,-22,-33,-23,-24,-25,-26,-39,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-55,-38,]),'ON':([6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,74,77,93,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,118,120,121,124,128,136,137,138,139,140,174,175,176,194,196,198,199,201,203,205,208,210,212,218,219,223,224,225,226,227,228,234,235,237,238,240,242,244,246,262,264,265,266,267,268,269,271,273,278,280,283,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,-18,-19,-20,-21,-11,-16,-61,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-22,-33,-23,-24,-25,-26,277,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'BY':([6,7,61,62,63,64,65,66,67,68,69,70,71,72,182,185,187,189,191,193,],[-225,-226,183,183,183,183,183,183,-107,-108,-109,-110,-111,-112,-169,-170,-171,-172,-173,-174,]),}
+_lr_action_items = {'error':([0,4,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,52,53,55,57,58,75,76,77,78,79,80,81,82,83,84,85,86,87,89,91,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,153,154,155,156,157,159,161,162,163,167,168,169,170,171,172,173,174,175,178,179,180,181,182,183,184,186,188,189,191,193,195,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,262,264,265,269,270,271,272,273,274,275,276,277,278,279,281,282,283,284,285,286,288,289,290,292,],[5,5,-225,-226,127,127,-90,127,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,127,127,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,180,-12,-101,-229,-230,204,204,204,204,204,204,-104,-105,-114,-113,-148,-41,-137,-62,127,127,127,127,127,127,127,127,127,127,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,127,-36,-37,-132,-133,-95,-220,-100,-159,127,-98,-92,-218,-157,127,127,-117,-119,-10,-18,-19,-20,-21,-11,-16,-227,-61,-13,-14,-163,204,-106,204,204,204,204,204,-231,-232,-22,-166,-33,-228,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,127,-74,-184,-75,-183,-8,127,-34,-35,-194,-195,-94,127,-150,-221,127,-96,-219,-97,-9,-52,-120,-179,-181,-17,127,-27,-168,-28,-29,-30,-31,-32,127,-138,-72,-99,-212,-182,127,-118,-57,-15,-38,-200,-180,]),'COMMENT':([0,4,7,8,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,53,54,56,57,58,59,60,62,63,64,65,66,67,68,69,70,71,72,73,77,78,79,80,81,83,84,85,86,87,89,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,129,130,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,149,150,151,153,154,156,157,159,162,163,165,167,168,169,170,176,177,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,202,206,208,210,212,214,215,217,218,219,220,221,222,223,224,226,228,231,233,235,237,238,240,242,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,262,264,269,271,277,278,282,283,284,285,286,290,292,],[7,7,-225,-226,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,7,7,-158,-156,-116,-149,7,-101,7,-153,7,7,7,7,7,7,-107,-108,-109,-110,-111,-112,7,7,7,7,7,-104,-105,-114,-113,-148,7,-137,7,7,7,7,7,7,7,7,-139,-140,-141,-142,-143,-144,-145,-146,7,7,7,7,7,7,7,7,7,7,-154,-151,-115,-124,-125,-147,-122,-121,-185,-214,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,7,7,-132,-133,7,-220,-159,7,7,-218,-157,-178,7,7,-117,-119,7,-211,7,7,-163,-215,7,-169,-106,7,-170,7,-171,7,-172,7,-173,7,-174,-166,-167,-176,-175,-210,7,-199,-201,-202,-203,-204,-205,-206,-207,-208,-216,-213,-177,-186,-187,-209,7,-184,-183,7,7,7,-194,-195,7,7,-150,-221,7,7,-219,7,7,7,-120,-179,-181,7,-168,7,-138,-212,-182,7,-118,7,-200,-180,]),'COMMENT_ALONE':([0,4,7,8,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,53,54,56,57,58,59,60,62,63,64,65,66,67,68,69,70,71,72,73,77,78,79,80,81,83,84,85,86,87,89,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,129,130,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,149,150,151,153,154,156,157,159,162,163,165,167,168,169,170,176,177,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,202,206,208,210,212,214,215,217,218,219,220,221,222,223,224,226,228,231,233,235,237,238,240,242,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,262,264,269,271,277,278,282,283,284,285,286,290,292,],[8,8,-225,-226,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,8,8,-158,-156,-116,-149,8,-101,8,-153,8,8,8,8,8,8,-107,-108,-109,-110,-111,-112,8,8,8,8,8,-104,-105,-114,-113,-148,8,-137,8,8,8,8,8,8,8,8,-139,-140,-141,-142,-143,-144,-145,-146,8,8,8,8,8,8,8,8,8,8,-154,-151,-115,-124,-125,-147,-122,-121,-185,-214,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,8,8,-132,-133,8,-220,-159,8,8,-218,-157,-178,8,8,-117,-119,8,-211,8,8,-163,-215,8,-169,-106,8,-170,8,-171,8,-172,8,-173,8,-174,-166,-167,-176,-175,-210,8,-199,-201,-202,-203,-204,-205,-206,-207,-208,-216,-213,-177,-186,-187,-209,8,-184,-183,8,8,8,-194,-195,8,8,-150,-221,8,8,-219,8,8,8,-120,-179,-181,8,-168,8,-138,-212,-182,8,-118,8,-200,-180,]),'NOT':([0,4,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,52,53,55,57,58,75,76,77,78,79,80,81,82,83,84,85,86,87,89,91,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,154,155,156,157,159,161,162,163,167,168,169,170,171,172,173,174,175,178,179,180,181,182,183,184,186,188,189,191,193,195,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,249,250,251,252,253,254,255,256,257,258,259,262,264,265,269,270,271,272,273,274,275,276,277,278,279,281,282,283,284,285,286,288,289,290,292,],[32,32,-225,-226,32,32,-90,32,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,32,32,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,32,-12,-101,-229,-230,32,32,32,32,32,32,-104,-105,-114,-113,-148,-41,-137,-62,32,32,32,32,32,32,32,32,32,32,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,32,-98,-92,-218,-157,32,32,-117,-119,-10,-18,-19,-20,-21,-11,-16,-227,-61,-13,-14,-163,32,-106,32,32,32,32,32,-231,-232,-22,-166,-33,-228,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,32,-74,-184,-75,-183,-8,-94,32,-150,-221,32,-96,-219,-97,-9,-52,-120,-179,-181,-17,32,-27,-168,-28,-29,-30,-31,-32,32,-138,-72,-99,-212,-182,32,-118,-57,-15,-38,-200,-180,]),'BETWEEN':([0,4,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,52,53,55,57,58,75,76,77,78,79,80,81,82,83,84,85,86,87,89,91,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,154,155,156,157,159,161,162,163,167,168,169,170,171,172,173,174,175,178,179,180,181,182,183,184,186,188,189,191,193,195,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,249,250,251,252,253,254,255,256,257,258,259,262,264,265,269,270,271,272,273,274,275,276,277,278,279,281,282,283,284,285,286,288,289,290,292,],[33,33,-225,-226,33,33,-90,33,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,33,33,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,33,-12,-101,-229,-230,33,33,33,33,33,33,-104,-105,-114,-113,-148,-41,-137,-62,33,33,33,33,33,33,33,33,33,33,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,33,-98,-92,-218,-157,33,33,-117,-119,-10,-18,-19,-20,-21,-11,-16,-227,-61,-13,-14,-163,33,-106,33,33,33,33,33,-231,-232,-22,-166,-33,-228,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,33,-74,-184,-75,-183,-8,-94,33,-150,-221,33,-96,-219,-97,-9,-52,-120,-179,-181,-17,33,-27,-168,-28,-29,-30,-31,-32,33,-138,-72,-99,-212,-182,33,-118,-57,-15,-38,-200,-180,]),'LABEL':([0,4,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,52,53,55,57,58,75,76,77,78,79,80,81,82,83,84,85,86,87,89,91,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,154,155,156,157,159,161,162,163,167,168,169,170,171,172,173,174,175,178,179,180,181,182,183,184,186,188,189,191,193,195,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,249,250,251,252,253,254,255,256,257,258,259,262,264,265,269,270,271,272,273,274,275,276,277,278,279,281,282,283,284,285,286,288,289,290,292,],[34,34,-225,-226,34,34,-90,34,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,34,34,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,34,-12,-101,-229,-230,34,34,34,34,34,34,-104,-105,-114,-113,-148,-41,-137,-62,34,34,34,34,34,34,34,34,34,34,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,34,-98,-92,-218,-157,34,34,-117,-119,-10,-18,-19,-20,-21,-11,-16,-227,-61,-13,-14,-163,34,-106,34,34,34,34,34,-231,-232,-22,-166,-33,-228,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,34,-74,-184,-75,-183,-8,-94,34,-150,-221,34,-96,-219,-97,-9,-52,-120,-179,-181,-17,34,-27,-168,-28,-29,-30,-31,-32,34,-138,-72,-99,-212,-182,34,-118,-57,-15,-38,-200,-180,]),'STRING_SIMPLE':([0,4,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,52,53,55,57,58,75,76,77,78,79,80,81,82,83,84,85,86,87,89,91,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,154,155,156,157,159,161,162,163,167,168,169,170,171,172,173,174,175,178,179,180,181,182,183,184,186,188,189,191,193,195,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,249,250,251,252,253,254,255,256,257,258,259,262,264,265,269,270,271,272,273,274,275,276,277,278,279,281,282,283,284,285,286,288,289,290,292,],[35,35,-225,-226,35,35,-90,35,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,35,35,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,35,-12,-101,-229,-230,35,35,35,35,35,35,-104,-105,-114,-113,-148,-41,-137,-62,35,35,35,35,35,35,35,35,35,35,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,35,-98,-92,-218,-157,35,35,-117,-119,-10,-18,-19,-20,-21,-11,-16,-227,-61,-13,-14,-163,35,-106,35,35,35,35,35,-231,-232,-22,-166,-33,-228,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,35,-74,-184,-75,-183,-8,-94,35,-150,-221,35,-96,-219,-97,-9,-52,-120,-179,-181,-17,35,-27,-168,-28,-29,-30,-31,-32,35,-138,-72,-99,-212,-182,35,-118,-57,-15,-38,-200,-180,]),'STRING_DOUBLE':([0,4,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,52,53,55,57,58,75,76,77,78,79,80,81,82,83,84,85,86,87,89,91,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,154,155,156,157,159,161,162,163,167,168,169,170,171,172,173,174,175,178,179,180,181,182,183,184,186,188,189,191,193,195,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,249,250,251,252,253,254,255,256,257,258,259,262,264,265,269,270,271,272,273,274,275,276,277,278,279,281,282,283,284,285,286,288,289,290,292,],[36,36,-225,-226,36,36,-90,36,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,36,36,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,36,-12,-101,-229,-230,36,36,36,36,36,36,-104,-105,-114,-113,-148,-41,-137,-62,36,36,36,36,36,36,36,36,36,36,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,36,-98,-92,-218,-157,36,36,-117,-119,-10,-18,-19,-20,-21,-11,-16,-227,-61,-13,-14,-163,36,-106,36,36,36,36,36,-231,-232,-22,-166,-33,-228,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,36,-74,-184,-75,-183,-8,-94,36,-150,-221,36,-96,-219,-97,-9,-52,-120,-179,-181,-17,36,-27,-168,-28,-29,-30,-31,-32,36,-138,-72,-99,-212,-182,36,-118,-57,-15,-38,-200,-180,]),'STRING_GRAVE':([0,4,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,52,53,55,57,58,75,76,77,78,79,80,81,82,83,84,85,86,87,89,91,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,154,155,156,157,159,161,162,163,167,168,169,170,171,172,173,174,175,178,179,180,181,182,183,184,186,188,189,191,193,195,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,249,250,251,252,253,254,255,256,257,258,259,262,264,265,269,270,271,272,273,274,275,276,277,278,279,281,282,283,284,285,286,288,289,290,292,],[37,37,-225,-226,37,37,-90,37,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,37,37,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,37,-12,-101,-229,-230,37,37,37,37,37,37,-104,-105,-114,-113,-148,-41,-137,-62,37,37,37,37,37,37,37,37,37,37,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,37,-98,-92,-218,-157,37,37,-117,-119,-10,-18,-19,-20,-21,-11,-16,-227,-61,-13,-14,-163,37,-106,37,37,37,37,37,-231,-232,-22,-166,-33,-228,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,37,-74,-184,-75,-183,-8,-94,37,-150,-221,37,-96,-219,-97,-9,-52,-120,-179,-181,-17,37,-27,-168,-28,-29,-30,-31,-32,37,-138,-72,-99,-212,-182,37,-118,-57,-15,-38,-200,-180,]),'DISTINCT':([0,4,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,52,53,55,57,58,75,76,77,78,79,80,81,82,83,84,85,86,87,89,91,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,150,153,154,155,156,157,159,161,162,163,167,168,169,170,171,172,173,174,175,178,179,180,181,182,183,184,186,188,189,191,193,195,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,247,249,250,251,252,253,254,255,256,257,258,259,262,264,265,269,270,271,272,273,274,275,276,277,278,279,281,282,283,284,285,286,288,289,290,292,],[38,38,-225,-226,38,38,-90,38,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,38,38,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,38,38,-101,-229,-230,38,38,38,38,38,38,-104,-105,-114,-113,-148,-41,-137,-62,38,38,38,38,38,38,38,38,38,38,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,38,-132,-95,-220,-100,-159,38,-98,-92,-218,-157,38,38,-117,-119,-10,-18,-19,-20,-21,-11,-16,-227,-61,-13,-14,-163,38,-106,38,38,38,38,38,-231,-232,-22,-166,-33,-228,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,38,-74,-184,-75,-183,-8,-194,-94,38,-150,-221,38,-96,-219,-97,-9,-52,-120,-179,-181,-17,38,-27,-168,-28,-29,-30,-31,-32,38,-138,-72,-99,-212,-182,38,-118,-57,-15,-38,-200,-180,]),'ALL':([0,4,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,52,53,55,57,58,75,76,77,78,79,80,81,82,83,84,85,86,87,89,91,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,150,153,154,155,156,157,159,161,162,163,167,168,169,170,171,172,173,174,175,178,179,180,181,182,183,184,186,188,189,191,193,195,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,247,249,250,251,252,253,254,255,256,257,258,259,262,264,265,269,270,271,272,273,274,275,276,277,278,279,281,282,283,284,285,286,288,289,290,292,],[39,39,-225,-226,39,39,-90,39,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,39,39,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,39,39,-101,-229,-230,39,39,39,39,39,39,-104,-105,-114,-113,-148,-41,-137,-62,39,39,39,39,39,39,39,39,39,39,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,39,-132,-95,-220,-100,-159,39,-98,-92,-218,-157,39,39,-117,-119,-10,-18,-19,-20,-21,-11,-16,-227,-61,-13,-14,-163,39,-106,39,39,39,39,39,-231,-232,-22,-166,-33,-228,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,39,-74,-184,-75,-183,-8,-194,-94,39,-150,-221,39,-96,-219,-97,-9,-52,-120,-179,-181,-17,39,-27,-168,-28,-29,-30,-31,-32,39,-138,-72,-99,-212,-182,39,-118,-57,-15,-38,-200,-180,]),'NULL':([0,4,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,52,53,55,57,58,75,76,77,78,79,80,81,82,83,84,85,86,87,89,91,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,154,155,156,157,159,161,162,163,167,168,169,170,171,172,173,174,175,178,179,180,181,182,183,184,186,188,189,191,193,195,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,249,250,251,252,253,254,255,256,257,258,259,262,264,265,269,270,271,272,273,274,275,276,277,278,279,281,282,283,284,285,286,288,289,290,292,],[40,40,-225,-226,40,40,-90,40,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,40,40,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,40,-12,-101,-229,-230,40,40,40,40,40,40,-104,-105,-114,-113,-148,-41,-137,-62,40,40,40,40,40,40,40,40,40,40,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,40,-98,-92,-218,-157,40,40,-117,-119,-10,-18,-19,-20,-21,-11,-16,-227,-61,-13,-14,-163,40,-106,40,40,40,40,40,-231,-232,-22,-166,-33,-228,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,40,-74,-184,-75,-183,-8,-94,40,-150,-221,40,-96,-219,-97,-9,-52,-120,-179,-181,-17,40,-27,-168,-28,-29,-30,-31,-32,40,-138,-72,-99,-212,-182,40,-118,-57,-15,-38,-200,-180,]),'TRUE':([0,4,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,52,53,55,57,58,75,76,77,78,79,80,81,82,83,84,85,86,87,89,91,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,154,155,156,157,159,161,162,163,167,168,169,170,171,172,173,174,175,178,179,180,181,182,183,184,186,188,189,191,193,195,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,249,250,251,252,253,254,255,256,257,258,259,262,264,265,269,270,271,272,273,274,275,276,277,278,279,281,282,283,284,285,286,288,289,290,292,],[41,41,-225,-226,41,41,-90,41,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,41,41,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,41,-12,-101,-229,-230,41,41,41,41,41,41,-104,-105,-114,-113,-148,-41,-137,-62,41,41,41,41,41,41,41,41,41,41,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,41,-98,-92,-218,-157,41,41,-117,-119,-10,-18,-19,-20,-21,-11,-16,-227,-61,-13,-14,-163,41,-106,41,41,41,41,41,-231,-232,-22,-166,-33,-228,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,41,-74,-184,-75,-183,-8,-94,41,-150,-221,41,-96,-219,-97,-9,-52,-120,-179,-181,-17,41,-27,-168,-28,-29,-30,-31,-32,41,-138,-72,-99,-212,-182,41,-118,-57,-15,-38,-200,-180,]),'FALSE':([0,4,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,52,53,55,57,58,75,76,77,78,79,80,81,82,83,84,85,86,87,89,91,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,154,155,156,157,159,161,162,163,167,168,169,170,171,172,173,174,175,178,179,180,181,182,183,184,186,188,189,191,193,195,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,249,250,251,252,253,254,255,256,257,258,259,262,264,265,269,270,271,272,273,274,275,276,277,278,279,281,282,283,284,285,286,288,289,290,292,],[42,42,-225,-226,42,42,-90,42,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,42,42,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,42,-12,-101,-229,-230,42,42,42,42,42,42,-104,-105,-114,-113,-148,-41,-137,-62,42,42,42,42,42,42,42,42,42,42,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,42,-98,-92,-218,-157,42,42,-117,-119,-10,-18,-19,-20,-21,-11,-16,-227,-61,-13,-14,-163,42,-106,42,42,42,42,42,-231,-232,-22,-166,-33,-228,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,42,-74,-184,-75,-183,-8,-94,42,-150,-221,42,-96,-219,-97,-9,-52,-120,-179,-181,-17,42,-27,-168,-28,-29,-30,-31,-32,42,-138,-72,-99,-212,-182,42,-118,-57,-15,-38,-200,-180,]),'COALESCE':([0,4,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,52,53,55,57,58,75,76,77,78,79,80,81,82,83,84,85,86,87,89,91,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,154,155,156,157,159,161,162,163,167,168,169,170,171,172,173,174,175,178,179,180,181,182,183,184,186,188,189,191,193,195,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,249,250,251,252,253,254,255,256,257,258,259,262,264,265,269,270,271,272,273,274,275,276,277,278,279,281,282,283,284,285,286,288,289,290,292,],[43,43,-225,-226,43,43,-90,43,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,43,43,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,43,-12,-101,-229,-230,43,43,43,43,43,43,-104,-105,-114,-113,-148,-41,-137,-62,43,43,43,43,43,43,43,43,43,43,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,43,-98,-92,-218,-157,43,43,-117,-119,-10,-18,-19,-20,-21,-11,-16,-227,-61,-13,-14,-163,43,-106,43,43,43,43,43,-231,-232,-22,-166,-33,-228,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,43,-74,-184,-75,-183,-8,-94,43,-150,-221,43,-96,-219,-97,-9,-52,-120,-179,-181,-17,43,-27,-168,-28,-29,-30,-31,-32,43,-138,-72,-99,-212,-182,43,-118,-57,-15,-38,-200,-180,]),'CAST':([0,4,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,52,53,55,57,58,75,76,77,78,79,80,81,82,83,84,85,86,87,89,91,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,154,155,156,157,159,161,162,163,167,168,169,170,171,172,173,174,175,178,179,180,181,182,183,184,186,188,189,191,193,195,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,249,250,251,252,253,254,255,256,257,258,259,262,264,265,269,270,271,272,273,274,275,276,277,278,279,281,282,283,284,285,286,288,289,290,292,],[44,44,-225,-226,44,44,-90,44,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,44,44,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,44,-12,-101,-229,-230,44,44,44,44,44,44,-104,-105,-114,-113,-148,-41,-137,-62,44,44,44,44,44,44,44,44,44,44,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,44,-98,-92,-218,-157,44,44,-117,-119,-10,-18,-19,-20,-21,-11,-16,-227,-61,-13,-14,-163,44,-106,44,44,44,44,44,-231,-232,-22,-166,-33,-228,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,44,-74,-184,-75,-183,-8,-94,44,-150,-221,44,-96,-219,-97,-9,-52,-120,-179,-181,-17,44,-27,-168,-28,-29,-30,-31,-32,44,-138,-72,-99,-212,-182,44,-118,-57,-15,-38,-200,-180,]),'CONCAT':([0,4,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,52,53,55,57,58,75,76,77,78,79,80,81,82,83,84,85,86,87,89,91,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,154,155,156,157,159,161,162,163,167,168,169,170,171,172,173,174,175,178,179,180,181,182,183,184,186,188,189,191,193,195,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,249,250,251,252,253,254,255,256,257,258,259,262,264,265,269,270,271,272,273,274,275,276,277,278,279,281,282,283,284,285,286,288,289,290,292,],[45,45,-225,-226,45,45,-90,45,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,45,45,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,45,-12,-101,-229,-230,45,45,45,45,45,45,-104,-105,-114,-113,-148,-41,-137,-62,45,45,45,45,45,45,45,45,45,45,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,45,-98,-92,-218,-157,45,45,-117,-119,-10,-18,-19,-20,-21,-11,-16,-227,-61,-13,-14,-163,45,-106,45,45,45,45,45,-231,-232,-22,-166,-33,-228,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,45,-74,-184,-75,-183,-8,-94,45,-150,-221,45,-96,-219,-97,-9,-52,-120,-179,-181,-17,45,-27,-168,-28,-29,-30,-31,-32,45,-138,-72,-99,-212,-182,45,-118,-57,-15,-38,-200,-180,]),'ASC':([0,4,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,52,53,55,57,58,75,76,77,78,79,80,81,82,83,84,85,86,87,89,91,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,154,155,156,157,159,161,162,163,167,168,169,170,171,172,173,174,175,178,179,180,181,182,183,184,186,188,189,191,193,195,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,249,250,251,252,253,254,255,256,257,258,259,262,264,265,269,270,271,272,273,274,275,276,277,278,279,281,282,283,284,285,286,288,289,290,292,],[46,46,-225,-226,46,46,-90,46,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,46,46,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,46,-12,-101,-229,-230,46,46,46,46,46,46,-104,-105,-114,-113,-148,-41,-137,-62,46,46,46,46,46,46,46,46,46,46,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,46,-98,-92,-218,-157,46,46,-117,-119,-10,-18,-19,-20,-21,-11,-16,-227,-61,-13,-14,-163,46,-106,46,46,46,46,46,-231,-232,-22,-166,-33,-228,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,46,-74,-184,-75,-183,-8,-94,46,-150,-221,46,-96,-219,-97,-9,-52,-120,-179,-181,-17,46,-27,-168,-28,-29,-30,-31,-32,46,-138,-72,-99,-212,-182,46,-118,-57,-15,-38,-200,-180,]),'DESC':([0,4,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,52,53,55,57,58,75,76,77,78,79,80,81,82,83,84,85,86,87,89,91,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,154,155,156,157,159,161,162,163,167,168,169,170,171,172,173,174,175,178,179,180,181,182,183,184,186,188,189,191,193,195,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,249,250,251,252,253,254,255,256,257,258,259,262,264,265,269,270,271,272,273,274,275,276,277,278,279,281,282,283,284,285,286,288,289,290,292,],[47,47,-225,-226,47,47,-90,47,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,47,47,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,47,-12,-101,-229,-230,47,47,47,47,47,47,-104,-105,-114,-113,-148,-41,-137,-62,47,47,47,47,47,47,47,47,47,47,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,47,-98,-92,-218,-157,47,47,-117,-119,-10,-18,-19,-20,-21,-11,-16,-227,-61,-13,-14,-163,47,-106,47,47,47,47,47,-231,-232,-22,-166,-33,-228,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,47,-74,-184,-75,-183,-8,-94,47,-150,-221,47,-96,-219,-97,-9,-52,-120,-179,-181,-17,47,-27,-168,-28,-29,-30,-31,-32,47,-138,-72,-99,-212,-182,47,-118,-57,-15,-38,-200,-180,]),'SYMBOL':([0,4,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,52,53,55,57,58,75,76,77,78,79,80,81,82,83,84,85,86,87,89,91,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,154,155,156,157,159,161,162,163,167,168,169,170,171,172,173,174,175,178,179,180,181,182,183,184,186,188,189,191,193,195,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,249,250,251,252,253,254,255,256,257,258,259,262,264,265,269,270,271,272,273,274,275,276,277,278,279,281,282,283,284,285,286,288,289,290,292,],[48,48,-225,-226,48,48,-90,48,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,48,48,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,48,-12,-101,-229,-230,48,48,48,48,48,48,-104,-105,-114,-113,-148,-41,-137,-62,48,48,48,48,48,48,48,48,48,48,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,48,-98,-92,-218,-157,48,48,-117,-119,-10,-18,-19,-20,-21,-11,-16,-227,-61,-13,-14,-163,48,-106,48,48,48,48,48,-231,-232,-22,-166,-33,-228,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,48,-74,-184,-75,-183,-8,-94,48,-150,-221,48,-96,-219,-97,-9,-52,-120,-179,-181,-17,48,-27,-168,-28,-29,-30,-31,-32,48,-138,-72,-99,-212,-182,48,-118,-57,-15,-38,-200,-180,]),'LEFT_BRA':([0,4,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,52,53,55,57,58,75,76,77,78,79,80,81,82,83,84,85,86,87,89,91,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,154,155,156,157,159,161,162,163,167,168,169,170,171,172,173,174,175,178,179,180,181,182,183,184,186,188,189,191,193,195,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,249,250,251,252,253,254,255,256,257,258,259,262,264,265,269,270,271,272,273,274,275,276,277,278,279,281,282,283,284,285,286,288,289,290,292,],[52,52,-225,-226,52,52,-90,52,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,52,52,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,52,-12,-101,-229,-230,52,52,52,52,52,52,-104,-105,-114,-113,-148,-41,-137,-62,52,52,52,52,52,52,52,52,52,52,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,52,-98,-92,-218,-157,52,52,-117,-119,-10,-18,-19,-20,-21,-11,-16,-227,-61,-13,-14,-163,52,-106,52,52,52,52,52,-231,-232,-22,-166,-33,-228,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,52,-74,-184,-75,-183,-8,-94,52,-150,-221,52,-96,-219,-97,-9,-52,-120,-179,-181,-17,52,-27,-168,-28,-29,-30,-31,-32,52,-138,-72,-99,-212,-182,52,-118,-57,-15,-38,-200,-180,]),'LEFT_PAR':([0,4,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,55,56,57,58,75,76,77,78,79,80,81,82,83,84,85,86,87,89,91,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,153,154,155,156,157,159,161,162,163,167,168,169,170,171,172,173,174,175,177,178,179,180,181,182,183,184,186,188,189,191,193,195,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,262,264,265,269,270,271,272,273,274,275,276,277,278,279,281,282,283,284,285,286,288,289,290,292,],[53,53,-225,-226,53,53,-90,53,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,53,53,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,53,-158,-156,53,-149,-12,-101,-229,-230,53,53,53,53,53,53,-104,-105,-114,-113,-148,-41,-137,-62,53,53,53,53,53,53,53,53,53,53,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,53,-36,-37,-132,-133,-95,-220,-100,-159,53,-98,-92,-218,-157,53,53,-117,-119,-10,-18,-19,-20,-21,-211,-11,-16,-227,-61,-13,-14,-163,53,-106,53,53,53,53,53,-231,-232,-22,-166,-33,-228,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,53,-74,-184,-75,-183,-8,53,-34,-35,-194,-195,-94,53,-150,-221,53,-96,-219,-97,-9,-52,-120,-179,-181,-17,53,-27,-168,-28,-29,-30,-31,-32,53,-138,-72,-99,-212,-182,53,-118,-57,-15,-38,-200,-180,]),'CASE':([0,4,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,52,53,55,57,58,75,76,77,78,79,80,81,82,83,84,85,86,87,89,91,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,154,155,156,157,159,161,162,163,167,168,169,170,171,172,173,174,175,178,179,180,181,182,183,184,186,188,189,191,193,195,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,249,250,251,252,253,254,255,256,257,258,259,262,264,265,269,270,271,272,273,274,275,276,277,278,279,281,282,283,284,285,286,288,289,290,292,],[54,54,-225,-226,54,54,-90,54,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,54,54,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,54,-12,-101,-229,-230,54,54,54,54,54,54,-104,-105,-114,-113,-148,-41,-137,-62,54,54,54,54,54,54,54,54,54,54,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,54,-98,-92,-218,-157,54,54,-117,-119,-10,-18,-19,-20,-21,-11,-16,-227,-61,-13,-14,-163,54,-106,54,54,54,54,54,-231,-232,-22,-166,-33,-228,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,54,-74,-184,-75,-183,-8,-94,54,-150,-221,54,-96,-219,-97,-9,-52,-120,-179,-181,-17,54,-27,-168,-28,-29,-30,-31,-32,54,-138,-72,-99,-212,-182,54,-118,-57,-15,-38,-200,-180,]),'OVER':([0,4,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,52,53,55,57,58,75,76,77,78,79,80,81,82,83,84,85,86,87,89,91,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,154,155,156,157,159,161,162,163,167,168,169,170,171,172,173,174,175,178,179,180,181,182,183,184,186,188,189,191,193,195,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,249,250,251,252,253,254,255,256,257,258,259,262,264,265,269,270,271,272,273,274,275,276,277,278,279,281,282,283,284,285,286,288,289,290,292,],[56,56,-225,-226,56,56,-90,56,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,56,56,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,56,-12,-101,-229,-230,56,56,56,56,56,56,-104,-105,-114,-113,-148,-41,-137,-62,56,56,56,56,56,56,56,56,56,56,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-220,-100,-159,56,-98,-92,-218,-157,56,56,-117,-119,-10,-18,-19,-20,-21,-11,-16,-227,-61,-13,-14,-163,56,-106,56,56,56,56,56,-231,-232,-22,-166,-33,-228,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,56,-74,-184,-75,-183,-8,-94,56,-150,-221,56,-96,-219,-97,-9,-52,-120,-179,-181,-17,56,-27,-168,-28,-29,-30,-31,-32,56,-138,-72,-99,-212,-182,56,-118,-57,-15,-38,-200,-180,]),'SELECT':([0,4,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,52,53,55,57,58,75,76,77,78,79,80,81,82,83,84,85,86,87,89,91,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,153,154,155,156,157,159,161,162,163,167,168,169,170,171,172,173,174,175,178,179,180,181,182,183,184,186,188,189,191,193,195,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,262,264,265,269,270,271,272,273,274,275,276,277,278,279,281,282,283,284,285,286,288,289,290,292,],[58,58,-225,-226,58,58,-90,58,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,58,58,-123,-134,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-156,58,-12,-101,-229,-230,58,58,58,58,58,58,-104,-105,-114,-113,-148,-41,-137,-62,58,58,58,58,58,58,58,58,58,58,-154,-151,-115,-124,-125,-147,-122,-121,-65,-185,-214,-73,-196,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,58,-36,-37,-132,-133,-95,-220,-100,-159,58,-98,-92,-218,-157,58,58,-117,-119,-10,-18,-19,-20,-21,-11,-16,-227,-61,-13,-14,-163,58,-106,58,58,58,58,58,-231,-232,-22,-166,-33,-228,-23,-167,-24,-176,-25,-175,-26,-210,-39,-40,-199,-63,-216,-66,-213,-67,-68,-177,-69,-186,-70,-187,-71,-209,58,-74,-184,-75,-183,-8,58,-34,-35,-194,-195,-94,58,-150,-221,58,-96,-219,-97,-9,-52,-120,-179,-181,-17,58,-27,-168,-28,-29,-30,-31,-32,58,-138,-72,-99,-212,-182,58,-118,-57,-15,-38,-200,-180,]),'$end':([1,2,3,5,6,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,59,60,61,74,75,76,108,111,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,163,171,172,173,174,175,178,179,180,181,185,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,270,272,273,274,275,276,279,281,283,286,288,289,],[0,-1,-2,-233,-5,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-3,-153,-6,-4,-229,-230,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,-18,-19,-20,-21,-11,-16,-227,-61,-215,-231,-232,-22,-33,-228,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'SEMICOLON':([2,3,5,6,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,59,60,61,74,75,76,108,111,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,163,171,172,173,174,175,178,179,180,181,185,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,270,272,273,274,275,276,279,281,283,286,288,289,],[60,-2,-233,-5,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-3,-153,-6,60,-229,-230,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,-18,-19,-20,-21,-11,-16,-227,-61,-215,-231,-232,-22,-33,-228,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'GROUP':([3,6,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,53,61,75,76,108,111,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,162,163,171,172,173,174,175,176,178,179,180,181,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,266,267,268,270,272,273,274,275,276,279,281,283,286,287,288,289,],[68,-5,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,68,-156,-6,68,68,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-218,-157,-10,68,-19,-20,-21,68,-11,-16,-227,-61,-231,-232,-22,-33,-228,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,68,-59,-60,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-58,-15,-38,]),'ORDER':([3,6,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,53,61,75,76,108,111,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,162,163,171,172,173,174,175,176,178,179,180,181,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,266,267,268,270,272,273,274,275,276,279,281,283,286,287,288,289,],[69,-5,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,69,-156,-6,69,69,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-218,-157,-10,69,-19,-20,-21,69,-11,-16,-227,-61,-231,-232,-22,-33,-228,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,69,-59,-60,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-58,-15,-38,]),'CLUSTER':([3,6,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,53,61,75,76,108,111,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,162,163,171,172,173,174,175,176,178,179,180,181,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,266,267,268,270,272,273,274,275,276,279,281,283,286,287,288,289,],[70,-5,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,70,-156,-6,70,70,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-218,-157,-10,70,-19,-20,-21,70,-11,-16,-227,-61,-231,-232,-22,-33,-228,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,70,-59,-60,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-58,-15,-38,]),'DISTRIBUTE':([3,6,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,53,61,75,76,108,111,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,162,163,171,172,173,174,175,176,178,179,180,181,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,266,267,268,270,272,273,274,275,276,279,281,283,286,287,288,289,],[71,-5,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,71,-156,-6,71,71,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-218,-157,-10,71,-19,-20,-21,71,-11,-16,-227,-61,-231,-232,-22,-33,-228,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,71,-59,-60,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-58,-15,-38,]),'SORT':([3,6,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,53,61,75,76,108,111,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,162,163,171,172,173,174,175,176,178,179,180,181,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,266,267,268,270,272,273,274,275,276,279,281,283,286,287,288,289,],[72,-5,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,72,-156,-6,72,72,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-218,-157,-10,72,-19,-20,-21,72,-11,-16,-227,-61,-231,-232,-22,-33,-228,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,72,-59,-60,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-58,-15,-38,]),'PARTITION':([3,6,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,53,61,75,76,108,111,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,162,163,171,172,173,174,175,176,178,179,180,181,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,266,267,268,270,272,273,274,275,276,279,281,283,286,287,288,289,],[73,-5,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,73,-156,-6,73,73,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-218,-157,-10,73,-19,-20,-21,73,-11,-16,-227,-61,-231,-232,-22,-33,-228,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,73,-59,-60,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-58,-15,-38,]),'FROM':([5,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,75,76,108,111,127,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,163,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,270,272,273,274,275,276,279,281,283,286,288,289,],[83,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,83,83,83,-62,-90,83,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,83,-19,-20,-21,-11,-16,83,-61,-231,-232,-22,-33,83,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'WHERE':([5,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,75,76,108,111,127,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,163,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,270,272,273,274,275,276,279,281,283,286,288,289,],[84,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,84,84,84,-62,-90,84,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,84,-19,-20,-21,-11,-16,84,-61,-231,-232,-22,-33,84,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'LIMIT':([5,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,75,76,108,111,127,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,163,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,270,272,273,274,275,276,279,281,283,286,288,289,],[85,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,85,85,85,-62,-90,85,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,85,-19,-20,-21,-11,-16,85,-61,-231,-232,-22,-33,85,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'HAVING':([5,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,75,76,108,111,127,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,163,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,270,272,273,274,275,276,279,281,283,286,288,289,],[86,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,86,86,86,-62,-90,86,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,86,-19,-20,-21,-11,-16,86,-61,-231,-232,-22,-33,86,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'OPTION':([5,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,75,76,108,111,127,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,163,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,270,272,273,274,275,276,279,281,283,286,288,289,],[87,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,87,87,87,-62,-90,87,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,87,-19,-20,-21,-11,-16,87,-61,-231,-232,-22,-33,87,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'JOIN':([5,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,75,76,88,90,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,127,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,163,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,216,217,218,219,220,221,222,223,224,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,270,272,273,274,275,276,279,281,283,286,288,289,],[91,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,91,91,91,91,-51,-42,-43,-44,-45,-46,-47,-48,-49,-139,-140,-141,-142,-143,-144,-145,-146,-62,-90,91,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,91,-19,-20,-21,-11,-16,91,-61,-231,-232,-22,-33,91,-23,-24,-25,-26,-39,-50,-201,-202,-203,-204,-205,-206,-207,-208,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'INNER':([5,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,75,76,90,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,127,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,163,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,217,218,219,220,221,222,223,224,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,270,272,273,274,275,276,279,281,283,286,288,289,],[100,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,100,100,100,100,-42,-43,-44,-45,-46,-47,-48,-49,-139,-140,-141,-142,-143,-144,-145,-146,-62,-90,100,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,100,-19,-20,-21,-11,-16,100,-61,-231,-232,-22,-33,100,-23,-24,-25,-26,-39,-201,-202,-203,-204,-205,-206,-207,-208,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'OUTER':([5,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,75,76,90,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,127,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,163,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,217,218,219,220,221,222,223,224,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,270,272,273,274,275,276,279,281,283,286,288,289,],[101,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,101,101,101,101,-42,-43,-44,-45,-46,-47,-48,-49,-139,-140,-141,-142,-143,-144,-145,-146,-62,-90,101,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,101,-19,-20,-21,-11,-16,101,-61,-231,-232,-22,-33,101,-23,-24,-25,-26,-39,-201,-202,-203,-204,-205,-206,-207,-208,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'LEFT':([5,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,75,76,90,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,127,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,163,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,217,218,219,220,221,222,223,224,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,270,272,273,274,275,276,279,281,283,286,288,289,],[102,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,102,102,102,102,-42,-43,-44,-45,-46,-47,-48,-49,-139,-140,-141,-142,-143,-144,-145,-146,-62,-90,102,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,102,-19,-20,-21,-11,-16,102,-61,-231,-232,-22,-33,102,-23,-24,-25,-26,-39,-201,-202,-203,-204,-205,-206,-207,-208,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'RIGHT':([5,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,75,76,90,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,127,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,163,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,217,218,219,220,221,222,223,224,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,270,272,273,274,275,276,279,281,283,286,288,289,],[103,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,103,103,103,103,-42,-43,-44,-45,-46,-47,-48,-49,-139,-140,-141,-142,-143,-144,-145,-146,-62,-90,103,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,103,-19,-20,-21,-11,-16,103,-61,-231,-232,-22,-33,103,-23,-24,-25,-26,-39,-201,-202,-203,-204,-205,-206,-207,-208,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'FULL':([5,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,75,76,90,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,127,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,163,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,217,218,219,220,221,222,223,224,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,270,272,273,274,275,276,279,281,283,286,288,289,],[104,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,104,104,104,104,-42,-43,-44,-45,-46,-47,-48,-49,-139,-140,-141,-142,-143,-144,-145,-146,-62,-90,104,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,104,-19,-20,-21,-11,-16,104,-61,-231,-232,-22,-33,104,-23,-24,-25,-26,-39,-201,-202,-203,-204,-205,-206,-207,-208,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'SEMI':([5,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,75,76,90,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,127,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,163,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,217,218,219,220,221,222,223,224,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,270,272,273,274,275,276,279,281,283,286,288,289,],[105,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,105,105,105,105,-42,-43,-44,-45,-46,-47,-48,-49,-139,-140,-141,-142,-143,-144,-145,-146,-62,-90,105,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,105,-19,-20,-21,-11,-16,105,-61,-231,-232,-22,-33,105,-23,-24,-25,-26,-39,-201,-202,-203,-204,-205,-206,-207,-208,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'CROSS':([5,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,75,76,90,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,127,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,163,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,217,218,219,220,221,222,223,224,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,270,272,273,274,275,276,279,281,283,286,288,289,],[106,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,106,106,106,106,-42,-43,-44,-45,-46,-47,-48,-49,-139,-140,-141,-142,-143,-144,-145,-146,-62,-90,106,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,106,-19,-20,-21,-11,-16,106,-61,-231,-232,-22,-33,106,-23,-24,-25,-26,-39,-201,-202,-203,-204,-205,-206,-207,-208,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'NATURAL':([5,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,75,76,90,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,127,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,163,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,217,218,219,220,221,222,223,224,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,270,272,273,274,275,276,279,281,283,286,288,289,],[107,-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,107,107,107,107,-42,-43,-44,-45,-46,-47,-48,-49,-139,-140,-141,-142,-143,-144,-145,-146,-62,-90,107,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,107,-19,-20,-21,-11,-16,107,-61,-231,-232,-22,-33,107,-23,-24,-25,-26,-39,-201,-202,-203,-204,-205,-206,-207,-208,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'POINT':([7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,75,76,108,111,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,161,163,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,270,272,273,274,275,276,279,281,283,286,288,289,],[-225,-226,119,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-229,-230,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-92,-157,-10,-18,-19,-20,-21,-11,-16,-227,-61,-231,-232,-22,-33,-228,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'COMPARISON':([7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,75,76,108,111,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,161,163,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,270,272,273,274,275,276,279,281,283,286,288,289,],[-225,-226,120,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-229,-230,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-92,-157,-10,-18,-19,-20,-21,-11,-16,-227,-61,-231,-232,-22,-33,-228,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'AS':([7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,75,76,108,111,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,161,163,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,270,272,273,274,275,276,279,281,283,286,288,289,],[-225,-226,121,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-229,-230,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-92,-157,-10,-18,-19,-20,-21,-11,-16,-227,-61,-231,-232,-22,-33,-228,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'IS':([7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,75,76,108,111,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,161,163,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,270,272,273,274,275,276,279,281,283,286,288,289,],[-225,-226,122,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-229,-230,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-92,-157,-10,-18,-19,-20,-21,-11,-16,-227,-61,-231,-232,-22,-33,-228,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'IN':([7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,32,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,75,76,108,111,116,128,129,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,161,163,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,270,272,273,274,275,276,279,281,283,286,288,289,],[-225,-226,123,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-123,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-229,-230,-62,-90,123,-65,-185,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-92,-157,-10,-18,-19,-20,-21,-11,-16,-227,-61,-231,-232,-22,-33,-228,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'WITH':([7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,75,76,108,111,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,161,163,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,270,272,273,274,275,276,279,281,283,286,288,289,],[-225,-226,124,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-229,-230,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-92,-157,-10,-18,-19,-20,-21,-11,-16,-227,-61,-231,-232,-22,-33,-228,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'AND':([7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,75,76,108,111,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,161,163,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,270,272,273,274,275,276,279,281,283,286,288,289,],[-225,-226,125,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-229,-230,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-92,-157,-10,-18,-19,-20,-21,-11,-16,-227,-61,-231,-232,-22,-33,-228,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'OR':([7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,75,76,108,111,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,161,163,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,270,272,273,274,275,276,279,281,283,286,288,289,],[-225,-226,126,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-229,-230,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-92,-157,-10,-18,-19,-20,-21,-11,-16,-227,-61,-231,-232,-22,-33,-228,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'RIGHT_BRA':([7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,52,75,76,108,111,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,152,153,154,155,156,159,163,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,270,272,273,274,275,276,279,281,283,286,288,289,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,156,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-158,-229,-230,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,156,-95,-220,-100,-159,-98,-157,-10,-18,-19,-20,-21,-11,-16,-227,-61,-231,-232,-22,-33,-228,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'COMMA':([7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,75,76,108,111,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,152,153,155,156,158,159,160,161,163,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,270,272,273,274,275,276,279,281,283,286,288,289,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-229,-230,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,251,-95,-100,-159,-100,-98,251,-92,-157,-10,-18,-19,-20,-21,251,-16,-227,-61,-231,-232,-22,251,-228,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,251,]),'RIGHT_PAR':([7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,53,75,76,108,111,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,157,158,159,160,161,162,163,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,253,254,255,256,257,258,259,265,266,267,268,270,272,273,274,275,276,279,280,281,283,286,287,288,289,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,163,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-156,-229,-230,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,163,163,-98,163,163,-218,-157,-10,-18,-19,-20,-21,-11,-16,-227,-61,-231,-232,-22,-33,-228,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,163,-96,-219,-97,-9,-52,-120,-17,163,-59,-60,-27,-28,-29,-30,-31,-32,-72,163,-99,-182,-57,-58,-15,-38,]),'UNION':([7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,75,76,108,111,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,161,163,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,270,272,273,274,275,276,279,280,281,283,286,288,289,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,150,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-229,-230,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,150,-157,-10,-18,-19,-20,-21,-11,-16,-227,-61,-231,-232,-22,-33,-228,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,150,-94,-221,-96,-219,-97,-9,-52,-120,-17,-27,-28,-29,-30,-31,-32,-72,150,-99,-182,-57,-15,-38,]),'EXCEPT':([7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,75,76,108,111,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,161,163,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,270,272,273,274,275,276,279,280,281,283,286,288,289,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,151,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-229,-230,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,151,-157,-10,-18,-19,-20,-21,-11,-16,-227,-61,-231,-232,-22,-33,-228,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,151,-94,-221,-96,-219,-97,-9,-52,-120,-17,-27,-28,-29,-30,-31,-32,-72,151,-99,-182,-57,-15,-38,]),'ON':([7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,75,76,108,111,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,163,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,265,270,272,273,274,275,276,279,281,283,286,288,289,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-229,-230,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,-18,-19,-20,-21,-11,-16,-227,-61,-231,-232,-22,-33,-228,-23,-24,-25,-26,278,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'THEN':([7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,75,76,108,111,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,163,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,261,265,270,272,273,274,275,276,279,281,283,286,288,289,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-229,-230,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-10,-18,-19,-20,-21,-11,-16,-227,-61,-231,-232,-22,-33,-228,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,285,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,]),'WHEN':([7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,54,75,76,108,111,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,163,165,166,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,263,265,270,272,273,274,275,276,279,281,283,286,288,289,291,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,169,-7,-116,-229,-230,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-178,169,-10,-18,-19,-20,-21,-11,-16,-227,-61,-231,-232,-22,-33,-228,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-56,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,-55,]),'ELSE':([7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,54,75,76,108,111,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,163,165,166,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,263,265,270,272,273,274,275,276,279,281,283,286,288,289,291,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,170,-7,-116,-229,-230,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,-178,170,-10,-18,-19,-20,-21,-11,-16,-227,-61,-231,-232,-22,-33,-228,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-56,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,-55,]),'END':([7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,75,76,108,111,128,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,146,153,155,156,159,163,164,166,171,172,173,174,175,178,179,180,181,199,200,201,203,204,205,207,209,211,213,225,227,229,230,232,234,236,239,241,243,249,252,254,255,256,257,258,259,260,263,265,270,272,273,274,275,276,279,281,283,286,288,289,291,],[-225,-226,-64,-90,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-155,-160,-161,-162,-103,-102,-128,-126,-127,-129,-130,-131,-135,-136,-152,-7,-229,-230,-62,-90,-65,-214,-73,-217,-222,-223,-224,-165,-164,-190,-188,-189,-191,-192,-193,-197,-198,-95,-100,-159,-98,-157,259,-54,-10,-18,-19,-20,-21,-11,-16,-227,-61,-231,-232,-22,-33,-228,-23,-24,-25,-26,-39,-63,-66,-67,-68,-69,-70,-71,-74,-75,-8,-94,-221,-96,-219,-97,-9,-52,-120,-53,-56,-17,-27,-28,-29,-30,-31,-32,-72,-99,-182,-57,-15,-38,-55,]),'BY':([7,8,62,63,64,65,66,67,68,69,70,71,72,73,187,190,192,194,196,198,],[-225,-226,188,188,188,188,188,188,-107,-108,-109,-110,-111,-112,-169,-170,-171,-172,-173,-174,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'formatted_query':([0,],[1,]),'query':([0,4,],[2,73,]),'subquerry':([0,4,],[3,3,]),'comment':([0,4,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,48,50,56,58,61,62,63,64,65,66,75,76,77,78,79,80,81,82,83,84,113,114,118,122,124,132,133,141,142,143,144,145,153,156,157,158,159,160,161,162,163,172,177,178,181,184,186,188,190,192,207,213,214,215,218,220,222,223,225,226,227,247,261,274,276,278,],[4,4,94,95,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,119,127,130,173,179,180,182,185,187,189,191,193,195,197,95,200,202,204,206,94,209,211,216,217,219,127,224,231,233,236,239,241,243,245,248,250,251,252,253,254,255,256,257,127,102,103,263,263,263,263,263,263,204,127,103,102,219,272,127,224,224,224,273,248,272,282,284,224,]),'expr_definition_list':([0,4,8,9,11,29,30,54,75,76,77,78,79,80,81,82,83,84,122,132,133,141,142,143,144,145,146,181,184,186,188,190,192,207,220,222,261,274,276,],[5,5,74,93,96,120,123,176,194,196,198,199,201,203,205,93,208,210,123,176,176,120,120,120,120,120,120,120,120,120,120,120,120,269,120,123,176,176,120,]),'expr_definition':([0,4,8,9,11,29,30,54,75,76,77,78,79,80,81,82,83,84,122,132,133,141,142,143,144,145,146,181,184,186,188,190,192,207,220,222,261,274,276,],[8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'not':([0,4,8,9,11,29,30,54,75,76,77,78,79,80,81,82,83,84,122,132,133,141,142,143,144,145,146,181,184,186,188,190,192,207,220,222,261,274,276,],[9,9,82,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'symbol':([0,4,8,9,11,29,30,54,75,76,77,78,79,80,81,82,83,84,122,132,133,141,142,143,144,145,146,181,184,186,188,190,192,207,220,222,261,274,276,],[10,10,77,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'between':([0,4,8,9,11,29,30,54,75,76,77,78,79,80,81,82,83,84,122,132,133,141,142,143,144,145,146,181,184,186,188,190,192,207,220,222,261,274,276,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'label':([0,4,8,9,11,29,30,54,75,76,77,78,79,80,81,82,83,84,122,132,133,141,142,143,144,145,146,181,184,186,188,190,192,207,220,222,261,274,276,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'string_simple':([0,4,8,9,11,29,30,54,75,76,77,78,79,80,81,82,83,84,122,132,133,141,142,143,144,145,146,181,184,186,188,190,192,207,220,222,261,274,276,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'string_double':([0,4,8,9,11,29,30,54,75,76,77,78,79,80,81,82,83,84,122,132,133,141,142,143,144,145,146,181,184,186,188,190,192,207,220,222,261,274,276,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'string_grave':([0,4,8,9,11,29,30,54,75,76,77,78,79,80,81,82,83,84,122,132,133,141,142,143,144,145,146,181,184,186,188,190,192,207,220,222,261,274,276,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'distinct':([0,4,8,9,11,29,30,54,56,75,76,77,78,79,80,81,82,83,84,113,122,132,133,141,142,143,144,145,146,181,184,186,188,190,192,207,220,222,261,274,276,],[16,16,16,16,16,16,16,16,177,16,16,16,16,16,16,16,16,16,16,215,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'all':([0,4,8,9,11,29,30,54,56,75,76,77,78,79,80,81,82,83,84,113,122,132,133,141,142,143,144,145,146,181,184,186,188,190,192,207,220,222,261,274,276,],[17,17,17,17,17,17,17,17,178,17,17,17,17,17,17,17,17,17,17,214,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'null':([0,4,8,9,11,29,30,54,75,76,77,78,79,80,81,82,83,84,122,132,133,141,142,143,144,145,146,181,184,186,188,190,192,207,220,222,261,274,276,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'true':([0,4,8,9,11,29,30,54,75,76,77,78,79,80,81,82,83,84,122,132,133,141,142,143,144,145,146,181,184,186,188,190,192,207,220,222,261,274,276,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'false':([0,4,8,9,11,29,30,54,75,76,77,78,79,80,81,82,83,84,122,132,133,141,142,143,144,145,146,181,184,186,188,190,192,207,220,222,261,274,276,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'coalesce':([0,4,8,9,11,29,30,54,75,76,77,78,79,80,81,82,83,84,122,132,133,141,142,143,144,145,146,181,184,186,188,190,192,207,220,222,261,274,276,],[21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'cast':([0,4,8,9,11,29,30,54,75,76,77,78,79,80,81,82,83,84,122,132,133,141,142,143,144,145,146,181,184,186,188,190,192,207,220,222,261,274,276,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,]),'concat':([0,4,8,9,11,29,30,54,75,76,77,78,79,80,81,82,83,84,122,132,133,141,142,143,144,145,146,181,184,186,188,190,192,207,220,222,261,274,276,],[23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,]),'asc':([0,4,8,9,11,29,30,54,75,76,77,78,79,80,81,82,83,84,122,132,133,141,142,143,144,145,146,181,184,186,188,190,192,207,220,222,261,274,276,],[24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,]),'desc':([0,4,8,9,11,29,30,54,75,76,77,78,79,80,81,82,83,84,122,132,133,141,142,143,144,145,146,181,184,186,188,190,192,207,220,222,261,274,276,],[25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,]),'case_when':([0,4,8,9,11,29,30,54,75,76,77,78,79,80,81,82,83,84,122,132,133,141,142,143,144,145,146,181,184,186,188,190,192,207,220,222,261,274,276,],[26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,]),'select_full':([0,4,8,9,11,29,30,54,75,76,77,78,79,80,81,82,83,84,112,122,132,133,141,142,143,144,145,146,181,184,186,188,190,192,207,213,220,222,261,274,276,],[27,27,27,27,27,27,126,27,27,27,27,27,27,27,27,27,27,27,212,126,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,270,27,126,27,27,27,]),'over_block':([0,4,8,9,11,29,30,54,75,76,77,78,79,80,81,82,83,84,122,132,133,141,142,143,144,145,146,181,184,186,188,190,192,207,220,222,261,274,276,],[28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,]),'left_bra':([0,4,8,9,11,29,30,54,75,76,77,78,79,80,81,82,83,84,122,132,133,141,142,143,144,145,146,181,184,186,188,190,192,207,220,222,261,274,276,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'left_par':([0,4,8,9,11,29,30,50,54,75,76,77,78,79,80,81,82,83,84,112,122,132,133,141,142,143,144,145,146,181,184,186,188,190,192,207,213,220,222,261,274,276,],[30,30,30,30,30,30,122,172,30,30,30,30,30,30,30,30,30,30,30,213,222,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,213,30,222,30,30,30,]),'case':([0,4,8,9,11,29,30,54,75,76,77,78,79,80,81,82,83,84,122,132,133,141,142,143,144,145,146,181,184,186,188,190,192,207,220,222,261,274,276,],[48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,]),'select_block':([0,4,8,9,11,29,30,54,75,76,77,78,79,80,81,82,83,84,112,122,132,133,141,142,143,144,145,146,181,184,186,188,190,192,207,213,220,222,261,274,276,],[49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,]),'over':([0,4,8,9,11,29,30,54,75,76,77,78,79,80,81,82,83,84,122,132,133,141,142,143,144,145,146,181,184,186,188,190,192,207,220,222,261,274,276,],[50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,]),'select_keyword':([0,4,8,9,11,29,30,54,75,76,77,78,79,80,81,82,83,84,112,122,132,133,141,142,143,144,145,146,181,184,186,188,190,192,207,213,220,222,261,274,276,],[54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,]),'select':([0,4,8,9,11,29,30,54,75,76,77,78,79,80,81,82,83,84,112,122,132,133,141,142,143,144,145,146,181,184,186,188,190,192,207,213,220,222,261,274,276,],[56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'semicolon':([2,73,],[58,58,]),'by_block':([3,49,137,172,258,],[60,139,139,260,260,]),'group':([3,49,137,172,258,],[61,61,61,61,61,]),'order':([3,49,137,172,258,],[62,62,62,62,62,]),'cluster':([3,49,137,172,258,],[63,63,63,63,63,]),'distribute':([3,49,137,172,258,],[64,64,64,64,64,]),'sort':([3,49,137,172,258,],[65,65,65,65,65,]),'partition':([3,49,137,172,258,],[66,66,66,66,66,]),'point':([8,],[75,]),'comparison':([8,],[76,]),'as':([8,],[78,]),'is':([8,],[79,]),'in':([8,82,],[80,207,]),'with':([8,],[81,]),'and':([8,],[83,]),'or':([8,],[84,]),'combine_keyword':([27,126,212,270,],[112,112,112,112,]),'union':([27,126,212,270,],[113,113,113,113,]),'except':([27,126,212,270,],[114,114,114,114,]),'expr_list':([29,30,122,141,142,143,144,145,146,181,184,186,188,190,192,220,222,276,],[117,125,125,237,237,237,237,237,237,237,237,237,237,237,237,271,125,283,]),'right_bra':([29,117,],[118,218,]),'right_par':([30,122,123,125,126,222,258,270,],[124,124,223,225,226,124,278,226,]),'case_when_clause_list':([48,131,],[129,229,]),'case_when_clause':([48,131,],[131,131,]),'when':([48,131,],[132,132,]),'else':([48,131,],[133,133,]),'additional_block_list':([49,137,],[136,234,]),'additional_block':([49,137,],[137,137,]),'keyword_block':([49,137,],[138,138,]),'join_block':([49,137,],[140,140,]),'from':([49,137,],[141,141,]),'where':([49,137,],[142,142,]),'limit':([49,137,],[143,143,]),'having':([49,137,],[144,144,]),'option':([49,137,],[145,145,]),'join_expression':([49,137,],[146,146,]),'join_prefix_list':([49,137,154,],[152,152,249,]),'join':([49,137,152,],[153,153,247,]),'join_prefix':([49,137,154,],[154,154,154,]),'inner':([49,137,154,],[156,156,156,]),'outer':([49,137,154,],[157,157,157,]),'left':([49,137,154,],[158,158,158,]),'right':([49,137,154,],[159,159,159,]),'full':([49,137,154,],[160,160,160,]),'semi':([49,137,154,],[161,161,161,]),'cross':([49,137,154,],[162,162,162,]),'natural':([49,137,154,],[163,163,163,]),'select_clause':([54,261,],[174,280,]),'expr':([54,132,133,261,274,],[175,230,232,175,281,]),'by':([61,62,63,64,65,66,],[181,184,186,188,190,192,]),'comma':([120,123,175,],[220,220,261,]),'end':([129,],[227,]),'clause':([141,142,143,144,145,146,181,184,186,188,190,192,],[235,238,240,242,244,246,262,264,265,266,267,268,]),'over_clause_list':([172,],[258,]),'over_clause':([172,258,],[259,279,]),'then':([230,],[274,]),'on':([246,],[276,]),}
+_lr_goto_items = {'formatted_query':([0,],[1,]),'query':([0,4,],[2,74,]),'subquerry':([0,4,],[3,3,]),'comment':([0,4,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,30,31,49,51,57,59,62,63,64,65,66,67,77,78,79,80,81,89,92,93,94,95,96,97,98,99,109,110,111,112,113,114,115,116,117,118,148,149,153,157,159,167,168,176,182,183,186,189,191,193,195,197,214,238,244,245,246,249,250,253,254,256,257,258,269,277,284,286,],[4,4,129,130,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,154,162,165,177,184,185,187,190,192,194,196,198,202,206,208,210,212,215,217,218,219,220,221,222,223,224,226,228,130,231,233,235,237,129,240,242,247,248,252,162,255,262,264,162,137,138,271,271,271,271,271,271,215,235,162,138,137,252,282,162,255,255,255,283,282,290,292,255,]),'expr_definition_list':([0,4,9,10,12,30,31,55,77,78,79,80,81,82,109,110,111,112,113,114,115,116,117,118,157,167,168,186,189,191,193,195,197,238,250,253,269,277,284,],[6,6,108,128,131,155,158,181,155,155,155,155,155,155,225,227,229,230,232,234,236,128,239,241,158,181,181,155,155,155,155,155,155,279,281,158,181,155,181,]),'expr_definition':([0,4,9,10,12,30,31,55,77,78,79,80,81,82,109,110,111,112,113,114,115,116,117,118,157,167,168,186,189,191,193,195,197,238,250,253,269,277,284,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'not':([0,4,9,10,12,30,31,55,77,78,79,80,81,82,109,110,111,112,113,114,115,116,117,118,157,167,168,186,189,191,193,195,197,238,250,253,269,277,284,],[10,10,116,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'symbol':([0,4,9,10,12,30,31,55,77,78,79,80,81,82,109,110,111,112,113,114,115,116,117,118,157,167,168,186,189,191,193,195,197,238,250,253,269,277,284,],[11,11,111,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'between':([0,4,9,10,12,30,31,55,77,78,79,80,81,82,109,110,111,112,113,114,115,116,117,118,157,167,168,186,189,191,193,195,197,238,250,253,269,277,284,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'label':([0,4,9,10,12,30,31,55,77,78,79,80,81,82,109,110,111,112,113,114,115,116,117,118,157,167,168,186,189,191,193,195,197,238,250,253,269,277,284,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'string_simple':([0,4,9,10,12,30,31,55,77,78,79,80,81,82,109,110,111,112,113,114,115,116,117,118,157,167,168,186,189,191,193,195,197,238,250,253,269,277,284,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'string_double':([0,4,9,10,12,30,31,55,77,78,79,80,81,82,109,110,111,112,113,114,115,116,117,118,157,167,168,186,189,191,193,195,197,238,250,253,269,277,284,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'string_grave':([0,4,9,10,12,30,31,55,77,78,79,80,81,82,109,110,111,112,113,114,115,116,117,118,157,167,168,186,189,191,193,195,197,238,250,253,269,277,284,],[16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'distinct':([0,4,9,10,12,30,31,55,57,77,78,79,80,81,82,109,110,111,112,113,114,115,116,117,118,148,157,167,168,186,189,191,193,195,197,238,250,253,269,277,284,],[17,17,17,17,17,17,17,17,182,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,246,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'all':([0,4,9,10,12,30,31,55,57,77,78,79,80,81,82,109,110,111,112,113,114,115,116,117,118,148,157,167,168,186,189,191,193,195,197,238,250,253,269,277,284,],[18,18,18,18,18,18,18,18,183,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,245,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'null':([0,4,9,10,12,30,31,55,77,78,79,80,81,82,109,110,111,112,113,114,115,116,117,118,157,167,168,186,189,191,193,195,197,238,250,253,269,277,284,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'true':([0,4,9,10,12,30,31,55,77,78,79,80,81,82,109,110,111,112,113,114,115,116,117,118,157,167,168,186,189,191,193,195,197,238,250,253,269,277,284,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'false':([0,4,9,10,12,30,31,55,77,78,79,80,81,82,109,110,111,112,113,114,115,116,117,118,157,167,168,186,189,191,193,195,197,238,250,253,269,277,284,],[21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'coalesce':([0,4,9,10,12,30,31,55,77,78,79,80,81,82,109,110,111,112,113,114,115,116,117,118,157,167,168,186,189,191,193,195,197,238,250,253,269,277,284,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,]),'cast':([0,4,9,10,12,30,31,55,77,78,79,80,81,82,109,110,111,112,113,114,115,116,117,118,157,167,168,186,189,191,193,195,197,238,250,253,269,277,284,],[23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,]),'concat':([0,4,9,10,12,30,31,55,77,78,79,80,81,82,109,110,111,112,113,114,115,116,117,118,157,167,168,186,189,191,193,195,197,238,250,253,269,277,284,],[24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,]),'asc':([0,4,9,10,12,30,31,55,77,78,79,80,81,82,109,110,111,112,113,114,115,116,117,118,157,167,168,186,189,191,193,195,197,238,250,253,269,277,284,],[25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,]),'desc':([0,4,9,10,12,30,31,55,77,78,79,80,81,82,109,110,111,112,113,114,115,116,117,118,157,167,168,186,189,191,193,195,197,238,250,253,269,277,284,],[26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,]),'case_when':([0,4,9,10,12,30,31,55,77,78,79,80,81,82,109,110,111,112,113,114,115,116,117,118,157,167,168,186,189,191,193,195,197,238,250,253,269,277,284,],[27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,]),'select_full':([0,4,9,10,12,30,31,55,77,78,79,80,81,82,109,110,111,112,113,114,115,116,117,118,147,157,167,168,186,189,191,193,195,197,238,244,250,253,269,277,284,],[28,28,28,28,28,28,161,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,243,161,28,28,28,28,28,28,28,28,28,280,28,161,28,28,28,]),'over_block':([0,4,9,10,12,30,31,55,77,78,79,80,81,82,109,110,111,112,113,114,115,116,117,118,157,167,168,186,189,191,193,195,197,238,250,253,269,277,284,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'left_bra':([0,4,9,10,12,30,31,55,77,78,79,80,81,82,109,110,111,112,113,114,115,116,117,118,157,167,168,186,189,191,193,195,197,238,250,253,269,277,284,],[30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'left_par':([0,4,9,10,12,30,31,51,55,77,78,79,80,81,82,109,110,111,112,113,114,115,116,117,118,147,157,167,168,186,189,191,193,195,197,238,244,250,253,269,277,284,],[31,31,31,31,31,31,157,176,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,244,253,31,31,31,31,31,31,31,31,31,244,31,253,31,31,31,]),'case':([0,4,9,10,12,30,31,55,77,78,79,80,81,82,109,110,111,112,113,114,115,116,117,118,157,167,168,186,189,191,193,195,197,238,250,253,269,277,284,],[49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,]),'select_block':([0,4,9,10,12,30,31,55,77,78,79,80,81,82,109,110,111,112,113,114,115,116,117,118,147,157,167,168,186,189,191,193,195,197,238,244,250,253,269,277,284,],[50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,]),'over':([0,4,9,10,12,30,31,55,77,78,79,80,81,82,109,110,111,112,113,114,115,116,117,118,157,167,168,186,189,191,193,195,197,238,250,253,269,277,284,],[51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,]),'select_keyword':([0,4,9,10,12,30,31,55,77,78,79,80,81,82,109,110,111,112,113,114,115,116,117,118,147,157,167,168,186,189,191,193,195,197,238,244,250,253,269,277,284,],[55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,]),'select':([0,4,9,10,12,30,31,55,77,78,79,80,81,82,109,110,111,112,113,114,115,116,117,118,147,157,167,168,186,189,191,193,195,197,238,244,250,253,269,277,284,],[57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,]),'semicolon':([2,74,],[59,59,]),'by_block':([3,50,75,76,172,176,266,],[61,174,174,174,174,268,268,]),'group':([3,50,75,76,172,176,266,],[62,62,62,62,62,62,62,]),'order':([3,50,75,76,172,176,266,],[63,63,63,63,63,63,63,]),'cluster':([3,50,75,76,172,176,266,],[64,64,64,64,64,64,64,]),'distribute':([3,50,75,76,172,176,266,],[65,65,65,65,65,65,65,]),'sort':([3,50,75,76,172,176,266,],[66,66,66,66,66,66,66,]),'partition':([3,50,75,76,172,176,266,],[67,67,67,67,67,67,67,]),'keyword_block':([5,50,75,76,127,172,180,204,],[75,173,173,173,75,173,75,75,]),'join_block':([5,50,75,76,127,172,180,204,],[76,175,175,175,76,175,76,76,]),'from':([5,50,75,76,127,172,180,204,],[77,77,77,77,77,77,77,77,]),'where':([5,50,75,76,127,172,180,204,],[78,78,78,78,78,78,78,78,]),'limit':([5,50,75,76,127,172,180,204,],[79,79,79,79,79,79,79,79,]),'having':([5,50,75,76,127,172,180,204,],[80,80,80,80,80,80,80,80,]),'option':([5,50,75,76,127,172,180,204,],[81,81,81,81,81,81,81,81,]),'join_expression':([5,50,75,76,127,172,180,204,],[82,82,82,82,82,82,82,82,]),'join_prefix_list':([5,50,75,76,90,127,172,180,204,],[88,88,88,88,216,88,88,88,88,]),'join':([5,50,75,76,88,127,172,180,204,],[89,89,89,89,214,89,89,89,89,]),'join_prefix':([5,50,75,76,90,127,172,180,204,],[90,90,90,90,90,90,90,90,90,]),'inner':([5,50,75,76,90,127,172,180,204,],[92,92,92,92,92,92,92,92,92,]),'outer':([5,50,75,76,90,127,172,180,204,],[93,93,93,93,93,93,93,93,93,]),'left':([5,50,75,76,90,127,172,180,204,],[94,94,94,94,94,94,94,94,94,]),'right':([5,50,75,76,90,127,172,180,204,],[95,95,95,95,95,95,95,95,95,]),'full':([5,50,75,76,90,127,172,180,204,],[96,96,96,96,96,96,96,96,96,]),'semi':([5,50,75,76,90,127,172,180,204,],[97,97,97,97,97,97,97,97,97,]),'cross':([5,50,75,76,90,127,172,180,204,],[98,98,98,98,98,98,98,98,98,]),'natural':([5,50,75,76,90,127,172,180,204,],[99,99,99,99,99,99,99,99,99,]),'point':([9,],[109,]),'comparison':([9,],[110,]),'as':([9,],[112,]),'is':([9,],[113,]),'in':([9,116,],[114,238,]),'with':([9,],[115,]),'and':([9,],[117,]),'or':([9,],[118,]),'combine_keyword':([28,161,243,280,],[147,147,147,147,]),'union':([28,161,243,280,],[148,148,148,148,]),'except':([28,161,243,280,],[149,149,149,149,]),'expr_list':([30,31,77,78,79,80,81,82,157,186,189,191,193,195,197,253,277,],[152,160,203,203,203,203,203,203,160,203,203,203,203,203,203,160,289,]),'right_bra':([30,152,],[153,249,]),'right_par':([31,157,158,160,161,253,266,280,],[159,159,254,256,257,159,286,257,]),'case_when_clause_list':([49,166,],[164,260,]),'case_when_clause':([49,166,],[166,166,]),'when':([49,166,],[167,167,]),'else':([49,166,],[168,168,]),'additional_block_list':([50,75,76,172,],[171,199,200,265,]),'additional_block':([50,75,76,172,],[172,172,172,172,]),'select_clause':([55,],[178,]),'expr':([55,167,168,269,284,],[179,261,263,288,291,]),'by':([62,63,64,65,66,67,],[186,189,191,193,195,197,]),'clause':([77,78,79,80,81,82,186,189,191,193,195,197,],[201,205,207,209,211,213,270,272,273,274,275,276,]),'comma':([152,160,178,203,289,],[250,250,269,250,250,]),'end':([164,],[258,]),'over_clause_list':([176,],[266,]),'over_clause':([176,266,],[267,287,]),'on':([213,],[277,]),'then':([261,],[284,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,230 +27,237 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> formatted_query","S'",1,None,None,None),
-  ('formatted_query -> query','formatted_query',1,'p_formatted_query','formatter.py',150),
-  ('query -> subquerry','query',1,'p_query','formatter.py',161),
-  ('query -> query semicolon','query',2,'p_query_with_semicolon','formatter.py',165),
-  ('query -> comment query','query',2,'p_query_with_comment','formatter.py',169),
-  ('subquerry -> expr_definition_list','subquerry',1,'p_subquerry','formatter.py',180),
-  ('subquerry -> subquerry by_block','subquerry',2,'p_subquerry_by_block','formatter.py',184),
-  ('select_full -> select_block','select_full',1,'p_select_full_select','formatter.py',194),
-  ('select_full -> select_full combine_keyword select_full','select_full',3,'p_select_full_combined','formatter.py',198),
-  ('select_full -> left_par select_full right_par','select_full',3,'p_select_full_parentheses','formatter.py',202),
-  ('select_full -> select_block additional_block_list','select_full',2,'p_select_full_more','formatter.py',207),
-  ('select_block -> select_keyword select_clause','select_block',2,'p_select_block','formatter.py',211),
-  ('select_keyword -> select','select_keyword',1,'p_select_keyword_alone','formatter.py',216),
-  ('select_keyword -> select distinct','select_keyword',2,'p_select_keyword_enriched','formatter.py',221),
-  ('select_keyword -> select all','select_keyword',2,'p_select_keyword_enriched','formatter.py',222),
-  ('select_clause -> expr comma select_clause','select_clause',3,'p_select_clause_next','formatter.py',227),
-  ('select_clause -> expr','select_clause',1,'p_select_clause_end','formatter.py',231),
-  ('additional_block_list -> additional_block additional_block_list','additional_block_list',2,'p_additional_block_list_next','formatter.py',242),
-  ('additional_block_list -> additional_block','additional_block_list',1,'p_additional_block_list_end','formatter.py',246),
-  ('additional_block -> keyword_block','additional_block',1,'p_additional_block','formatter.py',251),
-  ('additional_block -> by_block','additional_block',1,'p_additional_block','formatter.py',252),
-  ('additional_block -> join_block','additional_block',1,'p_additional_block','formatter.py',253),
-  ('keyword_block -> from clause','keyword_block',2,'p_keyword_block','formatter.py',259),
-  ('keyword_block -> where clause','keyword_block',2,'p_keyword_block','formatter.py',260),
-  ('keyword_block -> limit clause','keyword_block',2,'p_keyword_block','formatter.py',261),
-  ('keyword_block -> having clause','keyword_block',2,'p_keyword_block','formatter.py',262),
-  ('keyword_block -> option clause','keyword_block',2,'p_keyword_block','formatter.py',263),
-  ('by_block -> group by clause','by_block',3,'p_by_block','formatter.py',269),
-  ('by_block -> order by clause','by_block',3,'p_by_block','formatter.py',270),
-  ('by_block -> cluster by clause','by_block',3,'p_by_block','formatter.py',271),
-  ('by_block -> distribute by clause','by_block',3,'p_by_block','formatter.py',272),
-  ('by_block -> sort by clause','by_block',3,'p_by_block','formatter.py',273),
-  ('by_block -> partition by clause','by_block',3,'p_by_block','formatter.py',274),
-  ('clause -> expr_list','clause',1,'p_clause','formatter.py',279),
-  ('combine_keyword -> union all','combine_keyword',2,'p_combine_keyword_composed','formatter.py',292),
-  ('combine_keyword -> union distinct','combine_keyword',2,'p_combine_keyword_composed','formatter.py',293),
-  ('combine_keyword -> union','combine_keyword',1,'p_combine_keyword_alone','formatter.py',299),
-  ('combine_keyword -> except','combine_keyword',1,'p_combine_keyword_alone','formatter.py',300),
-  ('join_block -> join_expression clause on expr_list','join_block',4,'p_join_block_on','formatter.py',312),
-  ('join_block -> join_expression clause','join_block',2,'p_join_block_alone','formatter.py',317),
-  ('join_expression -> join_prefix_list join','join_expression',2,'p_join_expression','formatter.py',321),
-  ('join_expression -> join','join_expression',1,'p_join_expression_alone','formatter.py',325),
-  ('join_prefix -> inner','join_prefix',1,'p_join_prefix','formatter.py',330),
-  ('join_prefix -> outer','join_prefix',1,'p_join_prefix','formatter.py',331),
-  ('join_prefix -> left','join_prefix',1,'p_join_prefix','formatter.py',332),
-  ('join_prefix -> right','join_prefix',1,'p_join_prefix','formatter.py',333),
-  ('join_prefix -> full','join_prefix',1,'p_join_prefix','formatter.py',334),
-  ('join_prefix -> semi','join_prefix',1,'p_join_prefix','formatter.py',335),
-  ('join_prefix -> cross','join_prefix',1,'p_join_prefix','formatter.py',336),
-  ('join_prefix -> natural','join_prefix',1,'p_join_prefix','formatter.py',337),
-  ('join_prefix_list -> join_prefix join_prefix_list','join_prefix_list',2,'p_join_prefix_list_next','formatter.py',343),
-  ('join_prefix_list -> join_prefix','join_prefix_list',1,'p_join_prefix_list_end','formatter.py',347),
-  ('case_when -> case case_when_clause_list end','case_when',3,'p_case_when','formatter.py',358),
-  ('case_when_clause_list -> case_when_clause case_when_clause_list','case_when_clause_list',2,'p_case_when_clause_list_next','formatter.py',363),
-  ('case_when_clause_list -> case_when_clause','case_when_clause_list',1,'p_case_when_clause_list_end','formatter.py',367),
-  ('case_when_clause -> when expr then expr','case_when_clause',4,'p_case_when_clause_if','formatter.py',371),
-  ('case_when_clause -> else expr','case_when_clause',2,'p_case_when_clause_else','formatter.py',377),
-  ('over_block -> over left_par over_clause_list right_par','over_block',4,'p_over_block','formatter.py',386),
-  ('over_clause_list -> over_clause_list over_clause','over_clause_list',2,'p_over_clause_list_next','formatter.py',391),
-  ('over_clause_list -> over_clause','over_clause_list',1,'p_over_clause_list_alone','formatter.py',395),
-  ('over_clause -> by_block','over_clause',1,'p_over_clause','formatter.py',399),
-  ('expr -> expr_definition_list','expr',1,'p_expr','formatter.py',412),
-  ('expr_definition_list -> expr_definition expr_definition_list','expr_definition_list',2,'p_expr_definition_list_next','formatter.py',416),
-  ('expr_definition_list -> expr_definition point expr_definition_list','expr_definition_list',3,'p_expr_definition_list_point','formatter.py',423),
-  ('expr_definition_list -> expr_definition','expr_definition_list',1,'p_expr_definition_list_end','formatter.py',427),
-  ('expr_definition_list -> not expr_definition_list','expr_definition_list',2,'p_expr_definition_list_prefix','formatter.py',431),
-  ('expr_definition_list -> expr_definition comparison expr_definition_list','expr_definition_list',3,'p_expr_definition_list_infix','formatter.py',439),
-  ('expr_definition_list -> expr_definition symbol expr_definition_list','expr_definition_list',3,'p_expr_definition_list_infix','formatter.py',440),
-  ('expr_definition_list -> expr_definition as expr_definition_list','expr_definition_list',3,'p_expr_definition_list_infix','formatter.py',441),
-  ('expr_definition_list -> expr_definition is expr_definition_list','expr_definition_list',3,'p_expr_definition_list_infix','formatter.py',442),
-  ('expr_definition_list -> expr_definition in expr_definition_list','expr_definition_list',3,'p_expr_definition_list_infix','formatter.py',443),
-  ('expr_definition_list -> expr_definition with expr_definition_list','expr_definition_list',3,'p_expr_definition_list_infix','formatter.py',444),
-  ('expr_definition_list -> expr_definition not in expr_definition_list','expr_definition_list',4,'p_expr_definition_list_double_infix','formatter.py',449),
-  ('expr_definition_list -> between expr_definition_list','expr_definition_list',2,'p_expr_definition_list_between','formatter.py',453),
-  ('expr_definition_list -> expr_definition and expr_definition_list','expr_definition_list',3,'p_expr_definition_list_boolean','formatter.py',466),
-  ('expr_definition_list -> expr_definition or expr_definition_list','expr_definition_list',3,'p_expr_definition_list_boolean','formatter.py',467),
-  ('expr_definition -> label','expr_definition',1,'p_expr_definition_value','formatter.py',473),
-  ('expr_definition -> string_simple','expr_definition',1,'p_expr_definition_value','formatter.py',474),
-  ('expr_definition -> string_double','expr_definition',1,'p_expr_definition_value','formatter.py',475),
-  ('expr_definition -> string_grave','expr_definition',1,'p_expr_definition_value','formatter.py',476),
-  ('expr_definition -> distinct','expr_definition',1,'p_expr_definition_keyword','formatter.py',482),
-  ('expr_definition -> all','expr_definition',1,'p_expr_definition_keyword','formatter.py',483),
-  ('expr_definition -> null','expr_definition',1,'p_expr_definition_keyword','formatter.py',484),
-  ('expr_definition -> true','expr_definition',1,'p_expr_definition_keyword','formatter.py',485),
-  ('expr_definition -> false','expr_definition',1,'p_expr_definition_keyword','formatter.py',486),
-  ('expr_definition -> coalesce','expr_definition',1,'p_expr_definition_keyword','formatter.py',487),
-  ('expr_definition -> cast','expr_definition',1,'p_expr_definition_keyword','formatter.py',488),
-  ('expr_definition -> concat','expr_definition',1,'p_expr_definition_keyword','formatter.py',489),
-  ('expr_definition -> asc','expr_definition',1,'p_expr_definition_keyword','formatter.py',490),
-  ('expr_definition -> desc','expr_definition',1,'p_expr_definition_keyword','formatter.py',491),
-  ('expr_definition -> symbol','expr_definition',1,'p_expr_definition_keyword','formatter.py',492),
-  ('expr_definition -> case_when','expr_definition',1,'p_expr_definition_block','formatter.py',498),
-  ('expr_definition -> select_full','expr_definition',1,'p_expr_definition_block','formatter.py',499),
-  ('expr_definition -> over_block','expr_definition',1,'p_expr_definition_block','formatter.py',500),
-  ('expr_definition -> left_bra expr_list right_bra','expr_definition',3,'p_expr_definition_brackets','formatter.py',505),
-  ('expr_definition -> left_bra right_bra','expr_definition',2,'p_expr_definition_brackets_empty','formatter.py',510),
-  ('expr_definition -> left_par expr_definition_list right_par','expr_definition',3,'p_expr_definition_parentheses_unique','formatter.py',514),
-  ('expr_definition -> left_par expr_list right_par','expr_definition',3,'p_expr_definition_parentheses','formatter.py',523),
-  ('expr_definition -> left_par right_par','expr_definition',2,'p_expr_definition_parentheses_empty','formatter.py',532),
-  ('expr_list -> expr_definition_list comma expr_list','expr_list',3,'p_expr_list_next','formatter.py',537),
-  ('expr_list -> expr_definition_list','expr_list',1,'p_expr_list_end','formatter.py',541),
-  ('select -> SELECT','select',1,'p_token_to_upper','formatter.py',552),
-  ('all -> ALL','all',1,'p_token_to_upper','formatter.py',553),
-  ('distinct -> DISTINCT','distinct',1,'p_token_to_upper','formatter.py',554),
-  ('from -> FROM','from',1,'p_token_to_upper','formatter.py',555),
-  ('where -> WHERE','where',1,'p_token_to_upper','formatter.py',556),
-  ('by -> BY','by',1,'p_token_to_upper','formatter.py',557),
-  ('group -> GROUP','group',1,'p_token_to_upper','formatter.py',558),
-  ('order -> ORDER','order',1,'p_token_to_upper','formatter.py',559),
-  ('cluster -> CLUSTER','cluster',1,'p_token_to_upper','formatter.py',560),
-  ('distribute -> DISTRIBUTE','distribute',1,'p_token_to_upper','formatter.py',561),
-  ('sort -> SORT','sort',1,'p_token_to_upper','formatter.py',562),
-  ('partition -> PARTITION','partition',1,'p_token_to_upper','formatter.py',563),
-  ('having -> HAVING','having',1,'p_token_to_upper','formatter.py',564),
-  ('limit -> LIMIT','limit',1,'p_token_to_upper','formatter.py',565),
-  ('as -> AS','as',1,'p_token_to_upper','formatter.py',566),
-  ('case -> CASE','case',1,'p_token_to_upper','formatter.py',567),
-  ('when -> WHEN','when',1,'p_token_to_upper','formatter.py',568),
-  ('then -> THEN','then',1,'p_token_to_upper','formatter.py',569),
-  ('else -> ELSE','else',1,'p_token_to_upper','formatter.py',570),
-  ('end -> END','end',1,'p_token_to_upper','formatter.py',571),
-  ('or -> OR','or',1,'p_token_to_upper','formatter.py',572),
-  ('and -> AND','and',1,'p_token_to_upper','formatter.py',573),
-  ('not -> NOT','not',1,'p_token_to_upper','formatter.py',574),
-  ('is -> IS','is',1,'p_token_to_upper','formatter.py',575),
-  ('in -> IN','in',1,'p_token_to_upper','formatter.py',576),
-  ('true -> TRUE','true',1,'p_token_to_upper','formatter.py',577),
-  ('false -> FALSE','false',1,'p_token_to_upper','formatter.py',578),
-  ('null -> NULL','null',1,'p_token_to_upper','formatter.py',579),
-  ('coalesce -> COALESCE','coalesce',1,'p_token_to_upper','formatter.py',580),
-  ('cast -> CAST','cast',1,'p_token_to_upper','formatter.py',581),
-  ('concat -> CONCAT','concat',1,'p_token_to_upper','formatter.py',582),
-  ('union -> UNION','union',1,'p_token_to_upper','formatter.py',583),
-  ('except -> EXCEPT','except',1,'p_token_to_upper','formatter.py',584),
-  ('between -> BETWEEN','between',1,'p_token_to_upper','formatter.py',585),
-  ('asc -> ASC','asc',1,'p_token_to_upper','formatter.py',586),
-  ('desc -> DESC','desc',1,'p_token_to_upper','formatter.py',587),
-  ('join -> JOIN','join',1,'p_token_to_upper','formatter.py',588),
-  ('on -> ON','on',1,'p_token_to_upper','formatter.py',589),
-  ('inner -> INNER','inner',1,'p_token_to_upper','formatter.py',590),
-  ('outer -> OUTER','outer',1,'p_token_to_upper','formatter.py',591),
-  ('left -> LEFT','left',1,'p_token_to_upper','formatter.py',592),
-  ('right -> RIGHT','right',1,'p_token_to_upper','formatter.py',593),
-  ('full -> FULL','full',1,'p_token_to_upper','formatter.py',594),
-  ('semi -> SEMI','semi',1,'p_token_to_upper','formatter.py',595),
-  ('cross -> CROSS','cross',1,'p_token_to_upper','formatter.py',596),
-  ('natural -> NATURAL','natural',1,'p_token_to_upper','formatter.py',597),
-  ('with -> WITH','with',1,'p_token_to_upper','formatter.py',598),
-  ('option -> OPTION','option',1,'p_token_to_upper','formatter.py',599),
-  ('over -> OVER','over',1,'p_token_to_upper','formatter.py',600),
-  ('comma -> COMMA','comma',1,'p_token_unchanged','formatter.py',606),
-  ('comparison -> COMPARISON','comparison',1,'p_token_unchanged','formatter.py',607),
-  ('symbol -> SYMBOL','symbol',1,'p_token_unchanged','formatter.py',608),
-  ('semicolon -> SEMICOLON','semicolon',1,'p_token_unchanged','formatter.py',609),
-  ('point -> POINT','point',1,'p_token_unchanged','formatter.py',610),
-  ('label -> LABEL','label',1,'p_token_unchanged','formatter.py',611),
-  ('left_par -> LEFT_PAR','left_par',1,'p_token_unchanged','formatter.py',612),
-  ('right_par -> RIGHT_PAR','right_par',1,'p_token_unchanged','formatter.py',613),
-  ('left_bra -> LEFT_BRA','left_bra',1,'p_token_unchanged','formatter.py',614),
-  ('right_bra -> RIGHT_BRA','right_bra',1,'p_token_unchanged','formatter.py',615),
-  ('string_simple -> STRING_SIMPLE','string_simple',1,'p_token_unchanged','formatter.py',616),
-  ('string_double -> STRING_DOUBLE','string_double',1,'p_token_unchanged','formatter.py',617),
-  ('string_grave -> STRING_GRAVE','string_grave',1,'p_token_unchanged','formatter.py',618),
-  ('select -> select comment','select',2,'p_token_commented','formatter.py',624),
-  ('all -> all comment','all',2,'p_token_commented','formatter.py',625),
-  ('distinct -> distinct comment','distinct',2,'p_token_commented','formatter.py',626),
-  ('from -> from comment','from',2,'p_token_commented','formatter.py',627),
-  ('where -> where comment','where',2,'p_token_commented','formatter.py',628),
-  ('by -> by comment','by',2,'p_token_commented','formatter.py',629),
-  ('group -> group comment','group',2,'p_token_commented','formatter.py',630),
-  ('order -> order comment','order',2,'p_token_commented','formatter.py',631),
-  ('cluster -> cluster comment','cluster',2,'p_token_commented','formatter.py',632),
-  ('distribute -> distribute comment','distribute',2,'p_token_commented','formatter.py',633),
-  ('sort -> sort comment','sort',2,'p_token_commented','formatter.py',634),
-  ('partition -> partition comment','partition',2,'p_token_commented','formatter.py',635),
-  ('having -> having comment','having',2,'p_token_commented','formatter.py',636),
-  ('limit -> limit comment','limit',2,'p_token_commented','formatter.py',637),
-  ('as -> as comment','as',2,'p_token_commented','formatter.py',638),
-  ('case -> case comment','case',2,'p_token_commented','formatter.py',639),
-  ('when -> when comment','when',2,'p_token_commented','formatter.py',640),
-  ('then -> then comment','then',2,'p_token_commented','formatter.py',641),
-  ('else -> else comment','else',2,'p_token_commented','formatter.py',642),
-  ('end -> end comment','end',2,'p_token_commented','formatter.py',643),
-  ('or -> or comment','or',2,'p_token_commented','formatter.py',644),
-  ('and -> and comment','and',2,'p_token_commented','formatter.py',645),
-  ('not -> not comment','not',2,'p_token_commented','formatter.py',646),
-  ('is -> is comment','is',2,'p_token_commented','formatter.py',647),
-  ('in -> in comment','in',2,'p_token_commented','formatter.py',648),
-  ('true -> true comment','true',2,'p_token_commented','formatter.py',649),
-  ('false -> false comment','false',2,'p_token_commented','formatter.py',650),
-  ('null -> null comment','null',2,'p_token_commented','formatter.py',651),
-  ('coalesce -> coalesce comment','coalesce',2,'p_token_commented','formatter.py',652),
-  ('cast -> cast comment','cast',2,'p_token_commented','formatter.py',653),
-  ('concat -> concat comment','concat',2,'p_token_commented','formatter.py',654),
-  ('union -> union comment','union',2,'p_token_commented','formatter.py',655),
-  ('except -> except comment','except',2,'p_token_commented','formatter.py',656),
-  ('between -> between comment','between',2,'p_token_commented','formatter.py',657),
-  ('asc -> asc comment','asc',2,'p_token_commented','formatter.py',658),
-  ('desc -> desc comment','desc',2,'p_token_commented','formatter.py',659),
-  ('join -> join comment','join',2,'p_token_commented','formatter.py',660),
-  ('on -> on comment','on',2,'p_token_commented','formatter.py',661),
-  ('inner -> inner comment','inner',2,'p_token_commented','formatter.py',662),
-  ('outer -> outer comment','outer',2,'p_token_commented','formatter.py',663),
-  ('left -> left comment','left',2,'p_token_commented','formatter.py',664),
-  ('right -> right comment','right',2,'p_token_commented','formatter.py',665),
-  ('full -> full comment','full',2,'p_token_commented','formatter.py',666),
-  ('semi -> semi comment','semi',2,'p_token_commented','formatter.py',667),
-  ('cross -> cross comment','cross',2,'p_token_commented','formatter.py',668),
-  ('natural -> natural comment','natural',2,'p_token_commented','formatter.py',669),
-  ('with -> with comment','with',2,'p_token_commented','formatter.py',670),
-  ('option -> option comment','option',2,'p_token_commented','formatter.py',671),
-  ('over -> over comment','over',2,'p_token_commented','formatter.py',672),
-  ('comma -> comma comment','comma',2,'p_token_commented','formatter.py',673),
-  ('comparison -> comparison comment','comparison',2,'p_token_commented','formatter.py',674),
-  ('symbol -> symbol comment','symbol',2,'p_token_commented','formatter.py',675),
-  ('semicolon -> semicolon comment','semicolon',2,'p_token_commented','formatter.py',676),
-  ('point -> point comment','point',2,'p_token_commented','formatter.py',677),
-  ('label -> label comment','label',2,'p_token_commented','formatter.py',678),
-  ('left_par -> left_par comment','left_par',2,'p_token_commented','formatter.py',679),
-  ('right_par -> right_par comment','right_par',2,'p_token_commented','formatter.py',680),
-  ('left_bra -> left_bra comment','left_bra',2,'p_token_commented','formatter.py',681),
-  ('right_bra -> right_bra comment','right_bra',2,'p_token_commented','formatter.py',682),
-  ('string_simple -> string_simple comment','string_simple',2,'p_token_commented','formatter.py',683),
-  ('string_double -> string_double comment','string_double',2,'p_token_commented','formatter.py',684),
-  ('string_grave -> string_grave comment','string_grave',2,'p_token_commented','formatter.py',685),
-  ('comment -> COMMENT','comment',1,'p_comment','formatter.py',697),
-  ('comment -> COMMENT_ALONE','comment',1,'p_comment_alone','formatter.py',704),
+  ('formatted_query -> query','formatted_query',1,'p_formatted_query','formatter.py',158),
+  ('query -> subquerry','query',1,'p_query','formatter.py',169),
+  ('query -> query semicolon','query',2,'p_query_with_semicolon','formatter.py',173),
+  ('query -> comment query','query',2,'p_query_with_comment','formatter.py',177),
+  ('subquerry -> expr_definition_list','subquerry',1,'p_subquerry','formatter.py',188),
+  ('subquerry -> subquerry by_block','subquerry',2,'p_subquerry_by_block','formatter.py',192),
+  ('select_full -> select_block','select_full',1,'p_select_full_select','formatter.py',203),
+  ('select_full -> select_full combine_keyword select_full','select_full',3,'p_select_full_combined','formatter.py',207),
+  ('select_full -> left_par select_full right_par','select_full',3,'p_select_full_parentheses','formatter.py',212),
+  ('select_full -> select_block additional_block_list','select_full',2,'p_select_full_more','formatter.py',217),
+  ('select_block -> select_keyword select_clause','select_block',2,'p_select_block','formatter.py',222),
+  ('select_keyword -> select','select_keyword',1,'p_select_keyword_alone','formatter.py',227),
+  ('select_keyword -> select distinct','select_keyword',2,'p_select_keyword_enriched','formatter.py',232),
+  ('select_keyword -> select all','select_keyword',2,'p_select_keyword_enriched','formatter.py',233),
+  ('select_clause -> select_clause comma expr','select_clause',3,'p_select_clause_next','formatter.py',238),
+  ('select_clause -> expr','select_clause',1,'p_select_clause_end','formatter.py',243),
+  ('additional_block_list -> additional_block additional_block_list','additional_block_list',2,'p_additional_block_list_next','formatter.py',254),
+  ('additional_block_list -> additional_block','additional_block_list',1,'p_additional_block_list_end','formatter.py',259),
+  ('additional_block -> keyword_block','additional_block',1,'p_additional_block','formatter.py',264),
+  ('additional_block -> by_block','additional_block',1,'p_additional_block','formatter.py',265),
+  ('additional_block -> join_block','additional_block',1,'p_additional_block','formatter.py',266),
+  ('keyword_block -> from clause','keyword_block',2,'p_keyword_block','formatter.py',272),
+  ('keyword_block -> where clause','keyword_block',2,'p_keyword_block','formatter.py',273),
+  ('keyword_block -> limit clause','keyword_block',2,'p_keyword_block','formatter.py',274),
+  ('keyword_block -> having clause','keyword_block',2,'p_keyword_block','formatter.py',275),
+  ('keyword_block -> option clause','keyword_block',2,'p_keyword_block','formatter.py',276),
+  ('by_block -> group by clause','by_block',3,'p_by_block','formatter.py',282),
+  ('by_block -> order by clause','by_block',3,'p_by_block','formatter.py',283),
+  ('by_block -> cluster by clause','by_block',3,'p_by_block','formatter.py',284),
+  ('by_block -> distribute by clause','by_block',3,'p_by_block','formatter.py',285),
+  ('by_block -> sort by clause','by_block',3,'p_by_block','formatter.py',286),
+  ('by_block -> partition by clause','by_block',3,'p_by_block','formatter.py',287),
+  ('clause -> expr_list','clause',1,'p_clause','formatter.py',292),
+  ('combine_keyword -> union all','combine_keyword',2,'p_combine_keyword_composed','formatter.py',305),
+  ('combine_keyword -> union distinct','combine_keyword',2,'p_combine_keyword_composed','formatter.py',306),
+  ('combine_keyword -> union','combine_keyword',1,'p_combine_keyword_alone','formatter.py',312),
+  ('combine_keyword -> except','combine_keyword',1,'p_combine_keyword_alone','formatter.py',313),
+  ('join_block -> join_expression clause on expr_list','join_block',4,'p_join_block_on','formatter.py',325),
+  ('join_block -> join_expression clause','join_block',2,'p_join_block_alone','formatter.py',330),
+  ('join_expression -> join_prefix_list join','join_expression',2,'p_join_expression','formatter.py',334),
+  ('join_expression -> join','join_expression',1,'p_join_expression_alone','formatter.py',338),
+  ('join_prefix -> inner','join_prefix',1,'p_join_prefix','formatter.py',343),
+  ('join_prefix -> outer','join_prefix',1,'p_join_prefix','formatter.py',344),
+  ('join_prefix -> left','join_prefix',1,'p_join_prefix','formatter.py',345),
+  ('join_prefix -> right','join_prefix',1,'p_join_prefix','formatter.py',346),
+  ('join_prefix -> full','join_prefix',1,'p_join_prefix','formatter.py',347),
+  ('join_prefix -> semi','join_prefix',1,'p_join_prefix','formatter.py',348),
+  ('join_prefix -> cross','join_prefix',1,'p_join_prefix','formatter.py',349),
+  ('join_prefix -> natural','join_prefix',1,'p_join_prefix','formatter.py',350),
+  ('join_prefix_list -> join_prefix join_prefix_list','join_prefix_list',2,'p_join_prefix_list_next','formatter.py',356),
+  ('join_prefix_list -> join_prefix','join_prefix_list',1,'p_join_prefix_list_end','formatter.py',360),
+  ('case_when -> case case_when_clause_list end','case_when',3,'p_case_when','formatter.py',371),
+  ('case_when_clause_list -> case_when_clause case_when_clause_list','case_when_clause_list',2,'p_case_when_clause_list_next','formatter.py',376),
+  ('case_when_clause_list -> case_when_clause','case_when_clause_list',1,'p_case_when_clause_list_end','formatter.py',381),
+  ('case_when_clause -> when expr then expr','case_when_clause',4,'p_case_when_clause_if','formatter.py',385),
+  ('case_when_clause -> else expr','case_when_clause',2,'p_case_when_clause_else','formatter.py',389),
+  ('over_block -> over left_par over_clause_list right_par','over_block',4,'p_over_block','formatter.py',398),
+  ('over_clause_list -> over_clause_list over_clause','over_clause_list',2,'p_over_clause_list_next','formatter.py',403),
+  ('over_clause_list -> over_clause','over_clause_list',1,'p_over_clause_list_alone','formatter.py',408),
+  ('over_clause -> by_block','over_clause',1,'p_over_clause','formatter.py',412),
+  ('expr -> expr_definition_list','expr',1,'p_expr','formatter.py',425),
+  ('expr_definition_list -> expr_definition expr_definition_list','expr_definition_list',2,'p_expr_definition_list_next','formatter.py',429),
+  ('expr_definition_list -> expr_definition point expr_definition_list','expr_definition_list',3,'p_expr_definition_list_point','formatter.py',436),
+  ('expr_definition_list -> expr_definition','expr_definition_list',1,'p_expr_definition_list_end','formatter.py',440),
+  ('expr_definition_list -> not expr_definition_list','expr_definition_list',2,'p_expr_definition_list_prefix','formatter.py',444),
+  ('expr_definition_list -> expr_definition comparison expr_definition_list','expr_definition_list',3,'p_expr_definition_list_infix','formatter.py',452),
+  ('expr_definition_list -> expr_definition symbol expr_definition_list','expr_definition_list',3,'p_expr_definition_list_infix','formatter.py',453),
+  ('expr_definition_list -> expr_definition as expr_definition_list','expr_definition_list',3,'p_expr_definition_list_infix','formatter.py',454),
+  ('expr_definition_list -> expr_definition is expr_definition_list','expr_definition_list',3,'p_expr_definition_list_infix','formatter.py',455),
+  ('expr_definition_list -> expr_definition in expr_definition_list','expr_definition_list',3,'p_expr_definition_list_infix','formatter.py',456),
+  ('expr_definition_list -> expr_definition with expr_definition_list','expr_definition_list',3,'p_expr_definition_list_infix','formatter.py',457),
+  ('expr_definition_list -> expr_definition not in expr_definition_list','expr_definition_list',4,'p_expr_definition_list_double_infix','formatter.py',462),
+  ('expr_definition_list -> between expr_definition_list','expr_definition_list',2,'p_expr_definition_list_between','formatter.py',466),
+  ('expr_definition_list -> expr_definition and expr_definition_list','expr_definition_list',3,'p_expr_definition_list_boolean','formatter.py',478),
+  ('expr_definition_list -> expr_definition or expr_definition_list','expr_definition_list',3,'p_expr_definition_list_boolean','formatter.py',479),
+  ('expr_definition -> label','expr_definition',1,'p_expr_definition_value','formatter.py',486),
+  ('expr_definition -> string_simple','expr_definition',1,'p_expr_definition_value','formatter.py',487),
+  ('expr_definition -> string_double','expr_definition',1,'p_expr_definition_value','formatter.py',488),
+  ('expr_definition -> string_grave','expr_definition',1,'p_expr_definition_value','formatter.py',489),
+  ('expr_definition -> distinct','expr_definition',1,'p_expr_definition_keyword','formatter.py',495),
+  ('expr_definition -> all','expr_definition',1,'p_expr_definition_keyword','formatter.py',496),
+  ('expr_definition -> null','expr_definition',1,'p_expr_definition_keyword','formatter.py',497),
+  ('expr_definition -> true','expr_definition',1,'p_expr_definition_keyword','formatter.py',498),
+  ('expr_definition -> false','expr_definition',1,'p_expr_definition_keyword','formatter.py',499),
+  ('expr_definition -> coalesce','expr_definition',1,'p_expr_definition_keyword','formatter.py',500),
+  ('expr_definition -> cast','expr_definition',1,'p_expr_definition_keyword','formatter.py',501),
+  ('expr_definition -> concat','expr_definition',1,'p_expr_definition_keyword','formatter.py',502),
+  ('expr_definition -> asc','expr_definition',1,'p_expr_definition_keyword','formatter.py',503),
+  ('expr_definition -> desc','expr_definition',1,'p_expr_definition_keyword','formatter.py',504),
+  ('expr_definition -> symbol','expr_definition',1,'p_expr_definition_keyword','formatter.py',505),
+  ('expr_definition -> case_when','expr_definition',1,'p_expr_definition_block','formatter.py',511),
+  ('expr_definition -> select_full','expr_definition',1,'p_expr_definition_block','formatter.py',512),
+  ('expr_definition -> over_block','expr_definition',1,'p_expr_definition_block','formatter.py',513),
+  ('expr_definition -> left_bra expr_list right_bra','expr_definition',3,'p_expr_definition_brackets','formatter.py',518),
+  ('expr_definition -> left_bra right_bra','expr_definition',2,'p_expr_definition_brackets_empty','formatter.py',522),
+  ('expr_definition -> left_par expr_definition_list right_par','expr_definition',3,'p_expr_definition_parentheses_unique','formatter.py',526),
+  ('expr_definition -> left_par expr_list right_par','expr_definition',3,'p_expr_definition_parentheses','formatter.py',534),
+  ('expr_definition -> left_par right_par','expr_definition',2,'p_expr_definition_parentheses_empty','formatter.py',542),
+  ('expr_list -> expr_list comma expr_definition_list','expr_list',3,'p_expr_list_next','formatter.py',547),
+  ('expr_list -> expr_definition_list','expr_list',1,'p_expr_list_end','formatter.py',552),
+  ('select -> SELECT','select',1,'p_token_to_upper','formatter.py',563),
+  ('all -> ALL','all',1,'p_token_to_upper','formatter.py',564),
+  ('distinct -> DISTINCT','distinct',1,'p_token_to_upper','formatter.py',565),
+  ('from -> FROM','from',1,'p_token_to_upper','formatter.py',566),
+  ('where -> WHERE','where',1,'p_token_to_upper','formatter.py',567),
+  ('by -> BY','by',1,'p_token_to_upper','formatter.py',568),
+  ('group -> GROUP','group',1,'p_token_to_upper','formatter.py',569),
+  ('order -> ORDER','order',1,'p_token_to_upper','formatter.py',570),
+  ('cluster -> CLUSTER','cluster',1,'p_token_to_upper','formatter.py',571),
+  ('distribute -> DISTRIBUTE','distribute',1,'p_token_to_upper','formatter.py',572),
+  ('sort -> SORT','sort',1,'p_token_to_upper','formatter.py',573),
+  ('partition -> PARTITION','partition',1,'p_token_to_upper','formatter.py',574),
+  ('having -> HAVING','having',1,'p_token_to_upper','formatter.py',575),
+  ('limit -> LIMIT','limit',1,'p_token_to_upper','formatter.py',576),
+  ('as -> AS','as',1,'p_token_to_upper','formatter.py',577),
+  ('case -> CASE','case',1,'p_token_to_upper','formatter.py',578),
+  ('when -> WHEN','when',1,'p_token_to_upper','formatter.py',579),
+  ('then -> THEN','then',1,'p_token_to_upper','formatter.py',580),
+  ('else -> ELSE','else',1,'p_token_to_upper','formatter.py',581),
+  ('end -> END','end',1,'p_token_to_upper','formatter.py',582),
+  ('or -> OR','or',1,'p_token_to_upper','formatter.py',583),
+  ('and -> AND','and',1,'p_token_to_upper','formatter.py',584),
+  ('not -> NOT','not',1,'p_token_to_upper','formatter.py',585),
+  ('is -> IS','is',1,'p_token_to_upper','formatter.py',586),
+  ('in -> IN','in',1,'p_token_to_upper','formatter.py',587),
+  ('true -> TRUE','true',1,'p_token_to_upper','formatter.py',588),
+  ('false -> FALSE','false',1,'p_token_to_upper','formatter.py',589),
+  ('null -> NULL','null',1,'p_token_to_upper','formatter.py',590),
+  ('coalesce -> COALESCE','coalesce',1,'p_token_to_upper','formatter.py',591),
+  ('cast -> CAST','cast',1,'p_token_to_upper','formatter.py',592),
+  ('concat -> CONCAT','concat',1,'p_token_to_upper','formatter.py',593),
+  ('union -> UNION','union',1,'p_token_to_upper','formatter.py',594),
+  ('except -> EXCEPT','except',1,'p_token_to_upper','formatter.py',595),
+  ('between -> BETWEEN','between',1,'p_token_to_upper','formatter.py',596),
+  ('asc -> ASC','asc',1,'p_token_to_upper','formatter.py',597),
+  ('desc -> DESC','desc',1,'p_token_to_upper','formatter.py',598),
+  ('join -> JOIN','join',1,'p_token_to_upper','formatter.py',599),
+  ('on -> ON','on',1,'p_token_to_upper','formatter.py',600),
+  ('inner -> INNER','inner',1,'p_token_to_upper','formatter.py',601),
+  ('outer -> OUTER','outer',1,'p_token_to_upper','formatter.py',602),
+  ('left -> LEFT','left',1,'p_token_to_upper','formatter.py',603),
+  ('right -> RIGHT','right',1,'p_token_to_upper','formatter.py',604),
+  ('full -> FULL','full',1,'p_token_to_upper','formatter.py',605),
+  ('semi -> SEMI','semi',1,'p_token_to_upper','formatter.py',606),
+  ('cross -> CROSS','cross',1,'p_token_to_upper','formatter.py',607),
+  ('natural -> NATURAL','natural',1,'p_token_to_upper','formatter.py',608),
+  ('with -> WITH','with',1,'p_token_to_upper','formatter.py',609),
+  ('option -> OPTION','option',1,'p_token_to_upper','formatter.py',610),
+  ('over -> OVER','over',1,'p_token_to_upper','formatter.py',611),
+  ('comma -> COMMA','comma',1,'p_token_unchanged','formatter.py',617),
+  ('comparison -> COMPARISON','comparison',1,'p_token_unchanged','formatter.py',618),
+  ('symbol -> SYMBOL','symbol',1,'p_token_unchanged','formatter.py',619),
+  ('semicolon -> SEMICOLON','semicolon',1,'p_token_unchanged','formatter.py',620),
+  ('point -> POINT','point',1,'p_token_unchanged','formatter.py',621),
+  ('label -> LABEL','label',1,'p_token_unchanged','formatter.py',622),
+  ('left_par -> LEFT_PAR','left_par',1,'p_token_unchanged','formatter.py',623),
+  ('right_par -> RIGHT_PAR','right_par',1,'p_token_unchanged','formatter.py',624),
+  ('left_bra -> LEFT_BRA','left_bra',1,'p_token_unchanged','formatter.py',625),
+  ('right_bra -> RIGHT_BRA','right_bra',1,'p_token_unchanged','formatter.py',626),
+  ('string_simple -> STRING_SIMPLE','string_simple',1,'p_token_unchanged','formatter.py',627),
+  ('string_double -> STRING_DOUBLE','string_double',1,'p_token_unchanged','formatter.py',628),
+  ('string_grave -> STRING_GRAVE','string_grave',1,'p_token_unchanged','formatter.py',629),
+  ('select -> select comment','select',2,'p_token_commented','formatter.py',635),
+  ('all -> all comment','all',2,'p_token_commented','formatter.py',636),
+  ('distinct -> distinct comment','distinct',2,'p_token_commented','formatter.py',637),
+  ('from -> from comment','from',2,'p_token_commented','formatter.py',638),
+  ('where -> where comment','where',2,'p_token_commented','formatter.py',639),
+  ('by -> by comment','by',2,'p_token_commented','formatter.py',640),
+  ('group -> group comment','group',2,'p_token_commented','formatter.py',641),
+  ('order -> order comment','order',2,'p_token_commented','formatter.py',642),
+  ('cluster -> cluster comment','cluster',2,'p_token_commented','formatter.py',643),
+  ('distribute -> distribute comment','distribute',2,'p_token_commented','formatter.py',644),
+  ('sort -> sort comment','sort',2,'p_token_commented','formatter.py',645),
+  ('partition -> partition comment','partition',2,'p_token_commented','formatter.py',646),
+  ('having -> having comment','having',2,'p_token_commented','formatter.py',647),
+  ('limit -> limit comment','limit',2,'p_token_commented','formatter.py',648),
+  ('as -> as comment','as',2,'p_token_commented','formatter.py',649),
+  ('case -> case comment','case',2,'p_token_commented','formatter.py',650),
+  ('when -> when comment','when',2,'p_token_commented','formatter.py',651),
+  ('then -> then comment','then',2,'p_token_commented','formatter.py',652),
+  ('else -> else comment','else',2,'p_token_commented','formatter.py',653),
+  ('end -> end comment','end',2,'p_token_commented','formatter.py',654),
+  ('or -> or comment','or',2,'p_token_commented','formatter.py',655),
+  ('and -> and comment','and',2,'p_token_commented','formatter.py',656),
+  ('not -> not comment','not',2,'p_token_commented','formatter.py',657),
+  ('is -> is comment','is',2,'p_token_commented','formatter.py',658),
+  ('in -> in comment','in',2,'p_token_commented','formatter.py',659),
+  ('true -> true comment','true',2,'p_token_commented','formatter.py',660),
+  ('false -> false comment','false',2,'p_token_commented','formatter.py',661),
+  ('null -> null comment','null',2,'p_token_commented','formatter.py',662),
+  ('coalesce -> coalesce comment','coalesce',2,'p_token_commented','formatter.py',663),
+  ('cast -> cast comment','cast',2,'p_token_commented','formatter.py',664),
+  ('concat -> concat comment','concat',2,'p_token_commented','formatter.py',665),
+  ('union -> union comment','union',2,'p_token_commented','formatter.py',666),
+  ('except -> except comment','except',2,'p_token_commented','formatter.py',667),
+  ('between -> between comment','between',2,'p_token_commented','formatter.py',668),
+  ('asc -> asc comment','asc',2,'p_token_commented','formatter.py',669),
+  ('desc -> desc comment','desc',2,'p_token_commented','formatter.py',670),
+  ('join -> join comment','join',2,'p_token_commented','formatter.py',671),
+  ('on -> on comment','on',2,'p_token_commented','formatter.py',672),
+  ('inner -> inner comment','inner',2,'p_token_commented','formatter.py',673),
+  ('outer -> outer comment','outer',2,'p_token_commented','formatter.py',674),
+  ('left -> left comment','left',2,'p_token_commented','formatter.py',675),
+  ('right -> right comment','right',2,'p_token_commented','formatter.py',676),
+  ('full -> full comment','full',2,'p_token_commented','formatter.py',677),
+  ('semi -> semi comment','semi',2,'p_token_commented','formatter.py',678),
+  ('cross -> cross comment','cross',2,'p_token_commented','formatter.py',679),
+  ('natural -> natural comment','natural',2,'p_token_commented','formatter.py',680),
+  ('with -> with comment','with',2,'p_token_commented','formatter.py',681),
+  ('option -> option comment','option',2,'p_token_commented','formatter.py',682),
+  ('over -> over comment','over',2,'p_token_commented','formatter.py',683),
+  ('comma -> comma comment','comma',2,'p_token_commented','formatter.py',684),
+  ('comparison -> comparison comment','comparison',2,'p_token_commented','formatter.py',685),
+  ('symbol -> symbol comment','symbol',2,'p_token_commented','formatter.py',686),
+  ('semicolon -> semicolon comment','semicolon',2,'p_token_commented','formatter.py',687),
+  ('point -> point comment','point',2,'p_token_commented','formatter.py',688),
+  ('label -> label comment','label',2,'p_token_commented','formatter.py',689),
+  ('left_par -> left_par comment','left_par',2,'p_token_commented','formatter.py',690),
+  ('right_par -> right_par comment','right_par',2,'p_token_commented','formatter.py',691),
+  ('left_bra -> left_bra comment','left_bra',2,'p_token_commented','formatter.py',692),
+  ('right_bra -> right_bra comment','right_bra',2,'p_token_commented','formatter.py',693),
+  ('string_simple -> string_simple comment','string_simple',2,'p_token_commented','formatter.py',694),
+  ('string_double -> string_double comment','string_double',2,'p_token_commented','formatter.py',695),
+  ('string_grave -> string_grave comment','string_grave',2,'p_token_commented','formatter.py',696),
+  ('comment -> COMMENT','comment',1,'p_comment','formatter.py',708),
+  ('comment -> COMMENT_ALONE','comment',1,'p_comment_alone','formatter.py',716),
+  ('select_clause -> error','select_clause',1,'p_select_clause_error','formatter.py',736),
+  ('clause -> error','clause',1,'p_clause_error','formatter.py',740),
+  ('select_full -> error keyword_block','select_full',2,'p_select_full_error','formatter.py',745),
+  ('select_full -> error join_block','select_full',2,'p_select_full_error','formatter.py',746),
+  ('select_full -> error keyword_block additional_block_list','select_full',3,'p_select_full_error_more','formatter.py',752),
+  ('select_full -> error join_block additional_block_list','select_full',3,'p_select_full_error_more','formatter.py',753),
+  ('query -> error','query',1,'p_query_error','formatter.py',759),
 ]
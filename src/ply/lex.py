@@ -63,6 +63,9 @@ class LexError(Exception):
 
 # Token class.  This class is used to represent the tokens produced.
 class LexToken(object):
+    # Allocated for every match, hence slots rather than a dictionary
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'lexer')
+
     def __str__(self):
         return 'LexToken(%s,%r,%d,%d)' % (self.type, self.value, self.lineno, self.lexpos)
 
@@ -108,6 +111,7 @@ class NullLogger(object):
 #    input()          -  Store a new string in the lexer
 #    token()          -  Get the next token
 #    clone()          -  Clone the lexer
+#    bytes_clone()    -  Clone the lexer for encoded input, see BytesLexer
 #
 #    lineno           -  Current line number
 #    lexpos           -  Current position in the input string
@@ -169,6 +173,22 @@ class Lexer:
             c.lexmodule = object
         return c
 
+    # ------------------------------------------------------------
+    # bytes_clone() - Clone the lexer to read encoded input
+    # ------------------------------------------------------------
+    def bytes_clone(self, encoding='utf-8'):
+        c = BytesLexer()
+        c.__dict__.update(self.__dict__)
+        c.encoding = encoding
+        c.lexstatere = {}
+        for key, ritem in self.lexstatere.items():
+            c.lexstatere[key] = [(re.compile(cre.pattern.encode(encoding), cre.flags & ~re.UNICODE), findex)
+                                 for cre, findex in ritem]
+        c.lexstateignore = dict((key, ignore.encode(encoding)) for key, ignore in self.lexstateignore.items())
+        c.lexliterals = ''.join(self.lexliterals).encode(encoding)
+        c.begin(self.lexstate)
+        return c
+
     # ------------------------------------------------------------
     # writetab() - Write lexer information to a table file
     # ------------------------------------------------------------
@@ -424,6 +444,121 @@ class Lexer:
 
     __next__ = next
 
+# -----------------------------------------------------------------------------
+# BytesLexer
+#
+# Lexer made by Lexer.bytes_clone(), reading the encoded input given to input():
+# bytes, or any buffer such as an mmap, which is never decoded as a whole.  The
+# master regular expressions are compiled again for bytes, so that character
+# classes such as \s only match ASCII characters, and lexpos counts bytes.
+# The ignored matches are never sliced, and the values of the other tokens
+# are decoded when they are returned or passed to a rule function.
+# -----------------------------------------------------------------------------
+
+class BytesLexer(Lexer):
+    def input(self, s):
+        self.lexdata = s
+        self.lexpos = 0
+        self.lexlen = len(s)
+
+    def token(self):
+        lexpos    = self.lexpos
+        lexlen    = self.lexlen
+        lexignore = self.lexignore
+        lexdata   = self.lexdata
+        encoding  = self.encoding
+
+        while lexpos < lexlen:
+            if lexdata[lexpos] in lexignore:
+                lexpos += 1
+                continue
+
+            for lexre, lexindexfunc in self.lexre:
+                m = lexre.match(lexdata, lexpos)
+                if not m:
+                    continue
+
+                func, type = lexindexfunc[m.lastindex]
+                if not func and not type:
+                    lexpos = m.end()
+                    break
+
+                tok = LexToken()
+                tok.value = str(m.group(), encoding)
+                tok.lineno = self.lineno
+                tok.lexpos = lexpos
+                tok.type = type
+
+                if not func:
+                    self.lexpos = m.end()
+                    return tok
+
+                lexpos = m.end()
+                tok.lexer = self
+                self.lexmatch = m
+                self.lexpos = lexpos
+
+                newtok = func(tok)
+                if not newtok:
+                    lexpos    = self.lexpos
+                    lexignore = self.lexignore
+                    break
+
+                if not self.lexoptimize:
+                    if newtok.type not in self.lextokens_all:
+                        raise LexError("%s:%d: Rule '%s' returned an unknown token type '%s'" % (
+                            func.__code__.co_filename, func.__code__.co_firstlineno,
+                            func.__name__, newtok.type), lexdata[lexpos:lexpos + 1])
+
+                return newtok
+            else:
+                if lexdata[lexpos] in self.lexliterals:
+                    tok = LexToken()
+                    tok.value = str(lexdata[lexpos:lexpos + 1], encoding)
+                    tok.lineno = self.lineno
+                    tok.type = tok.value
+                    tok.lexpos = lexpos
+                    self.lexpos = lexpos + 1
+                    return tok
+
+                # The value of an error token is the byte not matched only,
+                # rather than the rest of the input
+                value = str(lexdata[lexpos:lexpos + 1], encoding, 'replace')
+                if self.lexerrorf:
+                    tok = LexToken()
+                    tok.value = value
+                    tok.lineno = self.lineno
+                    tok.type = 'error'
+                    tok.lexer = self
+                    tok.lexpos = lexpos
+                    self.lexpos = lexpos
+                    newtok = self.lexerrorf(tok)
+                    if lexpos == self.lexpos:
+                        raise LexError("Scanning error. Illegal character '%s'" % value, value)
+                    lexpos = self.lexpos
+                    if not newtok:
+                        continue
+                    return newtok
+
+                self.lexpos = lexpos
+                raise LexError("Illegal character '%s' at index %d" % (value, lexpos), value)
+
+        if self.lexeoff:
+            tok = LexToken()
+            tok.type = 'eof'
+            tok.value = ''
+            tok.lineno = self.lineno
+            tok.lexpos = lexpos
+            tok.lexer = self
+            self.lexpos = lexpos
+            newtok = self.lexeoff(tok)
+            return newtok
+
+        self.lexpos = lexpos + 1
+        if self.lexdata is None:
+            raise RuntimeError('No input string given with input()')
+        return None
+
 # -----------------------------------------------------------------------------
 #                           ==== Lex Builder ===
 #
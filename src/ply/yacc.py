@@ -215,6 +215,8 @@ def call_errorfunc(errorfunc, token, parser):
 #        .endlexpos  = Ending lex position (optional, set automatically)
 
 class YaccSymbol:
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'endlineno', 'endlexpos')
+
     def __str__(self):
         return self.type
 
@@ -231,6 +233,8 @@ class YaccSymbol:
 # representing the range of positional information for a symbol.
 
 class YaccProduction:
+    __slots__ = ('slice', 'stack', 'lexer', 'parser')
+
     def __init__(self, s, stack=None):
         self.slice = s
         self.stack = stack
@@ -279,6 +283,70 @@ class YaccProduction:
     def error(self):
         raise SyntaxError
 
+# -----------------------------------------------------------------------------
+#                             == CompactTable ==
+#
+# The action and goto tables of a parser, with the symbols numbered and the
+# row of each state stored in a tuple rather than in a dictionary.  The action
+# of a state for a terminal is action[state][terminal], missing entries are
+# None, and default[state] holds the reduction of the states reducing whatever
+# the lookahead.  The tables are built from the dictionaries read from the table
+# file or generated, which remain the reference.
+#
+# Rows hold the same integer objects, read as they are, whereas the items of an
+# array.array would be converted to new integers at every read.
+# -----------------------------------------------------------------------------
+
+class CompactTable(object):
+    def __init__(self, action, goto, productions, defaulted_states):
+        terminals = set(['$end', 'error'])
+        for row in action.values():
+            terminals.update(row)
+        nonterminals = set(p.name for p in productions)
+        for row in goto.values():
+            nonterminals.update(row)
+
+        # The last column is left empty for the token types unknown to the grammar
+        self.terminals = sorted(terminals)
+        self.terminal_ids = dict((name, i) for i, name in enumerate(self.terminals))
+        self.nonterminals = sorted(nonterminals)
+        self.nonterminal_ids = dict((name, i) for i, name in enumerate(self.nonterminals))
+
+        states = max(list(action) + list(goto)) + 1
+        integers = {}
+        self.action = self.rows(action, states, self.terminal_ids, len(self.terminals) + 1, integers)
+        self.goto = self.rows(goto, states, self.nonterminal_ids, len(self.nonterminals), integers)
+        self.lhs = tuple(self.nonterminal_ids[p.name] for p in productions)
+        self.default = [None] * states
+        for state, value in defaulted_states.items():
+            self.default[state] = value
+
+    @staticmethod
+    def rows(table, states, ids, width, integers):
+        # States with the same entries share the same row
+        result = [()] * states
+        shared = {}
+        for state, entries in table.items():
+            row = [None] * width
+            for name, value in entries.items():
+                row[ids[name]] = integers.setdefault(value, value)
+            row = tuple(row)
+            result[state] = shared.setdefault(row, row)
+        return result
+
+    def expand(self):
+        'Dictionaries of the action and goto tables, as read from a table file'
+        return self.entries(self.action, self.terminals), self.entries(self.goto, self.nonterminals)
+
+    @staticmethod
+    def entries(rows, names):
+        table = {}
+        for state, row in enumerate(rows):
+            for symbol, value in enumerate(row):
+                if value is not None:
+                    table.setdefault(state, {})[names[symbol]] = value
+        return table
+
 # -----------------------------------------------------------------------------
 #                               == LRParser ==
 #
@@ -293,6 +361,7 @@ class LRParser:
         self.errorfunc = errorf
         self.set_defaulted_states()
         self.errorok = True
+        self.compact = None
 
     def errok(self):
         self.errorok = True
@@ -322,14 +391,28 @@ class LRParser:
 
     def disable_defaulted_states(self):
         self.defaulted_states = {}
+        if self.compact:
+            self.compact.default = [None] * len(self.compact.default)
+
+    # Switches the parser to compact tables and parseopt_compact(). The
+    # dictionaries are dropped, and built again only for debugging or tracking.
+    def compact_tables(self):
+        if self.compact is None:
+            self.compact = CompactTable(self.action, self.goto, self.productions, self.defaulted_states)
+            self.action = None
+            self.goto = None
 
     def parse(self, input=None, lexer=None, debug=False, tracking=False, tokenfunc=None):
+        if (debug or yaccdevel or tracking) and self.action is None:
+            self.action, self.goto = self.compact.expand()
         if debug or yaccdevel:
             if isinstance(debug, int):
                 debug = PlyLogger(sys.stderr)
             return self.parsedebug(input, lexer, debug, tracking, tokenfunc)
         elif tracking:
             return self.parseopt(input, lexer, debug, tracking, tokenfunc)
+        elif self.compact:
+            return self.parseopt_compact(input, lexer, debug, tracking, tokenfunc)
         else:
             return self.parseopt_notrack(input, lexer, debug, tracking, tokenfunc)
 
@@ -1275,6 +1358,298 @@ class LRParser:
 
         #--! parseopt-notrack-end
 
+    # !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+    # parseopt_compact().
+    #
+    # Version of parseopt_notrack() reading the compact tables. The type of the
+    # lookahead symbol is numbered once, when the symbol changes, rather than
+    # looked up by name for every action.  Changes made to parsedebug() must be
+    # reported here by hand.
+    # !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+    def parseopt_compact(self, input=None, lexer=None, debug=False, tracking=False, tokenfunc=None):
+        lookahead = None                         # Current lookahead symbol
+        lookaheadstack = []                      # Stack of lookahead symbols
+        ltid    = None                           # Number of the type of the lookahead symbol
+        compact = self.compact
+        actions = compact.action                 # Local reference to action table (to avoid lookup on self.)
+        goto    = compact.goto                   # Local reference to goto table (to avoid lookup on self.)
+        lhs     = compact.lhs                    # Number of the left hand side of each production
+        ids     = compact.terminal_ids           # Number of each terminal
+        unknown = len(compact.terminals)         # Empty column for unknown token types
+        prod    = self.productions               # Local reference to production list (to avoid lookup on self.)
+        defaulted_states = compact.default       # Local reference to defaulted states
+        pslice  = YaccProduction(None)           # Production object passed to grammar rules
+        errorcount = 0                           # Used during error recovery
+
+
+        # If no lexer was given, we will try to use the lex module
+        if not lexer:
+            from . import lex
+            lexer = lex.lexer
+
+        # Set up the lexer and parser objects on pslice
+        pslice.lexer = lexer
+        pslice.parser = self
+
+        # If input was supplied, pass to lexer
+        if input is not None:
+            lexer.input(input)
+
+        if tokenfunc is None:
+            # Tokenize function
+            get_token = lexer.token
+        else:
+            get_token = tokenfunc
+
+        # Set the parser() token method (sometimes used in error recovery)
+        self.token = get_token
+
+        # Set up the state and symbol stacks
+
+        statestack = []                # Stack of parsing states
+        self.statestack = statestack
+        symstack   = []                # Stack of grammar symbols
+        self.symstack = symstack
+
+        pslice.stack = symstack         # Put in the production
+        errtoken   = None               # Err token
+
+        # The start state is assumed to be (0,$end)
+
+        statestack.append(0)
+        sym = YaccSymbol()
+        sym.type = '$end'
+        symstack.append(sym)
+        state = 0
+        while True:
+            # Get the next symbol on the input.  If a lookahead symbol
+            # is already set, we just use that. Otherwise, we'll pull
+            # the next token off of the lookaheadstack or from the lexer
+
+
+            t = defaulted_states[state]
+            if t is None:
+                if not lookahead:
+                    if not lookaheadstack:
+                        lookahead = get_token()     # Get the next token
+                    else:
+                        lookahead = lookaheadstack.pop()
+                    if not lookahead:
+                        lookahead = YaccSymbol()
+                        lookahead.type = '$end'
+                    ltid = None
+
+                # Check the action table
+                if ltid is None:
+                    ltid = ids.get(lookahead.type, unknown)
+                t = actions[state][ltid]
+
+
+            if t is not None:
+                if t > 0:
+                    # shift a symbol on the stack
+                    statestack.append(t)
+                    state = t
+
+
+                    symstack.append(lookahead)
+                    lookahead = None
+
+                    # Decrease error count on successful shift
+                    if errorcount:
+                        errorcount -= 1
+                    continue
+
+                if t < 0:
+                    # reduce a symbol on the stack, emit a production
+                    p = prod[-t]
+                    pname = p.name
+                    plen  = p.len
+                    plhs  = lhs[-t]
+
+                    # Get production function
+                    sym = YaccSymbol()
+                    sym.type = pname       # Production name
+                    sym.value = None
+
+
+                    if plen:
+                        targ = symstack[-plen-1:]
+                        targ[0] = sym
+
+
+                        # !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+                        # The code enclosed in this section is duplicated
+                        # below as a performance optimization.  Make sure
+                        # changes get made in both locations.
+
+                        pslice.slice = targ
+
+                        try:
+                            # Call the grammar rule with our special slice object
+                            del symstack[-plen:]
+                            self.state = state
+                            p.callable(pslice)
+                            del statestack[-plen:]
+                            symstack.append(sym)
+                            state = goto[statestack[-1]][plhs]
+                            statestack.append(state)
+                        except SyntaxError:
+                            # If an error was set. Enter error recovery state
+                            lookaheadstack.append(lookahead)    # Save the current lookahead token
+                            symstack.extend(targ[1:-1])         # Put the production slice back on the stack
+                            statestack.pop()                    # Pop back one state (before the reduce)
+                            state = statestack[-1]
+                            sym.type = 'error'
+                            sym.value = 'error'
+                            lookahead = sym
+                            ltid = None
+                            errorcount = error_count
+                            self.errorok = False
+
+                        continue
+                        # !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+                    else:
+
+
+                        targ = [sym]
+
+                        # !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+                        # The code enclosed in this section is duplicated
+                        # above as a performance optimization.  Make sure
+                        # changes get made in both locations.
+
+                        pslice.slice = targ
+
+                        try:
+                            # Call the grammar rule with our special slice object
+                            self.state = state
+                            p.callable(pslice)
+                            symstack.append(sym)
+                            state = goto[statestack[-1]][plhs]
+                            statestack.append(state)
+                        except SyntaxError:
+                            # If an error was set. Enter error recovery state
+                            lookaheadstack.append(lookahead)    # Save the current lookahead token
+                            statestack.pop()                    # Pop back one state (before the reduce)
+                            state = statestack[-1]
+                            sym.type = 'error'
+                            sym.value = 'error'
+                            lookahead = sym
+                            ltid = None
+                            errorcount = error_count
+                            self.errorok = False
+
+                        continue
+                        # !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+                if t == 0:
+                    n = symstack[-1]
+                    result = getattr(n, 'value', None)
+                    return result
+
+            if t is None:
+
+
+                # We have some kind of parsing error here.  To handle
+                # this, we are going to push the current token onto
+                # the tokenstack and replace it with an 'error' token.
+                # If there are any synchronization rules, they may
+                # catch it.
+                #
+                # In addition to pushing the error token, we call call
+                # the user defined p_error() function if this is the
+                # first syntax error.  This function is only called if
+                # errorcount == 0.
+                if errorcount == 0 or self.errorok:
+                    errorcount = error_count
+                    self.errorok = False
+                    errtoken = lookahead
+                    if errtoken.type == '$end':
+                        errtoken = None               # End of file!
+                    if self.errorfunc:
+                        if errtoken and not hasattr(errtoken, 'lexer'):
+                            errtoken.lexer = lexer
+                        self.state = state
+                        tok = call_errorfunc(self.errorfunc, errtoken, self)
+                        if self.errorok:
+                            # User must have done some kind of panic
+                            # mode recovery on their own.  The
+                            # returned token is the next lookahead
+                            lookahead = tok
+                            ltid = None
+                            errtoken = None
+                            continue
+                    else:
+                        if errtoken:
+                            if hasattr(errtoken, 'lineno'):
+                                lineno = lookahead.lineno
+                            else:
+                                lineno = 0
+                            if lineno:
+                                sys.stderr.write('yacc: Syntax error at line %d, token=%s\n' % (lineno, errtoken.type))
+                            else:
+                                sys.stderr.write('yacc: Syntax error, token=%s' % errtoken.type)
+                        else:
+                            sys.stderr.write('yacc: Parse error in input. EOF\n')
+                            return
+
+                else:
+                    errorcount = error_count
+
+                # case 1:  the statestack only has 1 entry on it.  If we're in this state, the
+                # entire parse has been rolled back and we're completely hosed.   The token is
+                # discarded and we just keep going.
+
+                if len(statestack) <= 1 and lookahead.type != '$end':
+                    lookahead = None
+                    errtoken = None
+                    state = 0
+                    # Nuke the pushback stack
+                    del lookaheadstack[:]
+                    continue
+
+                # case 2: the statestack has a couple of entries on it, but we're
+                # at the end of the file. nuke the top entry and generate an error token
+
+                # Start nuking entries on the stack
+                if lookahead.type == '$end':
+                    # Whoa. We're really hosed here. Bail out
+                    return
+
+                if lookahead.type != 'error':
+                    sym = symstack[-1]
+                    if sym.type == 'error':
+                        # Hmmm. Error is on top of stack, we'll just nuke input
+                        # symbol and continue
+                        lookahead = None
+                        continue
+
+                    # Create the error symbol for the first time and make it the new lookahead symbol
+                    t = YaccSymbol()
+                    t.type = 'error'
+
+                    if hasattr(lookahead, 'lineno'):
+                        t.lineno = t.endlineno = lookahead.lineno
+                    if hasattr(lookahead, 'lexpos'):
+                        t.lexpos = t.endlexpos = lookahead.lexpos
+                    t.value = lookahead
+                    lookaheadstack.append(lookahead)
+                    lookahead = t
+                    ltid = None
+                else:
+                    sym = symstack.pop()
+                    statestack.pop()
+                    state = statestack[-1]
+
+                continue
+
+            # Call an error function here
+            raise RuntimeError('yacc: internal parser error!!!\n')
+
+
 # -----------------------------------------------------------------------------
 #                          === Grammar Representation ===
 #
@@ -3208,6 +3583,16 @@ class ParserReflect(object):
 
         self.grammar = grammar
 
+# Once the parser holds compact tables, the dictionaries of a table module
+# imported by name are only referenced by the module, which is forgotten to free
+# them.  Importing it again reads the table file again.
+def forget_table_module(tabmodule):
+    if isinstance(tabmodule, str) and tabmodule in sys.modules:
+        del sys.modules[tabmodule]
+        package, _, name = tabmodule.rpartition('.')
+        if package in sys.modules and hasattr(sys.modules[package], name):
+            delattr(sys.modules[package], name)
+
 # -----------------------------------------------------------------------------
 # yacc(module)
 #
@@ -3216,7 +3601,7 @@ class ParserReflect(object):
 
 def yacc(method='LALR', debug=yaccdebug, module=None, tabmodule=tab_module, start=None,
          check_recursion=True, optimize=False, write_tables=True, debugfile=debug_file,
-         outputdir=None, debuglog=None, errorlog=None, picklefile=None):
+         outputdir=None, debuglog=None, errorlog=None, picklefile=None, compact=False):
 
     if tabmodule is None:
         tabmodule = tab_module
@@ -3296,6 +3681,9 @@ def yacc(method='LALR', debug=yaccdebug, module=None, tabmodule=tab_module, star
             try:
                 lr.bind_callables(pinfo.pdict)
                 parser = LRParser(lr, pinfo.error_func)
+                if compact:
+                    parser.compact_tables()
+                    forget_table_module(tabmodule)
                 parse = parser.parse
                 return parser
             except Exception as e:
@@ -3498,6 +3886,8 @@ def yacc(method='LALR', debug=yaccdebug, module=None, tabmodule=tab_module, star
     # Build the parser
     lr.bind_callables(pinfo.pdict)
     parser = LRParser(lr, pinfo.error_func)
+    if compact:
+        parser.compact_tables()
 
     parse = parser.parse
     return parser
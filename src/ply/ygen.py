@@ -6,9 +6,20 @@
 # Users should edit the method LRParser.parsedebug() in yacc.py.   The source code
 # for that method is then used to create the other methods.   See the comments in
 # yacc.py for further details.
+#
+# write_direct() generates a standalone parser module for a grammar.  See the
+# comments of the section of that name below.
 
+import ast
+import hashlib
+import importlib
+import inspect
 import os.path
+import re
 import shutil
+import sys
+import textwrap
+import types
 
 def get_source_range(lines, tag):
     srclines = enumerate(lines)
@@ -36,6 +47,228 @@ def filter_section(lines, tag):
             filtered_lines.append(line)
     return filtered_lines
 
+# -----------------------------------------------------------------------------
+# Direct-coded parsers
+#
+# write_direct() emits a module parsing like the parseopt_compact() loop of a
+# parser built by yacc(compact=True), without yacc.py.  The compact tables are
+# written as literals, and every production gets a reduction function into
+# which the body of its grammar rule is copied.  The body reads the symbols it
+# reduces from the locals p1, p2... and sets p0 instead of indexing a
+# YaccProduction, and p.parser is the object given to parse(), so that no
+# YaccSymbol or YaccProduction is created while parsing.  The names the rules
+# use are imported from the module defining them, next to which the generated
+# module is written.
+#
+# The generated parser stops at the first syntax error, once the error function
+# of the grammar is called: the error rules of the grammar are kept but never
+# reduced, recovering from errors is left to the table-driven parser.  Grammar
+# rules may only use p[n] and p.parser.
+# -----------------------------------------------------------------------------
+
+direct_parse = '''
+def parse(input=None, lexer=None, parser=None):
+    if input is not None:
+        lexer.input(input)
+    get_token = lexer.token
+    states = [0]
+    values = [None]
+    state = 0
+    token = None
+    ltid = None
+    while True:
+        t = DEFAULT[state]
+        if t is None:
+            if ltid is None:
+                token = get_token()
+                ltid = END if token is None else TERMINALS.get(token.type, UNKNOWN)
+            t = ACTION[state][ltid]
+            if t is None:
+                %s
+                raise SyntaxError('Syntax error')
+        if t > 0:
+            states.append(t)
+            values.append(token.value)
+            state = t
+            ltid = None
+        elif t < 0:
+            state = REDUCE[-t](values, states, parser)
+        else:
+            return values[-1]
+'''
+
+reserved_names = set(['parser', 'values', 'states', 'state'])
+
+def rule_body(func):
+    'Lines of the body of a grammar rule reading its symbols from p0, p1...'
+    source = textwrap.dedent(inspect.getsource(func))
+    tree = ast.parse(source).body[0]
+    arg = tree.args.args[0].arg
+    body = tree.body[1:] if ast.get_docstring(tree) is not None else tree.body
+    if not body:
+        return ['p0 = None']
+    used = set(node.id for statement in body for node in ast.walk(statement) if isinstance(node, ast.Name))
+    if used & reserved_names:
+        raise ValueError('%s uses a name of the direct parser: %s' % (func.__name__, ', '.join(sorted(used & reserved_names))))
+
+    lines = source.splitlines()[body[0].lineno - 1:]
+    lines = [re.sub(r'\b%s\[(\d+)\]' % arg, r'p\1', line) for line in lines]
+    lines = [re.sub(r'\b%s\.parser\b' % arg, 'parser', line) for line in lines]
+    lines = textwrap.dedent('\n'.join(lines)).splitlines()
+    statements = ast.parse('\n'.join(lines)).body
+    if arg in set(node.id for statement in statements for node in ast.walk(statement) if isinstance(node, ast.Name)):
+        raise ValueError('%s uses %s otherwise than with %s[n] or %s.parser' % (func.__name__, arg, arg, arg))
+
+    # p[0] defaults to None when the rule doesn't always set it
+    assigned = [target.id for statement in statements if isinstance(statement, ast.Assign)
+                for target in statement.targets if isinstance(target, ast.Name)]
+    if 'p0' not in assigned:
+        lines.insert(0, 'p0 = None')
+    return lines
+
+def free_names(lines):
+    'Global names read by lines of code'
+    loaded = set()
+    stored = set()
+    for node in ast.walk(ast.parse('\n'.join(lines))):
+        if isinstance(node, ast.Name):
+            (stored if isinstance(node.ctx, ast.Store) else loaded).add(node.id)
+    builtins = set(dir(sys.modules['builtins']))
+    return set(name for name in loaded - stored - builtins - reserved_names if not re.match(r'p\d+$', name))
+
+def wrapped(items, begin, end, indent='    ', width=100):
+    'Source of a literal holding the source of items, wrapped'
+    lines = textwrap.wrap(', '.join(items), width, initial_indent=indent, subsequent_indent=indent,
+                          break_long_words=False, break_on_hyphens=False)
+    if not lines:
+        return begin + end
+    return begin + '\n' + '\n'.join(lines) + end
+
+def literal(value, indent='    '):
+    'Source of a tuple or dict literal, wrapped'
+    if isinstance(value, dict):
+        return wrapped(['%r: %r' % item for item in sorted(value.items())], '{', '}', indent)
+    return wrapped([repr(item) for item in value], '(', ',)' if len(value) == 1 else ')', indent)
+
+def direct_source(parser, module, name):
+    'Source of the direct-coded parser of parser, whose rules are defined in module'
+    compact = parser.compact
+    productions = parser.productions
+
+    imports = set()
+    reducers = []
+    reducer_names = {}
+    table = [None] * len(productions)
+    gotos = set()
+    for number, production in enumerate(productions[1:], 1):
+        key = (production.func, production.len, production.name)
+        if key in reducer_names:
+            table[number] = reducer_names[key]
+            continue
+        name_of_reducer = table[number] = reducer_names[key] = 'reduce_%d' % number
+        goto = 'GOTO_%s' % production.name
+        gotos.add(production.name)
+        body = rule_body(production.callable) if production.callable else ['p0 = None']
+        imports.update(free_names(body))
+        lines = ['def %s(values, states, parser):' % name_of_reducer,
+                 '    # %s' % production.str]
+        symbols = ['p%d' % i for i in range(1, production.len + 1)]
+        if production.len == 1:
+            lines.append('    p1 = values[-1]')
+        elif production.len > 1:
+            lines.append('    %s = values[-%d:]' % (', '.join(symbols), production.len))
+            lines.append('    del values[-%d:]' % (production.len - 1))
+            lines.append('    del states[-%d:]' % (production.len - 1))
+        lines.extend('    ' + line if line else '' for line in body)
+        if production.len:
+            lines.append('    values[-1] = p0')
+            lines.append('    state = states[-1] = %s[states[-2]]' % goto)
+        else:
+            lines.append('    values.append(p0)')
+            lines.append('    state = %s[states[-1]]' % goto)
+            lines.append('    states.append(state)')
+        lines.append('    return state')
+        reducers.append('\n'.join(lines))
+
+    error = 'pass'
+    if parser.errorfunc is not None:
+        error = '%s(token)' % parser.errorfunc.__name__
+        imports.add(parser.errorfunc.__name__)
+    package, _, module_name = module.__name__.rpartition('.')
+    origin = '.' + module_name if package else module_name
+
+    rows = []
+    row_numbers = {}
+    action = []
+    for row in compact.action:
+        if row not in row_numbers:
+            row_numbers[row] = len(rows)
+            rows.append(dict((i, value) for i, value in enumerate(row) if value is not None))
+        action.append(row_numbers[row])
+
+    parts = []
+    if imports:
+        parts.append('from %s import %s' % (origin, ', '.join(sorted(imports))))
+    parts.append('TERMINALS = %s' % literal(compact.terminal_ids))
+    parts.append('END = %d\nUNKNOWN = %d' % (compact.terminal_ids['$end'], len(compact.terminals)))
+    parts.append('def row(entries):\n'
+                 '    result = [None] * (UNKNOWN + 1)\n'
+                 '    for terminal, value in entries.items():\n'
+                 '        result[terminal] = value\n'
+                 '    return tuple(result)')
+    parts.append('ROWS = [\n%s\n]' % ',\n'.join('    row(%s)' % literal(row, '        ') for row in rows))
+    parts.append('ACTION = tuple(ROWS[i] for i in %s)' % literal(action))
+    parts.append('DEFAULT = %s' % literal(compact.default))
+    column = dict((nonterminal, {}) for nonterminal in gotos)
+    for state, row in enumerate(compact.goto):
+        for nonterminal in gotos:
+            value = row[compact.nonterminal_ids[nonterminal]] if row else None
+            if value is not None:
+                column[nonterminal][state] = value
+    parts.extend('GOTO_%s = %s' % (nonterminal, literal(column[nonterminal])) for nonterminal in sorted(gotos))
+    parts.extend(reducers)
+    parts.append('REDUCE = %s' % wrapped([str(reducer) for reducer in table], '(', ')'))
+    parts.append(direct_parse.strip() % error)
+
+    source = '\n\n'.join(parts) + '\n'
+    signature = hashlib.md5(source.encode('utf-8')).hexdigest()
+    header = ('# %s.py\n'
+              '# This file is automatically generated by ply/ygen.py from %s. Do not edit.\n'
+              '# pylint: disable=W,C,R\n\n'
+              'signature = %r\n\n' % (name, module.__name__.rpartition('.')[2], signature))
+    return header + source, signature
+
+def write_direct(parser, module, name='parsedirect'):
+    '''
+    Direct-coded parser of parser, whose rules are defined in module. The module
+    generated next to it is imported, or written again when it doesn't exist or
+    was generated from other rules or tables.
+    '''
+    source, signature = direct_source(parser, module, name)
+    package = module.__name__.rpartition('.')[0]
+    full_name = package + '.' + name if package else name
+    try:
+        direct = importlib.import_module(full_name)
+        if getattr(direct, 'signature', None) == signature:
+            return direct
+    except ImportError:
+        pass
+
+    path = os.path.join(os.path.dirname(module.__file__), name + '.py')
+    try:
+        with open(path, 'w') as f:
+            f.write(source)
+    except IOError:
+        pass
+    direct = types.ModuleType(full_name)
+    direct.__file__ = path
+    direct.__package__ = package
+    exec(compile(source, path, 'exec'), direct.__dict__)
+    sys.modules[full_name] = direct
+    if package in sys.modules:
+        setattr(sys.modules[package], name, direct)
+    return direct
+
 def main():
     dirname = os.path.dirname(__file__)
     shutil.copy2(os.path.join(dirname, 'yacc.py'), os.path.join(dirname, 'yacc.py.bak'))
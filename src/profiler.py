@@ -0,0 +1,120 @@
+# Profiling of the grammar actions
+#
+# A profiled formatter gets its own copy of the productions of the parser, whose
+# actions are wrapped to record, for every p_* function of formatter.py:
+#
+# - calls      : number of reductions
+# - self       : time spent in the function itself
+# - cumulative : time spent in the function and in the actions which built the
+#                symbols it reduces, that is in its whole subtree, counted once
+#                for nested calls of a recursive rule
+# - bytes      : length of the text the function adds to the symbols it
+#                reduces, counted in characters
+#
+# Formatters which are not profiled share the original productions, so that
+# profiling costs nothing when it is not used.
+
+import copy
+import threading
+import time
+
+class Rule(object):
+    __slots__ = ('calls', 'self_time', 'cumulative_time', 'bytes')
+
+    def __init__(self):
+        self.calls = 0
+        self.self_time = 0.0
+        self.cumulative_time = 0.0
+        self.bytes = 0
+
+def produced(value):
+    'Characters of text held by the result of an action'
+    if isinstance(value, str):
+        return len(value)
+    return getattr(value, 'size', 0)
+
+class Profile(object):
+    'Statistics of the grammar actions, safe to share between formatters'
+
+    def __init__(self):
+        self.rules = {}
+        self.lock = threading.Lock()
+
+    def wrap(self, productions):
+        'Copy of productions whose actions record their statistics here'
+        # For each symbol waiting on the stack of the parser: the time spent
+        # building it, and the part of it already counted in the cumulative time
+        # of each rule, so that recursive rules don't count their subtree twice
+        subtrees = {}
+        start = productions[0].str.split()[-1] if productions else None
+
+        def record(production):
+            action = production.callable
+            name = production.func
+
+            def recorded(p):
+                symbols = p.slice
+                # Sizes are read first, as lists are extended in place
+                size = -sum(produced(symbol.value) for symbol in symbols[1:] if symbol in subtrees)
+                begin = time.perf_counter()
+                action(p)
+                elapsed = time.perf_counter() - begin
+                size += produced(symbols[0].value)
+                subtree = elapsed
+                counted = {}
+                for symbol in symbols[1:]:
+                    child = subtrees.pop(symbol, None)
+                    if child is None:
+                        continue
+                    child_time, child_counted = child
+                    subtree += child_time
+                    if len(child_counted) > len(counted):
+                        counted, child_counted = child_counted, counted
+                    for rule, value in child_counted.items():
+                        counted[rule] = counted.get(rule, 0.0) + value
+                cumulative = subtree - counted.get(name, 0.0)
+                counted[name] = subtree
+                if production.name == start:
+                    # The query is complete, symbols left by failed parses go
+                    subtrees.clear()
+                else:
+                    subtrees[symbols[0]] = (subtree, counted)
+                with self.lock:
+                    rule = self.rules.get(name)
+                    if rule is None:
+                        rule = self.rules[name] = Rule()
+                    rule.calls += 1
+                    rule.self_time += elapsed
+                    rule.cumulative_time += cumulative
+                    rule.bytes += size
+
+            wrapped = copy.copy(production)
+            wrapped.callable = recorded
+            return wrapped
+
+        return [record(production) if production.callable else production for production in productions]
+
+    def clear(self):
+        with self.lock:
+            self.rules.clear()
+
+    def stats(self):
+        'Statistics of every rule, by name of the function of the rule'
+        with self.lock:
+            return dict((name, {
+                'calls': rule.calls,
+                'self': rule.self_time,
+                'cumulative': rule.cumulative_time,
+                'bytes': rule.bytes,
+            }) for name, rule in self.rules.items())
+
+    def report(self, sort='self', limit=None):
+        'Table of the rules, from the most expensive one according to sort'
+        stats = sorted(self.stats().items(), key=lambda item: item[1][sort], reverse=True)
+        if limit is not None:
+            stats = stats[:limit]
+        width = max([len('rule')] + [len(name) for name, _ in stats])
+        lines = ['%-*s %9s %10s %10s %10s' % (width, 'rule', 'calls', 'self', 'cumulative', 'bytes')]
+        for name, rule in stats:
+            lines.append('%-*s %9d %9.4fs %9.4fs %10d' % (width, name, rule['calls'], rule['self'], rule['cumulative'], rule['bytes']))
+        return '\n'.join(lines)
@@ -0,0 +1,300 @@
+# Formatting of scripts holding several statements
+#
+# The grammar only accepts one query, ended by optional semicolons. Scripts are
+# therefore cut after their semicolons with the lexer, and each statement is
+# formatted on its own. The script is read chunk by chunk, so that only the
+# statement being cut is held in memory.
+#
+# Scripts given as UTF-8 bytes or as a buffer such as an mmap are lexed without
+# being decoded, by a lexer for bytes, and only the statements are decoded as
+# they are cut. Their offsets still count characters, so that both give the
+# same statements.
+#
+# The lines before the first token of a statement, such as the blank lines
+# between two statements, are left as they are by format_stream() as by the
+# plugin. A statement sharing its line with the one before is written on a new
+# line instead.
+
+import collections
+import mmap
+import re
+
+from . import formatter
+
+CHUNK_SIZE = 1 << 16
+
+# Whitespace up to the line of the first token of a statement
+LEADING_LINES = re.compile(r'\s*\n')
+
+BUFFER_TYPES = (bytes, bytearray, mmap.mmap)
+
+# Characters opening the strings and the labels between backquotes
+QUOTES = '\'"`'
+
+# start, end : offsets of the statement in the script
+# output     : formatted statement, None when it could not be formatted
+# error      : ValueError or SyntaxError whose argument is the absolute offset
+#              of the error in the script, or QueryErrors holding every such
+#              error when recovering, None when the statement is formatted
+Statement = collections.namedtuple('Statement', 'start end output error')
+
+def read_chunks(source, chunk_size):
+    if isinstance(source, str):
+        return iter((source,))
+    return iter(lambda: source.read(chunk_size), '')
+
+def split_statements(source, chunk_size=CHUNK_SIZE):
+    '''
+    Yields (start, text, code) for every statement of source, a string, a file
+    object, UTF-8 bytes or a buffer. A statement ends after its semicolons and
+    the comments following them on the same line. code is False for statements
+    without any query, made of comments and whitespaces only, like the
+    whitespaces ending source.
+    '''
+    if isinstance(source, BUFFER_TYPES):
+        for statement in split_buffer(source):
+            yield statement
+        return
+    if formatter.parser is None:
+        formatter.build()
+    scanner = formatter.lexer.clone()
+    buffer = ''
+    base = 0
+    scanned = 0
+    end = None
+    code = False
+    chunks = read_chunks(source, chunk_size)
+    while chunks is not None:
+        chunk = next(chunks, None)
+        if chunk is None:
+            chunks = None
+        else:
+            buffer += chunk
+
+        cuts = []
+        scanner.input(buffer)
+        scanner.lexpos = scanned
+        while True:
+            try:
+                token = scanner.token()
+            except ValueError:
+                # A quote on the last line may open a string which the next
+                # chunk closes, strings never span a newline
+                if chunks is not None and buffer[scanner.lexpos] in QUOTES and \
+                        buffer.find('\n', scanner.lexpos) < 0:
+                    break
+                # Invalid characters are reported when the statement is formatted
+                scanner.skip(1)
+                scanned = scanner.lexpos
+                code = True
+                continue
+            if token is None:
+                break
+            # The last token, and the whitespace before it, may go on in the
+            # next chunk, and are scanned again with it
+            if chunks is not None and scanner.lexpos == len(buffer):
+                break
+            scanned = scanner.lexpos
+            kind = token.type
+            if end is not None:
+                if kind == 'SEMICOLON' or kind == 'COMMENT':
+                    end = token.lexpos + len(token.value)
+                    continue
+                cuts.append((end, code))
+                end = None
+                code = False
+            if kind == 'SEMICOLON':
+                end = token.lexpos + 1
+            if kind != 'COMMENT' and kind != 'COMMENT_ALONE':
+                code = True
+        if chunks is None and end is not None:
+            cuts.append((end, code))
+            end = None
+            code = False
+
+        start = 0
+        for cut, cut_code in cuts:
+            yield base + start, buffer[start:cut], cut_code
+            start = cut
+        if start:
+            buffer = buffer[start:]
+            base += start
+            scanned -= start
+            if end is not None:
+                end -= start
+
+    if buffer:
+        yield base, buffer, code
+
+bytes_scanner = None
+
+def space_size(data, position):
+    '''
+    Size of the whitespace which the lexer for bytes doesn't match, such as
+    \x1c or whitespace beyond ASCII, starting at position in UTF-8 data, or 0
+    '''
+    if data[position] < 0x80:
+        return 1 if chr(data[position]).isspace() else 0
+    for size in (2, 3, 4):
+        try:
+            char = str(data[position:position + size], 'utf-8')
+        except UnicodeDecodeError:
+            continue
+        return size if char.isspace() else 0
+    return 0
+
+def split_buffer(data):
+    'split_statements() of UTF-8 data, cut without being decoded'
+    global bytes_scanner
+    if bytes_scanner is None:
+        if formatter.parser is None:
+            formatter.build()
+        bytes_scanner = formatter.lexer.bytes_clone()
+    scanner = bytes_scanner.clone()
+    scanner.input(data)
+    start = 0
+    offset = 0
+    end = None
+    code = False
+    spaced = False
+    while True:
+        try:
+            token = scanner.token()
+        except ValueError:
+            # Some whitespaces aren't matched by the lexer for bytes
+            size = space_size(data, scanner.lexpos)
+            scanner.skip(size or 1)
+            code = code or not size
+            spaced = spaced or size > 0
+            continue
+        if token is None:
+            break
+        kind = token.type
+        if spaced:
+            # A comment may still be alone on its line after such whitespaces
+            line = data.rfind(b'\n', 0, token.lexpos) + 1
+            if kind == 'COMMENT' and not str(data[line:token.lexpos], 'utf-8').strip():
+                kind = 'COMMENT_ALONE'
+            spaced = False
+        if end is not None:
+            if kind == 'SEMICOLON' or kind == 'COMMENT':
+                end = scanner.lexpos
+                continue
+            text = str(data[start:end], 'utf-8')
+            yield offset, text, code
+            offset += len(text)
+            start = end
+            end = None
+            code = False
+        if kind == 'SEMICOLON':
+            end = scanner.lexpos
+        if kind != 'COMMENT' and kind != 'COMMENT_ALONE':
+            code = True
+
+    if end is not None:
+        text = str(data[start:end], 'utf-8')
+        yield offset, text, code
+        offset += len(text)
+        start = end
+        code = False
+    if start < len(data):
+        yield offset, str(data[start:], 'utf-8'), code
+
+def absolute(error, start, end):
+    'Error of a statement with the offset of its position in the script'
+    position = int(str(error))
+    return type(error)(start + position if position >= 0 else end)
+
+def statement_error(err, start, end):
+    'Error of a statement, or QueryErrors holding its errors, with their offsets in the script'
+    if isinstance(err, formatter.QueryErrors):
+        return formatter.QueryErrors([absolute(error, start, end) for error in err.errors])
+    return absolute(err, start, end)
+
+def format_statement(start, text, code, minify=False, recover=False):
+    'Formats one statement of a script into a Statement'
+    end = start + len(text)
+    if not code:
+        if minify:
+            return Statement(start, end, '', None)
+        lines = (formatter.normalize_comment(line.strip()) for line in text.split('\n'))
+        # The newline ending the comments, often the last one of the script, is kept
+        output = '\n'.join(line for line in lines if line)
+        if output and text.endswith('\n'):
+            output += '\n'
+        return Statement(start, end, output, None)
+    try:
+        return Statement(start, end, formatter.format_query(text, minify, recover), None)
+    except (formatter.QueryErrors, ValueError, SyntaxError) as err:
+        return Statement(start, end, None, statement_error(err, start, end))
+
+def format_statements(source, minify=False, chunk_size=CHUNK_SIZE, recover=False):
+    '''
+    Formats the statements of source, as split by split_statements(), one at
+    a time and yields a Statement for each of them. A statement which can't be
+    formatted doesn't prevent the following ones from being formatted. With
+    recover, every error of a statement is reported.
+    '''
+    for start, text, code in split_statements(source, chunk_size):
+        if text.strip():
+            yield format_statement(start, text, code, minify, recover)
+
+def without_leading_lines(start, text):
+    'Offset and text of a statement from the line of its first token, and the lines before'
+    leading = LEADING_LINES.match(text)
+    if leading is None:
+        return start, text, ''
+    return start + leading.end(), text[leading.end():], leading.group()
+
+def separator(start, leading, code):
+    'Newline to write before a statement of code sharing its line with the one before, or nothing'
+    return '\n' if code and start and not leading else ''
+
+def format_stream(source, sink, minify=False, chunk_size=CHUNK_SIZE, recover=False):
+    '''
+    Formats the statements of source, as split by split_statements(), writing
+    the output to sink, an object with a write method, statement by statement
+    and chunk by chunk as it is rendered. Only the statement being formatted is
+    held in memory. The statements which can't be formatted are written as they
+    are, and a list of their Statement is returned.
+    '''
+    failed = []
+    for start, text, code in split_statements(source, chunk_size):
+        start, text, leading = without_leading_lines(start, text)
+        sink.write(leading or separator(start, leading, code))
+        if not text.strip():
+            sink.write(text)
+        elif not code:
+            sink.write(format_statement(start, text, code, minify).output)
+        else:
+            try:
+                formatter.write_query(text, sink, minify, recover)
+            except (formatter.QueryErrors, ValueError, SyntaxError) as err:
+                sink.write(text)
+                failed.append(Statement(start, start + len(text), None, statement_error(err, start, start + len(text))))
+    return failed
+
+def check_stream(source, minify=False, chunk_size=CHUNK_SIZE, recover=False):
+    '''
+    Offset of the first difference between source and the output written by
+    format_stream(), or None when source is already formatted. The statements
+    after the first one differing are not formatted. The errors of a statement
+    are raised as format_statement() reports them.
+    '''
+    for start, text, code in split_statements(source, chunk_size):
+        start, text, leading = without_leading_lines(start, text)
+        if not text.strip():
+            continue
+        # The newline written before the statement is missing
+        if separator(start, leading, code):
+            return start
+        if not code:
+            position = formatter.first_difference((format_statement(start, text, code, minify).output,), text)
+        else:
+            try:
+                position = formatter.check_query(text, minify, recover)
+            except (formatter.QueryErrors, ValueError, SyntaxError) as err:
+                raise statement_error(err, start, start + len(text))
+        if position is not None:
+            return start + position
+    return None